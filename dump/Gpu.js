@@ -13,12 +13,18 @@
 // limitations under the License.
 
 import {DetailedError} from "src/base/DetailedError.js";
+import {footprint, layeredVariant, pickVariant, singleShotVariant} from "src/sim/ShaderVariants.js";
 
 //noinspection JSValidateJSDoc
 let gl = /** @type {!WebGL2RenderingContext} */  undefined;
 //noinspection JSValidateJSDoc
 let vertexShader = /** @type {!WebGLShader} */ undefined;
 let maxTextureSize = /** @type {!int} */ undefined;
+let maxTextureLayers = /** @type {!int} */ undefined;
+
+// Rendering a shader in place draws the texels it can change (see registerFootprint) when that takes at most this
+// many draws, covering at most half of the texture. Otherwise the whole texture is drawn.
+const MAX_FOOTPRINT_DRAWS = 16;
 
 function initGpu(canvas) {
     if (gl === undefined) {
@@ -43,6 +49,8 @@ function initGpu(canvas) {
     gl.bindVertexArray(gl.createVertexArray());
 
     maxTextureSize = gl.getParameter(gl.MAX_TEXTURE_SIZE);
+    //noinspection JSUnresolvedVariable
+    maxTextureLayers = gl.getParameter(gl.MAX_ARRAY_TEXTURE_LAYERS);
     vertexShader = createShader(gl.VERTEX_SHADER, `#version 300 es
         in vec4 a_position;
         void main() {
@@ -101,44 +109,94 @@ function unalign_buffer(buf, w) {
     return realign_buffer(buf, aligned_length(w), w);
 }
 
+/**
+ * @param {!int} width
+ * @param {!int} height
+ * @returns {!boolean} Whether a texture of the given size can be allocated, without splitting it into layers.
+ */
+function fitsInTexture(width, height) {
+    return width <= maxTextureSize && height <= maxTextureSize;
+}
+
+/**
+ * @param {!WebGLFramebuffer} frameBuffer
+ * @param {!int} w
+ * @param {!int} h
+ * @param {!boolean} packed
+ * @returns {!Uint8Array|!Uint32Array}
+ */
+function readFrameBuffer(frameBuffer, w, h, packed) {
+    gl.bindFramebuffer(gl.FRAMEBUFFER, frameBuffer);
+    try {
+        checkGetErrorResult(gl, "readFrameBuffer:bindFramebuffer");
+        checkFrameBufferStatusResult(gl);
+        if (packed) {
+            // Integer color buffers are only guaranteed to be readable as RGBA_INTEGER.
+            let rgba = new Uint32Array(w * h * 4);
+            //noinspection JSUnresolvedVariable
+            gl.readPixels(0, 0, w, h, gl.RGBA_INTEGER, gl.UNSIGNED_INT, rgba);
+            checkGetErrorResult(gl, "readFrameBuffer:readPixels");
+            let result = new Uint32Array(w * h);
+            for (let i = 0; i < result.length; i++) {
+                result[i] = rgba[i * 4];
+            }
+            return result;
+        }
+        let outputBuffer = align_buffer(new Uint8Array(w * h), w);
+        //noinspection JSUnresolvedVariable
+        gl.readPixels(0, 0, w, h, gl.RED, gl.UNSIGNED_BYTE, outputBuffer);
+        checkGetErrorResult(gl, "readFrameBuffer:readPixels");
+        return unalign_buffer(outputBuffer, w);
+    } finally {
+        gl.bindFramebuffer(gl.FRAMEBUFFER, null);
+    }
+}
+
 class Tex {
-    constructor(width, height, data=undefined) {
+    /**
+     * @param {!int} width
+     * @param {!int} height
+     * @param {undefined|!Uint8Array|!Uint32Array} data
+     * @param {!boolean} packed Whether each texel is a 32 bit word (R32UI) packing 32 bits, instead of a byte (R8).
+     * @param {!Array.<!int>} shots The number of columns and rows in the grid of equally sized shot tiles the texture
+     *     is divided into.
+     */
+    constructor(width, height, data=undefined, packed=false, shots=[1, 1]) {
         if (width > maxTextureSize || height > maxTextureSize) {
             throw new DetailedError('Span exceeds maximum size.', {width, height, maxTextureSize});
         }
 
-        let {texture, frameBuffer} = Tex.allocTexture(width, height, data);
+        let {texture, frameBuffer} = Tex.allocTexture(width, height, data, packed);
         this.texture = texture;
         this.frameBuffer = frameBuffer;
         this.width = width;
         this.height = height;
+        this.packed = packed;
+        this.shots = shots;
     }
 
     /**
-     * @returns {!Uint8Array}
+     * @returns {!Array.<!number>} The width and height of each shot's tile.
+     */
+    tileSize() {
+        return [this.width / this.shots[0], this.height / this.shots[1]];
+    }
+
+    /**
+     * @returns {!Uint8Array|!Uint32Array}
      */
     read() {
-        gl.bindFramebuffer(gl.FRAMEBUFFER, this.frameBuffer);
-        try {
-            checkGetErrorResult(gl, "Tex.read:bindFramebuffer");
-            checkFrameBufferStatusResult(gl);
-            let outputBuffer = align_buffer(new Uint8Array(this.width * this.height), this.width);
-            //noinspection JSUnresolvedVariable
-            gl.readPixels(0, 0, this.width, this.height, gl.RED, gl.UNSIGNED_BYTE, outputBuffer);
-            checkGetErrorResult(gl, "Tex.read:readPixels");
-            return unalign_buffer(outputBuffer, this.width);
-        } finally {
-            gl.bindFramebuffer(gl.FRAMEBUFFER, null);
-        }
+        return readFrameBuffer(this.frameBuffer, this.width, this.height, this.packed);
     }
 
     /**
      * @param {!int} w
      * @param {!int} h
-     * @param {undefined|!Uint8Array} data
+     * @param {undefined|!Uint8Array|!Uint32Array} data
+     * @param {!boolean} packed
      * @returns {!{texture: !WebGLTexture, frameBuffer: !WebGLFramebuffer}}
      */
-    static allocTexture(w, h, data=undefined) {
+    static allocTexture(w, h, data=undefined, packed=false) {
         let texture = gl.createTexture();
         let frameBuffer = gl.createFramebuffer();
 
@@ -149,9 +207,15 @@ class Tex {
             gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MIN_FILTER, gl.NEAREST);
             gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_S, gl.CLAMP_TO_EDGE);
             gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_T, gl.CLAMP_TO_EDGE);
-            //noinspection JSUnresolvedVariable
-            gl.texImage2D(gl.TEXTURE_2D, 0, gl.R8, w, h, 0, gl.RED, gl.UNSIGNED_BYTE,
-                data === undefined ? null : align_buffer(data, w));
+            if (packed) {
+                //noinspection JSUnresolvedVariable
+                gl.texImage2D(gl.TEXTURE_2D, 0, gl.R32UI, w, h, 0, gl.RED_INTEGER, gl.UNSIGNED_INT,
+                    data === undefined ? null : data);
+            } else {
+                //noinspection JSUnresolvedVariable
+                gl.texImage2D(gl.TEXTURE_2D, 0, gl.R8, w, h, 0, gl.RED, gl.UNSIGNED_BYTE,
+                    data === undefined ? null : align_buffer(data, w));
+            }
             checkGetErrorResult(gl, "texImage2D");
             gl.framebufferTexture2D(gl.FRAMEBUFFER, gl.COLOR_ATTACHMENT0, gl.TEXTURE_2D, texture, 0);
             checkGetErrorResult(gl, "framebufferTexture2D");
@@ -165,6 +229,132 @@ class Tex {
     }
 }
 
+/**
+ * A texture that may be larger than the GPU allows, split into a grid of layers of a texture array (in row-major
+ * order). Generated shaders read and write it through their layered variants (see tiling.tile_layers), drawing one
+ * layer at a time.
+ */
+class LayeredTex {
+    /**
+     * @param {!int} width
+     * @param {!int} height
+     * @param {undefined|!Uint8Array|!Uint32Array} data
+     * @param {!boolean} packed
+     * @param {!Array.<!int>} shots
+     * @param {!Array.<!int>} layerSize The width and height of each layer (shrunk to fit the texture).
+     */
+    constructor(width, height, data=undefined, packed=false, shots=[1, 1],
+                layerSize=[maxTextureSize, maxTextureSize]) {
+        let [w, h] = [Math.min(layerSize[0], width), Math.min(layerSize[1], height)];
+        let layerGrid = [Math.ceil(width / w), Math.ceil(height / h)];
+        let layers = layerGrid[0] * layerGrid[1];
+        if (!fitsInTexture(w, h) || layers > maxTextureLayers) {
+            throw new DetailedError('Layers exceed maximum size.',
+                {width, height, layerSize, maxTextureSize, maxTextureLayers});
+        }
+
+        this.width = width;
+        this.height = height;
+        this.packed = packed;
+        this.shots = shots;
+        this.layerSize = [w, h];
+        this.layerGrid = layerGrid;
+        this.layers = layers;
+        let {texture, frameBuffers} = this._allocLayers(data);
+        this.texture = texture;
+        this.frameBuffers = frameBuffers;
+    }
+
+    /**
+     * @returns {!Array.<!number>} The width and height of each shot's tile.
+     */
+    tileSize() {
+        return [this.width / this.shots[0], this.height / this.shots[1]];
+    }
+
+    /**
+     * @param {!int} layer
+     * @returns {!Array.<!int>} The x, y, width and height of the part of the texture stored in the layer.
+     */
+    layerRect(layer) {
+        let [w, h] = this.layerSize;
+        let x = (layer % this.layerGrid[0]) * w;
+        let y = Math.floor(layer / this.layerGrid[0]) * h;
+        return [x, y, Math.min(w, this.width - x), Math.min(h, this.height - y)];
+    }
+
+    /**
+     * @returns {!Uint8Array|!Uint32Array}
+     */
+    read() {
+        let result = this.packed ? new Uint32Array(this.width * this.height) : new Uint8Array(this.width * this.height);
+        for (let layer = 0; layer < this.layers; layer++) {
+            let [x, y, w, h] = this.layerRect(layer);
+            let part = readFrameBuffer(this.frameBuffers[layer], w, h, this.packed);
+            for (let row = 0; row < h; row++) {
+                result.set(part.subarray(row * w, (row + 1) * w), (y + row) * this.width + x);
+            }
+        }
+        return result;
+    }
+
+    /**
+     * @param {undefined|!Uint8Array|!Uint32Array} data
+     * @returns {!{texture: !WebGLTexture, frameBuffers: !Array.<!WebGLFramebuffer>}}
+     * @private
+     */
+    _allocLayers(data) {
+        let [w, h] = this.layerSize;
+        let texture = gl.createTexture();
+        //noinspection JSUnresolvedVariable
+        let format = this.packed ? gl.RED_INTEGER : gl.RED;
+        let type = this.packed ? gl.UNSIGNED_INT : gl.UNSIGNED_BYTE;
+
+        //noinspection JSUnresolvedVariable
+        gl.bindTexture(gl.TEXTURE_2D_ARRAY, texture);
+        let frameBuffers = [];
+        try {
+            //noinspection JSUnresolvedVariable
+            let target = gl.TEXTURE_2D_ARRAY;
+            gl.texParameteri(target, gl.TEXTURE_MAG_FILTER, gl.NEAREST);
+            gl.texParameteri(target, gl.TEXTURE_MIN_FILTER, gl.NEAREST);
+            gl.texParameteri(target, gl.TEXTURE_WRAP_S, gl.CLAMP_TO_EDGE);
+            gl.texParameteri(target, gl.TEXTURE_WRAP_T, gl.CLAMP_TO_EDGE);
+            //noinspection JSUnresolvedVariable,JSUnresolvedFunction
+            gl.texImage3D(target, 0, this.packed ? gl.R32UI : gl.R8, w, h, this.layers, 0, format, type, null);
+            checkGetErrorResult(gl, "texImage3D");
+            for (let layer = 0; layer < this.layers; layer++) {
+                let [x, y, lw, lh] = this.layerRect(layer);
+                if (data !== undefined) {
+                    let part = this.packed ? new Uint32Array(lw * lh) : new Uint8Array(lw * lh);
+                    for (let row = 0; row < lh; row++) {
+                        let start = (y + row) * this.width + x;
+                        part.set(data.subarray(start, start + lw), row * lw);
+                    }
+                    //noinspection JSUnresolvedFunction
+                    gl.texSubImage3D(target, 0, 0, 0, layer, lw, lh, 1, format, type,
+                        this.packed ? part : align_buffer(part, lw));
+                    checkGetErrorResult(gl, "texSubImage3D");
+                }
+
+                let frameBuffer = gl.createFramebuffer();
+                gl.bindFramebuffer(gl.FRAMEBUFFER, frameBuffer);
+                //noinspection JSUnresolvedFunction
+                gl.framebufferTextureLayer(gl.FRAMEBUFFER, gl.COLOR_ATTACHMENT0, texture, 0, layer);
+                checkGetErrorResult(gl, "framebufferTextureLayer");
+                checkFrameBufferStatusResult(gl);
+                frameBuffers.push(frameBuffer);
+            }
+        } finally {
+            //noinspection JSUnresolvedVariable
+            gl.bindTexture(gl.TEXTURE_2D_ARRAY, null);
+            gl.bindFramebuffer(gl.FRAMEBUFFER, null);
+        }
+
+        return {texture, frameBuffers};
+    }
+}
+
 /**
  * Checks if the given code, returned by gl.getError, is an error or not.
  * Throws an error with a descriptive message if the code represents an error.
@@ -252,7 +442,7 @@ class ParametrizedShader {
         gl.uniform1i(loc, texture_unit);
         gl.activeTexture(gl.TEXTURE0 + texture_unit);
         let src;
-        if (arg instanceof Tex) {
+        if (arg instanceof Tex || arg instanceof LayeredTex) {
             src = arg;
         } else if (arg instanceof TexPair) {
             src = arg.src;
@@ -260,10 +450,22 @@ class ParametrizedShader {
             throw DetailedError("Don't know how to get texture and size from tex arg.", {arg});
         }
 
-        gl.bindTexture(gl.TEXTURE_2D, src.texture);
+        // Layered shaders read layered textures exactly where they declare the size of their layers.
+        let layered = param.length >= 5 && param[4] !== undefined;
+        if (layered !== (src instanceof LayeredTex)) {
+            throw new DetailedError('Layered textures must be used together, by layered shaders.', {param, layered});
+        }
+        //noinspection JSUnresolvedVariable
+        gl.bindTexture(layered ? gl.TEXTURE_2D_ARRAY : gl.TEXTURE_2D, src.texture);
         if (param.length >= 2 && param[2] !== undefined) {
             gl.uniform2f(gl.getUniformLocation(this.program, param[2]), src.width, src.height);
         }
+        if (param.length >= 4 && param[3] !== undefined) {
+            gl.uniform2f(gl.getUniformLocation(this.program, param[3]), ...src.tileSize());
+        }
+        if (layered) {
+            gl.uniform2f(gl.getUniformLocation(this.program, param[4]), ...src.layerSize);
+        }
     }
 
     useArgs(...args) {
@@ -303,24 +505,143 @@ class ParametrizedShaderWithArgs {
     }
 
     /**
-     * @param {!TexPair|!Tex} tex
+     * Draws into the texture. Layered textures are drawn one layer at a time, by the shader's layered variant.
+     * Otherwise textures holding a single shot are drawn by the shader's untiled variant, and others by its variant
+     * for their tile sizes (if it has one).
+     *
+     * When the shader updates a texture pair in place and only changes a few of its texels, only those texels are
+     * drawn into the pair's destination and then copied back into its source, instead of swapping the two.
+     * @param {!TexPair|!Tex|!LayeredTex} tex
      */
     renderInto(tex) {
         let dst = tex instanceof TexPair ? tex.dst : tex;
-        this.parametrizedShader.useArgs(...this.args);
-        drawToTexture(this.parametrizedShader.program, dst, dst.width, dst.height);
-        if (tex instanceof TexPair) {
+        let shader = this.parametrizedShader;
+        if (dst instanceof LayeredTex) {
+            shader = layeredVariant(shader);
+            if (shader === undefined) {
+                throw new DetailedError('Shader has no layered variant.', {shader: this.parametrizedShader});
+            }
+        } else if (this._isSingleShot(dst)) {
+            shader = singleShotVariant(shader) || shader;
+        } else {
+            shader = pickVariant(shader, this._tileSizes(dst));
+        }
+        shader.useArgs(...this.args);
+        let outTile = gl.getUniformLocation(shader.program, 'out_tile');
+        if (outTile !== null) {
+            gl.uniform2f(outTile, ...dst.tileSize());
+        }
+        let boxes = tex instanceof TexPair ? this._footprintBoxes(tex) : undefined;
+        let outOrigin = gl.getUniformLocation(shader.program, 'out_origin');
+        let srcParts = boxes === undefined ? undefined : frameBufferParts(tex.src);
+        frameBufferParts(dst).forEach(({frameBuffer, rect: [x, y, w, h]}, i) => {
+            if (outOrigin !== null) {
+                gl.uniform2f(outOrigin, x, y);
+            }
+            if (boxes === undefined) {
+                drawToFrameBuffer(shader.program, frameBuffer, w, h);
+                return;
+            }
+            for (let [bx, by, bw, bh] of boxes) {
+                // The part of the box within this part of the texture, in the part's coordinates.
+                let x0 = Math.max(bx - x, 0);
+                let y0 = Math.max(by - y, 0);
+                let x1 = Math.min(bx + bw - x, w);
+                let y1 = Math.min(by + bh - y, h);
+                if (x0 < x1 && y0 < y1) {
+                    let box = [x0, y0, x1 - x0, y1 - y0];
+                    drawToFrameBuffer(shader.program, frameBuffer, w, h, box);
+                    copyBox(frameBuffer, srcParts[i].frameBuffer, box);
+                }
+            }
+        });
+        if (tex instanceof TexPair && boxes === undefined) {
             tex.swap();
         }
     }
 
+    /**
+     * @param {!Tex} dst
+     * @returns {!boolean} Whether the destination and every texture argument hold a single shot.
+     * @private
+     */
+    _isSingleShot(dst) {
+        let textures = [dst, ...this.args.filter(e => e instanceof Tex || e instanceof TexPair)];
+        return textures.every(e => e.shots[0] === 1 && e.shots[1] === 1);
+    }
+
+    /**
+     * @param {!Tex} dst
+     * @returns {!Object.<!string, !Array.<!number>>} The tile size of the destination and of each texture argument,
+     *     keyed by the name of the shader's uniform holding it.
+     * @private
+     */
+    _tileSizes(dst) {
+        let sizes = {out_tile: dst.tileSize()};
+        this.parametrizedShader.params.forEach((param, i) => {
+            if (param[0] === 'tex' && param.length >= 4 && param[3] !== undefined) {
+                sizes[param[3]] = this.args[i].tileSize();
+            }
+        });
+        return sizes;
+    }
+
+    /**
+     * @param {!TexPair} pair
+     * @returns {undefined|!Array.<!Array.<!int>>} Boxes ([x, y, w, h]) covering the texels that rendering the
+     *     shader into the pair in place can change, or undefined when the whole texture should be drawn.
+     * @private
+     */
+    _footprintBoxes(pair) {
+        let changes = footprint(this.parametrizedShader, this.args);
+        if (changes === undefined || (changes.tex !== pair && changes.tex !== pair.src)) {
+            return undefined;
+        }
+        let {width, height, shots} = pair.src;
+        let [tileWidth, tileHeight] = pair.src.tileSize();
+
+        // Spans of the rect's coordinates along an axis, in every tile.
+        let spans = (low, high, tile, count, size) => {
+            low = Math.max(low, 0);
+            high = Math.min(high, tile);
+            if (low >= high) {
+                return [];
+            }
+            if (low === 0 && high === tile) {
+                // Covers the whole axis at once.
+                return [[0, size]];
+            }
+            let result = [];
+            for (let i = 0; i < count; i++) {
+                result.push([i * tile + low, i * tile + high]);
+            }
+            return result;
+        };
+
+        let boxes = [];
+        let area = 0;
+        for (let [x0, x1, y0, y1] of changes.rects) {
+            for (let [a, b] of spans(x0, x1, tileWidth, shots[0], width)) {
+                for (let [c, d] of spans(y0, y1, tileHeight, shots[1], height)) {
+                    boxes.push([a, c, b - a, d - c]);
+                    area += (b - a) * (d - c);
+                }
+            }
+        }
+        if (boxes.length > MAX_FOOTPRINT_DRAWS || area * 2 > width * height) {
+            return undefined;
+        }
+        return boxes;
+    }
+
     /**
      * @param {!int} w
      * @param {!int} h
-     * @returns {!Uint8Array}
+     * @param {!boolean} packed
+     * @returns {!Uint8Array|!Uint32Array}
      */
-    read(w, h) {
-        let tex = new Tex(w, h);
+    read(w, h, packed=false) {
+        let tex = new Tex(w, h, undefined, packed);
         this.renderInto(tex);
         return tex.read();
     }
@@ -343,19 +664,76 @@ class ParametrizedShaderWithArgs {
  * @param {!Tex} tex
  */
 function drawToTexture(program, tex, w, h) {
-    gl.bindFramebuffer(gl.FRAMEBUFFER, tex.frameBuffer);
+    drawToFrameBuffer(program, tex.frameBuffer, w, h);
+}
+
+//noinspection JSValidateJSDoc
+/**
+ * @param {!WebGLProgram} program
+ * @param {!WebGLFramebuffer} frameBuffer
+ * @param {!int} w
+ * @param {!int} h
+ * @param {undefined|!Array.<!int>} box When given, only the texels in the [x, y, w, h] box are drawn.
+ */
+function drawToFrameBuffer(program, frameBuffer, w, h, box=undefined) {
+    gl.bindFramebuffer(gl.FRAMEBUFFER, frameBuffer);
     try {
-        checkGetErrorResult(gl, "drawToTexture:bindFrameBuffer");
+        checkGetErrorResult(gl, "drawToFrameBuffer:bindFrameBuffer");
         checkFrameBufferStatusResult(gl);
         gl.viewport(0, 0, w, h);
+        if (box !== undefined) {
+            gl.enable(gl.SCISSOR_TEST);
+            gl.scissor(...box);
+        }
         gl.useProgram(program);
         gl.drawArrays(gl.TRIANGLES, 0, 6);
-        checkGetErrorResult(gl, "drawToTexture:drawArrays");
+        checkGetErrorResult(gl, "drawToFrameBuffer:drawArrays");
     } finally {
+        gl.disable(gl.SCISSOR_TEST);
         gl.bindFramebuffer(gl.FRAMEBUFFER, null);
     }
 }
 
+/**
+ * Copies the texels in an [x, y, w, h] box from one frame buffer into another of the same format.
+ * @param {!WebGLFramebuffer} src
+ * @param {!WebGLFramebuffer} dst
+ * @param {!Array.<!int>} box
+ */
+function copyBox(src, dst, box) {
+    let [x, y, w, h] = box;
+    //noinspection JSUnresolvedVariable
+    gl.bindFramebuffer(gl.READ_FRAMEBUFFER, src);
+    //noinspection JSUnresolvedVariable
+    gl.bindFramebuffer(gl.DRAW_FRAMEBUFFER, dst);
+    try {
+        //noinspection JSUnresolvedFunction
+        gl.blitFramebuffer(x, y, x + w, y + h, x, y, x + w, y + h, gl.COLOR_BUFFER_BIT, gl.NEAREST);
+        checkGetErrorResult(gl, "copyBox:blitFramebuffer");
+    } finally {
+        //noinspection JSUnresolvedVariable
+        gl.bindFramebuffer(gl.READ_FRAMEBUFFER, null);
+        //noinspection JSUnresolvedVariable
+        gl.bindFramebuffer(gl.DRAW_FRAMEBUFFER, null);
+    }
+}
+
+/**
+ * @param {!Tex|!LayeredTex} tex
+ * @returns {!Array.<!{frameBuffer: !WebGLFramebuffer, rect: !Array.<!int>}>} The frame buffers of the texture, with
+ *     the [x, y, w, h] part of the texture each holds.
+ */
+function frameBufferParts(tex) {
+    if (tex instanceof LayeredTex) {
+        let result = [];
+        for (let layer = 0; layer < tex.layers; layer++) {
+            result.push({frameBuffer: tex.frameBuffers[layer], rect: tex.layerRect(layer)});
+        }
+        return result;
+    }
+    return [{frameBuffer: tex.frameBuffer, rect: [0, 0, tex.width, tex.height]}];
+}
+
 function createShader(type, source) {
     let shader = gl.createShader(type);
     gl.shaderSource(shader, source);
@@ -391,11 +769,33 @@ function createFragProgram(fragmentShaderSource) {
 }
 
 class TexPair {
-    constructor(width, height, data=undefined) {
-        this.src = new Tex(width, height, data);
-        this.dst = new Tex(width, height);
+    /**
+     * @param {!int} width
+     * @param {!int} height
+     * @param {undefined|!Uint8Array|!Uint32Array} data
+     * @param {!boolean} packed
+     * @param {!Array.<!int>} shots
+     * @param {undefined|!Array.<!int>} layerSize When given, the textures are layered (see LayeredTex) with layers of
+     *     this size. Textures too large for the GPU are always layered.
+     */
+    constructor(width, height, data=undefined, packed=false, shots=[1, 1], layerSize=undefined) {
+        if (layerSize !== undefined || !fitsInTexture(width, height)) {
+            this.src = new LayeredTex(width, height, data, packed, shots, layerSize);
+            this.dst = new LayeredTex(width, height, undefined, packed, shots, layerSize);
+        } else {
+            this.src = new Tex(width, height, data, packed, shots);
+            this.dst = new Tex(width, height, undefined, packed, shots);
+        }
         this.width = width;
         this.height = height;
+        this.shots = shots;
+    }
+
+    /**
+     * @returns {!Array.<!number>}
+     */
+    tileSize() {
+        return this.src.tileSize();
     }
 
     swap() {
@@ -413,7 +813,9 @@ export {
     initGpu,
     createFragProgram,
     drawToTexture,
+    fitsInTexture,
     Tex,
+    LayeredTex,
     TexPair,
     ParametrizedShader,
     ParametrizedShaderWithArgs,
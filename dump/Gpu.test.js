@@ -1,7 +1,10 @@
 import {GpuSuite, assertThat, assertThrows, assertTrue, assertFalse} from "test/TestUtil.js"
 import {assertShaderOutputs, texture_diagram} from "test/GpuTestUtil.js"
 
-import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {ParametrizedShader, Tex, TexPair, LayeredTex} from 'src/sim/Gpu.js'
+import {shifter} from 'src/gen/shifter.js'
+import {singleCZ} from 'src/gen/singleCZ.js'
+import {singleHadamard} from 'src/gen/singleHadamard.js'
 
 let suite = new GpuSuite('gpu');
 
@@ -63,3 +66,67 @@ suite.test('shader', () => {
         'B8967'
     );
 });
+
+suite.test('texture-packed', () => {
+    let words = new Uint32Array([0, 1, 0xFFFFFFFF, 0x80000000, 5, 0xDEADBEEF]);
+    assertThat(new Tex(3, 2, words, true).read()).isEqualTo(words);
+    assertThat(new Tex(1, 6, words, true).read()).isEqualTo(words);
+
+    let shader = new ParametrizedShader(`#version 300 es
+        precision highp float;
+        precision highp int;
+        uniform vec2 state_size;
+        uniform highp usampler2D state;
+        out uint outColor;
+        void main() {
+            outColor = ~texture(state, gl_FragCoord.xy / state_size).x;
+        }`,
+        ['tex', 'state', 'state_size']);
+    assertThat(shader.withArgs(new Tex(3, 2, words, true)).read(3, 2, true)).isEqualTo(new Uint32Array(
+        [0xFFFFFFFF, 0xFFFFFFFE, 0, 0x7FFFFFFF, 0xFFFFFFFA, 0x21524110]));
+});
+
+suite.test('layered-texture', () => {
+    let bytes = new Uint8Array(7 * 5).map((_, i) => i + 1);
+    let tex = new LayeredTex(7, 5, bytes, false, [1, 1], [3, 2]);
+    assertThat(tex.layers).isEqualTo(9);
+    assertThat(tex.layerRect(8)).isEqualTo([6, 4, 1, 1]);
+    assertThat(tex.read()).isEqualTo(bytes);
+
+    let words = new Uint32Array([0, 1, 0xFFFFFFFF, 0x80000000, 5, 0xDEADBEEF]);
+    assertThat(new LayeredTex(3, 2, words, true, [1, 1], [2, 1]).read()).isEqualTo(words);
+});
+
+suite.test('layered-render', () => {
+    let bytes = new Uint8Array(6 * 8).map((_, i) => (i * 37) & 0xFF);
+    let plain = new TexPair(6, 8, bytes, false, [2, 2]);
+    let layered = new TexPair(6, 8, bytes, false, [2, 2], [4, 3]);
+    assertTrue(layered.src instanceof LayeredTex);
+    shifter.withArgs([1, 2], plain).renderInto(plain);
+    shifter.withArgs([1, 2], layered).renderInto(layered);
+    assertThat(layered.src.read()).isEqualTo(plain.src.read());
+    assertThrows(() => shifter.withArgs([1, 2], plain).renderInto(layered));
+});
+
+suite.test('footprint-render', () => {
+    let render = shaderWithArgs => {
+        let out = new Tex(6, 16, undefined, false, [2, 1]);
+        shaderWithArgs.renderInto(out);
+        return out.read();
+    };
+    let bytes = new Uint8Array(6 * 16).map((_, i) => ((i * 37) >> 2) & 1 ? 255 : 0);
+    for (let layerSize of [undefined, [4, 5]]) {
+        let plain = new Tex(6, 16, bytes, false, [2, 1]);
+        let pair = new TexPair(6, 16, bytes, false, [2, 1], layerSize);
+        let src = pair.src;
+        singleHadamard.withArgs(2, pair).renderInto(pair);
+        // Only the target's rows were drawn, in place.
+        assertTrue(pair.src === src);
+        let expected = render(singleHadamard.withArgs(2, plain));
+        assertThat(pair.src.read()).isEqualTo(expected);
+
+        singleCZ.withArgs(0, 5, pair).renderInto(pair);
+        expected = render(singleCZ.withArgs(0, 5, new Tex(6, 16, expected, false, [2, 1])));
+        assertThat(pair.src.read()).isEqualTo(expected);
+    }
+});
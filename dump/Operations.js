@@ -1,50 +1,309 @@
+import {DetailedError} from 'src/base/DetailedError.js'
 import {TexPair} from 'src/sim/Gpu.js'
+import {Prng} from 'src/sim/Prng.js'
 import {bitToInt} from 'src/gen/bitToInt.js'
-import {randomAdvance} from 'src/gen/randomAdvance.js'
 import {eliminateCol} from 'src/gen/eliminateCol.js'
 import {shifter} from 'src/gen/shifter.js'
 import {measureSetResult} from 'src/gen/measureSetResult.js'
 import {findOneFold} from 'src/gen/findOneFold.js'
+import {findOneFold4} from 'src/gen/findOneFold4.js'
+import {findOneFold8} from 'src/gen/findOneFold8.js'
+import {findOneFold16} from 'src/gen/findOneFold16.js'
+import {orFold} from 'src/gen/orFold.js'
+import {orFold4} from 'src/gen/orFold4.js'
+import {orFold8} from 'src/gen/orFold8.js'
+import {orFold16} from 'src/gen/orFold16.js'
+import {orFoldPacked} from 'src/gen/orFoldPacked.js'
+import {orFold4Packed} from 'src/gen/orFold4Packed.js'
+import {orFold8Packed} from 'src/gen/orFold8Packed.js'
+import {orFold16Packed} from 'src/gen/orFold16Packed.js'
+import {measureClaims} from 'src/gen/measureClaims.js'
+import {minFoldRows} from 'src/gen/minFoldRows.js'
+import {measureBatchSetResult} from 'src/gen/measureBatchSetResult.js'
+import {eliminateCols} from 'src/gen/eliminateCols.js'
+import {measureBlocked} from 'src/gen/measureBlocked.js'
+import {orAll} from 'src/gen/orAll.js'
+import {frameMeasureRecord} from 'src/gen/frameMeasureRecord.js'
+import {frameMeasureReset} from 'src/gen/frameMeasureReset.js'
+import {gatherMeasurements} from 'src/gen/gatherMeasurements.js'
+import {gatherFrameRecord} from 'src/gen/gatherFrameRecord.js'
+import {depolarize} from 'src/gen/depolarize.js'
+import {depolarizeFrame} from 'src/gen/depolarizeFrame.js'
+import {bitFlip} from 'src/gen/bitFlip.js'
+import {bitFlipFrame} from 'src/gen/bitFlipFrame.js'
+import {measurementFlip} from 'src/gen/measurementFlip.js'
+import {measurementFlipFrame} from 'src/gen/measurementFlipFrame.js'
 
 /**
- * @param {!int} h
- * @returns {!TexPair}
+ * The fold shaders of each arity (the number of texels combined into each output texel), in increasing order.
+ * @type {!Array.<!{arity: !int, findOne: !ParametrizedShader, or: !ParametrizedShader, orPacked: !ParametrizedShader}>}
  */
-function createPrng(h) {
-    let rng_seed = new Uint8Array(4 * h);
-    for (let i = 0; i < rng_seed.length; i++) {
-        rng_seed[i] = Math.floor(Math.random() * 256);
+const FOLDS = [
+    {arity: 2, findOne: findOneFold, or: orFold, orPacked: orFoldPacked},
+    {arity: 4, findOne: findOneFold4, or: orFold4, orPacked: orFold4Packed},
+    {arity: 8, findOne: findOneFold8, or: orFold8, orPacked: orFold8Packed},
+    {arity: 16, findOne: findOneFold16, or: orFold16, orPacked: orFold16Packed},
+];
+
+/**
+ * Picks the folds reducing a width down to a single texel in as few passes as possible. Each pass uses the largest
+ * fold, except the last which uses the smallest fold that finishes.
+ * @param {!int} w
+ * @returns {!Array.<!{arity: !int, findOne: !ParametrizedShader, or: !ParametrizedShader, orPacked: !ParametrizedShader}>}
+ */
+function foldPasses(w) {
+    let passes = [];
+    while (w > 1) {
+        let fold = FOLDS.find(e => e.arity >= w) || FOLDS[FOLDS.length - 1];
+        passes.push(fold);
+        w = Math.ceil(w / fold.arity);
     }
-    return new TexPair(4, h, rng_seed);
+    return passes;
+}
+
+/**
+ * @param {!int} seed Defaults to a random seed.
+ * @returns {!Prng}
+ */
+function createPrng(seed=Math.floor(Math.random() * 0x100000000)) {
+    return new Prng(seed);
 }
 
 /**
- * @param {!TexPair} rngState
+ * Moves on to fresh random values. Shaders drawing random values should be followed by an advance.
+ * @param {!Prng} prng
  */
-function advancePrng(rngState) {
-    randomAdvance.withArgs(rngState).renderInto(rngState);
+function advancePrng(prng) {
+    prng.advance();
 }
 
 /**
  * @param {!TexPair} sim_state
  * @param {!TexPair} fold_state
- * @param {!TexPair} rand_state
+ * @param {!Prng} rand_state
  * @param {!int} target
  */
 function advanceMeasureWithReset(sim_state, fold_state, rand_state, target) {
+    foldFirstOnes(sim_state, fold_state);
+
+    measureSetResult.withArgs(target, rand_state.counter, rand_state.seed, fold_state, sim_state).
+        renderInto(sim_state);
+    advancePrng(rand_state);
+
+    eliminateCol.withArgs(target, fold_state, sim_state).renderInto(sim_state);
+}
+
+/**
+ * Puts the (off by one) column of the first variable of each row of the state into column 0 of the fold state.
+ * @param {!TexPair} sim_state
+ * @param {!TexPair} fold_state
+ */
+function foldFirstOnes(sim_state, fold_state) {
     shifter.withArgs([-2, 0], sim_state.src).renderInto(fold_state);
     bitToInt.withArgs(fold_state).renderInto(fold_state);
 
-    let w = Math.ceil(sim_state.src.width - 2);
-    while (w > 1) {
-        findOneFold.withArgs(fold_state.src).renderInto(fold_state);
-        w = Math.ceil(w / 2);
+    for (let fold of foldPasses(sim_state.tileSize()[0] - 2)) {
+        fold.findOne.withArgs(fold_state.src).renderInto(fold_state);
+    }
+}
+
+/**
+ * Ors each row of the given state together, into column 0.
+ * @param {!TexPair} state
+ * @param {!boolean} packed Whether the state holds packed bits instead of bits.
+ */
+function orFoldRows(state, packed=false) {
+    for (let fold of foldPasses(state.tileSize()[0])) {
+        (packed ? fold.orPacked : fold.or).withArgs(state.src).renderInto(state);
+    }
+}
+
+/**
+ * Claims are stored as bytes, with 255 meaning unclaimed, so batches need fewer than this many columns and targets.
+ * @type {!int}
+ */
+const NO_CLAIM = 255;
+
+/**
+ * Measures (with reset) every qubit marked in the targets texture. Each round of draws handles all targets with a
+ * determined result and all random targets whose pivot columns don't conflict, so usually one or two rounds suffice.
+ *
+ * Whether another round is needed is decided on the GPU, so that each round only reads back a single texel.
+ * @param {!TexPair} sim_state
+ * @param {!TexPair} fold_state
+ * @param {!TexPair} claim_state Twice as wide as the sim state.
+ * @param {!Prng} rand_state
+ * @param {!Tex|!TexPair} targets A 1xN texture with a set texel for each target qubit, shared by all shots.
+ * @param {!TexPair} blocked_state A texture with a single texel per shot, layered when the states are.
+ * @param {!TexPair} blocked_flag A 1x1 texture, layered when the states are.
+ */
+function advanceMeasureBatch(sim_state, fold_state, claim_state, rand_state, targets, blocked_state, blocked_flag) {
+    let [columns] = sim_state.tileSize();
+    let qubits = targets.height;
+    if (columns >= NO_CLAIM || qubits >= NO_CLAIM) {
+        throw new DetailedError('Too many columns or qubits for a batched measurement.', {columns, qubits});
+    }
+    for (let round = 0; ; round++) {
+        foldFirstOnes(sim_state, fold_state);
+        measureClaims.withArgs(fold_state, sim_state, targets).renderInto(claim_state);
+        let h = claim_state.tileSize()[1];
+        while (h > 1) {
+            minFoldRows.withArgs(claim_state).renderInto(claim_state);
+            h = Math.ceil(h / 2);
+        }
+
+        measureBatchSetResult.withArgs(
+            round === 0, rand_state.counter, rand_state.seed, claim_state, fold_state, sim_state, targets).
+            renderInto(sim_state);
+        advancePrng(rand_state);
+        eliminateCols.withArgs(claim_state, fold_state, sim_state).renderInto(sim_state);
+
+        // Targets skipped because another target claimed their pivot column need another round.
+        measureBlocked.withArgs(claim_state, fold_state, targets).renderInto(blocked_state);
+        orAll.withArgs(blocked_state).renderInto(blocked_flag);
+        if (blocked_flag.read()[0] === 0) {
+            return;
+        }
+    }
+}
+
+/**
+ * Records the measurement flips of a batch of Pauli frames (one shot per row) and then resets the measured qubits.
+ * @param {!TexPair} frame_state
+ * @param {!Tex|!TexPair} record The shots x num_qubits texture receiving the measurement flips.
+ * @param {!Prng} rand_state
+ * @param {!Tex|!TexPair} targets A 1xN texture with a set texel for each target qubit.
+ */
+function advanceFrameMeasure(frame_state, record, rand_state, targets) {
+    frameMeasureRecord.withArgs(frame_state).renderInto(record);
+    frameMeasureReset.withArgs(rand_state.counter, rand_state.seed, frame_state, targets).renderInto(frame_state);
+    advancePrng(rand_state);
+}
+
+/**
+ * Reads the measurement results of the target qubits out of a (single shot, unpacked) tableau. Xor-ing frame
+ * measurement flips into these reference results gives the results of each frame's shot.
+ * @param {!TexPair} sim_state
+ * @param {!Uint8Array} target_flags
+ * @returns {!Array.<!boolean>}
+ */
+function readMeasurementRecord(sim_state, target_flags) {
+    let data = sim_state.read();
+    let result = [];
+    for (let t = 0; t < target_flags.length; t++) {
+        if (target_flags[t] !== 0) {
+            result.push(data[(t*2 + 1) * sim_state.width] !== 0);
+        }
     }
+    return result;
+}
 
-    measureSetResult.withArgs(target, fold_state, rand_state, sim_state).renderInto(sim_state);
+/**
+ * Reads back the measurement results of every shot of a measured tableau, packed 32 per word.
+ * @param {!TexPair} sim_state
+ * @param {!Tex|!TexPair} targets A 1xN texture with a set texel for each target qubit.
+ * @param {!Tex|!TexPair} gathered A packed texture with a row of ceil(N/32) texels per shot, tiled like the sim state.
+ * @returns {!Array.<!Uint32Array>} See readPackedShots.
+ */
+function readMeasurementBits(sim_state, targets, gathered) {
+    gatherMeasurements.withArgs(sim_state, targets).renderInto(gathered);
+    return readPackedShots(gathered);
+}
+
+/**
+ * Reads back the measurement flips recorded by advanceFrameMeasure, packed 32 per word.
+ * @param {!Tex|!TexPair} record
+ * @param {!Tex|!TexPair} gathered A packed texture with ceil(N/32) texels per row, and a shot per row.
+ * @returns {!Array.<!Uint32Array>} See readPackedShots.
+ */
+function readFrameRecordBits(record, gathered) {
+    gatherFrameRecord.withArgs(record).renderInto(gathered);
+    return readPackedShots(gathered);
+}
+
+/**
+ * Splits the words of a packed texture into each shot's words, with shots in row-major order. Bit q of a shot is
+ * (words[q >> 5] >>> (q & 31)) & 1.
+ * @param {!Tex|!TexPair} packed_tex
+ * @returns {!Array.<!Uint32Array>}
+ */
+function readPackedShots(packed_tex) {
+    let data = packed_tex.read();
+    let [w, h] = packed_tex.tileSize();
+    let [cols, rows] = packed_tex.shots;
+    let result = [];
+    for (let shot_y = 0; shot_y < rows; shot_y++) {
+        for (let shot_x = 0; shot_x < cols; shot_x++) {
+            let words = new Uint32Array(w * h);
+            for (let y = 0; y < h; y++) {
+                let start = (shot_y * h + y) * packed_tex.width + shot_x * w;
+                words.set(data.subarray(start, start + w), y * w);
+            }
+            result.push(words);
+        }
+    }
+    return result;
+}
+
+/**
+ * Applies a random one of X, Y or Z to every qubit with the given probability.
+ * @param {!TexPair} state A tableau, or a texture of Pauli frames when frame is set.
+ * @param {!Prng} rand_state
+ * @param {!number} probability
+ * @param {!boolean} frame
+ */
+function applyDepolarizing(state, rand_state, probability, frame=false) {
+    if (frame) {
+        depolarizeFrame.withArgs(probability, rand_state.counter, rand_state.seed, state).renderInto(state);
+    } else {
+        depolarize.withArgs(probability, rand_state.counter, rand_state.seed, state).renderInto(state);
+    }
     advancePrng(rand_state);
+}
 
-    eliminateCol.withArgs(target, fold_state, sim_state).renderInto(sim_state);
+/**
+ * Applies X to every qubit with the given probability.
+ * @param {!TexPair} state A tableau, or a texture of Pauli frames when frame is set.
+ * @param {!Prng} rand_state
+ * @param {!number} probability
+ * @param {!boolean} frame
+ */
+function applyBitFlips(state, rand_state, probability, frame=false) {
+    if (frame) {
+        bitFlipFrame.withArgs(probability, rand_state.counter, rand_state.seed, state).renderInto(state);
+    } else {
+        bitFlip.withArgs(probability, rand_state.counter, rand_state.seed, state).renderInto(state);
+    }
+    advancePrng(rand_state);
 }
 
-export {createPrng, advancePrng, advanceMeasureWithReset}
+/**
+ * Flips the recorded measurement result of every target qubit with the given probability.
+ * @param {!TexPair} record A measured tableau, or the frame record written by advanceFrameMeasure when frame is set.
+ * @param {!Prng} rand_state
+ * @param {!Tex|!TexPair} targets A 1xN texture with a set texel for each target qubit.
+ * @param {!number} probability
+ * @param {!boolean} frame
+ */
+function applyMeasurementFlips(record, rand_state, targets, probability, frame=false) {
+    let shader = frame ? measurementFlipFrame : measurementFlip;
+    shader.withArgs(probability, rand_state.counter, rand_state.seed, record, targets).renderInto(record);
+    advancePrng(rand_state);
+}
+
+export {
+    createPrng,
+    advancePrng,
+    advanceMeasureWithReset,
+    advanceMeasureBatch,
+    advanceFrameMeasure,
+    foldPasses,
+    orFoldRows,
+    readMeasurementRecord,
+    readMeasurementBits,
+    readFrameRecordBits,
+    readPackedShots,
+    applyDepolarizing,
+    applyBitFlips,
+    applyMeasurementFlips,
+}
@@ -2,42 +2,78 @@ import {GpuSuite, assertThat, assertThrows, assertTrue, assertFalse} from "test/
 import {assertShaderOutputs, assertTextureReads, texture_diagram} from "test/GpuTestUtil.js"
 
 import {TexPair} from 'src/sim/Gpu.js'
-import {createPrng, advancePrng, advanceMeasureWithReset} from 'src/sim/Operations.js'
+import {randomBit} from 'src/sim/Prng.js'
+import {
+    createPrng,
+    advancePrng,
+    advanceMeasureWithReset,
+    advanceMeasureBatch,
+    advanceFrameMeasure,
+    foldPasses,
+    applyBitFlips,
+    readFrameRecordBits,
+} from 'src/sim/Operations.js'
 
 let suite = new GpuSuite('operations');
 
-suite.test('createPrng-distinction', () => {
-    let prng = createPrng(30);
-    let seed = prng.read();
-    let seen = new Set();
-    for (let e of seed) {
-        seen.add(e);
+/**
+ * Finds a PRNG whose next draws (for the shot at 0, 0) give the wanted bits.
+ * @param {...!Array.<!boolean|!int>} draws Each wanted bit followed by the keys it is drawn with.
+ * @returns {!Prng}
+ */
+function prngGiving(...draws) {
+    for (let seed = 0; ; seed++) {
+        let prng = createPrng(seed);
+        if (draws.every(([bit, ...keys]) => randomBit(prng, [0, 0], ...keys) === bit)) {
+            return prng;
+        }
     }
-    assertThat(seen.size).isGreaterThan(50);
+}
 
-    advancePrng(prng);
-    let next = prng.read();
-    let same = 0;
-    for (let i = 0; i < seed.length; i++) {
-        if (seed[i] === next[i]) {
-            same += 1;
+suite.test('createPrng-distinction', () => {
+    let bits = prng => {
+        let result = [];
+        for (let k = 0; k < 100; k++) {
+            result.push(randomBit(prng, [0, 0], k));
         }
-    }
+        return result;
+    };
+    let prng = createPrng();
+    let seen = bits(prng);
+    let ones = seen.filter(e => e).length;
+    assertThat(ones).isGreaterThan(25);
+    assertThat(ones).isLessThan(75);
+    assertThat(bits(createPrng(prng.seed))).isEqualTo(seen);
+    assertThat(bits(createPrng(prng.seed ^ 1))).isNotEqualTo(seen);
+});
+
+suite.test('foldPasses', () => {
+    let arities = w => foldPasses(w).map(e => e.arity);
+    assertThat(arities(1)).isEqualTo([]);
+    assertThat(arities(2)).isEqualTo([2]);
+    assertThat(arities(3)).isEqualTo([4]);
+    assertThat(arities(16)).isEqualTo([16]);
+    assertThat(arities(17)).isEqualTo([16, 2]);
+    assertThat(arities(100)).isEqualTo([16, 8]);
+    assertThat(arities(300)).isEqualTo([16, 16, 2]);
 });
 
 suite.test('advancePrng-agreement-between-states', () => {
     let prng = createPrng(2048);
-    let seed = prng.read();
+    let seed = [];
+    for (let k = 0; k < 100; k++) {
+        seed.push(randomBit(prng, [0, 0], k));
+    }
     advancePrng(prng);
-    let next = prng.read();
+    assertThat(prng.counter).isEqualTo(1);
     let same = 0;
-    for (let i = 0; i < seed.length; i++) {
-        if (seed[i] === next[i]) {
+    for (let k = 0; k < 100; k++) {
+        if (seed[k] === randomBit(prng, [0, 0], k)) {
             same += 1;
         }
     }
-    assertThat(same).isGreaterThan(10);
-    assertThat(same).isLessThan(50);
+    assertThat(same).isGreaterThan(25);
+    assertThat(same).isLessThan(75);
 });
 
 suite.test('advanceMeasureWithReset-random-toggle', () => {
@@ -51,15 +87,8 @@ suite.test('advanceMeasureWithReset-random-toggle', () => {
         '          ',
         '    #  #  ');
     let fold = new TexPair(state.src.width, state.src.height);
-    let rng = texture_diagram(
-        '    ',
-        '    ',
-        '    ',
-        '1   ',
-        '    ',
-        '    ',
-        '    ',
-        '    ');
+    // Qubit 1's measurement draws its bit with key 1.
+    let rng = prngGiving([true, 1]);
     advanceMeasureWithReset(state, fold, rng, 1);
 
     assertTextureReads(fold,
@@ -71,15 +100,7 @@ suite.test('advanceMeasureWithReset-random-toggle', () => {
         '1         ',
         '          ',
         '3         ');
-    assertTextureReads(rng,
-        '    ',
-        '    ',
-        '    ',
-        [33, 32, 4, 0],
-        '    ',
-        '    ',
-        '    ',
-        '    ');
+    assertThat(rng.counter).isEqualTo(1);
     assertTextureReads(state,
         ' #    # # ',
         '       #  ',
@@ -92,15 +113,7 @@ suite.test('advanceMeasureWithReset-random-toggle', () => {
 });
 
 suite.test('advanceMeasureWithReset-random-no-toggle', () => {
-    let rng = texture_diagram(
-        '    ',
-        '    ',
-        '    ',
-        '2   ',
-        '    ',
-        '    ',
-        '    ',
-        '    ');
+    let rng = prngGiving([false, 1]);
     let state = texture_diagram(
         ' #   #  # ',
         '     ###  ',
@@ -135,7 +148,7 @@ suite.test('advanceMeasureWithReset-implied-false', () => {
         '     #### ',
         '    #  #  ');
     let fold = new TexPair(state.src.width, state.src.height);
-    let rng = createPrng(state.src.height);
+    let rng = createPrng();
     advanceMeasureWithReset(state, fold, rng, 0);
 
     assertTextureReads(state,
@@ -160,7 +173,7 @@ suite.test('advanceMeasureWithReset-implied-true', () => {
         '     #### ',
         '    #  #  ');
     let fold = new TexPair(state.src.width, state.src.height);
-    let rng = createPrng(state.src.height);
+    let rng = createPrng();
     advanceMeasureWithReset(state, fold, rng, 0);
 
     assertTextureReads(state,
@@ -173,3 +186,87 @@ suite.test('advanceMeasureWithReset-implied-true', () => {
         '     #### ',
         '    #  #  ');
 });
+
+suite.test('advanceMeasureBatch-matches-single', () => {
+    let state = texture_diagram(
+        ' #   #  # ',
+        '     ###  ',
+        '    #  #  ',
+        '##   ##   ',
+        '    # #   ',
+        '##########',
+        '          ',
+        '    #  #  ');
+    let fold = new TexPair(state.src.width, state.src.height);
+    let claims = new TexPair(state.src.width * 2, state.src.height);
+    let rng = prngGiving([true, 1]);
+    let targets = texture_diagram(
+        ' ',
+        '#',
+        ' ',
+        ' ');
+    advanceMeasureBatch(state, fold, claims, rng, targets, new TexPair(1, 1), new TexPair(1, 1));
+
+    assertTextureReads(state,
+        ' #    # # ',
+        '       #  ',
+        '     #    ',
+        '#         ',
+        '    # #   ',
+        '#####  ###',
+        '          ',
+        '    #  #  ');
+});
+
+suite.test('advanceMeasureBatch-too-wide', () => {
+    let state = new TexPair(255, 8);
+    let claims = new TexPair(510, 8);
+    let targets = new TexPair(1, 4);
+    assertThrows(() => advanceMeasureBatch(
+        state, new TexPair(255, 8), claims, createPrng(0), targets, new TexPair(1, 1), new TexPair(1, 1)));
+});
+
+suite.test('advanceFrameMeasure', () => {
+    let frame = texture_diagram(
+        '# # ',
+        ' ###');
+    let record = new TexPair(2, 2);
+    // Frames draw with the qubit and the shot's row as keys.
+    let rng = prngGiving([false, 1, 0], [false, 1, 1]);
+    let targets = texture_diagram(
+        ' ',
+        '#');
+    advanceFrameMeasure(frame, record, rng, targets);
+
+    assertTextureReads(record,
+        '##',
+        ' #');
+    assertTextureReads(frame,
+        '#   ',
+        ' #  ');
+});
+
+suite.test('applyBitFlips-frame-extremes', () => {
+    let frame = texture_diagram(
+        '  # ',
+        '## #');
+    let rng = createPrng();
+    applyBitFlips(frame, rng, 0, true);
+    assertTextureReads(frame,
+        '  # ',
+        '## #');
+
+    applyBitFlips(frame, rng, 1, true);
+    assertTextureReads(frame,
+        '# ##',
+        ' # #');
+});
+
+suite.test('readFrameRecordBits', () => {
+    let record = texture_diagram(
+        '# #',
+        ' ##');
+    let gathered = new TexPair(1, 2, undefined, true, [1, 2]);
+    let shots = readFrameRecordBits(record, gathered);
+    assertThat(shots.map(words => [...words])).isEqualTo([[5], [6]]);
+});
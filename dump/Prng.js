@@ -0,0 +1,60 @@
+/**
+ * The state of the counter-based PRNG used by the generated shaders (see shader-codegen/prng.py). Random values are
+ * a pure function of the seed, the counter and what they are drawn for, so advancing only increments the counter.
+ */
+class Prng {
+    /**
+     * @param {!int} seed
+     * @param {!int} counter
+     */
+    constructor(seed, counter=0) {
+        this.seed = seed >>> 0;
+        this.counter = counter >>> 0;
+    }
+
+    advance() {
+        this.counter = (this.counter + 1) >>> 0;
+    }
+}
+
+/**
+ * Scrambles a 32 bit word (with the 'lowbias32' integer hash). Matches prng.mix.
+ * @param {!int} word
+ * @returns {!int}
+ */
+function mix(word) {
+    word ^= word >>> 16;
+    word = Math.imul(word, 0x7FEB352D);
+    word ^= word >>> 15;
+    word = Math.imul(word, 0x846CA68B);
+    word ^= word >>> 16;
+    return word >>> 0;
+}
+
+/**
+ * The word the shaders draw for the given keys. Matches prng.random_word.
+ * @param {!Prng} prng
+ * @param {!Array.<!int>} shot The shot's tile (0, 0 for untiled textures).
+ * @param {...!int} keys
+ * @returns {!int}
+ */
+function randomWord(prng, shot, ...keys) {
+    let h = mix(prng.seed);
+    for (let key of [prng.counter, ...shot, ...keys]) {
+        h = mix(h ^ key);
+    }
+    return h;
+}
+
+/**
+ * The bit the shaders draw for the given keys. Matches prng.random_bit.
+ * @param {!Prng} prng
+ * @param {!Array.<!int>} shot
+ * @param {...!int} keys
+ * @returns {!boolean}
+ */
+function randomBit(prng, shot, ...keys) {
+    return (randomWord(prng, shot, ...keys) >>> 31) === 1;
+}
+
+export {Prng, randomWord, randomBit}
@@ -0,0 +1,26 @@
+import {Suite, assertThat} from "test/TestUtil.js"
+
+import {Prng, randomWord, randomBit} from 'src/sim/Prng.js'
+
+let suite = new Suite('Prng');
+
+suite.test('randomWord-matches-shaders', () => {
+    // Computed by evaluating prng.random_word(X, Y) with the interpreter.
+    let prng = new Prng(12345, 7);
+    let words = [0, 1].map(y => [0, 1, 2].map(x => randomWord(prng, [0, 0], x, y)));
+    assertThat(words).isEqualTo([
+        [1385238222, 4171289637, 4230445925],
+        [2967907285, 99256494, 2336403045],
+    ]);
+    assertThat(randomBit(prng, [0, 0], 1, 0)).isEqualTo(true);
+    assertThat(randomBit(prng, [0, 0], 1, 1)).isEqualTo(false);
+});
+
+suite.test('advance', () => {
+    let prng = new Prng(5, 0xFFFFFFFF);
+    let before = randomWord(prng, [0, 0]);
+    prng.advance();
+    assertThat(prng.counter).isEqualTo(0);
+    assertThat(prng.seed).isEqualTo(5);
+    assertThat(randomWord(prng, [0, 0])).isNotEqualTo(before);
+});
@@ -0,0 +1,143 @@
+/**
+ * Specialized variants of generated shaders, keyed by the shader they specialize.
+ * @type {!Map.<!ParametrizedShader, !Array.<!{values: !Object.<!string, *>, variant: !ParametrizedShader}>>}
+ */
+let variants = new Map();
+
+/**
+ * Records that a shader has a variant with some of its uniforms fixed to the given values. Variants take the same
+ * arguments as the shader they specialize.
+ * @param {!ParametrizedShader} shader
+ * @param {!Object.<!string, *>} values
+ * @param {!ParametrizedShader} variant
+ */
+function registerVariant(shader, values, variant) {
+    if (!variants.has(shader)) {
+        variants.set(shader, []);
+    }
+    variants.get(shader).push({values, variant});
+}
+
+/**
+ * Picks the variant of a shader specialized to the given uniform values, or the shader itself when there's no such
+ * variant.
+ * @param {!ParametrizedShader} shader
+ * @param {!Object.<!string, *>} values The values of (at least) the uniforms fixed by variants.
+ * @returns {!ParametrizedShader}
+ */
+function pickVariant(shader, values) {
+    for (let {values: fixed, variant} of variants.get(shader) || []) {
+        if (Object.keys(fixed).every(key => sameValue(fixed[key], values[key]))) {
+            return variant;
+        }
+    }
+    return shader;
+}
+
+/**
+ * @param {*} a
+ * @param {*} b
+ * @returns {!boolean} Whether the values are the same, comparing arrays (e.g. tile sizes) element by element.
+ */
+function sameValue(a, b) {
+    if (Array.isArray(a)) {
+        return Array.isArray(b) && a.length === b.length && a.every((e, i) => e === b[i]);
+    }
+    return a === b;
+}
+
+/**
+ * The variant of each tiled shader (and of its specialized variants) computing a single shot, without tiles.
+ * @type {!Map.<!ParametrizedShader, !ParametrizedShader>}
+ */
+let singleShotVariants = new Map();
+
+/**
+ * Records the untiled variant of a shader, which is equivalent to it when every texture holds a single shot. It
+ * takes the same arguments as the shader.
+ * @param {!ParametrizedShader} shader
+ * @param {!ParametrizedShader} untiled
+ */
+function registerSingleShot(shader, untiled) {
+    singleShotVariants.set(shader, untiled);
+}
+
+/**
+ * @param {!ParametrizedShader} shader
+ * @returns {undefined|!ParametrizedShader} The shader's variant for single shot textures, if it has one.
+ */
+function singleShotVariant(shader) {
+    return singleShotVariants.get(shader);
+}
+
+/**
+ * The variant of each generated shader (and of its specialized variants) that draws into layered textures.
+ * @type {!Map.<!ParametrizedShader, !ParametrizedShader>}
+ */
+let layeredVariants = new Map();
+
+/**
+ * Records the variant of a shader that reads and writes layered textures (see LayeredTex in Gpu.js). It takes the
+ * same arguments as the shader.
+ * @param {!ParametrizedShader} shader
+ * @param {!ParametrizedShader} layered
+ */
+function registerLayered(shader, layered) {
+    layeredVariants.set(shader, layered);
+}
+
+/**
+ * @param {!ParametrizedShader} shader
+ * @returns {undefined|!ParametrizedShader} The variant of the shader drawing into layered textures, if it has one.
+ */
+function layeredVariant(shader) {
+    return layeredVariants.get(shader);
+}
+
+/**
+ * The texels each generated shader (or variant) can change in the texture it updates, see registerFootprint.
+ * @type {!Map.<!ParametrizedShader, !{texName: !string, rects: !function(!Object.<!string, *>): !Array.<!Array.<!number>>}>}
+ */
+let footprints = new Map();
+
+/**
+ * Records which texels of a texture argument a shader can change (see shader-codegen/footprint.py), so that
+ * rendering the shader in place only needs to draw those texels.
+ * @param {!ParametrizedShader} shader
+ * @param {!string} texName The name of the texture parameter.
+ * @param {!function(!Object.<!string, *>): !Array.<!Array.<!number>>} rects Computes, from the shader's arguments
+ *     keyed by parameter name, [x_low, x_high, y_low, y_high] bounds of rects within each shot's tile covering the
+ *     texels that may change. High bounds are exclusive, and may be past the edge of the tile.
+ */
+function registerFootprint(shader, texName, rects) {
+    footprints.set(shader, {texName, rects});
+}
+
+/**
+ * @param {!ParametrizedShader} shader
+ * @param {!Array.<*>} args The shader's arguments.
+ * @returns {undefined|!{tex: *, rects: !Array.<!Array.<!number>>}} The texture argument the shader changes in place,
+ *     with rects covering the texels it can change, or undefined when the shader has no known footprint.
+ */
+function footprint(shader, args) {
+    let entry = footprints.get(shader);
+    if (entry === undefined) {
+        return undefined;
+    }
+    let values = {};
+    shader.params.forEach((param, i) => {
+        values[param[1]] = args[i];
+    });
+    return {tex: values[entry.texName], rects: entry.rects(values)};
+}
+
+export {
+    registerVariant,
+    pickVariant,
+    registerSingleShot,
+    singleShotVariant,
+    registerLayered,
+    layeredVariant,
+    registerFootprint,
+    footprint,
+}
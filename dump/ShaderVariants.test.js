@@ -0,0 +1,78 @@
+import {Suite, assertThat} from "test/TestUtil.js"
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {
+    registerVariant,
+    pickVariant,
+    registerSingleShot,
+    singleShotVariant,
+    registerLayered,
+    layeredVariant,
+    registerFootprint,
+    footprint,
+} from 'src/sim/ShaderVariants.js'
+
+let suite = new Suite('ShaderVariants');
+
+/**
+ * A trivial shader's source, for variants that are only compared by identity.
+ */
+const SOURCE = `#version 300 es
+    precision highp float;
+    out float outColor;
+    void main() {
+        outColor = 0.0;
+    }`;
+
+suite.test('pickVariant', () => {
+    let generic = new ParametrizedShader(SOURCE, ['1i', 'w', false]);
+    let five = new ParametrizedShader(SOURCE, ['1i', 'w', false]);
+    let nine = new ParametrizedShader(SOURCE, ['1i', 'w', false]);
+    registerVariant(generic, {w: 5, h: 5}, five);
+    registerVariant(generic, {w: 9, h: 9}, nine);
+
+    assertThat(pickVariant(generic, {w: 5, h: 5}) === five).isEqualTo(true);
+    assertThat(pickVariant(generic, {w: 9, h: 9}) === nine).isEqualTo(true);
+    assertThat(pickVariant(generic, {w: 5, h: 9}) === generic).isEqualTo(true);
+    assertThat(pickVariant(generic, {w: 7, h: 7}) === generic).isEqualTo(true);
+    assertThat(pickVariant(five, {w: 5, h: 5}) === five).isEqualTo(true);
+});
+
+suite.test('pickVariant-tiles', () => {
+    let generic = new ParametrizedShader(SOURCE, ['tex', 'state', undefined, 'state_tile']);
+    let fixed = new ParametrizedShader(SOURCE, ['tex', 'state', undefined, 'state_tile']);
+    registerVariant(generic, {out_tile: [27, 50], state_tile: [27, 50]}, fixed);
+
+    assertThat(pickVariant(generic, {out_tile: [27, 50], state_tile: [27, 50]}) === fixed).isEqualTo(true);
+    assertThat(pickVariant(generic, {out_tile: [27, 50], state_tile: [27, 51]}) === generic).isEqualTo(true);
+    assertThat(pickVariant(generic, {out_tile: [27, 50]}) === generic).isEqualTo(true);
+    assertThat(pickVariant(generic, {out_tile: [27], state_tile: [27, 50]}) === generic).isEqualTo(true);
+});
+
+suite.test('singleShotVariant', () => {
+    let shader = new ParametrizedShader(SOURCE);
+    let untiled = new ParametrizedShader(SOURCE);
+    registerSingleShot(shader, untiled);
+
+    assertThat(singleShotVariant(shader) === untiled).isEqualTo(true);
+    assertThat(singleShotVariant(untiled)).isEqualTo(undefined);
+});
+
+suite.test('layeredVariant', () => {
+    let shader = new ParametrizedShader(SOURCE);
+    let layered = new ParametrizedShader(SOURCE);
+    registerLayered(shader, layered);
+
+    assertThat(layeredVariant(shader) === layered).isEqualTo(true);
+    assertThat(layeredVariant(layered)).isEqualTo(undefined);
+});
+
+suite.test('footprint', () => {
+    let shader = new ParametrizedShader(SOURCE, ['tex', 'state'], ['1i', 'target', false]);
+    registerFootprint(shader, 'state', ({target}) => [[0, Infinity, target << 1, (target + 1) << 1]]);
+
+    let state = {};
+    assertThat(footprint(shader, [state, 3]).tex === state).isEqualTo(true);
+    assertThat(footprint(shader, [state, 3]).rects).isEqualTo([[0, Infinity, 6, 8]]);
+    assertThat(footprint(new ParametrizedShader(SOURCE), [])).isEqualTo(undefined);
+});
@@ -1,21 +1,71 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let bitToInt = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int add_2 = ((x / func_int_0) * func_int_1) + clamp((x % func_int_0), 0, (func_int_1 - 1));
+        int func_int_4 = int(state_tile.y);
+        int func_int_3 = int(out_tile.y);
+        outColor = float(int((texelFetch(state, ivec2(add_2, (((y / func_int_3) * func_int_4) + clamp((y % func_int_3), 0, (func_int_4 - 1)))), 0).x > 0.5))) / 255.0;
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let bitToIntLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int add_3 = ((add_0 / func_int_1) * func_int_2) + clamp((add_0 % func_int_1), 0, (func_int_2 - 1));
+        int func_int_4 = int(state_size.x);
+        int func_clamp_5 = clamp(add_3, 0, (func_int_4 - 1));
+        int func_int_6 = int(state_layer.x);
+        int mod_7 = func_clamp_5 % func_int_6;
+        int func_int_10 = int(state_tile.y);
+        int add_8 = y + int(out_origin.y);
+        int func_int_9 = int(out_tile.y);
+        int func_clamp_11 = clamp((((add_8 / func_int_9) * func_int_10) + clamp((add_8 % func_int_9), 0, (func_int_10 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_12 = int(state_layer.y);
+        outColor = float(int((texelFetch(state, ivec3(mod_7, (func_clamp_11 % func_int_12), (((func_clamp_11 / func_int_12) * (((func_int_4 + func_int_6) - 1) / func_int_6)) + (func_clamp_5 / func_int_6))), 0).x > 0.5))) / 255.0;
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let bitToIntSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     uniform sampler2D state;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        bool v_state = (texture(state, gl_FragCoord.xy / state_size)).x > 0.5;
-        bool func_bool_0 = bool(v_state);
-        int func_int_1 = int(func_bool_0);
-        outColor = float(func_int_1) / 255.0;
+        
+        outColor = float(int((texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5))) / 255.0;
     }`,
-    ['tex', 'state', 'state_size']);
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(bitToInt, bitToIntLayered);
+registerSingleShot(bitToInt, bitToIntSingleShot);
 
 export {bitToInt}
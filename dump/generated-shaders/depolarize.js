@@ -0,0 +1,170 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerFootprint, registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let depolarize = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform float probability;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.x);
+        int divide_1 = x / func_int_0;
+        int func_int_2 = int(state_tile.x);
+        int mul_3 = divide_1 * func_int_2;
+        int mod_4 = x % func_int_0;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(out_tile.y);
+        int divide_7 = y / func_int_6;
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = divide_7 * func_int_8;
+        int mod_10 = y % func_int_6;
+        bool slice_11 = texelFetch(state, ivec2(add_5, (mul_9 + clamp(mod_10, 0, (func_int_8 - 1)))), 0).x > 0.5;
+        bool eq_12 = mod_4 == 1;
+        bool eq_13 = (mod_10 & 1) == 1;
+        uint mul_14 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+        uint mul_15 = (mul_14 ^ (mul_14 >> 15)) * 2221713035u;
+        uint bitwise_xor_16 = (mul_15 ^ (mul_15 >> 16)) ^ rand_counter;
+        uint mul_17 = (bitwise_xor_16 ^ (bitwise_xor_16 >> 16)) * 2146121005u;
+        uint mul_18 = (mul_17 ^ (mul_17 >> 15)) * 2221713035u;
+        uint bitwise_xor_19 = (mul_18 ^ (mul_18 >> 16)) ^ uint(divide_1);
+        uint mul_20 = (bitwise_xor_19 ^ (bitwise_xor_19 >> 16)) * 2146121005u;
+        uint mul_21 = (mul_20 ^ (mul_20 >> 15)) * 2221713035u;
+        uint bitwise_xor_22 = (mul_21 ^ (mul_21 >> 16)) ^ uint(divide_7);
+        uint mul_23 = (bitwise_xor_22 ^ (bitwise_xor_22 >> 16)) * 2146121005u;
+        uint mul_24 = (mul_23 ^ (mul_23 >> 15)) * 2221713035u;
+        uint bitwise_xor_25 = (mul_24 ^ (mul_24 >> 16)) ^ uint((mod_10 >> 1));
+        uint mul_26 = (bitwise_xor_25 ^ (bitwise_xor_25 >> 16)) * 2146121005u;
+        uint mul_27 = (mul_26 ^ (mul_26 >> 15)) * 2221713035u;
+        float func_float_28 = float(((mul_27 ^ (mul_27 >> 16)) >> 8));
+        bool lt_29 = func_float_28 < (probability * 11184810.666666666);
+        bool bit_and_30 = eq_13 && lt_29;
+        bool not_31 = !eq_13;
+        bool bit_and_32 = (func_float_28 >= (probability * 5592405.333333333)) && (func_float_28 < (probability * 16777216.0));
+        outColor = float((slice_11 != ((eq_12 && (bit_and_30 || (not_31 && bit_and_32))) || (((mod_4 == 0) && not_31) && (lt_29 != bit_and_32)))));
+    }`,
+    ['1f', 'probability', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let depolarizeLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform float probability;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int divide_2 = add_0 / func_int_1;
+        int func_int_3 = int(state_tile.x);
+        int mul_4 = divide_2 * func_int_3;
+        int mod_5 = add_0 % func_int_1;
+        int add_6 = mul_4 + clamp(mod_5, 0, (func_int_3 - 1));
+        int func_int_7 = int(state_size.x);
+        int func_clamp_8 = clamp(add_6, 0, (func_int_7 - 1));
+        int func_int_9 = int(state_layer.x);
+        int mod_10 = func_clamp_8 % func_int_9;
+        int add_11 = y + int(out_origin.y);
+        int func_int_12 = int(out_tile.y);
+        int divide_13 = add_11 / func_int_12;
+        int func_int_14 = int(state_tile.y);
+        int mul_15 = divide_13 * func_int_14;
+        int mod_16 = add_11 % func_int_12;
+        int func_clamp_17 = clamp((mul_15 + clamp(mod_16, 0, (func_int_14 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_18 = int(state_layer.y);
+        bool fetch_19 = texelFetch(state, ivec3(mod_10, (func_clamp_17 % func_int_18), (((func_clamp_17 / func_int_18) * (((func_int_7 + func_int_9) - 1) / func_int_9)) + (func_clamp_8 / func_int_9))), 0).x > 0.5;
+        bool eq_20 = mod_5 == 1;
+        bool eq_21 = (mod_16 & 1) == 1;
+        uint mul_22 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+        uint mul_23 = (mul_22 ^ (mul_22 >> 15)) * 2221713035u;
+        uint bitwise_xor_24 = (mul_23 ^ (mul_23 >> 16)) ^ rand_counter;
+        uint mul_25 = (bitwise_xor_24 ^ (bitwise_xor_24 >> 16)) * 2146121005u;
+        uint mul_26 = (mul_25 ^ (mul_25 >> 15)) * 2221713035u;
+        uint bitwise_xor_27 = (mul_26 ^ (mul_26 >> 16)) ^ uint(divide_2);
+        uint mul_28 = (bitwise_xor_27 ^ (bitwise_xor_27 >> 16)) * 2146121005u;
+        uint mul_29 = (mul_28 ^ (mul_28 >> 15)) * 2221713035u;
+        uint bitwise_xor_30 = (mul_29 ^ (mul_29 >> 16)) ^ uint(divide_13);
+        uint mul_31 = (bitwise_xor_30 ^ (bitwise_xor_30 >> 16)) * 2146121005u;
+        uint mul_32 = (mul_31 ^ (mul_31 >> 15)) * 2221713035u;
+        uint bitwise_xor_33 = (mul_32 ^ (mul_32 >> 16)) ^ uint((mod_16 >> 1));
+        uint mul_34 = (bitwise_xor_33 ^ (bitwise_xor_33 >> 16)) * 2146121005u;
+        uint mul_35 = (mul_34 ^ (mul_34 >> 15)) * 2221713035u;
+        float func_float_36 = float(((mul_35 ^ (mul_35 >> 16)) >> 8));
+        bool lt_37 = func_float_36 < (probability * 11184810.666666666);
+        bool bit_and_38 = eq_21 && lt_37;
+        bool not_39 = !eq_21;
+        bool bit_and_40 = (func_float_36 >= (probability * 5592405.333333333)) && (func_float_36 < (probability * 16777216.0));
+        outColor = float((fetch_19 != ((eq_20 && (bit_and_38 || (not_39 && bit_and_40))) || (((mod_5 == 0) && not_39) && (lt_37 != bit_and_40)))));
+    }`,
+    ['1f', 'probability', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let depolarizeSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform float probability;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_0 = x == 1;
+        bool eq_1 = (y & 1) == 1;
+        uint mul_2 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+        uint mul_3 = (mul_2 ^ (mul_2 >> 15)) * 2221713035u;
+        uint bitwise_xor_4 = (mul_3 ^ (mul_3 >> 16)) ^ rand_counter;
+        uint mul_5 = (bitwise_xor_4 ^ (bitwise_xor_4 >> 16)) * 2146121005u;
+        uint mul_6 = (mul_5 ^ (mul_5 >> 15)) * 2221713035u;
+        uint bitwise_xor_7 = mul_6 ^ (mul_6 >> 16);
+        uint mul_8 = (bitwise_xor_7 ^ (bitwise_xor_7 >> 16)) * 2146121005u;
+        uint mul_9 = (mul_8 ^ (mul_8 >> 15)) * 2221713035u;
+        uint bitwise_xor_10 = mul_9 ^ (mul_9 >> 16);
+        uint mul_11 = (bitwise_xor_10 ^ (bitwise_xor_10 >> 16)) * 2146121005u;
+        uint mul_12 = (mul_11 ^ (mul_11 >> 15)) * 2221713035u;
+        uint bitwise_xor_13 = (mul_12 ^ (mul_12 >> 16)) ^ uint((y >> 1));
+        uint mul_14 = (bitwise_xor_13 ^ (bitwise_xor_13 >> 16)) * 2146121005u;
+        uint mul_15 = (mul_14 ^ (mul_14 >> 15)) * 2221713035u;
+        float func_float_16 = float(((mul_15 ^ (mul_15 >> 16)) >> 8));
+        bool lt_17 = func_float_16 < (probability * 11184810.666666666);
+        bool bit_and_18 = eq_1 && lt_17;
+        bool not_19 = !eq_1;
+        bool bit_and_20 = (func_float_16 >= (probability * 5592405.333333333)) && (func_float_16 < (probability * 16777216.0));
+        outColor = float((v_state != ((eq_0 && (bit_and_18 || (not_19 && bit_and_20))) || (((x == 0) && not_19) && (lt_17 != bit_and_20)))));
+    }`,
+    ['1f', 'probability', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(depolarize, depolarizeLayered);
+registerFootprint(depolarize, 'state', ({}) => [
+    [1, 2, 0, Infinity],
+    [0, 1, 0, Infinity],
+]);
+registerSingleShot(depolarize, depolarizeSingleShot);
+
+export {depolarize}
@@ -1,43 +1,153 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let eliminateCol = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
     uniform int target;
-    uniform vec2 found_ones_size;
+    uniform vec2 found_ones_tile;
     uniform sampler2D found_ones;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_3 = int(out_tile.x);
+        int mod_12 = x % func_int_3;
+        int divide_4 = x / func_int_3;
+        int mul_5 = divide_4 * int(found_ones_tile.x);
+        int func_int_0 = int(out_tile.y);
+        int divide_6 = y / func_int_0;
+        int func_int_7 = int(found_ones_tile.y);
+        int mul_8 = divide_6 * func_int_7;
+        int mul_2 = target * 2;
+        int add_9 = mul_2 + 1;
+        int add_10 = int(texelFetch(found_ones, ivec2(mul_5, (mul_8 + clamp(add_9, 0, (func_int_7 - 1)))), 0).x*255.0 + 0.5) + 1;
+        bool ge_11 = add_10 >= 2;
+        int mod_1 = y % func_int_0;
+        bool match_22;
+        if (((mod_1 == mul_2) && ge_11)) {
+            match_22 = (mod_12 == add_10);
+        } else {
+            int func_int_13 = int(state_tile.x);
+            int mul_14 = divide_4 * func_int_13;
+            int sub_15 = func_int_13 - 1;
+            int add_16 = mul_14 + clamp(mod_12, 0, sub_15);
+            int func_int_17 = int(state_tile.y);
+            int mul_18 = divide_6 * func_int_17;
+            int sub_19 = func_int_17 - 1;
+            bool slice_20 = texelFetch(state, ivec2(add_16, (mul_18 + clamp(add_9, 0, sub_19))), 0).x > 0.5;
+            int add_21 = mul_18 + clamp(mod_1, 0, sub_19);
+            match_22 = ((((slice_20 && (texelFetch(state, ivec2((mul_14 + clamp(add_10, 0, sub_15)), add_21), 0).x > 0.5)) && ge_11) && (mod_12 > 0)) != (texelFetch(state, ivec2(add_16, add_21), 0).x > 0.5));
+        }
+        outColor = float(match_22);
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let eliminateColLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int target;
+    uniform vec2 found_ones_tile;
+    uniform vec2 found_ones_size;
+    uniform vec2 found_ones_layer;
+    uniform highp sampler2DArray found_ones;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_4 = x + int(out_origin.x);
+        int func_int_5 = int(out_tile.x);
+        int mod_20 = add_4 % func_int_5;
+        int divide_6 = add_4 / func_int_5;
+        int mul_7 = divide_6 * int(found_ones_tile.x);
+        int func_int_8 = int(found_ones_size.x);
+        int func_clamp_9 = clamp(mul_7, 0, (func_int_8 - 1));
+        int func_int_10 = int(found_ones_layer.x);
+        int mod_11 = func_clamp_9 % func_int_10;
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int divide_12 = add_0 / func_int_1;
+        int func_int_13 = int(found_ones_tile.y);
+        int mul_14 = divide_12 * func_int_13;
+        int mul_3 = target * 2;
+        int add_15 = mul_3 + 1;
+        int func_clamp_16 = clamp((mul_14 + clamp(add_15, 0, (func_int_13 - 1))), 0, (int(found_ones_size.y) - 1));
+        int func_int_17 = int(found_ones_layer.y);
+        int add_18 = int(texelFetch(found_ones, ivec3(mod_11, (func_clamp_16 % func_int_17), (((func_clamp_16 / func_int_17) * (((func_int_8 + func_int_10) - 1) / func_int_10)) + (func_clamp_9 / func_int_10))), 0).x*255.0 + 0.5) + 1;
+        bool ge_19 = add_18 >= 2;
+        int mod_2 = add_0 % func_int_1;
+        bool match_44;
+        if (((mod_2 == mul_3) && ge_19)) {
+            match_44 = (mod_20 == add_18);
+        } else {
+            int func_int_24 = int(state_size.x);
+            int sub_25 = func_int_24 - 1;
+            int func_int_21 = int(state_tile.x);
+            int mul_22 = divide_6 * func_int_21;
+            int sub_23 = func_int_21 - 1;
+            int func_clamp_26 = clamp((mul_22 + clamp(mod_20, 0, sub_23)), 0, sub_25);
+            int func_int_27 = int(state_layer.x);
+            int mod_28 = func_clamp_26 % func_int_27;
+            int sub_32 = int(state_size.y) - 1;
+            int func_int_29 = int(state_tile.y);
+            int mul_30 = divide_12 * func_int_29;
+            int sub_31 = func_int_29 - 1;
+            int func_clamp_33 = clamp((mul_30 + clamp(add_15, 0, sub_31)), 0, sub_32);
+            int func_int_34 = int(state_layer.y);
+            int mod_35 = func_clamp_33 % func_int_34;
+            int divide_37 = func_clamp_26 / func_int_27;
+            int divide_36 = ((func_int_24 + func_int_27) - 1) / func_int_27;
+            bool fetch_38 = texelFetch(state, ivec3(mod_28, mod_35, (((func_clamp_33 / func_int_34) * divide_36) + divide_37)), 0).x > 0.5;
+            int func_clamp_41 = clamp((mul_30 + clamp(mod_2, 0, sub_31)), 0, sub_32);
+            int mod_42 = func_clamp_41 % func_int_34;
+            int func_clamp_39 = clamp((mul_22 + clamp(add_18, 0, sub_23)), 0, sub_25);
+            int mod_40 = func_clamp_39 % func_int_27;
+            int mul_43 = (func_clamp_41 / func_int_34) * divide_36;
+            match_44 = ((((fetch_38 && (texelFetch(state, ivec3(mod_40, mod_42, (mul_43 + (func_clamp_39 / func_int_27))), 0).x > 0.5)) && ge_19) && (mod_20 > 0)) != (texelFetch(state, ivec3(mod_28, mod_42, (mul_43 + divide_37)), 0).x > 0.5));
+        }
+        outColor = float(match_44);
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'found_ones', 'found_ones_size', 'found_ones_tile', 'found_ones_layer'],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let eliminateColSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int target;
+    uniform sampler2D found_ones;
     uniform sampler2D state;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        int mul_11 = target * 2;
-        bool eq_12 = y == mul_11;
         int mul_0 = target * 2;
         int add_1 = mul_0 + 1;
-        int slice_2 = int((texture(found_ones, vec2(0.5, float(add_1) + 0.5) / found_ones_size)).x*255.0 + 0.5);
-        int add_3 = slice_2 + 1;
-        bool ge_4 = add_3 >= 2;
-        bool bit_and_13 = eq_12 && ge_4;
-        bool eq_14 = x == add_3;
-        bool slice_5 = (texture(state, vec2(gl_FragCoord.x, float(add_1) + 0.5) / state_size)).x > 0.5;
-        bool slice_6 = (texture(state, vec2(float(add_3) + 0.5, gl_FragCoord.y) / state_size)).x > 0.5;
-        bool bit_and_7 = slice_5 && slice_6;
-        bool bit_and_8 = bit_and_7 && ge_4;
-        bool gt_9 = x > 0;
-        bool bit_and_10 = bit_and_8 && gt_9;
-        bool v_state = (texture(state, gl_FragCoord.xy / state_size)).x > 0.5;
-        bool bit_xor_15 = bit_and_10 != v_state;
-        bool match_16 = 
-            bit_and_13 ? eq_14 :
-            bit_xor_15;
-        outColor = float(match_16);
+        int add_2 = int(texelFetch(found_ones, clamp(ivec2(0, add_1), ivec2(0), textureSize(found_ones, 0) - 1), 0).x*255.0 + 0.5) + 1;
+        bool ge_3 = add_2 >= 2;
+        bool match_4 = 
+            ((y == mul_0) && ge_3) ? (x == add_2) :
+            (((((texelFetch(state, clamp(ivec2(x, add_1), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (texelFetch(state, clamp(ivec2(add_2, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) && ge_3) && (x > 0)) != (texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5));
+        outColor = float(match_4);
     }`,
     ['1i', 'target', false],
-    ['tex', 'found_ones', 'found_ones_size'],
-    ['tex', 'state', 'state_size']);
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(eliminateCol, eliminateColLayered);
+registerSingleShot(eliminateCol, eliminateColSingleShot);
 
 export {eliminateCol}
@@ -0,0 +1,251 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let eliminateCols = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 claims_tile;
+    uniform vec2 found_ones_tile;
+    uniform sampler2D found_ones;
+    uniform sampler2D claims;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_3 = int(out_tile.x);
+        int divide_4 = x / func_int_3;
+        int func_int_13 = int(state_tile.x);
+        int mul_15 = divide_4 * func_int_13;
+        int mod_14 = x % func_int_3;
+        int sub_16 = func_int_13 - 1;
+        int add_17 = mul_15 + clamp(mod_14, 0, sub_16);
+        int func_int_0 = int(out_tile.y);
+        int divide_8 = y / func_int_0;
+        int func_int_18 = int(state_tile.y);
+        int mul_19 = divide_8 * func_int_18;
+        int mod_1 = y % func_int_0;
+        int sub_20 = func_int_18 - 1;
+        int add_21 = mul_19 + clamp(mod_1, 0, sub_20);
+        bool slice_22 = texelFetch(state, ivec2(add_17, add_21), 0).x > 0.5;
+        bool eq_2 = (mod_1 & 1) == 0;
+        int mul_12 = divide_8 * int(claims_tile.y);
+        int func_int_5 = int(claims_tile.x);
+        int mul_6 = divide_4 * func_int_5;
+        int mul_7 = divide_4 * int(found_ones_tile.x);
+        int func_int_9 = int(found_ones_tile.y);
+        int add_10 = int(texelFetch(found_ones, ivec2(mul_7, ((divide_8 * func_int_9) + clamp((mod_1 | 1), 0, (func_int_9 - 1)))), 0).x*255.0 + 0.5) + 1;
+        int sub_11 = func_int_5 - 1;
+        bool match_43;
+        if ((eq_2 && ((int(texelFetch(claims, ivec2((mul_6 + clamp(add_10, 0, sub_11)), mul_12), 0).x*255.0 + 0.5) == add_10) && (int(texelFetch(claims, ivec2((mul_6 + clamp((func_int_13 + add_10), 0, sub_11)), mul_12), 0).x*255.0 + 0.5) == (mod_1 >> 1))))) {
+            match_43 = (mod_14 == add_10);
+        } else if ((mod_14 == 0)) {
+            match_43 = slice_22;
+        } else {
+            bool reduce_42 = false;
+            for (int i_23 = 0; i_23 < func_int_13; i_23++) {
+                int func_clamp_24 = clamp(i_23, 0, sub_11);
+                int add_25 = mul_6 + func_clamp_24;
+                int slice_26 = int(texelFetch(claims, ivec2(add_25, mul_12), 0).x*255.0 + 0.5);
+                bool eq_27 = slice_26 == i_23;
+                int func_clamp_28 = clamp(i_23, 0, sub_16);
+                int add_29 = mul_15 + func_clamp_28;
+                bool slice_30 = texelFetch(state, ivec2(add_29, add_21), 0).x > 0.5;
+                bool bit_and_31 = eq_27 && slice_30;
+                int add_32 = func_int_13 + i_23;
+                int func_clamp_33 = clamp(add_32, 0, sub_11);
+                int add_34 = mul_6 + func_clamp_33;
+                int slice_35 = int(texelFetch(claims, ivec2(add_34, mul_12), 0).x*255.0 + 0.5);
+                int mul_36 = slice_35 * 2;
+                int add_37 = mul_36 + 1;
+                int func_clamp_38 = clamp(add_37, 0, sub_20);
+                int add_39 = mul_19 + func_clamp_38;
+                bool slice_40 = texelFetch(state, ivec2(add_17, add_39), 0).x > 0.5;
+                bool bit_and_41 = bit_and_31 && slice_40;
+                reduce_42 = reduce_42 != bit_and_41;
+            }
+            match_43 = (slice_22 != reduce_42);
+        }
+        outColor = float(match_43);
+    }`,
+    ['tex', 'claims', undefined, 'claims_tile'],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let eliminateColsLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 claims_tile;
+    uniform vec2 found_ones_tile;
+    uniform vec2 found_ones_size;
+    uniform vec2 found_ones_layer;
+    uniform highp sampler2DArray found_ones;
+    uniform vec2 claims_size;
+    uniform vec2 claims_layer;
+    uniform highp sampler2DArray claims;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_35 = int(state_size.x);
+        int sub_36 = func_int_35 - 1;
+        int add_4 = x + int(out_origin.x);
+        int func_int_5 = int(out_tile.x);
+        int divide_6 = add_4 / func_int_5;
+        int func_int_30 = int(state_tile.x);
+        int mul_33 = divide_6 * func_int_30;
+        int mod_32 = add_4 % func_int_5;
+        int sub_34 = func_int_30 - 1;
+        int func_clamp_37 = clamp((mul_33 + clamp(mod_32, 0, sub_34)), 0, sub_36);
+        int func_int_38 = int(state_layer.x);
+        int mod_39 = func_clamp_37 % func_int_38;
+        int sub_43 = int(state_size.y) - 1;
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int divide_14 = add_0 / func_int_1;
+        int func_int_40 = int(state_tile.y);
+        int mul_41 = divide_14 * func_int_40;
+        int mod_2 = add_0 % func_int_1;
+        int sub_42 = func_int_40 - 1;
+        int func_clamp_44 = clamp((mul_41 + clamp(mod_2, 0, sub_42)), 0, sub_43);
+        int func_int_45 = int(state_layer.y);
+        int mod_46 = func_clamp_44 % func_int_45;
+        int divide_47 = ((func_int_35 + func_int_38) - 1) / func_int_38;
+        int mul_48 = (func_clamp_44 / func_int_45) * divide_47;
+        int divide_49 = func_clamp_37 / func_int_38;
+        bool fetch_50 = texelFetch(state, ivec3(mod_39, mod_46, (mul_48 + divide_49)), 0).x > 0.5;
+        bool eq_3 = (mod_2 & 1) == 0;
+        int func_clamp_25 = clamp((divide_14 * int(claims_tile.y)), 0, (int(claims_size.y) - 1));
+        int func_int_26 = int(claims_layer.y);
+        int mod_27 = func_clamp_25 % func_int_26;
+        int func_int_20 = int(claims_size.x);
+        int sub_21 = func_int_20 - 1;
+        int func_int_7 = int(claims_tile.x);
+        int mul_8 = divide_6 * func_int_7;
+        int mul_9 = divide_6 * int(found_ones_tile.x);
+        int func_int_10 = int(found_ones_size.x);
+        int func_clamp_11 = clamp(mul_9, 0, (func_int_10 - 1));
+        int func_int_12 = int(found_ones_layer.x);
+        int mod_13 = func_clamp_11 % func_int_12;
+        int func_int_15 = int(found_ones_tile.y);
+        int func_clamp_16 = clamp(((divide_14 * func_int_15) + clamp((mod_2 | 1), 0, (func_int_15 - 1))), 0, (int(found_ones_size.y) - 1));
+        int func_int_17 = int(found_ones_layer.y);
+        int add_18 = int(texelFetch(found_ones, ivec3(mod_13, (func_clamp_16 % func_int_17), (((func_clamp_16 / func_int_17) * (((func_int_10 + func_int_12) - 1) / func_int_12)) + (func_clamp_11 / func_int_12))), 0).x*255.0 + 0.5) + 1;
+        int sub_19 = func_int_7 - 1;
+        int func_clamp_22 = clamp((mul_8 + clamp(add_18, 0, sub_19)), 0, sub_21);
+        int func_int_23 = int(claims_layer.x);
+        int mod_24 = func_clamp_22 % func_int_23;
+        int mul_28 = (func_clamp_25 / func_int_26) * (((func_int_20 + func_int_23) - 1) / func_int_23);
+        bool eq_29 = int(texelFetch(claims, ivec3(mod_24, mod_27, (mul_28 + (func_clamp_22 / func_int_23))), 0).x*255.0 + 0.5) == add_18;
+        int func_clamp_31 = clamp((mul_8 + clamp((func_int_30 + add_18), 0, sub_19)), 0, sub_21);
+        bool match_88;
+        if ((eq_3 && (eq_29 && (int(texelFetch(claims, ivec3((func_clamp_31 % func_int_23), mod_27, (mul_28 + (func_clamp_31 / func_int_23))), 0).x*255.0 + 0.5) == (mod_2 >> 1))))) {
+            match_88 = (mod_32 == add_18);
+        } else if ((mod_32 == 0)) {
+            match_88 = fetch_50;
+        } else {
+            bool reduce_87 = false;
+            for (int i_51 = 0; i_51 < func_int_30; i_51++) {
+                int func_clamp_52 = clamp(i_51, 0, sub_19);
+                int add_53 = mul_8 + func_clamp_52;
+                int func_clamp_54 = clamp(add_53, 0, sub_21);
+                int mod_55 = func_clamp_54 % func_int_23;
+                int divide_56 = func_clamp_54 / func_int_23;
+                int add_57 = mul_28 + divide_56;
+                int fetch_58 = int(texelFetch(claims, ivec3(mod_55, mod_27, add_57), 0).x*255.0 + 0.5);
+                bool eq_59 = fetch_58 == i_51;
+                int func_clamp_60 = clamp(i_51, 0, sub_34);
+                int add_61 = mul_33 + func_clamp_60;
+                int func_clamp_62 = clamp(add_61, 0, sub_36);
+                int mod_63 = func_clamp_62 % func_int_38;
+                int divide_64 = func_clamp_62 / func_int_38;
+                int add_65 = mul_48 + divide_64;
+                bool fetch_66 = texelFetch(state, ivec3(mod_63, mod_46, add_65), 0).x > 0.5;
+                bool bit_and_67 = eq_59 && fetch_66;
+                int add_68 = func_int_30 + i_51;
+                int func_clamp_69 = clamp(add_68, 0, sub_19);
+                int add_70 = mul_8 + func_clamp_69;
+                int func_clamp_71 = clamp(add_70, 0, sub_21);
+                int mod_72 = func_clamp_71 % func_int_23;
+                int divide_73 = func_clamp_71 / func_int_23;
+                int add_74 = mul_28 + divide_73;
+                int fetch_75 = int(texelFetch(claims, ivec3(mod_72, mod_27, add_74), 0).x*255.0 + 0.5);
+                int mul_76 = fetch_75 * 2;
+                int add_77 = mul_76 + 1;
+                int func_clamp_78 = clamp(add_77, 0, sub_42);
+                int add_79 = mul_41 + func_clamp_78;
+                int func_clamp_80 = clamp(add_79, 0, sub_43);
+                int mod_81 = func_clamp_80 % func_int_45;
+                int divide_82 = func_clamp_80 / func_int_45;
+                int mul_83 = divide_82 * divide_47;
+                int add_84 = mul_83 + divide_49;
+                bool fetch_85 = texelFetch(state, ivec3(mod_39, mod_81, add_84), 0).x > 0.5;
+                bool bit_and_86 = bit_and_67 && fetch_85;
+                reduce_87 = reduce_87 != bit_and_86;
+            }
+            match_88 = (fetch_50 != reduce_87);
+        }
+        outColor = float(match_88);
+    }`,
+    ['tex', 'claims', 'claims_size', 'claims_tile', 'claims_layer'],
+    ['tex', 'found_ones', 'found_ones_size', 'found_ones_tile', 'found_ones_layer'],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let eliminateColsSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D found_ones;
+    uniform sampler2D claims;
+    uniform vec2 state_size;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_0 = (y & 1) == 0;
+        int add_1 = int(texelFetch(found_ones, clamp(ivec2(0, (y | 1)), ivec2(0), textureSize(found_ones, 0) - 1), 0).x*255.0 + 0.5) + 1;
+        bool eq_2 = int(texelFetch(claims, clamp(ivec2(add_1, 0), ivec2(0), textureSize(claims, 0) - 1), 0).x*255.0 + 0.5) == add_1;
+        int func_int_3 = int(state_size.x);
+        bool match_16;
+        if ((eq_0 && (eq_2 && (int(texelFetch(claims, clamp(ivec2((func_int_3 + add_1), 0), ivec2(0), textureSize(claims, 0) - 1), 0).x*255.0 + 0.5) == (y >> 1))))) {
+            match_16 = (x == add_1);
+        } else if ((x == 0)) {
+            match_16 = v_state;
+        } else {
+            bool reduce_15 = false;
+            for (int i_4 = 0; i_4 < func_int_3; i_4++) {
+                int slice_5 = int(texelFetch(claims, clamp(ivec2(i_4, 0), ivec2(0), textureSize(claims, 0) - 1), 0).x*255.0 + 0.5);
+                bool eq_6 = slice_5 == i_4;
+                bool slice_7 = texelFetch(state, clamp(ivec2(i_4, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+                bool bit_and_8 = eq_6 && slice_7;
+                int add_9 = func_int_3 + i_4;
+                int slice_10 = int(texelFetch(claims, clamp(ivec2(add_9, 0), ivec2(0), textureSize(claims, 0) - 1), 0).x*255.0 + 0.5);
+                int mul_11 = slice_10 * 2;
+                int add_12 = mul_11 + 1;
+                bool slice_13 = texelFetch(state, clamp(ivec2(x, add_12), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+                bool bit_and_14 = bit_and_8 && slice_13;
+                reduce_15 = reduce_15 != bit_and_14;
+            }
+            match_16 = (v_state != reduce_15);
+        }
+        outColor = float(match_16);
+    }`,
+    ['tex', 'claims', undefined, 'claims_tile'],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+registerLayered(eliminateCols, eliminateColsLayered);
+registerSingleShot(eliminateCols, eliminateColsSingleShot);
+
+export {eliminateCols}
@@ -1,29 +1,99 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let findOneFold = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.y);
+        int func_int_6 = int(out_tile.y);
+        int add_8 = ((y / func_int_6) * func_int_7) + clamp((y % func_int_6), 0, (func_int_7 - 1));
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int mul_4 = mod_3 * 2;
+        int sub_5 = func_int_1 - 1;
+        int slice_9 = int(texelFetch(state, ivec2((mul_2 + clamp(mul_4, 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_10 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 1), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int match_11 = 
+            (slice_9 != 0) ? (slice_9 + mod_3) :
+            (slice_10 != 0) ? ((slice_10 + mod_3) + 1) :
+            0;
+        outColor = float(match_11) / 255.0;
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let findOneFoldLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_14 = int(state_tile.y);
+        int add_12 = y + int(out_origin.y);
+        int func_int_13 = int(out_tile.y);
+        int func_clamp_15 = clamp((((add_12 / func_int_13) * func_int_14) + clamp((add_12 % func_int_13), 0, (func_int_14 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_16 = int(state_layer.y);
+        int mod_17 = func_clamp_15 % func_int_16;
+        int func_int_7 = int(state_size.x);
+        int sub_8 = func_int_7 - 1;
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int mul_5 = mod_4 * 2;
+        int sub_6 = func_int_2 - 1;
+        int func_clamp_9 = clamp((mul_3 + clamp(mul_5, 0, sub_6)), 0, sub_8);
+        int func_int_10 = int(state_layer.x);
+        int mod_11 = func_clamp_9 % func_int_10;
+        int mul_18 = (func_clamp_15 / func_int_16) * (((func_int_7 + func_int_10) - 1) / func_int_10);
+        int fetch_19 = int(texelFetch(state, ivec3(mod_11, mod_17, (mul_18 + (func_clamp_9 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_20 = clamp((mul_3 + clamp((mul_5 + 1), 0, sub_6)), 0, sub_8);
+        int fetch_21 = int(texelFetch(state, ivec3((func_clamp_20 % func_int_10), mod_17, (mul_18 + (func_clamp_20 / func_int_10))), 0).x*255.0 + 0.5);
+        int match_22 = 
+            (fetch_19 != 0) ? (fetch_19 + mod_4) :
+            (fetch_21 != 0) ? ((fetch_21 + mod_4) + 1) :
+            0;
+        outColor = float(match_22) / 255.0;
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let findOneFoldSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     uniform sampler2D state;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        int slice_0 = int((texture((state), vec2(float((x)*(2)) + 0.5, gl_FragCoord.y) / state_size)).x*255.0 + 0.5);
-        bool ne_2 = slice_0 != 0;
-        int add_3 = slice_0 + x;
-        int slice_1 = int((texture((state), vec2(float((x)*(2) + 1) + 0.5, gl_FragCoord.y) / state_size)).x*255.0 + 0.5);
-        bool ne_4 = slice_1 != 0;
-        int add_5 = slice_1 + x;
-        int add_6 = add_5 + 1;
-        int match_7 = 
-            ne_2 ? add_3 :
-            ne_4 ? add_6 :
+        int slice_0 = int(texelFetch(state, clamp(ivec2(x*2, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_1 = int(texelFetch(state, clamp(ivec2(x*2 + 1, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int match_2 = 
+            (slice_0 != 0) ? (slice_0 + x) :
+            (slice_1 != 0) ? ((slice_1 + x) + 1) :
             0;
-        outColor = float(match_7) / 255.0;
+        outColor = float(match_2) / 255.0;
     }`,
-    ['tex', 'state', 'state_size']);
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(findOneFold, findOneFoldLayered);
+registerSingleShot(findOneFold, findOneFoldSingleShot);
 
 export {findOneFold}
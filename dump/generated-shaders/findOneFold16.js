@@ -0,0 +1,200 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let findOneFold16 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.y);
+        int func_int_6 = int(out_tile.y);
+        int add_8 = ((y / func_int_6) * func_int_7) + clamp((y % func_int_6), 0, (func_int_7 - 1));
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int mul_4 = mod_3 * 16;
+        int sub_5 = func_int_1 - 1;
+        int slice_9 = int(texelFetch(state, ivec2((mul_2 + clamp(mul_4, 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int mul_10 = mod_3 * 15;
+        int slice_11 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 1), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_12 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 2), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_13 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 3), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_14 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 4), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_15 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 5), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_16 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 6), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_17 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 7), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_18 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 8), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_19 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 9), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_20 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 10), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_21 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 11), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_22 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 12), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_23 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 13), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_24 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 14), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_25 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 15), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int match_26 = 
+            (slice_9 != 0) ? (slice_9 + mul_10) :
+            (slice_11 != 0) ? ((slice_11 + mul_10) + 1) :
+            (slice_12 != 0) ? ((slice_12 + mul_10) + 2) :
+            (slice_13 != 0) ? ((slice_13 + mul_10) + 3) :
+            (slice_14 != 0) ? ((slice_14 + mul_10) + 4) :
+            (slice_15 != 0) ? ((slice_15 + mul_10) + 5) :
+            (slice_16 != 0) ? ((slice_16 + mul_10) + 6) :
+            (slice_17 != 0) ? ((slice_17 + mul_10) + 7) :
+            (slice_18 != 0) ? ((slice_18 + mul_10) + 8) :
+            (slice_19 != 0) ? ((slice_19 + mul_10) + 9) :
+            (slice_20 != 0) ? ((slice_20 + mul_10) + 10) :
+            (slice_21 != 0) ? ((slice_21 + mul_10) + 11) :
+            (slice_22 != 0) ? ((slice_22 + mul_10) + 12) :
+            (slice_23 != 0) ? ((slice_23 + mul_10) + 13) :
+            (slice_24 != 0) ? ((slice_24 + mul_10) + 14) :
+            (slice_25 != 0) ? ((slice_25 + mul_10) + 15) :
+            0;
+        outColor = float(match_26) / 255.0;
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let findOneFold16Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_14 = int(state_tile.y);
+        int add_12 = y + int(out_origin.y);
+        int func_int_13 = int(out_tile.y);
+        int func_clamp_15 = clamp((((add_12 / func_int_13) * func_int_14) + clamp((add_12 % func_int_13), 0, (func_int_14 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_16 = int(state_layer.y);
+        int mod_17 = func_clamp_15 % func_int_16;
+        int func_int_7 = int(state_size.x);
+        int sub_8 = func_int_7 - 1;
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int mul_5 = mod_4 * 16;
+        int sub_6 = func_int_2 - 1;
+        int func_clamp_9 = clamp((mul_3 + clamp(mul_5, 0, sub_6)), 0, sub_8);
+        int func_int_10 = int(state_layer.x);
+        int mod_11 = func_clamp_9 % func_int_10;
+        int mul_18 = (func_clamp_15 / func_int_16) * (((func_int_7 + func_int_10) - 1) / func_int_10);
+        int fetch_19 = int(texelFetch(state, ivec3(mod_11, mod_17, (mul_18 + (func_clamp_9 / func_int_10))), 0).x*255.0 + 0.5);
+        int mul_20 = mod_4 * 15;
+        int func_clamp_21 = clamp((mul_3 + clamp((mul_5 + 1), 0, sub_6)), 0, sub_8);
+        int fetch_22 = int(texelFetch(state, ivec3((func_clamp_21 % func_int_10), mod_17, (mul_18 + (func_clamp_21 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_23 = clamp((mul_3 + clamp((mul_5 + 2), 0, sub_6)), 0, sub_8);
+        int fetch_24 = int(texelFetch(state, ivec3((func_clamp_23 % func_int_10), mod_17, (mul_18 + (func_clamp_23 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_25 = clamp((mul_3 + clamp((mul_5 + 3), 0, sub_6)), 0, sub_8);
+        int fetch_26 = int(texelFetch(state, ivec3((func_clamp_25 % func_int_10), mod_17, (mul_18 + (func_clamp_25 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_27 = clamp((mul_3 + clamp((mul_5 + 4), 0, sub_6)), 0, sub_8);
+        int fetch_28 = int(texelFetch(state, ivec3((func_clamp_27 % func_int_10), mod_17, (mul_18 + (func_clamp_27 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_29 = clamp((mul_3 + clamp((mul_5 + 5), 0, sub_6)), 0, sub_8);
+        int fetch_30 = int(texelFetch(state, ivec3((func_clamp_29 % func_int_10), mod_17, (mul_18 + (func_clamp_29 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_31 = clamp((mul_3 + clamp((mul_5 + 6), 0, sub_6)), 0, sub_8);
+        int fetch_32 = int(texelFetch(state, ivec3((func_clamp_31 % func_int_10), mod_17, (mul_18 + (func_clamp_31 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_33 = clamp((mul_3 + clamp((mul_5 + 7), 0, sub_6)), 0, sub_8);
+        int fetch_34 = int(texelFetch(state, ivec3((func_clamp_33 % func_int_10), mod_17, (mul_18 + (func_clamp_33 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_35 = clamp((mul_3 + clamp((mul_5 + 8), 0, sub_6)), 0, sub_8);
+        int fetch_36 = int(texelFetch(state, ivec3((func_clamp_35 % func_int_10), mod_17, (mul_18 + (func_clamp_35 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_37 = clamp((mul_3 + clamp((mul_5 + 9), 0, sub_6)), 0, sub_8);
+        int fetch_38 = int(texelFetch(state, ivec3((func_clamp_37 % func_int_10), mod_17, (mul_18 + (func_clamp_37 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_39 = clamp((mul_3 + clamp((mul_5 + 10), 0, sub_6)), 0, sub_8);
+        int fetch_40 = int(texelFetch(state, ivec3((func_clamp_39 % func_int_10), mod_17, (mul_18 + (func_clamp_39 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_41 = clamp((mul_3 + clamp((mul_5 + 11), 0, sub_6)), 0, sub_8);
+        int fetch_42 = int(texelFetch(state, ivec3((func_clamp_41 % func_int_10), mod_17, (mul_18 + (func_clamp_41 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_43 = clamp((mul_3 + clamp((mul_5 + 12), 0, sub_6)), 0, sub_8);
+        int fetch_44 = int(texelFetch(state, ivec3((func_clamp_43 % func_int_10), mod_17, (mul_18 + (func_clamp_43 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_45 = clamp((mul_3 + clamp((mul_5 + 13), 0, sub_6)), 0, sub_8);
+        int fetch_46 = int(texelFetch(state, ivec3((func_clamp_45 % func_int_10), mod_17, (mul_18 + (func_clamp_45 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_47 = clamp((mul_3 + clamp((mul_5 + 14), 0, sub_6)), 0, sub_8);
+        int fetch_48 = int(texelFetch(state, ivec3((func_clamp_47 % func_int_10), mod_17, (mul_18 + (func_clamp_47 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_49 = clamp((mul_3 + clamp((mul_5 + 15), 0, sub_6)), 0, sub_8);
+        int fetch_50 = int(texelFetch(state, ivec3((func_clamp_49 % func_int_10), mod_17, (mul_18 + (func_clamp_49 / func_int_10))), 0).x*255.0 + 0.5);
+        int match_51 = 
+            (fetch_19 != 0) ? (fetch_19 + mul_20) :
+            (fetch_22 != 0) ? ((fetch_22 + mul_20) + 1) :
+            (fetch_24 != 0) ? ((fetch_24 + mul_20) + 2) :
+            (fetch_26 != 0) ? ((fetch_26 + mul_20) + 3) :
+            (fetch_28 != 0) ? ((fetch_28 + mul_20) + 4) :
+            (fetch_30 != 0) ? ((fetch_30 + mul_20) + 5) :
+            (fetch_32 != 0) ? ((fetch_32 + mul_20) + 6) :
+            (fetch_34 != 0) ? ((fetch_34 + mul_20) + 7) :
+            (fetch_36 != 0) ? ((fetch_36 + mul_20) + 8) :
+            (fetch_38 != 0) ? ((fetch_38 + mul_20) + 9) :
+            (fetch_40 != 0) ? ((fetch_40 + mul_20) + 10) :
+            (fetch_42 != 0) ? ((fetch_42 + mul_20) + 11) :
+            (fetch_44 != 0) ? ((fetch_44 + mul_20) + 12) :
+            (fetch_46 != 0) ? ((fetch_46 + mul_20) + 13) :
+            (fetch_48 != 0) ? ((fetch_48 + mul_20) + 14) :
+            (fetch_50 != 0) ? ((fetch_50 + mul_20) + 15) :
+            0;
+        outColor = float(match_51) / 255.0;
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let findOneFold16SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int slice_0 = int(texelFetch(state, clamp(ivec2(x*16, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int mul_1 = x * 15;
+        int slice_2 = int(texelFetch(state, clamp(ivec2(x*16 + 1, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_3 = int(texelFetch(state, clamp(ivec2(x*16 + 2, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_4 = int(texelFetch(state, clamp(ivec2(x*16 + 3, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_5 = int(texelFetch(state, clamp(ivec2(x*16 + 4, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_6 = int(texelFetch(state, clamp(ivec2(x*16 + 5, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_7 = int(texelFetch(state, clamp(ivec2(x*16 + 6, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_8 = int(texelFetch(state, clamp(ivec2(x*16 + 7, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_9 = int(texelFetch(state, clamp(ivec2(x*16 + 8, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_10 = int(texelFetch(state, clamp(ivec2(x*16 + 9, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_11 = int(texelFetch(state, clamp(ivec2(x*16 + 10, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_12 = int(texelFetch(state, clamp(ivec2(x*16 + 11, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_13 = int(texelFetch(state, clamp(ivec2(x*16 + 12, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_14 = int(texelFetch(state, clamp(ivec2(x*16 + 13, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_15 = int(texelFetch(state, clamp(ivec2(x*16 + 14, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_16 = int(texelFetch(state, clamp(ivec2(x*16 + 15, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int match_17 = 
+            (slice_0 != 0) ? (slice_0 + mul_1) :
+            (slice_2 != 0) ? ((slice_2 + mul_1) + 1) :
+            (slice_3 != 0) ? ((slice_3 + mul_1) + 2) :
+            (slice_4 != 0) ? ((slice_4 + mul_1) + 3) :
+            (slice_5 != 0) ? ((slice_5 + mul_1) + 4) :
+            (slice_6 != 0) ? ((slice_6 + mul_1) + 5) :
+            (slice_7 != 0) ? ((slice_7 + mul_1) + 6) :
+            (slice_8 != 0) ? ((slice_8 + mul_1) + 7) :
+            (slice_9 != 0) ? ((slice_9 + mul_1) + 8) :
+            (slice_10 != 0) ? ((slice_10 + mul_1) + 9) :
+            (slice_11 != 0) ? ((slice_11 + mul_1) + 10) :
+            (slice_12 != 0) ? ((slice_12 + mul_1) + 11) :
+            (slice_13 != 0) ? ((slice_13 + mul_1) + 12) :
+            (slice_14 != 0) ? ((slice_14 + mul_1) + 13) :
+            (slice_15 != 0) ? ((slice_15 + mul_1) + 14) :
+            (slice_16 != 0) ? ((slice_16 + mul_1) + 15) :
+            0;
+        outColor = float(match_17) / 255.0;
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(findOneFold16, findOneFold16Layered);
+registerSingleShot(findOneFold16, findOneFold16SingleShot);
+
+export {findOneFold16}
@@ -0,0 +1,116 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let findOneFold4 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.y);
+        int func_int_6 = int(out_tile.y);
+        int add_8 = ((y / func_int_6) * func_int_7) + clamp((y % func_int_6), 0, (func_int_7 - 1));
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int mul_4 = mod_3 * 4;
+        int sub_5 = func_int_1 - 1;
+        int slice_9 = int(texelFetch(state, ivec2((mul_2 + clamp(mul_4, 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int mul_10 = mod_3 * 3;
+        int slice_11 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 1), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_12 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 2), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int slice_13 = int(texelFetch(state, ivec2((mul_2 + clamp((mul_4 + 3), 0, sub_5)), add_8), 0).x*255.0 + 0.5);
+        int match_14 = 
+            (slice_9 != 0) ? (slice_9 + mul_10) :
+            (slice_11 != 0) ? ((slice_11 + mul_10) + 1) :
+            (slice_12 != 0) ? ((slice_12 + mul_10) + 2) :
+            (slice_13 != 0) ? ((slice_13 + mul_10) + 3) :
+            0;
+        outColor = float(match_14) / 255.0;
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let findOneFold4Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_14 = int(state_tile.y);
+        int add_12 = y + int(out_origin.y);
+        int func_int_13 = int(out_tile.y);
+        int func_clamp_15 = clamp((((add_12 / func_int_13) * func_int_14) + clamp((add_12 % func_int_13), 0, (func_int_14 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_16 = int(state_layer.y);
+        int mod_17 = func_clamp_15 % func_int_16;
+        int func_int_7 = int(state_size.x);
+        int sub_8 = func_int_7 - 1;
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int mul_5 = mod_4 * 4;
+        int sub_6 = func_int_2 - 1;
+        int func_clamp_9 = clamp((mul_3 + clamp(mul_5, 0, sub_6)), 0, sub_8);
+        int func_int_10 = int(state_layer.x);
+        int mod_11 = func_clamp_9 % func_int_10;
+        int mul_18 = (func_clamp_15 / func_int_16) * (((func_int_7 + func_int_10) - 1) / func_int_10);
+        int fetch_19 = int(texelFetch(state, ivec3(mod_11, mod_17, (mul_18 + (func_clamp_9 / func_int_10))), 0).x*255.0 + 0.5);
+        int mul_20 = mod_4 * 3;
+        int func_clamp_21 = clamp((mul_3 + clamp((mul_5 + 1), 0, sub_6)), 0, sub_8);
+        int fetch_22 = int(texelFetch(state, ivec3((func_clamp_21 % func_int_10), mod_17, (mul_18 + (func_clamp_21 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_23 = clamp((mul_3 + clamp((mul_5 + 2), 0, sub_6)), 0, sub_8);
+        int fetch_24 = int(texelFetch(state, ivec3((func_clamp_23 % func_int_10), mod_17, (mul_18 + (func_clamp_23 / func_int_10))), 0).x*255.0 + 0.5);
+        int func_clamp_25 = clamp((mul_3 + clamp((mul_5 + 3), 0, sub_6)), 0, sub_8);
+        int fetch_26 = int(texelFetch(state, ivec3((func_clamp_25 % func_int_10), mod_17, (mul_18 + (func_clamp_25 / func_int_10))), 0).x*255.0 + 0.5);
+        int match_27 = 
+            (fetch_19 != 0) ? (fetch_19 + mul_20) :
+            (fetch_22 != 0) ? ((fetch_22 + mul_20) + 1) :
+            (fetch_24 != 0) ? ((fetch_24 + mul_20) + 2) :
+            (fetch_26 != 0) ? ((fetch_26 + mul_20) + 3) :
+            0;
+        outColor = float(match_27) / 255.0;
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let findOneFold4SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int slice_0 = int(texelFetch(state, clamp(ivec2(x*4, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int mul_1 = x * 3;
+        int slice_2 = int(texelFetch(state, clamp(ivec2(x*4 + 1, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_3 = int(texelFetch(state, clamp(ivec2(x*4 + 2, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_4 = int(texelFetch(state, clamp(ivec2(x*4 + 3, y), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int match_5 = 
+            (slice_0 != 0) ? (slice_0 + mul_1) :
+            (slice_2 != 0) ? ((slice_2 + mul_1) + 1) :
+            (slice_3 != 0) ? ((slice_3 + mul_1) + 2) :
+            (slice_4 != 0) ? ((slice_4 + mul_1) + 3) :
+            0;
+        outColor = float(match_5) / 255.0;
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(findOneFold4, findOneFold4Layered);
+registerSingleShot(findOneFold4, findOneFold4SingleShot);
+
+export {findOneFold4}
@@ -0,0 +1,1099 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {pickVariant, registerLayered, registerVariant} from 'src/sim/ShaderVariants.js'
+
+let frameCyclePass0 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform int surface_width;
+    uniform vec2 frame_size;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool slice_0 = texelFetch(frame, clamp(ivec2((x ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_9 = (x & 1) == 1;
+        int sub_6 = int(frame_size.x) - 1;
+        int right_shift_1 = x >> 1;
+        int divide_2 = right_shift_1 / surface_width;
+        int mul_3 = divide_2 * surface_width;
+        int mod_4 = right_shift_1 % surface_width;
+        int add_5 = mod_4 + 1;
+        bool slice_7 = texelFetch(frame, clamp(ivec2((clamp(((mul_3 + ((add_5 ^ 1) - 1)) * 2), 0, sub_6) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_8 = (divide_2 & 1) == 1;
+        bool bit_xor_10 = slice_0 != ((slice_7 && ((((add_5 | 1) - 1) < surface_width) && eq_8)) && eq_9);
+        int func_clamp_11 = clamp(((mul_3 + (mod_4 ^ 1)) * 2), 0, sub_6);
+        bool slice_12 = texelFetch(frame, clamp(ivec2((func_clamp_11 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_13 = func_clamp_11 >> 1;
+        int divide_14 = right_shift_13 / surface_width;
+        int mul_15 = divide_14 * surface_width;
+        int add_16 = (right_shift_13 % surface_width) + 1;
+        bool bit_xor_17 = bit_xor_10 != (((slice_12 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_15 + ((add_16 ^ 1) - 1)) * 2), 0, sub_6) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((((add_16 | 1) - 1) < surface_width) && ((divide_14 & 1) == 1))) && ((func_clamp_11 & 1) == 1))) && (((mod_4 | 1) < surface_width) && eq_8)) && eq_9);
+        int add_18 = divide_2 + 1;
+        int func_clamp_19 = clamp((((((add_18 ^ 1) - 1) * surface_width) + mod_4) * 2), 0, sub_6);
+        bool slice_20 = texelFetch(frame, clamp(ivec2((func_clamp_19 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_28 = (func_clamp_19 & 1) == 1;
+        int right_shift_21 = func_clamp_19 >> 1;
+        int divide_22 = right_shift_21 / surface_width;
+        int mul_23 = divide_22 * surface_width;
+        int mod_24 = right_shift_21 % surface_width;
+        int add_25 = mod_24 + 1;
+        bool slice_26 = texelFetch(frame, clamp(ivec2((clamp(((mul_23 + ((add_25 ^ 1) - 1)) * 2), 0, sub_6) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_27 = (divide_22 & 1) == 1;
+        bool bit_xor_29 = slice_20 != ((slice_26 && ((((add_25 | 1) - 1) < surface_width) && eq_27)) && eq_28);
+        int func_clamp_30 = clamp(((mul_23 + (mod_24 ^ 1)) * 2), 0, sub_6);
+        bool slice_31 = texelFetch(frame, clamp(ivec2((func_clamp_30 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_32 = func_clamp_30 >> 1;
+        int divide_33 = right_shift_32 / surface_width;
+        int mul_34 = divide_33 * surface_width;
+        int add_35 = (right_shift_32 % surface_width) + 1;
+        bool bit_xor_36 = bit_xor_29 != (((slice_31 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_34 + ((add_35 ^ 1) - 1)) * 2), 0, sub_6) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((((add_35 | 1) - 1) < surface_width) && ((divide_33 & 1) == 1))) && ((func_clamp_30 & 1) == 1))) && (((mod_24 | 1) < surface_width) && eq_27)) && eq_28);
+        bool eq_37 = (mod_4 & 1) == 0;
+        bool bit_xor_38 = bit_xor_17 != ((bit_xor_36 && ((((add_18 | 1) - 1) < surface_height) && eq_37)) && eq_9);
+        int func_clamp_39 = clamp(((((divide_2 ^ 1) * surface_width) + mod_4) * 2), 0, sub_6);
+        bool slice_40 = texelFetch(frame, clamp(ivec2((func_clamp_39 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_48 = (func_clamp_39 & 1) == 1;
+        int right_shift_41 = func_clamp_39 >> 1;
+        int divide_42 = right_shift_41 / surface_width;
+        int mul_43 = divide_42 * surface_width;
+        int mod_44 = right_shift_41 % surface_width;
+        int add_45 = mod_44 + 1;
+        bool slice_46 = texelFetch(frame, clamp(ivec2((clamp(((mul_43 + ((add_45 ^ 1) - 1)) * 2), 0, sub_6) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_47 = (divide_42 & 1) == 1;
+        bool bit_xor_49 = slice_40 != ((slice_46 && ((((add_45 | 1) - 1) < surface_width) && eq_47)) && eq_48);
+        int func_clamp_50 = clamp(((mul_43 + (mod_44 ^ 1)) * 2), 0, sub_6);
+        bool slice_51 = texelFetch(frame, clamp(ivec2((func_clamp_50 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_52 = func_clamp_50 >> 1;
+        int divide_53 = right_shift_52 / surface_width;
+        int mul_54 = divide_53 * surface_width;
+        int add_55 = (right_shift_52 % surface_width) + 1;
+        bool bit_xor_56 = bit_xor_49 != (((slice_51 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_54 + ((add_55 ^ 1) - 1)) * 2), 0, sub_6) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((((add_55 | 1) - 1) < surface_width) && ((divide_53 & 1) == 1))) && ((func_clamp_50 & 1) == 1))) && (((mod_44 | 1) < surface_width) && eq_47)) && eq_48);
+        int add_57 = divide_42 + 1;
+        int func_clamp_58 = clamp((((((add_57 ^ 1) - 1) * surface_width) + mod_44) * 2), 0, sub_6);
+        bool slice_59 = texelFetch(frame, clamp(ivec2((func_clamp_58 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_67 = (func_clamp_58 & 1) == 1;
+        int right_shift_60 = func_clamp_58 >> 1;
+        int divide_61 = right_shift_60 / surface_width;
+        int mul_62 = divide_61 * surface_width;
+        int mod_63 = right_shift_60 % surface_width;
+        int add_64 = mod_63 + 1;
+        bool slice_65 = texelFetch(frame, clamp(ivec2((clamp(((mul_62 + ((add_64 ^ 1) - 1)) * 2), 0, sub_6) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_66 = (divide_61 & 1) == 1;
+        bool bit_xor_68 = slice_59 != ((slice_65 && ((((add_64 | 1) - 1) < surface_width) && eq_66)) && eq_67);
+        int func_clamp_69 = clamp(((mul_62 + (mod_63 ^ 1)) * 2), 0, sub_6);
+        bool slice_70 = texelFetch(frame, clamp(ivec2((func_clamp_69 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_71 = func_clamp_69 >> 1;
+        int divide_72 = right_shift_71 / surface_width;
+        int mul_73 = divide_72 * surface_width;
+        int add_74 = (right_shift_71 % surface_width) + 1;
+        outColor = float((bit_xor_38 != (((bit_xor_56 != (((bit_xor_68 != (((slice_70 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_73 + ((add_74 ^ 1) - 1)) * 2), 0, sub_6) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((((add_74 | 1) - 1) < surface_width) && ((divide_72 & 1) == 1))) && ((func_clamp_69 & 1) == 1))) && (((mod_63 | 1) < surface_width) && eq_66)) && eq_67)) && ((((add_57 | 1) - 1) < surface_height) && ((mod_44 & 1) == 0))) && eq_48)) && (((divide_2 | 1) < surface_height) && eq_37)) && eq_9)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass0Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 frame_size;
+    uniform vec2 frame_layer;
+    uniform highp sampler2DArray frame;
+    uniform int surface_width;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_clamp_6 = clamp((y + int(out_origin.y)), 0, (int(frame_size.y) - 1));
+        int func_int_7 = int(frame_layer.y);
+        int mod_8 = func_clamp_6 % func_int_7;
+        int func_int_1 = int(frame_size.x);
+        int sub_2 = func_int_1 - 1;
+        int add_0 = x + int(out_origin.x);
+        int func_clamp_3 = clamp((add_0 ^ 1), 0, sub_2);
+        int func_int_4 = int(frame_layer.x);
+        int mod_5 = func_clamp_3 % func_int_4;
+        int mul_9 = (func_clamp_6 / func_int_7) * (((func_int_1 + func_int_4) - 1) / func_int_4);
+        bool fetch_10 = texelFetch(frame, ivec3(mod_5, mod_8, (mul_9 + (func_clamp_3 / func_int_4))), 0).x > 0.5;
+        bool eq_19 = (add_0 & 1) == 1;
+        int right_shift_11 = add_0 >> 1;
+        int divide_12 = right_shift_11 / surface_width;
+        int mul_13 = divide_12 * surface_width;
+        int mod_14 = right_shift_11 % surface_width;
+        int add_15 = mod_14 + 1;
+        int func_clamp_16 = clamp((clamp(((mul_13 + ((add_15 ^ 1) - 1)) * 2), 0, sub_2) ^ 1), 0, sub_2);
+        bool fetch_17 = texelFetch(frame, ivec3((func_clamp_16 % func_int_4), mod_8, (mul_9 + (func_clamp_16 / func_int_4))), 0).x > 0.5;
+        bool eq_18 = (divide_12 & 1) == 1;
+        bool bit_xor_20 = fetch_10 != ((fetch_17 && ((((add_15 | 1) - 1) < surface_width) && eq_18)) && eq_19);
+        int func_clamp_21 = clamp(((mul_13 + (mod_14 ^ 1)) * 2), 0, sub_2);
+        int func_clamp_22 = clamp((func_clamp_21 ^ 1), 0, sub_2);
+        bool fetch_23 = texelFetch(frame, ivec3((func_clamp_22 % func_int_4), mod_8, (mul_9 + (func_clamp_22 / func_int_4))), 0).x > 0.5;
+        int right_shift_24 = func_clamp_21 >> 1;
+        int divide_25 = right_shift_24 / surface_width;
+        int mul_26 = divide_25 * surface_width;
+        int add_27 = (right_shift_24 % surface_width) + 1;
+        int func_clamp_28 = clamp((clamp(((mul_26 + ((add_27 ^ 1) - 1)) * 2), 0, sub_2) ^ 1), 0, sub_2);
+        bool bit_xor_29 = bit_xor_20 != (((fetch_23 != (((texelFetch(frame, ivec3((func_clamp_28 % func_int_4), mod_8, (mul_9 + (func_clamp_28 / func_int_4))), 0).x > 0.5) && ((((add_27 | 1) - 1) < surface_width) && ((divide_25 & 1) == 1))) && ((func_clamp_21 & 1) == 1))) && (((mod_14 | 1) < surface_width) && eq_18)) && eq_19);
+        int add_30 = divide_12 + 1;
+        int func_clamp_31 = clamp((((((add_30 ^ 1) - 1) * surface_width) + mod_14) * 2), 0, sub_2);
+        int func_clamp_32 = clamp((func_clamp_31 ^ 1), 0, sub_2);
+        bool fetch_33 = texelFetch(frame, ivec3((func_clamp_32 % func_int_4), mod_8, (mul_9 + (func_clamp_32 / func_int_4))), 0).x > 0.5;
+        bool eq_42 = (func_clamp_31 & 1) == 1;
+        int right_shift_34 = func_clamp_31 >> 1;
+        int divide_35 = right_shift_34 / surface_width;
+        int mul_36 = divide_35 * surface_width;
+        int mod_37 = right_shift_34 % surface_width;
+        int add_38 = mod_37 + 1;
+        int func_clamp_39 = clamp((clamp(((mul_36 + ((add_38 ^ 1) - 1)) * 2), 0, sub_2) ^ 1), 0, sub_2);
+        bool fetch_40 = texelFetch(frame, ivec3((func_clamp_39 % func_int_4), mod_8, (mul_9 + (func_clamp_39 / func_int_4))), 0).x > 0.5;
+        bool eq_41 = (divide_35 & 1) == 1;
+        bool bit_xor_43 = fetch_33 != ((fetch_40 && ((((add_38 | 1) - 1) < surface_width) && eq_41)) && eq_42);
+        int func_clamp_44 = clamp(((mul_36 + (mod_37 ^ 1)) * 2), 0, sub_2);
+        int func_clamp_45 = clamp((func_clamp_44 ^ 1), 0, sub_2);
+        bool fetch_46 = texelFetch(frame, ivec3((func_clamp_45 % func_int_4), mod_8, (mul_9 + (func_clamp_45 / func_int_4))), 0).x > 0.5;
+        int right_shift_47 = func_clamp_44 >> 1;
+        int divide_48 = right_shift_47 / surface_width;
+        int mul_49 = divide_48 * surface_width;
+        int add_50 = (right_shift_47 % surface_width) + 1;
+        int func_clamp_51 = clamp((clamp(((mul_49 + ((add_50 ^ 1) - 1)) * 2), 0, sub_2) ^ 1), 0, sub_2);
+        bool bit_xor_52 = bit_xor_43 != (((fetch_46 != (((texelFetch(frame, ivec3((func_clamp_51 % func_int_4), mod_8, (mul_9 + (func_clamp_51 / func_int_4))), 0).x > 0.5) && ((((add_50 | 1) - 1) < surface_width) && ((divide_48 & 1) == 1))) && ((func_clamp_44 & 1) == 1))) && (((mod_37 | 1) < surface_width) && eq_41)) && eq_42);
+        bool eq_53 = (mod_14 & 1) == 0;
+        bool bit_xor_54 = bit_xor_29 != ((bit_xor_52 && ((((add_30 | 1) - 1) < surface_height) && eq_53)) && eq_19);
+        int func_clamp_55 = clamp(((((divide_12 ^ 1) * surface_width) + mod_14) * 2), 0, sub_2);
+        int func_clamp_56 = clamp((func_clamp_55 ^ 1), 0, sub_2);
+        bool fetch_57 = texelFetch(frame, ivec3((func_clamp_56 % func_int_4), mod_8, (mul_9 + (func_clamp_56 / func_int_4))), 0).x > 0.5;
+        bool eq_66 = (func_clamp_55 & 1) == 1;
+        int right_shift_58 = func_clamp_55 >> 1;
+        int divide_59 = right_shift_58 / surface_width;
+        int mul_60 = divide_59 * surface_width;
+        int mod_61 = right_shift_58 % surface_width;
+        int add_62 = mod_61 + 1;
+        int func_clamp_63 = clamp((clamp(((mul_60 + ((add_62 ^ 1) - 1)) * 2), 0, sub_2) ^ 1), 0, sub_2);
+        bool fetch_64 = texelFetch(frame, ivec3((func_clamp_63 % func_int_4), mod_8, (mul_9 + (func_clamp_63 / func_int_4))), 0).x > 0.5;
+        bool eq_65 = (divide_59 & 1) == 1;
+        bool bit_xor_67 = fetch_57 != ((fetch_64 && ((((add_62 | 1) - 1) < surface_width) && eq_65)) && eq_66);
+        int func_clamp_68 = clamp(((mul_60 + (mod_61 ^ 1)) * 2), 0, sub_2);
+        int func_clamp_69 = clamp((func_clamp_68 ^ 1), 0, sub_2);
+        bool fetch_70 = texelFetch(frame, ivec3((func_clamp_69 % func_int_4), mod_8, (mul_9 + (func_clamp_69 / func_int_4))), 0).x > 0.5;
+        int right_shift_71 = func_clamp_68 >> 1;
+        int divide_72 = right_shift_71 / surface_width;
+        int mul_73 = divide_72 * surface_width;
+        int add_74 = (right_shift_71 % surface_width) + 1;
+        int func_clamp_75 = clamp((clamp(((mul_73 + ((add_74 ^ 1) - 1)) * 2), 0, sub_2) ^ 1), 0, sub_2);
+        bool bit_xor_76 = bit_xor_67 != (((fetch_70 != (((texelFetch(frame, ivec3((func_clamp_75 % func_int_4), mod_8, (mul_9 + (func_clamp_75 / func_int_4))), 0).x > 0.5) && ((((add_74 | 1) - 1) < surface_width) && ((divide_72 & 1) == 1))) && ((func_clamp_68 & 1) == 1))) && (((mod_61 | 1) < surface_width) && eq_65)) && eq_66);
+        int add_77 = divide_59 + 1;
+        int func_clamp_78 = clamp((((((add_77 ^ 1) - 1) * surface_width) + mod_61) * 2), 0, sub_2);
+        int func_clamp_79 = clamp((func_clamp_78 ^ 1), 0, sub_2);
+        bool fetch_80 = texelFetch(frame, ivec3((func_clamp_79 % func_int_4), mod_8, (mul_9 + (func_clamp_79 / func_int_4))), 0).x > 0.5;
+        bool eq_89 = (func_clamp_78 & 1) == 1;
+        int right_shift_81 = func_clamp_78 >> 1;
+        int divide_82 = right_shift_81 / surface_width;
+        int mul_83 = divide_82 * surface_width;
+        int mod_84 = right_shift_81 % surface_width;
+        int add_85 = mod_84 + 1;
+        int func_clamp_86 = clamp((clamp(((mul_83 + ((add_85 ^ 1) - 1)) * 2), 0, sub_2) ^ 1), 0, sub_2);
+        bool fetch_87 = texelFetch(frame, ivec3((func_clamp_86 % func_int_4), mod_8, (mul_9 + (func_clamp_86 / func_int_4))), 0).x > 0.5;
+        bool eq_88 = (divide_82 & 1) == 1;
+        bool bit_xor_90 = fetch_80 != ((fetch_87 && ((((add_85 | 1) - 1) < surface_width) && eq_88)) && eq_89);
+        int func_clamp_91 = clamp(((mul_83 + (mod_84 ^ 1)) * 2), 0, sub_2);
+        int func_clamp_92 = clamp((func_clamp_91 ^ 1), 0, sub_2);
+        bool fetch_93 = texelFetch(frame, ivec3((func_clamp_92 % func_int_4), mod_8, (mul_9 + (func_clamp_92 / func_int_4))), 0).x > 0.5;
+        int right_shift_94 = func_clamp_91 >> 1;
+        int divide_95 = right_shift_94 / surface_width;
+        int mul_96 = divide_95 * surface_width;
+        int add_97 = (right_shift_94 % surface_width) + 1;
+        int func_clamp_98 = clamp((clamp(((mul_96 + ((add_97 ^ 1) - 1)) * 2), 0, sub_2) ^ 1), 0, sub_2);
+        outColor = float((bit_xor_54 != (((bit_xor_76 != (((bit_xor_90 != (((fetch_93 != (((texelFetch(frame, ivec3((func_clamp_98 % func_int_4), mod_8, (mul_9 + (func_clamp_98 / func_int_4))), 0).x > 0.5) && ((((add_97 | 1) - 1) < surface_width) && ((divide_95 & 1) == 1))) && ((func_clamp_91 & 1) == 1))) && (((mod_84 | 1) < surface_width) && eq_88)) && eq_89)) && ((((add_77 | 1) - 1) < surface_height) && ((mod_61 & 1) == 0))) && eq_66)) && (((divide_12 | 1) < surface_height) && eq_53)) && eq_19)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size', undefined, 'frame_layer']);
+
+let frameCyclePass0_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool slice_0 = texelFetch(frame, clamp(ivec2((x ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_7 = (x & 1) == 1;
+        int right_shift_1 = x >> 1;
+        int right_shift_2 = (right_shift_1 * 26215) >> 17;
+        bool eq_6 = (right_shift_2 & 1) == 1;
+        int sub_5 = int(frame_size.x) - 1;
+        int mul_3 = right_shift_2 * 5;
+        int sub_4 = right_shift_1 - mul_3;
+        bool bit_xor_8 = slice_0 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_3 + (((sub_4 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_6) && eq_7);
+        int func_clamp_9 = clamp(((mul_3 + (sub_4 ^ 1)) * 2), 0, sub_5);
+        bool slice_10 = texelFetch(frame, clamp(ivec2((func_clamp_9 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_11 = func_clamp_9 >> 1;
+        int right_shift_12 = (right_shift_11 * 26215) >> 17;
+        int mul_13 = right_shift_12 * 5;
+        bool bit_xor_14 = bit_xor_8 != (((slice_10 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_13 + ((((right_shift_11 - mul_13) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_12 & 1) == 1)) && ((func_clamp_9 & 1) == 1))) && (((sub_4 | 1) < 5) && eq_6)) && eq_7);
+        int add_15 = right_shift_2 + 1;
+        int func_clamp_16 = clamp((((((add_15 ^ 1) - 1) * 5) + sub_4) * 2), 0, sub_5);
+        bool slice_17 = texelFetch(frame, clamp(ivec2((func_clamp_16 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_23 = (func_clamp_16 & 1) == 1;
+        int right_shift_18 = func_clamp_16 >> 1;
+        int right_shift_19 = (right_shift_18 * 26215) >> 17;
+        bool eq_22 = (right_shift_19 & 1) == 1;
+        int mul_20 = right_shift_19 * 5;
+        int sub_21 = right_shift_18 - mul_20;
+        bool bit_xor_24 = slice_17 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_20 + (((sub_21 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_22) && eq_23);
+        int func_clamp_25 = clamp(((mul_20 + (sub_21 ^ 1)) * 2), 0, sub_5);
+        bool slice_26 = texelFetch(frame, clamp(ivec2((func_clamp_25 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_27 = func_clamp_25 >> 1;
+        int right_shift_28 = (right_shift_27 * 26215) >> 17;
+        int mul_29 = right_shift_28 * 5;
+        bool bit_xor_30 = bit_xor_24 != (((slice_26 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_29 + ((((right_shift_27 - mul_29) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_28 & 1) == 1)) && ((func_clamp_25 & 1) == 1))) && (((sub_21 | 1) < 5) && eq_22)) && eq_23);
+        bool eq_31 = (sub_4 & 1) == 0;
+        bool bit_xor_32 = bit_xor_14 != ((bit_xor_30 && ((((add_15 | 1) - 1) < 5) && eq_31)) && eq_7);
+        int func_clamp_33 = clamp(((((right_shift_2 ^ 1) * 5) + sub_4) * 2), 0, sub_5);
+        bool slice_34 = texelFetch(frame, clamp(ivec2((func_clamp_33 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_40 = (func_clamp_33 & 1) == 1;
+        int right_shift_35 = func_clamp_33 >> 1;
+        int right_shift_36 = (right_shift_35 * 26215) >> 17;
+        bool eq_39 = (right_shift_36 & 1) == 1;
+        int mul_37 = right_shift_36 * 5;
+        int sub_38 = right_shift_35 - mul_37;
+        bool bit_xor_41 = slice_34 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_37 + (((sub_38 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_39) && eq_40);
+        int func_clamp_42 = clamp(((mul_37 + (sub_38 ^ 1)) * 2), 0, sub_5);
+        bool slice_43 = texelFetch(frame, clamp(ivec2((func_clamp_42 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_44 = func_clamp_42 >> 1;
+        int right_shift_45 = (right_shift_44 * 26215) >> 17;
+        int mul_46 = right_shift_45 * 5;
+        bool bit_xor_47 = bit_xor_41 != (((slice_43 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_46 + ((((right_shift_44 - mul_46) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_45 & 1) == 1)) && ((func_clamp_42 & 1) == 1))) && (((sub_38 | 1) < 5) && eq_39)) && eq_40);
+        int add_48 = right_shift_36 + 1;
+        int func_clamp_49 = clamp((((((add_48 ^ 1) - 1) * 5) + sub_38) * 2), 0, sub_5);
+        bool slice_50 = texelFetch(frame, clamp(ivec2((func_clamp_49 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_56 = (func_clamp_49 & 1) == 1;
+        int right_shift_51 = func_clamp_49 >> 1;
+        int right_shift_52 = (right_shift_51 * 26215) >> 17;
+        bool eq_55 = (right_shift_52 & 1) == 1;
+        int mul_53 = right_shift_52 * 5;
+        int sub_54 = right_shift_51 - mul_53;
+        bool bit_xor_57 = slice_50 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_53 + (((sub_54 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_55) && eq_56);
+        int func_clamp_58 = clamp(((mul_53 + (sub_54 ^ 1)) * 2), 0, sub_5);
+        bool slice_59 = texelFetch(frame, clamp(ivec2((func_clamp_58 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_60 = func_clamp_58 >> 1;
+        int right_shift_61 = (right_shift_60 * 26215) >> 17;
+        int mul_62 = right_shift_61 * 5;
+        outColor = float((bit_xor_32 != (((bit_xor_47 != (((bit_xor_57 != (((slice_59 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_62 + ((((right_shift_60 - mul_62) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_61 & 1) == 1)) && ((func_clamp_58 & 1) == 1))) && (((sub_54 | 1) < 5) && eq_55)) && eq_56)) && ((((add_48 | 1) - 1) < 5) && ((sub_38 & 1) == 0))) && eq_40)) && (((right_shift_2 | 1) < 5) && eq_31)) && eq_7)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass0_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool slice_0 = texelFetch(frame, clamp(ivec2((x ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_7 = (x & 1) == 1;
+        int right_shift_1 = x >> 1;
+        int right_shift_2 = (right_shift_1 * 3641) >> 15;
+        bool eq_6 = (right_shift_2 & 1) == 1;
+        int sub_5 = int(frame_size.x) - 1;
+        int mul_3 = right_shift_2 * 9;
+        int sub_4 = right_shift_1 - mul_3;
+        bool bit_xor_8 = slice_0 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_3 + (((sub_4 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_6) && eq_7);
+        int func_clamp_9 = clamp(((mul_3 + (sub_4 ^ 1)) * 2), 0, sub_5);
+        bool slice_10 = texelFetch(frame, clamp(ivec2((func_clamp_9 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_11 = func_clamp_9 >> 1;
+        int right_shift_12 = (right_shift_11 * 3641) >> 15;
+        int mul_13 = right_shift_12 * 9;
+        bool bit_xor_14 = bit_xor_8 != (((slice_10 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_13 + ((((right_shift_11 - mul_13) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_12 & 1) == 1)) && ((func_clamp_9 & 1) == 1))) && (((sub_4 | 1) < 9) && eq_6)) && eq_7);
+        int add_15 = right_shift_2 + 1;
+        int func_clamp_16 = clamp((((((add_15 ^ 1) - 1) * 9) + sub_4) * 2), 0, sub_5);
+        bool slice_17 = texelFetch(frame, clamp(ivec2((func_clamp_16 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_23 = (func_clamp_16 & 1) == 1;
+        int right_shift_18 = func_clamp_16 >> 1;
+        int right_shift_19 = (right_shift_18 * 3641) >> 15;
+        bool eq_22 = (right_shift_19 & 1) == 1;
+        int mul_20 = right_shift_19 * 9;
+        int sub_21 = right_shift_18 - mul_20;
+        bool bit_xor_24 = slice_17 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_20 + (((sub_21 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_22) && eq_23);
+        int func_clamp_25 = clamp(((mul_20 + (sub_21 ^ 1)) * 2), 0, sub_5);
+        bool slice_26 = texelFetch(frame, clamp(ivec2((func_clamp_25 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_27 = func_clamp_25 >> 1;
+        int right_shift_28 = (right_shift_27 * 3641) >> 15;
+        int mul_29 = right_shift_28 * 9;
+        bool bit_xor_30 = bit_xor_24 != (((slice_26 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_29 + ((((right_shift_27 - mul_29) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_28 & 1) == 1)) && ((func_clamp_25 & 1) == 1))) && (((sub_21 | 1) < 9) && eq_22)) && eq_23);
+        bool eq_31 = (sub_4 & 1) == 0;
+        bool bit_xor_32 = bit_xor_14 != ((bit_xor_30 && ((((add_15 | 1) - 1) < 9) && eq_31)) && eq_7);
+        int func_clamp_33 = clamp(((((right_shift_2 ^ 1) * 9) + sub_4) * 2), 0, sub_5);
+        bool slice_34 = texelFetch(frame, clamp(ivec2((func_clamp_33 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_40 = (func_clamp_33 & 1) == 1;
+        int right_shift_35 = func_clamp_33 >> 1;
+        int right_shift_36 = (right_shift_35 * 3641) >> 15;
+        bool eq_39 = (right_shift_36 & 1) == 1;
+        int mul_37 = right_shift_36 * 9;
+        int sub_38 = right_shift_35 - mul_37;
+        bool bit_xor_41 = slice_34 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_37 + (((sub_38 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_39) && eq_40);
+        int func_clamp_42 = clamp(((mul_37 + (sub_38 ^ 1)) * 2), 0, sub_5);
+        bool slice_43 = texelFetch(frame, clamp(ivec2((func_clamp_42 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_44 = func_clamp_42 >> 1;
+        int right_shift_45 = (right_shift_44 * 3641) >> 15;
+        int mul_46 = right_shift_45 * 9;
+        bool bit_xor_47 = bit_xor_41 != (((slice_43 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_46 + ((((right_shift_44 - mul_46) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_45 & 1) == 1)) && ((func_clamp_42 & 1) == 1))) && (((sub_38 | 1) < 9) && eq_39)) && eq_40);
+        int add_48 = right_shift_36 + 1;
+        int func_clamp_49 = clamp((((((add_48 ^ 1) - 1) * 9) + sub_38) * 2), 0, sub_5);
+        bool slice_50 = texelFetch(frame, clamp(ivec2((func_clamp_49 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_56 = (func_clamp_49 & 1) == 1;
+        int right_shift_51 = func_clamp_49 >> 1;
+        int right_shift_52 = (right_shift_51 * 3641) >> 15;
+        bool eq_55 = (right_shift_52 & 1) == 1;
+        int mul_53 = right_shift_52 * 9;
+        int sub_54 = right_shift_51 - mul_53;
+        bool bit_xor_57 = slice_50 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_53 + (((sub_54 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_55) && eq_56);
+        int func_clamp_58 = clamp(((mul_53 + (sub_54 ^ 1)) * 2), 0, sub_5);
+        bool slice_59 = texelFetch(frame, clamp(ivec2((func_clamp_58 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_60 = func_clamp_58 >> 1;
+        int right_shift_61 = (right_shift_60 * 3641) >> 15;
+        int mul_62 = right_shift_61 * 9;
+        outColor = float((bit_xor_32 != (((bit_xor_47 != (((bit_xor_57 != (((slice_59 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_62 + ((((right_shift_60 - mul_62) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_61 & 1) == 1)) && ((func_clamp_58 & 1) == 1))) && (((sub_54 | 1) < 9) && eq_55)) && eq_56)) && ((((add_48 | 1) - 1) < 9) && ((sub_38 & 1) == 0))) && eq_40)) && (((right_shift_2 | 1) < 9) && eq_31)) && eq_7)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass0_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool slice_0 = texelFetch(frame, clamp(ivec2((x ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_7 = (x & 1) == 1;
+        int right_shift_1 = x >> 1;
+        int right_shift_2 = (right_shift_1 * 20165) >> 18;
+        bool eq_6 = (right_shift_2 & 1) == 1;
+        int sub_5 = int(frame_size.x) - 1;
+        int mul_3 = right_shift_2 * 13;
+        int sub_4 = right_shift_1 - mul_3;
+        bool bit_xor_8 = slice_0 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_3 + (((sub_4 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_6) && eq_7);
+        int func_clamp_9 = clamp(((mul_3 + (sub_4 ^ 1)) * 2), 0, sub_5);
+        bool slice_10 = texelFetch(frame, clamp(ivec2((func_clamp_9 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_11 = func_clamp_9 >> 1;
+        int right_shift_12 = (right_shift_11 * 20165) >> 18;
+        int mul_13 = right_shift_12 * 13;
+        bool bit_xor_14 = bit_xor_8 != (((slice_10 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_13 + ((((right_shift_11 - mul_13) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_12 & 1) == 1)) && ((func_clamp_9 & 1) == 1))) && (((sub_4 | 1) < 13) && eq_6)) && eq_7);
+        int add_15 = right_shift_2 + 1;
+        int func_clamp_16 = clamp((((((add_15 ^ 1) - 1) * 13) + sub_4) * 2), 0, sub_5);
+        bool slice_17 = texelFetch(frame, clamp(ivec2((func_clamp_16 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_23 = (func_clamp_16 & 1) == 1;
+        int right_shift_18 = func_clamp_16 >> 1;
+        int right_shift_19 = (right_shift_18 * 20165) >> 18;
+        bool eq_22 = (right_shift_19 & 1) == 1;
+        int mul_20 = right_shift_19 * 13;
+        int sub_21 = right_shift_18 - mul_20;
+        bool bit_xor_24 = slice_17 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_20 + (((sub_21 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_22) && eq_23);
+        int func_clamp_25 = clamp(((mul_20 + (sub_21 ^ 1)) * 2), 0, sub_5);
+        bool slice_26 = texelFetch(frame, clamp(ivec2((func_clamp_25 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_27 = func_clamp_25 >> 1;
+        int right_shift_28 = (right_shift_27 * 20165) >> 18;
+        int mul_29 = right_shift_28 * 13;
+        bool bit_xor_30 = bit_xor_24 != (((slice_26 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_29 + ((((right_shift_27 - mul_29) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_28 & 1) == 1)) && ((func_clamp_25 & 1) == 1))) && (((sub_21 | 1) < 13) && eq_22)) && eq_23);
+        bool eq_31 = (sub_4 & 1) == 0;
+        bool bit_xor_32 = bit_xor_14 != ((bit_xor_30 && ((((add_15 | 1) - 1) < 13) && eq_31)) && eq_7);
+        int func_clamp_33 = clamp(((((right_shift_2 ^ 1) * 13) + sub_4) * 2), 0, sub_5);
+        bool slice_34 = texelFetch(frame, clamp(ivec2((func_clamp_33 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_40 = (func_clamp_33 & 1) == 1;
+        int right_shift_35 = func_clamp_33 >> 1;
+        int right_shift_36 = (right_shift_35 * 20165) >> 18;
+        bool eq_39 = (right_shift_36 & 1) == 1;
+        int mul_37 = right_shift_36 * 13;
+        int sub_38 = right_shift_35 - mul_37;
+        bool bit_xor_41 = slice_34 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_37 + (((sub_38 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_39) && eq_40);
+        int func_clamp_42 = clamp(((mul_37 + (sub_38 ^ 1)) * 2), 0, sub_5);
+        bool slice_43 = texelFetch(frame, clamp(ivec2((func_clamp_42 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_44 = func_clamp_42 >> 1;
+        int right_shift_45 = (right_shift_44 * 20165) >> 18;
+        int mul_46 = right_shift_45 * 13;
+        bool bit_xor_47 = bit_xor_41 != (((slice_43 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_46 + ((((right_shift_44 - mul_46) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_45 & 1) == 1)) && ((func_clamp_42 & 1) == 1))) && (((sub_38 | 1) < 13) && eq_39)) && eq_40);
+        int add_48 = right_shift_36 + 1;
+        int func_clamp_49 = clamp((((((add_48 ^ 1) - 1) * 13) + sub_38) * 2), 0, sub_5);
+        bool slice_50 = texelFetch(frame, clamp(ivec2((func_clamp_49 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        bool eq_56 = (func_clamp_49 & 1) == 1;
+        int right_shift_51 = func_clamp_49 >> 1;
+        int right_shift_52 = (right_shift_51 * 20165) >> 18;
+        bool eq_55 = (right_shift_52 & 1) == 1;
+        int mul_53 = right_shift_52 * 13;
+        int sub_54 = right_shift_51 - mul_53;
+        bool bit_xor_57 = slice_50 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_53 + (((sub_54 + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && eq_55) && eq_56);
+        int func_clamp_58 = clamp(((mul_53 + (sub_54 ^ 1)) * 2), 0, sub_5);
+        bool slice_59 = texelFetch(frame, clamp(ivec2((func_clamp_58 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+        int right_shift_60 = func_clamp_58 >> 1;
+        int right_shift_61 = (right_shift_60 * 20165) >> 18;
+        int mul_62 = right_shift_61 * 13;
+        outColor = float((bit_xor_32 != (((bit_xor_47 != (((bit_xor_57 != (((slice_59 != (((texelFetch(frame, clamp(ivec2((clamp(((mul_62 + ((((right_shift_60 - mul_62) + 1) ^ 1) - 1)) * 2), 0, sub_5) ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && ((right_shift_61 & 1) == 1)) && ((func_clamp_58 & 1) == 1))) && (((sub_54 | 1) < 13) && eq_55)) && eq_56)) && ((((add_48 | 1) - 1) < 13) && ((sub_38 & 1) == 0))) && eq_40)) && (((right_shift_2 | 1) < 13) && eq_31)) && eq_7)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+registerLayered(frameCyclePass0, frameCyclePass0Layered);
+registerVariant(frameCyclePass0, {surface_height: 5, surface_width: 5}, frameCyclePass0_surface_height5_surface_width5);
+registerLayered(frameCyclePass0_surface_height5_surface_width5, frameCyclePass0Layered);
+registerVariant(frameCyclePass0, {surface_height: 9, surface_width: 9}, frameCyclePass0_surface_height9_surface_width9);
+registerLayered(frameCyclePass0_surface_height9_surface_width9, frameCyclePass0Layered);
+registerVariant(frameCyclePass0, {surface_height: 13, surface_width: 13}, frameCyclePass0_surface_height13_surface_width13);
+registerLayered(frameCyclePass0_surface_height13_surface_width13, frameCyclePass0Layered);
+
+let frameCyclePass1 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int surface_width;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        int mod_1 = right_shift_0 % surface_width;
+        int bitwise_and_2 = mod_1 & 1;
+        int divide_3 = right_shift_0 / surface_width;
+        int bitwise_and_4 = divide_3 & 1;
+        bool match_5 = 
+            (bitwise_and_2 == bitwise_and_4) ? (texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((x ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_13 = (x & 1) == 1;
+        int sub_8 = int(frame_size.x) - 1;
+        int mul_6 = divide_3 * surface_width;
+        int add_7 = mod_1 + 1;
+        int func_clamp_9 = clamp(((mul_6 + ((add_7 ^ 1) - 1)) * 2), 0, sub_8);
+        int right_shift_10 = func_clamp_9 >> 1;
+        bool match_11 = 
+            (((right_shift_10 % surface_width) & 1) == ((right_shift_10 / surface_width) & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_9, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_9 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_12 = bitwise_and_4 == 0;
+        bool bit_xor_14 = match_5 != ((match_11 && ((((add_7 | 1) - 1) < surface_width) && eq_12)) && eq_13);
+        int func_clamp_15 = clamp(((mul_6 + (mod_1 ^ 1)) * 2), 0, sub_8);
+        int right_shift_16 = func_clamp_15 >> 1;
+        int divide_18 = right_shift_16 / surface_width;
+        int bitwise_and_19 = divide_18 & 1;
+        int mod_17 = right_shift_16 % surface_width;
+        bool match_20 = 
+            ((mod_17 & 1) == bitwise_and_19) ? (texelFetch(frame, clamp(ivec2(func_clamp_15, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_15 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        int mul_21 = divide_18 * surface_width;
+        int add_22 = mod_17 + 1;
+        int func_clamp_23 = clamp(((mul_21 + ((add_22 ^ 1) - 1)) * 2), 0, sub_8);
+        int right_shift_24 = func_clamp_23 >> 1;
+        bool match_25 = 
+            (((right_shift_24 % surface_width) & 1) == ((right_shift_24 / surface_width) & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_23, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_23 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool bit_xor_26 = bit_xor_14 != (((match_20 != ((match_25 && ((((add_22 | 1) - 1) < surface_width) && (bitwise_and_19 == 0))) && ((func_clamp_15 & 1) == 1))) && (((mod_1 | 1) < surface_width) && eq_12)) && eq_13);
+        int add_27 = divide_3 + 1;
+        int func_clamp_28 = clamp((((((add_27 ^ 1) - 1) * surface_width) + mod_1) * 2), 0, sub_8);
+        int right_shift_29 = func_clamp_28 >> 1;
+        int divide_31 = right_shift_29 / surface_width;
+        int bitwise_and_32 = divide_31 & 1;
+        int mod_30 = right_shift_29 % surface_width;
+        bool match_33 = 
+            ((mod_30 & 1) == bitwise_and_32) ? (texelFetch(frame, clamp(ivec2(func_clamp_28, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_28 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_40 = (func_clamp_28 & 1) == 1;
+        int mul_34 = divide_31 * surface_width;
+        int add_35 = mod_30 + 1;
+        int func_clamp_36 = clamp(((mul_34 + ((add_35 ^ 1) - 1)) * 2), 0, sub_8);
+        int right_shift_37 = func_clamp_36 >> 1;
+        bool match_38 = 
+            (((right_shift_37 % surface_width) & 1) == ((right_shift_37 / surface_width) & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_36, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_36 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_39 = bitwise_and_32 == 0;
+        bool bit_xor_41 = match_33 != ((match_38 && ((((add_35 | 1) - 1) < surface_width) && eq_39)) && eq_40);
+        int func_clamp_42 = clamp(((mul_34 + (mod_30 ^ 1)) * 2), 0, sub_8);
+        int right_shift_43 = func_clamp_42 >> 1;
+        int divide_45 = right_shift_43 / surface_width;
+        int bitwise_and_46 = divide_45 & 1;
+        int mod_44 = right_shift_43 % surface_width;
+        bool match_47 = 
+            ((mod_44 & 1) == bitwise_and_46) ? (texelFetch(frame, clamp(ivec2(func_clamp_42, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_42 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        int mul_48 = divide_45 * surface_width;
+        int add_49 = mod_44 + 1;
+        int func_clamp_50 = clamp(((mul_48 + ((add_49 ^ 1) - 1)) * 2), 0, sub_8);
+        int right_shift_51 = func_clamp_50 >> 1;
+        bool match_52 = 
+            (((right_shift_51 % surface_width) & 1) == ((right_shift_51 / surface_width) & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_50, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_50 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        outColor = float((bit_xor_26 != (((bit_xor_41 != (((match_47 != ((match_52 && ((((add_49 | 1) - 1) < surface_width) && (bitwise_and_46 == 0))) && ((func_clamp_42 & 1) == 1))) && (((mod_30 | 1) < surface_width) && eq_39)) && eq_40)) && ((((add_27 | 1) - 1) < surface_height) && (bitwise_and_2 == 1))) && eq_13)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass1Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform int surface_width;
+    uniform vec2 frame_size;
+    uniform vec2 frame_layer;
+    uniform highp sampler2DArray frame;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = x + int(out_origin.x);
+        int right_shift_1 = add_0 >> 1;
+        int mod_2 = right_shift_1 % surface_width;
+        int bitwise_and_3 = mod_2 & 1;
+        int divide_4 = right_shift_1 / surface_width;
+        int bitwise_and_5 = divide_4 & 1;
+        int func_clamp_10 = clamp((y + int(out_origin.y)), 0, (int(frame_size.y) - 1));
+        int func_int_11 = int(frame_layer.y);
+        int mod_12 = func_clamp_10 % func_int_11;
+        int func_int_6 = int(frame_size.x);
+        int sub_7 = func_int_6 - 1;
+        int func_clamp_8 = clamp(add_0, 0, sub_7);
+        int func_int_9 = int(frame_layer.x);
+        int mul_13 = (func_clamp_10 / func_int_11) * (((func_int_6 + func_int_9) - 1) / func_int_9);
+        int func_clamp_14 = clamp((add_0 ^ 1), 0, sub_7);
+        bool match_15 = 
+            (bitwise_and_3 == bitwise_and_5) ? (texelFetch(frame, ivec3((func_clamp_8 % func_int_9), mod_12, (mul_13 + (func_clamp_8 / func_int_9))), 0).x > 0.5) :
+            (texelFetch(frame, ivec3((func_clamp_14 % func_int_9), mod_12, (mul_13 + (func_clamp_14 / func_int_9))), 0).x > 0.5);
+        bool eq_24 = (add_0 & 1) == 1;
+        int mul_16 = divide_4 * surface_width;
+        int add_17 = mod_2 + 1;
+        int func_clamp_18 = clamp(((mul_16 + ((add_17 ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_19 = func_clamp_18 >> 1;
+        int func_clamp_20 = clamp(func_clamp_18, 0, sub_7);
+        int func_clamp_21 = clamp((func_clamp_18 ^ 1), 0, sub_7);
+        bool match_22 = 
+            (((right_shift_19 % surface_width) & 1) == ((right_shift_19 / surface_width) & 1)) ? (texelFetch(frame, ivec3((func_clamp_20 % func_int_9), mod_12, (mul_13 + (func_clamp_20 / func_int_9))), 0).x > 0.5) :
+            (texelFetch(frame, ivec3((func_clamp_21 % func_int_9), mod_12, (mul_13 + (func_clamp_21 / func_int_9))), 0).x > 0.5);
+        bool eq_23 = bitwise_and_5 == 0;
+        bool bit_xor_25 = match_15 != ((match_22 && ((((add_17 | 1) - 1) < surface_width) && eq_23)) && eq_24);
+        int func_clamp_26 = clamp(((mul_16 + (mod_2 ^ 1)) * 2), 0, sub_7);
+        int right_shift_27 = func_clamp_26 >> 1;
+        int divide_29 = right_shift_27 / surface_width;
+        int bitwise_and_30 = divide_29 & 1;
+        int mod_28 = right_shift_27 % surface_width;
+        int func_clamp_31 = clamp(func_clamp_26, 0, sub_7);
+        int func_clamp_32 = clamp((func_clamp_26 ^ 1), 0, sub_7);
+        bool match_33 = 
+            ((mod_28 & 1) == bitwise_and_30) ? (texelFetch(frame, ivec3((func_clamp_31 % func_int_9), mod_12, (mul_13 + (func_clamp_31 / func_int_9))), 0).x > 0.5) :
+            (texelFetch(frame, ivec3((func_clamp_32 % func_int_9), mod_12, (mul_13 + (func_clamp_32 / func_int_9))), 0).x > 0.5);
+        int mul_34 = divide_29 * surface_width;
+        int add_35 = mod_28 + 1;
+        int func_clamp_36 = clamp(((mul_34 + ((add_35 ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_37 = func_clamp_36 >> 1;
+        int func_clamp_38 = clamp(func_clamp_36, 0, sub_7);
+        int func_clamp_39 = clamp((func_clamp_36 ^ 1), 0, sub_7);
+        bool match_40 = 
+            (((right_shift_37 % surface_width) & 1) == ((right_shift_37 / surface_width) & 1)) ? (texelFetch(frame, ivec3((func_clamp_38 % func_int_9), mod_12, (mul_13 + (func_clamp_38 / func_int_9))), 0).x > 0.5) :
+            (texelFetch(frame, ivec3((func_clamp_39 % func_int_9), mod_12, (mul_13 + (func_clamp_39 / func_int_9))), 0).x > 0.5);
+        bool bit_xor_41 = bit_xor_25 != (((match_33 != ((match_40 && ((((add_35 | 1) - 1) < surface_width) && (bitwise_and_30 == 0))) && ((func_clamp_26 & 1) == 1))) && (((mod_2 | 1) < surface_width) && eq_23)) && eq_24);
+        int add_42 = divide_4 + 1;
+        int func_clamp_43 = clamp((((((add_42 ^ 1) - 1) * surface_width) + mod_2) * 2), 0, sub_7);
+        int right_shift_44 = func_clamp_43 >> 1;
+        int divide_46 = right_shift_44 / surface_width;
+        int bitwise_and_47 = divide_46 & 1;
+        int mod_45 = right_shift_44 % surface_width;
+        int func_clamp_48 = clamp(func_clamp_43, 0, sub_7);
+        int func_clamp_49 = clamp((func_clamp_43 ^ 1), 0, sub_7);
+        bool match_50 = 
+            ((mod_45 & 1) == bitwise_and_47) ? (texelFetch(frame, ivec3((func_clamp_48 % func_int_9), mod_12, (mul_13 + (func_clamp_48 / func_int_9))), 0).x > 0.5) :
+            (texelFetch(frame, ivec3((func_clamp_49 % func_int_9), mod_12, (mul_13 + (func_clamp_49 / func_int_9))), 0).x > 0.5);
+        bool eq_59 = (func_clamp_43 & 1) == 1;
+        int mul_51 = divide_46 * surface_width;
+        int add_52 = mod_45 + 1;
+        int func_clamp_53 = clamp(((mul_51 + ((add_52 ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_54 = func_clamp_53 >> 1;
+        int func_clamp_55 = clamp(func_clamp_53, 0, sub_7);
+        int func_clamp_56 = clamp((func_clamp_53 ^ 1), 0, sub_7);
+        bool match_57 = 
+            (((right_shift_54 % surface_width) & 1) == ((right_shift_54 / surface_width) & 1)) ? (texelFetch(frame, ivec3((func_clamp_55 % func_int_9), mod_12, (mul_13 + (func_clamp_55 / func_int_9))), 0).x > 0.5) :
+            (texelFetch(frame, ivec3((func_clamp_56 % func_int_9), mod_12, (mul_13 + (func_clamp_56 / func_int_9))), 0).x > 0.5);
+        bool eq_58 = bitwise_and_47 == 0;
+        bool bit_xor_60 = match_50 != ((match_57 && ((((add_52 | 1) - 1) < surface_width) && eq_58)) && eq_59);
+        int func_clamp_61 = clamp(((mul_51 + (mod_45 ^ 1)) * 2), 0, sub_7);
+        int right_shift_62 = func_clamp_61 >> 1;
+        int divide_64 = right_shift_62 / surface_width;
+        int bitwise_and_65 = divide_64 & 1;
+        int mod_63 = right_shift_62 % surface_width;
+        int func_clamp_66 = clamp(func_clamp_61, 0, sub_7);
+        int func_clamp_67 = clamp((func_clamp_61 ^ 1), 0, sub_7);
+        bool match_68 = 
+            ((mod_63 & 1) == bitwise_and_65) ? (texelFetch(frame, ivec3((func_clamp_66 % func_int_9), mod_12, (mul_13 + (func_clamp_66 / func_int_9))), 0).x > 0.5) :
+            (texelFetch(frame, ivec3((func_clamp_67 % func_int_9), mod_12, (mul_13 + (func_clamp_67 / func_int_9))), 0).x > 0.5);
+        int mul_69 = divide_64 * surface_width;
+        int add_70 = mod_63 + 1;
+        int func_clamp_71 = clamp(((mul_69 + ((add_70 ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_72 = func_clamp_71 >> 1;
+        int func_clamp_73 = clamp(func_clamp_71, 0, sub_7);
+        int func_clamp_74 = clamp((func_clamp_71 ^ 1), 0, sub_7);
+        bool match_75 = 
+            (((right_shift_72 % surface_width) & 1) == ((right_shift_72 / surface_width) & 1)) ? (texelFetch(frame, ivec3((func_clamp_73 % func_int_9), mod_12, (mul_13 + (func_clamp_73 / func_int_9))), 0).x > 0.5) :
+            (texelFetch(frame, ivec3((func_clamp_74 % func_int_9), mod_12, (mul_13 + (func_clamp_74 / func_int_9))), 0).x > 0.5);
+        outColor = float((bit_xor_41 != (((bit_xor_60 != (((match_68 != ((match_75 && ((((add_70 | 1) - 1) < surface_width) && (bitwise_and_65 == 0))) && ((func_clamp_61 & 1) == 1))) && (((mod_45 | 1) < surface_width) && eq_58)) && eq_59)) && ((((add_42 | 1) - 1) < surface_height) && (bitwise_and_3 == 1))) && eq_24)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size', undefined, 'frame_layer']);
+
+let frameCyclePass1_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        int mul_2 = right_shift_1 * 5;
+        int sub_3 = right_shift_0 - mul_2;
+        int bitwise_and_4 = sub_3 & 1;
+        int bitwise_and_5 = right_shift_1 & 1;
+        bool match_6 = 
+            (bitwise_and_4 == bitwise_and_5) ? (texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((x ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_13 = (x & 1) == 1;
+        int sub_7 = int(frame_size.x) - 1;
+        int func_clamp_8 = clamp(((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_9 = func_clamp_8 >> 1;
+        int right_shift_10 = (right_shift_9 * 26215) >> 17;
+        bool match_11 = 
+            (((right_shift_9 - (right_shift_10 * 5)) & 1) == (right_shift_10 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_8, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_8 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_12 = bitwise_and_5 == 0;
+        bool bit_xor_14 = match_6 != ((match_11 && eq_12) && eq_13);
+        int func_clamp_15 = clamp(((mul_2 + (sub_3 ^ 1)) * 2), 0, sub_7);
+        int right_shift_16 = func_clamp_15 >> 1;
+        int right_shift_17 = (right_shift_16 * 26215) >> 17;
+        int bitwise_and_20 = right_shift_17 & 1;
+        int mul_18 = right_shift_17 * 5;
+        int sub_19 = right_shift_16 - mul_18;
+        bool match_21 = 
+            ((sub_19 & 1) == bitwise_and_20) ? (texelFetch(frame, clamp(ivec2(func_clamp_15, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_15 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        int func_clamp_22 = clamp(((mul_18 + (((sub_19 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_23 = func_clamp_22 >> 1;
+        int right_shift_24 = (right_shift_23 * 26215) >> 17;
+        bool match_25 = 
+            (((right_shift_23 - (right_shift_24 * 5)) & 1) == (right_shift_24 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_22, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_22 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool bit_xor_26 = bit_xor_14 != (((match_21 != ((match_25 && (bitwise_and_20 == 0)) && ((func_clamp_15 & 1) == 1))) && (((sub_3 | 1) < 5) && eq_12)) && eq_13);
+        int add_27 = right_shift_1 + 1;
+        int func_clamp_28 = clamp((((((add_27 ^ 1) - 1) * 5) + sub_3) * 2), 0, sub_7);
+        int right_shift_29 = func_clamp_28 >> 1;
+        int right_shift_30 = (right_shift_29 * 26215) >> 17;
+        int bitwise_and_33 = right_shift_30 & 1;
+        int mul_31 = right_shift_30 * 5;
+        int sub_32 = right_shift_29 - mul_31;
+        bool match_34 = 
+            ((sub_32 & 1) == bitwise_and_33) ? (texelFetch(frame, clamp(ivec2(func_clamp_28, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_28 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_40 = (func_clamp_28 & 1) == 1;
+        int func_clamp_35 = clamp(((mul_31 + (((sub_32 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_36 = func_clamp_35 >> 1;
+        int right_shift_37 = (right_shift_36 * 26215) >> 17;
+        bool match_38 = 
+            (((right_shift_36 - (right_shift_37 * 5)) & 1) == (right_shift_37 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_35, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_35 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_39 = bitwise_and_33 == 0;
+        bool bit_xor_41 = match_34 != ((match_38 && eq_39) && eq_40);
+        int func_clamp_42 = clamp(((mul_31 + (sub_32 ^ 1)) * 2), 0, sub_7);
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 26215) >> 17;
+        int bitwise_and_47 = right_shift_44 & 1;
+        int mul_45 = right_shift_44 * 5;
+        int sub_46 = right_shift_43 - mul_45;
+        bool match_48 = 
+            ((sub_46 & 1) == bitwise_and_47) ? (texelFetch(frame, clamp(ivec2(func_clamp_42, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_42 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        int func_clamp_49 = clamp(((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_50 = func_clamp_49 >> 1;
+        int right_shift_51 = (right_shift_50 * 26215) >> 17;
+        bool match_52 = 
+            (((right_shift_50 - (right_shift_51 * 5)) & 1) == (right_shift_51 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_49, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_49 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        outColor = float((bit_xor_26 != (((bit_xor_41 != (((match_48 != ((match_52 && (bitwise_and_47 == 0)) && ((func_clamp_42 & 1) == 1))) && (((sub_32 | 1) < 5) && eq_39)) && eq_40)) && ((((add_27 | 1) - 1) < 5) && (bitwise_and_4 == 1))) && eq_13)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass1_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        int mul_2 = right_shift_1 * 9;
+        int sub_3 = right_shift_0 - mul_2;
+        int bitwise_and_4 = sub_3 & 1;
+        int bitwise_and_5 = right_shift_1 & 1;
+        bool match_6 = 
+            (bitwise_and_4 == bitwise_and_5) ? (texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((x ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_13 = (x & 1) == 1;
+        int sub_7 = int(frame_size.x) - 1;
+        int func_clamp_8 = clamp(((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_9 = func_clamp_8 >> 1;
+        int right_shift_10 = (right_shift_9 * 3641) >> 15;
+        bool match_11 = 
+            (((right_shift_9 - (right_shift_10 * 9)) & 1) == (right_shift_10 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_8, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_8 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_12 = bitwise_and_5 == 0;
+        bool bit_xor_14 = match_6 != ((match_11 && eq_12) && eq_13);
+        int func_clamp_15 = clamp(((mul_2 + (sub_3 ^ 1)) * 2), 0, sub_7);
+        int right_shift_16 = func_clamp_15 >> 1;
+        int right_shift_17 = (right_shift_16 * 3641) >> 15;
+        int bitwise_and_20 = right_shift_17 & 1;
+        int mul_18 = right_shift_17 * 9;
+        int sub_19 = right_shift_16 - mul_18;
+        bool match_21 = 
+            ((sub_19 & 1) == bitwise_and_20) ? (texelFetch(frame, clamp(ivec2(func_clamp_15, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_15 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        int func_clamp_22 = clamp(((mul_18 + (((sub_19 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_23 = func_clamp_22 >> 1;
+        int right_shift_24 = (right_shift_23 * 3641) >> 15;
+        bool match_25 = 
+            (((right_shift_23 - (right_shift_24 * 9)) & 1) == (right_shift_24 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_22, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_22 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool bit_xor_26 = bit_xor_14 != (((match_21 != ((match_25 && (bitwise_and_20 == 0)) && ((func_clamp_15 & 1) == 1))) && (((sub_3 | 1) < 9) && eq_12)) && eq_13);
+        int add_27 = right_shift_1 + 1;
+        int func_clamp_28 = clamp((((((add_27 ^ 1) - 1) * 9) + sub_3) * 2), 0, sub_7);
+        int right_shift_29 = func_clamp_28 >> 1;
+        int right_shift_30 = (right_shift_29 * 3641) >> 15;
+        int bitwise_and_33 = right_shift_30 & 1;
+        int mul_31 = right_shift_30 * 9;
+        int sub_32 = right_shift_29 - mul_31;
+        bool match_34 = 
+            ((sub_32 & 1) == bitwise_and_33) ? (texelFetch(frame, clamp(ivec2(func_clamp_28, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_28 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_40 = (func_clamp_28 & 1) == 1;
+        int func_clamp_35 = clamp(((mul_31 + (((sub_32 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_36 = func_clamp_35 >> 1;
+        int right_shift_37 = (right_shift_36 * 3641) >> 15;
+        bool match_38 = 
+            (((right_shift_36 - (right_shift_37 * 9)) & 1) == (right_shift_37 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_35, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_35 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_39 = bitwise_and_33 == 0;
+        bool bit_xor_41 = match_34 != ((match_38 && eq_39) && eq_40);
+        int func_clamp_42 = clamp(((mul_31 + (sub_32 ^ 1)) * 2), 0, sub_7);
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 3641) >> 15;
+        int bitwise_and_47 = right_shift_44 & 1;
+        int mul_45 = right_shift_44 * 9;
+        int sub_46 = right_shift_43 - mul_45;
+        bool match_48 = 
+            ((sub_46 & 1) == bitwise_and_47) ? (texelFetch(frame, clamp(ivec2(func_clamp_42, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_42 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        int func_clamp_49 = clamp(((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_50 = func_clamp_49 >> 1;
+        int right_shift_51 = (right_shift_50 * 3641) >> 15;
+        bool match_52 = 
+            (((right_shift_50 - (right_shift_51 * 9)) & 1) == (right_shift_51 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_49, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_49 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        outColor = float((bit_xor_26 != (((bit_xor_41 != (((match_48 != ((match_52 && (bitwise_and_47 == 0)) && ((func_clamp_42 & 1) == 1))) && (((sub_32 | 1) < 9) && eq_39)) && eq_40)) && ((((add_27 | 1) - 1) < 9) && (bitwise_and_4 == 1))) && eq_13)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass1_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        int mul_2 = right_shift_1 * 13;
+        int sub_3 = right_shift_0 - mul_2;
+        int bitwise_and_4 = sub_3 & 1;
+        int bitwise_and_5 = right_shift_1 & 1;
+        bool match_6 = 
+            (bitwise_and_4 == bitwise_and_5) ? (texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((x ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_13 = (x & 1) == 1;
+        int sub_7 = int(frame_size.x) - 1;
+        int func_clamp_8 = clamp(((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_9 = func_clamp_8 >> 1;
+        int right_shift_10 = (right_shift_9 * 20165) >> 18;
+        bool match_11 = 
+            (((right_shift_9 - (right_shift_10 * 13)) & 1) == (right_shift_10 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_8, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_8 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_12 = bitwise_and_5 == 0;
+        bool bit_xor_14 = match_6 != ((match_11 && eq_12) && eq_13);
+        int func_clamp_15 = clamp(((mul_2 + (sub_3 ^ 1)) * 2), 0, sub_7);
+        int right_shift_16 = func_clamp_15 >> 1;
+        int right_shift_17 = (right_shift_16 * 20165) >> 18;
+        int bitwise_and_20 = right_shift_17 & 1;
+        int mul_18 = right_shift_17 * 13;
+        int sub_19 = right_shift_16 - mul_18;
+        bool match_21 = 
+            ((sub_19 & 1) == bitwise_and_20) ? (texelFetch(frame, clamp(ivec2(func_clamp_15, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_15 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        int func_clamp_22 = clamp(((mul_18 + (((sub_19 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_23 = func_clamp_22 >> 1;
+        int right_shift_24 = (right_shift_23 * 20165) >> 18;
+        bool match_25 = 
+            (((right_shift_23 - (right_shift_24 * 13)) & 1) == (right_shift_24 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_22, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_22 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool bit_xor_26 = bit_xor_14 != (((match_21 != ((match_25 && (bitwise_and_20 == 0)) && ((func_clamp_15 & 1) == 1))) && (((sub_3 | 1) < 13) && eq_12)) && eq_13);
+        int add_27 = right_shift_1 + 1;
+        int func_clamp_28 = clamp((((((add_27 ^ 1) - 1) * 13) + sub_3) * 2), 0, sub_7);
+        int right_shift_29 = func_clamp_28 >> 1;
+        int right_shift_30 = (right_shift_29 * 20165) >> 18;
+        int bitwise_and_33 = right_shift_30 & 1;
+        int mul_31 = right_shift_30 * 13;
+        int sub_32 = right_shift_29 - mul_31;
+        bool match_34 = 
+            ((sub_32 & 1) == bitwise_and_33) ? (texelFetch(frame, clamp(ivec2(func_clamp_28, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_28 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_40 = (func_clamp_28 & 1) == 1;
+        int func_clamp_35 = clamp(((mul_31 + (((sub_32 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_36 = func_clamp_35 >> 1;
+        int right_shift_37 = (right_shift_36 * 20165) >> 18;
+        bool match_38 = 
+            (((right_shift_36 - (right_shift_37 * 13)) & 1) == (right_shift_37 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_35, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_35 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        bool eq_39 = bitwise_and_33 == 0;
+        bool bit_xor_41 = match_34 != ((match_38 && eq_39) && eq_40);
+        int func_clamp_42 = clamp(((mul_31 + (sub_32 ^ 1)) * 2), 0, sub_7);
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 20165) >> 18;
+        int bitwise_and_47 = right_shift_44 & 1;
+        int mul_45 = right_shift_44 * 13;
+        int sub_46 = right_shift_43 - mul_45;
+        bool match_48 = 
+            ((sub_46 & 1) == bitwise_and_47) ? (texelFetch(frame, clamp(ivec2(func_clamp_42, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_42 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        int func_clamp_49 = clamp(((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2), 0, sub_7);
+        int right_shift_50 = func_clamp_49 >> 1;
+        int right_shift_51 = (right_shift_50 * 20165) >> 18;
+        bool match_52 = 
+            (((right_shift_50 - (right_shift_51 * 13)) & 1) == (right_shift_51 & 1)) ? (texelFetch(frame, clamp(ivec2(func_clamp_49, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) :
+            (texelFetch(frame, clamp(ivec2((func_clamp_49 ^ 1), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        outColor = float((bit_xor_26 != (((bit_xor_41 != (((match_48 != ((match_52 && (bitwise_and_47 == 0)) && ((func_clamp_42 & 1) == 1))) && (((sub_32 | 1) < 13) && eq_39)) && eq_40)) && ((((add_27 | 1) - 1) < 13) && (bitwise_and_4 == 1))) && eq_13)));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+registerLayered(frameCyclePass1, frameCyclePass1Layered);
+registerVariant(frameCyclePass1, {surface_height: 5, surface_width: 5}, frameCyclePass1_surface_height5_surface_width5);
+registerLayered(frameCyclePass1_surface_height5_surface_width5, frameCyclePass1Layered);
+registerVariant(frameCyclePass1, {surface_height: 9, surface_width: 9}, frameCyclePass1_surface_height9_surface_width9);
+registerLayered(frameCyclePass1_surface_height9_surface_width9, frameCyclePass1Layered);
+registerVariant(frameCyclePass1, {surface_height: 13, surface_width: 13}, frameCyclePass1_surface_height13_surface_width13);
+registerLayered(frameCyclePass1_surface_height13_surface_width13, frameCyclePass1Layered);
+
+let frameCyclePass2 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int surface_width;
+    uniform sampler2D frame;
+    uniform int surface_height;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        int mod_1 = right_shift_0 % surface_width;
+        int bitwise_and_2 = mod_1 & 1;
+        int divide_3 = right_shift_0 / surface_width;
+        bool match_9;
+        if ((bitwise_and_2 != (divide_3 & 1))) {
+            match_9 = ((texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) != (((texelFetch(frame, clamp(ivec2(((((divide_3 ^ 1) * surface_width) + mod_1) * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && (((divide_3 | 1) < surface_height) && (bitwise_and_2 == 1))) && ((x & 1) == 1)));
+        } else {
+            int func_clamp_4 = clamp((x ^ 1), 0, (int(frame_size.x) - 1));
+            bool slice_5 = texelFetch(frame, clamp(ivec2(func_clamp_4, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+            int right_shift_6 = func_clamp_4 >> 1;
+            int mod_8 = right_shift_6 % surface_width;
+            int divide_7 = right_shift_6 / surface_width;
+            match_9 = (slice_5 != (((texelFetch(frame, clamp(ivec2(((((divide_7 ^ 1) * surface_width) + mod_8) * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && (((divide_7 | 1) < surface_height) && ((mod_8 & 1) == 1))) && ((func_clamp_4 & 1) == 1)));
+        }
+        outColor = float(match_9);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass2Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform int surface_width;
+    uniform vec2 frame_size;
+    uniform vec2 frame_layer;
+    uniform highp sampler2DArray frame;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_5 = int(frame_size.x);
+        int sub_6 = func_int_5 - 1;
+        int func_clamp_9 = clamp((y + int(out_origin.y)), 0, (int(frame_size.y) - 1));
+        int func_int_10 = int(frame_layer.y);
+        int divide_12 = func_clamp_9 / func_int_10;
+        int func_int_8 = int(frame_layer.x);
+        int mul_13 = divide_12 * (((func_int_5 + func_int_8) - 1) / func_int_8);
+        int mod_11 = func_clamp_9 % func_int_10;
+        int add_0 = x + int(out_origin.x);
+        int right_shift_1 = add_0 >> 1;
+        int mod_2 = right_shift_1 % surface_width;
+        int bitwise_and_3 = mod_2 & 1;
+        int divide_4 = right_shift_1 / surface_width;
+        bool match_23;
+        if ((bitwise_and_3 != (divide_4 & 1))) {
+            int func_clamp_7 = clamp(add_0, 0, sub_6);
+            bool fetch_14 = texelFetch(frame, ivec3((func_clamp_7 % func_int_8), mod_11, (mul_13 + (func_clamp_7 / func_int_8))), 0).x > 0.5;
+            int func_clamp_15 = clamp(((((divide_4 ^ 1) * surface_width) + mod_2) * 2), 0, sub_6);
+            match_23 = (fetch_14 != (((texelFetch(frame, ivec3((func_clamp_15 % func_int_8), mod_11, (mul_13 + (func_clamp_15 / func_int_8))), 0).x > 0.5) && (((divide_4 | 1) < surface_height) && (bitwise_and_3 == 1))) && ((add_0 & 1) == 1)));
+        } else {
+            int func_clamp_16 = clamp((add_0 ^ 1), 0, sub_6);
+            int func_clamp_17 = clamp(func_clamp_16, 0, sub_6);
+            bool fetch_18 = texelFetch(frame, ivec3((func_clamp_17 % func_int_8), mod_11, (mul_13 + (func_clamp_17 / func_int_8))), 0).x > 0.5;
+            int right_shift_19 = func_clamp_16 >> 1;
+            int mod_21 = right_shift_19 % surface_width;
+            int divide_20 = right_shift_19 / surface_width;
+            int func_clamp_22 = clamp(((((divide_20 ^ 1) * surface_width) + mod_21) * 2), 0, sub_6);
+            match_23 = (fetch_18 != (((texelFetch(frame, ivec3((func_clamp_22 % func_int_8), mod_11, (mul_13 + (func_clamp_22 / func_int_8))), 0).x > 0.5) && (((divide_20 | 1) < surface_height) && ((mod_21 & 1) == 1))) && ((func_clamp_16 & 1) == 1)));
+        }
+        outColor = float(match_23);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size', undefined, 'frame_layer']);
+
+let frameCyclePass2_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        int sub_2 = right_shift_0 - (right_shift_1 * 5);
+        int bitwise_and_3 = sub_2 & 1;
+        bool match_9;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_9 = ((texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) != (((texelFetch(frame, clamp(ivec2(((((right_shift_1 ^ 1) * 5) + sub_2) * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && (((right_shift_1 | 1) < 5) && (bitwise_and_3 == 1))) && ((x & 1) == 1)));
+        } else {
+            int func_clamp_4 = clamp((x ^ 1), 0, (int(frame_size.x) - 1));
+            bool slice_5 = texelFetch(frame, clamp(ivec2(func_clamp_4, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+            int right_shift_6 = func_clamp_4 >> 1;
+            int right_shift_7 = (right_shift_6 * 26215) >> 17;
+            int sub_8 = right_shift_6 - (right_shift_7 * 5);
+            match_9 = (slice_5 != (((texelFetch(frame, clamp(ivec2(((((right_shift_7 ^ 1) * 5) + sub_8) * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && (((right_shift_7 | 1) < 5) && ((sub_8 & 1) == 1))) && ((func_clamp_4 & 1) == 1)));
+        }
+        outColor = float(match_9);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass2_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        int sub_2 = right_shift_0 - (right_shift_1 * 9);
+        int bitwise_and_3 = sub_2 & 1;
+        bool match_9;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_9 = ((texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) != (((texelFetch(frame, clamp(ivec2(((((right_shift_1 ^ 1) * 9) + sub_2) * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && (((right_shift_1 | 1) < 9) && (bitwise_and_3 == 1))) && ((x & 1) == 1)));
+        } else {
+            int func_clamp_4 = clamp((x ^ 1), 0, (int(frame_size.x) - 1));
+            bool slice_5 = texelFetch(frame, clamp(ivec2(func_clamp_4, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+            int right_shift_6 = func_clamp_4 >> 1;
+            int right_shift_7 = (right_shift_6 * 3641) >> 15;
+            int sub_8 = right_shift_6 - (right_shift_7 * 9);
+            match_9 = (slice_5 != (((texelFetch(frame, clamp(ivec2(((((right_shift_7 ^ 1) * 9) + sub_8) * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && (((right_shift_7 | 1) < 9) && ((sub_8 & 1) == 1))) && ((func_clamp_4 & 1) == 1)));
+        }
+        outColor = float(match_9);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+let frameCyclePass2_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    uniform vec2 frame_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        int sub_2 = right_shift_0 - (right_shift_1 * 13);
+        int bitwise_and_3 = sub_2 & 1;
+        bool match_9;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_9 = ((texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) != (((texelFetch(frame, clamp(ivec2(((((right_shift_1 ^ 1) * 13) + sub_2) * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && (((right_shift_1 | 1) < 13) && (bitwise_and_3 == 1))) && ((x & 1) == 1)));
+        } else {
+            int func_clamp_4 = clamp((x ^ 1), 0, (int(frame_size.x) - 1));
+            bool slice_5 = texelFetch(frame, clamp(ivec2(func_clamp_4, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5;
+            int right_shift_6 = func_clamp_4 >> 1;
+            int right_shift_7 = (right_shift_6 * 20165) >> 18;
+            int sub_8 = right_shift_6 - (right_shift_7 * 13);
+            match_9 = (slice_5 != (((texelFetch(frame, clamp(ivec2(((((right_shift_7 ^ 1) * 13) + sub_8) * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5) && (((right_shift_7 | 1) < 13) && ((sub_8 & 1) == 1))) && ((func_clamp_4 & 1) == 1)));
+        }
+        outColor = float(match_9);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'frame', 'frame_size']);
+
+registerLayered(frameCyclePass2, frameCyclePass2Layered);
+registerVariant(frameCyclePass2, {surface_height: 5, surface_width: 5}, frameCyclePass2_surface_height5_surface_width5);
+registerLayered(frameCyclePass2_surface_height5_surface_width5, frameCyclePass2Layered);
+registerVariant(frameCyclePass2, {surface_height: 9, surface_width: 9}, frameCyclePass2_surface_height9_surface_width9);
+registerLayered(frameCyclePass2_surface_height9_surface_width9, frameCyclePass2Layered);
+registerVariant(frameCyclePass2, {surface_height: 13, surface_width: 13}, frameCyclePass2_surface_height13_surface_width13);
+registerLayered(frameCyclePass2_surface_height13_surface_width13, frameCyclePass2Layered);
+
+function frameCycle(frame, surface_height, surface_width) {
+    pickVariant(frameCyclePass0, {surface_height, surface_width}).withArgs(surface_height, surface_width, frame).renderInto(frame);
+    pickVariant(frameCyclePass1, {surface_height, surface_width}).withArgs(surface_height, surface_width, frame).renderInto(frame);
+    pickVariant(frameCyclePass2, {surface_height, surface_width}).withArgs(surface_height, surface_width, frame).renderInto(frame);
+}
+
+export {frameCycle}
@@ -0,0 +1,43 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered} from 'src/sim/ShaderVariants.js'
+
+let frameMeasureRecord = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D frame;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        
+        outColor = float((texelFetch(frame, clamp(ivec2((x * 2), y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5));
+    }`,
+    ['tex', 'frame']);
+
+let frameMeasureRecordLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 frame_size;
+    uniform vec2 frame_layer;
+    uniform highp sampler2DArray frame;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = (x + int(out_origin.x)) * 2;
+        int func_int_1 = int(frame_size.x);
+        int func_clamp_2 = clamp(mul_0, 0, (func_int_1 - 1));
+        int func_int_3 = int(frame_layer.x);
+        int mod_4 = func_clamp_2 % func_int_3;
+        int func_clamp_5 = clamp((y + int(out_origin.y)), 0, (int(frame_size.y) - 1));
+        int func_int_6 = int(frame_layer.y);
+        outColor = float((texelFetch(frame, ivec3(mod_4, (func_clamp_5 % func_int_6), (((func_clamp_5 / func_int_6) * (((func_int_1 + func_int_3) - 1) / func_int_3)) + (func_clamp_2 / func_int_3))), 0).x > 0.5));
+    }`,
+    ['tex', 'frame', 'frame_size', undefined, 'frame_layer']);
+
+registerLayered(frameMeasureRecord, frameMeasureRecordLayered);
+
+export {frameMeasureRecord}
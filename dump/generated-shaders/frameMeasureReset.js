@@ -0,0 +1,105 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered} from 'src/sim/ShaderVariants.js'
+
+let frameMeasureReset = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D targets;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform sampler2D frame;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = x >> 1;
+        bool match_19;
+        if ((texelFetch(targets, clamp(ivec2(0, right_shift_0), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5)) {
+            bool eq_1 = (x & 1) == 1;
+            uint mul_2 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+            uint mul_3 = (mul_2 ^ (mul_2 >> 15)) * 2221713035u;
+            uint bitwise_xor_4 = (mul_3 ^ (mul_3 >> 16)) ^ rand_counter;
+            uint mul_5 = (bitwise_xor_4 ^ (bitwise_xor_4 >> 16)) * 2146121005u;
+            uint mul_6 = (mul_5 ^ (mul_5 >> 15)) * 2221713035u;
+            uint bitwise_xor_7 = mul_6 ^ (mul_6 >> 16);
+            uint mul_8 = (bitwise_xor_7 ^ (bitwise_xor_7 >> 16)) * 2146121005u;
+            uint mul_9 = (mul_8 ^ (mul_8 >> 15)) * 2221713035u;
+            uint bitwise_xor_10 = mul_9 ^ (mul_9 >> 16);
+            uint mul_11 = (bitwise_xor_10 ^ (bitwise_xor_10 >> 16)) * 2146121005u;
+            uint mul_12 = (mul_11 ^ (mul_11 >> 15)) * 2221713035u;
+            uint bitwise_xor_13 = (mul_12 ^ (mul_12 >> 16)) ^ uint(right_shift_0);
+            uint mul_14 = (bitwise_xor_13 ^ (bitwise_xor_13 >> 16)) * 2146121005u;
+            uint mul_15 = (mul_14 ^ (mul_14 >> 15)) * 2221713035u;
+            uint bitwise_xor_16 = (mul_15 ^ (mul_15 >> 16)) ^ uint(y);
+            uint mul_17 = (bitwise_xor_16 ^ (bitwise_xor_16 >> 16)) * 2146121005u;
+            uint mul_18 = (mul_17 ^ (mul_17 >> 15)) * 2221713035u;
+            match_19 = (eq_1 && (((mul_18 ^ (mul_18 >> 16)) >> 31) == 1u));
+        } else {
+            match_19 = (texelFetch(frame, clamp(ivec2(x, y), ivec2(0), textureSize(frame, 0) - 1), 0).x > 0.5);
+        }
+        outColor = float(match_19);
+    }`,
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'frame'],
+    ['tex', 'targets']);
+
+let frameMeasureResetLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform sampler2D targets;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform vec2 frame_size;
+    uniform vec2 frame_layer;
+    uniform highp sampler2DArray frame;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_17 = y + int(out_origin.y);
+        int add_0 = x + int(out_origin.x);
+        int right_shift_1 = add_0 >> 1;
+        bool match_27;
+        if ((texelFetch(targets, clamp(ivec2(0, right_shift_1), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5)) {
+            bool eq_2 = (add_0 & 1) == 1;
+            uint mul_3 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+            uint mul_4 = (mul_3 ^ (mul_3 >> 15)) * 2221713035u;
+            uint bitwise_xor_5 = (mul_4 ^ (mul_4 >> 16)) ^ rand_counter;
+            uint mul_6 = (bitwise_xor_5 ^ (bitwise_xor_5 >> 16)) * 2146121005u;
+            uint mul_7 = (mul_6 ^ (mul_6 >> 15)) * 2221713035u;
+            uint bitwise_xor_8 = mul_7 ^ (mul_7 >> 16);
+            uint mul_9 = (bitwise_xor_8 ^ (bitwise_xor_8 >> 16)) * 2146121005u;
+            uint mul_10 = (mul_9 ^ (mul_9 >> 15)) * 2221713035u;
+            uint bitwise_xor_11 = mul_10 ^ (mul_10 >> 16);
+            uint mul_12 = (bitwise_xor_11 ^ (bitwise_xor_11 >> 16)) * 2146121005u;
+            uint mul_13 = (mul_12 ^ (mul_12 >> 15)) * 2221713035u;
+            uint bitwise_xor_14 = (mul_13 ^ (mul_13 >> 16)) ^ uint(right_shift_1);
+            uint mul_15 = (bitwise_xor_14 ^ (bitwise_xor_14 >> 16)) * 2146121005u;
+            uint mul_16 = (mul_15 ^ (mul_15 >> 15)) * 2221713035u;
+            uint bitwise_xor_18 = (mul_16 ^ (mul_16 >> 16)) ^ uint(add_17);
+            uint mul_19 = (bitwise_xor_18 ^ (bitwise_xor_18 >> 16)) * 2146121005u;
+            uint mul_20 = (mul_19 ^ (mul_19 >> 15)) * 2221713035u;
+            match_27 = (eq_2 && (((mul_20 ^ (mul_20 >> 16)) >> 31) == 1u));
+        } else {
+            int func_int_21 = int(frame_size.x);
+            int func_clamp_22 = clamp(add_0, 0, (func_int_21 - 1));
+            int func_int_23 = int(frame_layer.x);
+            int mod_24 = func_clamp_22 % func_int_23;
+            int func_clamp_25 = clamp(add_17, 0, (int(frame_size.y) - 1));
+            int func_int_26 = int(frame_layer.y);
+            match_27 = (texelFetch(frame, ivec3(mod_24, (func_clamp_25 % func_int_26), (((func_clamp_25 / func_int_26) * (((func_int_21 + func_int_23) - 1) / func_int_23)) + (func_clamp_22 / func_int_23))), 0).x > 0.5);
+        }
+        outColor = float(match_27);
+    }`,
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'frame', 'frame_size', undefined, 'frame_layer'],
+    ['tex', 'targets']);
+
+registerLayered(frameMeasureReset, frameMeasureResetLayered);
+
+export {frameMeasureReset}
@@ -0,0 +1,75 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered} from 'src/sim/ShaderVariants.js'
+
+let gatherFrameRecord = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 record_size;
+    uniform sampler2D record;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = x * 32;
+        int func_int_1 = int(record_size.x);
+        uint reduce_9 = 0u;
+        for (int i_2 = 0; i_2 < 32; i_2++) {
+            int add_3 = mul_0 + i_2;
+            bool lt_4 = add_3 < func_int_1;
+            bool slice_5 = texelFetch(record, clamp(ivec2(add_3, y), ivec2(0), textureSize(record, 0) - 1), 0).x > 0.5;
+            bool bit_and_6 = lt_4 && slice_5;
+            uint match_7 = 
+            bit_and_6 ? 1u :
+            0u;
+            uint left_shift_8 = match_7 << i_2;
+            reduce_9 = reduce_9 | left_shift_8;
+        }
+        outColor = reduce_9;
+    }`,
+    ['tex', 'record', 'record_size']);
+
+let gatherFrameRecordLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 record_size;
+    uniform vec2 record_layer;
+    uniform highp sampler2DArray record;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = (x + int(out_origin.x)) * 32;
+        int func_int_1 = int(record_size.x);
+        int sub_2 = func_int_1 - 1;
+        int func_clamp_4 = clamp((y + int(out_origin.y)), 0, (int(record_size.y) - 1));
+        int func_int_5 = int(record_layer.y);
+        int divide_6 = func_clamp_4 / func_int_5;
+        int func_int_3 = int(record_layer.x);
+        int mul_7 = divide_6 * (((func_int_1 + func_int_3) - 1) / func_int_3);
+        int mod_8 = func_clamp_4 % func_int_5;
+        uint reduce_20 = 0u;
+        for (int i_9 = 0; i_9 < 32; i_9++) {
+            int add_10 = mul_0 + i_9;
+            bool lt_11 = add_10 < func_int_1;
+            int func_clamp_12 = clamp(add_10, 0, sub_2);
+            int mod_13 = func_clamp_12 % func_int_3;
+            int divide_14 = func_clamp_12 / func_int_3;
+            int add_15 = mul_7 + divide_14;
+            bool fetch_16 = texelFetch(record, ivec3(mod_13, mod_8, add_15), 0).x > 0.5;
+            bool bit_and_17 = lt_11 && fetch_16;
+            uint match_18 = 
+            bit_and_17 ? 1u :
+            0u;
+            uint left_shift_19 = match_18 << i_9;
+            reduce_20 = reduce_20 | left_shift_19;
+        }
+        outColor = reduce_20;
+    }`,
+    ['tex', 'record', 'record_size', undefined, 'record_layer']);
+
+registerLayered(gatherFrameRecord, gatherFrameRecordLayered);
+
+export {gatherFrameRecord}
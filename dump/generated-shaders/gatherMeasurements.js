@@ -0,0 +1,140 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let gatherMeasurements = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D targets;
+    uniform sampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.x);
+        int mul_1 = (x % func_int_0) * 32;
+        int func_int_2 = int(state_tile.y);
+        int right_shift_3 = func_int_2 >> 1;
+        int sub_4 = func_int_2 - 1;
+        int mul_5 = (y / int(out_tile.y)) * func_int_2;
+        int mul_6 = (x / func_int_0) * int(state_tile.x);
+        uint reduce_20 = 0u;
+        for (int i_7 = 0; i_7 < 32; i_7++) {
+            int add_8 = mul_1 + i_7;
+            bool lt_9 = add_8 < right_shift_3;
+            bool slice_10 = texelFetch(targets, clamp(ivec2(0, add_8), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5;
+            int mul_11 = add_8 * 2;
+            int add_12 = mul_11 + 1;
+            int func_clamp_13 = clamp(add_12, 0, sub_4);
+            int add_14 = mul_5 + func_clamp_13;
+            bool slice_15 = texelFetch(state, ivec2(mul_6, add_14), 0).x > 0.5;
+            bool bit_and_16 = slice_10 && slice_15;
+            bool bit_and_17 = lt_9 && bit_and_16;
+            uint match_18 = 
+            bit_and_17 ? 1u :
+            0u;
+            uint left_shift_19 = match_18 << i_7;
+            reduce_20 = reduce_20 | left_shift_19;
+        }
+        outColor = reduce_20;
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile'],
+    ['tex', 'targets']);
+
+let gatherMeasurementsLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform sampler2D targets;
+    uniform highp sampler2DArray state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_2 = (add_0 % func_int_1) * 32;
+        int func_int_3 = int(state_tile.y);
+        int right_shift_4 = func_int_3 >> 1;
+        int sub_5 = func_int_3 - 1;
+        int mul_6 = ((y + int(out_origin.y)) / int(out_tile.y)) * func_int_3;
+        int sub_7 = int(state_size.y) - 1;
+        int func_int_8 = int(state_layer.y);
+        int func_int_9 = int(state_size.x);
+        int func_int_10 = int(state_layer.x);
+        int divide_11 = ((func_int_9 + func_int_10) - 1) / func_int_10;
+        int func_clamp_12 = clamp(((add_0 / func_int_1) * int(state_tile.x)), 0, (func_int_9 - 1));
+        int divide_13 = func_clamp_12 / func_int_10;
+        int mod_14 = func_clamp_12 % func_int_10;
+        uint reduce_33 = 0u;
+        for (int i_15 = 0; i_15 < 32; i_15++) {
+            int add_16 = mul_2 + i_15;
+            bool lt_17 = add_16 < right_shift_4;
+            bool slice_18 = texelFetch(targets, clamp(ivec2(0, add_16), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5;
+            int mul_19 = add_16 * 2;
+            int add_20 = mul_19 + 1;
+            int func_clamp_21 = clamp(add_20, 0, sub_5);
+            int add_22 = mul_6 + func_clamp_21;
+            int func_clamp_23 = clamp(add_22, 0, sub_7);
+            int mod_24 = func_clamp_23 % func_int_8;
+            int divide_25 = func_clamp_23 / func_int_8;
+            int mul_26 = divide_25 * divide_11;
+            int add_27 = mul_26 + divide_13;
+            bool fetch_28 = texelFetch(state, ivec3(mod_14, mod_24, add_27), 0).x > 0.5;
+            bool bit_and_29 = slice_18 && fetch_28;
+            bool bit_and_30 = lt_17 && bit_and_29;
+            uint match_31 = 
+            bit_and_30 ? 1u :
+            0u;
+            uint left_shift_32 = match_31 << i_15;
+            reduce_33 = reduce_33 | left_shift_32;
+        }
+        outColor = reduce_33;
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer'],
+    ['tex', 'targets']);
+
+let gatherMeasurementsSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 state_size;
+    uniform sampler2D targets;
+    uniform sampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = x * 32;
+        int right_shift_1 = int(state_size.y) >> 1;
+        uint reduce_13 = 0u;
+        for (int i_2 = 0; i_2 < 32; i_2++) {
+            int add_3 = mul_0 + i_2;
+            bool lt_4 = add_3 < right_shift_1;
+            bool slice_5 = texelFetch(targets, clamp(ivec2(0, add_3), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5;
+            int mul_6 = add_3 * 2;
+            int add_7 = mul_6 + 1;
+            bool slice_8 = texelFetch(state, clamp(ivec2(0, add_7), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            bool bit_and_9 = slice_5 && slice_8;
+            bool bit_and_10 = lt_4 && bit_and_9;
+            uint match_11 = 
+            bit_and_10 ? 1u :
+            0u;
+            uint left_shift_12 = match_11 << i_2;
+            reduce_13 = reduce_13 | left_shift_12;
+        }
+        outColor = reduce_13;
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile'],
+    ['tex', 'targets']);
+
+registerLayered(gatherMeasurements, gatherMeasurementsLayered);
+registerSingleShot(gatherMeasurements, gatherMeasurementsSingleShot);
+
+export {gatherMeasurements}
@@ -1,29 +1,145 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
 
 let hadamardAll = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.x);
+        int mod_1 = x % func_int_0;
+        int func_int_2 = int(out_tile.y);
+        int mod_3 = y % func_int_2;
+        int func_int_4 = int(state_tile.x);
+        int add_5 = ((x / func_int_0) * func_int_4) + clamp(mod_1, 0, (func_int_4 - 1));
+        int func_int_6 = int(state_tile.y);
+        int mul_7 = (y / func_int_2) * func_int_6;
+        int sub_8 = func_int_6 - 1;
+        bool match_9 = 
+            ((mod_1 == 0) && ((mod_3 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_5, (mul_7 + clamp(mod_3, 0, sub_8))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_5, (mul_7 + clamp((mod_3 ^ 1), 0, sub_8))), 0).x > 0.5);
+        outColor = float(match_9);
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardAllLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mod_2 = add_0 % func_int_1;
+        int add_3 = y + int(out_origin.y);
+        int func_int_4 = int(out_tile.y);
+        int mod_5 = add_3 % func_int_4;
+        int func_int_6 = int(state_tile.x);
+        int add_7 = ((add_0 / func_int_1) * func_int_6) + clamp(mod_2, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_size.x);
+        int func_clamp_9 = clamp(add_7, 0, (func_int_8 - 1));
+        int func_int_10 = int(state_layer.x);
+        int mod_11 = func_clamp_9 % func_int_10;
+        int sub_15 = int(state_size.y) - 1;
+        int func_int_12 = int(state_tile.y);
+        int mul_13 = (add_3 / func_int_4) * func_int_12;
+        int sub_14 = func_int_12 - 1;
+        int func_clamp_16 = clamp((mul_13 + clamp(mod_5, 0, sub_14)), 0, sub_15);
+        int func_int_17 = int(state_layer.y);
+        int divide_19 = func_clamp_9 / func_int_10;
+        int divide_18 = ((func_int_8 + func_int_10) - 1) / func_int_10;
+        int func_clamp_20 = clamp((mul_13 + clamp((mod_5 ^ 1), 0, sub_14)), 0, sub_15);
+        bool match_21 = 
+            ((mod_2 == 0) && ((mod_5 & 1) == 0)) ? (!(texelFetch(state, ivec3(mod_11, (func_clamp_16 % func_int_17), (((func_clamp_16 / func_int_17) * divide_18) + divide_19)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_11, (func_clamp_20 % func_int_17), (((func_clamp_20 / func_int_17) * divide_18) + divide_19)), 0).x > 0.5);
+        outColor = float(match_21);
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let hadamardAllSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     uniform sampler2D state;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        bool eq_8 = x == 0;
-        int bitwise_and_9 = y & 1;
-        bool eq_10 = bitwise_and_9 == 0;
-        bool bit_and_11 = eq_8 && eq_10;
-        bool v_state = (texture(state, gl_FragCoord.xy / state_size)).x > 0.5;
-        bool not_12 = !v_state;
-        int bitwise_xor_13 = y ^ 1;
-        bool slice_14 = (texture(state, vec2(gl_FragCoord.x, float(bitwise_xor_13) + 0.5) / state_size)).x > 0.5;
-        bool match_15 = 
-            bit_and_11 ? not_12 :
-            slice_14;
-        outColor = float(match_15);
+        bool match_0 = 
+            ((x == 0) && ((y & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float(match_0);
     }`,
-    ['tex', 'state', 'state_size']);
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardAll_out_tile27x50_state_tile27x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        bool match_2 = 
+            (((x - (int(((float(x) + 0.5) * 0.03703703731298447)) * 27)) == 0) && ((sub_1 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, y), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x > 0.5);
+        outColor = float(match_2);
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardAll_out_tile83x162_state_tile83x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        bool match_2 = 
+            (((x - (((x * 25267) >> 21) * 83)) == 0) && ((sub_1 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, y), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x > 0.5);
+        outColor = float(match_2);
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardAll_out_tile171x338_state_tile171x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        bool match_2 = 
+            (((x - (int(((float(x) + 0.5) * 0.005847953259944916)) * 171)) == 0) && ((sub_1 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, y), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x > 0.5);
+        outColor = float(match_2);
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(hadamardAll, hadamardAllLayered);
+registerSingleShot(hadamardAll, hadamardAllSingleShot);
+registerVariant(hadamardAll, {out_tile: [27, 50], state_tile: [27, 50]}, hadamardAll_out_tile27x50_state_tile27x50);
+registerVariant(hadamardAll, {out_tile: [83, 162], state_tile: [83, 162]}, hadamardAll_out_tile83x162_state_tile83x162);
+registerVariant(hadamardAll, {out_tile: [171, 338], state_tile: [171, 338]}, hadamardAll_out_tile171x338_state_tile171x338);
 
-export {hadamardAll}
\ No newline at end of file
+export {hadamardAll}
@@ -0,0 +1,155 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
+
+let hadamardAllPacked = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int sub_9 = func_int_6 - 1;
+        int mod_8 = y % func_int_5;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((mod_8 ^ 1), 0, sub_9))), 0).x;
+        uint match_11 = 
+            ((mod_3 == 0) && ((mod_8 & 1) == 0)) ? 1u :
+            0u;
+        outColor = ((slice_10 & (~match_11)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x)) & match_11));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardAllPackedLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp usampler2DArray state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(state_size.x);
+        int func_clamp_7 = clamp(add_5, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_layer.x);
+        int mod_9 = func_clamp_7 % func_int_8;
+        int sub_16 = int(state_size.y) - 1;
+        int func_int_12 = int(state_tile.y);
+        int add_10 = y + int(out_origin.y);
+        int func_int_11 = int(out_tile.y);
+        int mul_13 = (add_10 / func_int_11) * func_int_12;
+        int sub_15 = func_int_12 - 1;
+        int mod_14 = add_10 % func_int_11;
+        int func_clamp_17 = clamp((mul_13 + clamp((mod_14 ^ 1), 0, sub_15)), 0, sub_16);
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int divide_21 = func_clamp_7 / func_int_8;
+        int divide_20 = ((func_int_6 + func_int_8) - 1) / func_int_8;
+        uint fetch_22 = texelFetch(state, ivec3(mod_9, mod_19, (((func_clamp_17 / func_int_18) * divide_20) + divide_21)), 0).x;
+        uint match_23 = 
+            ((mod_4 == 0) && ((mod_14 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_and_24 = fetch_22 & (~match_23);
+        int func_clamp_25 = clamp((mul_13 + clamp(mod_14, 0, sub_15)), 0, sub_16);
+        outColor = (bitwise_and_24 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_25 % func_int_18), (((func_clamp_25 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_23));
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let hadamardAllPackedSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint slice_0 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_1 = 
+            ((x == 0) && ((y & 1) == 0)) ? 1u :
+            0u;
+        outColor = ((slice_0 & (~match_1)) | ((~(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_1));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardAllPacked_out_tile1x50_state_tile1x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        uint slice_2 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+        uint match_3 = 
+            ((sub_1 & 1) == 0) ? 1u :
+            0u;
+        outColor = ((slice_2 & (~match_3)) | ((~(texelFetch(state, ivec2(x, y), 0).x)) & match_3));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardAllPacked_out_tile3x162_state_tile3x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        uint slice_2 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+        uint match_3 = 
+            (((x - (int(((float(x) + 0.5) * 0.3333333432674408)) * 3)) == 0) && ((sub_1 & 1) == 0)) ? 1u :
+            0u;
+        outColor = ((slice_2 & (~match_3)) | ((~(texelFetch(state, ivec2(x, y), 0).x)) & match_3));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardAllPacked_out_tile6x338_state_tile6x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        uint slice_2 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+        uint match_3 = 
+            (((x - (int(((float(x) + 0.5) * 0.1666666716337204)) * 6)) == 0) && ((sub_1 & 1) == 0)) ? 1u :
+            0u;
+        outColor = ((slice_2 & (~match_3)) | ((~(texelFetch(state, ivec2(x, y), 0).x)) & match_3));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(hadamardAllPacked, hadamardAllPackedLayered);
+registerSingleShot(hadamardAllPacked, hadamardAllPackedSingleShot);
+registerVariant(hadamardAllPacked, {out_tile: [1, 50], state_tile: [1, 50]}, hadamardAllPacked_out_tile1x50_state_tile1x50);
+registerVariant(hadamardAllPacked, {out_tile: [3, 162], state_tile: [3, 162]}, hadamardAllPacked_out_tile3x162_state_tile3x162);
+registerVariant(hadamardAllPacked, {out_tile: [6, 338], state_tile: [6, 338]}, hadamardAllPacked_out_tile6x338_state_tile6x338);
+
+export {hadamardAllPacked}
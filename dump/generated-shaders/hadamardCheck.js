@@ -1,38 +1,338 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
 
 let hadamardCheck = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
     uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.y);
+        int mod_1 = y % func_int_0;
+        int right_shift_2 = mod_1 >> 1;
+        int func_int_3 = int(out_tile.x);
+        int mod_5 = x % func_int_3;
+        int func_int_4 = int(state_tile.x);
+        int add_6 = ((x / func_int_3) * func_int_4) + clamp(mod_5, 0, (func_int_4 - 1));
+        int func_int_7 = int(state_tile.y);
+        int mul_8 = (y / func_int_0) * func_int_7;
+        int sub_9 = func_int_7 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_6, (mul_8 + clamp(mod_1, 0, sub_9))), 0).x > 0.5;
+        bool match_11 = 
+            (((right_shift_2 % surface_width) & 1) != ((right_shift_2 / surface_width) & 1)) ? slice_10 :
+            ((mod_5 == 0) && ((mod_1 & 1) == 0)) ? (!slice_10) :
+            (texelFetch(state, ivec2(add_6, (mul_8 + clamp((mod_1 ^ 1), 0, sub_9))), 0).x > 0.5);
+        outColor = float(match_11);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheckLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mod_2 = add_0 % func_int_1;
+        int right_shift_3 = mod_2 >> 1;
+        int add_4 = x + int(out_origin.x);
+        int func_int_5 = int(out_tile.x);
+        int mod_7 = add_4 % func_int_5;
+        int func_int_6 = int(state_tile.x);
+        int add_8 = ((add_4 / func_int_5) * func_int_6) + clamp(mod_7, 0, (func_int_6 - 1));
+        int func_int_9 = int(state_size.x);
+        int func_clamp_10 = clamp(add_8, 0, (func_int_9 - 1));
+        int func_int_11 = int(state_layer.x);
+        int mod_12 = func_clamp_10 % func_int_11;
+        int sub_16 = int(state_size.y) - 1;
+        int func_int_13 = int(state_tile.y);
+        int mul_14 = (add_0 / func_int_1) * func_int_13;
+        int sub_15 = func_int_13 - 1;
+        int func_clamp_17 = clamp((mul_14 + clamp(mod_2, 0, sub_15)), 0, sub_16);
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int divide_21 = func_clamp_10 / func_int_11;
+        int divide_20 = ((func_int_9 + func_int_11) - 1) / func_int_11;
+        bool fetch_22 = texelFetch(state, ivec3(mod_12, mod_19, (((func_clamp_17 / func_int_18) * divide_20) + divide_21)), 0).x > 0.5;
+        int func_clamp_23 = clamp((mul_14 + clamp((mod_2 ^ 1), 0, sub_15)), 0, sub_16);
+        bool match_24 = 
+            (((right_shift_3 % surface_width) & 1) != ((right_shift_3 / surface_width) & 1)) ? fetch_22 :
+            ((mod_7 == 0) && ((mod_2 & 1) == 0)) ? (!fetch_22) :
+            (texelFetch(state, ivec3(mod_12, (func_clamp_23 % func_int_18), (((func_clamp_23 / func_int_18) * divide_20) + divide_21)), 0).x > 0.5);
+        outColor = float(match_24);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let hadamardCheckSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int surface_width;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = y >> 1;
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool match_1 = 
+            (((right_shift_0 % surface_width) & 1) != ((right_shift_0 / surface_width) & 1)) ? v_state :
+            ((x == 0) && ((y & 1) == 0)) ? (!v_state) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float(match_1);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.y);
+        int mod_1 = y % func_int_0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 26215) >> 17;
+        int func_int_4 = int(out_tile.x);
+        int mod_6 = x % func_int_4;
+        int func_int_5 = int(state_tile.x);
+        int add_7 = ((x / func_int_4) * func_int_5) + clamp(mod_6, 0, (func_int_5 - 1));
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = (y / func_int_0) * func_int_8;
+        int sub_10 = func_int_8 - 1;
+        bool slice_11 = texelFetch(state, ivec2(add_7, (mul_9 + clamp(mod_1, 0, sub_10))), 0).x > 0.5;
+        bool match_12 = 
+            (((right_shift_2 - (right_shift_3 * 5)) & 1) != (right_shift_3 & 1)) ? slice_11 :
+            ((mod_6 == 0) && ((mod_1 & 1) == 0)) ? (!slice_11) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((mod_1 ^ 1), 0, sub_10))), 0).x > 0.5);
+        outColor = float(match_12);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool match_2 = 
+            (((right_shift_0 - (right_shift_1 * 5)) & 1) != (right_shift_1 & 1)) ? v_state :
+            ((x == 0) && ((y & 1) == 0)) ? (!v_state) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float(match_2);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width5_out_tile27x50_state_tile27x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        bool match_4 = 
+            (((right_shift_2 - (right_shift_3 * 5)) & 1) != (right_shift_3 & 1)) ? v_state :
+            (((x - (int(((float(x) + 0.5) * 0.03703703731298447)) * 27)) == 0) && ((sub_1 & 1) == 0)) ? (!v_state) :
+            (texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x > 0.5);
+        outColor = float(match_4);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.y);
+        int mod_1 = y % func_int_0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 3641) >> 15;
+        int func_int_4 = int(out_tile.x);
+        int mod_6 = x % func_int_4;
+        int func_int_5 = int(state_tile.x);
+        int add_7 = ((x / func_int_4) * func_int_5) + clamp(mod_6, 0, (func_int_5 - 1));
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = (y / func_int_0) * func_int_8;
+        int sub_10 = func_int_8 - 1;
+        bool slice_11 = texelFetch(state, ivec2(add_7, (mul_9 + clamp(mod_1, 0, sub_10))), 0).x > 0.5;
+        bool match_12 = 
+            (((right_shift_2 - (right_shift_3 * 9)) & 1) != (right_shift_3 & 1)) ? slice_11 :
+            ((mod_6 == 0) && ((mod_1 & 1) == 0)) ? (!slice_11) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((mod_1 ^ 1), 0, sub_10))), 0).x > 0.5);
+        outColor = float(match_12);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     uniform sampler2D state;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
         int right_shift_0 = y >> 1;
-        int mod_1 = right_shift_0 % surface_width;
-        int bitwise_and_6 = mod_1 & 1;
-        int divide_2 = right_shift_0 / surface_width;
-        int bitwise_and_7 = divide_2 & 1;
-        bool ne_8 = bitwise_and_6 != bitwise_and_7;
-        bool v_state = (texture(state, gl_FragCoord.xy / state_size)).x > 0.5;
-        bool eq_9 = x == 0;
-        int bitwise_and_10 = y & 1;
-        bool eq_11 = bitwise_and_10 == 0;
-        bool bit_and_12 = eq_9 && eq_11;
-        bool not_13 = !v_state;
-        int bitwise_xor_14 = y ^ 1;
-        bool slice_15 = (texture(state, vec2(gl_FragCoord.x, float(bitwise_xor_14) + 0.5) / state_size)).x > 0.5;
-        bool match_16 = 
-            ne_8 ? v_state :
-            bit_and_12 ? not_13 :
-            slice_15;
-        outColor = float(match_16);
-    }`,
-    ['1i', 'surface_width', false],
-    ['tex', 'state', 'state_size']);
-
-export {hadamardCheck}
\ No newline at end of file
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool match_2 = 
+            (((right_shift_0 - (right_shift_1 * 9)) & 1) != (right_shift_1 & 1)) ? v_state :
+            ((x == 0) && ((y & 1) == 0)) ? (!v_state) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float(match_2);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width9_out_tile83x162_state_tile83x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        bool match_4 = 
+            (((right_shift_2 - (right_shift_3 * 9)) & 1) != (right_shift_3 & 1)) ? v_state :
+            (((x - (((x * 25267) >> 21) * 83)) == 0) && ((sub_1 & 1) == 0)) ? (!v_state) :
+            (texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x > 0.5);
+        outColor = float(match_4);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.y);
+        int mod_1 = y % func_int_0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 20165) >> 18;
+        int func_int_4 = int(out_tile.x);
+        int mod_6 = x % func_int_4;
+        int func_int_5 = int(state_tile.x);
+        int add_7 = ((x / func_int_4) * func_int_5) + clamp(mod_6, 0, (func_int_5 - 1));
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = (y / func_int_0) * func_int_8;
+        int sub_10 = func_int_8 - 1;
+        bool slice_11 = texelFetch(state, ivec2(add_7, (mul_9 + clamp(mod_1, 0, sub_10))), 0).x > 0.5;
+        bool match_12 = 
+            (((right_shift_2 - (right_shift_3 * 13)) & 1) != (right_shift_3 & 1)) ? slice_11 :
+            ((mod_6 == 0) && ((mod_1 & 1) == 0)) ? (!slice_11) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((mod_1 ^ 1), 0, sub_10))), 0).x > 0.5);
+        outColor = float(match_12);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool match_2 = 
+            (((right_shift_0 - (right_shift_1 * 13)) & 1) != (right_shift_1 & 1)) ? v_state :
+            ((x == 0) && ((y & 1) == 0)) ? (!v_state) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float(match_2);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardCheck_surface_width13_out_tile171x338_state_tile171x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        bool match_4 = 
+            (((right_shift_2 - (right_shift_3 * 13)) & 1) != (right_shift_3 & 1)) ? v_state :
+            (((x - (int(((float(x) + 0.5) * 0.005847953259944916)) * 171)) == 0) && ((sub_1 & 1) == 0)) ? (!v_state) :
+            (texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x > 0.5);
+        outColor = float(match_4);
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(hadamardCheck, hadamardCheckLayered);
+registerSingleShot(hadamardCheck, hadamardCheckSingleShot);
+registerVariant(hadamardCheck, {surface_width: 5}, hadamardCheck_surface_width5);
+registerLayered(hadamardCheck_surface_width5, hadamardCheckLayered);
+registerSingleShot(hadamardCheck_surface_width5, hadamardCheck_surface_width5SingleShot);
+registerVariant(hadamardCheck_surface_width5, {out_tile: [27, 50], state_tile: [27, 50]}, hadamardCheck_surface_width5_out_tile27x50_state_tile27x50);
+registerVariant(hadamardCheck, {surface_width: 9}, hadamardCheck_surface_width9);
+registerLayered(hadamardCheck_surface_width9, hadamardCheckLayered);
+registerSingleShot(hadamardCheck_surface_width9, hadamardCheck_surface_width9SingleShot);
+registerVariant(hadamardCheck_surface_width9, {out_tile: [83, 162], state_tile: [83, 162]}, hadamardCheck_surface_width9_out_tile83x162_state_tile83x162);
+registerVariant(hadamardCheck, {surface_width: 13}, hadamardCheck_surface_width13);
+registerLayered(hadamardCheck_surface_width13, hadamardCheckLayered);
+registerSingleShot(hadamardCheck_surface_width13, hadamardCheck_surface_width13SingleShot);
+registerVariant(hadamardCheck_surface_width13, {out_tile: [171, 338], state_tile: [171, 338]}, hadamardCheck_surface_width13_out_tile171x338_state_tile171x338);
+
+export {hadamardCheck}
@@ -0,0 +1,415 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
+
+let hadamardDataPacked = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_4 = int(state_tile.x);
+        int func_int_3 = int(out_tile.x);
+        int mul_5 = (x / func_int_3) * func_int_4;
+        int mod_6 = x % func_int_3;
+        int add_7 = mul_5 + clamp(mod_6, 0, (func_int_4 - 1));
+        int func_int_8 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_9 = (y / func_int_0) * func_int_8;
+        int mod_1 = y % func_int_0;
+        int sub_10 = func_int_8 - 1;
+        uint slice_11 = texelFetch(state, ivec2(add_7, (mul_9 + clamp(mod_1, 0, sub_10))), 0).x;
+        int right_shift_2 = mod_1 >> 1;
+        uint match_14;
+        if ((((right_shift_2 % surface_width) & 1) == ((right_shift_2 / surface_width) & 1))) {
+            match_14 = slice_11;
+        } else {
+            uint slice_12 = texelFetch(state, ivec2(add_7, (mul_9 + clamp((mod_1 ^ 1), 0, sub_10))), 0).x;
+            uint match_13 = 
+            ((mod_6 == 0) && ((mod_1 & 1) == 0)) ? 1u :
+            0u;
+            match_14 = ((slice_12 & (~match_13)) | ((~slice_11) & match_13));
+        }
+        outColor = match_14;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPackedLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp usampler2DArray state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_6 = int(state_tile.x);
+        int add_4 = x + int(out_origin.x);
+        int func_int_5 = int(out_tile.x);
+        int mul_7 = (add_4 / func_int_5) * func_int_6;
+        int mod_8 = add_4 % func_int_5;
+        int add_9 = mul_7 + clamp(mod_8, 0, (func_int_6 - 1));
+        int func_int_10 = int(state_size.x);
+        int func_clamp_11 = clamp(add_9, 0, (func_int_10 - 1));
+        int func_int_12 = int(state_layer.x);
+        int mod_13 = func_clamp_11 % func_int_12;
+        int sub_17 = int(state_size.y) - 1;
+        int func_int_14 = int(state_tile.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mul_15 = (add_0 / func_int_1) * func_int_14;
+        int mod_2 = add_0 % func_int_1;
+        int sub_16 = func_int_14 - 1;
+        int func_clamp_18 = clamp((mul_15 + clamp(mod_2, 0, sub_16)), 0, sub_17);
+        int func_int_19 = int(state_layer.y);
+        int mod_20 = func_clamp_18 % func_int_19;
+        int divide_22 = func_clamp_11 / func_int_12;
+        int divide_21 = ((func_int_10 + func_int_12) - 1) / func_int_12;
+        uint fetch_23 = texelFetch(state, ivec3(mod_13, mod_20, (((func_clamp_18 / func_int_19) * divide_21) + divide_22)), 0).x;
+        int right_shift_3 = mod_2 >> 1;
+        uint match_27;
+        if ((((right_shift_3 % surface_width) & 1) == ((right_shift_3 / surface_width) & 1))) {
+            match_27 = fetch_23;
+        } else {
+            int func_clamp_24 = clamp((mul_15 + clamp((mod_2 ^ 1), 0, sub_16)), 0, sub_17);
+            uint fetch_25 = texelFetch(state, ivec3(mod_13, (func_clamp_24 % func_int_19), (((func_clamp_24 / func_int_19) * divide_21) + divide_22)), 0).x;
+            uint match_26 = 
+            ((mod_8 == 0) && ((mod_2 & 1) == 0)) ? 1u :
+            0u;
+            match_27 = ((fetch_25 & (~match_26)) | ((~fetch_23) & match_26));
+        }
+        outColor = match_27;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let hadamardDataPackedSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int surface_width;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        int right_shift_0 = y >> 1;
+        uint match_3;
+        if ((((right_shift_0 % surface_width) & 1) == ((right_shift_0 / surface_width) & 1))) {
+            match_3 = v_state;
+        } else {
+            uint slice_1 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            uint match_2 = 
+            ((x == 0) && ((y & 1) == 0)) ? 1u :
+            0u;
+            match_3 = ((slice_1 & (~match_2)) | ((~v_state) & match_2));
+        }
+        outColor = match_3;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_5 = int(state_tile.x);
+        int func_int_4 = int(out_tile.x);
+        int mul_6 = (x / func_int_4) * func_int_5;
+        int mod_7 = x % func_int_4;
+        int add_8 = mul_6 + clamp(mod_7, 0, (func_int_5 - 1));
+        int func_int_9 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_10 = (y / func_int_0) * func_int_9;
+        int mod_1 = y % func_int_0;
+        int sub_11 = func_int_9 - 1;
+        uint slice_12 = texelFetch(state, ivec2(add_8, (mul_10 + clamp(mod_1, 0, sub_11))), 0).x;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 26215) >> 17;
+        uint match_15;
+        if ((((right_shift_2 - (right_shift_3 * 5)) & 1) == (right_shift_3 & 1))) {
+            match_15 = slice_12;
+        } else {
+            uint slice_13 = texelFetch(state, ivec2(add_8, (mul_10 + clamp((mod_1 ^ 1), 0, sub_11))), 0).x;
+            uint match_14 = 
+            ((mod_7 == 0) && ((mod_1 & 1) == 0)) ? 1u :
+            0u;
+            match_15 = ((slice_13 & (~match_14)) | ((~slice_12) & match_14));
+        }
+        outColor = match_15;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        uint match_4;
+        if ((((right_shift_0 - (right_shift_1 * 5)) & 1) == (right_shift_1 & 1))) {
+            match_4 = v_state;
+        } else {
+            uint slice_2 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            uint match_3 = 
+            ((x == 0) && ((y & 1) == 0)) ? 1u :
+            0u;
+            match_4 = ((slice_2 & (~match_3)) | ((~v_state) & match_3));
+        }
+        outColor = match_4;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width5_out_tile1x50_state_tile1x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        uint match_6;
+        if ((((right_shift_2 - (right_shift_3 * 5)) & 1) == (right_shift_3 & 1))) {
+            match_6 = v_state;
+        } else {
+            uint slice_4 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+            uint match_5 = 
+            ((sub_1 & 1) == 0) ? 1u :
+            0u;
+            match_6 = ((slice_4 & (~match_5)) | ((~v_state) & match_5));
+        }
+        outColor = match_6;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_5 = int(state_tile.x);
+        int func_int_4 = int(out_tile.x);
+        int mul_6 = (x / func_int_4) * func_int_5;
+        int mod_7 = x % func_int_4;
+        int add_8 = mul_6 + clamp(mod_7, 0, (func_int_5 - 1));
+        int func_int_9 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_10 = (y / func_int_0) * func_int_9;
+        int mod_1 = y % func_int_0;
+        int sub_11 = func_int_9 - 1;
+        uint slice_12 = texelFetch(state, ivec2(add_8, (mul_10 + clamp(mod_1, 0, sub_11))), 0).x;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 3641) >> 15;
+        uint match_15;
+        if ((((right_shift_2 - (right_shift_3 * 9)) & 1) == (right_shift_3 & 1))) {
+            match_15 = slice_12;
+        } else {
+            uint slice_13 = texelFetch(state, ivec2(add_8, (mul_10 + clamp((mod_1 ^ 1), 0, sub_11))), 0).x;
+            uint match_14 = 
+            ((mod_7 == 0) && ((mod_1 & 1) == 0)) ? 1u :
+            0u;
+            match_15 = ((slice_13 & (~match_14)) | ((~slice_12) & match_14));
+        }
+        outColor = match_15;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        uint match_4;
+        if ((((right_shift_0 - (right_shift_1 * 9)) & 1) == (right_shift_1 & 1))) {
+            match_4 = v_state;
+        } else {
+            uint slice_2 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            uint match_3 = 
+            ((x == 0) && ((y & 1) == 0)) ? 1u :
+            0u;
+            match_4 = ((slice_2 & (~match_3)) | ((~v_state) & match_3));
+        }
+        outColor = match_4;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width9_out_tile3x162_state_tile3x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        uint match_6;
+        if ((((right_shift_2 - (right_shift_3 * 9)) & 1) == (right_shift_3 & 1))) {
+            match_6 = v_state;
+        } else {
+            uint slice_4 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+            uint match_5 = 
+            (((x - (int(((float(x) + 0.5) * 0.3333333432674408)) * 3)) == 0) && ((sub_1 & 1) == 0)) ? 1u :
+            0u;
+            match_6 = ((slice_4 & (~match_5)) | ((~v_state) & match_5));
+        }
+        outColor = match_6;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_5 = int(state_tile.x);
+        int func_int_4 = int(out_tile.x);
+        int mul_6 = (x / func_int_4) * func_int_5;
+        int mod_7 = x % func_int_4;
+        int add_8 = mul_6 + clamp(mod_7, 0, (func_int_5 - 1));
+        int func_int_9 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_10 = (y / func_int_0) * func_int_9;
+        int mod_1 = y % func_int_0;
+        int sub_11 = func_int_9 - 1;
+        uint slice_12 = texelFetch(state, ivec2(add_8, (mul_10 + clamp(mod_1, 0, sub_11))), 0).x;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 20165) >> 18;
+        uint match_15;
+        if ((((right_shift_2 - (right_shift_3 * 13)) & 1) == (right_shift_3 & 1))) {
+            match_15 = slice_12;
+        } else {
+            uint slice_13 = texelFetch(state, ivec2(add_8, (mul_10 + clamp((mod_1 ^ 1), 0, sub_11))), 0).x;
+            uint match_14 = 
+            ((mod_7 == 0) && ((mod_1 & 1) == 0)) ? 1u :
+            0u;
+            match_15 = ((slice_13 & (~match_14)) | ((~slice_12) & match_14));
+        }
+        outColor = match_15;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        uint match_4;
+        if ((((right_shift_0 - (right_shift_1 * 13)) & 1) == (right_shift_1 & 1))) {
+            match_4 = v_state;
+        } else {
+            uint slice_2 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            uint match_3 = 
+            ((x == 0) && ((y & 1) == 0)) ? 1u :
+            0u;
+            match_4 = ((slice_2 & (~match_3)) | ((~v_state) & match_3));
+        }
+        outColor = match_4;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let hadamardDataPacked_surface_width13_out_tile6x338_state_tile6x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        uint match_6;
+        if ((((right_shift_2 - (right_shift_3 * 13)) & 1) == (right_shift_3 & 1))) {
+            match_6 = v_state;
+        } else {
+            uint slice_4 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+            uint match_5 = 
+            (((x - (int(((float(x) + 0.5) * 0.1666666716337204)) * 6)) == 0) && ((sub_1 & 1) == 0)) ? 1u :
+            0u;
+            match_6 = ((slice_4 & (~match_5)) | ((~v_state) & match_5));
+        }
+        outColor = match_6;
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(hadamardDataPacked, hadamardDataPackedLayered);
+registerSingleShot(hadamardDataPacked, hadamardDataPackedSingleShot);
+registerVariant(hadamardDataPacked, {surface_width: 5}, hadamardDataPacked_surface_width5);
+registerLayered(hadamardDataPacked_surface_width5, hadamardDataPackedLayered);
+registerSingleShot(hadamardDataPacked_surface_width5, hadamardDataPacked_surface_width5SingleShot);
+registerVariant(hadamardDataPacked_surface_width5, {out_tile: [1, 50], state_tile: [1, 50]}, hadamardDataPacked_surface_width5_out_tile1x50_state_tile1x50);
+registerVariant(hadamardDataPacked, {surface_width: 9}, hadamardDataPacked_surface_width9);
+registerLayered(hadamardDataPacked_surface_width9, hadamardDataPackedLayered);
+registerSingleShot(hadamardDataPacked_surface_width9, hadamardDataPacked_surface_width9SingleShot);
+registerVariant(hadamardDataPacked_surface_width9, {out_tile: [3, 162], state_tile: [3, 162]}, hadamardDataPacked_surface_width9_out_tile3x162_state_tile3x162);
+registerVariant(hadamardDataPacked, {surface_width: 13}, hadamardDataPacked_surface_width13);
+registerLayered(hadamardDataPacked_surface_width13, hadamardDataPackedLayered);
+registerSingleShot(hadamardDataPacked_surface_width13, hadamardDataPacked_surface_width13SingleShot);
+registerVariant(hadamardDataPacked_surface_width13, {out_tile: [6, 338], state_tile: [6, 338]}, hadamardDataPacked_surface_width13_out_tile6x338_state_tile6x338);
+
+export {hadamardDataPacked}
@@ -0,0 +1,246 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerFootprint, registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let measureBatchSetResult = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform sampler2D targets;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform vec2 found_ones_tile;
+    uniform sampler2D found_ones;
+    uniform vec2 claims_tile;
+    uniform sampler2D claims;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform bool clear_results;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.y);
+        int mod_1 = y % func_int_0;
+        int right_shift_2 = mod_1 >> 1;
+        int func_int_3 = int(out_tile.x);
+        int mod_4 = x % func_int_3;
+        int divide_8 = y / func_int_0;
+        int func_int_9 = int(state_tile.y);
+        int add_10 = (divide_8 * func_int_9) + clamp(mod_1, 0, (func_int_9 - 1));
+        int divide_5 = x / func_int_3;
+        int func_int_6 = int(state_tile.x);
+        int mul_7 = divide_5 * func_int_6;
+        bool slice_11 = texelFetch(state, ivec2((mul_7 + clamp(mod_4, 0, (func_int_6 - 1))), add_10), 0).x > 0.5;
+        int mul_12 = divide_5 * int(found_ones_tile.x);
+        int func_int_13 = int(found_ones_tile.y);
+        int add_14 = int(texelFetch(found_ones, ivec2(mul_12, ((divide_8 * func_int_13) + clamp(mod_1, 0, (func_int_13 - 1)))), 0).x*255.0 + 0.5) + 1;
+        bool lt_15 = add_14 < 2;
+        bool match_34;
+        if (lt_15) {
+            match_34 = (texelFetch(state, ivec2((mul_7 + 1), add_10), 0).x > 0.5);
+        } else {
+            uint mul_20 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+            uint mul_21 = (mul_20 ^ (mul_20 >> 15)) * 2221713035u;
+            uint bitwise_xor_22 = (mul_21 ^ (mul_21 >> 16)) ^ rand_counter;
+            uint mul_23 = (bitwise_xor_22 ^ (bitwise_xor_22 >> 16)) * 2146121005u;
+            uint mul_24 = (mul_23 ^ (mul_23 >> 15)) * 2221713035u;
+            uint bitwise_xor_25 = (mul_24 ^ (mul_24 >> 16)) ^ uint(divide_5);
+            uint mul_26 = (bitwise_xor_25 ^ (bitwise_xor_25 >> 16)) * 2146121005u;
+            uint mul_27 = (mul_26 ^ (mul_26 >> 15)) * 2221713035u;
+            uint bitwise_xor_28 = (mul_27 ^ (mul_27 >> 16)) ^ uint(divide_8);
+            uint mul_29 = (bitwise_xor_28 ^ (bitwise_xor_28 >> 16)) * 2146121005u;
+            uint mul_30 = (mul_29 ^ (mul_29 >> 15)) * 2221713035u;
+            uint bitwise_xor_31 = (mul_30 ^ (mul_30 >> 16)) ^ uint(right_shift_2);
+            uint mul_32 = (bitwise_xor_31 ^ (bitwise_xor_31 >> 16)) * 2146121005u;
+            uint mul_33 = (mul_32 ^ (mul_32 >> 15)) * 2221713035u;
+            match_34 = (((mul_33 ^ (mul_33 >> 16)) >> 31) == 1u);
+        }
+        int mul_19 = divide_8 * int(claims_tile.y);
+        int func_int_16 = int(claims_tile.x);
+        int mul_17 = divide_5 * func_int_16;
+        int sub_18 = func_int_16 - 1;
+        bool bit_and_35 = (lt_15 || ((int(texelFetch(claims, ivec2((mul_17 + clamp(add_14, 0, sub_18)), mul_19), 0).x*255.0 + 0.5) == add_14) && (int(texelFetch(claims, ivec2((mul_17 + clamp((func_int_6 + add_14), 0, sub_18)), mul_19), 0).x*255.0 + 0.5) == right_shift_2))) && match_34;
+        bool match_36 = 
+            ((!(((mod_1 & 1) == 1) && (texelFetch(targets, clamp(ivec2(0, right_shift_2), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5))) || (mod_4 >= 2)) ? slice_11 :
+            (mod_4 == 1) ? (slice_11 != bit_and_35) :
+            (((!clear_results) && slice_11) != bit_and_35);
+        outColor = float(match_36);
+    }`,
+    ['1i', 'clear_results', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'claims', undefined, 'claims_tile'],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', 'state_size', 'state_tile'],
+    ['tex', 'targets']);
+
+let measureBatchSetResultLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform sampler2D targets;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform vec2 found_ones_tile;
+    uniform vec2 found_ones_size;
+    uniform vec2 found_ones_layer;
+    uniform highp sampler2DArray found_ones;
+    uniform vec2 claims_tile;
+    uniform vec2 claims_size;
+    uniform vec2 claims_layer;
+    uniform highp sampler2DArray claims;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform bool clear_results;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mod_2 = add_0 % func_int_1;
+        int right_shift_3 = mod_2 >> 1;
+        int add_4 = x + int(out_origin.x);
+        int func_int_5 = int(out_tile.x);
+        int mod_6 = add_4 % func_int_5;
+        int divide_15 = add_0 / func_int_1;
+        int func_int_16 = int(state_tile.y);
+        int func_clamp_17 = clamp(((divide_15 * func_int_16) + clamp(mod_2, 0, (func_int_16 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int func_int_10 = int(state_size.x);
+        int sub_11 = func_int_10 - 1;
+        int divide_7 = add_4 / func_int_5;
+        int func_int_8 = int(state_tile.x);
+        int mul_9 = divide_7 * func_int_8;
+        int func_clamp_12 = clamp((mul_9 + clamp(mod_6, 0, (func_int_8 - 1))), 0, sub_11);
+        int func_int_13 = int(state_layer.x);
+        int mod_14 = func_clamp_12 % func_int_13;
+        int mul_20 = (func_clamp_17 / func_int_18) * (((func_int_10 + func_int_13) - 1) / func_int_13);
+        bool fetch_21 = texelFetch(state, ivec3(mod_14, mod_19, (mul_20 + (func_clamp_12 / func_int_13))), 0).x > 0.5;
+        int mul_22 = divide_7 * int(found_ones_tile.x);
+        int func_int_23 = int(found_ones_size.x);
+        int func_clamp_24 = clamp(mul_22, 0, (func_int_23 - 1));
+        int func_int_25 = int(found_ones_layer.x);
+        int mod_26 = func_clamp_24 % func_int_25;
+        int func_int_27 = int(found_ones_tile.y);
+        int func_clamp_28 = clamp(((divide_15 * func_int_27) + clamp(mod_2, 0, (func_int_27 - 1))), 0, (int(found_ones_size.y) - 1));
+        int func_int_29 = int(found_ones_layer.y);
+        int add_30 = int(texelFetch(found_ones, ivec3(mod_26, (func_clamp_28 % func_int_29), (((func_clamp_28 / func_int_29) * (((func_int_23 + func_int_25) - 1) / func_int_25)) + (func_clamp_24 / func_int_25))), 0).x*255.0 + 0.5) + 1;
+        bool lt_31 = add_30 < 2;
+        bool match_61;
+        if (lt_31) {
+            int func_clamp_46 = clamp((mul_9 + 1), 0, sub_11);
+            match_61 = (texelFetch(state, ivec3((func_clamp_46 % func_int_13), mod_19, (mul_20 + (func_clamp_46 / func_int_13))), 0).x > 0.5);
+        } else {
+            uint mul_47 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+            uint mul_48 = (mul_47 ^ (mul_47 >> 15)) * 2221713035u;
+            uint bitwise_xor_49 = (mul_48 ^ (mul_48 >> 16)) ^ rand_counter;
+            uint mul_50 = (bitwise_xor_49 ^ (bitwise_xor_49 >> 16)) * 2146121005u;
+            uint mul_51 = (mul_50 ^ (mul_50 >> 15)) * 2221713035u;
+            uint bitwise_xor_52 = (mul_51 ^ (mul_51 >> 16)) ^ uint(divide_7);
+            uint mul_53 = (bitwise_xor_52 ^ (bitwise_xor_52 >> 16)) * 2146121005u;
+            uint mul_54 = (mul_53 ^ (mul_53 >> 15)) * 2221713035u;
+            uint bitwise_xor_55 = (mul_54 ^ (mul_54 >> 16)) ^ uint(divide_15);
+            uint mul_56 = (bitwise_xor_55 ^ (bitwise_xor_55 >> 16)) * 2146121005u;
+            uint mul_57 = (mul_56 ^ (mul_56 >> 15)) * 2221713035u;
+            uint bitwise_xor_58 = (mul_57 ^ (mul_57 >> 16)) ^ uint(right_shift_3);
+            uint mul_59 = (bitwise_xor_58 ^ (bitwise_xor_58 >> 16)) * 2146121005u;
+            uint mul_60 = (mul_59 ^ (mul_59 >> 15)) * 2221713035u;
+            match_61 = (((mul_60 ^ (mul_60 >> 16)) >> 31) == 1u);
+        }
+        int func_clamp_40 = clamp((divide_15 * int(claims_tile.y)), 0, (int(claims_size.y) - 1));
+        int func_int_41 = int(claims_layer.y);
+        int mod_42 = func_clamp_40 % func_int_41;
+        int func_int_35 = int(claims_size.x);
+        int sub_36 = func_int_35 - 1;
+        int func_int_32 = int(claims_tile.x);
+        int mul_33 = divide_7 * func_int_32;
+        int sub_34 = func_int_32 - 1;
+        int func_clamp_37 = clamp((mul_33 + clamp(add_30, 0, sub_34)), 0, sub_36);
+        int func_int_38 = int(claims_layer.x);
+        int mod_39 = func_clamp_37 % func_int_38;
+        int mul_43 = (func_clamp_40 / func_int_41) * (((func_int_35 + func_int_38) - 1) / func_int_38);
+        bool eq_44 = int(texelFetch(claims, ivec3(mod_39, mod_42, (mul_43 + (func_clamp_37 / func_int_38))), 0).x*255.0 + 0.5) == add_30;
+        int func_clamp_45 = clamp((mul_33 + clamp((func_int_8 + add_30), 0, sub_34)), 0, sub_36);
+        bool bit_and_62 = (lt_31 || (eq_44 && (int(texelFetch(claims, ivec3((func_clamp_45 % func_int_38), mod_42, (mul_43 + (func_clamp_45 / func_int_38))), 0).x*255.0 + 0.5) == right_shift_3))) && match_61;
+        bool match_63 = 
+            ((!(((mod_2 & 1) == 1) && (texelFetch(targets, clamp(ivec2(0, right_shift_3), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5))) || (mod_6 >= 2)) ? fetch_21 :
+            (mod_6 == 1) ? (fetch_21 != bit_and_62) :
+            (((!clear_results) && fetch_21) != bit_and_62);
+        outColor = float(match_63);
+    }`,
+    ['1i', 'clear_results', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'claims', 'claims_size', 'claims_tile', 'claims_layer'],
+    ['tex', 'found_ones', 'found_ones_size', 'found_ones_tile', 'found_ones_layer'],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer'],
+    ['tex', 'targets']);
+
+let measureBatchSetResultSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D targets;
+    uniform sampler2D state;
+    uniform sampler2D found_ones;
+    uniform sampler2D claims;
+    uniform vec2 state_size;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform bool clear_results;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int right_shift_0 = y >> 1;
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int add_1 = int(texelFetch(found_ones, clamp(ivec2(0, y), ivec2(0), textureSize(found_ones, 0) - 1), 0).x*255.0 + 0.5) + 1;
+        bool lt_2 = add_1 < 2;
+        bool match_17;
+        if (lt_2) {
+            match_17 = (texelFetch(state, clamp(ivec2(1, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        } else {
+            uint mul_3 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+            uint mul_4 = (mul_3 ^ (mul_3 >> 15)) * 2221713035u;
+            uint bitwise_xor_5 = (mul_4 ^ (mul_4 >> 16)) ^ rand_counter;
+            uint mul_6 = (bitwise_xor_5 ^ (bitwise_xor_5 >> 16)) * 2146121005u;
+            uint mul_7 = (mul_6 ^ (mul_6 >> 15)) * 2221713035u;
+            uint bitwise_xor_8 = mul_7 ^ (mul_7 >> 16);
+            uint mul_9 = (bitwise_xor_8 ^ (bitwise_xor_8 >> 16)) * 2146121005u;
+            uint mul_10 = (mul_9 ^ (mul_9 >> 15)) * 2221713035u;
+            uint bitwise_xor_11 = mul_10 ^ (mul_10 >> 16);
+            uint mul_12 = (bitwise_xor_11 ^ (bitwise_xor_11 >> 16)) * 2146121005u;
+            uint mul_13 = (mul_12 ^ (mul_12 >> 15)) * 2221713035u;
+            uint bitwise_xor_14 = (mul_13 ^ (mul_13 >> 16)) ^ uint(right_shift_0);
+            uint mul_15 = (bitwise_xor_14 ^ (bitwise_xor_14 >> 16)) * 2146121005u;
+            uint mul_16 = (mul_15 ^ (mul_15 >> 15)) * 2221713035u;
+            match_17 = (((mul_16 ^ (mul_16 >> 16)) >> 31) == 1u);
+        }
+        bool bit_and_18 = (lt_2 || ((int(texelFetch(claims, clamp(ivec2(add_1, 0), ivec2(0), textureSize(claims, 0) - 1), 0).x*255.0 + 0.5) == add_1) && (int(texelFetch(claims, clamp(ivec2((int(state_size.x) + add_1), 0), ivec2(0), textureSize(claims, 0) - 1), 0).x*255.0 + 0.5) == right_shift_0))) && match_17;
+        bool match_19 = 
+            ((!(((y & 1) == 1) && (texelFetch(targets, clamp(ivec2(0, right_shift_0), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5))) || (x >= 2)) ? v_state :
+            (x == 1) ? (v_state != bit_and_18) :
+            (((!clear_results) && v_state) != bit_and_18);
+        outColor = float(match_19);
+    }`,
+    ['1i', 'clear_results', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'claims', undefined, 'claims_tile'],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', 'state_size', 'state_tile'],
+    ['tex', 'targets']);
+
+registerLayered(measureBatchSetResult, measureBatchSetResultLayered);
+registerFootprint(measureBatchSetResult, 'state', ({}) => [
+    [0, 2, 0, Infinity],
+]);
+registerSingleShot(measureBatchSetResult, measureBatchSetResultSingleShot);
+
+export {measureBatchSetResult}
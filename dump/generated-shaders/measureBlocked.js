@@ -0,0 +1,194 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let measureBlocked = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 targets_size;
+    uniform vec2 found_ones_tile;
+    uniform vec2 out_tile;
+    uniform vec2 claims_tile;
+    uniform sampler2D targets;
+    uniform sampler2D found_ones;
+    uniform sampler2D claims;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(targets_size.y);
+        int func_int_1 = int(found_ones_tile.y);
+        int sub_2 = func_int_1 - 1;
+        int divide_3 = y / int(out_tile.y);
+        int mul_4 = divide_3 * func_int_1;
+        int divide_5 = x / int(out_tile.x);
+        int mul_6 = divide_5 * int(found_ones_tile.x);
+        int func_int_7 = int(claims_tile.x);
+        int right_shift_11 = func_int_7 >> 1;
+        int sub_8 = func_int_7 - 1;
+        int mul_9 = divide_5 * func_int_7;
+        int mul_10 = divide_3 * int(claims_tile.y);
+        bool reduce_34 = false;
+        for (int i_12 = 0; i_12 < func_int_0; i_12++) {
+            bool slice_13 = texelFetch(targets, clamp(ivec2(0, i_12), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5;
+            int mul_14 = i_12 * 2;
+            int add_15 = mul_14 + 1;
+            int func_clamp_16 = clamp(add_15, 0, sub_2);
+            int add_17 = mul_4 + func_clamp_16;
+            int slice_18 = int(texelFetch(found_ones, ivec2(mul_6, add_17), 0).x*255.0 + 0.5);
+            int add_19 = slice_18 + 1;
+            bool ge_20 = add_19 >= 2;
+            bool bit_and_21 = slice_13 && ge_20;
+            int func_clamp_22 = clamp(add_19, 0, sub_8);
+            int add_23 = mul_9 + func_clamp_22;
+            int slice_24 = int(texelFetch(claims, ivec2(add_23, mul_10), 0).x*255.0 + 0.5);
+            bool eq_25 = slice_24 == add_19;
+            int add_26 = right_shift_11 + add_19;
+            int func_clamp_27 = clamp(add_26, 0, sub_8);
+            int add_28 = mul_9 + func_clamp_27;
+            int slice_29 = int(texelFetch(claims, ivec2(add_28, mul_10), 0).x*255.0 + 0.5);
+            bool eq_30 = slice_29 == i_12;
+            bool bit_and_31 = eq_25 && eq_30;
+            bool not_32 = !bit_and_31;
+            bool bit_and_33 = bit_and_21 && not_32;
+            reduce_34 = reduce_34 || bit_and_33;
+        }
+        outColor = float(reduce_34);
+    }`,
+    ['tex', 'claims', 'claims_size', 'claims_tile'],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'targets', 'targets_size']);
+
+let measureBlockedLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 targets_size;
+    uniform vec2 found_ones_tile;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 found_ones_size;
+    uniform vec2 found_ones_layer;
+    uniform vec2 claims_tile;
+    uniform vec2 claims_size;
+    uniform vec2 claims_layer;
+    uniform sampler2D targets;
+    uniform highp sampler2DArray found_ones;
+    uniform highp sampler2DArray claims;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(targets_size.y);
+        int func_int_1 = int(found_ones_tile.y);
+        int sub_2 = func_int_1 - 1;
+        int divide_3 = (y + int(out_origin.y)) / int(out_tile.y);
+        int mul_4 = divide_3 * func_int_1;
+        int sub_5 = int(found_ones_size.y) - 1;
+        int func_int_6 = int(found_ones_layer.y);
+        int func_int_7 = int(found_ones_size.x);
+        int func_int_8 = int(found_ones_layer.x);
+        int divide_9 = ((func_int_7 + func_int_8) - 1) / func_int_8;
+        int divide_10 = (x + int(out_origin.x)) / int(out_tile.x);
+        int func_clamp_11 = clamp((divide_10 * int(found_ones_tile.x)), 0, (func_int_7 - 1));
+        int divide_12 = func_clamp_11 / func_int_8;
+        int mod_13 = func_clamp_11 % func_int_8;
+        int func_int_14 = int(claims_tile.x);
+        int right_shift_25 = func_int_14 >> 1;
+        int sub_15 = func_int_14 - 1;
+        int mul_16 = divide_10 * func_int_14;
+        int func_int_17 = int(claims_size.x);
+        int sub_18 = func_int_17 - 1;
+        int func_clamp_20 = clamp((divide_3 * int(claims_tile.y)), 0, (int(claims_size.y) - 1));
+        int func_int_21 = int(claims_layer.y);
+        int divide_22 = func_clamp_20 / func_int_21;
+        int func_int_19 = int(claims_layer.x);
+        int mul_23 = divide_22 * (((func_int_17 + func_int_19) - 1) / func_int_19);
+        int mod_24 = func_clamp_20 % func_int_21;
+        bool reduce_61 = false;
+        for (int i_26 = 0; i_26 < func_int_0; i_26++) {
+            bool slice_27 = texelFetch(targets, clamp(ivec2(0, i_26), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5;
+            int mul_28 = i_26 * 2;
+            int add_29 = mul_28 + 1;
+            int func_clamp_30 = clamp(add_29, 0, sub_2);
+            int add_31 = mul_4 + func_clamp_30;
+            int func_clamp_32 = clamp(add_31, 0, sub_5);
+            int mod_33 = func_clamp_32 % func_int_6;
+            int divide_34 = func_clamp_32 / func_int_6;
+            int mul_35 = divide_34 * divide_9;
+            int add_36 = mul_35 + divide_12;
+            int fetch_37 = int(texelFetch(found_ones, ivec3(mod_13, mod_33, add_36), 0).x*255.0 + 0.5);
+            int add_38 = fetch_37 + 1;
+            bool ge_39 = add_38 >= 2;
+            bool bit_and_40 = slice_27 && ge_39;
+            int func_clamp_41 = clamp(add_38, 0, sub_15);
+            int add_42 = mul_16 + func_clamp_41;
+            int func_clamp_43 = clamp(add_42, 0, sub_18);
+            int mod_44 = func_clamp_43 % func_int_19;
+            int divide_45 = func_clamp_43 / func_int_19;
+            int add_46 = mul_23 + divide_45;
+            int fetch_47 = int(texelFetch(claims, ivec3(mod_44, mod_24, add_46), 0).x*255.0 + 0.5);
+            bool eq_48 = fetch_47 == add_38;
+            int add_49 = right_shift_25 + add_38;
+            int func_clamp_50 = clamp(add_49, 0, sub_15);
+            int add_51 = mul_16 + func_clamp_50;
+            int func_clamp_52 = clamp(add_51, 0, sub_18);
+            int mod_53 = func_clamp_52 % func_int_19;
+            int divide_54 = func_clamp_52 / func_int_19;
+            int add_55 = mul_23 + divide_54;
+            int fetch_56 = int(texelFetch(claims, ivec3(mod_53, mod_24, add_55), 0).x*255.0 + 0.5);
+            bool eq_57 = fetch_56 == i_26;
+            bool bit_and_58 = eq_48 && eq_57;
+            bool not_59 = !bit_and_58;
+            bool bit_and_60 = bit_and_40 && not_59;
+            reduce_61 = reduce_61 || bit_and_60;
+        }
+        outColor = float(reduce_61);
+    }`,
+    ['tex', 'claims', 'claims_size', 'claims_tile', 'claims_layer'],
+    ['tex', 'found_ones', 'found_ones_size', 'found_ones_tile', 'found_ones_layer'],
+    ['tex', 'targets', 'targets_size']);
+
+let measureBlockedSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 targets_size;
+    uniform vec2 claims_size;
+    uniform sampler2D targets;
+    uniform sampler2D found_ones;
+    uniform sampler2D claims;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(targets_size.y);
+        int right_shift_1 = int(claims_size.x) >> 1;
+        bool reduce_18 = false;
+        for (int i_2 = 0; i_2 < func_int_0; i_2++) {
+            bool slice_3 = texelFetch(targets, clamp(ivec2(0, i_2), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5;
+            int mul_4 = i_2 * 2;
+            int add_5 = mul_4 + 1;
+            int slice_6 = int(texelFetch(found_ones, clamp(ivec2(0, add_5), ivec2(0), textureSize(found_ones, 0) - 1), 0).x*255.0 + 0.5);
+            int add_7 = slice_6 + 1;
+            bool ge_8 = add_7 >= 2;
+            bool bit_and_9 = slice_3 && ge_8;
+            int slice_10 = int(texelFetch(claims, clamp(ivec2(add_7, 0), ivec2(0), textureSize(claims, 0) - 1), 0).x*255.0 + 0.5);
+            bool eq_11 = slice_10 == add_7;
+            int add_12 = right_shift_1 + add_7;
+            int slice_13 = int(texelFetch(claims, clamp(ivec2(add_12, 0), ivec2(0), textureSize(claims, 0) - 1), 0).x*255.0 + 0.5);
+            bool eq_14 = slice_13 == i_2;
+            bool bit_and_15 = eq_11 && eq_14;
+            bool not_16 = !bit_and_15;
+            bool bit_and_17 = bit_and_9 && not_16;
+            reduce_18 = reduce_18 || bit_and_17;
+        }
+        outColor = float(reduce_18);
+    }`,
+    ['tex', 'claims', 'claims_size', 'claims_tile'],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'targets', 'targets_size']);
+
+registerLayered(measureBlocked, measureBlockedLayered);
+registerSingleShot(measureBlocked, measureBlockedSingleShot);
+
+export {measureBlocked}
@@ -0,0 +1,167 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let measureClaims = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D targets;
+    uniform vec2 found_ones_tile;
+    uniform sampler2D found_ones;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_4 = int(out_tile.y);
+        int mod_5 = y % func_int_4;
+        bool eq_6 = (mod_5 & 1) == 1;
+        int right_shift_7 = mod_5 >> 1;
+        bool bit_and_8 = eq_6 && (texelFetch(targets, clamp(ivec2(0, right_shift_7), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5);
+        int func_int_0 = int(out_tile.x);
+        int divide_9 = x / func_int_0;
+        int mul_10 = divide_9 * int(found_ones_tile.x);
+        int divide_11 = y / func_int_4;
+        int func_int_12 = int(found_ones_tile.y);
+        int add_13 = int(texelFetch(found_ones, ivec2(mul_10, ((divide_11 * func_int_12) + clamp(mod_5, 0, (func_int_12 - 1)))), 0).x*255.0 + 0.5) + 1;
+        bool bit_and_14 = bit_and_8 && (add_13 >= 2);
+        int mod_1 = x % func_int_0;
+        int func_int_2 = int(state_tile.x);
+        bool ge_3 = mod_1 >= func_int_2;
+        int match_15 = 
+            ge_3 ? (mod_1 - func_int_2) :
+            mod_1;
+        int match_19;
+        if (ge_3) {
+            int match_16 = 
+            (bit_and_14 && (add_13 == match_15)) ? right_shift_7 :
+            255;
+            match_19 = match_16;
+        } else {
+            int func_int_17 = int(state_tile.y);
+            int match_18 = 
+            ((bit_and_14 && (texelFetch(state, ivec2(((divide_9 * func_int_2) + clamp(match_15, 0, (func_int_2 - 1))), ((divide_11 * func_int_17) + clamp(mod_5, 0, (func_int_17 - 1)))), 0).x > 0.5)) && (match_15 >= 2)) ? add_13 :
+            255;
+            match_19 = match_18;
+        }
+        outColor = float(match_19) / 255.0;
+    }`,
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', 'state_size', 'state_tile'],
+    ['tex', 'targets']);
+
+let measureClaimsLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D targets;
+    uniform vec2 found_ones_tile;
+    uniform vec2 found_ones_size;
+    uniform vec2 found_ones_layer;
+    uniform highp sampler2DArray found_ones;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_5 = y + int(out_origin.y);
+        int func_int_6 = int(out_tile.y);
+        int mod_7 = add_5 % func_int_6;
+        bool eq_8 = (mod_7 & 1) == 1;
+        int right_shift_9 = mod_7 >> 1;
+        bool bit_and_10 = eq_8 && (texelFetch(targets, clamp(ivec2(0, right_shift_9), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int divide_11 = add_0 / func_int_1;
+        int mul_12 = divide_11 * int(found_ones_tile.x);
+        int func_int_13 = int(found_ones_size.x);
+        int func_clamp_14 = clamp(mul_12, 0, (func_int_13 - 1));
+        int func_int_15 = int(found_ones_layer.x);
+        int mod_16 = func_clamp_14 % func_int_15;
+        int divide_17 = add_5 / func_int_6;
+        int func_int_18 = int(found_ones_tile.y);
+        int func_clamp_19 = clamp(((divide_17 * func_int_18) + clamp(mod_7, 0, (func_int_18 - 1))), 0, (int(found_ones_size.y) - 1));
+        int func_int_20 = int(found_ones_layer.y);
+        int add_21 = int(texelFetch(found_ones, ivec3(mod_16, (func_clamp_19 % func_int_20), (((func_clamp_19 / func_int_20) * (((func_int_13 + func_int_15) - 1) / func_int_15)) + (func_clamp_14 / func_int_15))), 0).x*255.0 + 0.5) + 1;
+        bool bit_and_22 = bit_and_10 && (add_21 >= 2);
+        int mod_2 = add_0 % func_int_1;
+        int func_int_3 = int(state_tile.x);
+        bool ge_4 = mod_2 >= func_int_3;
+        int match_23 = 
+            ge_4 ? (mod_2 - func_int_3) :
+            mod_2;
+        int match_33;
+        if (ge_4) {
+            int match_24 = 
+            (bit_and_22 && (add_21 == match_23)) ? right_shift_9 :
+            255;
+            match_33 = match_24;
+        } else {
+            int add_25 = (divide_11 * func_int_3) + clamp(match_23, 0, (func_int_3 - 1));
+            int func_int_26 = int(state_size.x);
+            int func_clamp_27 = clamp(add_25, 0, (func_int_26 - 1));
+            int func_int_28 = int(state_layer.x);
+            int func_int_29 = int(state_tile.y);
+            int func_clamp_30 = clamp(((divide_17 * func_int_29) + clamp(mod_7, 0, (func_int_29 - 1))), 0, (int(state_size.y) - 1));
+            int func_int_31 = int(state_layer.y);
+            int match_32 = 
+            ((bit_and_22 && (texelFetch(state, ivec3((func_clamp_27 % func_int_28), (func_clamp_30 % func_int_31), (((func_clamp_30 / func_int_31) * (((func_int_26 + func_int_28) - 1) / func_int_28)) + (func_clamp_27 / func_int_28))), 0).x > 0.5)) && (match_23 >= 2)) ? add_21 :
+            255;
+            match_33 = match_32;
+        }
+        outColor = float(match_33) / 255.0;
+    }`,
+    ['tex', 'found_ones', 'found_ones_size', 'found_ones_tile', 'found_ones_layer'],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer'],
+    ['tex', 'targets']);
+
+let measureClaimsSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 state_size;
+    uniform sampler2D targets;
+    uniform sampler2D found_ones;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool eq_2 = (y & 1) == 1;
+        int right_shift_3 = y >> 1;
+        bool bit_and_4 = eq_2 && (texelFetch(targets, clamp(ivec2(0, right_shift_3), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5);
+        int add_5 = int(texelFetch(found_ones, clamp(ivec2(0, y), ivec2(0), textureSize(found_ones, 0) - 1), 0).x*255.0 + 0.5) + 1;
+        bool bit_and_6 = bit_and_4 && (add_5 >= 2);
+        int func_int_0 = int(state_size.x);
+        bool ge_1 = x >= func_int_0;
+        int match_7 = 
+            ge_1 ? (x - func_int_0) :
+            x;
+        int match_10;
+        if (ge_1) {
+            int match_8 = 
+            (bit_and_6 && (add_5 == match_7)) ? right_shift_3 :
+            255;
+            match_10 = match_8;
+        } else {
+            int match_9 = 
+            ((bit_and_6 && (texelFetch(state, clamp(ivec2(match_7, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) && (match_7 >= 2)) ? add_5 :
+            255;
+            match_10 = match_9;
+        }
+        outColor = float(match_10) / 255.0;
+    }`,
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', 'state_size', 'state_tile'],
+    ['tex', 'targets']);
+
+registerLayered(measureClaims, measureClaimsLayered);
+registerSingleShot(measureClaims, measureClaimsSingleShot);
+
+export {measureClaims}
@@ -1,47 +1,199 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerFootprint, registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let measureSetResult = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
     uniform int target;
-    uniform vec2 state_size;
+    uniform vec2 state_tile;
     uniform sampler2D state;
+    uniform vec2 found_ones_tile;
+    uniform sampler2D found_ones;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.y);
+        int mod_1 = y % func_int_0;
+        int func_int_2 = int(out_tile.x);
+        int mod_3 = x % func_int_2;
+        int divide_7 = y / func_int_0;
+        int func_int_8 = int(state_tile.y);
+        int add_9 = (divide_7 * func_int_8) + clamp(mod_1, 0, (func_int_8 - 1));
+        int divide_4 = x / func_int_2;
+        int func_int_5 = int(state_tile.x);
+        int mul_6 = divide_4 * func_int_5;
+        bool slice_10 = texelFetch(state, ivec2((mul_6 + clamp(mod_3, 0, (func_int_5 - 1))), add_9), 0).x > 0.5;
+        int mul_11 = divide_4 * int(found_ones_tile.x);
+        int func_int_12 = int(found_ones_tile.y);
+        bool match_27;
+        if ((int(texelFetch(found_ones, ivec2(mul_11, ((divide_7 * func_int_12) + clamp(mod_1, 0, (func_int_12 - 1)))), 0).x*255.0 + 0.5) != 0)) {
+            uint mul_13 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+            uint mul_14 = (mul_13 ^ (mul_13 >> 15)) * 2221713035u;
+            uint bitwise_xor_15 = (mul_14 ^ (mul_14 >> 16)) ^ rand_counter;
+            uint mul_16 = (bitwise_xor_15 ^ (bitwise_xor_15 >> 16)) * 2146121005u;
+            uint mul_17 = (mul_16 ^ (mul_16 >> 15)) * 2221713035u;
+            uint bitwise_xor_18 = (mul_17 ^ (mul_17 >> 16)) ^ uint(divide_4);
+            uint mul_19 = (bitwise_xor_18 ^ (bitwise_xor_18 >> 16)) * 2146121005u;
+            uint mul_20 = (mul_19 ^ (mul_19 >> 15)) * 2221713035u;
+            uint bitwise_xor_21 = (mul_20 ^ (mul_20 >> 16)) ^ uint(divide_7);
+            uint mul_22 = (bitwise_xor_21 ^ (bitwise_xor_21 >> 16)) * 2146121005u;
+            uint mul_23 = (mul_22 ^ (mul_22 >> 15)) * 2221713035u;
+            uint bitwise_xor_24 = (mul_23 ^ (mul_23 >> 16)) ^ uint((mod_1 >> 1));
+            uint mul_25 = (bitwise_xor_24 ^ (bitwise_xor_24 >> 16)) * 2146121005u;
+            uint mul_26 = (mul_25 ^ (mul_25 >> 15)) * 2221713035u;
+            match_27 = (((mul_26 ^ (mul_26 >> 16)) >> 31) == 1u);
+        } else {
+            match_27 = (texelFetch(state, ivec2((mul_6 + 1), add_9), 0).x > 0.5);
+        }
+        bool match_28 = 
+            ((mod_1 != ((target * 2) + 1)) || (mod_3 >= 2)) ? slice_10 :
+            (mod_3 == 1) ? (slice_10 != match_27) :
+            match_27;
+        outColor = float(match_28);
+    }`,
+    ['1i', 'target', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let measureSetResultLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int target;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform vec2 found_ones_tile;
     uniform vec2 found_ones_size;
+    uniform vec2 found_ones_layer;
+    uniform highp sampler2DArray found_ones;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mod_2 = add_0 % func_int_1;
+        int add_3 = x + int(out_origin.x);
+        int func_int_4 = int(out_tile.x);
+        int mod_5 = add_3 % func_int_4;
+        int divide_14 = add_0 / func_int_1;
+        int func_int_15 = int(state_tile.y);
+        int func_clamp_16 = clamp(((divide_14 * func_int_15) + clamp(mod_2, 0, (func_int_15 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_17 = int(state_layer.y);
+        int mod_18 = func_clamp_16 % func_int_17;
+        int func_int_9 = int(state_size.x);
+        int sub_10 = func_int_9 - 1;
+        int divide_6 = add_3 / func_int_4;
+        int func_int_7 = int(state_tile.x);
+        int mul_8 = divide_6 * func_int_7;
+        int func_clamp_11 = clamp((mul_8 + clamp(mod_5, 0, (func_int_7 - 1))), 0, sub_10);
+        int func_int_12 = int(state_layer.x);
+        int mod_13 = func_clamp_11 % func_int_12;
+        int mul_19 = (func_clamp_16 / func_int_17) * (((func_int_9 + func_int_12) - 1) / func_int_12);
+        bool fetch_20 = texelFetch(state, ivec3(mod_13, mod_18, (mul_19 + (func_clamp_11 / func_int_12))), 0).x > 0.5;
+        int mul_21 = divide_6 * int(found_ones_tile.x);
+        int func_int_22 = int(found_ones_size.x);
+        int func_clamp_23 = clamp(mul_21, 0, (func_int_22 - 1));
+        int func_int_24 = int(found_ones_layer.x);
+        int mod_25 = func_clamp_23 % func_int_24;
+        int func_int_26 = int(found_ones_tile.y);
+        int func_clamp_27 = clamp(((divide_14 * func_int_26) + clamp(mod_2, 0, (func_int_26 - 1))), 0, (int(found_ones_size.y) - 1));
+        int func_int_28 = int(found_ones_layer.y);
+        bool match_44;
+        if ((int(texelFetch(found_ones, ivec3(mod_25, (func_clamp_27 % func_int_28), (((func_clamp_27 / func_int_28) * (((func_int_22 + func_int_24) - 1) / func_int_24)) + (func_clamp_23 / func_int_24))), 0).x*255.0 + 0.5) != 0)) {
+            uint mul_29 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+            uint mul_30 = (mul_29 ^ (mul_29 >> 15)) * 2221713035u;
+            uint bitwise_xor_31 = (mul_30 ^ (mul_30 >> 16)) ^ rand_counter;
+            uint mul_32 = (bitwise_xor_31 ^ (bitwise_xor_31 >> 16)) * 2146121005u;
+            uint mul_33 = (mul_32 ^ (mul_32 >> 15)) * 2221713035u;
+            uint bitwise_xor_34 = (mul_33 ^ (mul_33 >> 16)) ^ uint(divide_6);
+            uint mul_35 = (bitwise_xor_34 ^ (bitwise_xor_34 >> 16)) * 2146121005u;
+            uint mul_36 = (mul_35 ^ (mul_35 >> 15)) * 2221713035u;
+            uint bitwise_xor_37 = (mul_36 ^ (mul_36 >> 16)) ^ uint(divide_14);
+            uint mul_38 = (bitwise_xor_37 ^ (bitwise_xor_37 >> 16)) * 2146121005u;
+            uint mul_39 = (mul_38 ^ (mul_38 >> 15)) * 2221713035u;
+            uint bitwise_xor_40 = (mul_39 ^ (mul_39 >> 16)) ^ uint((mod_2 >> 1));
+            uint mul_41 = (bitwise_xor_40 ^ (bitwise_xor_40 >> 16)) * 2146121005u;
+            uint mul_42 = (mul_41 ^ (mul_41 >> 15)) * 2221713035u;
+            match_44 = (((mul_42 ^ (mul_42 >> 16)) >> 31) == 1u);
+        } else {
+            int func_clamp_43 = clamp((mul_8 + 1), 0, sub_10);
+            match_44 = (texelFetch(state, ivec3((func_clamp_43 % func_int_12), mod_18, (mul_19 + (func_clamp_43 / func_int_12))), 0).x > 0.5);
+        }
+        bool match_45 = 
+            ((mod_2 != ((target * 2) + 1)) || (mod_5 >= 2)) ? fetch_20 :
+            (mod_5 == 1) ? (fetch_20 != match_44) :
+            match_44;
+        outColor = float(match_45);
+    }`,
+    ['1i', 'target', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'found_ones', 'found_ones_size', 'found_ones_tile', 'found_ones_layer'],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let measureSetResultSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int target;
+    uniform sampler2D state;
     uniform sampler2D found_ones;
-    uniform vec2 rand_size;
-    uniform sampler2D rand;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        int mul_7 = target * 2;
-        int add_8 = mul_7 + 1;
-        bool ne_9 = y != add_8;
-        bool ge_10 = x >= 2;
-        bool bit_or_11 = ne_9 || ge_10;
-        bool v_state = (texture(state, gl_FragCoord.xy / state_size)).x > 0.5;
-        bool eq_12 = x == 1;
-        int slice_4 = int((texture(found_ones, vec2(0.5, gl_FragCoord.y) / found_ones_size)).x*255.0 + 0.5);
-        bool ne_5 = slice_4 != 0;
-        int slice_0 = int((texture(rand, vec2(0.5, gl_FragCoord.y) / rand_size)).x*255.0 + 0.5);
-        int bitwise_and_1 = slice_0 & 1;
-        bool func_bool_2 = bool(bitwise_and_1);
-        bool slice_3 = (texture(state, vec2(1.5, gl_FragCoord.y) / state_size)).x > 0.5;
-        bool match_6 = 
-            ne_5 ? func_bool_2 :
-            slice_3;
-        bool bit_xor_13 = v_state != match_6;
-        bool match_14 = 
-            bit_or_11 ? v_state :
-            eq_12 ? bit_xor_13 :
-            match_6;
-        outColor = float(match_14);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool match_14;
+        if ((int(texelFetch(found_ones, clamp(ivec2(0, y), ivec2(0), textureSize(found_ones, 0) - 1), 0).x*255.0 + 0.5) != 0)) {
+            uint mul_0 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+            uint mul_1 = (mul_0 ^ (mul_0 >> 15)) * 2221713035u;
+            uint bitwise_xor_2 = (mul_1 ^ (mul_1 >> 16)) ^ rand_counter;
+            uint mul_3 = (bitwise_xor_2 ^ (bitwise_xor_2 >> 16)) * 2146121005u;
+            uint mul_4 = (mul_3 ^ (mul_3 >> 15)) * 2221713035u;
+            uint bitwise_xor_5 = mul_4 ^ (mul_4 >> 16);
+            uint mul_6 = (bitwise_xor_5 ^ (bitwise_xor_5 >> 16)) * 2146121005u;
+            uint mul_7 = (mul_6 ^ (mul_6 >> 15)) * 2221713035u;
+            uint bitwise_xor_8 = mul_7 ^ (mul_7 >> 16);
+            uint mul_9 = (bitwise_xor_8 ^ (bitwise_xor_8 >> 16)) * 2146121005u;
+            uint mul_10 = (mul_9 ^ (mul_9 >> 15)) * 2221713035u;
+            uint bitwise_xor_11 = (mul_10 ^ (mul_10 >> 16)) ^ uint((y >> 1));
+            uint mul_12 = (bitwise_xor_11 ^ (bitwise_xor_11 >> 16)) * 2146121005u;
+            uint mul_13 = (mul_12 ^ (mul_12 >> 15)) * 2221713035u;
+            match_14 = (((mul_13 ^ (mul_13 >> 16)) >> 31) == 1u);
+        } else {
+            match_14 = (texelFetch(state, clamp(ivec2(1, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        }
+        bool match_15 = 
+            ((y != ((target * 2) + 1)) || (x >= 2)) ? v_state :
+            (x == 1) ? (v_state != match_14) :
+            match_14;
+        outColor = float(match_15);
     }`,
     ['1i', 'target', false],
-    ['tex', 'found_ones', 'found_ones_size'],
-    ['tex', 'rand', 'rand_size'],
-    ['tex', 'state', 'state_size']);
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'found_ones', undefined, 'found_ones_tile'],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(measureSetResult, measureSetResultLayered);
+registerFootprint(measureSetResult, 'state', ({target}) => [
+    [0, 2, (target * 2) + 1, ((target * 2) + 1) + 1],
+]);
+registerSingleShot(measureSetResult, measureSetResultSingleShot);
 
 export {measureSetResult}
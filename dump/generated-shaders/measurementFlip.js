@@ -0,0 +1,163 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerFootprint, registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let measurementFlip = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform sampler2D targets;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform float probability;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.x);
+        int divide_1 = x / func_int_0;
+        int func_int_2 = int(state_tile.x);
+        int mul_3 = divide_1 * func_int_2;
+        int mod_4 = x % func_int_0;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(out_tile.y);
+        int divide_7 = y / func_int_6;
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = divide_7 * func_int_8;
+        int mod_10 = y % func_int_6;
+        bool slice_11 = texelFetch(state, ivec2(add_5, (mul_9 + clamp(mod_10, 0, (func_int_8 - 1)))), 0).x > 0.5;
+        bool bit_and_12 = (mod_4 == 0) && ((mod_10 & 1) == 1);
+        int right_shift_13 = mod_10 >> 1;
+        bool bit_and_14 = bit_and_12 && (texelFetch(targets, clamp(ivec2(0, right_shift_13), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5);
+        uint mul_15 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+        uint mul_16 = (mul_15 ^ (mul_15 >> 15)) * 2221713035u;
+        uint bitwise_xor_17 = (mul_16 ^ (mul_16 >> 16)) ^ rand_counter;
+        uint mul_18 = (bitwise_xor_17 ^ (bitwise_xor_17 >> 16)) * 2146121005u;
+        uint mul_19 = (mul_18 ^ (mul_18 >> 15)) * 2221713035u;
+        uint bitwise_xor_20 = (mul_19 ^ (mul_19 >> 16)) ^ uint(divide_1);
+        uint mul_21 = (bitwise_xor_20 ^ (bitwise_xor_20 >> 16)) * 2146121005u;
+        uint mul_22 = (mul_21 ^ (mul_21 >> 15)) * 2221713035u;
+        uint bitwise_xor_23 = (mul_22 ^ (mul_22 >> 16)) ^ uint(divide_7);
+        uint mul_24 = (bitwise_xor_23 ^ (bitwise_xor_23 >> 16)) * 2146121005u;
+        uint mul_25 = (mul_24 ^ (mul_24 >> 15)) * 2221713035u;
+        uint bitwise_xor_26 = (mul_25 ^ (mul_25 >> 16)) ^ uint(right_shift_13);
+        uint mul_27 = (bitwise_xor_26 ^ (bitwise_xor_26 >> 16)) * 2146121005u;
+        uint mul_28 = (mul_27 ^ (mul_27 >> 15)) * 2221713035u;
+        outColor = float((slice_11 != (bit_and_14 && (float(((mul_28 ^ (mul_28 >> 16)) >> 8)) < (probability * 16777216.0)))));
+    }`,
+    ['1f', 'probability', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'state', undefined, 'state_tile'],
+    ['tex', 'targets']);
+
+let measurementFlipLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform sampler2D targets;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform float probability;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int divide_2 = add_0 / func_int_1;
+        int func_int_3 = int(state_tile.x);
+        int mul_4 = divide_2 * func_int_3;
+        int mod_5 = add_0 % func_int_1;
+        int add_6 = mul_4 + clamp(mod_5, 0, (func_int_3 - 1));
+        int func_int_7 = int(state_size.x);
+        int func_clamp_8 = clamp(add_6, 0, (func_int_7 - 1));
+        int func_int_9 = int(state_layer.x);
+        int mod_10 = func_clamp_8 % func_int_9;
+        int add_11 = y + int(out_origin.y);
+        int func_int_12 = int(out_tile.y);
+        int divide_13 = add_11 / func_int_12;
+        int func_int_14 = int(state_tile.y);
+        int mul_15 = divide_13 * func_int_14;
+        int mod_16 = add_11 % func_int_12;
+        int func_clamp_17 = clamp((mul_15 + clamp(mod_16, 0, (func_int_14 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_18 = int(state_layer.y);
+        bool fetch_19 = texelFetch(state, ivec3(mod_10, (func_clamp_17 % func_int_18), (((func_clamp_17 / func_int_18) * (((func_int_7 + func_int_9) - 1) / func_int_9)) + (func_clamp_8 / func_int_9))), 0).x > 0.5;
+        bool bit_and_20 = (mod_5 == 0) && ((mod_16 & 1) == 1);
+        int right_shift_21 = mod_16 >> 1;
+        bool bit_and_22 = bit_and_20 && (texelFetch(targets, clamp(ivec2(0, right_shift_21), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5);
+        uint mul_23 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+        uint mul_24 = (mul_23 ^ (mul_23 >> 15)) * 2221713035u;
+        uint bitwise_xor_25 = (mul_24 ^ (mul_24 >> 16)) ^ rand_counter;
+        uint mul_26 = (bitwise_xor_25 ^ (bitwise_xor_25 >> 16)) * 2146121005u;
+        uint mul_27 = (mul_26 ^ (mul_26 >> 15)) * 2221713035u;
+        uint bitwise_xor_28 = (mul_27 ^ (mul_27 >> 16)) ^ uint(divide_2);
+        uint mul_29 = (bitwise_xor_28 ^ (bitwise_xor_28 >> 16)) * 2146121005u;
+        uint mul_30 = (mul_29 ^ (mul_29 >> 15)) * 2221713035u;
+        uint bitwise_xor_31 = (mul_30 ^ (mul_30 >> 16)) ^ uint(divide_13);
+        uint mul_32 = (bitwise_xor_31 ^ (bitwise_xor_31 >> 16)) * 2146121005u;
+        uint mul_33 = (mul_32 ^ (mul_32 >> 15)) * 2221713035u;
+        uint bitwise_xor_34 = (mul_33 ^ (mul_33 >> 16)) ^ uint(right_shift_21);
+        uint mul_35 = (bitwise_xor_34 ^ (bitwise_xor_34 >> 16)) * 2146121005u;
+        uint mul_36 = (mul_35 ^ (mul_35 >> 15)) * 2221713035u;
+        outColor = float((fetch_19 != (bit_and_22 && (float(((mul_36 ^ (mul_36 >> 16)) >> 8)) < (probability * 16777216.0)))));
+    }`,
+    ['1f', 'probability', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer'],
+    ['tex', 'targets']);
+
+let measurementFlipSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform sampler2D targets;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform float probability;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool bit_and_0 = (x == 0) && ((y & 1) == 1);
+        int right_shift_1 = y >> 1;
+        bool bit_and_2 = bit_and_0 && (texelFetch(targets, clamp(ivec2(0, right_shift_1), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5);
+        uint mul_3 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+        uint mul_4 = (mul_3 ^ (mul_3 >> 15)) * 2221713035u;
+        uint bitwise_xor_5 = (mul_4 ^ (mul_4 >> 16)) ^ rand_counter;
+        uint mul_6 = (bitwise_xor_5 ^ (bitwise_xor_5 >> 16)) * 2146121005u;
+        uint mul_7 = (mul_6 ^ (mul_6 >> 15)) * 2221713035u;
+        uint bitwise_xor_8 = mul_7 ^ (mul_7 >> 16);
+        uint mul_9 = (bitwise_xor_8 ^ (bitwise_xor_8 >> 16)) * 2146121005u;
+        uint mul_10 = (mul_9 ^ (mul_9 >> 15)) * 2221713035u;
+        uint bitwise_xor_11 = mul_10 ^ (mul_10 >> 16);
+        uint mul_12 = (bitwise_xor_11 ^ (bitwise_xor_11 >> 16)) * 2146121005u;
+        uint mul_13 = (mul_12 ^ (mul_12 >> 15)) * 2221713035u;
+        uint bitwise_xor_14 = (mul_13 ^ (mul_13 >> 16)) ^ uint(right_shift_1);
+        uint mul_15 = (bitwise_xor_14 ^ (bitwise_xor_14 >> 16)) * 2146121005u;
+        uint mul_16 = (mul_15 ^ (mul_15 >> 15)) * 2221713035u;
+        outColor = float((v_state != (bit_and_2 && (float(((mul_16 ^ (mul_16 >> 16)) >> 8)) < (probability * 16777216.0)))));
+    }`,
+    ['1f', 'probability', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'state', undefined, 'state_tile'],
+    ['tex', 'targets']);
+
+registerLayered(measurementFlip, measurementFlipLayered);
+registerFootprint(measurementFlip, 'state', ({}) => [
+    [0, 1, 0, Infinity],
+]);
+registerSingleShot(measurementFlip, measurementFlipSingleShot);
+
+export {measurementFlip}
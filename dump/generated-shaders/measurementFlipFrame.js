@@ -0,0 +1,97 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered} from 'src/sim/ShaderVariants.js'
+
+let measurementFlipFrame = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D record;
+    uniform sampler2D targets;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform float probability;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_record = texelFetch(record, clamp(ivec2(x, y), ivec2(0), textureSize(record, 0) - 1), 0).x > 0.5;
+        bool slice_0 = texelFetch(targets, clamp(ivec2(0, x), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5;
+        uint mul_1 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+        uint mul_2 = (mul_1 ^ (mul_1 >> 15)) * 2221713035u;
+        uint bitwise_xor_3 = (mul_2 ^ (mul_2 >> 16)) ^ rand_counter;
+        uint mul_4 = (bitwise_xor_3 ^ (bitwise_xor_3 >> 16)) * 2146121005u;
+        uint mul_5 = (mul_4 ^ (mul_4 >> 15)) * 2221713035u;
+        uint bitwise_xor_6 = mul_5 ^ (mul_5 >> 16);
+        uint mul_7 = (bitwise_xor_6 ^ (bitwise_xor_6 >> 16)) * 2146121005u;
+        uint mul_8 = (mul_7 ^ (mul_7 >> 15)) * 2221713035u;
+        uint bitwise_xor_9 = mul_8 ^ (mul_8 >> 16);
+        uint mul_10 = (bitwise_xor_9 ^ (bitwise_xor_9 >> 16)) * 2146121005u;
+        uint mul_11 = (mul_10 ^ (mul_10 >> 15)) * 2221713035u;
+        uint bitwise_xor_12 = (mul_11 ^ (mul_11 >> 16)) ^ uint(x);
+        uint mul_13 = (bitwise_xor_12 ^ (bitwise_xor_12 >> 16)) * 2146121005u;
+        uint mul_14 = (mul_13 ^ (mul_13 >> 15)) * 2221713035u;
+        uint bitwise_xor_15 = (mul_14 ^ (mul_14 >> 16)) ^ uint(y);
+        uint mul_16 = (bitwise_xor_15 ^ (bitwise_xor_15 >> 16)) * 2146121005u;
+        uint mul_17 = (mul_16 ^ (mul_16 >> 15)) * 2221713035u;
+        outColor = float((v_record != (slice_0 && (float(((mul_17 ^ (mul_17 >> 16)) >> 8)) < (probability * 16777216.0)))));
+    }`,
+    ['1f', 'probability', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'record'],
+    ['tex', 'targets']);
+
+let measurementFlipFrameLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 record_size;
+    uniform vec2 record_layer;
+    uniform highp sampler2DArray record;
+    uniform sampler2D targets;
+    uniform uint rand_seed;
+    uniform uint rand_counter;
+    uniform float probability;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(record_size.x);
+        int func_clamp_2 = clamp(add_0, 0, (func_int_1 - 1));
+        int func_int_3 = int(record_layer.x);
+        int mod_4 = func_clamp_2 % func_int_3;
+        int add_5 = y + int(out_origin.y);
+        int func_clamp_6 = clamp(add_5, 0, (int(record_size.y) - 1));
+        int func_int_7 = int(record_layer.y);
+        bool fetch_8 = texelFetch(record, ivec3(mod_4, (func_clamp_6 % func_int_7), (((func_clamp_6 / func_int_7) * (((func_int_1 + func_int_3) - 1) / func_int_3)) + (func_clamp_2 / func_int_3))), 0).x > 0.5;
+        bool slice_9 = texelFetch(targets, clamp(ivec2(0, add_0), ivec2(0), textureSize(targets, 0) - 1), 0).x > 0.5;
+        uint mul_10 = (rand_seed ^ (rand_seed >> 16)) * 2146121005u;
+        uint mul_11 = (mul_10 ^ (mul_10 >> 15)) * 2221713035u;
+        uint bitwise_xor_12 = (mul_11 ^ (mul_11 >> 16)) ^ rand_counter;
+        uint mul_13 = (bitwise_xor_12 ^ (bitwise_xor_12 >> 16)) * 2146121005u;
+        uint mul_14 = (mul_13 ^ (mul_13 >> 15)) * 2221713035u;
+        uint bitwise_xor_15 = mul_14 ^ (mul_14 >> 16);
+        uint mul_16 = (bitwise_xor_15 ^ (bitwise_xor_15 >> 16)) * 2146121005u;
+        uint mul_17 = (mul_16 ^ (mul_16 >> 15)) * 2221713035u;
+        uint bitwise_xor_18 = mul_17 ^ (mul_17 >> 16);
+        uint mul_19 = (bitwise_xor_18 ^ (bitwise_xor_18 >> 16)) * 2146121005u;
+        uint mul_20 = (mul_19 ^ (mul_19 >> 15)) * 2221713035u;
+        uint bitwise_xor_21 = (mul_20 ^ (mul_20 >> 16)) ^ uint(add_0);
+        uint mul_22 = (bitwise_xor_21 ^ (bitwise_xor_21 >> 16)) * 2146121005u;
+        uint mul_23 = (mul_22 ^ (mul_22 >> 15)) * 2221713035u;
+        uint bitwise_xor_24 = (mul_23 ^ (mul_23 >> 16)) ^ uint(add_5);
+        uint mul_25 = (bitwise_xor_24 ^ (bitwise_xor_24 >> 16)) * 2146121005u;
+        uint mul_26 = (mul_25 ^ (mul_25 >> 15)) * 2221713035u;
+        outColor = float((fetch_8 != (slice_9 && (float(((mul_26 ^ (mul_26 >> 16)) >> 8)) < (probability * 16777216.0)))));
+    }`,
+    ['1f', 'probability', false],
+    ['1ui', 'rand_counter', false],
+    ['1ui', 'rand_seed', false],
+    ['tex', 'record', 'record_size', undefined, 'record_layer'],
+    ['tex', 'targets']);
+
+registerLayered(measurementFlipFrame, measurementFlipFrameLayered);
+
+export {measurementFlipFrame}
@@ -0,0 +1,96 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let minFoldRows = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int add_2 = ((x / func_int_0) * func_int_1) + clamp((x % func_int_0), 0, (func_int_1 - 1));
+        int func_int_4 = int(state_tile.y);
+        int func_int_3 = int(out_tile.y);
+        int mul_5 = (y / func_int_3) * func_int_4;
+        int mul_6 = (y % func_int_3) * 2;
+        int sub_7 = func_int_4 - 1;
+        int slice_8 = int(texelFetch(state, ivec2(add_2, (mul_5 + clamp(mul_6, 0, sub_7))), 0).x*255.0 + 0.5);
+        int slice_9 = int(texelFetch(state, ivec2(add_2, (mul_5 + clamp((mul_6 + 1), 0, sub_7))), 0).x*255.0 + 0.5);
+        int match_10 = 
+            (slice_8 < slice_9) ? slice_8 :
+            slice_9;
+        outColor = float(match_10) / 255.0;
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let minFoldRowsLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int add_3 = ((add_0 / func_int_1) * func_int_2) + clamp((add_0 % func_int_1), 0, (func_int_2 - 1));
+        int func_int_4 = int(state_size.x);
+        int func_clamp_5 = clamp(add_3, 0, (func_int_4 - 1));
+        int func_int_6 = int(state_layer.x);
+        int mod_7 = func_clamp_5 % func_int_6;
+        int sub_14 = int(state_size.y) - 1;
+        int func_int_10 = int(state_tile.y);
+        int add_8 = y + int(out_origin.y);
+        int func_int_9 = int(out_tile.y);
+        int mul_11 = (add_8 / func_int_9) * func_int_10;
+        int mul_12 = (add_8 % func_int_9) * 2;
+        int sub_13 = func_int_10 - 1;
+        int func_clamp_15 = clamp((mul_11 + clamp(mul_12, 0, sub_13)), 0, sub_14);
+        int func_int_16 = int(state_layer.y);
+        int mod_17 = func_clamp_15 % func_int_16;
+        int divide_19 = func_clamp_5 / func_int_6;
+        int divide_18 = ((func_int_4 + func_int_6) - 1) / func_int_6;
+        int fetch_20 = int(texelFetch(state, ivec3(mod_7, mod_17, (((func_clamp_15 / func_int_16) * divide_18) + divide_19)), 0).x*255.0 + 0.5);
+        int func_clamp_21 = clamp((mul_11 + clamp((mul_12 + 1), 0, sub_13)), 0, sub_14);
+        int fetch_22 = int(texelFetch(state, ivec3(mod_7, (func_clamp_21 % func_int_16), (((func_clamp_21 / func_int_16) * divide_18) + divide_19)), 0).x*255.0 + 0.5);
+        int match_23 = 
+            (fetch_20 < fetch_22) ? fetch_20 :
+            fetch_22;
+        outColor = float(match_23) / 255.0;
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let minFoldRowsSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int slice_0 = int(texelFetch(state, clamp(ivec2(x, y*2), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int slice_1 = int(texelFetch(state, clamp(ivec2(x, y*2 + 1), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5);
+        int match_2 = 
+            (slice_0 < slice_1) ? slice_0 :
+            slice_1;
+        outColor = float(match_2) / 255.0;
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(minFoldRows, minFoldRowsLayered);
+registerSingleShot(minFoldRows, minFoldRowsSingleShot);
+
+export {minFoldRows}
@@ -0,0 +1,67 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered} from 'src/sim/ShaderVariants.js'
+
+let orAll = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 state_size;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(state_size.x);
+        int mul_1 = func_int_0 * int(state_size.y);
+        bool reduce_6 = false;
+        for (int i_2 = 0; i_2 < mul_1; i_2++) {
+            int mod_3 = i_2 % func_int_0;
+            int divide_4 = i_2 / func_int_0;
+            bool slice_5 = texelFetch(state, clamp(ivec2(mod_3, divide_4), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            reduce_6 = reduce_6 || slice_5;
+        }
+        outColor = float(reduce_6);
+    }`,
+    ['tex', 'state', 'state_size']);
+
+let orAllLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(state_size.x);
+        int func_int_1 = int(state_size.y);
+        int mul_2 = func_int_0 * func_int_1;
+        int sub_3 = func_int_0 - 1;
+        int sub_5 = func_int_1 - 1;
+        int func_int_6 = int(state_layer.y);
+        int func_int_4 = int(state_layer.x);
+        int divide_7 = ((func_int_0 + func_int_4) - 1) / func_int_4;
+        bool reduce_20 = false;
+        for (int i_8 = 0; i_8 < mul_2; i_8++) {
+            int mod_9 = i_8 % func_int_0;
+            int func_clamp_10 = clamp(mod_9, 0, sub_3);
+            int mod_11 = func_clamp_10 % func_int_4;
+            int divide_12 = i_8 / func_int_0;
+            int func_clamp_13 = clamp(divide_12, 0, sub_5);
+            int mod_14 = func_clamp_13 % func_int_6;
+            int divide_15 = func_clamp_13 / func_int_6;
+            int mul_16 = divide_15 * divide_7;
+            int divide_17 = func_clamp_10 / func_int_4;
+            int add_18 = mul_16 + divide_17;
+            bool fetch_19 = texelFetch(state, ivec3(mod_11, mod_14, add_18), 0).x > 0.5;
+            reduce_20 = reduce_20 || fetch_19;
+        }
+        outColor = float(reduce_20);
+    }`,
+    ['tex', 'state', 'state_size', undefined, 'state_layer']);
+
+registerLayered(orAll, orAllLayered);
+
+export {orAll}
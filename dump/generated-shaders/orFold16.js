@@ -0,0 +1,109 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let orFold16 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int add_7 = ((y / func_int_5) * func_int_6) + clamp((y % func_int_5), 0, (func_int_6 - 1));
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mul_3 = (x % func_int_0) * 16;
+        int sub_4 = func_int_1 - 1;
+        outColor = float(((((((((((((((((texelFetch(state, ivec2((mul_2 + clamp(mul_3, 0, sub_4)), add_7), 0).x > 0.5) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 1), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 2), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 3), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 4), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 5), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 6), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 7), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 8), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 9), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 10), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 11), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 12), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 13), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 14), 0, sub_4)), add_7), 0).x > 0.5)) || (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 15), 0, sub_4)), add_7), 0).x > 0.5)));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let orFold16Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_13 = int(state_tile.y);
+        int add_11 = y + int(out_origin.y);
+        int func_int_12 = int(out_tile.y);
+        int func_clamp_14 = clamp((((add_11 / func_int_12) * func_int_13) + clamp((add_11 % func_int_12), 0, (func_int_13 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_15 = int(state_layer.y);
+        int mod_16 = func_clamp_14 % func_int_15;
+        int func_int_6 = int(state_size.x);
+        int sub_7 = func_int_6 - 1;
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mul_4 = (add_0 % func_int_1) * 16;
+        int sub_5 = func_int_2 - 1;
+        int func_clamp_8 = clamp((mul_3 + clamp(mul_4, 0, sub_5)), 0, sub_7);
+        int func_int_9 = int(state_layer.x);
+        int mod_10 = func_clamp_8 % func_int_9;
+        int mul_17 = (func_clamp_14 / func_int_15) * (((func_int_6 + func_int_9) - 1) / func_int_9);
+        bool fetch_18 = texelFetch(state, ivec3(mod_10, mod_16, (mul_17 + (func_clamp_8 / func_int_9))), 0).x > 0.5;
+        int func_clamp_19 = clamp((mul_3 + clamp((mul_4 + 1), 0, sub_5)), 0, sub_7);
+        bool bit_or_20 = fetch_18 || (texelFetch(state, ivec3((func_clamp_19 % func_int_9), mod_16, (mul_17 + (func_clamp_19 / func_int_9))), 0).x > 0.5);
+        int func_clamp_21 = clamp((mul_3 + clamp((mul_4 + 2), 0, sub_5)), 0, sub_7);
+        bool bit_or_22 = bit_or_20 || (texelFetch(state, ivec3((func_clamp_21 % func_int_9), mod_16, (mul_17 + (func_clamp_21 / func_int_9))), 0).x > 0.5);
+        int func_clamp_23 = clamp((mul_3 + clamp((mul_4 + 3), 0, sub_5)), 0, sub_7);
+        bool bit_or_24 = bit_or_22 || (texelFetch(state, ivec3((func_clamp_23 % func_int_9), mod_16, (mul_17 + (func_clamp_23 / func_int_9))), 0).x > 0.5);
+        int func_clamp_25 = clamp((mul_3 + clamp((mul_4 + 4), 0, sub_5)), 0, sub_7);
+        bool bit_or_26 = bit_or_24 || (texelFetch(state, ivec3((func_clamp_25 % func_int_9), mod_16, (mul_17 + (func_clamp_25 / func_int_9))), 0).x > 0.5);
+        int func_clamp_27 = clamp((mul_3 + clamp((mul_4 + 5), 0, sub_5)), 0, sub_7);
+        bool bit_or_28 = bit_or_26 || (texelFetch(state, ivec3((func_clamp_27 % func_int_9), mod_16, (mul_17 + (func_clamp_27 / func_int_9))), 0).x > 0.5);
+        int func_clamp_29 = clamp((mul_3 + clamp((mul_4 + 6), 0, sub_5)), 0, sub_7);
+        bool bit_or_30 = bit_or_28 || (texelFetch(state, ivec3((func_clamp_29 % func_int_9), mod_16, (mul_17 + (func_clamp_29 / func_int_9))), 0).x > 0.5);
+        int func_clamp_31 = clamp((mul_3 + clamp((mul_4 + 7), 0, sub_5)), 0, sub_7);
+        bool bit_or_32 = bit_or_30 || (texelFetch(state, ivec3((func_clamp_31 % func_int_9), mod_16, (mul_17 + (func_clamp_31 / func_int_9))), 0).x > 0.5);
+        int func_clamp_33 = clamp((mul_3 + clamp((mul_4 + 8), 0, sub_5)), 0, sub_7);
+        bool bit_or_34 = bit_or_32 || (texelFetch(state, ivec3((func_clamp_33 % func_int_9), mod_16, (mul_17 + (func_clamp_33 / func_int_9))), 0).x > 0.5);
+        int func_clamp_35 = clamp((mul_3 + clamp((mul_4 + 9), 0, sub_5)), 0, sub_7);
+        bool bit_or_36 = bit_or_34 || (texelFetch(state, ivec3((func_clamp_35 % func_int_9), mod_16, (mul_17 + (func_clamp_35 / func_int_9))), 0).x > 0.5);
+        int func_clamp_37 = clamp((mul_3 + clamp((mul_4 + 10), 0, sub_5)), 0, sub_7);
+        bool bit_or_38 = bit_or_36 || (texelFetch(state, ivec3((func_clamp_37 % func_int_9), mod_16, (mul_17 + (func_clamp_37 / func_int_9))), 0).x > 0.5);
+        int func_clamp_39 = clamp((mul_3 + clamp((mul_4 + 11), 0, sub_5)), 0, sub_7);
+        bool bit_or_40 = bit_or_38 || (texelFetch(state, ivec3((func_clamp_39 % func_int_9), mod_16, (mul_17 + (func_clamp_39 / func_int_9))), 0).x > 0.5);
+        int func_clamp_41 = clamp((mul_3 + clamp((mul_4 + 12), 0, sub_5)), 0, sub_7);
+        bool bit_or_42 = bit_or_40 || (texelFetch(state, ivec3((func_clamp_41 % func_int_9), mod_16, (mul_17 + (func_clamp_41 / func_int_9))), 0).x > 0.5);
+        int func_clamp_43 = clamp((mul_3 + clamp((mul_4 + 13), 0, sub_5)), 0, sub_7);
+        bool bit_or_44 = bit_or_42 || (texelFetch(state, ivec3((func_clamp_43 % func_int_9), mod_16, (mul_17 + (func_clamp_43 / func_int_9))), 0).x > 0.5);
+        int func_clamp_45 = clamp((mul_3 + clamp((mul_4 + 14), 0, sub_5)), 0, sub_7);
+        bool bit_or_46 = bit_or_44 || (texelFetch(state, ivec3((func_clamp_45 % func_int_9), mod_16, (mul_17 + (func_clamp_45 / func_int_9))), 0).x > 0.5);
+        int func_clamp_47 = clamp((mul_3 + clamp((mul_4 + 15), 0, sub_5)), 0, sub_7);
+        outColor = float((bit_or_46 || (texelFetch(state, ivec3((func_clamp_47 % func_int_9), mod_16, (mul_17 + (func_clamp_47 / func_int_9))), 0).x > 0.5)));
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let orFold16SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        
+        outColor = float(((((((((((((((((texelFetch(state, clamp(ivec2(x*16, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) || (texelFetch(state, clamp(ivec2(x*16 + 1, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 2, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 3, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 4, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 5, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 6, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 7, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 8, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 9, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 10, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 11, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 12, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 13, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 14, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) || (texelFetch(state, clamp(ivec2(x*16 + 15, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(orFold16, orFold16Layered);
+registerSingleShot(orFold16, orFold16SingleShot);
+
+export {orFold16}
@@ -0,0 +1,93 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let orFold8Packed = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int add_7 = ((y / func_int_5) * func_int_6) + clamp((y % func_int_5), 0, (func_int_6 - 1));
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mul_3 = (x % func_int_0) * 8;
+        int sub_4 = func_int_1 - 1;
+        outColor = ((((((((texelFetch(state, ivec2((mul_2 + clamp(mul_3, 0, sub_4)), add_7), 0).x) | (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 1), 0, sub_4)), add_7), 0).x)) | (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 2), 0, sub_4)), add_7), 0).x)) | (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 3), 0, sub_4)), add_7), 0).x)) | (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 4), 0, sub_4)), add_7), 0).x)) | (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 5), 0, sub_4)), add_7), 0).x)) | (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 6), 0, sub_4)), add_7), 0).x)) | (texelFetch(state, ivec2((mul_2 + clamp((mul_3 + 7), 0, sub_4)), add_7), 0).x));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+let orFold8PackedLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp usampler2DArray state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_13 = int(state_tile.y);
+        int add_11 = y + int(out_origin.y);
+        int func_int_12 = int(out_tile.y);
+        int func_clamp_14 = clamp((((add_11 / func_int_12) * func_int_13) + clamp((add_11 % func_int_12), 0, (func_int_13 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_15 = int(state_layer.y);
+        int mod_16 = func_clamp_14 % func_int_15;
+        int func_int_6 = int(state_size.x);
+        int sub_7 = func_int_6 - 1;
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mul_4 = (add_0 % func_int_1) * 8;
+        int sub_5 = func_int_2 - 1;
+        int func_clamp_8 = clamp((mul_3 + clamp(mul_4, 0, sub_5)), 0, sub_7);
+        int func_int_9 = int(state_layer.x);
+        int mod_10 = func_clamp_8 % func_int_9;
+        int mul_17 = (func_clamp_14 / func_int_15) * (((func_int_6 + func_int_9) - 1) / func_int_9);
+        uint fetch_18 = texelFetch(state, ivec3(mod_10, mod_16, (mul_17 + (func_clamp_8 / func_int_9))), 0).x;
+        int func_clamp_19 = clamp((mul_3 + clamp((mul_4 + 1), 0, sub_5)), 0, sub_7);
+        uint bitwise_or_20 = fetch_18 | (texelFetch(state, ivec3((func_clamp_19 % func_int_9), mod_16, (mul_17 + (func_clamp_19 / func_int_9))), 0).x);
+        int func_clamp_21 = clamp((mul_3 + clamp((mul_4 + 2), 0, sub_5)), 0, sub_7);
+        uint bitwise_or_22 = bitwise_or_20 | (texelFetch(state, ivec3((func_clamp_21 % func_int_9), mod_16, (mul_17 + (func_clamp_21 / func_int_9))), 0).x);
+        int func_clamp_23 = clamp((mul_3 + clamp((mul_4 + 3), 0, sub_5)), 0, sub_7);
+        uint bitwise_or_24 = bitwise_or_22 | (texelFetch(state, ivec3((func_clamp_23 % func_int_9), mod_16, (mul_17 + (func_clamp_23 / func_int_9))), 0).x);
+        int func_clamp_25 = clamp((mul_3 + clamp((mul_4 + 4), 0, sub_5)), 0, sub_7);
+        uint bitwise_or_26 = bitwise_or_24 | (texelFetch(state, ivec3((func_clamp_25 % func_int_9), mod_16, (mul_17 + (func_clamp_25 / func_int_9))), 0).x);
+        int func_clamp_27 = clamp((mul_3 + clamp((mul_4 + 5), 0, sub_5)), 0, sub_7);
+        uint bitwise_or_28 = bitwise_or_26 | (texelFetch(state, ivec3((func_clamp_27 % func_int_9), mod_16, (mul_17 + (func_clamp_27 / func_int_9))), 0).x);
+        int func_clamp_29 = clamp((mul_3 + clamp((mul_4 + 6), 0, sub_5)), 0, sub_7);
+        uint bitwise_or_30 = bitwise_or_28 | (texelFetch(state, ivec3((func_clamp_29 % func_int_9), mod_16, (mul_17 + (func_clamp_29 / func_int_9))), 0).x);
+        int func_clamp_31 = clamp((mul_3 + clamp((mul_4 + 7), 0, sub_5)), 0, sub_7);
+        outColor = (bitwise_or_30 | (texelFetch(state, ivec3((func_clamp_31 % func_int_9), mod_16, (mul_17 + (func_clamp_31 / func_int_9))), 0).x));
+    }`,
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let orFold8PackedSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        
+        outColor = ((((((((texelFetch(state, clamp(ivec2(x*8, y), ivec2(0), textureSize(state, 0) - 1), 0).x) | (texelFetch(state, clamp(ivec2(x*8 + 1, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) | (texelFetch(state, clamp(ivec2(x*8 + 2, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) | (texelFetch(state, clamp(ivec2(x*8 + 3, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) | (texelFetch(state, clamp(ivec2(x*8 + 4, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) | (texelFetch(state, clamp(ivec2(x*8 + 5, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) | (texelFetch(state, clamp(ivec2(x*8 + 6, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) | (texelFetch(state, clamp(ivec2(x*8 + 7, y), ivec2(0), textureSize(state, 0) - 1), 0).x));
+    }`,
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(orFold8Packed, orFold8PackedLayered);
+registerSingleShot(orFold8Packed, orFold8PackedSingleShot);
+
+export {orFold8Packed}
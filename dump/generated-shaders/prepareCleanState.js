@@ -1,17 +1,46 @@
+////// AUTO-GENERATED CODE //////
+
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let prepareCleanState = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        
+        outColor = float((((x % int(out_tile.x)) * 2) == ((y % int(out_tile.y)) + 4)));
+    }`);
+
+let prepareCleanStateLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        
+        outColor = float(((((x + int(out_origin.x)) % int(out_tile.x)) * 2) == (((y + int(out_origin.y)) % int(out_tile.y)) + 4)));
+    }`);
+
+let prepareCleanStateSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        int mul_0 = x * 2;
-        int add_1 = y + 4;
-        bool eq_2 = mul_0 == add_1;
-        outColor = float(eq_2);
+        
+        outColor = float(((x * 2) == (y + 4)));
     }`);
 
+registerLayered(prepareCleanState, prepareCleanStateLayered);
+registerSingleShot(prepareCleanState, prepareCleanStateSingleShot);
+
 export {prepareCleanState}
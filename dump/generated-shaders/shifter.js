@@ -1,41 +1,97 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let shifter = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
     uniform vec2 offset;
-    uniform vec2 state_size;
+    uniform vec2 state_tile;
     uniform sampler2D state;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        float prop_x_0 = offset.x;
-        int func_int_1 = int(prop_x_0);
-        int sub_2 = x - func_int_1;
-        bool ge_6 = sub_2 >= 0;
-        float prop_y_3 = offset.y;
-        int func_int_4 = int(prop_y_3);
-        int sub_5 = y - func_int_4;
-        bool ge_7 = sub_5 >= 0;
-        bool bit_and_8 = ge_6 && ge_7;
-        float prop_x_9 = state_size.x;
-        int func_int_10 = int(prop_x_9);
-        bool lt_11 = sub_2 < func_int_10;
-        bool bit_and_12 = bit_and_8 && lt_11;
-        float prop_y_13 = state_size.y;
-        int func_int_14 = int(prop_y_13);
-        bool lt_15 = sub_5 < func_int_14;
-        bool bit_and_16 = bit_and_12 && lt_15;
-        int slice_17 = int((texture(state, vec2(float(sub_2) + 0.5, float(sub_5) + 0.5) / state_size)).x*255.0 + 0.5);
-        int match_18 = 
-            bit_and_16 ? slice_17 :
+        int func_int_0 = int(out_tile.x);
+        int sub_1 = (x % func_int_0) - int(offset.x);
+        int func_int_2 = int(out_tile.y);
+        int sub_3 = (y % func_int_2) - int(offset.y);
+        int func_int_4 = int(state_tile.x);
+        int func_int_5 = int(state_tile.y);
+        int match_6 = 
+            ((((sub_1 >= 0) && (sub_3 >= 0)) && (sub_1 < func_int_4)) && (sub_3 < func_int_5)) ? int(texelFetch(state, ivec2((((x / func_int_0) * func_int_4) + clamp(sub_1, 0, (func_int_4 - 1))), (((y / func_int_2) * func_int_5) + clamp(sub_3, 0, (func_int_5 - 1)))), 0).x*255.0 + 0.5) :
             0;
+        outColor = float(match_6) / 255.0;
+    }`,
+    ['2f', 'offset', true],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let shifterLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 offset;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int sub_2 = (add_0 % func_int_1) - int(offset.x);
+        bool ge_3 = sub_2 >= 0;
+        int add_4 = y + int(out_origin.y);
+        int func_int_5 = int(out_tile.y);
+        int sub_6 = (add_4 % func_int_5) - int(offset.y);
+        bool bit_and_7 = ge_3 && (sub_6 >= 0);
+        int func_int_8 = int(state_tile.x);
+        bool bit_and_9 = bit_and_7 && (sub_2 < func_int_8);
+        int func_int_10 = int(state_tile.y);
+        int match_18;
+        if ((bit_and_9 && (sub_6 < func_int_10))) {
+            int add_11 = ((add_0 / func_int_1) * func_int_8) + clamp(sub_2, 0, (func_int_8 - 1));
+            int func_int_12 = int(state_size.x);
+            int func_clamp_13 = clamp(add_11, 0, (func_int_12 - 1));
+            int func_int_14 = int(state_layer.x);
+            int mod_15 = func_clamp_13 % func_int_14;
+            int func_clamp_16 = clamp((((add_4 / func_int_5) * func_int_10) + clamp(sub_6, 0, (func_int_10 - 1))), 0, (int(state_size.y) - 1));
+            int func_int_17 = int(state_layer.y);
+            match_18 = int(texelFetch(state, ivec3(mod_15, (func_clamp_16 % func_int_17), (((func_clamp_16 / func_int_17) * (((func_int_12 + func_int_14) - 1) / func_int_14)) + (func_clamp_13 / func_int_14))), 0).x*255.0 + 0.5);
+        } else {
+            match_18 = 0;
+        }
         outColor = float(match_18) / 255.0;
     }`,
     ['2f', 'offset', true],
-    ['tex', 'state', 'state_size']);
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let shifterSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 offset;
+    uniform vec2 state_size;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int sub_0 = x - int(offset.x);
+        int sub_1 = y - int(offset.y);
+        int match_2 = 
+            ((((sub_0 >= 0) && (sub_1 >= 0)) && (sub_0 < int(state_size.x))) && (sub_1 < int(state_size.y))) ? int(texelFetch(state, clamp(ivec2(sub_0, sub_1), ivec2(0), textureSize(state, 0) - 1), 0).x*255.0 + 0.5) :
+            0;
+        outColor = float(match_2) / 255.0;
+    }`,
+    ['2f', 'offset', true],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+registerLayered(shifter, shifterLayered);
+registerSingleShot(shifter, shifterSingleShot);
 
 export {shifter}
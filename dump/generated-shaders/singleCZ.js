@@ -1,11 +1,87 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerFootprint, registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let singleCZ = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform int target1;
+    uniform int target2;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp(((((target1 + target2) - right_shift_11) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && ((right_shift_11 == target1) || (right_shift_11 == target2))))));
+    }`,
+    ['1i', 'target1', false],
+    ['1i', 'target2', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let singleCZLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform int target1;
+    uniform int target2;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(state_size.x);
+        int func_clamp_7 = clamp(add_5, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_layer.x);
+        int mod_9 = func_clamp_7 % func_int_8;
+        int sub_16 = int(state_size.y) - 1;
+        int func_int_12 = int(state_tile.y);
+        int add_10 = y + int(out_origin.y);
+        int func_int_11 = int(out_tile.y);
+        int mul_13 = (add_10 / func_int_11) * func_int_12;
+        int mod_14 = add_10 % func_int_11;
+        int sub_15 = func_int_12 - 1;
+        int func_clamp_17 = clamp((mul_13 + clamp(mod_14, 0, sub_15)), 0, sub_16);
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int divide_21 = func_clamp_7 / func_int_8;
+        int divide_20 = ((func_int_6 + func_int_8) - 1) / func_int_8;
+        bool fetch_22 = texelFetch(state, ivec3(mod_9, mod_19, (((func_clamp_17 / func_int_18) * divide_20) + divide_21)), 0).x > 0.5;
+        int right_shift_23 = mod_14 >> 1;
+        int func_clamp_24 = clamp((mul_13 + clamp(((((target1 + target2) - right_shift_23) * 2) + 1), 0, sub_15)), 0, sub_16);
+        outColor = float((fetch_22 != ((texelFetch(state, ivec3(mod_9, (func_clamp_24 % func_int_18), (((func_clamp_24 / func_int_18) * divide_20) + divide_21)), 0).x > 0.5) && (((mod_4 > 0) && ((mod_14 & 1) == 0)) && ((right_shift_23 == target1) || (right_shift_23 == target2))))));
+    }`,
+    ['1i', 'target1', false],
+    ['1i', 'target2', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let singleCZSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     uniform sampler2D state;
     uniform int target1;
     uniform int target2;
@@ -13,27 +89,19 @@ let singleCZ = new ParametrizedShader(`#version 300 es
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        bool v_state = (texture(state, gl_FragCoord.xy / state_size)).x > 0.5;
-        int add_4 = target1 + target2;
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
         int right_shift_0 = y >> 1;
-        int sub_5 = add_4 - right_shift_0;
-        int mul_11 = sub_5 * 2;
-        int add_12 = mul_11 + 1;
-        bool slice_13 = (texture(state, vec2(gl_FragCoord.x, float(add_12) + 0.5) / state_size)).x > 0.5;
-        bool gt_6 = x > 0;
-        int bitwise_and_7 = y & 1;
-        bool eq_8 = bitwise_and_7 == 0;
-        bool bit_and_9 = gt_6 && eq_8;
-        bool eq_1 = right_shift_0 == target1;
-        bool eq_2 = right_shift_0 == target2;
-        bool bit_or_3 = eq_1 || eq_2;
-        bool bit_and_10 = bit_and_9 && bit_or_3;
-        bool bit_and_14 = slice_13 && bit_and_10;
-        bool bit_xor_15 = v_state != bit_and_14;
-        outColor = float(bit_xor_15);
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, ((((target1 + target2) - right_shift_0) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && ((right_shift_0 == target1) || (right_shift_0 == target2))))));
     }`,
     ['1i', 'target1', false],
     ['1i', 'target2', false],
-    ['tex', 'state', 'state_size']);
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(singleCZ, singleCZLayered);
+registerFootprint(singleCZ, 'state', ({target1, target2}) => [
+    [1, Infinity, target1 << 1, (target1 + 1) << 1],
+    [1, Infinity, target2 << 1, (target2 + 1) << 1],
+]);
+registerSingleShot(singleCZ, singleCZSingleShot);
 
 export {singleCZ}
@@ -1,34 +1,107 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerFootprint, registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let singleHadamard = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
     uniform int target;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.y);
+        int mod_1 = y % func_int_0;
+        int func_int_2 = int(out_tile.x);
+        int mod_4 = x % func_int_2;
+        int func_int_3 = int(state_tile.x);
+        int add_5 = ((x / func_int_2) * func_int_3) + clamp(mod_4, 0, (func_int_3 - 1));
+        int func_int_6 = int(state_tile.y);
+        int mul_7 = (y / func_int_0) * func_int_6;
+        int sub_8 = func_int_6 - 1;
+        bool slice_9 = texelFetch(state, ivec2(add_5, (mul_7 + clamp(mod_1, 0, sub_8))), 0).x > 0.5;
+        bool match_10 = 
+            ((mod_1 >> 1) != target) ? slice_9 :
+            ((mod_4 == 0) && ((mod_1 & 1) == 0)) ? (!slice_9) :
+            (texelFetch(state, ivec2(add_5, (mul_7 + clamp((mod_1 ^ 1), 0, sub_8))), 0).x > 0.5);
+        outColor = float(match_10);
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let singleHadamardLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int target;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mod_2 = add_0 % func_int_1;
+        int add_3 = x + int(out_origin.x);
+        int func_int_4 = int(out_tile.x);
+        int mod_6 = add_3 % func_int_4;
+        int func_int_5 = int(state_tile.x);
+        int add_7 = ((add_3 / func_int_4) * func_int_5) + clamp(mod_6, 0, (func_int_5 - 1));
+        int func_int_8 = int(state_size.x);
+        int func_clamp_9 = clamp(add_7, 0, (func_int_8 - 1));
+        int func_int_10 = int(state_layer.x);
+        int mod_11 = func_clamp_9 % func_int_10;
+        int sub_15 = int(state_size.y) - 1;
+        int func_int_12 = int(state_tile.y);
+        int mul_13 = (add_0 / func_int_1) * func_int_12;
+        int sub_14 = func_int_12 - 1;
+        int func_clamp_16 = clamp((mul_13 + clamp(mod_2, 0, sub_14)), 0, sub_15);
+        int func_int_17 = int(state_layer.y);
+        int mod_18 = func_clamp_16 % func_int_17;
+        int divide_20 = func_clamp_9 / func_int_10;
+        int divide_19 = ((func_int_8 + func_int_10) - 1) / func_int_10;
+        bool fetch_21 = texelFetch(state, ivec3(mod_11, mod_18, (((func_clamp_16 / func_int_17) * divide_19) + divide_20)), 0).x > 0.5;
+        int func_clamp_22 = clamp((mul_13 + clamp((mod_2 ^ 1), 0, sub_14)), 0, sub_15);
+        bool match_23 = 
+            ((mod_2 >> 1) != target) ? fetch_21 :
+            ((mod_6 == 0) && ((mod_2 & 1) == 0)) ? (!fetch_21) :
+            (texelFetch(state, ivec3(mod_11, (func_clamp_22 % func_int_17), (((func_clamp_22 / func_int_17) * divide_19) + divide_20)), 0).x > 0.5);
+        outColor = float(match_23);
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let singleHadamardSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int target;
     uniform sampler2D state;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        int right_shift_0 = y >> 1;
-        bool ne_1 = right_shift_0 != target;
-        bool v_state = (texture((state), gl_FragCoord.xy / state_size)).x > 0.5;
-        bool eq_2 = x == 0;
-        int bitwise_and_3 = y & 1;
-        bool eq_4 = bitwise_and_3 == 0;
-        bool bit_and_5 = eq_2 && eq_4;
-        bool not_6 = !(v_state);
-        int bitwise_xor_7 = y ^ 1;
-        bool slice_8 = (texture((state), vec2(gl_FragCoord.x, float(bitwise_xor_7) + 0.5) / state_size)).x > 0.5;
-        bool match_9 = 
-            ne_1 ? v_state :
-            bit_and_5 ? not_6 :
-            slice_8;
-        outColor = float(match_9);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool match_0 = 
+            ((y >> 1) != target) ? v_state :
+            ((x == 0) && ((y & 1) == 0)) ? (!v_state) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float(match_0);
     }`,
     ['1i', 'target', false],
-    ['tex', 'state', 'state_size']);
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(singleHadamard, singleHadamardLayered);
+registerFootprint(singleHadamard, 'state', ({target}) => [
+    [0, Infinity, target << 1, (target + 1) << 1],
+]);
+registerSingleShot(singleHadamard, singleHadamardSingleShot);
 
 export {singleHadamard}
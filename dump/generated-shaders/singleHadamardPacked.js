@@ -0,0 +1,127 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerFootprint, registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
+
+let singleHadamardPacked = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform int target;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_3 = int(state_tile.x);
+        int func_int_2 = int(out_tile.x);
+        int mul_4 = (x / func_int_2) * func_int_3;
+        int mod_5 = x % func_int_2;
+        int add_6 = mul_4 + clamp(mod_5, 0, (func_int_3 - 1));
+        int func_int_7 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_8 = (y / func_int_0) * func_int_7;
+        int mod_1 = y % func_int_0;
+        int sub_9 = func_int_7 - 1;
+        uint slice_10 = texelFetch(state, ivec2(add_6, (mul_8 + clamp(mod_1, 0, sub_9))), 0).x;
+        uint match_13;
+        if (((mod_1 >> 1) != target)) {
+            match_13 = slice_10;
+        } else {
+            uint slice_11 = texelFetch(state, ivec2(add_6, (mul_8 + clamp((mod_1 ^ 1), 0, sub_9))), 0).x;
+            uint match_12 = 
+            ((mod_5 == 0) && ((mod_1 & 1) == 0)) ? 1u :
+            0u;
+            match_13 = ((slice_11 & (~match_12)) | ((~slice_10) & match_12));
+        }
+        outColor = match_13;
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let singleHadamardPackedLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int target;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp usampler2DArray state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_5 = int(state_tile.x);
+        int add_3 = x + int(out_origin.x);
+        int func_int_4 = int(out_tile.x);
+        int mul_6 = (add_3 / func_int_4) * func_int_5;
+        int mod_7 = add_3 % func_int_4;
+        int add_8 = mul_6 + clamp(mod_7, 0, (func_int_5 - 1));
+        int func_int_9 = int(state_size.x);
+        int func_clamp_10 = clamp(add_8, 0, (func_int_9 - 1));
+        int func_int_11 = int(state_layer.x);
+        int mod_12 = func_clamp_10 % func_int_11;
+        int sub_16 = int(state_size.y) - 1;
+        int func_int_13 = int(state_tile.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mul_14 = (add_0 / func_int_1) * func_int_13;
+        int mod_2 = add_0 % func_int_1;
+        int sub_15 = func_int_13 - 1;
+        int func_clamp_17 = clamp((mul_14 + clamp(mod_2, 0, sub_15)), 0, sub_16);
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int divide_21 = func_clamp_10 / func_int_11;
+        int divide_20 = ((func_int_9 + func_int_11) - 1) / func_int_11;
+        uint fetch_22 = texelFetch(state, ivec3(mod_12, mod_19, (((func_clamp_17 / func_int_18) * divide_20) + divide_21)), 0).x;
+        uint match_26;
+        if (((mod_2 >> 1) != target)) {
+            match_26 = fetch_22;
+        } else {
+            int func_clamp_23 = clamp((mul_14 + clamp((mod_2 ^ 1), 0, sub_15)), 0, sub_16);
+            uint fetch_24 = texelFetch(state, ivec3(mod_12, (func_clamp_23 % func_int_18), (((func_clamp_23 / func_int_18) * divide_20) + divide_21)), 0).x;
+            uint match_25 = 
+            ((mod_7 == 0) && ((mod_2 & 1) == 0)) ? 1u :
+            0u;
+            match_26 = ((fetch_24 & (~match_25)) | ((~fetch_22) & match_25));
+        }
+        outColor = match_26;
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let singleHadamardPackedSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int target;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_2;
+        if (((y >> 1) != target)) {
+            match_2 = v_state;
+        } else {
+            uint slice_0 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            uint match_1 = 
+            ((x == 0) && ((y & 1) == 0)) ? 1u :
+            0u;
+            match_2 = ((slice_0 & (~match_1)) | ((~v_state) & match_1));
+        }
+        outColor = match_2;
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(singleHadamardPacked, singleHadamardPackedLayered);
+registerFootprint(singleHadamardPacked, 'state', ({target}) => [
+    [0, Infinity, target << 1, (target + 1) << 1],
+]);
+registerSingleShot(singleHadamardPacked, singleHadamardPackedSingleShot);
+
+export {singleHadamardPacked}
@@ -1,27 +1,88 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerFootprint, registerLayered, registerSingleShot} from 'src/sim/ShaderVariants.js'
 
 let singleX = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform int target;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        outColor = float(((texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, (func_int_6 - 1)))), 0).x > 0.5) != ((mod_3 < 2) && (mod_8 == ((target * 2) + mod_3)))));
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let singleXLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform int target;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(state_size.x);
+        int func_clamp_7 = clamp(add_5, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_layer.x);
+        int mod_9 = func_clamp_7 % func_int_8;
+        int func_int_12 = int(state_tile.y);
+        int add_10 = y + int(out_origin.y);
+        int func_int_11 = int(out_tile.y);
+        int mul_13 = (add_10 / func_int_11) * func_int_12;
+        int mod_14 = add_10 % func_int_11;
+        int func_clamp_15 = clamp((mul_13 + clamp(mod_14, 0, (func_int_12 - 1))), 0, (int(state_size.y) - 1));
+        int func_int_16 = int(state_layer.y);
+        outColor = float(((texelFetch(state, ivec3(mod_9, (func_clamp_15 % func_int_16), (((func_clamp_15 / func_int_16) * (((func_int_6 + func_int_8) - 1) / func_int_8)) + (func_clamp_7 / func_int_8))), 0).x > 0.5) != ((mod_4 < 2) && (mod_14 == ((target * 2) + mod_4)))));
+    }`,
+    ['1i', 'target', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let singleXSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     uniform sampler2D state;
     uniform int target;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        bool v_state = (texture((state), gl_FragCoord.xy / state_size)).x > 0.5;
-        bool lt_0 = x < 2;
-        int mul_1 = target * 2;
-        int add_2 = mul_1 + x;
-        bool eq_3 = y == add_2;
-        bool bit_and_4 = lt_0 && eq_3;
-        bool ne_5 = v_state != bit_and_4;
-        outColor = float(ne_5);
+        
+        outColor = float(((texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) != ((x < 2) && (y == ((target * 2) + x)))));
     }`,
     ['1i', 'target', false],
-    ['tex', 'state', 'state_size']);
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(singleX, singleXLayered);
+registerFootprint(singleX, 'state', ({target}) => [
+    [0, 2, target * 2, (target * 2) + 2],
+]);
+registerSingleShot(singleX, singleXSingleShot);
 
 export {singleX}
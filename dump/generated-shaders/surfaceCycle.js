@@ -0,0 +1,3355 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {pickVariant, registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
+
+let surfaceCyclePass0 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform int surface_width;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.x);
+        int mod_1 = x % func_int_0;
+        bool eq_2 = mod_1 == 0;
+        int func_int_3 = int(out_tile.y);
+        int mod_4 = y % func_int_3;
+        bool eq_5 = (mod_4 & 1) == 0;
+        int func_int_6 = int(state_tile.x);
+        int add_7 = ((x / func_int_0) * func_int_6) + clamp(mod_1, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = (y / func_int_3) * func_int_8;
+        int sub_10 = func_int_8 - 1;
+        bool match_11 = 
+            (eq_2 && eq_5) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(mod_4, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((mod_4 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_12 = mod_4 >> 1;
+        int divide_13 = right_shift_12 / surface_width;
+        int mul_14 = divide_13 * surface_width;
+        int mod_15 = right_shift_12 % surface_width;
+        int add_16 = mod_15 + 1;
+        int func_clamp_17 = clamp((((mul_14 + ((add_16 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_18 = 
+            (eq_2 && ((func_clamp_17 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_17, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_17 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool gt_19 = mod_1 > 0;
+        bool bit_and_20 = gt_19 && eq_5;
+        bool eq_21 = (divide_13 & 1) == 1;
+        bool bit_xor_22 = match_11 != (match_18 && (bit_and_20 && ((((add_16 | 1) - 1) < surface_width) && eq_21)));
+        int func_clamp_23 = clamp((((mul_14 + (mod_15 ^ 1)) * 2) + 1), 0, sub_10);
+        bool eq_24 = (func_clamp_23 & 1) == 0;
+        bool match_25 = 
+            (eq_2 && eq_24) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_23, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_23 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_26 = func_clamp_23 >> 1;
+        int divide_27 = right_shift_26 / surface_width;
+        int mul_28 = divide_27 * surface_width;
+        int add_29 = (right_shift_26 % surface_width) + 1;
+        int func_clamp_30 = clamp((((mul_28 + ((add_29 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_31 = 
+            (eq_2 && ((func_clamp_30 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_30, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_30 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool bit_xor_32 = bit_xor_22 != ((match_25 != (match_31 && ((gt_19 && eq_24) && ((((add_29 | 1) - 1) < surface_width) && ((divide_27 & 1) == 1))))) && (bit_and_20 && (((mod_15 | 1) < surface_width) && eq_21)));
+        int add_33 = divide_13 + 1;
+        int func_clamp_34 = clamp(((((((add_33 ^ 1) - 1) * surface_width) + mod_15) * 2) + 1), 0, sub_10);
+        bool eq_35 = (func_clamp_34 & 1) == 0;
+        bool match_36 = 
+            (eq_2 && eq_35) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_34, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_34 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_37 = func_clamp_34 >> 1;
+        int divide_38 = right_shift_37 / surface_width;
+        int mul_39 = divide_38 * surface_width;
+        int mod_40 = right_shift_37 % surface_width;
+        int add_41 = mod_40 + 1;
+        int func_clamp_42 = clamp((((mul_39 + ((add_41 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_43 = 
+            (eq_2 && ((func_clamp_42 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_42, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_42 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool bit_and_44 = gt_19 && eq_35;
+        bool eq_45 = (divide_38 & 1) == 1;
+        bool bit_xor_46 = match_36 != (match_43 && (bit_and_44 && ((((add_41 | 1) - 1) < surface_width) && eq_45)));
+        int func_clamp_47 = clamp((((mul_39 + (mod_40 ^ 1)) * 2) + 1), 0, sub_10);
+        bool eq_48 = (func_clamp_47 & 1) == 0;
+        bool match_49 = 
+            (eq_2 && eq_48) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_47, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_47 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_50 = func_clamp_47 >> 1;
+        int divide_51 = right_shift_50 / surface_width;
+        int mul_52 = divide_51 * surface_width;
+        int add_53 = (right_shift_50 % surface_width) + 1;
+        int func_clamp_54 = clamp((((mul_52 + ((add_53 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_55 = 
+            (eq_2 && ((func_clamp_54 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_54, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_54 ^ 1), 0, sub_10))), 0).x > 0.5);
+        outColor = float((bit_xor_32 != ((bit_xor_46 != ((match_49 != (match_55 && ((gt_19 && eq_48) && ((((add_53 | 1) - 1) < surface_width) && ((divide_51 & 1) == 1))))) && (bit_and_44 && (((mod_40 | 1) < surface_width) && eq_45)))) && (bit_and_20 && ((((add_33 | 1) - 1) < surface_height) && ((mod_15 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform int surface_width;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mod_2 = add_0 % func_int_1;
+        bool eq_3 = mod_2 == 0;
+        int add_4 = y + int(out_origin.y);
+        int func_int_5 = int(out_tile.y);
+        int mod_6 = add_4 % func_int_5;
+        bool eq_7 = (mod_6 & 1) == 0;
+        int func_int_8 = int(state_tile.x);
+        int add_9 = ((add_0 / func_int_1) * func_int_8) + clamp(mod_2, 0, (func_int_8 - 1));
+        int func_int_10 = int(state_size.x);
+        int func_clamp_11 = clamp(add_9, 0, (func_int_10 - 1));
+        int func_int_12 = int(state_layer.x);
+        int mod_13 = func_clamp_11 % func_int_12;
+        int sub_17 = int(state_size.y) - 1;
+        int func_int_14 = int(state_tile.y);
+        int mul_15 = (add_4 / func_int_5) * func_int_14;
+        int sub_16 = func_int_14 - 1;
+        int func_clamp_18 = clamp((mul_15 + clamp(mod_6, 0, sub_16)), 0, sub_17);
+        int func_int_19 = int(state_layer.y);
+        int divide_21 = func_clamp_11 / func_int_12;
+        int divide_20 = ((func_int_10 + func_int_12) - 1) / func_int_12;
+        int func_clamp_22 = clamp((mul_15 + clamp((mod_6 ^ 1), 0, sub_16)), 0, sub_17);
+        bool match_23 = 
+            (eq_3 && eq_7) ? (!(texelFetch(state, ivec3(mod_13, (func_clamp_18 % func_int_19), (((func_clamp_18 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_13, (func_clamp_22 % func_int_19), (((func_clamp_22 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5);
+        int right_shift_24 = mod_6 >> 1;
+        int divide_25 = right_shift_24 / surface_width;
+        int mul_26 = divide_25 * surface_width;
+        int mod_27 = right_shift_24 % surface_width;
+        int add_28 = mod_27 + 1;
+        int func_clamp_29 = clamp((((mul_26 + ((add_28 ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        int func_clamp_30 = clamp((mul_15 + clamp(func_clamp_29, 0, sub_16)), 0, sub_17);
+        int func_clamp_31 = clamp((mul_15 + clamp((func_clamp_29 ^ 1), 0, sub_16)), 0, sub_17);
+        bool match_32 = 
+            (eq_3 && ((func_clamp_29 & 1) == 0)) ? (!(texelFetch(state, ivec3(mod_13, (func_clamp_30 % func_int_19), (((func_clamp_30 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_13, (func_clamp_31 % func_int_19), (((func_clamp_31 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5);
+        bool gt_33 = mod_2 > 0;
+        bool bit_and_34 = gt_33 && eq_7;
+        bool eq_35 = (divide_25 & 1) == 1;
+        bool bit_xor_36 = match_23 != (match_32 && (bit_and_34 && ((((add_28 | 1) - 1) < surface_width) && eq_35)));
+        int func_clamp_37 = clamp((((mul_26 + (mod_27 ^ 1)) * 2) + 1), 0, sub_16);
+        bool eq_38 = (func_clamp_37 & 1) == 0;
+        int func_clamp_39 = clamp((mul_15 + clamp(func_clamp_37, 0, sub_16)), 0, sub_17);
+        int func_clamp_40 = clamp((mul_15 + clamp((func_clamp_37 ^ 1), 0, sub_16)), 0, sub_17);
+        bool match_41 = 
+            (eq_3 && eq_38) ? (!(texelFetch(state, ivec3(mod_13, (func_clamp_39 % func_int_19), (((func_clamp_39 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_13, (func_clamp_40 % func_int_19), (((func_clamp_40 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5);
+        int right_shift_42 = func_clamp_37 >> 1;
+        int divide_43 = right_shift_42 / surface_width;
+        int mul_44 = divide_43 * surface_width;
+        int add_45 = (right_shift_42 % surface_width) + 1;
+        int func_clamp_46 = clamp((((mul_44 + ((add_45 ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        int func_clamp_47 = clamp((mul_15 + clamp(func_clamp_46, 0, sub_16)), 0, sub_17);
+        int func_clamp_48 = clamp((mul_15 + clamp((func_clamp_46 ^ 1), 0, sub_16)), 0, sub_17);
+        bool match_49 = 
+            (eq_3 && ((func_clamp_46 & 1) == 0)) ? (!(texelFetch(state, ivec3(mod_13, (func_clamp_47 % func_int_19), (((func_clamp_47 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_13, (func_clamp_48 % func_int_19), (((func_clamp_48 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5);
+        bool bit_xor_50 = bit_xor_36 != ((match_41 != (match_49 && ((gt_33 && eq_38) && ((((add_45 | 1) - 1) < surface_width) && ((divide_43 & 1) == 1))))) && (bit_and_34 && (((mod_27 | 1) < surface_width) && eq_35)));
+        int add_51 = divide_25 + 1;
+        int func_clamp_52 = clamp(((((((add_51 ^ 1) - 1) * surface_width) + mod_27) * 2) + 1), 0, sub_16);
+        bool eq_53 = (func_clamp_52 & 1) == 0;
+        int func_clamp_54 = clamp((mul_15 + clamp(func_clamp_52, 0, sub_16)), 0, sub_17);
+        int func_clamp_55 = clamp((mul_15 + clamp((func_clamp_52 ^ 1), 0, sub_16)), 0, sub_17);
+        bool match_56 = 
+            (eq_3 && eq_53) ? (!(texelFetch(state, ivec3(mod_13, (func_clamp_54 % func_int_19), (((func_clamp_54 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_13, (func_clamp_55 % func_int_19), (((func_clamp_55 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5);
+        int right_shift_57 = func_clamp_52 >> 1;
+        int divide_58 = right_shift_57 / surface_width;
+        int mul_59 = divide_58 * surface_width;
+        int mod_60 = right_shift_57 % surface_width;
+        int add_61 = mod_60 + 1;
+        int func_clamp_62 = clamp((((mul_59 + ((add_61 ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        int func_clamp_63 = clamp((mul_15 + clamp(func_clamp_62, 0, sub_16)), 0, sub_17);
+        int func_clamp_64 = clamp((mul_15 + clamp((func_clamp_62 ^ 1), 0, sub_16)), 0, sub_17);
+        bool match_65 = 
+            (eq_3 && ((func_clamp_62 & 1) == 0)) ? (!(texelFetch(state, ivec3(mod_13, (func_clamp_63 % func_int_19), (((func_clamp_63 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_13, (func_clamp_64 % func_int_19), (((func_clamp_64 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5);
+        bool bit_and_66 = gt_33 && eq_53;
+        bool eq_67 = (divide_58 & 1) == 1;
+        bool bit_xor_68 = match_56 != (match_65 && (bit_and_66 && ((((add_61 | 1) - 1) < surface_width) && eq_67)));
+        int func_clamp_69 = clamp((((mul_59 + (mod_60 ^ 1)) * 2) + 1), 0, sub_16);
+        bool eq_70 = (func_clamp_69 & 1) == 0;
+        int func_clamp_71 = clamp((mul_15 + clamp(func_clamp_69, 0, sub_16)), 0, sub_17);
+        int func_clamp_72 = clamp((mul_15 + clamp((func_clamp_69 ^ 1), 0, sub_16)), 0, sub_17);
+        bool match_73 = 
+            (eq_3 && eq_70) ? (!(texelFetch(state, ivec3(mod_13, (func_clamp_71 % func_int_19), (((func_clamp_71 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_13, (func_clamp_72 % func_int_19), (((func_clamp_72 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5);
+        int right_shift_74 = func_clamp_69 >> 1;
+        int divide_75 = right_shift_74 / surface_width;
+        int mul_76 = divide_75 * surface_width;
+        int add_77 = (right_shift_74 % surface_width) + 1;
+        int func_clamp_78 = clamp((((mul_76 + ((add_77 ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        int func_clamp_79 = clamp((mul_15 + clamp(func_clamp_78, 0, sub_16)), 0, sub_17);
+        int func_clamp_80 = clamp((mul_15 + clamp((func_clamp_78 ^ 1), 0, sub_16)), 0, sub_17);
+        bool match_81 = 
+            (eq_3 && ((func_clamp_78 & 1) == 0)) ? (!(texelFetch(state, ivec3(mod_13, (func_clamp_79 % func_int_19), (((func_clamp_79 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5)) :
+            (texelFetch(state, ivec3(mod_13, (func_clamp_80 % func_int_19), (((func_clamp_80 / func_int_19) * divide_20) + divide_21)), 0).x > 0.5);
+        outColor = float((bit_xor_50 != ((bit_xor_68 != ((match_73 != (match_81 && ((gt_33 && eq_70) && ((((add_77 | 1) - 1) < surface_width) && ((divide_75 & 1) == 1))))) && (bit_and_66 && (((mod_60 | 1) < surface_width) && eq_67)))) && (bit_and_34 && ((((add_51 | 1) - 1) < surface_height) && ((mod_27 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCyclePass0SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform int surface_width;
+    uniform vec2 state_size;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool eq_0 = x == 0;
+        bool eq_1 = (y & 1) == 0;
+        bool match_2 = 
+            (eq_0 && eq_1) ? (!(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int sub_8 = int(state_size.y) - 1;
+        int right_shift_3 = y >> 1;
+        int divide_4 = right_shift_3 / surface_width;
+        int mul_5 = divide_4 * surface_width;
+        int mod_6 = right_shift_3 % surface_width;
+        int add_7 = mod_6 + 1;
+        int func_clamp_9 = clamp((((mul_5 + ((add_7 ^ 1) - 1)) * 2) + 1), 0, sub_8);
+        bool match_10 = 
+            (eq_0 && ((func_clamp_9 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_9), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_9 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool gt_11 = x > 0;
+        bool bit_and_12 = gt_11 && eq_1;
+        bool eq_13 = (divide_4 & 1) == 1;
+        bool bit_xor_14 = match_2 != (match_10 && (bit_and_12 && ((((add_7 | 1) - 1) < surface_width) && eq_13)));
+        int func_clamp_15 = clamp((((mul_5 + (mod_6 ^ 1)) * 2) + 1), 0, sub_8);
+        bool eq_16 = (func_clamp_15 & 1) == 0;
+        bool match_17 = 
+            (eq_0 && eq_16) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_15), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_15 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_18 = func_clamp_15 >> 1;
+        int divide_19 = right_shift_18 / surface_width;
+        int mul_20 = divide_19 * surface_width;
+        int add_21 = (right_shift_18 % surface_width) + 1;
+        int func_clamp_22 = clamp((((mul_20 + ((add_21 ^ 1) - 1)) * 2) + 1), 0, sub_8);
+        bool match_23 = 
+            (eq_0 && ((func_clamp_22 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_22), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_22 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool bit_xor_24 = bit_xor_14 != ((match_17 != (match_23 && ((gt_11 && eq_16) && ((((add_21 | 1) - 1) < surface_width) && ((divide_19 & 1) == 1))))) && (bit_and_12 && (((mod_6 | 1) < surface_width) && eq_13)));
+        int add_25 = divide_4 + 1;
+        int func_clamp_26 = clamp(((((((add_25 ^ 1) - 1) * surface_width) + mod_6) * 2) + 1), 0, sub_8);
+        bool eq_27 = (func_clamp_26 & 1) == 0;
+        bool match_28 = 
+            (eq_0 && eq_27) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_26), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_26 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_29 = func_clamp_26 >> 1;
+        int divide_30 = right_shift_29 / surface_width;
+        int mul_31 = divide_30 * surface_width;
+        int mod_32 = right_shift_29 % surface_width;
+        int add_33 = mod_32 + 1;
+        int func_clamp_34 = clamp((((mul_31 + ((add_33 ^ 1) - 1)) * 2) + 1), 0, sub_8);
+        bool match_35 = 
+            (eq_0 && ((func_clamp_34 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_34), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_34 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool bit_and_36 = gt_11 && eq_27;
+        bool eq_37 = (divide_30 & 1) == 1;
+        bool bit_xor_38 = match_28 != (match_35 && (bit_and_36 && ((((add_33 | 1) - 1) < surface_width) && eq_37)));
+        int func_clamp_39 = clamp((((mul_31 + (mod_32 ^ 1)) * 2) + 1), 0, sub_8);
+        bool eq_40 = (func_clamp_39 & 1) == 0;
+        bool match_41 = 
+            (eq_0 && eq_40) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_39), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_39 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_42 = func_clamp_39 >> 1;
+        int divide_43 = right_shift_42 / surface_width;
+        int mul_44 = divide_43 * surface_width;
+        int add_45 = (right_shift_42 % surface_width) + 1;
+        int func_clamp_46 = clamp((((mul_44 + ((add_45 ^ 1) - 1)) * 2) + 1), 0, sub_8);
+        bool match_47 = 
+            (eq_0 && ((func_clamp_46 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_46), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_46 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float((bit_xor_24 != ((bit_xor_38 != ((match_41 != (match_47 && ((gt_11 && eq_40) && ((((add_45 | 1) - 1) < surface_width) && ((divide_43 & 1) == 1))))) && (bit_and_36 && (((mod_32 | 1) < surface_width) && eq_37)))) && (bit_and_12 && ((((add_25 | 1) - 1) < surface_height) && ((mod_6 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.x);
+        int mod_1 = x % func_int_0;
+        bool eq_2 = mod_1 == 0;
+        int func_int_3 = int(out_tile.y);
+        int mod_4 = y % func_int_3;
+        bool eq_5 = (mod_4 & 1) == 0;
+        int func_int_6 = int(state_tile.x);
+        int add_7 = ((x / func_int_0) * func_int_6) + clamp(mod_1, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = (y / func_int_3) * func_int_8;
+        int sub_10 = func_int_8 - 1;
+        bool match_11 = 
+            (eq_2 && eq_5) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(mod_4, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((mod_4 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_12 = mod_4 >> 1;
+        int right_shift_13 = (right_shift_12 * 26215) >> 17;
+        int mul_14 = right_shift_13 * 5;
+        int sub_15 = right_shift_12 - mul_14;
+        int func_clamp_16 = clamp((((mul_14 + (((sub_15 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_17 = 
+            (eq_2 && ((func_clamp_16 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_16, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_16 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool gt_18 = mod_1 > 0;
+        bool bit_and_19 = gt_18 && eq_5;
+        bool eq_20 = (right_shift_13 & 1) == 1;
+        bool bit_xor_21 = match_11 != (match_17 && (bit_and_19 && eq_20));
+        int func_clamp_22 = clamp((((mul_14 + (sub_15 ^ 1)) * 2) + 1), 0, sub_10);
+        bool eq_23 = (func_clamp_22 & 1) == 0;
+        bool match_24 = 
+            (eq_2 && eq_23) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_22, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_22 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_25 = func_clamp_22 >> 1;
+        int right_shift_26 = (right_shift_25 * 26215) >> 17;
+        int mul_27 = right_shift_26 * 5;
+        int func_clamp_28 = clamp((((mul_27 + ((((right_shift_25 - mul_27) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_29 = 
+            (eq_2 && ((func_clamp_28 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_28, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_28 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool bit_xor_30 = bit_xor_21 != ((match_24 != (match_29 && ((gt_18 && eq_23) && ((right_shift_26 & 1) == 1)))) && (bit_and_19 && (((sub_15 | 1) < 5) && eq_20)));
+        int add_31 = right_shift_13 + 1;
+        int func_clamp_32 = clamp(((((((add_31 ^ 1) - 1) * 5) + sub_15) * 2) + 1), 0, sub_10);
+        bool eq_33 = (func_clamp_32 & 1) == 0;
+        bool match_34 = 
+            (eq_2 && eq_33) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_32, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_32 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_35 = func_clamp_32 >> 1;
+        int right_shift_36 = (right_shift_35 * 26215) >> 17;
+        int mul_37 = right_shift_36 * 5;
+        int sub_38 = right_shift_35 - mul_37;
+        int func_clamp_39 = clamp((((mul_37 + (((sub_38 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_40 = 
+            (eq_2 && ((func_clamp_39 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_39, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_39 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool bit_and_41 = gt_18 && eq_33;
+        bool eq_42 = (right_shift_36 & 1) == 1;
+        bool bit_xor_43 = match_34 != (match_40 && (bit_and_41 && eq_42));
+        int func_clamp_44 = clamp((((mul_37 + (sub_38 ^ 1)) * 2) + 1), 0, sub_10);
+        bool eq_45 = (func_clamp_44 & 1) == 0;
+        bool match_46 = 
+            (eq_2 && eq_45) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_44, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_44 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_47 = func_clamp_44 >> 1;
+        int right_shift_48 = (right_shift_47 * 26215) >> 17;
+        int mul_49 = right_shift_48 * 5;
+        int func_clamp_50 = clamp((((mul_49 + ((((right_shift_47 - mul_49) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_51 = 
+            (eq_2 && ((func_clamp_50 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_50, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_50 ^ 1), 0, sub_10))), 0).x > 0.5);
+        outColor = float((bit_xor_30 != ((bit_xor_43 != ((match_46 != (match_51 && ((gt_18 && eq_45) && ((right_shift_48 & 1) == 1)))) && (bit_and_41 && (((sub_38 | 1) < 5) && eq_42)))) && (bit_and_19 && ((((add_31 | 1) - 1) < 5) && ((sub_15 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height5_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool eq_0 = x == 0;
+        bool eq_1 = (y & 1) == 0;
+        bool match_2 = 
+            (eq_0 && eq_1) ? (!(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int sub_7 = int(state_size.y) - 1;
+        int right_shift_3 = y >> 1;
+        int right_shift_4 = (right_shift_3 * 26215) >> 17;
+        int mul_5 = right_shift_4 * 5;
+        int sub_6 = right_shift_3 - mul_5;
+        int func_clamp_8 = clamp((((mul_5 + (((sub_6 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_9 = 
+            (eq_0 && ((func_clamp_8 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_8), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_8 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool gt_10 = x > 0;
+        bool bit_and_11 = gt_10 && eq_1;
+        bool eq_12 = (right_shift_4 & 1) == 1;
+        bool bit_xor_13 = match_2 != (match_9 && (bit_and_11 && eq_12));
+        int func_clamp_14 = clamp((((mul_5 + (sub_6 ^ 1)) * 2) + 1), 0, sub_7);
+        bool eq_15 = (func_clamp_14 & 1) == 0;
+        bool match_16 = 
+            (eq_0 && eq_15) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_14), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_14 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_17 = func_clamp_14 >> 1;
+        int right_shift_18 = (right_shift_17 * 26215) >> 17;
+        int mul_19 = right_shift_18 * 5;
+        int func_clamp_20 = clamp((((mul_19 + ((((right_shift_17 - mul_19) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_21 = 
+            (eq_0 && ((func_clamp_20 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_20), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_20 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool bit_xor_22 = bit_xor_13 != ((match_16 != (match_21 && ((gt_10 && eq_15) && ((right_shift_18 & 1) == 1)))) && (bit_and_11 && (((sub_6 | 1) < 5) && eq_12)));
+        int add_23 = right_shift_4 + 1;
+        int func_clamp_24 = clamp(((((((add_23 ^ 1) - 1) * 5) + sub_6) * 2) + 1), 0, sub_7);
+        bool eq_25 = (func_clamp_24 & 1) == 0;
+        bool match_26 = 
+            (eq_0 && eq_25) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_24), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_24 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_27 = func_clamp_24 >> 1;
+        int right_shift_28 = (right_shift_27 * 26215) >> 17;
+        int mul_29 = right_shift_28 * 5;
+        int sub_30 = right_shift_27 - mul_29;
+        int func_clamp_31 = clamp((((mul_29 + (((sub_30 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_32 = 
+            (eq_0 && ((func_clamp_31 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_31), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_31 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool bit_and_33 = gt_10 && eq_25;
+        bool eq_34 = (right_shift_28 & 1) == 1;
+        bool bit_xor_35 = match_26 != (match_32 && (bit_and_33 && eq_34));
+        int func_clamp_36 = clamp((((mul_29 + (sub_30 ^ 1)) * 2) + 1), 0, sub_7);
+        bool eq_37 = (func_clamp_36 & 1) == 0;
+        bool match_38 = 
+            (eq_0 && eq_37) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_36), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_36 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_39 = func_clamp_36 >> 1;
+        int right_shift_40 = (right_shift_39 * 26215) >> 17;
+        int mul_41 = right_shift_40 * 5;
+        int func_clamp_42 = clamp((((mul_41 + ((((right_shift_39 - mul_41) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_43 = 
+            (eq_0 && ((func_clamp_42 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_42), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_42 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float((bit_xor_22 != ((bit_xor_35 != ((match_38 != (match_43 && ((gt_10 && eq_37) && ((right_shift_40 & 1) == 1)))) && (bit_and_33 && (((sub_30 | 1) < 5) && eq_34)))) && (bit_and_11 && ((((add_23 | 1) - 1) < 5) && ((sub_6 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height5_surface_width5_out_tile27x50_state_tile27x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int sub_0 = x - (int(((float(x) + 0.5) * 0.03703703731298447)) * 27);
+        bool eq_1 = sub_0 == 0;
+        int mul_2 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_3 = y - mul_2;
+        bool eq_4 = (sub_3 & 1) == 0;
+        bool match_5 = 
+            (eq_1 && eq_4) ? (!(texelFetch(state, ivec2(x, y), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (sub_3 ^ 1))), 0).x > 0.5);
+        int right_shift_6 = sub_3 >> 1;
+        int right_shift_7 = (right_shift_6 * 13) >> 6;
+        int mul_8 = right_shift_7 * 5;
+        int sub_9 = right_shift_6 - mul_8;
+        int func_clamp_10 = clamp((((mul_8 + (((sub_9 + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        bool match_11 = 
+            (eq_1 && ((func_clamp_10 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_10)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_10 ^ 1))), 0).x > 0.5);
+        bool gt_12 = sub_0 > 0;
+        bool bit_and_13 = gt_12 && eq_4;
+        bool eq_14 = (right_shift_7 & 1) == 1;
+        bool bit_xor_15 = match_5 != (match_11 && (bit_and_13 && eq_14));
+        int func_clamp_16 = clamp((((mul_8 + (sub_9 ^ 1)) * 2) + 1), 0, 49);
+        bool eq_17 = (func_clamp_16 & 1) == 0;
+        bool match_18 = 
+            (eq_1 && eq_17) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_16)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_16 ^ 1))), 0).x > 0.5);
+        int right_shift_19 = func_clamp_16 >> 1;
+        int right_shift_20 = (right_shift_19 * 13) >> 6;
+        int mul_21 = right_shift_20 * 5;
+        int func_clamp_22 = clamp((((mul_21 + ((((right_shift_19 - mul_21) + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        bool match_23 = 
+            (eq_1 && ((func_clamp_22 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_22)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_22 ^ 1))), 0).x > 0.5);
+        bool bit_xor_24 = bit_xor_15 != ((match_18 != (match_23 && ((gt_12 && eq_17) && ((right_shift_20 & 1) == 1)))) && (bit_and_13 && (((sub_9 | 1) < 5) && eq_14)));
+        int func_clamp_25 = clamp((((((((right_shift_7 + 1) ^ 1) - 1) * 5) + sub_9) * 2) + 1), 0, 49);
+        bool eq_26 = (func_clamp_25 & 1) == 0;
+        bool match_27 = 
+            (eq_1 && eq_26) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_25)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_25 ^ 1))), 0).x > 0.5);
+        int right_shift_28 = func_clamp_25 >> 1;
+        int right_shift_29 = (right_shift_28 * 13) >> 6;
+        int mul_30 = right_shift_29 * 5;
+        int sub_31 = right_shift_28 - mul_30;
+        int func_clamp_32 = clamp((((mul_30 + (((sub_31 + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        bool match_33 = 
+            (eq_1 && ((func_clamp_32 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_32)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_32 ^ 1))), 0).x > 0.5);
+        bool bit_and_34 = gt_12 && eq_26;
+        bool eq_35 = (right_shift_29 & 1) == 1;
+        bool bit_xor_36 = match_27 != (match_33 && (bit_and_34 && eq_35));
+        int func_clamp_37 = clamp((((mul_30 + (sub_31 ^ 1)) * 2) + 1), 0, 49);
+        bool eq_38 = (func_clamp_37 & 1) == 0;
+        bool match_39 = 
+            (eq_1 && eq_38) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_37)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_37 ^ 1))), 0).x > 0.5);
+        int right_shift_40 = func_clamp_37 >> 1;
+        int right_shift_41 = (right_shift_40 * 13) >> 6;
+        int mul_42 = right_shift_41 * 5;
+        int func_clamp_43 = clamp((((mul_42 + ((((right_shift_40 - mul_42) + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        bool match_44 = 
+            (eq_1 && ((func_clamp_43 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_43)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_43 ^ 1))), 0).x > 0.5);
+        outColor = float((bit_xor_24 != ((bit_xor_36 != ((match_39 != (match_44 && ((gt_12 && eq_38) && ((right_shift_41 & 1) == 1)))) && (bit_and_34 && (((sub_31 | 1) < 5) && eq_35)))) && (bit_and_13 && ((sub_9 & 1) == 0)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.x);
+        int mod_1 = x % func_int_0;
+        bool eq_2 = mod_1 == 0;
+        int func_int_3 = int(out_tile.y);
+        int mod_4 = y % func_int_3;
+        bool eq_5 = (mod_4 & 1) == 0;
+        int func_int_6 = int(state_tile.x);
+        int add_7 = ((x / func_int_0) * func_int_6) + clamp(mod_1, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = (y / func_int_3) * func_int_8;
+        int sub_10 = func_int_8 - 1;
+        bool match_11 = 
+            (eq_2 && eq_5) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(mod_4, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((mod_4 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_12 = mod_4 >> 1;
+        int right_shift_13 = (right_shift_12 * 3641) >> 15;
+        int mul_14 = right_shift_13 * 9;
+        int sub_15 = right_shift_12 - mul_14;
+        int func_clamp_16 = clamp((((mul_14 + (((sub_15 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_17 = 
+            (eq_2 && ((func_clamp_16 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_16, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_16 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool gt_18 = mod_1 > 0;
+        bool bit_and_19 = gt_18 && eq_5;
+        bool eq_20 = (right_shift_13 & 1) == 1;
+        bool bit_xor_21 = match_11 != (match_17 && (bit_and_19 && eq_20));
+        int func_clamp_22 = clamp((((mul_14 + (sub_15 ^ 1)) * 2) + 1), 0, sub_10);
+        bool eq_23 = (func_clamp_22 & 1) == 0;
+        bool match_24 = 
+            (eq_2 && eq_23) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_22, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_22 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_25 = func_clamp_22 >> 1;
+        int right_shift_26 = (right_shift_25 * 3641) >> 15;
+        int mul_27 = right_shift_26 * 9;
+        int func_clamp_28 = clamp((((mul_27 + ((((right_shift_25 - mul_27) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_29 = 
+            (eq_2 && ((func_clamp_28 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_28, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_28 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool bit_xor_30 = bit_xor_21 != ((match_24 != (match_29 && ((gt_18 && eq_23) && ((right_shift_26 & 1) == 1)))) && (bit_and_19 && (((sub_15 | 1) < 9) && eq_20)));
+        int add_31 = right_shift_13 + 1;
+        int func_clamp_32 = clamp(((((((add_31 ^ 1) - 1) * 9) + sub_15) * 2) + 1), 0, sub_10);
+        bool eq_33 = (func_clamp_32 & 1) == 0;
+        bool match_34 = 
+            (eq_2 && eq_33) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_32, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_32 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_35 = func_clamp_32 >> 1;
+        int right_shift_36 = (right_shift_35 * 3641) >> 15;
+        int mul_37 = right_shift_36 * 9;
+        int sub_38 = right_shift_35 - mul_37;
+        int func_clamp_39 = clamp((((mul_37 + (((sub_38 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_40 = 
+            (eq_2 && ((func_clamp_39 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_39, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_39 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool bit_and_41 = gt_18 && eq_33;
+        bool eq_42 = (right_shift_36 & 1) == 1;
+        bool bit_xor_43 = match_34 != (match_40 && (bit_and_41 && eq_42));
+        int func_clamp_44 = clamp((((mul_37 + (sub_38 ^ 1)) * 2) + 1), 0, sub_10);
+        bool eq_45 = (func_clamp_44 & 1) == 0;
+        bool match_46 = 
+            (eq_2 && eq_45) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_44, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_44 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_47 = func_clamp_44 >> 1;
+        int right_shift_48 = (right_shift_47 * 3641) >> 15;
+        int mul_49 = right_shift_48 * 9;
+        int func_clamp_50 = clamp((((mul_49 + ((((right_shift_47 - mul_49) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_51 = 
+            (eq_2 && ((func_clamp_50 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_50, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_50 ^ 1), 0, sub_10))), 0).x > 0.5);
+        outColor = float((bit_xor_30 != ((bit_xor_43 != ((match_46 != (match_51 && ((gt_18 && eq_45) && ((right_shift_48 & 1) == 1)))) && (bit_and_41 && (((sub_38 | 1) < 9) && eq_42)))) && (bit_and_19 && ((((add_31 | 1) - 1) < 9) && ((sub_15 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height9_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool eq_0 = x == 0;
+        bool eq_1 = (y & 1) == 0;
+        bool match_2 = 
+            (eq_0 && eq_1) ? (!(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int sub_7 = int(state_size.y) - 1;
+        int right_shift_3 = y >> 1;
+        int right_shift_4 = (right_shift_3 * 3641) >> 15;
+        int mul_5 = right_shift_4 * 9;
+        int sub_6 = right_shift_3 - mul_5;
+        int func_clamp_8 = clamp((((mul_5 + (((sub_6 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_9 = 
+            (eq_0 && ((func_clamp_8 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_8), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_8 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool gt_10 = x > 0;
+        bool bit_and_11 = gt_10 && eq_1;
+        bool eq_12 = (right_shift_4 & 1) == 1;
+        bool bit_xor_13 = match_2 != (match_9 && (bit_and_11 && eq_12));
+        int func_clamp_14 = clamp((((mul_5 + (sub_6 ^ 1)) * 2) + 1), 0, sub_7);
+        bool eq_15 = (func_clamp_14 & 1) == 0;
+        bool match_16 = 
+            (eq_0 && eq_15) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_14), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_14 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_17 = func_clamp_14 >> 1;
+        int right_shift_18 = (right_shift_17 * 3641) >> 15;
+        int mul_19 = right_shift_18 * 9;
+        int func_clamp_20 = clamp((((mul_19 + ((((right_shift_17 - mul_19) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_21 = 
+            (eq_0 && ((func_clamp_20 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_20), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_20 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool bit_xor_22 = bit_xor_13 != ((match_16 != (match_21 && ((gt_10 && eq_15) && ((right_shift_18 & 1) == 1)))) && (bit_and_11 && (((sub_6 | 1) < 9) && eq_12)));
+        int add_23 = right_shift_4 + 1;
+        int func_clamp_24 = clamp(((((((add_23 ^ 1) - 1) * 9) + sub_6) * 2) + 1), 0, sub_7);
+        bool eq_25 = (func_clamp_24 & 1) == 0;
+        bool match_26 = 
+            (eq_0 && eq_25) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_24), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_24 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_27 = func_clamp_24 >> 1;
+        int right_shift_28 = (right_shift_27 * 3641) >> 15;
+        int mul_29 = right_shift_28 * 9;
+        int sub_30 = right_shift_27 - mul_29;
+        int func_clamp_31 = clamp((((mul_29 + (((sub_30 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_32 = 
+            (eq_0 && ((func_clamp_31 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_31), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_31 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool bit_and_33 = gt_10 && eq_25;
+        bool eq_34 = (right_shift_28 & 1) == 1;
+        bool bit_xor_35 = match_26 != (match_32 && (bit_and_33 && eq_34));
+        int func_clamp_36 = clamp((((mul_29 + (sub_30 ^ 1)) * 2) + 1), 0, sub_7);
+        bool eq_37 = (func_clamp_36 & 1) == 0;
+        bool match_38 = 
+            (eq_0 && eq_37) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_36), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_36 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_39 = func_clamp_36 >> 1;
+        int right_shift_40 = (right_shift_39 * 3641) >> 15;
+        int mul_41 = right_shift_40 * 9;
+        int func_clamp_42 = clamp((((mul_41 + ((((right_shift_39 - mul_41) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_43 = 
+            (eq_0 && ((func_clamp_42 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_42), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_42 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float((bit_xor_22 != ((bit_xor_35 != ((match_38 != (match_43 && ((gt_10 && eq_37) && ((right_shift_40 & 1) == 1)))) && (bit_and_33 && (((sub_30 | 1) < 9) && eq_34)))) && (bit_and_11 && ((((add_23 | 1) - 1) < 9) && ((sub_6 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height9_surface_width9_out_tile83x162_state_tile83x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int sub_0 = x - (((x * 25267) >> 21) * 83);
+        bool eq_1 = sub_0 == 0;
+        int mul_2 = ((y * 25891) >> 22) * 162;
+        int sub_3 = y - mul_2;
+        bool eq_4 = (sub_3 & 1) == 0;
+        bool match_5 = 
+            (eq_1 && eq_4) ? (!(texelFetch(state, ivec2(x, y), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (sub_3 ^ 1))), 0).x > 0.5);
+        int right_shift_6 = sub_3 >> 1;
+        int right_shift_7 = (right_shift_6 * 57) >> 9;
+        int mul_8 = right_shift_7 * 9;
+        int sub_9 = right_shift_6 - mul_8;
+        int func_clamp_10 = clamp((((mul_8 + (((sub_9 + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        bool match_11 = 
+            (eq_1 && ((func_clamp_10 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_10)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_10 ^ 1))), 0).x > 0.5);
+        bool gt_12 = sub_0 > 0;
+        bool bit_and_13 = gt_12 && eq_4;
+        bool eq_14 = (right_shift_7 & 1) == 1;
+        bool bit_xor_15 = match_5 != (match_11 && (bit_and_13 && eq_14));
+        int func_clamp_16 = clamp((((mul_8 + (sub_9 ^ 1)) * 2) + 1), 0, 161);
+        bool eq_17 = (func_clamp_16 & 1) == 0;
+        bool match_18 = 
+            (eq_1 && eq_17) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_16)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_16 ^ 1))), 0).x > 0.5);
+        int right_shift_19 = func_clamp_16 >> 1;
+        int right_shift_20 = (right_shift_19 * 57) >> 9;
+        int mul_21 = right_shift_20 * 9;
+        int func_clamp_22 = clamp((((mul_21 + ((((right_shift_19 - mul_21) + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        bool match_23 = 
+            (eq_1 && ((func_clamp_22 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_22)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_22 ^ 1))), 0).x > 0.5);
+        bool bit_xor_24 = bit_xor_15 != ((match_18 != (match_23 && ((gt_12 && eq_17) && ((right_shift_20 & 1) == 1)))) && (bit_and_13 && (((sub_9 | 1) < 9) && eq_14)));
+        int func_clamp_25 = clamp((((((((right_shift_7 + 1) ^ 1) - 1) * 9) + sub_9) * 2) + 1), 0, 161);
+        bool eq_26 = (func_clamp_25 & 1) == 0;
+        bool match_27 = 
+            (eq_1 && eq_26) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_25)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_25 ^ 1))), 0).x > 0.5);
+        int right_shift_28 = func_clamp_25 >> 1;
+        int right_shift_29 = (right_shift_28 * 57) >> 9;
+        int mul_30 = right_shift_29 * 9;
+        int sub_31 = right_shift_28 - mul_30;
+        int func_clamp_32 = clamp((((mul_30 + (((sub_31 + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        bool match_33 = 
+            (eq_1 && ((func_clamp_32 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_32)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_32 ^ 1))), 0).x > 0.5);
+        bool bit_and_34 = gt_12 && eq_26;
+        bool eq_35 = (right_shift_29 & 1) == 1;
+        bool bit_xor_36 = match_27 != (match_33 && (bit_and_34 && eq_35));
+        int func_clamp_37 = clamp((((mul_30 + (sub_31 ^ 1)) * 2) + 1), 0, 161);
+        bool eq_38 = (func_clamp_37 & 1) == 0;
+        bool match_39 = 
+            (eq_1 && eq_38) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_37)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_37 ^ 1))), 0).x > 0.5);
+        int right_shift_40 = func_clamp_37 >> 1;
+        int right_shift_41 = (right_shift_40 * 57) >> 9;
+        int mul_42 = right_shift_41 * 9;
+        int func_clamp_43 = clamp((((mul_42 + ((((right_shift_40 - mul_42) + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        bool match_44 = 
+            (eq_1 && ((func_clamp_43 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_43)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_43 ^ 1))), 0).x > 0.5);
+        outColor = float((bit_xor_24 != ((bit_xor_36 != ((match_39 != (match_44 && ((gt_12 && eq_38) && ((right_shift_41 & 1) == 1)))) && (bit_and_34 && (((sub_31 | 1) < 9) && eq_35)))) && (bit_and_13 && ((sub_9 & 1) == 0)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_0 = int(out_tile.x);
+        int mod_1 = x % func_int_0;
+        bool eq_2 = mod_1 == 0;
+        int func_int_3 = int(out_tile.y);
+        int mod_4 = y % func_int_3;
+        bool eq_5 = (mod_4 & 1) == 0;
+        int func_int_6 = int(state_tile.x);
+        int add_7 = ((x / func_int_0) * func_int_6) + clamp(mod_1, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_tile.y);
+        int mul_9 = (y / func_int_3) * func_int_8;
+        int sub_10 = func_int_8 - 1;
+        bool match_11 = 
+            (eq_2 && eq_5) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(mod_4, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((mod_4 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_12 = mod_4 >> 1;
+        int right_shift_13 = (right_shift_12 * 20165) >> 18;
+        int mul_14 = right_shift_13 * 13;
+        int sub_15 = right_shift_12 - mul_14;
+        int func_clamp_16 = clamp((((mul_14 + (((sub_15 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_17 = 
+            (eq_2 && ((func_clamp_16 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_16, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_16 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool gt_18 = mod_1 > 0;
+        bool bit_and_19 = gt_18 && eq_5;
+        bool eq_20 = (right_shift_13 & 1) == 1;
+        bool bit_xor_21 = match_11 != (match_17 && (bit_and_19 && eq_20));
+        int func_clamp_22 = clamp((((mul_14 + (sub_15 ^ 1)) * 2) + 1), 0, sub_10);
+        bool eq_23 = (func_clamp_22 & 1) == 0;
+        bool match_24 = 
+            (eq_2 && eq_23) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_22, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_22 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_25 = func_clamp_22 >> 1;
+        int right_shift_26 = (right_shift_25 * 20165) >> 18;
+        int mul_27 = right_shift_26 * 13;
+        int func_clamp_28 = clamp((((mul_27 + ((((right_shift_25 - mul_27) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_29 = 
+            (eq_2 && ((func_clamp_28 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_28, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_28 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool bit_xor_30 = bit_xor_21 != ((match_24 != (match_29 && ((gt_18 && eq_23) && ((right_shift_26 & 1) == 1)))) && (bit_and_19 && (((sub_15 | 1) < 13) && eq_20)));
+        int add_31 = right_shift_13 + 1;
+        int func_clamp_32 = clamp(((((((add_31 ^ 1) - 1) * 13) + sub_15) * 2) + 1), 0, sub_10);
+        bool eq_33 = (func_clamp_32 & 1) == 0;
+        bool match_34 = 
+            (eq_2 && eq_33) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_32, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_32 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_35 = func_clamp_32 >> 1;
+        int right_shift_36 = (right_shift_35 * 20165) >> 18;
+        int mul_37 = right_shift_36 * 13;
+        int sub_38 = right_shift_35 - mul_37;
+        int func_clamp_39 = clamp((((mul_37 + (((sub_38 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_40 = 
+            (eq_2 && ((func_clamp_39 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_39, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_39 ^ 1), 0, sub_10))), 0).x > 0.5);
+        bool bit_and_41 = gt_18 && eq_33;
+        bool eq_42 = (right_shift_36 & 1) == 1;
+        bool bit_xor_43 = match_34 != (match_40 && (bit_and_41 && eq_42));
+        int func_clamp_44 = clamp((((mul_37 + (sub_38 ^ 1)) * 2) + 1), 0, sub_10);
+        bool eq_45 = (func_clamp_44 & 1) == 0;
+        bool match_46 = 
+            (eq_2 && eq_45) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_44, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_44 ^ 1), 0, sub_10))), 0).x > 0.5);
+        int right_shift_47 = func_clamp_44 >> 1;
+        int right_shift_48 = (right_shift_47 * 20165) >> 18;
+        int mul_49 = right_shift_48 * 13;
+        int func_clamp_50 = clamp((((mul_49 + ((((right_shift_47 - mul_49) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        bool match_51 = 
+            (eq_2 && ((func_clamp_50 & 1) == 0)) ? (!(texelFetch(state, ivec2(add_7, (mul_9 + clamp(func_clamp_50, 0, sub_10))), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(add_7, (mul_9 + clamp((func_clamp_50 ^ 1), 0, sub_10))), 0).x > 0.5);
+        outColor = float((bit_xor_30 != ((bit_xor_43 != ((match_46 != (match_51 && ((gt_18 && eq_45) && ((right_shift_48 & 1) == 1)))) && (bit_and_41 && (((sub_38 | 1) < 13) && eq_42)))) && (bit_and_19 && ((((add_31 | 1) - 1) < 13) && ((sub_15 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height13_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool eq_0 = x == 0;
+        bool eq_1 = (y & 1) == 0;
+        bool match_2 = 
+            (eq_0 && eq_1) ? (!(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int sub_7 = int(state_size.y) - 1;
+        int right_shift_3 = y >> 1;
+        int right_shift_4 = (right_shift_3 * 20165) >> 18;
+        int mul_5 = right_shift_4 * 13;
+        int sub_6 = right_shift_3 - mul_5;
+        int func_clamp_8 = clamp((((mul_5 + (((sub_6 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_9 = 
+            (eq_0 && ((func_clamp_8 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_8), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_8 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool gt_10 = x > 0;
+        bool bit_and_11 = gt_10 && eq_1;
+        bool eq_12 = (right_shift_4 & 1) == 1;
+        bool bit_xor_13 = match_2 != (match_9 && (bit_and_11 && eq_12));
+        int func_clamp_14 = clamp((((mul_5 + (sub_6 ^ 1)) * 2) + 1), 0, sub_7);
+        bool eq_15 = (func_clamp_14 & 1) == 0;
+        bool match_16 = 
+            (eq_0 && eq_15) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_14), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_14 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_17 = func_clamp_14 >> 1;
+        int right_shift_18 = (right_shift_17 * 20165) >> 18;
+        int mul_19 = right_shift_18 * 13;
+        int func_clamp_20 = clamp((((mul_19 + ((((right_shift_17 - mul_19) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_21 = 
+            (eq_0 && ((func_clamp_20 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_20), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_20 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool bit_xor_22 = bit_xor_13 != ((match_16 != (match_21 && ((gt_10 && eq_15) && ((right_shift_18 & 1) == 1)))) && (bit_and_11 && (((sub_6 | 1) < 13) && eq_12)));
+        int add_23 = right_shift_4 + 1;
+        int func_clamp_24 = clamp(((((((add_23 ^ 1) - 1) * 13) + sub_6) * 2) + 1), 0, sub_7);
+        bool eq_25 = (func_clamp_24 & 1) == 0;
+        bool match_26 = 
+            (eq_0 && eq_25) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_24), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_24 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_27 = func_clamp_24 >> 1;
+        int right_shift_28 = (right_shift_27 * 20165) >> 18;
+        int mul_29 = right_shift_28 * 13;
+        int sub_30 = right_shift_27 - mul_29;
+        int func_clamp_31 = clamp((((mul_29 + (((sub_30 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_32 = 
+            (eq_0 && ((func_clamp_31 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_31), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_31 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        bool bit_and_33 = gt_10 && eq_25;
+        bool eq_34 = (right_shift_28 & 1) == 1;
+        bool bit_xor_35 = match_26 != (match_32 && (bit_and_33 && eq_34));
+        int func_clamp_36 = clamp((((mul_29 + (sub_30 ^ 1)) * 2) + 1), 0, sub_7);
+        bool eq_37 = (func_clamp_36 & 1) == 0;
+        bool match_38 = 
+            (eq_0 && eq_37) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_36), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_36 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        int right_shift_39 = func_clamp_36 >> 1;
+        int right_shift_40 = (right_shift_39 * 20165) >> 18;
+        int mul_41 = right_shift_40 * 13;
+        int func_clamp_42 = clamp((((mul_41 + ((((right_shift_39 - mul_41) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_7);
+        bool match_43 = 
+            (eq_0 && ((func_clamp_42 & 1) == 0)) ? (!(texelFetch(state, clamp(ivec2(x, func_clamp_42), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5)) :
+            (texelFetch(state, clamp(ivec2(x, (func_clamp_42 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5);
+        outColor = float((bit_xor_22 != ((bit_xor_35 != ((match_38 != (match_43 && ((gt_10 && eq_37) && ((right_shift_40 & 1) == 1)))) && (bit_and_33 && (((sub_30 | 1) < 13) && eq_34)))) && (bit_and_11 && ((((add_23 | 1) - 1) < 13) && ((sub_6 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass0_surface_height13_surface_width13_out_tile171x338_state_tile171x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int sub_0 = x - (int(((float(x) + 0.5) * 0.005847953259944916)) * 171);
+        bool eq_1 = sub_0 == 0;
+        int mul_2 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_3 = y - mul_2;
+        bool eq_4 = (sub_3 & 1) == 0;
+        bool match_5 = 
+            (eq_1 && eq_4) ? (!(texelFetch(state, ivec2(x, y), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (sub_3 ^ 1))), 0).x > 0.5);
+        int right_shift_6 = sub_3 >> 1;
+        int right_shift_7 = (right_shift_6 * 79) >> 10;
+        int mul_8 = right_shift_7 * 13;
+        int sub_9 = right_shift_6 - mul_8;
+        int func_clamp_10 = clamp((((mul_8 + (((sub_9 + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        bool match_11 = 
+            (eq_1 && ((func_clamp_10 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_10)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_10 ^ 1))), 0).x > 0.5);
+        bool gt_12 = sub_0 > 0;
+        bool bit_and_13 = gt_12 && eq_4;
+        bool eq_14 = (right_shift_7 & 1) == 1;
+        bool bit_xor_15 = match_5 != (match_11 && (bit_and_13 && eq_14));
+        int func_clamp_16 = clamp((((mul_8 + (sub_9 ^ 1)) * 2) + 1), 0, 337);
+        bool eq_17 = (func_clamp_16 & 1) == 0;
+        bool match_18 = 
+            (eq_1 && eq_17) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_16)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_16 ^ 1))), 0).x > 0.5);
+        int right_shift_19 = func_clamp_16 >> 1;
+        int right_shift_20 = (right_shift_19 * 79) >> 10;
+        int mul_21 = right_shift_20 * 13;
+        int func_clamp_22 = clamp((((mul_21 + ((((right_shift_19 - mul_21) + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        bool match_23 = 
+            (eq_1 && ((func_clamp_22 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_22)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_22 ^ 1))), 0).x > 0.5);
+        bool bit_xor_24 = bit_xor_15 != ((match_18 != (match_23 && ((gt_12 && eq_17) && ((right_shift_20 & 1) == 1)))) && (bit_and_13 && (((sub_9 | 1) < 13) && eq_14)));
+        int func_clamp_25 = clamp((((((((right_shift_7 + 1) ^ 1) - 1) * 13) + sub_9) * 2) + 1), 0, 337);
+        bool eq_26 = (func_clamp_25 & 1) == 0;
+        bool match_27 = 
+            (eq_1 && eq_26) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_25)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_25 ^ 1))), 0).x > 0.5);
+        int right_shift_28 = func_clamp_25 >> 1;
+        int right_shift_29 = (right_shift_28 * 79) >> 10;
+        int mul_30 = right_shift_29 * 13;
+        int sub_31 = right_shift_28 - mul_30;
+        int func_clamp_32 = clamp((((mul_30 + (((sub_31 + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        bool match_33 = 
+            (eq_1 && ((func_clamp_32 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_32)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_32 ^ 1))), 0).x > 0.5);
+        bool bit_and_34 = gt_12 && eq_26;
+        bool eq_35 = (right_shift_29 & 1) == 1;
+        bool bit_xor_36 = match_27 != (match_33 && (bit_and_34 && eq_35));
+        int func_clamp_37 = clamp((((mul_30 + (sub_31 ^ 1)) * 2) + 1), 0, 337);
+        bool eq_38 = (func_clamp_37 & 1) == 0;
+        bool match_39 = 
+            (eq_1 && eq_38) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_37)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_37 ^ 1))), 0).x > 0.5);
+        int right_shift_40 = func_clamp_37 >> 1;
+        int right_shift_41 = (right_shift_40 * 79) >> 10;
+        int mul_42 = right_shift_41 * 13;
+        int func_clamp_43 = clamp((((mul_42 + ((((right_shift_40 - mul_42) + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        bool match_44 = 
+            (eq_1 && ((func_clamp_43 & 1) == 0)) ? (!(texelFetch(state, ivec2(x, (mul_2 + func_clamp_43)), 0).x > 0.5)) :
+            (texelFetch(state, ivec2(x, (mul_2 + (func_clamp_43 ^ 1))), 0).x > 0.5);
+        outColor = float((bit_xor_24 != ((bit_xor_36 != ((match_39 != (match_44 && ((gt_12 && eq_38) && ((right_shift_41 & 1) == 1)))) && (bit_and_34 && (((sub_31 | 1) < 13) && eq_35)))) && (bit_and_13 && ((sub_9 & 1) == 0)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+registerLayered(surfaceCyclePass0, surfaceCyclePass0Layered);
+registerSingleShot(surfaceCyclePass0, surfaceCyclePass0SingleShot);
+registerVariant(surfaceCyclePass0, {surface_height: 5, surface_width: 5}, surfaceCyclePass0_surface_height5_surface_width5);
+registerLayered(surfaceCyclePass0_surface_height5_surface_width5, surfaceCyclePass0Layered);
+registerSingleShot(surfaceCyclePass0_surface_height5_surface_width5, surfaceCyclePass0_surface_height5_surface_width5SingleShot);
+registerVariant(surfaceCyclePass0_surface_height5_surface_width5, {out_tile: [27, 50], state_tile: [27, 50]}, surfaceCyclePass0_surface_height5_surface_width5_out_tile27x50_state_tile27x50);
+registerVariant(surfaceCyclePass0, {surface_height: 9, surface_width: 9}, surfaceCyclePass0_surface_height9_surface_width9);
+registerLayered(surfaceCyclePass0_surface_height9_surface_width9, surfaceCyclePass0Layered);
+registerSingleShot(surfaceCyclePass0_surface_height9_surface_width9, surfaceCyclePass0_surface_height9_surface_width9SingleShot);
+registerVariant(surfaceCyclePass0_surface_height9_surface_width9, {out_tile: [83, 162], state_tile: [83, 162]}, surfaceCyclePass0_surface_height9_surface_width9_out_tile83x162_state_tile83x162);
+registerVariant(surfaceCyclePass0, {surface_height: 13, surface_width: 13}, surfaceCyclePass0_surface_height13_surface_width13);
+registerLayered(surfaceCyclePass0_surface_height13_surface_width13, surfaceCyclePass0Layered);
+registerSingleShot(surfaceCyclePass0_surface_height13_surface_width13, surfaceCyclePass0_surface_height13_surface_width13SingleShot);
+registerVariant(surfaceCyclePass0_surface_height13_surface_width13, {out_tile: [171, 338], state_tile: [171, 338]}, surfaceCyclePass0_surface_height13_surface_width13_out_tile171x338_state_tile171x338);
+
+let surfaceCyclePass1 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_9 = int(state_tile.x);
+        int func_int_8 = int(out_tile.x);
+        int mul_10 = (x / func_int_8) * func_int_9;
+        int mod_11 = x % func_int_8;
+        int add_12 = mul_10 + clamp(mod_11, 0, (func_int_9 - 1));
+        int func_int_13 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_14 = (y / func_int_0) * func_int_13;
+        int mod_1 = y % func_int_0;
+        int sub_15 = func_int_13 - 1;
+        bool slice_16 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(mod_1, 0, sub_15))), 0).x > 0.5;
+        int right_shift_2 = mod_1 >> 1;
+        int mod_3 = right_shift_2 % surface_width;
+        int divide_5 = right_shift_2 / surface_width;
+        bool slice_17 = texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((divide_5 ^ 1) * surface_width) + mod_3) * 2) + 1), 0, sub_15))), 0).x > 0.5;
+        bool gt_18 = mod_11 > 0;
+        bool eq_19 = (mod_1 & 1) == 0;
+        bool bit_and_20 = gt_18 && eq_19;
+        bool lt_21 = (divide_5 | 1) < surface_height;
+        int bitwise_and_4 = mod_3 & 1;
+        bool bit_xor_22 = slice_16 != (slice_17 && (bit_and_20 && (lt_21 && (bitwise_and_4 == 0))));
+        int bitwise_and_6 = divide_5 & 1;
+        bool eq_7 = bitwise_and_4 == bitwise_and_6;
+        bool eq_23 = mod_11 == 0;
+        bool match_29;
+        if (eq_7) {
+            match_29 = bit_xor_22;
+        } else if ((eq_23 && eq_19)) {
+            match_29 = (!bit_xor_22);
+        } else {
+            int func_clamp_24 = clamp((mod_1 ^ 1), 0, sub_15);
+            bool slice_25 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_24, 0, sub_15))), 0).x > 0.5;
+            int right_shift_26 = func_clamp_24 >> 1;
+            int mod_28 = right_shift_26 % surface_width;
+            int divide_27 = right_shift_26 / surface_width;
+            match_29 = (slice_25 != ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((divide_27 ^ 1) * surface_width) + mod_28) * 2) + 1), 0, sub_15))), 0).x > 0.5) && ((gt_18 && ((func_clamp_24 & 1) == 0)) && (((divide_27 | 1) < surface_height) && ((mod_28 & 1) == 0)))));
+        }
+        int mul_30 = divide_5 * surface_width;
+        int add_31 = mod_3 + 1;
+        int func_clamp_32 = clamp((((mul_30 + ((add_31 ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        bool slice_37 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_32, 0, sub_15))), 0).x > 0.5;
+        int right_shift_33 = func_clamp_32 >> 1;
+        int mod_34 = right_shift_33 % surface_width;
+        int divide_36 = right_shift_33 / surface_width;
+        bool slice_38 = texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((divide_36 ^ 1) * surface_width) + mod_34) * 2) + 1), 0, sub_15))), 0).x > 0.5;
+        bool eq_39 = (func_clamp_32 & 1) == 0;
+        bool bit_and_40 = gt_18 && eq_39;
+        bool lt_41 = (divide_36 | 1) < surface_height;
+        int bitwise_and_35 = mod_34 & 1;
+        bool bit_xor_42 = slice_37 != (slice_38 && (bit_and_40 && (lt_41 && (bitwise_and_35 == 0))));
+        bool match_48;
+        if ((bitwise_and_35 == (divide_36 & 1))) {
+            match_48 = bit_xor_42;
+        } else if ((eq_23 && eq_39)) {
+            match_48 = (!bit_xor_42);
+        } else {
+            int func_clamp_43 = clamp((func_clamp_32 ^ 1), 0, sub_15);
+            bool slice_44 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_43, 0, sub_15))), 0).x > 0.5;
+            int right_shift_45 = func_clamp_43 >> 1;
+            int mod_47 = right_shift_45 % surface_width;
+            int divide_46 = right_shift_45 / surface_width;
+            match_48 = (slice_44 != ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((divide_46 ^ 1) * surface_width) + mod_47) * 2) + 1), 0, sub_15))), 0).x > 0.5) && ((gt_18 && ((func_clamp_43 & 1) == 0)) && (((divide_46 | 1) < surface_height) && ((mod_47 & 1) == 0)))));
+        }
+        bool eq_49 = bitwise_and_6 == 0;
+        bool bit_xor_50 = match_29 != (match_48 && (bit_and_20 && ((((add_31 | 1) - 1) < surface_width) && eq_49)));
+        int func_clamp_51 = clamp((((mul_30 + (mod_3 ^ 1)) * 2) + 1), 0, sub_15);
+        bool slice_57 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_51, 0, sub_15))), 0).x > 0.5;
+        int right_shift_52 = func_clamp_51 >> 1;
+        int mod_53 = right_shift_52 % surface_width;
+        int divide_55 = right_shift_52 / surface_width;
+        bool slice_58 = texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((divide_55 ^ 1) * surface_width) + mod_53) * 2) + 1), 0, sub_15))), 0).x > 0.5;
+        bool eq_59 = (func_clamp_51 & 1) == 0;
+        bool bit_and_60 = gt_18 && eq_59;
+        bool lt_61 = (divide_55 | 1) < surface_height;
+        int bitwise_and_54 = mod_53 & 1;
+        bool bit_xor_62 = slice_57 != (slice_58 && (bit_and_60 && (lt_61 && (bitwise_and_54 == 0))));
+        int bitwise_and_56 = divide_55 & 1;
+        bool match_68;
+        if ((bitwise_and_54 == bitwise_and_56)) {
+            match_68 = bit_xor_62;
+        } else if ((eq_23 && eq_59)) {
+            match_68 = (!bit_xor_62);
+        } else {
+            int func_clamp_63 = clamp((func_clamp_51 ^ 1), 0, sub_15);
+            bool slice_64 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_63, 0, sub_15))), 0).x > 0.5;
+            int right_shift_65 = func_clamp_63 >> 1;
+            int mod_67 = right_shift_65 % surface_width;
+            int divide_66 = right_shift_65 / surface_width;
+            match_68 = (slice_64 != ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((divide_66 ^ 1) * surface_width) + mod_67) * 2) + 1), 0, sub_15))), 0).x > 0.5) && ((gt_18 && ((func_clamp_63 & 1) == 0)) && (((divide_66 | 1) < surface_height) && ((mod_67 & 1) == 0)))));
+        }
+        int mul_69 = divide_55 * surface_width;
+        int add_70 = mod_53 + 1;
+        int func_clamp_71 = clamp((((mul_69 + ((add_70 ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        bool slice_76 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_71, 0, sub_15))), 0).x > 0.5;
+        int right_shift_72 = func_clamp_71 >> 1;
+        int mod_73 = right_shift_72 % surface_width;
+        int divide_75 = right_shift_72 / surface_width;
+        bool slice_77 = texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((divide_75 ^ 1) * surface_width) + mod_73) * 2) + 1), 0, sub_15))), 0).x > 0.5;
+        bool eq_78 = (func_clamp_71 & 1) == 0;
+        bool bit_and_79 = gt_18 && eq_78;
+        bool lt_80 = (divide_75 | 1) < surface_height;
+        int bitwise_and_74 = mod_73 & 1;
+        bool bit_xor_81 = slice_76 != (slice_77 && (bit_and_79 && (lt_80 && (bitwise_and_74 == 0))));
+        bool match_87;
+        if ((bitwise_and_74 == (divide_75 & 1))) {
+            match_87 = bit_xor_81;
+        } else if ((eq_23 && eq_78)) {
+            match_87 = (!bit_xor_81);
+        } else {
+            int func_clamp_82 = clamp((func_clamp_71 ^ 1), 0, sub_15);
+            bool slice_83 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_82, 0, sub_15))), 0).x > 0.5;
+            int right_shift_84 = func_clamp_82 >> 1;
+            int mod_86 = right_shift_84 % surface_width;
+            int divide_85 = right_shift_84 / surface_width;
+            match_87 = (slice_83 != ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((divide_85 ^ 1) * surface_width) + mod_86) * 2) + 1), 0, sub_15))), 0).x > 0.5) && ((gt_18 && ((func_clamp_82 & 1) == 0)) && (((divide_85 | 1) < surface_height) && ((mod_86 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_50 != ((match_68 != (match_87 && (bit_and_60 && ((((add_70 | 1) - 1) < surface_width) && (bitwise_and_56 == 0))))) && (bit_and_20 && (((mod_3 | 1) < surface_width) && eq_49)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_11 = int(state_tile.x);
+        int add_9 = x + int(out_origin.x);
+        int func_int_10 = int(out_tile.x);
+        int mul_12 = (add_9 / func_int_10) * func_int_11;
+        int mod_13 = add_9 % func_int_10;
+        int add_14 = mul_12 + clamp(mod_13, 0, (func_int_11 - 1));
+        int func_int_15 = int(state_size.x);
+        int func_clamp_16 = clamp(add_14, 0, (func_int_15 - 1));
+        int func_int_17 = int(state_layer.x);
+        int mod_18 = func_clamp_16 % func_int_17;
+        int sub_22 = int(state_size.y) - 1;
+        int func_int_19 = int(state_tile.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mul_20 = (add_0 / func_int_1) * func_int_19;
+        int mod_2 = add_0 % func_int_1;
+        int sub_21 = func_int_19 - 1;
+        int func_clamp_23 = clamp((mul_20 + clamp(mod_2, 0, sub_21)), 0, sub_22);
+        int func_int_24 = int(state_layer.y);
+        int mod_25 = func_clamp_23 % func_int_24;
+        int divide_27 = func_clamp_16 / func_int_17;
+        int divide_26 = ((func_int_15 + func_int_17) - 1) / func_int_17;
+        bool fetch_28 = texelFetch(state, ivec3(mod_18, mod_25, (((func_clamp_23 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+        int right_shift_3 = mod_2 >> 1;
+        int mod_4 = right_shift_3 % surface_width;
+        int divide_6 = right_shift_3 / surface_width;
+        int func_clamp_29 = clamp((mul_20 + clamp((((((divide_6 ^ 1) * surface_width) + mod_4) * 2) + 1), 0, sub_21)), 0, sub_22);
+        bool fetch_30 = texelFetch(state, ivec3(mod_18, (func_clamp_29 % func_int_24), (((func_clamp_29 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+        bool gt_31 = mod_13 > 0;
+        bool eq_32 = (mod_2 & 1) == 0;
+        bool bit_and_33 = gt_31 && eq_32;
+        bool lt_34 = (divide_6 | 1) < surface_height;
+        int bitwise_and_5 = mod_4 & 1;
+        bool bit_xor_35 = fetch_28 != (fetch_30 && (bit_and_33 && (lt_34 && (bitwise_and_5 == 0))));
+        int bitwise_and_7 = divide_6 & 1;
+        bool eq_8 = bitwise_and_5 == bitwise_and_7;
+        bool eq_36 = mod_13 == 0;
+        bool match_44;
+        if (eq_8) {
+            match_44 = bit_xor_35;
+        } else if ((eq_36 && eq_32)) {
+            match_44 = (!bit_xor_35);
+        } else {
+            int func_clamp_37 = clamp((mod_2 ^ 1), 0, sub_21);
+            int func_clamp_38 = clamp((mul_20 + clamp(func_clamp_37, 0, sub_21)), 0, sub_22);
+            bool fetch_39 = texelFetch(state, ivec3(mod_18, (func_clamp_38 % func_int_24), (((func_clamp_38 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+            int right_shift_40 = func_clamp_37 >> 1;
+            int mod_42 = right_shift_40 % surface_width;
+            int divide_41 = right_shift_40 / surface_width;
+            int func_clamp_43 = clamp((mul_20 + clamp((((((divide_41 ^ 1) * surface_width) + mod_42) * 2) + 1), 0, sub_21)), 0, sub_22);
+            match_44 = (fetch_39 != ((texelFetch(state, ivec3(mod_18, (func_clamp_43 % func_int_24), (((func_clamp_43 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5) && ((gt_31 && ((func_clamp_37 & 1) == 0)) && (((divide_41 | 1) < surface_height) && ((mod_42 & 1) == 0)))));
+        }
+        int mul_45 = divide_6 * surface_width;
+        int add_46 = mod_4 + 1;
+        int func_clamp_47 = clamp((((mul_45 + ((add_46 ^ 1) - 1)) * 2) + 1), 0, sub_21);
+        int func_clamp_52 = clamp((mul_20 + clamp(func_clamp_47, 0, sub_21)), 0, sub_22);
+        bool fetch_53 = texelFetch(state, ivec3(mod_18, (func_clamp_52 % func_int_24), (((func_clamp_52 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+        int right_shift_48 = func_clamp_47 >> 1;
+        int mod_49 = right_shift_48 % surface_width;
+        int divide_51 = right_shift_48 / surface_width;
+        int func_clamp_54 = clamp((mul_20 + clamp((((((divide_51 ^ 1) * surface_width) + mod_49) * 2) + 1), 0, sub_21)), 0, sub_22);
+        bool fetch_55 = texelFetch(state, ivec3(mod_18, (func_clamp_54 % func_int_24), (((func_clamp_54 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+        bool eq_56 = (func_clamp_47 & 1) == 0;
+        bool bit_and_57 = gt_31 && eq_56;
+        bool lt_58 = (divide_51 | 1) < surface_height;
+        int bitwise_and_50 = mod_49 & 1;
+        bool bit_xor_59 = fetch_53 != (fetch_55 && (bit_and_57 && (lt_58 && (bitwise_and_50 == 0))));
+        bool match_67;
+        if ((bitwise_and_50 == (divide_51 & 1))) {
+            match_67 = bit_xor_59;
+        } else if ((eq_36 && eq_56)) {
+            match_67 = (!bit_xor_59);
+        } else {
+            int func_clamp_60 = clamp((func_clamp_47 ^ 1), 0, sub_21);
+            int func_clamp_61 = clamp((mul_20 + clamp(func_clamp_60, 0, sub_21)), 0, sub_22);
+            bool fetch_62 = texelFetch(state, ivec3(mod_18, (func_clamp_61 % func_int_24), (((func_clamp_61 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+            int right_shift_63 = func_clamp_60 >> 1;
+            int mod_65 = right_shift_63 % surface_width;
+            int divide_64 = right_shift_63 / surface_width;
+            int func_clamp_66 = clamp((mul_20 + clamp((((((divide_64 ^ 1) * surface_width) + mod_65) * 2) + 1), 0, sub_21)), 0, sub_22);
+            match_67 = (fetch_62 != ((texelFetch(state, ivec3(mod_18, (func_clamp_66 % func_int_24), (((func_clamp_66 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5) && ((gt_31 && ((func_clamp_60 & 1) == 0)) && (((divide_64 | 1) < surface_height) && ((mod_65 & 1) == 0)))));
+        }
+        bool eq_68 = bitwise_and_7 == 0;
+        bool bit_xor_69 = match_44 != (match_67 && (bit_and_33 && ((((add_46 | 1) - 1) < surface_width) && eq_68)));
+        int func_clamp_70 = clamp((((mul_45 + (mod_4 ^ 1)) * 2) + 1), 0, sub_21);
+        int func_clamp_76 = clamp((mul_20 + clamp(func_clamp_70, 0, sub_21)), 0, sub_22);
+        bool fetch_77 = texelFetch(state, ivec3(mod_18, (func_clamp_76 % func_int_24), (((func_clamp_76 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+        int right_shift_71 = func_clamp_70 >> 1;
+        int mod_72 = right_shift_71 % surface_width;
+        int divide_74 = right_shift_71 / surface_width;
+        int func_clamp_78 = clamp((mul_20 + clamp((((((divide_74 ^ 1) * surface_width) + mod_72) * 2) + 1), 0, sub_21)), 0, sub_22);
+        bool fetch_79 = texelFetch(state, ivec3(mod_18, (func_clamp_78 % func_int_24), (((func_clamp_78 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+        bool eq_80 = (func_clamp_70 & 1) == 0;
+        bool bit_and_81 = gt_31 && eq_80;
+        bool lt_82 = (divide_74 | 1) < surface_height;
+        int bitwise_and_73 = mod_72 & 1;
+        bool bit_xor_83 = fetch_77 != (fetch_79 && (bit_and_81 && (lt_82 && (bitwise_and_73 == 0))));
+        int bitwise_and_75 = divide_74 & 1;
+        bool match_91;
+        if ((bitwise_and_73 == bitwise_and_75)) {
+            match_91 = bit_xor_83;
+        } else if ((eq_36 && eq_80)) {
+            match_91 = (!bit_xor_83);
+        } else {
+            int func_clamp_84 = clamp((func_clamp_70 ^ 1), 0, sub_21);
+            int func_clamp_85 = clamp((mul_20 + clamp(func_clamp_84, 0, sub_21)), 0, sub_22);
+            bool fetch_86 = texelFetch(state, ivec3(mod_18, (func_clamp_85 % func_int_24), (((func_clamp_85 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+            int right_shift_87 = func_clamp_84 >> 1;
+            int mod_89 = right_shift_87 % surface_width;
+            int divide_88 = right_shift_87 / surface_width;
+            int func_clamp_90 = clamp((mul_20 + clamp((((((divide_88 ^ 1) * surface_width) + mod_89) * 2) + 1), 0, sub_21)), 0, sub_22);
+            match_91 = (fetch_86 != ((texelFetch(state, ivec3(mod_18, (func_clamp_90 % func_int_24), (((func_clamp_90 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5) && ((gt_31 && ((func_clamp_84 & 1) == 0)) && (((divide_88 | 1) < surface_height) && ((mod_89 & 1) == 0)))));
+        }
+        int mul_92 = divide_74 * surface_width;
+        int add_93 = mod_72 + 1;
+        int func_clamp_94 = clamp((((mul_92 + ((add_93 ^ 1) - 1)) * 2) + 1), 0, sub_21);
+        int func_clamp_99 = clamp((mul_20 + clamp(func_clamp_94, 0, sub_21)), 0, sub_22);
+        bool fetch_100 = texelFetch(state, ivec3(mod_18, (func_clamp_99 % func_int_24), (((func_clamp_99 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+        int right_shift_95 = func_clamp_94 >> 1;
+        int mod_96 = right_shift_95 % surface_width;
+        int divide_98 = right_shift_95 / surface_width;
+        int func_clamp_101 = clamp((mul_20 + clamp((((((divide_98 ^ 1) * surface_width) + mod_96) * 2) + 1), 0, sub_21)), 0, sub_22);
+        bool fetch_102 = texelFetch(state, ivec3(mod_18, (func_clamp_101 % func_int_24), (((func_clamp_101 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+        bool eq_103 = (func_clamp_94 & 1) == 0;
+        bool bit_and_104 = gt_31 && eq_103;
+        bool lt_105 = (divide_98 | 1) < surface_height;
+        int bitwise_and_97 = mod_96 & 1;
+        bool bit_xor_106 = fetch_100 != (fetch_102 && (bit_and_104 && (lt_105 && (bitwise_and_97 == 0))));
+        bool match_114;
+        if ((bitwise_and_97 == (divide_98 & 1))) {
+            match_114 = bit_xor_106;
+        } else if ((eq_36 && eq_103)) {
+            match_114 = (!bit_xor_106);
+        } else {
+            int func_clamp_107 = clamp((func_clamp_94 ^ 1), 0, sub_21);
+            int func_clamp_108 = clamp((mul_20 + clamp(func_clamp_107, 0, sub_21)), 0, sub_22);
+            bool fetch_109 = texelFetch(state, ivec3(mod_18, (func_clamp_108 % func_int_24), (((func_clamp_108 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5;
+            int right_shift_110 = func_clamp_107 >> 1;
+            int mod_112 = right_shift_110 % surface_width;
+            int divide_111 = right_shift_110 / surface_width;
+            int func_clamp_113 = clamp((mul_20 + clamp((((((divide_111 ^ 1) * surface_width) + mod_112) * 2) + 1), 0, sub_21)), 0, sub_22);
+            match_114 = (fetch_109 != ((texelFetch(state, ivec3(mod_18, (func_clamp_113 % func_int_24), (((func_clamp_113 / func_int_24) * divide_26) + divide_27)), 0).x > 0.5) && ((gt_31 && ((func_clamp_107 & 1) == 0)) && (((divide_111 | 1) < surface_height) && ((mod_112 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_69 != ((match_91 != (match_114 && (bit_and_81 && ((((add_93 | 1) - 1) < surface_width) && (bitwise_and_75 == 0))))) && (bit_and_33 && (((mod_4 | 1) < surface_width) && eq_68)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCyclePass1SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int surface_width;
+    uniform sampler2D state;
+    uniform int surface_height;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int mod_1 = right_shift_0 % surface_width;
+        int divide_3 = right_shift_0 / surface_width;
+        bool slice_6 = texelFetch(state, clamp(ivec2(x, (((((divide_3 ^ 1) * surface_width) + mod_1) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool gt_7 = x > 0;
+        bool eq_8 = (y & 1) == 0;
+        bool bit_and_9 = gt_7 && eq_8;
+        bool lt_10 = (divide_3 | 1) < surface_height;
+        int bitwise_and_2 = mod_1 & 1;
+        bool bit_xor_11 = v_state != (slice_6 && (bit_and_9 && (lt_10 && (bitwise_and_2 == 0))));
+        int sub_13 = int(state_size.y) - 1;
+        int bitwise_and_4 = divide_3 & 1;
+        bool eq_5 = bitwise_and_2 == bitwise_and_4;
+        bool eq_12 = x == 0;
+        bool match_19;
+        if (eq_5) {
+            match_19 = bit_xor_11;
+        } else if ((eq_12 && eq_8)) {
+            match_19 = (!bit_xor_11);
+        } else {
+            int func_clamp_14 = clamp((y ^ 1), 0, sub_13);
+            bool slice_15 = texelFetch(state, clamp(ivec2(x, func_clamp_14), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_16 = func_clamp_14 >> 1;
+            int mod_18 = right_shift_16 % surface_width;
+            int divide_17 = right_shift_16 / surface_width;
+            match_19 = (slice_15 != ((texelFetch(state, clamp(ivec2(x, (((((divide_17 ^ 1) * surface_width) + mod_18) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_7 && ((func_clamp_14 & 1) == 0)) && (((divide_17 | 1) < surface_height) && ((mod_18 & 1) == 0)))));
+        }
+        int mul_20 = divide_3 * surface_width;
+        int add_21 = mod_1 + 1;
+        int func_clamp_22 = clamp((((mul_20 + ((add_21 ^ 1) - 1)) * 2) + 1), 0, sub_13);
+        bool slice_27 = texelFetch(state, clamp(ivec2(x, func_clamp_22), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_23 = func_clamp_22 >> 1;
+        int mod_24 = right_shift_23 % surface_width;
+        int divide_26 = right_shift_23 / surface_width;
+        bool slice_28 = texelFetch(state, clamp(ivec2(x, (((((divide_26 ^ 1) * surface_width) + mod_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_29 = (func_clamp_22 & 1) == 0;
+        bool bit_and_30 = gt_7 && eq_29;
+        bool lt_31 = (divide_26 | 1) < surface_height;
+        int bitwise_and_25 = mod_24 & 1;
+        bool bit_xor_32 = slice_27 != (slice_28 && (bit_and_30 && (lt_31 && (bitwise_and_25 == 0))));
+        bool match_38;
+        if ((bitwise_and_25 == (divide_26 & 1))) {
+            match_38 = bit_xor_32;
+        } else if ((eq_12 && eq_29)) {
+            match_38 = (!bit_xor_32);
+        } else {
+            int func_clamp_33 = clamp((func_clamp_22 ^ 1), 0, sub_13);
+            bool slice_34 = texelFetch(state, clamp(ivec2(x, func_clamp_33), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_35 = func_clamp_33 >> 1;
+            int mod_37 = right_shift_35 % surface_width;
+            int divide_36 = right_shift_35 / surface_width;
+            match_38 = (slice_34 != ((texelFetch(state, clamp(ivec2(x, (((((divide_36 ^ 1) * surface_width) + mod_37) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_7 && ((func_clamp_33 & 1) == 0)) && (((divide_36 | 1) < surface_height) && ((mod_37 & 1) == 0)))));
+        }
+        bool eq_39 = bitwise_and_4 == 0;
+        bool bit_xor_40 = match_19 != (match_38 && (bit_and_9 && ((((add_21 | 1) - 1) < surface_width) && eq_39)));
+        int func_clamp_41 = clamp((((mul_20 + (mod_1 ^ 1)) * 2) + 1), 0, sub_13);
+        bool slice_47 = texelFetch(state, clamp(ivec2(x, func_clamp_41), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_42 = func_clamp_41 >> 1;
+        int mod_43 = right_shift_42 % surface_width;
+        int divide_45 = right_shift_42 / surface_width;
+        bool slice_48 = texelFetch(state, clamp(ivec2(x, (((((divide_45 ^ 1) * surface_width) + mod_43) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_49 = (func_clamp_41 & 1) == 0;
+        bool bit_and_50 = gt_7 && eq_49;
+        bool lt_51 = (divide_45 | 1) < surface_height;
+        int bitwise_and_44 = mod_43 & 1;
+        bool bit_xor_52 = slice_47 != (slice_48 && (bit_and_50 && (lt_51 && (bitwise_and_44 == 0))));
+        int bitwise_and_46 = divide_45 & 1;
+        bool match_58;
+        if ((bitwise_and_44 == bitwise_and_46)) {
+            match_58 = bit_xor_52;
+        } else if ((eq_12 && eq_49)) {
+            match_58 = (!bit_xor_52);
+        } else {
+            int func_clamp_53 = clamp((func_clamp_41 ^ 1), 0, sub_13);
+            bool slice_54 = texelFetch(state, clamp(ivec2(x, func_clamp_53), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_55 = func_clamp_53 >> 1;
+            int mod_57 = right_shift_55 % surface_width;
+            int divide_56 = right_shift_55 / surface_width;
+            match_58 = (slice_54 != ((texelFetch(state, clamp(ivec2(x, (((((divide_56 ^ 1) * surface_width) + mod_57) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_7 && ((func_clamp_53 & 1) == 0)) && (((divide_56 | 1) < surface_height) && ((mod_57 & 1) == 0)))));
+        }
+        int mul_59 = divide_45 * surface_width;
+        int add_60 = mod_43 + 1;
+        int func_clamp_61 = clamp((((mul_59 + ((add_60 ^ 1) - 1)) * 2) + 1), 0, sub_13);
+        bool slice_66 = texelFetch(state, clamp(ivec2(x, func_clamp_61), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_62 = func_clamp_61 >> 1;
+        int mod_63 = right_shift_62 % surface_width;
+        int divide_65 = right_shift_62 / surface_width;
+        bool slice_67 = texelFetch(state, clamp(ivec2(x, (((((divide_65 ^ 1) * surface_width) + mod_63) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_68 = (func_clamp_61 & 1) == 0;
+        bool bit_and_69 = gt_7 && eq_68;
+        bool lt_70 = (divide_65 | 1) < surface_height;
+        int bitwise_and_64 = mod_63 & 1;
+        bool bit_xor_71 = slice_66 != (slice_67 && (bit_and_69 && (lt_70 && (bitwise_and_64 == 0))));
+        bool match_77;
+        if ((bitwise_and_64 == (divide_65 & 1))) {
+            match_77 = bit_xor_71;
+        } else if ((eq_12 && eq_68)) {
+            match_77 = (!bit_xor_71);
+        } else {
+            int func_clamp_72 = clamp((func_clamp_61 ^ 1), 0, sub_13);
+            bool slice_73 = texelFetch(state, clamp(ivec2(x, func_clamp_72), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_74 = func_clamp_72 >> 1;
+            int mod_76 = right_shift_74 % surface_width;
+            int divide_75 = right_shift_74 / surface_width;
+            match_77 = (slice_73 != ((texelFetch(state, clamp(ivec2(x, (((((divide_75 ^ 1) * surface_width) + mod_76) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_7 && ((func_clamp_72 & 1) == 0)) && (((divide_75 | 1) < surface_height) && ((mod_76 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_40 != ((match_58 != (match_77 && (bit_and_50 && ((((add_60 | 1) - 1) < surface_width) && (bitwise_and_46 == 0))))) && (bit_and_9 && (((mod_1 | 1) < surface_width) && eq_39)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_10 = int(state_tile.x);
+        int func_int_9 = int(out_tile.x);
+        int mul_11 = (x / func_int_9) * func_int_10;
+        int mod_12 = x % func_int_9;
+        int add_13 = mul_11 + clamp(mod_12, 0, (func_int_10 - 1));
+        int func_int_14 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_15 = (y / func_int_0) * func_int_14;
+        int mod_1 = y % func_int_0;
+        int sub_16 = func_int_14 - 1;
+        bool slice_17 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(mod_1, 0, sub_16))), 0).x > 0.5;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 26215) >> 17;
+        int mul_4 = right_shift_3 * 5;
+        int sub_5 = right_shift_2 - mul_4;
+        bool slice_18 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_3 ^ 1) * 5) + sub_5) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool gt_19 = mod_12 > 0;
+        bool eq_20 = (mod_1 & 1) == 0;
+        bool bit_and_21 = gt_19 && eq_20;
+        bool lt_22 = (right_shift_3 | 1) < 5;
+        int bitwise_and_6 = sub_5 & 1;
+        bool bit_xor_23 = slice_17 != (slice_18 && (bit_and_21 && (lt_22 && (bitwise_and_6 == 0))));
+        int bitwise_and_7 = right_shift_3 & 1;
+        bool eq_8 = bitwise_and_6 == bitwise_and_7;
+        bool eq_24 = mod_12 == 0;
+        bool match_30;
+        if (eq_8) {
+            match_30 = bit_xor_23;
+        } else if ((eq_24 && eq_20)) {
+            match_30 = (!bit_xor_23);
+        } else {
+            int func_clamp_25 = clamp((mod_1 ^ 1), 0, sub_16);
+            bool slice_26 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_25, 0, sub_16))), 0).x > 0.5;
+            int right_shift_27 = func_clamp_25 >> 1;
+            int right_shift_28 = (right_shift_27 * 26215) >> 17;
+            int sub_29 = right_shift_27 - (right_shift_28 * 5);
+            match_30 = (slice_26 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_28 ^ 1) * 5) + sub_29) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_25 & 1) == 0)) && (((right_shift_28 | 1) < 5) && ((sub_29 & 1) == 0)))));
+        }
+        int func_clamp_31 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        bool slice_36 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_31, 0, sub_16))), 0).x > 0.5;
+        int right_shift_32 = func_clamp_31 >> 1;
+        int right_shift_33 = (right_shift_32 * 26215) >> 17;
+        int sub_34 = right_shift_32 - (right_shift_33 * 5);
+        bool slice_37 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_33 ^ 1) * 5) + sub_34) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_38 = (func_clamp_31 & 1) == 0;
+        bool bit_and_39 = gt_19 && eq_38;
+        bool lt_40 = (right_shift_33 | 1) < 5;
+        int bitwise_and_35 = sub_34 & 1;
+        bool bit_xor_41 = slice_36 != (slice_37 && (bit_and_39 && (lt_40 && (bitwise_and_35 == 0))));
+        bool match_47;
+        if ((bitwise_and_35 == (right_shift_33 & 1))) {
+            match_47 = bit_xor_41;
+        } else if ((eq_24 && eq_38)) {
+            match_47 = (!bit_xor_41);
+        } else {
+            int func_clamp_42 = clamp((func_clamp_31 ^ 1), 0, sub_16);
+            bool slice_43 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_42, 0, sub_16))), 0).x > 0.5;
+            int right_shift_44 = func_clamp_42 >> 1;
+            int right_shift_45 = (right_shift_44 * 26215) >> 17;
+            int sub_46 = right_shift_44 - (right_shift_45 * 5);
+            match_47 = (slice_43 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_45 ^ 1) * 5) + sub_46) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_42 & 1) == 0)) && (((right_shift_45 | 1) < 5) && ((sub_46 & 1) == 0)))));
+        }
+        bool eq_48 = bitwise_and_7 == 0;
+        bool bit_xor_49 = match_30 != (match_47 && (bit_and_21 && eq_48));
+        int func_clamp_50 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, sub_16);
+        bool slice_57 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_50, 0, sub_16))), 0).x > 0.5;
+        int right_shift_51 = func_clamp_50 >> 1;
+        int right_shift_52 = (right_shift_51 * 26215) >> 17;
+        int mul_53 = right_shift_52 * 5;
+        int sub_54 = right_shift_51 - mul_53;
+        bool slice_58 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_52 ^ 1) * 5) + sub_54) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_59 = (func_clamp_50 & 1) == 0;
+        bool bit_and_60 = gt_19 && eq_59;
+        bool lt_61 = (right_shift_52 | 1) < 5;
+        int bitwise_and_55 = sub_54 & 1;
+        bool bit_xor_62 = slice_57 != (slice_58 && (bit_and_60 && (lt_61 && (bitwise_and_55 == 0))));
+        int bitwise_and_56 = right_shift_52 & 1;
+        bool match_68;
+        if ((bitwise_and_55 == bitwise_and_56)) {
+            match_68 = bit_xor_62;
+        } else if ((eq_24 && eq_59)) {
+            match_68 = (!bit_xor_62);
+        } else {
+            int func_clamp_63 = clamp((func_clamp_50 ^ 1), 0, sub_16);
+            bool slice_64 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_63, 0, sub_16))), 0).x > 0.5;
+            int right_shift_65 = func_clamp_63 >> 1;
+            int right_shift_66 = (right_shift_65 * 26215) >> 17;
+            int sub_67 = right_shift_65 - (right_shift_66 * 5);
+            match_68 = (slice_64 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_66 ^ 1) * 5) + sub_67) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_63 & 1) == 0)) && (((right_shift_66 | 1) < 5) && ((sub_67 & 1) == 0)))));
+        }
+        int func_clamp_69 = clamp((((mul_53 + (((sub_54 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        bool slice_74 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_69, 0, sub_16))), 0).x > 0.5;
+        int right_shift_70 = func_clamp_69 >> 1;
+        int right_shift_71 = (right_shift_70 * 26215) >> 17;
+        int sub_72 = right_shift_70 - (right_shift_71 * 5);
+        bool slice_75 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_71 ^ 1) * 5) + sub_72) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_76 = (func_clamp_69 & 1) == 0;
+        bool bit_and_77 = gt_19 && eq_76;
+        bool lt_78 = (right_shift_71 | 1) < 5;
+        int bitwise_and_73 = sub_72 & 1;
+        bool bit_xor_79 = slice_74 != (slice_75 && (bit_and_77 && (lt_78 && (bitwise_and_73 == 0))));
+        bool match_85;
+        if ((bitwise_and_73 == (right_shift_71 & 1))) {
+            match_85 = bit_xor_79;
+        } else if ((eq_24 && eq_76)) {
+            match_85 = (!bit_xor_79);
+        } else {
+            int func_clamp_80 = clamp((func_clamp_69 ^ 1), 0, sub_16);
+            bool slice_81 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_80, 0, sub_16))), 0).x > 0.5;
+            int right_shift_82 = func_clamp_80 >> 1;
+            int right_shift_83 = (right_shift_82 * 26215) >> 17;
+            int sub_84 = right_shift_82 - (right_shift_83 * 5);
+            match_85 = (slice_81 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_83 ^ 1) * 5) + sub_84) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_80 & 1) == 0)) && (((right_shift_83 | 1) < 5) && ((sub_84 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_49 != ((match_68 != (match_85 && (bit_and_60 && (bitwise_and_56 == 0)))) && (bit_and_21 && (((sub_5 | 1) < 5) && eq_48)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height5_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        int mul_2 = right_shift_1 * 5;
+        int sub_3 = right_shift_0 - mul_2;
+        bool slice_7 = texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 5) + sub_3) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool gt_8 = x > 0;
+        bool eq_9 = (y & 1) == 0;
+        bool bit_and_10 = gt_8 && eq_9;
+        bool lt_11 = (right_shift_1 | 1) < 5;
+        int bitwise_and_4 = sub_3 & 1;
+        bool bit_xor_12 = v_state != (slice_7 && (bit_and_10 && (lt_11 && (bitwise_and_4 == 0))));
+        int sub_14 = int(state_size.y) - 1;
+        int bitwise_and_5 = right_shift_1 & 1;
+        bool eq_6 = bitwise_and_4 == bitwise_and_5;
+        bool eq_13 = x == 0;
+        bool match_20;
+        if (eq_6) {
+            match_20 = bit_xor_12;
+        } else if ((eq_13 && eq_9)) {
+            match_20 = (!bit_xor_12);
+        } else {
+            int func_clamp_15 = clamp((y ^ 1), 0, sub_14);
+            bool slice_16 = texelFetch(state, clamp(ivec2(x, func_clamp_15), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_17 = func_clamp_15 >> 1;
+            int right_shift_18 = (right_shift_17 * 26215) >> 17;
+            int sub_19 = right_shift_17 - (right_shift_18 * 5);
+            match_20 = (slice_16 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_18 ^ 1) * 5) + sub_19) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_15 & 1) == 0)) && (((right_shift_18 | 1) < 5) && ((sub_19 & 1) == 0)))));
+        }
+        int func_clamp_21 = clamp((((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_14);
+        bool slice_26 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_22 = func_clamp_21 >> 1;
+        int right_shift_23 = (right_shift_22 * 26215) >> 17;
+        int sub_24 = right_shift_22 - (right_shift_23 * 5);
+        bool slice_27 = texelFetch(state, clamp(ivec2(x, (((((right_shift_23 ^ 1) * 5) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_28 = (func_clamp_21 & 1) == 0;
+        bool bit_and_29 = gt_8 && eq_28;
+        bool lt_30 = (right_shift_23 | 1) < 5;
+        int bitwise_and_25 = sub_24 & 1;
+        bool bit_xor_31 = slice_26 != (slice_27 && (bit_and_29 && (lt_30 && (bitwise_and_25 == 0))));
+        bool match_37;
+        if ((bitwise_and_25 == (right_shift_23 & 1))) {
+            match_37 = bit_xor_31;
+        } else if ((eq_13 && eq_28)) {
+            match_37 = (!bit_xor_31);
+        } else {
+            int func_clamp_32 = clamp((func_clamp_21 ^ 1), 0, sub_14);
+            bool slice_33 = texelFetch(state, clamp(ivec2(x, func_clamp_32), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_34 = func_clamp_32 >> 1;
+            int right_shift_35 = (right_shift_34 * 26215) >> 17;
+            int sub_36 = right_shift_34 - (right_shift_35 * 5);
+            match_37 = (slice_33 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_35 ^ 1) * 5) + sub_36) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_32 & 1) == 0)) && (((right_shift_35 | 1) < 5) && ((sub_36 & 1) == 0)))));
+        }
+        bool eq_38 = bitwise_and_5 == 0;
+        bool bit_xor_39 = match_20 != (match_37 && (bit_and_10 && eq_38));
+        int func_clamp_40 = clamp((((mul_2 + (sub_3 ^ 1)) * 2) + 1), 0, sub_14);
+        bool slice_47 = texelFetch(state, clamp(ivec2(x, func_clamp_40), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_41 = func_clamp_40 >> 1;
+        int right_shift_42 = (right_shift_41 * 26215) >> 17;
+        int mul_43 = right_shift_42 * 5;
+        int sub_44 = right_shift_41 - mul_43;
+        bool slice_48 = texelFetch(state, clamp(ivec2(x, (((((right_shift_42 ^ 1) * 5) + sub_44) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_49 = (func_clamp_40 & 1) == 0;
+        bool bit_and_50 = gt_8 && eq_49;
+        bool lt_51 = (right_shift_42 | 1) < 5;
+        int bitwise_and_45 = sub_44 & 1;
+        bool bit_xor_52 = slice_47 != (slice_48 && (bit_and_50 && (lt_51 && (bitwise_and_45 == 0))));
+        int bitwise_and_46 = right_shift_42 & 1;
+        bool match_58;
+        if ((bitwise_and_45 == bitwise_and_46)) {
+            match_58 = bit_xor_52;
+        } else if ((eq_13 && eq_49)) {
+            match_58 = (!bit_xor_52);
+        } else {
+            int func_clamp_53 = clamp((func_clamp_40 ^ 1), 0, sub_14);
+            bool slice_54 = texelFetch(state, clamp(ivec2(x, func_clamp_53), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_55 = func_clamp_53 >> 1;
+            int right_shift_56 = (right_shift_55 * 26215) >> 17;
+            int sub_57 = right_shift_55 - (right_shift_56 * 5);
+            match_58 = (slice_54 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_56 ^ 1) * 5) + sub_57) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_53 & 1) == 0)) && (((right_shift_56 | 1) < 5) && ((sub_57 & 1) == 0)))));
+        }
+        int func_clamp_59 = clamp((((mul_43 + (((sub_44 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_14);
+        bool slice_64 = texelFetch(state, clamp(ivec2(x, func_clamp_59), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_60 = func_clamp_59 >> 1;
+        int right_shift_61 = (right_shift_60 * 26215) >> 17;
+        int sub_62 = right_shift_60 - (right_shift_61 * 5);
+        bool slice_65 = texelFetch(state, clamp(ivec2(x, (((((right_shift_61 ^ 1) * 5) + sub_62) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_66 = (func_clamp_59 & 1) == 0;
+        bool bit_and_67 = gt_8 && eq_66;
+        bool lt_68 = (right_shift_61 | 1) < 5;
+        int bitwise_and_63 = sub_62 & 1;
+        bool bit_xor_69 = slice_64 != (slice_65 && (bit_and_67 && (lt_68 && (bitwise_and_63 == 0))));
+        bool match_75;
+        if ((bitwise_and_63 == (right_shift_61 & 1))) {
+            match_75 = bit_xor_69;
+        } else if ((eq_13 && eq_66)) {
+            match_75 = (!bit_xor_69);
+        } else {
+            int func_clamp_70 = clamp((func_clamp_59 ^ 1), 0, sub_14);
+            bool slice_71 = texelFetch(state, clamp(ivec2(x, func_clamp_70), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_72 = func_clamp_70 >> 1;
+            int right_shift_73 = (right_shift_72 * 26215) >> 17;
+            int sub_74 = right_shift_72 - (right_shift_73 * 5);
+            match_75 = (slice_71 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_73 ^ 1) * 5) + sub_74) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_70 & 1) == 0)) && (((right_shift_73 | 1) < 5) && ((sub_74 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_39 != ((match_58 != (match_75 && (bit_and_50 && (bitwise_and_46 == 0)))) && (bit_and_10 && (((sub_3 | 1) < 5) && eq_38)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height5_surface_width5_out_tile27x50_state_tile27x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        int mul_4 = right_shift_3 * 5;
+        int sub_5 = right_shift_2 - mul_4;
+        bool slice_9 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 5) + sub_5) * 2) + 1), 0, 49))), 0).x > 0.5;
+        int sub_10 = x - (int(((float(x) + 0.5) * 0.03703703731298447)) * 27);
+        bool gt_11 = sub_10 > 0;
+        bool eq_12 = (sub_1 & 1) == 0;
+        bool bit_and_13 = gt_11 && eq_12;
+        bool lt_14 = (right_shift_3 | 1) < 5;
+        int bitwise_and_6 = sub_5 & 1;
+        bool bit_xor_15 = v_state != (slice_9 && (bit_and_13 && (lt_14 && (bitwise_and_6 == 0))));
+        int bitwise_and_7 = right_shift_3 & 1;
+        bool eq_8 = bitwise_and_6 == bitwise_and_7;
+        bool eq_16 = sub_10 == 0;
+        bool match_22;
+        if (eq_8) {
+            match_22 = bit_xor_15;
+        } else if ((eq_16 && eq_12)) {
+            match_22 = (!bit_xor_15);
+        } else {
+            int bitwise_xor_17 = sub_1 ^ 1;
+            bool slice_18 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_17)), 0).x > 0.5;
+            int right_shift_19 = bitwise_xor_17 >> 1;
+            int right_shift_20 = (right_shift_19 * 13) >> 6;
+            int sub_21 = right_shift_19 - (right_shift_20 * 5);
+            match_22 = (slice_18 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_20 ^ 1) * 5) + sub_21) * 2) + 1), 0, 49))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_17 & 1) == 0)) && (((right_shift_20 | 1) < 5) && ((sub_21 & 1) == 0)))));
+        }
+        int func_clamp_23 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        bool slice_28 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_23)), 0).x > 0.5;
+        int right_shift_24 = func_clamp_23 >> 1;
+        int right_shift_25 = (right_shift_24 * 13) >> 6;
+        int sub_26 = right_shift_24 - (right_shift_25 * 5);
+        bool slice_29 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_25 ^ 1) * 5) + sub_26) * 2) + 1), 0, 49))), 0).x > 0.5;
+        bool eq_30 = (func_clamp_23 & 1) == 0;
+        bool bit_and_31 = gt_11 && eq_30;
+        bool lt_32 = (right_shift_25 | 1) < 5;
+        int bitwise_and_27 = sub_26 & 1;
+        bool bit_xor_33 = slice_28 != (slice_29 && (bit_and_31 && (lt_32 && (bitwise_and_27 == 0))));
+        bool match_39;
+        if ((bitwise_and_27 == (right_shift_25 & 1))) {
+            match_39 = bit_xor_33;
+        } else if ((eq_16 && eq_30)) {
+            match_39 = (!bit_xor_33);
+        } else {
+            int bitwise_xor_34 = func_clamp_23 ^ 1;
+            bool slice_35 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_34)), 0).x > 0.5;
+            int right_shift_36 = bitwise_xor_34 >> 1;
+            int right_shift_37 = (right_shift_36 * 13) >> 6;
+            int sub_38 = right_shift_36 - (right_shift_37 * 5);
+            match_39 = (slice_35 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_37 ^ 1) * 5) + sub_38) * 2) + 1), 0, 49))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_34 & 1) == 0)) && (((right_shift_37 | 1) < 5) && ((sub_38 & 1) == 0)))));
+        }
+        bool eq_40 = bitwise_and_7 == 0;
+        bool bit_xor_41 = match_22 != (match_39 && (bit_and_13 && eq_40));
+        int func_clamp_42 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 49);
+        bool slice_49 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_42)), 0).x > 0.5;
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 13) >> 6;
+        int mul_45 = right_shift_44 * 5;
+        int sub_46 = right_shift_43 - mul_45;
+        bool slice_50 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_44 ^ 1) * 5) + sub_46) * 2) + 1), 0, 49))), 0).x > 0.5;
+        bool eq_51 = (func_clamp_42 & 1) == 0;
+        bool bit_and_52 = gt_11 && eq_51;
+        bool lt_53 = (right_shift_44 | 1) < 5;
+        int bitwise_and_47 = sub_46 & 1;
+        bool bit_xor_54 = slice_49 != (slice_50 && (bit_and_52 && (lt_53 && (bitwise_and_47 == 0))));
+        int bitwise_and_48 = right_shift_44 & 1;
+        bool match_60;
+        if ((bitwise_and_47 == bitwise_and_48)) {
+            match_60 = bit_xor_54;
+        } else if ((eq_16 && eq_51)) {
+            match_60 = (!bit_xor_54);
+        } else {
+            int bitwise_xor_55 = func_clamp_42 ^ 1;
+            bool slice_56 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_55)), 0).x > 0.5;
+            int right_shift_57 = bitwise_xor_55 >> 1;
+            int right_shift_58 = (right_shift_57 * 13) >> 6;
+            int sub_59 = right_shift_57 - (right_shift_58 * 5);
+            match_60 = (slice_56 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_58 ^ 1) * 5) + sub_59) * 2) + 1), 0, 49))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_55 & 1) == 0)) && (((right_shift_58 | 1) < 5) && ((sub_59 & 1) == 0)))));
+        }
+        int func_clamp_61 = clamp((((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        bool slice_66 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_61)), 0).x > 0.5;
+        int right_shift_62 = func_clamp_61 >> 1;
+        int right_shift_63 = (right_shift_62 * 13) >> 6;
+        int sub_64 = right_shift_62 - (right_shift_63 * 5);
+        bool slice_67 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_63 ^ 1) * 5) + sub_64) * 2) + 1), 0, 49))), 0).x > 0.5;
+        bool eq_68 = (func_clamp_61 & 1) == 0;
+        bool bit_and_69 = gt_11 && eq_68;
+        bool lt_70 = (right_shift_63 | 1) < 5;
+        int bitwise_and_65 = sub_64 & 1;
+        bool bit_xor_71 = slice_66 != (slice_67 && (bit_and_69 && (lt_70 && (bitwise_and_65 == 0))));
+        bool match_77;
+        if ((bitwise_and_65 == (right_shift_63 & 1))) {
+            match_77 = bit_xor_71;
+        } else if ((eq_16 && eq_68)) {
+            match_77 = (!bit_xor_71);
+        } else {
+            int bitwise_xor_72 = func_clamp_61 ^ 1;
+            bool slice_73 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_72)), 0).x > 0.5;
+            int right_shift_74 = bitwise_xor_72 >> 1;
+            int right_shift_75 = (right_shift_74 * 13) >> 6;
+            int sub_76 = right_shift_74 - (right_shift_75 * 5);
+            match_77 = (slice_73 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_75 ^ 1) * 5) + sub_76) * 2) + 1), 0, 49))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_72 & 1) == 0)) && (((right_shift_75 | 1) < 5) && ((sub_76 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_41 != ((match_60 != (match_77 && (bit_and_52 && (bitwise_and_48 == 0)))) && (bit_and_13 && (((sub_5 | 1) < 5) && eq_40)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_10 = int(state_tile.x);
+        int func_int_9 = int(out_tile.x);
+        int mul_11 = (x / func_int_9) * func_int_10;
+        int mod_12 = x % func_int_9;
+        int add_13 = mul_11 + clamp(mod_12, 0, (func_int_10 - 1));
+        int func_int_14 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_15 = (y / func_int_0) * func_int_14;
+        int mod_1 = y % func_int_0;
+        int sub_16 = func_int_14 - 1;
+        bool slice_17 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(mod_1, 0, sub_16))), 0).x > 0.5;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 3641) >> 15;
+        int mul_4 = right_shift_3 * 9;
+        int sub_5 = right_shift_2 - mul_4;
+        bool slice_18 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_3 ^ 1) * 9) + sub_5) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool gt_19 = mod_12 > 0;
+        bool eq_20 = (mod_1 & 1) == 0;
+        bool bit_and_21 = gt_19 && eq_20;
+        bool lt_22 = (right_shift_3 | 1) < 9;
+        int bitwise_and_6 = sub_5 & 1;
+        bool bit_xor_23 = slice_17 != (slice_18 && (bit_and_21 && (lt_22 && (bitwise_and_6 == 0))));
+        int bitwise_and_7 = right_shift_3 & 1;
+        bool eq_8 = bitwise_and_6 == bitwise_and_7;
+        bool eq_24 = mod_12 == 0;
+        bool match_30;
+        if (eq_8) {
+            match_30 = bit_xor_23;
+        } else if ((eq_24 && eq_20)) {
+            match_30 = (!bit_xor_23);
+        } else {
+            int func_clamp_25 = clamp((mod_1 ^ 1), 0, sub_16);
+            bool slice_26 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_25, 0, sub_16))), 0).x > 0.5;
+            int right_shift_27 = func_clamp_25 >> 1;
+            int right_shift_28 = (right_shift_27 * 3641) >> 15;
+            int sub_29 = right_shift_27 - (right_shift_28 * 9);
+            match_30 = (slice_26 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_28 ^ 1) * 9) + sub_29) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_25 & 1) == 0)) && (((right_shift_28 | 1) < 9) && ((sub_29 & 1) == 0)))));
+        }
+        int func_clamp_31 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        bool slice_36 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_31, 0, sub_16))), 0).x > 0.5;
+        int right_shift_32 = func_clamp_31 >> 1;
+        int right_shift_33 = (right_shift_32 * 3641) >> 15;
+        int sub_34 = right_shift_32 - (right_shift_33 * 9);
+        bool slice_37 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_33 ^ 1) * 9) + sub_34) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_38 = (func_clamp_31 & 1) == 0;
+        bool bit_and_39 = gt_19 && eq_38;
+        bool lt_40 = (right_shift_33 | 1) < 9;
+        int bitwise_and_35 = sub_34 & 1;
+        bool bit_xor_41 = slice_36 != (slice_37 && (bit_and_39 && (lt_40 && (bitwise_and_35 == 0))));
+        bool match_47;
+        if ((bitwise_and_35 == (right_shift_33 & 1))) {
+            match_47 = bit_xor_41;
+        } else if ((eq_24 && eq_38)) {
+            match_47 = (!bit_xor_41);
+        } else {
+            int func_clamp_42 = clamp((func_clamp_31 ^ 1), 0, sub_16);
+            bool slice_43 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_42, 0, sub_16))), 0).x > 0.5;
+            int right_shift_44 = func_clamp_42 >> 1;
+            int right_shift_45 = (right_shift_44 * 3641) >> 15;
+            int sub_46 = right_shift_44 - (right_shift_45 * 9);
+            match_47 = (slice_43 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_45 ^ 1) * 9) + sub_46) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_42 & 1) == 0)) && (((right_shift_45 | 1) < 9) && ((sub_46 & 1) == 0)))));
+        }
+        bool eq_48 = bitwise_and_7 == 0;
+        bool bit_xor_49 = match_30 != (match_47 && (bit_and_21 && eq_48));
+        int func_clamp_50 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, sub_16);
+        bool slice_57 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_50, 0, sub_16))), 0).x > 0.5;
+        int right_shift_51 = func_clamp_50 >> 1;
+        int right_shift_52 = (right_shift_51 * 3641) >> 15;
+        int mul_53 = right_shift_52 * 9;
+        int sub_54 = right_shift_51 - mul_53;
+        bool slice_58 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_52 ^ 1) * 9) + sub_54) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_59 = (func_clamp_50 & 1) == 0;
+        bool bit_and_60 = gt_19 && eq_59;
+        bool lt_61 = (right_shift_52 | 1) < 9;
+        int bitwise_and_55 = sub_54 & 1;
+        bool bit_xor_62 = slice_57 != (slice_58 && (bit_and_60 && (lt_61 && (bitwise_and_55 == 0))));
+        int bitwise_and_56 = right_shift_52 & 1;
+        bool match_68;
+        if ((bitwise_and_55 == bitwise_and_56)) {
+            match_68 = bit_xor_62;
+        } else if ((eq_24 && eq_59)) {
+            match_68 = (!bit_xor_62);
+        } else {
+            int func_clamp_63 = clamp((func_clamp_50 ^ 1), 0, sub_16);
+            bool slice_64 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_63, 0, sub_16))), 0).x > 0.5;
+            int right_shift_65 = func_clamp_63 >> 1;
+            int right_shift_66 = (right_shift_65 * 3641) >> 15;
+            int sub_67 = right_shift_65 - (right_shift_66 * 9);
+            match_68 = (slice_64 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_66 ^ 1) * 9) + sub_67) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_63 & 1) == 0)) && (((right_shift_66 | 1) < 9) && ((sub_67 & 1) == 0)))));
+        }
+        int func_clamp_69 = clamp((((mul_53 + (((sub_54 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        bool slice_74 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_69, 0, sub_16))), 0).x > 0.5;
+        int right_shift_70 = func_clamp_69 >> 1;
+        int right_shift_71 = (right_shift_70 * 3641) >> 15;
+        int sub_72 = right_shift_70 - (right_shift_71 * 9);
+        bool slice_75 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_71 ^ 1) * 9) + sub_72) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_76 = (func_clamp_69 & 1) == 0;
+        bool bit_and_77 = gt_19 && eq_76;
+        bool lt_78 = (right_shift_71 | 1) < 9;
+        int bitwise_and_73 = sub_72 & 1;
+        bool bit_xor_79 = slice_74 != (slice_75 && (bit_and_77 && (lt_78 && (bitwise_and_73 == 0))));
+        bool match_85;
+        if ((bitwise_and_73 == (right_shift_71 & 1))) {
+            match_85 = bit_xor_79;
+        } else if ((eq_24 && eq_76)) {
+            match_85 = (!bit_xor_79);
+        } else {
+            int func_clamp_80 = clamp((func_clamp_69 ^ 1), 0, sub_16);
+            bool slice_81 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_80, 0, sub_16))), 0).x > 0.5;
+            int right_shift_82 = func_clamp_80 >> 1;
+            int right_shift_83 = (right_shift_82 * 3641) >> 15;
+            int sub_84 = right_shift_82 - (right_shift_83 * 9);
+            match_85 = (slice_81 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_83 ^ 1) * 9) + sub_84) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_80 & 1) == 0)) && (((right_shift_83 | 1) < 9) && ((sub_84 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_49 != ((match_68 != (match_85 && (bit_and_60 && (bitwise_and_56 == 0)))) && (bit_and_21 && (((sub_5 | 1) < 9) && eq_48)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height9_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        int mul_2 = right_shift_1 * 9;
+        int sub_3 = right_shift_0 - mul_2;
+        bool slice_7 = texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 9) + sub_3) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool gt_8 = x > 0;
+        bool eq_9 = (y & 1) == 0;
+        bool bit_and_10 = gt_8 && eq_9;
+        bool lt_11 = (right_shift_1 | 1) < 9;
+        int bitwise_and_4 = sub_3 & 1;
+        bool bit_xor_12 = v_state != (slice_7 && (bit_and_10 && (lt_11 && (bitwise_and_4 == 0))));
+        int sub_14 = int(state_size.y) - 1;
+        int bitwise_and_5 = right_shift_1 & 1;
+        bool eq_6 = bitwise_and_4 == bitwise_and_5;
+        bool eq_13 = x == 0;
+        bool match_20;
+        if (eq_6) {
+            match_20 = bit_xor_12;
+        } else if ((eq_13 && eq_9)) {
+            match_20 = (!bit_xor_12);
+        } else {
+            int func_clamp_15 = clamp((y ^ 1), 0, sub_14);
+            bool slice_16 = texelFetch(state, clamp(ivec2(x, func_clamp_15), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_17 = func_clamp_15 >> 1;
+            int right_shift_18 = (right_shift_17 * 3641) >> 15;
+            int sub_19 = right_shift_17 - (right_shift_18 * 9);
+            match_20 = (slice_16 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_18 ^ 1) * 9) + sub_19) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_15 & 1) == 0)) && (((right_shift_18 | 1) < 9) && ((sub_19 & 1) == 0)))));
+        }
+        int func_clamp_21 = clamp((((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_14);
+        bool slice_26 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_22 = func_clamp_21 >> 1;
+        int right_shift_23 = (right_shift_22 * 3641) >> 15;
+        int sub_24 = right_shift_22 - (right_shift_23 * 9);
+        bool slice_27 = texelFetch(state, clamp(ivec2(x, (((((right_shift_23 ^ 1) * 9) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_28 = (func_clamp_21 & 1) == 0;
+        bool bit_and_29 = gt_8 && eq_28;
+        bool lt_30 = (right_shift_23 | 1) < 9;
+        int bitwise_and_25 = sub_24 & 1;
+        bool bit_xor_31 = slice_26 != (slice_27 && (bit_and_29 && (lt_30 && (bitwise_and_25 == 0))));
+        bool match_37;
+        if ((bitwise_and_25 == (right_shift_23 & 1))) {
+            match_37 = bit_xor_31;
+        } else if ((eq_13 && eq_28)) {
+            match_37 = (!bit_xor_31);
+        } else {
+            int func_clamp_32 = clamp((func_clamp_21 ^ 1), 0, sub_14);
+            bool slice_33 = texelFetch(state, clamp(ivec2(x, func_clamp_32), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_34 = func_clamp_32 >> 1;
+            int right_shift_35 = (right_shift_34 * 3641) >> 15;
+            int sub_36 = right_shift_34 - (right_shift_35 * 9);
+            match_37 = (slice_33 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_35 ^ 1) * 9) + sub_36) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_32 & 1) == 0)) && (((right_shift_35 | 1) < 9) && ((sub_36 & 1) == 0)))));
+        }
+        bool eq_38 = bitwise_and_5 == 0;
+        bool bit_xor_39 = match_20 != (match_37 && (bit_and_10 && eq_38));
+        int func_clamp_40 = clamp((((mul_2 + (sub_3 ^ 1)) * 2) + 1), 0, sub_14);
+        bool slice_47 = texelFetch(state, clamp(ivec2(x, func_clamp_40), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_41 = func_clamp_40 >> 1;
+        int right_shift_42 = (right_shift_41 * 3641) >> 15;
+        int mul_43 = right_shift_42 * 9;
+        int sub_44 = right_shift_41 - mul_43;
+        bool slice_48 = texelFetch(state, clamp(ivec2(x, (((((right_shift_42 ^ 1) * 9) + sub_44) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_49 = (func_clamp_40 & 1) == 0;
+        bool bit_and_50 = gt_8 && eq_49;
+        bool lt_51 = (right_shift_42 | 1) < 9;
+        int bitwise_and_45 = sub_44 & 1;
+        bool bit_xor_52 = slice_47 != (slice_48 && (bit_and_50 && (lt_51 && (bitwise_and_45 == 0))));
+        int bitwise_and_46 = right_shift_42 & 1;
+        bool match_58;
+        if ((bitwise_and_45 == bitwise_and_46)) {
+            match_58 = bit_xor_52;
+        } else if ((eq_13 && eq_49)) {
+            match_58 = (!bit_xor_52);
+        } else {
+            int func_clamp_53 = clamp((func_clamp_40 ^ 1), 0, sub_14);
+            bool slice_54 = texelFetch(state, clamp(ivec2(x, func_clamp_53), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_55 = func_clamp_53 >> 1;
+            int right_shift_56 = (right_shift_55 * 3641) >> 15;
+            int sub_57 = right_shift_55 - (right_shift_56 * 9);
+            match_58 = (slice_54 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_56 ^ 1) * 9) + sub_57) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_53 & 1) == 0)) && (((right_shift_56 | 1) < 9) && ((sub_57 & 1) == 0)))));
+        }
+        int func_clamp_59 = clamp((((mul_43 + (((sub_44 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_14);
+        bool slice_64 = texelFetch(state, clamp(ivec2(x, func_clamp_59), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_60 = func_clamp_59 >> 1;
+        int right_shift_61 = (right_shift_60 * 3641) >> 15;
+        int sub_62 = right_shift_60 - (right_shift_61 * 9);
+        bool slice_65 = texelFetch(state, clamp(ivec2(x, (((((right_shift_61 ^ 1) * 9) + sub_62) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_66 = (func_clamp_59 & 1) == 0;
+        bool bit_and_67 = gt_8 && eq_66;
+        bool lt_68 = (right_shift_61 | 1) < 9;
+        int bitwise_and_63 = sub_62 & 1;
+        bool bit_xor_69 = slice_64 != (slice_65 && (bit_and_67 && (lt_68 && (bitwise_and_63 == 0))));
+        bool match_75;
+        if ((bitwise_and_63 == (right_shift_61 & 1))) {
+            match_75 = bit_xor_69;
+        } else if ((eq_13 && eq_66)) {
+            match_75 = (!bit_xor_69);
+        } else {
+            int func_clamp_70 = clamp((func_clamp_59 ^ 1), 0, sub_14);
+            bool slice_71 = texelFetch(state, clamp(ivec2(x, func_clamp_70), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_72 = func_clamp_70 >> 1;
+            int right_shift_73 = (right_shift_72 * 3641) >> 15;
+            int sub_74 = right_shift_72 - (right_shift_73 * 9);
+            match_75 = (slice_71 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_73 ^ 1) * 9) + sub_74) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_70 & 1) == 0)) && (((right_shift_73 | 1) < 9) && ((sub_74 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_39 != ((match_58 != (match_75 && (bit_and_50 && (bitwise_and_46 == 0)))) && (bit_and_10 && (((sub_3 | 1) < 9) && eq_38)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height9_surface_width9_out_tile83x162_state_tile83x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        int mul_4 = right_shift_3 * 9;
+        int sub_5 = right_shift_2 - mul_4;
+        bool slice_9 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 9) + sub_5) * 2) + 1), 0, 161))), 0).x > 0.5;
+        int sub_10 = x - (((x * 25267) >> 21) * 83);
+        bool gt_11 = sub_10 > 0;
+        bool eq_12 = (sub_1 & 1) == 0;
+        bool bit_and_13 = gt_11 && eq_12;
+        bool lt_14 = (right_shift_3 | 1) < 9;
+        int bitwise_and_6 = sub_5 & 1;
+        bool bit_xor_15 = v_state != (slice_9 && (bit_and_13 && (lt_14 && (bitwise_and_6 == 0))));
+        int bitwise_and_7 = right_shift_3 & 1;
+        bool eq_8 = bitwise_and_6 == bitwise_and_7;
+        bool eq_16 = sub_10 == 0;
+        bool match_22;
+        if (eq_8) {
+            match_22 = bit_xor_15;
+        } else if ((eq_16 && eq_12)) {
+            match_22 = (!bit_xor_15);
+        } else {
+            int bitwise_xor_17 = sub_1 ^ 1;
+            bool slice_18 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_17)), 0).x > 0.5;
+            int right_shift_19 = bitwise_xor_17 >> 1;
+            int right_shift_20 = (right_shift_19 * 57) >> 9;
+            int sub_21 = right_shift_19 - (right_shift_20 * 9);
+            match_22 = (slice_18 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_20 ^ 1) * 9) + sub_21) * 2) + 1), 0, 161))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_17 & 1) == 0)) && (((right_shift_20 | 1) < 9) && ((sub_21 & 1) == 0)))));
+        }
+        int func_clamp_23 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        bool slice_28 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_23)), 0).x > 0.5;
+        int right_shift_24 = func_clamp_23 >> 1;
+        int right_shift_25 = (right_shift_24 * 57) >> 9;
+        int sub_26 = right_shift_24 - (right_shift_25 * 9);
+        bool slice_29 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_25 ^ 1) * 9) + sub_26) * 2) + 1), 0, 161))), 0).x > 0.5;
+        bool eq_30 = (func_clamp_23 & 1) == 0;
+        bool bit_and_31 = gt_11 && eq_30;
+        bool lt_32 = (right_shift_25 | 1) < 9;
+        int bitwise_and_27 = sub_26 & 1;
+        bool bit_xor_33 = slice_28 != (slice_29 && (bit_and_31 && (lt_32 && (bitwise_and_27 == 0))));
+        bool match_39;
+        if ((bitwise_and_27 == (right_shift_25 & 1))) {
+            match_39 = bit_xor_33;
+        } else if ((eq_16 && eq_30)) {
+            match_39 = (!bit_xor_33);
+        } else {
+            int bitwise_xor_34 = func_clamp_23 ^ 1;
+            bool slice_35 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_34)), 0).x > 0.5;
+            int right_shift_36 = bitwise_xor_34 >> 1;
+            int right_shift_37 = (right_shift_36 * 57) >> 9;
+            int sub_38 = right_shift_36 - (right_shift_37 * 9);
+            match_39 = (slice_35 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_37 ^ 1) * 9) + sub_38) * 2) + 1), 0, 161))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_34 & 1) == 0)) && (((right_shift_37 | 1) < 9) && ((sub_38 & 1) == 0)))));
+        }
+        bool eq_40 = bitwise_and_7 == 0;
+        bool bit_xor_41 = match_22 != (match_39 && (bit_and_13 && eq_40));
+        int func_clamp_42 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 161);
+        bool slice_49 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_42)), 0).x > 0.5;
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 57) >> 9;
+        int mul_45 = right_shift_44 * 9;
+        int sub_46 = right_shift_43 - mul_45;
+        bool slice_50 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_44 ^ 1) * 9) + sub_46) * 2) + 1), 0, 161))), 0).x > 0.5;
+        bool eq_51 = (func_clamp_42 & 1) == 0;
+        bool bit_and_52 = gt_11 && eq_51;
+        bool lt_53 = (right_shift_44 | 1) < 9;
+        int bitwise_and_47 = sub_46 & 1;
+        bool bit_xor_54 = slice_49 != (slice_50 && (bit_and_52 && (lt_53 && (bitwise_and_47 == 0))));
+        int bitwise_and_48 = right_shift_44 & 1;
+        bool match_60;
+        if ((bitwise_and_47 == bitwise_and_48)) {
+            match_60 = bit_xor_54;
+        } else if ((eq_16 && eq_51)) {
+            match_60 = (!bit_xor_54);
+        } else {
+            int bitwise_xor_55 = func_clamp_42 ^ 1;
+            bool slice_56 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_55)), 0).x > 0.5;
+            int right_shift_57 = bitwise_xor_55 >> 1;
+            int right_shift_58 = (right_shift_57 * 57) >> 9;
+            int sub_59 = right_shift_57 - (right_shift_58 * 9);
+            match_60 = (slice_56 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_58 ^ 1) * 9) + sub_59) * 2) + 1), 0, 161))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_55 & 1) == 0)) && (((right_shift_58 | 1) < 9) && ((sub_59 & 1) == 0)))));
+        }
+        int func_clamp_61 = clamp((((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        bool slice_66 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_61)), 0).x > 0.5;
+        int right_shift_62 = func_clamp_61 >> 1;
+        int right_shift_63 = (right_shift_62 * 57) >> 9;
+        int sub_64 = right_shift_62 - (right_shift_63 * 9);
+        bool slice_67 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_63 ^ 1) * 9) + sub_64) * 2) + 1), 0, 161))), 0).x > 0.5;
+        bool eq_68 = (func_clamp_61 & 1) == 0;
+        bool bit_and_69 = gt_11 && eq_68;
+        bool lt_70 = (right_shift_63 | 1) < 9;
+        int bitwise_and_65 = sub_64 & 1;
+        bool bit_xor_71 = slice_66 != (slice_67 && (bit_and_69 && (lt_70 && (bitwise_and_65 == 0))));
+        bool match_77;
+        if ((bitwise_and_65 == (right_shift_63 & 1))) {
+            match_77 = bit_xor_71;
+        } else if ((eq_16 && eq_68)) {
+            match_77 = (!bit_xor_71);
+        } else {
+            int bitwise_xor_72 = func_clamp_61 ^ 1;
+            bool slice_73 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_72)), 0).x > 0.5;
+            int right_shift_74 = bitwise_xor_72 >> 1;
+            int right_shift_75 = (right_shift_74 * 57) >> 9;
+            int sub_76 = right_shift_74 - (right_shift_75 * 9);
+            match_77 = (slice_73 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_75 ^ 1) * 9) + sub_76) * 2) + 1), 0, 161))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_72 & 1) == 0)) && (((right_shift_75 | 1) < 9) && ((sub_76 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_41 != ((match_60 != (match_77 && (bit_and_52 && (bitwise_and_48 == 0)))) && (bit_and_13 && (((sub_5 | 1) < 9) && eq_40)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_10 = int(state_tile.x);
+        int func_int_9 = int(out_tile.x);
+        int mul_11 = (x / func_int_9) * func_int_10;
+        int mod_12 = x % func_int_9;
+        int add_13 = mul_11 + clamp(mod_12, 0, (func_int_10 - 1));
+        int func_int_14 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_15 = (y / func_int_0) * func_int_14;
+        int mod_1 = y % func_int_0;
+        int sub_16 = func_int_14 - 1;
+        bool slice_17 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(mod_1, 0, sub_16))), 0).x > 0.5;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 20165) >> 18;
+        int mul_4 = right_shift_3 * 13;
+        int sub_5 = right_shift_2 - mul_4;
+        bool slice_18 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_3 ^ 1) * 13) + sub_5) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool gt_19 = mod_12 > 0;
+        bool eq_20 = (mod_1 & 1) == 0;
+        bool bit_and_21 = gt_19 && eq_20;
+        bool lt_22 = (right_shift_3 | 1) < 13;
+        int bitwise_and_6 = sub_5 & 1;
+        bool bit_xor_23 = slice_17 != (slice_18 && (bit_and_21 && (lt_22 && (bitwise_and_6 == 0))));
+        int bitwise_and_7 = right_shift_3 & 1;
+        bool eq_8 = bitwise_and_6 == bitwise_and_7;
+        bool eq_24 = mod_12 == 0;
+        bool match_30;
+        if (eq_8) {
+            match_30 = bit_xor_23;
+        } else if ((eq_24 && eq_20)) {
+            match_30 = (!bit_xor_23);
+        } else {
+            int func_clamp_25 = clamp((mod_1 ^ 1), 0, sub_16);
+            bool slice_26 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_25, 0, sub_16))), 0).x > 0.5;
+            int right_shift_27 = func_clamp_25 >> 1;
+            int right_shift_28 = (right_shift_27 * 20165) >> 18;
+            int sub_29 = right_shift_27 - (right_shift_28 * 13);
+            match_30 = (slice_26 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_28 ^ 1) * 13) + sub_29) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_25 & 1) == 0)) && (((right_shift_28 | 1) < 13) && ((sub_29 & 1) == 0)))));
+        }
+        int func_clamp_31 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        bool slice_36 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_31, 0, sub_16))), 0).x > 0.5;
+        int right_shift_32 = func_clamp_31 >> 1;
+        int right_shift_33 = (right_shift_32 * 20165) >> 18;
+        int sub_34 = right_shift_32 - (right_shift_33 * 13);
+        bool slice_37 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_33 ^ 1) * 13) + sub_34) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_38 = (func_clamp_31 & 1) == 0;
+        bool bit_and_39 = gt_19 && eq_38;
+        bool lt_40 = (right_shift_33 | 1) < 13;
+        int bitwise_and_35 = sub_34 & 1;
+        bool bit_xor_41 = slice_36 != (slice_37 && (bit_and_39 && (lt_40 && (bitwise_and_35 == 0))));
+        bool match_47;
+        if ((bitwise_and_35 == (right_shift_33 & 1))) {
+            match_47 = bit_xor_41;
+        } else if ((eq_24 && eq_38)) {
+            match_47 = (!bit_xor_41);
+        } else {
+            int func_clamp_42 = clamp((func_clamp_31 ^ 1), 0, sub_16);
+            bool slice_43 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_42, 0, sub_16))), 0).x > 0.5;
+            int right_shift_44 = func_clamp_42 >> 1;
+            int right_shift_45 = (right_shift_44 * 20165) >> 18;
+            int sub_46 = right_shift_44 - (right_shift_45 * 13);
+            match_47 = (slice_43 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_45 ^ 1) * 13) + sub_46) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_42 & 1) == 0)) && (((right_shift_45 | 1) < 13) && ((sub_46 & 1) == 0)))));
+        }
+        bool eq_48 = bitwise_and_7 == 0;
+        bool bit_xor_49 = match_30 != (match_47 && (bit_and_21 && eq_48));
+        int func_clamp_50 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, sub_16);
+        bool slice_57 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_50, 0, sub_16))), 0).x > 0.5;
+        int right_shift_51 = func_clamp_50 >> 1;
+        int right_shift_52 = (right_shift_51 * 20165) >> 18;
+        int mul_53 = right_shift_52 * 13;
+        int sub_54 = right_shift_51 - mul_53;
+        bool slice_58 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_52 ^ 1) * 13) + sub_54) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_59 = (func_clamp_50 & 1) == 0;
+        bool bit_and_60 = gt_19 && eq_59;
+        bool lt_61 = (right_shift_52 | 1) < 13;
+        int bitwise_and_55 = sub_54 & 1;
+        bool bit_xor_62 = slice_57 != (slice_58 && (bit_and_60 && (lt_61 && (bitwise_and_55 == 0))));
+        int bitwise_and_56 = right_shift_52 & 1;
+        bool match_68;
+        if ((bitwise_and_55 == bitwise_and_56)) {
+            match_68 = bit_xor_62;
+        } else if ((eq_24 && eq_59)) {
+            match_68 = (!bit_xor_62);
+        } else {
+            int func_clamp_63 = clamp((func_clamp_50 ^ 1), 0, sub_16);
+            bool slice_64 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_63, 0, sub_16))), 0).x > 0.5;
+            int right_shift_65 = func_clamp_63 >> 1;
+            int right_shift_66 = (right_shift_65 * 20165) >> 18;
+            int sub_67 = right_shift_65 - (right_shift_66 * 13);
+            match_68 = (slice_64 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_66 ^ 1) * 13) + sub_67) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_63 & 1) == 0)) && (((right_shift_66 | 1) < 13) && ((sub_67 & 1) == 0)))));
+        }
+        int func_clamp_69 = clamp((((mul_53 + (((sub_54 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_16);
+        bool slice_74 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_69, 0, sub_16))), 0).x > 0.5;
+        int right_shift_70 = func_clamp_69 >> 1;
+        int right_shift_71 = (right_shift_70 * 20165) >> 18;
+        int sub_72 = right_shift_70 - (right_shift_71 * 13);
+        bool slice_75 = texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_71 ^ 1) * 13) + sub_72) * 2) + 1), 0, sub_16))), 0).x > 0.5;
+        bool eq_76 = (func_clamp_69 & 1) == 0;
+        bool bit_and_77 = gt_19 && eq_76;
+        bool lt_78 = (right_shift_71 | 1) < 13;
+        int bitwise_and_73 = sub_72 & 1;
+        bool bit_xor_79 = slice_74 != (slice_75 && (bit_and_77 && (lt_78 && (bitwise_and_73 == 0))));
+        bool match_85;
+        if ((bitwise_and_73 == (right_shift_71 & 1))) {
+            match_85 = bit_xor_79;
+        } else if ((eq_24 && eq_76)) {
+            match_85 = (!bit_xor_79);
+        } else {
+            int func_clamp_80 = clamp((func_clamp_69 ^ 1), 0, sub_16);
+            bool slice_81 = texelFetch(state, ivec2(add_13, (mul_15 + clamp(func_clamp_80, 0, sub_16))), 0).x > 0.5;
+            int right_shift_82 = func_clamp_80 >> 1;
+            int right_shift_83 = (right_shift_82 * 20165) >> 18;
+            int sub_84 = right_shift_82 - (right_shift_83 * 13);
+            match_85 = (slice_81 != ((texelFetch(state, ivec2(add_13, (mul_15 + clamp((((((right_shift_83 ^ 1) * 13) + sub_84) * 2) + 1), 0, sub_16))), 0).x > 0.5) && ((gt_19 && ((func_clamp_80 & 1) == 0)) && (((right_shift_83 | 1) < 13) && ((sub_84 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_49 != ((match_68 != (match_85 && (bit_and_60 && (bitwise_and_56 == 0)))) && (bit_and_21 && (((sub_5 | 1) < 13) && eq_48)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height13_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        int mul_2 = right_shift_1 * 13;
+        int sub_3 = right_shift_0 - mul_2;
+        bool slice_7 = texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 13) + sub_3) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool gt_8 = x > 0;
+        bool eq_9 = (y & 1) == 0;
+        bool bit_and_10 = gt_8 && eq_9;
+        bool lt_11 = (right_shift_1 | 1) < 13;
+        int bitwise_and_4 = sub_3 & 1;
+        bool bit_xor_12 = v_state != (slice_7 && (bit_and_10 && (lt_11 && (bitwise_and_4 == 0))));
+        int sub_14 = int(state_size.y) - 1;
+        int bitwise_and_5 = right_shift_1 & 1;
+        bool eq_6 = bitwise_and_4 == bitwise_and_5;
+        bool eq_13 = x == 0;
+        bool match_20;
+        if (eq_6) {
+            match_20 = bit_xor_12;
+        } else if ((eq_13 && eq_9)) {
+            match_20 = (!bit_xor_12);
+        } else {
+            int func_clamp_15 = clamp((y ^ 1), 0, sub_14);
+            bool slice_16 = texelFetch(state, clamp(ivec2(x, func_clamp_15), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_17 = func_clamp_15 >> 1;
+            int right_shift_18 = (right_shift_17 * 20165) >> 18;
+            int sub_19 = right_shift_17 - (right_shift_18 * 13);
+            match_20 = (slice_16 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_18 ^ 1) * 13) + sub_19) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_15 & 1) == 0)) && (((right_shift_18 | 1) < 13) && ((sub_19 & 1) == 0)))));
+        }
+        int func_clamp_21 = clamp((((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_14);
+        bool slice_26 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_22 = func_clamp_21 >> 1;
+        int right_shift_23 = (right_shift_22 * 20165) >> 18;
+        int sub_24 = right_shift_22 - (right_shift_23 * 13);
+        bool slice_27 = texelFetch(state, clamp(ivec2(x, (((((right_shift_23 ^ 1) * 13) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_28 = (func_clamp_21 & 1) == 0;
+        bool bit_and_29 = gt_8 && eq_28;
+        bool lt_30 = (right_shift_23 | 1) < 13;
+        int bitwise_and_25 = sub_24 & 1;
+        bool bit_xor_31 = slice_26 != (slice_27 && (bit_and_29 && (lt_30 && (bitwise_and_25 == 0))));
+        bool match_37;
+        if ((bitwise_and_25 == (right_shift_23 & 1))) {
+            match_37 = bit_xor_31;
+        } else if ((eq_13 && eq_28)) {
+            match_37 = (!bit_xor_31);
+        } else {
+            int func_clamp_32 = clamp((func_clamp_21 ^ 1), 0, sub_14);
+            bool slice_33 = texelFetch(state, clamp(ivec2(x, func_clamp_32), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_34 = func_clamp_32 >> 1;
+            int right_shift_35 = (right_shift_34 * 20165) >> 18;
+            int sub_36 = right_shift_34 - (right_shift_35 * 13);
+            match_37 = (slice_33 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_35 ^ 1) * 13) + sub_36) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_32 & 1) == 0)) && (((right_shift_35 | 1) < 13) && ((sub_36 & 1) == 0)))));
+        }
+        bool eq_38 = bitwise_and_5 == 0;
+        bool bit_xor_39 = match_20 != (match_37 && (bit_and_10 && eq_38));
+        int func_clamp_40 = clamp((((mul_2 + (sub_3 ^ 1)) * 2) + 1), 0, sub_14);
+        bool slice_47 = texelFetch(state, clamp(ivec2(x, func_clamp_40), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_41 = func_clamp_40 >> 1;
+        int right_shift_42 = (right_shift_41 * 20165) >> 18;
+        int mul_43 = right_shift_42 * 13;
+        int sub_44 = right_shift_41 - mul_43;
+        bool slice_48 = texelFetch(state, clamp(ivec2(x, (((((right_shift_42 ^ 1) * 13) + sub_44) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_49 = (func_clamp_40 & 1) == 0;
+        bool bit_and_50 = gt_8 && eq_49;
+        bool lt_51 = (right_shift_42 | 1) < 13;
+        int bitwise_and_45 = sub_44 & 1;
+        bool bit_xor_52 = slice_47 != (slice_48 && (bit_and_50 && (lt_51 && (bitwise_and_45 == 0))));
+        int bitwise_and_46 = right_shift_42 & 1;
+        bool match_58;
+        if ((bitwise_and_45 == bitwise_and_46)) {
+            match_58 = bit_xor_52;
+        } else if ((eq_13 && eq_49)) {
+            match_58 = (!bit_xor_52);
+        } else {
+            int func_clamp_53 = clamp((func_clamp_40 ^ 1), 0, sub_14);
+            bool slice_54 = texelFetch(state, clamp(ivec2(x, func_clamp_53), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_55 = func_clamp_53 >> 1;
+            int right_shift_56 = (right_shift_55 * 20165) >> 18;
+            int sub_57 = right_shift_55 - (right_shift_56 * 13);
+            match_58 = (slice_54 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_56 ^ 1) * 13) + sub_57) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_53 & 1) == 0)) && (((right_shift_56 | 1) < 13) && ((sub_57 & 1) == 0)))));
+        }
+        int func_clamp_59 = clamp((((mul_43 + (((sub_44 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_14);
+        bool slice_64 = texelFetch(state, clamp(ivec2(x, func_clamp_59), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_60 = func_clamp_59 >> 1;
+        int right_shift_61 = (right_shift_60 * 20165) >> 18;
+        int sub_62 = right_shift_60 - (right_shift_61 * 13);
+        bool slice_65 = texelFetch(state, clamp(ivec2(x, (((((right_shift_61 ^ 1) * 13) + sub_62) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool eq_66 = (func_clamp_59 & 1) == 0;
+        bool bit_and_67 = gt_8 && eq_66;
+        bool lt_68 = (right_shift_61 | 1) < 13;
+        int bitwise_and_63 = sub_62 & 1;
+        bool bit_xor_69 = slice_64 != (slice_65 && (bit_and_67 && (lt_68 && (bitwise_and_63 == 0))));
+        bool match_75;
+        if ((bitwise_and_63 == (right_shift_61 & 1))) {
+            match_75 = bit_xor_69;
+        } else if ((eq_13 && eq_66)) {
+            match_75 = (!bit_xor_69);
+        } else {
+            int func_clamp_70 = clamp((func_clamp_59 ^ 1), 0, sub_14);
+            bool slice_71 = texelFetch(state, clamp(ivec2(x, func_clamp_70), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_72 = func_clamp_70 >> 1;
+            int right_shift_73 = (right_shift_72 * 20165) >> 18;
+            int sub_74 = right_shift_72 - (right_shift_73 * 13);
+            match_75 = (slice_71 != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_73 ^ 1) * 13) + sub_74) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_8 && ((func_clamp_70 & 1) == 0)) && (((right_shift_73 | 1) < 13) && ((sub_74 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_39 != ((match_58 != (match_75 && (bit_and_50 && (bitwise_and_46 == 0)))) && (bit_and_10 && (((sub_3 | 1) < 13) && eq_38)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass1_surface_height13_surface_width13_out_tile171x338_state_tile171x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        int mul_4 = right_shift_3 * 13;
+        int sub_5 = right_shift_2 - mul_4;
+        bool slice_9 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 13) + sub_5) * 2) + 1), 0, 337))), 0).x > 0.5;
+        int sub_10 = x - (int(((float(x) + 0.5) * 0.005847953259944916)) * 171);
+        bool gt_11 = sub_10 > 0;
+        bool eq_12 = (sub_1 & 1) == 0;
+        bool bit_and_13 = gt_11 && eq_12;
+        bool lt_14 = (right_shift_3 | 1) < 13;
+        int bitwise_and_6 = sub_5 & 1;
+        bool bit_xor_15 = v_state != (slice_9 && (bit_and_13 && (lt_14 && (bitwise_and_6 == 0))));
+        int bitwise_and_7 = right_shift_3 & 1;
+        bool eq_8 = bitwise_and_6 == bitwise_and_7;
+        bool eq_16 = sub_10 == 0;
+        bool match_22;
+        if (eq_8) {
+            match_22 = bit_xor_15;
+        } else if ((eq_16 && eq_12)) {
+            match_22 = (!bit_xor_15);
+        } else {
+            int bitwise_xor_17 = sub_1 ^ 1;
+            bool slice_18 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_17)), 0).x > 0.5;
+            int right_shift_19 = bitwise_xor_17 >> 1;
+            int right_shift_20 = (right_shift_19 * 79) >> 10;
+            int sub_21 = right_shift_19 - (right_shift_20 * 13);
+            match_22 = (slice_18 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_20 ^ 1) * 13) + sub_21) * 2) + 1), 0, 337))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_17 & 1) == 0)) && (((right_shift_20 | 1) < 13) && ((sub_21 & 1) == 0)))));
+        }
+        int func_clamp_23 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        bool slice_28 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_23)), 0).x > 0.5;
+        int right_shift_24 = func_clamp_23 >> 1;
+        int right_shift_25 = (right_shift_24 * 79) >> 10;
+        int sub_26 = right_shift_24 - (right_shift_25 * 13);
+        bool slice_29 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_25 ^ 1) * 13) + sub_26) * 2) + 1), 0, 337))), 0).x > 0.5;
+        bool eq_30 = (func_clamp_23 & 1) == 0;
+        bool bit_and_31 = gt_11 && eq_30;
+        bool lt_32 = (right_shift_25 | 1) < 13;
+        int bitwise_and_27 = sub_26 & 1;
+        bool bit_xor_33 = slice_28 != (slice_29 && (bit_and_31 && (lt_32 && (bitwise_and_27 == 0))));
+        bool match_39;
+        if ((bitwise_and_27 == (right_shift_25 & 1))) {
+            match_39 = bit_xor_33;
+        } else if ((eq_16 && eq_30)) {
+            match_39 = (!bit_xor_33);
+        } else {
+            int bitwise_xor_34 = func_clamp_23 ^ 1;
+            bool slice_35 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_34)), 0).x > 0.5;
+            int right_shift_36 = bitwise_xor_34 >> 1;
+            int right_shift_37 = (right_shift_36 * 79) >> 10;
+            int sub_38 = right_shift_36 - (right_shift_37 * 13);
+            match_39 = (slice_35 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_37 ^ 1) * 13) + sub_38) * 2) + 1), 0, 337))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_34 & 1) == 0)) && (((right_shift_37 | 1) < 13) && ((sub_38 & 1) == 0)))));
+        }
+        bool eq_40 = bitwise_and_7 == 0;
+        bool bit_xor_41 = match_22 != (match_39 && (bit_and_13 && eq_40));
+        int func_clamp_42 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 337);
+        bool slice_49 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_42)), 0).x > 0.5;
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 79) >> 10;
+        int mul_45 = right_shift_44 * 13;
+        int sub_46 = right_shift_43 - mul_45;
+        bool slice_50 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_44 ^ 1) * 13) + sub_46) * 2) + 1), 0, 337))), 0).x > 0.5;
+        bool eq_51 = (func_clamp_42 & 1) == 0;
+        bool bit_and_52 = gt_11 && eq_51;
+        bool lt_53 = (right_shift_44 | 1) < 13;
+        int bitwise_and_47 = sub_46 & 1;
+        bool bit_xor_54 = slice_49 != (slice_50 && (bit_and_52 && (lt_53 && (bitwise_and_47 == 0))));
+        int bitwise_and_48 = right_shift_44 & 1;
+        bool match_60;
+        if ((bitwise_and_47 == bitwise_and_48)) {
+            match_60 = bit_xor_54;
+        } else if ((eq_16 && eq_51)) {
+            match_60 = (!bit_xor_54);
+        } else {
+            int bitwise_xor_55 = func_clamp_42 ^ 1;
+            bool slice_56 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_55)), 0).x > 0.5;
+            int right_shift_57 = bitwise_xor_55 >> 1;
+            int right_shift_58 = (right_shift_57 * 79) >> 10;
+            int sub_59 = right_shift_57 - (right_shift_58 * 13);
+            match_60 = (slice_56 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_58 ^ 1) * 13) + sub_59) * 2) + 1), 0, 337))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_55 & 1) == 0)) && (((right_shift_58 | 1) < 13) && ((sub_59 & 1) == 0)))));
+        }
+        int func_clamp_61 = clamp((((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        bool slice_66 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_61)), 0).x > 0.5;
+        int right_shift_62 = func_clamp_61 >> 1;
+        int right_shift_63 = (right_shift_62 * 79) >> 10;
+        int sub_64 = right_shift_62 - (right_shift_63 * 13);
+        bool slice_67 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_63 ^ 1) * 13) + sub_64) * 2) + 1), 0, 337))), 0).x > 0.5;
+        bool eq_68 = (func_clamp_61 & 1) == 0;
+        bool bit_and_69 = gt_11 && eq_68;
+        bool lt_70 = (right_shift_63 | 1) < 13;
+        int bitwise_and_65 = sub_64 & 1;
+        bool bit_xor_71 = slice_66 != (slice_67 && (bit_and_69 && (lt_70 && (bitwise_and_65 == 0))));
+        bool match_77;
+        if ((bitwise_and_65 == (right_shift_63 & 1))) {
+            match_77 = bit_xor_71;
+        } else if ((eq_16 && eq_68)) {
+            match_77 = (!bit_xor_71);
+        } else {
+            int bitwise_xor_72 = func_clamp_61 ^ 1;
+            bool slice_73 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_72)), 0).x > 0.5;
+            int right_shift_74 = bitwise_xor_72 >> 1;
+            int right_shift_75 = (right_shift_74 * 79) >> 10;
+            int sub_76 = right_shift_74 - (right_shift_75 * 13);
+            match_77 = (slice_73 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_75 ^ 1) * 13) + sub_76) * 2) + 1), 0, 337))), 0).x > 0.5) && ((gt_11 && ((bitwise_xor_72 & 1) == 0)) && (((right_shift_75 | 1) < 13) && ((sub_76 & 1) == 0)))));
+        }
+        outColor = float((bit_xor_41 != ((match_60 != (match_77 && (bit_and_52 && (bitwise_and_48 == 0)))) && (bit_and_13 && (((sub_5 | 1) < 13) && eq_40)))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+registerLayered(surfaceCyclePass1, surfaceCyclePass1Layered);
+registerSingleShot(surfaceCyclePass1, surfaceCyclePass1SingleShot);
+registerVariant(surfaceCyclePass1, {surface_height: 5, surface_width: 5}, surfaceCyclePass1_surface_height5_surface_width5);
+registerLayered(surfaceCyclePass1_surface_height5_surface_width5, surfaceCyclePass1Layered);
+registerSingleShot(surfaceCyclePass1_surface_height5_surface_width5, surfaceCyclePass1_surface_height5_surface_width5SingleShot);
+registerVariant(surfaceCyclePass1_surface_height5_surface_width5, {out_tile: [27, 50], state_tile: [27, 50]}, surfaceCyclePass1_surface_height5_surface_width5_out_tile27x50_state_tile27x50);
+registerVariant(surfaceCyclePass1, {surface_height: 9, surface_width: 9}, surfaceCyclePass1_surface_height9_surface_width9);
+registerLayered(surfaceCyclePass1_surface_height9_surface_width9, surfaceCyclePass1Layered);
+registerSingleShot(surfaceCyclePass1_surface_height9_surface_width9, surfaceCyclePass1_surface_height9_surface_width9SingleShot);
+registerVariant(surfaceCyclePass1_surface_height9_surface_width9, {out_tile: [83, 162], state_tile: [83, 162]}, surfaceCyclePass1_surface_height9_surface_width9_out_tile83x162_state_tile83x162);
+registerVariant(surfaceCyclePass1, {surface_height: 13, surface_width: 13}, surfaceCyclePass1_surface_height13_surface_width13);
+registerLayered(surfaceCyclePass1_surface_height13_surface_width13, surfaceCyclePass1Layered);
+registerSingleShot(surfaceCyclePass1_surface_height13_surface_width13, surfaceCyclePass1_surface_height13_surface_width13SingleShot);
+registerVariant(surfaceCyclePass1_surface_height13_surface_width13, {out_tile: [171, 338], state_tile: [171, 338]}, surfaceCyclePass1_surface_height13_surface_width13_out_tile171x338_state_tile171x338);
+
+let surfaceCyclePass2 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.x);
+        int func_int_6 = int(out_tile.x);
+        int mul_8 = (x / func_int_6) * func_int_7;
+        int mod_9 = x % func_int_6;
+        int add_10 = mul_8 + clamp(mod_9, 0, (func_int_7 - 1));
+        int func_int_11 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_12 = (y / func_int_0) * func_int_11;
+        int mod_1 = y % func_int_0;
+        int sub_13 = func_int_11 - 1;
+        bool slice_14 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(mod_1, 0, sub_13))), 0).x > 0.5;
+        int right_shift_2 = mod_1 >> 1;
+        int mod_3 = right_shift_2 % surface_width;
+        int divide_5 = right_shift_2 / surface_width;
+        int add_15 = divide_5 + 1;
+        bool slice_16 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_15 ^ 1) - 1) * surface_width) + mod_3) * 2) + 1), 0, sub_13))), 0).x > 0.5;
+        bool gt_17 = mod_9 > 0;
+        bool eq_18 = (mod_1 & 1) == 0;
+        bool bit_and_19 = gt_17 && eq_18;
+        int bitwise_and_4 = mod_3 & 1;
+        bool eq_20 = bitwise_and_4 == 1;
+        bool bit_xor_21 = slice_14 != (slice_16 && (bit_and_19 && ((((add_15 | 1) - 1) < surface_height) && eq_20)));
+        int func_clamp_22 = clamp((((((divide_5 ^ 1) * surface_width) + mod_3) * 2) + 1), 0, sub_13);
+        bool slice_23 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_22, 0, sub_13))), 0).x > 0.5;
+        int right_shift_24 = func_clamp_22 >> 1;
+        int mod_26 = right_shift_24 % surface_width;
+        int add_25 = (right_shift_24 / surface_width) + 1;
+        bool bit_xor_27 = bit_xor_21 != ((slice_23 != ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_25 ^ 1) - 1) * surface_width) + mod_26) * 2) + 1), 0, sub_13))), 0).x > 0.5) && ((gt_17 && ((func_clamp_22 & 1) == 0)) && ((((add_25 | 1) - 1) < surface_height) && ((mod_26 & 1) == 1))))) && (bit_and_19 && (((divide_5 | 1) < surface_height) && eq_20)));
+        bool match_43;
+        if ((bitwise_and_4 != (divide_5 & 1))) {
+            match_43 = bit_xor_27;
+        } else if (((mod_9 == 0) && eq_18)) {
+            match_43 = (!bit_xor_27);
+        } else {
+            int func_clamp_28 = clamp((mod_1 ^ 1), 0, sub_13);
+            bool slice_29 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_28, 0, sub_13))), 0).x > 0.5;
+            int right_shift_30 = func_clamp_28 >> 1;
+            int mod_33 = right_shift_30 % surface_width;
+            int divide_31 = right_shift_30 / surface_width;
+            int add_32 = divide_31 + 1;
+            bool slice_34 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_32 ^ 1) - 1) * surface_width) + mod_33) * 2) + 1), 0, sub_13))), 0).x > 0.5;
+            bool bit_and_35 = gt_17 && ((func_clamp_28 & 1) == 0);
+            bool eq_36 = (mod_33 & 1) == 1;
+            bool bit_xor_37 = slice_29 != (slice_34 && (bit_and_35 && ((((add_32 | 1) - 1) < surface_height) && eq_36)));
+            int func_clamp_38 = clamp((((((divide_31 ^ 1) * surface_width) + mod_33) * 2) + 1), 0, sub_13);
+            bool slice_39 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_38, 0, sub_13))), 0).x > 0.5;
+            int right_shift_40 = func_clamp_38 >> 1;
+            int mod_42 = right_shift_40 % surface_width;
+            int add_41 = (right_shift_40 / surface_width) + 1;
+            match_43 = (bit_xor_37 != ((slice_39 != ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_41 ^ 1) - 1) * surface_width) + mod_42) * 2) + 1), 0, sub_13))), 0).x > 0.5) && ((gt_17 && ((func_clamp_38 & 1) == 0)) && ((((add_41 | 1) - 1) < surface_height) && ((mod_42 & 1) == 1))))) && (bit_and_35 && (((divide_31 | 1) < surface_height) && eq_36))));
+        }
+        outColor = float(match_43);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_9 = int(state_tile.x);
+        int add_7 = x + int(out_origin.x);
+        int func_int_8 = int(out_tile.x);
+        int mul_10 = (add_7 / func_int_8) * func_int_9;
+        int mod_11 = add_7 % func_int_8;
+        int add_12 = mul_10 + clamp(mod_11, 0, (func_int_9 - 1));
+        int func_int_13 = int(state_size.x);
+        int func_clamp_14 = clamp(add_12, 0, (func_int_13 - 1));
+        int func_int_15 = int(state_layer.x);
+        int mod_16 = func_clamp_14 % func_int_15;
+        int sub_20 = int(state_size.y) - 1;
+        int func_int_17 = int(state_tile.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mul_18 = (add_0 / func_int_1) * func_int_17;
+        int mod_2 = add_0 % func_int_1;
+        int sub_19 = func_int_17 - 1;
+        int func_clamp_21 = clamp((mul_18 + clamp(mod_2, 0, sub_19)), 0, sub_20);
+        int func_int_22 = int(state_layer.y);
+        int mod_23 = func_clamp_21 % func_int_22;
+        int divide_25 = func_clamp_14 / func_int_15;
+        int divide_24 = ((func_int_13 + func_int_15) - 1) / func_int_15;
+        bool fetch_26 = texelFetch(state, ivec3(mod_16, mod_23, (((func_clamp_21 / func_int_22) * divide_24) + divide_25)), 0).x > 0.5;
+        int right_shift_3 = mod_2 >> 1;
+        int mod_4 = right_shift_3 % surface_width;
+        int divide_6 = right_shift_3 / surface_width;
+        int add_27 = divide_6 + 1;
+        int func_clamp_28 = clamp((mul_18 + clamp(((((((add_27 ^ 1) - 1) * surface_width) + mod_4) * 2) + 1), 0, sub_19)), 0, sub_20);
+        bool fetch_29 = texelFetch(state, ivec3(mod_16, (func_clamp_28 % func_int_22), (((func_clamp_28 / func_int_22) * divide_24) + divide_25)), 0).x > 0.5;
+        bool gt_30 = mod_11 > 0;
+        bool eq_31 = (mod_2 & 1) == 0;
+        bool bit_and_32 = gt_30 && eq_31;
+        int bitwise_and_5 = mod_4 & 1;
+        bool eq_33 = bitwise_and_5 == 1;
+        bool bit_xor_34 = fetch_26 != (fetch_29 && (bit_and_32 && ((((add_27 | 1) - 1) < surface_height) && eq_33)));
+        int func_clamp_35 = clamp((((((divide_6 ^ 1) * surface_width) + mod_4) * 2) + 1), 0, sub_19);
+        int func_clamp_36 = clamp((mul_18 + clamp(func_clamp_35, 0, sub_19)), 0, sub_20);
+        bool fetch_37 = texelFetch(state, ivec3(mod_16, (func_clamp_36 % func_int_22), (((func_clamp_36 / func_int_22) * divide_24) + divide_25)), 0).x > 0.5;
+        int right_shift_38 = func_clamp_35 >> 1;
+        int mod_40 = right_shift_38 % surface_width;
+        int add_39 = (right_shift_38 / surface_width) + 1;
+        int func_clamp_41 = clamp((mul_18 + clamp(((((((add_39 ^ 1) - 1) * surface_width) + mod_40) * 2) + 1), 0, sub_19)), 0, sub_20);
+        bool bit_xor_42 = bit_xor_34 != ((fetch_37 != ((texelFetch(state, ivec3(mod_16, (func_clamp_41 % func_int_22), (((func_clamp_41 / func_int_22) * divide_24) + divide_25)), 0).x > 0.5) && ((gt_30 && ((func_clamp_35 & 1) == 0)) && ((((add_39 | 1) - 1) < surface_height) && ((mod_40 & 1) == 1))))) && (bit_and_32 && (((divide_6 | 1) < surface_height) && eq_33)));
+        bool match_62;
+        if ((bitwise_and_5 != (divide_6 & 1))) {
+            match_62 = bit_xor_42;
+        } else if (((mod_11 == 0) && eq_31)) {
+            match_62 = (!bit_xor_42);
+        } else {
+            int func_clamp_43 = clamp((mod_2 ^ 1), 0, sub_19);
+            int func_clamp_44 = clamp((mul_18 + clamp(func_clamp_43, 0, sub_19)), 0, sub_20);
+            bool fetch_45 = texelFetch(state, ivec3(mod_16, (func_clamp_44 % func_int_22), (((func_clamp_44 / func_int_22) * divide_24) + divide_25)), 0).x > 0.5;
+            int right_shift_46 = func_clamp_43 >> 1;
+            int mod_49 = right_shift_46 % surface_width;
+            int divide_47 = right_shift_46 / surface_width;
+            int add_48 = divide_47 + 1;
+            int func_clamp_50 = clamp((mul_18 + clamp(((((((add_48 ^ 1) - 1) * surface_width) + mod_49) * 2) + 1), 0, sub_19)), 0, sub_20);
+            bool fetch_51 = texelFetch(state, ivec3(mod_16, (func_clamp_50 % func_int_22), (((func_clamp_50 / func_int_22) * divide_24) + divide_25)), 0).x > 0.5;
+            bool bit_and_52 = gt_30 && ((func_clamp_43 & 1) == 0);
+            bool eq_53 = (mod_49 & 1) == 1;
+            bool bit_xor_54 = fetch_45 != (fetch_51 && (bit_and_52 && ((((add_48 | 1) - 1) < surface_height) && eq_53)));
+            int func_clamp_55 = clamp((((((divide_47 ^ 1) * surface_width) + mod_49) * 2) + 1), 0, sub_19);
+            int func_clamp_56 = clamp((mul_18 + clamp(func_clamp_55, 0, sub_19)), 0, sub_20);
+            bool fetch_57 = texelFetch(state, ivec3(mod_16, (func_clamp_56 % func_int_22), (((func_clamp_56 / func_int_22) * divide_24) + divide_25)), 0).x > 0.5;
+            int right_shift_58 = func_clamp_55 >> 1;
+            int mod_60 = right_shift_58 % surface_width;
+            int add_59 = (right_shift_58 / surface_width) + 1;
+            int func_clamp_61 = clamp((mul_18 + clamp(((((((add_59 ^ 1) - 1) * surface_width) + mod_60) * 2) + 1), 0, sub_19)), 0, sub_20);
+            match_62 = (bit_xor_54 != ((fetch_57 != ((texelFetch(state, ivec3(mod_16, (func_clamp_61 % func_int_22), (((func_clamp_61 / func_int_22) * divide_24) + divide_25)), 0).x > 0.5) && ((gt_30 && ((func_clamp_55 & 1) == 0)) && ((((add_59 | 1) - 1) < surface_height) && ((mod_60 & 1) == 1))))) && (bit_and_52 && (((divide_47 | 1) < surface_height) && eq_53))));
+        }
+        outColor = float(match_62);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCyclePass2SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int surface_width;
+    uniform sampler2D state;
+    uniform int surface_height;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int mod_1 = right_shift_0 % surface_width;
+        int divide_3 = right_shift_0 / surface_width;
+        int add_4 = divide_3 + 1;
+        bool slice_5 = texelFetch(state, clamp(ivec2(x, ((((((add_4 ^ 1) - 1) * surface_width) + mod_1) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool gt_6 = x > 0;
+        bool eq_7 = (y & 1) == 0;
+        bool bit_and_8 = gt_6 && eq_7;
+        int bitwise_and_2 = mod_1 & 1;
+        bool eq_9 = bitwise_and_2 == 1;
+        bool bit_xor_10 = v_state != (slice_5 && (bit_and_8 && ((((add_4 | 1) - 1) < surface_height) && eq_9)));
+        int sub_11 = int(state_size.y) - 1;
+        int func_clamp_12 = clamp((((((divide_3 ^ 1) * surface_width) + mod_1) * 2) + 1), 0, sub_11);
+        bool slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int mod_16 = right_shift_14 % surface_width;
+        int add_15 = (right_shift_14 / surface_width) + 1;
+        bool bit_xor_17 = bit_xor_10 != ((slice_13 != ((texelFetch(state, clamp(ivec2(x, ((((((add_15 ^ 1) - 1) * surface_width) + mod_16) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_6 && ((func_clamp_12 & 1) == 0)) && ((((add_15 | 1) - 1) < surface_height) && ((mod_16 & 1) == 1))))) && (bit_and_8 && (((divide_3 | 1) < surface_height) && eq_9)));
+        bool match_33;
+        if ((bitwise_and_2 != (divide_3 & 1))) {
+            match_33 = bit_xor_17;
+        } else if (((x == 0) && eq_7)) {
+            match_33 = (!bit_xor_17);
+        } else {
+            int func_clamp_18 = clamp((y ^ 1), 0, sub_11);
+            bool slice_19 = texelFetch(state, clamp(ivec2(x, func_clamp_18), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_20 = func_clamp_18 >> 1;
+            int mod_23 = right_shift_20 % surface_width;
+            int divide_21 = right_shift_20 / surface_width;
+            int add_22 = divide_21 + 1;
+            bool slice_24 = texelFetch(state, clamp(ivec2(x, ((((((add_22 ^ 1) - 1) * surface_width) + mod_23) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            bool bit_and_25 = gt_6 && ((func_clamp_18 & 1) == 0);
+            bool eq_26 = (mod_23 & 1) == 1;
+            bool bit_xor_27 = slice_19 != (slice_24 && (bit_and_25 && ((((add_22 | 1) - 1) < surface_height) && eq_26)));
+            int func_clamp_28 = clamp((((((divide_21 ^ 1) * surface_width) + mod_23) * 2) + 1), 0, sub_11);
+            bool slice_29 = texelFetch(state, clamp(ivec2(x, func_clamp_28), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_30 = func_clamp_28 >> 1;
+            int mod_32 = right_shift_30 % surface_width;
+            int add_31 = (right_shift_30 / surface_width) + 1;
+            match_33 = (bit_xor_27 != ((slice_29 != ((texelFetch(state, clamp(ivec2(x, ((((((add_31 ^ 1) - 1) * surface_width) + mod_32) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_6 && ((func_clamp_28 & 1) == 0)) && ((((add_31 | 1) - 1) < surface_height) && ((mod_32 & 1) == 1))))) && (bit_and_25 && (((divide_21 | 1) < surface_height) && eq_26))));
+        }
+        outColor = float(match_33);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.x);
+        int func_int_6 = int(out_tile.x);
+        int mul_8 = (x / func_int_6) * func_int_7;
+        int mod_9 = x % func_int_6;
+        int add_10 = mul_8 + clamp(mod_9, 0, (func_int_7 - 1));
+        int func_int_11 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_12 = (y / func_int_0) * func_int_11;
+        int mod_1 = y % func_int_0;
+        int sub_13 = func_int_11 - 1;
+        bool slice_14 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(mod_1, 0, sub_13))), 0).x > 0.5;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 26215) >> 17;
+        int sub_4 = right_shift_2 - (right_shift_3 * 5);
+        int add_15 = right_shift_3 + 1;
+        bool slice_16 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_15 ^ 1) - 1) * 5) + sub_4) * 2) + 1), 0, sub_13))), 0).x > 0.5;
+        bool gt_17 = mod_9 > 0;
+        bool eq_18 = (mod_1 & 1) == 0;
+        bool bit_and_19 = gt_17 && eq_18;
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_20 = bitwise_and_5 == 1;
+        bool bit_xor_21 = slice_14 != (slice_16 && (bit_and_19 && ((((add_15 | 1) - 1) < 5) && eq_20)));
+        int func_clamp_22 = clamp((((((right_shift_3 ^ 1) * 5) + sub_4) * 2) + 1), 0, sub_13);
+        bool slice_23 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_22, 0, sub_13))), 0).x > 0.5;
+        int right_shift_24 = func_clamp_22 >> 1;
+        int right_shift_25 = (right_shift_24 * 26215) >> 17;
+        int sub_27 = right_shift_24 - (right_shift_25 * 5);
+        int add_26 = right_shift_25 + 1;
+        bool bit_xor_28 = bit_xor_21 != ((slice_23 != ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_26 ^ 1) - 1) * 5) + sub_27) * 2) + 1), 0, sub_13))), 0).x > 0.5) && ((gt_17 && ((func_clamp_22 & 1) == 0)) && ((((add_26 | 1) - 1) < 5) && ((sub_27 & 1) == 1))))) && (bit_and_19 && (((right_shift_3 | 1) < 5) && eq_20)));
+        bool match_45;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_45 = bit_xor_28;
+        } else if (((mod_9 == 0) && eq_18)) {
+            match_45 = (!bit_xor_28);
+        } else {
+            int func_clamp_29 = clamp((mod_1 ^ 1), 0, sub_13);
+            bool slice_30 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_29, 0, sub_13))), 0).x > 0.5;
+            int right_shift_31 = func_clamp_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 26215) >> 17;
+            int sub_34 = right_shift_31 - (right_shift_32 * 5);
+            int add_33 = right_shift_32 + 1;
+            bool slice_35 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_33 ^ 1) - 1) * 5) + sub_34) * 2) + 1), 0, sub_13))), 0).x > 0.5;
+            bool bit_and_36 = gt_17 && ((func_clamp_29 & 1) == 0);
+            bool eq_37 = (sub_34 & 1) == 1;
+            bool bit_xor_38 = slice_30 != (slice_35 && (bit_and_36 && ((((add_33 | 1) - 1) < 5) && eq_37)));
+            int func_clamp_39 = clamp((((((right_shift_32 ^ 1) * 5) + sub_34) * 2) + 1), 0, sub_13);
+            bool slice_40 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_39, 0, sub_13))), 0).x > 0.5;
+            int right_shift_41 = func_clamp_39 >> 1;
+            int right_shift_42 = (right_shift_41 * 26215) >> 17;
+            int sub_44 = right_shift_41 - (right_shift_42 * 5);
+            int add_43 = right_shift_42 + 1;
+            match_45 = (bit_xor_38 != ((slice_40 != ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_43 ^ 1) - 1) * 5) + sub_44) * 2) + 1), 0, sub_13))), 0).x > 0.5) && ((gt_17 && ((func_clamp_39 & 1) == 0)) && ((((add_43 | 1) - 1) < 5) && ((sub_44 & 1) == 1))))) && (bit_and_36 && (((right_shift_32 | 1) < 5) && eq_37))));
+        }
+        outColor = float(match_45);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height5_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        int sub_2 = right_shift_0 - (right_shift_1 * 5);
+        int add_4 = right_shift_1 + 1;
+        bool slice_5 = texelFetch(state, clamp(ivec2(x, ((((((add_4 ^ 1) - 1) * 5) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool gt_6 = x > 0;
+        bool eq_7 = (y & 1) == 0;
+        bool bit_and_8 = gt_6 && eq_7;
+        int bitwise_and_3 = sub_2 & 1;
+        bool eq_9 = bitwise_and_3 == 1;
+        bool bit_xor_10 = v_state != (slice_5 && (bit_and_8 && ((((add_4 | 1) - 1) < 5) && eq_9)));
+        int sub_11 = int(state_size.y) - 1;
+        int func_clamp_12 = clamp((((((right_shift_1 ^ 1) * 5) + sub_2) * 2) + 1), 0, sub_11);
+        bool slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int right_shift_15 = (right_shift_14 * 26215) >> 17;
+        int sub_17 = right_shift_14 - (right_shift_15 * 5);
+        int add_16 = right_shift_15 + 1;
+        bool bit_xor_18 = bit_xor_10 != ((slice_13 != ((texelFetch(state, clamp(ivec2(x, ((((((add_16 ^ 1) - 1) * 5) + sub_17) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_6 && ((func_clamp_12 & 1) == 0)) && ((((add_16 | 1) - 1) < 5) && ((sub_17 & 1) == 1))))) && (bit_and_8 && (((right_shift_1 | 1) < 5) && eq_9)));
+        bool match_35;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_35 = bit_xor_18;
+        } else if (((x == 0) && eq_7)) {
+            match_35 = (!bit_xor_18);
+        } else {
+            int func_clamp_19 = clamp((y ^ 1), 0, sub_11);
+            bool slice_20 = texelFetch(state, clamp(ivec2(x, func_clamp_19), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_21 = func_clamp_19 >> 1;
+            int right_shift_22 = (right_shift_21 * 26215) >> 17;
+            int sub_24 = right_shift_21 - (right_shift_22 * 5);
+            int add_23 = right_shift_22 + 1;
+            bool slice_25 = texelFetch(state, clamp(ivec2(x, ((((((add_23 ^ 1) - 1) * 5) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            bool bit_and_26 = gt_6 && ((func_clamp_19 & 1) == 0);
+            bool eq_27 = (sub_24 & 1) == 1;
+            bool bit_xor_28 = slice_20 != (slice_25 && (bit_and_26 && ((((add_23 | 1) - 1) < 5) && eq_27)));
+            int func_clamp_29 = clamp((((((right_shift_22 ^ 1) * 5) + sub_24) * 2) + 1), 0, sub_11);
+            bool slice_30 = texelFetch(state, clamp(ivec2(x, func_clamp_29), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_31 = func_clamp_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 26215) >> 17;
+            int sub_34 = right_shift_31 - (right_shift_32 * 5);
+            int add_33 = right_shift_32 + 1;
+            match_35 = (bit_xor_28 != ((slice_30 != ((texelFetch(state, clamp(ivec2(x, ((((((add_33 ^ 1) - 1) * 5) + sub_34) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_6 && ((func_clamp_29 & 1) == 0)) && ((((add_33 | 1) - 1) < 5) && ((sub_34 & 1) == 1))))) && (bit_and_26 && (((right_shift_22 | 1) < 5) && eq_27))));
+        }
+        outColor = float(match_35);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height5_surface_width5_out_tile27x50_state_tile27x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        int sub_4 = right_shift_2 - (right_shift_3 * 5);
+        bool slice_6 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_3 + 1) ^ 1) - 1) * 5) + sub_4) * 2) + 1), 0, 49))), 0).x > 0.5;
+        int sub_7 = x - (int(((float(x) + 0.5) * 0.03703703731298447)) * 27);
+        bool gt_8 = sub_7 > 0;
+        bool eq_9 = (sub_1 & 1) == 0;
+        bool bit_and_10 = gt_8 && eq_9;
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_11 = bitwise_and_5 == 1;
+        bool bit_xor_12 = v_state != (slice_6 && (bit_and_10 && eq_11));
+        int func_clamp_13 = clamp((((((right_shift_3 ^ 1) * 5) + sub_4) * 2) + 1), 0, 49);
+        bool slice_14 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_13)), 0).x > 0.5;
+        int right_shift_15 = func_clamp_13 >> 1;
+        int right_shift_16 = (right_shift_15 * 13) >> 6;
+        int sub_17 = right_shift_15 - (right_shift_16 * 5);
+        bool bit_xor_18 = bit_xor_12 != ((slice_14 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_16 + 1) ^ 1) - 1) * 5) + sub_17) * 2) + 1), 0, 49))), 0).x > 0.5) && ((gt_8 && ((func_clamp_13 & 1) == 0)) && ((sub_17 & 1) == 1)))) && (bit_and_10 && (((right_shift_3 | 1) < 5) && eq_11)));
+        bool match_33;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_33 = bit_xor_18;
+        } else if (((sub_7 == 0) && eq_9)) {
+            match_33 = (!bit_xor_18);
+        } else {
+            int bitwise_xor_19 = sub_1 ^ 1;
+            bool slice_20 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_19)), 0).x > 0.5;
+            int right_shift_21 = bitwise_xor_19 >> 1;
+            int right_shift_22 = (right_shift_21 * 13) >> 6;
+            int sub_23 = right_shift_21 - (right_shift_22 * 5);
+            bool slice_24 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_22 + 1) ^ 1) - 1) * 5) + sub_23) * 2) + 1), 0, 49))), 0).x > 0.5;
+            bool bit_and_25 = gt_8 && ((bitwise_xor_19 & 1) == 0);
+            bool eq_26 = (sub_23 & 1) == 1;
+            bool bit_xor_27 = slice_20 != (slice_24 && (bit_and_25 && eq_26));
+            int func_clamp_28 = clamp((((((right_shift_22 ^ 1) * 5) + sub_23) * 2) + 1), 0, 49);
+            bool slice_29 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_28)), 0).x > 0.5;
+            int right_shift_30 = func_clamp_28 >> 1;
+            int right_shift_31 = (right_shift_30 * 13) >> 6;
+            int sub_32 = right_shift_30 - (right_shift_31 * 5);
+            match_33 = (bit_xor_27 != ((slice_29 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_31 + 1) ^ 1) - 1) * 5) + sub_32) * 2) + 1), 0, 49))), 0).x > 0.5) && ((gt_8 && ((func_clamp_28 & 1) == 0)) && ((sub_32 & 1) == 1)))) && (bit_and_25 && (((right_shift_22 | 1) < 5) && eq_26))));
+        }
+        outColor = float(match_33);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.x);
+        int func_int_6 = int(out_tile.x);
+        int mul_8 = (x / func_int_6) * func_int_7;
+        int mod_9 = x % func_int_6;
+        int add_10 = mul_8 + clamp(mod_9, 0, (func_int_7 - 1));
+        int func_int_11 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_12 = (y / func_int_0) * func_int_11;
+        int mod_1 = y % func_int_0;
+        int sub_13 = func_int_11 - 1;
+        bool slice_14 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(mod_1, 0, sub_13))), 0).x > 0.5;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 3641) >> 15;
+        int sub_4 = right_shift_2 - (right_shift_3 * 9);
+        int add_15 = right_shift_3 + 1;
+        bool slice_16 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_15 ^ 1) - 1) * 9) + sub_4) * 2) + 1), 0, sub_13))), 0).x > 0.5;
+        bool gt_17 = mod_9 > 0;
+        bool eq_18 = (mod_1 & 1) == 0;
+        bool bit_and_19 = gt_17 && eq_18;
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_20 = bitwise_and_5 == 1;
+        bool bit_xor_21 = slice_14 != (slice_16 && (bit_and_19 && ((((add_15 | 1) - 1) < 9) && eq_20)));
+        int func_clamp_22 = clamp((((((right_shift_3 ^ 1) * 9) + sub_4) * 2) + 1), 0, sub_13);
+        bool slice_23 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_22, 0, sub_13))), 0).x > 0.5;
+        int right_shift_24 = func_clamp_22 >> 1;
+        int right_shift_25 = (right_shift_24 * 3641) >> 15;
+        int sub_27 = right_shift_24 - (right_shift_25 * 9);
+        int add_26 = right_shift_25 + 1;
+        bool bit_xor_28 = bit_xor_21 != ((slice_23 != ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_26 ^ 1) - 1) * 9) + sub_27) * 2) + 1), 0, sub_13))), 0).x > 0.5) && ((gt_17 && ((func_clamp_22 & 1) == 0)) && ((((add_26 | 1) - 1) < 9) && ((sub_27 & 1) == 1))))) && (bit_and_19 && (((right_shift_3 | 1) < 9) && eq_20)));
+        bool match_45;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_45 = bit_xor_28;
+        } else if (((mod_9 == 0) && eq_18)) {
+            match_45 = (!bit_xor_28);
+        } else {
+            int func_clamp_29 = clamp((mod_1 ^ 1), 0, sub_13);
+            bool slice_30 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_29, 0, sub_13))), 0).x > 0.5;
+            int right_shift_31 = func_clamp_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 3641) >> 15;
+            int sub_34 = right_shift_31 - (right_shift_32 * 9);
+            int add_33 = right_shift_32 + 1;
+            bool slice_35 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_33 ^ 1) - 1) * 9) + sub_34) * 2) + 1), 0, sub_13))), 0).x > 0.5;
+            bool bit_and_36 = gt_17 && ((func_clamp_29 & 1) == 0);
+            bool eq_37 = (sub_34 & 1) == 1;
+            bool bit_xor_38 = slice_30 != (slice_35 && (bit_and_36 && ((((add_33 | 1) - 1) < 9) && eq_37)));
+            int func_clamp_39 = clamp((((((right_shift_32 ^ 1) * 9) + sub_34) * 2) + 1), 0, sub_13);
+            bool slice_40 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_39, 0, sub_13))), 0).x > 0.5;
+            int right_shift_41 = func_clamp_39 >> 1;
+            int right_shift_42 = (right_shift_41 * 3641) >> 15;
+            int sub_44 = right_shift_41 - (right_shift_42 * 9);
+            int add_43 = right_shift_42 + 1;
+            match_45 = (bit_xor_38 != ((slice_40 != ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_43 ^ 1) - 1) * 9) + sub_44) * 2) + 1), 0, sub_13))), 0).x > 0.5) && ((gt_17 && ((func_clamp_39 & 1) == 0)) && ((((add_43 | 1) - 1) < 9) && ((sub_44 & 1) == 1))))) && (bit_and_36 && (((right_shift_32 | 1) < 9) && eq_37))));
+        }
+        outColor = float(match_45);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height9_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        int sub_2 = right_shift_0 - (right_shift_1 * 9);
+        int add_4 = right_shift_1 + 1;
+        bool slice_5 = texelFetch(state, clamp(ivec2(x, ((((((add_4 ^ 1) - 1) * 9) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool gt_6 = x > 0;
+        bool eq_7 = (y & 1) == 0;
+        bool bit_and_8 = gt_6 && eq_7;
+        int bitwise_and_3 = sub_2 & 1;
+        bool eq_9 = bitwise_and_3 == 1;
+        bool bit_xor_10 = v_state != (slice_5 && (bit_and_8 && ((((add_4 | 1) - 1) < 9) && eq_9)));
+        int sub_11 = int(state_size.y) - 1;
+        int func_clamp_12 = clamp((((((right_shift_1 ^ 1) * 9) + sub_2) * 2) + 1), 0, sub_11);
+        bool slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int right_shift_15 = (right_shift_14 * 3641) >> 15;
+        int sub_17 = right_shift_14 - (right_shift_15 * 9);
+        int add_16 = right_shift_15 + 1;
+        bool bit_xor_18 = bit_xor_10 != ((slice_13 != ((texelFetch(state, clamp(ivec2(x, ((((((add_16 ^ 1) - 1) * 9) + sub_17) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_6 && ((func_clamp_12 & 1) == 0)) && ((((add_16 | 1) - 1) < 9) && ((sub_17 & 1) == 1))))) && (bit_and_8 && (((right_shift_1 | 1) < 9) && eq_9)));
+        bool match_35;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_35 = bit_xor_18;
+        } else if (((x == 0) && eq_7)) {
+            match_35 = (!bit_xor_18);
+        } else {
+            int func_clamp_19 = clamp((y ^ 1), 0, sub_11);
+            bool slice_20 = texelFetch(state, clamp(ivec2(x, func_clamp_19), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_21 = func_clamp_19 >> 1;
+            int right_shift_22 = (right_shift_21 * 3641) >> 15;
+            int sub_24 = right_shift_21 - (right_shift_22 * 9);
+            int add_23 = right_shift_22 + 1;
+            bool slice_25 = texelFetch(state, clamp(ivec2(x, ((((((add_23 ^ 1) - 1) * 9) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            bool bit_and_26 = gt_6 && ((func_clamp_19 & 1) == 0);
+            bool eq_27 = (sub_24 & 1) == 1;
+            bool bit_xor_28 = slice_20 != (slice_25 && (bit_and_26 && ((((add_23 | 1) - 1) < 9) && eq_27)));
+            int func_clamp_29 = clamp((((((right_shift_22 ^ 1) * 9) + sub_24) * 2) + 1), 0, sub_11);
+            bool slice_30 = texelFetch(state, clamp(ivec2(x, func_clamp_29), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_31 = func_clamp_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 3641) >> 15;
+            int sub_34 = right_shift_31 - (right_shift_32 * 9);
+            int add_33 = right_shift_32 + 1;
+            match_35 = (bit_xor_28 != ((slice_30 != ((texelFetch(state, clamp(ivec2(x, ((((((add_33 ^ 1) - 1) * 9) + sub_34) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_6 && ((func_clamp_29 & 1) == 0)) && ((((add_33 | 1) - 1) < 9) && ((sub_34 & 1) == 1))))) && (bit_and_26 && (((right_shift_22 | 1) < 9) && eq_27))));
+        }
+        outColor = float(match_35);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height9_surface_width9_out_tile83x162_state_tile83x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        int sub_4 = right_shift_2 - (right_shift_3 * 9);
+        bool slice_6 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_3 + 1) ^ 1) - 1) * 9) + sub_4) * 2) + 1), 0, 161))), 0).x > 0.5;
+        int sub_7 = x - (((x * 25267) >> 21) * 83);
+        bool gt_8 = sub_7 > 0;
+        bool eq_9 = (sub_1 & 1) == 0;
+        bool bit_and_10 = gt_8 && eq_9;
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_11 = bitwise_and_5 == 1;
+        bool bit_xor_12 = v_state != (slice_6 && (bit_and_10 && eq_11));
+        int func_clamp_13 = clamp((((((right_shift_3 ^ 1) * 9) + sub_4) * 2) + 1), 0, 161);
+        bool slice_14 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_13)), 0).x > 0.5;
+        int right_shift_15 = func_clamp_13 >> 1;
+        int right_shift_16 = (right_shift_15 * 57) >> 9;
+        int sub_17 = right_shift_15 - (right_shift_16 * 9);
+        bool bit_xor_18 = bit_xor_12 != ((slice_14 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_16 + 1) ^ 1) - 1) * 9) + sub_17) * 2) + 1), 0, 161))), 0).x > 0.5) && ((gt_8 && ((func_clamp_13 & 1) == 0)) && ((sub_17 & 1) == 1)))) && (bit_and_10 && (((right_shift_3 | 1) < 9) && eq_11)));
+        bool match_33;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_33 = bit_xor_18;
+        } else if (((sub_7 == 0) && eq_9)) {
+            match_33 = (!bit_xor_18);
+        } else {
+            int bitwise_xor_19 = sub_1 ^ 1;
+            bool slice_20 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_19)), 0).x > 0.5;
+            int right_shift_21 = bitwise_xor_19 >> 1;
+            int right_shift_22 = (right_shift_21 * 57) >> 9;
+            int sub_23 = right_shift_21 - (right_shift_22 * 9);
+            bool slice_24 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_22 + 1) ^ 1) - 1) * 9) + sub_23) * 2) + 1), 0, 161))), 0).x > 0.5;
+            bool bit_and_25 = gt_8 && ((bitwise_xor_19 & 1) == 0);
+            bool eq_26 = (sub_23 & 1) == 1;
+            bool bit_xor_27 = slice_20 != (slice_24 && (bit_and_25 && eq_26));
+            int func_clamp_28 = clamp((((((right_shift_22 ^ 1) * 9) + sub_23) * 2) + 1), 0, 161);
+            bool slice_29 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_28)), 0).x > 0.5;
+            int right_shift_30 = func_clamp_28 >> 1;
+            int right_shift_31 = (right_shift_30 * 57) >> 9;
+            int sub_32 = right_shift_30 - (right_shift_31 * 9);
+            match_33 = (bit_xor_27 != ((slice_29 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_31 + 1) ^ 1) - 1) * 9) + sub_32) * 2) + 1), 0, 161))), 0).x > 0.5) && ((gt_8 && ((func_clamp_28 & 1) == 0)) && ((sub_32 & 1) == 1)))) && (bit_and_25 && (((right_shift_22 | 1) < 9) && eq_26))));
+        }
+        outColor = float(match_33);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.x);
+        int func_int_6 = int(out_tile.x);
+        int mul_8 = (x / func_int_6) * func_int_7;
+        int mod_9 = x % func_int_6;
+        int add_10 = mul_8 + clamp(mod_9, 0, (func_int_7 - 1));
+        int func_int_11 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_12 = (y / func_int_0) * func_int_11;
+        int mod_1 = y % func_int_0;
+        int sub_13 = func_int_11 - 1;
+        bool slice_14 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(mod_1, 0, sub_13))), 0).x > 0.5;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 20165) >> 18;
+        int sub_4 = right_shift_2 - (right_shift_3 * 13);
+        int add_15 = right_shift_3 + 1;
+        bool slice_16 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_15 ^ 1) - 1) * 13) + sub_4) * 2) + 1), 0, sub_13))), 0).x > 0.5;
+        bool gt_17 = mod_9 > 0;
+        bool eq_18 = (mod_1 & 1) == 0;
+        bool bit_and_19 = gt_17 && eq_18;
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_20 = bitwise_and_5 == 1;
+        bool bit_xor_21 = slice_14 != (slice_16 && (bit_and_19 && ((((add_15 | 1) - 1) < 13) && eq_20)));
+        int func_clamp_22 = clamp((((((right_shift_3 ^ 1) * 13) + sub_4) * 2) + 1), 0, sub_13);
+        bool slice_23 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_22, 0, sub_13))), 0).x > 0.5;
+        int right_shift_24 = func_clamp_22 >> 1;
+        int right_shift_25 = (right_shift_24 * 20165) >> 18;
+        int sub_27 = right_shift_24 - (right_shift_25 * 13);
+        int add_26 = right_shift_25 + 1;
+        bool bit_xor_28 = bit_xor_21 != ((slice_23 != ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_26 ^ 1) - 1) * 13) + sub_27) * 2) + 1), 0, sub_13))), 0).x > 0.5) && ((gt_17 && ((func_clamp_22 & 1) == 0)) && ((((add_26 | 1) - 1) < 13) && ((sub_27 & 1) == 1))))) && (bit_and_19 && (((right_shift_3 | 1) < 13) && eq_20)));
+        bool match_45;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_45 = bit_xor_28;
+        } else if (((mod_9 == 0) && eq_18)) {
+            match_45 = (!bit_xor_28);
+        } else {
+            int func_clamp_29 = clamp((mod_1 ^ 1), 0, sub_13);
+            bool slice_30 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_29, 0, sub_13))), 0).x > 0.5;
+            int right_shift_31 = func_clamp_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 20165) >> 18;
+            int sub_34 = right_shift_31 - (right_shift_32 * 13);
+            int add_33 = right_shift_32 + 1;
+            bool slice_35 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_33 ^ 1) - 1) * 13) + sub_34) * 2) + 1), 0, sub_13))), 0).x > 0.5;
+            bool bit_and_36 = gt_17 && ((func_clamp_29 & 1) == 0);
+            bool eq_37 = (sub_34 & 1) == 1;
+            bool bit_xor_38 = slice_30 != (slice_35 && (bit_and_36 && ((((add_33 | 1) - 1) < 13) && eq_37)));
+            int func_clamp_39 = clamp((((((right_shift_32 ^ 1) * 13) + sub_34) * 2) + 1), 0, sub_13);
+            bool slice_40 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_39, 0, sub_13))), 0).x > 0.5;
+            int right_shift_41 = func_clamp_39 >> 1;
+            int right_shift_42 = (right_shift_41 * 20165) >> 18;
+            int sub_44 = right_shift_41 - (right_shift_42 * 13);
+            int add_43 = right_shift_42 + 1;
+            match_45 = (bit_xor_38 != ((slice_40 != ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_43 ^ 1) - 1) * 13) + sub_44) * 2) + 1), 0, sub_13))), 0).x > 0.5) && ((gt_17 && ((func_clamp_39 & 1) == 0)) && ((((add_43 | 1) - 1) < 13) && ((sub_44 & 1) == 1))))) && (bit_and_36 && (((right_shift_32 | 1) < 13) && eq_37))));
+        }
+        outColor = float(match_45);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height13_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    uniform vec2 state_size;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        int sub_2 = right_shift_0 - (right_shift_1 * 13);
+        int add_4 = right_shift_1 + 1;
+        bool slice_5 = texelFetch(state, clamp(ivec2(x, ((((((add_4 ^ 1) - 1) * 13) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        bool gt_6 = x > 0;
+        bool eq_7 = (y & 1) == 0;
+        bool bit_and_8 = gt_6 && eq_7;
+        int bitwise_and_3 = sub_2 & 1;
+        bool eq_9 = bitwise_and_3 == 1;
+        bool bit_xor_10 = v_state != (slice_5 && (bit_and_8 && ((((add_4 | 1) - 1) < 13) && eq_9)));
+        int sub_11 = int(state_size.y) - 1;
+        int func_clamp_12 = clamp((((((right_shift_1 ^ 1) * 13) + sub_2) * 2) + 1), 0, sub_11);
+        bool slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int right_shift_15 = (right_shift_14 * 20165) >> 18;
+        int sub_17 = right_shift_14 - (right_shift_15 * 13);
+        int add_16 = right_shift_15 + 1;
+        bool bit_xor_18 = bit_xor_10 != ((slice_13 != ((texelFetch(state, clamp(ivec2(x, ((((((add_16 ^ 1) - 1) * 13) + sub_17) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_6 && ((func_clamp_12 & 1) == 0)) && ((((add_16 | 1) - 1) < 13) && ((sub_17 & 1) == 1))))) && (bit_and_8 && (((right_shift_1 | 1) < 13) && eq_9)));
+        bool match_35;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_35 = bit_xor_18;
+        } else if (((x == 0) && eq_7)) {
+            match_35 = (!bit_xor_18);
+        } else {
+            int func_clamp_19 = clamp((y ^ 1), 0, sub_11);
+            bool slice_20 = texelFetch(state, clamp(ivec2(x, func_clamp_19), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_21 = func_clamp_19 >> 1;
+            int right_shift_22 = (right_shift_21 * 20165) >> 18;
+            int sub_24 = right_shift_21 - (right_shift_22 * 13);
+            int add_23 = right_shift_22 + 1;
+            bool slice_25 = texelFetch(state, clamp(ivec2(x, ((((((add_23 ^ 1) - 1) * 13) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            bool bit_and_26 = gt_6 && ((func_clamp_19 & 1) == 0);
+            bool eq_27 = (sub_24 & 1) == 1;
+            bool bit_xor_28 = slice_20 != (slice_25 && (bit_and_26 && ((((add_23 | 1) - 1) < 13) && eq_27)));
+            int func_clamp_29 = clamp((((((right_shift_22 ^ 1) * 13) + sub_24) * 2) + 1), 0, sub_11);
+            bool slice_30 = texelFetch(state, clamp(ivec2(x, func_clamp_29), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+            int right_shift_31 = func_clamp_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 20165) >> 18;
+            int sub_34 = right_shift_31 - (right_shift_32 * 13);
+            int add_33 = right_shift_32 + 1;
+            match_35 = (bit_xor_28 != ((slice_30 != ((texelFetch(state, clamp(ivec2(x, ((((((add_33 ^ 1) - 1) * 13) + sub_34) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && ((gt_6 && ((func_clamp_29 & 1) == 0)) && ((((add_33 | 1) - 1) < 13) && ((sub_34 & 1) == 1))))) && (bit_and_26 && (((right_shift_22 | 1) < 13) && eq_27))));
+        }
+        outColor = float(match_35);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePass2_surface_height13_surface_width13_out_tile171x338_state_tile171x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        int sub_4 = right_shift_2 - (right_shift_3 * 13);
+        bool slice_6 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_3 + 1) ^ 1) - 1) * 13) + sub_4) * 2) + 1), 0, 337))), 0).x > 0.5;
+        int sub_7 = x - (int(((float(x) + 0.5) * 0.005847953259944916)) * 171);
+        bool gt_8 = sub_7 > 0;
+        bool eq_9 = (sub_1 & 1) == 0;
+        bool bit_and_10 = gt_8 && eq_9;
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_11 = bitwise_and_5 == 1;
+        bool bit_xor_12 = v_state != (slice_6 && (bit_and_10 && eq_11));
+        int func_clamp_13 = clamp((((((right_shift_3 ^ 1) * 13) + sub_4) * 2) + 1), 0, 337);
+        bool slice_14 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_13)), 0).x > 0.5;
+        int right_shift_15 = func_clamp_13 >> 1;
+        int right_shift_16 = (right_shift_15 * 79) >> 10;
+        int sub_17 = right_shift_15 - (right_shift_16 * 13);
+        bool bit_xor_18 = bit_xor_12 != ((slice_14 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_16 + 1) ^ 1) - 1) * 13) + sub_17) * 2) + 1), 0, 337))), 0).x > 0.5) && ((gt_8 && ((func_clamp_13 & 1) == 0)) && ((sub_17 & 1) == 1)))) && (bit_and_10 && (((right_shift_3 | 1) < 13) && eq_11)));
+        bool match_33;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_33 = bit_xor_18;
+        } else if (((sub_7 == 0) && eq_9)) {
+            match_33 = (!bit_xor_18);
+        } else {
+            int bitwise_xor_19 = sub_1 ^ 1;
+            bool slice_20 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_19)), 0).x > 0.5;
+            int right_shift_21 = bitwise_xor_19 >> 1;
+            int right_shift_22 = (right_shift_21 * 79) >> 10;
+            int sub_23 = right_shift_21 - (right_shift_22 * 13);
+            bool slice_24 = texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_22 + 1) ^ 1) - 1) * 13) + sub_23) * 2) + 1), 0, 337))), 0).x > 0.5;
+            bool bit_and_25 = gt_8 && ((bitwise_xor_19 & 1) == 0);
+            bool eq_26 = (sub_23 & 1) == 1;
+            bool bit_xor_27 = slice_20 != (slice_24 && (bit_and_25 && eq_26));
+            int func_clamp_28 = clamp((((((right_shift_22 ^ 1) * 13) + sub_23) * 2) + 1), 0, 337);
+            bool slice_29 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_28)), 0).x > 0.5;
+            int right_shift_30 = func_clamp_28 >> 1;
+            int right_shift_31 = (right_shift_30 * 79) >> 10;
+            int sub_32 = right_shift_30 - (right_shift_31 * 13);
+            match_33 = (bit_xor_27 != ((slice_29 != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_31 + 1) ^ 1) - 1) * 13) + sub_32) * 2) + 1), 0, 337))), 0).x > 0.5) && ((gt_8 && ((func_clamp_28 & 1) == 0)) && ((sub_32 & 1) == 1)))) && (bit_and_25 && (((right_shift_22 | 1) < 13) && eq_26))));
+        }
+        outColor = float(match_33);
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+registerLayered(surfaceCyclePass2, surfaceCyclePass2Layered);
+registerSingleShot(surfaceCyclePass2, surfaceCyclePass2SingleShot);
+registerVariant(surfaceCyclePass2, {surface_height: 5, surface_width: 5}, surfaceCyclePass2_surface_height5_surface_width5);
+registerLayered(surfaceCyclePass2_surface_height5_surface_width5, surfaceCyclePass2Layered);
+registerSingleShot(surfaceCyclePass2_surface_height5_surface_width5, surfaceCyclePass2_surface_height5_surface_width5SingleShot);
+registerVariant(surfaceCyclePass2_surface_height5_surface_width5, {out_tile: [27, 50], state_tile: [27, 50]}, surfaceCyclePass2_surface_height5_surface_width5_out_tile27x50_state_tile27x50);
+registerVariant(surfaceCyclePass2, {surface_height: 9, surface_width: 9}, surfaceCyclePass2_surface_height9_surface_width9);
+registerLayered(surfaceCyclePass2_surface_height9_surface_width9, surfaceCyclePass2Layered);
+registerSingleShot(surfaceCyclePass2_surface_height9_surface_width9, surfaceCyclePass2_surface_height9_surface_width9SingleShot);
+registerVariant(surfaceCyclePass2_surface_height9_surface_width9, {out_tile: [83, 162], state_tile: [83, 162]}, surfaceCyclePass2_surface_height9_surface_width9_out_tile83x162_state_tile83x162);
+registerVariant(surfaceCyclePass2, {surface_height: 13, surface_width: 13}, surfaceCyclePass2_surface_height13_surface_width13);
+registerLayered(surfaceCyclePass2_surface_height13_surface_width13, surfaceCyclePass2Layered);
+registerSingleShot(surfaceCyclePass2_surface_height13_surface_width13, surfaceCyclePass2_surface_height13_surface_width13SingleShot);
+registerVariant(surfaceCyclePass2_surface_height13_surface_width13, {out_tile: [171, 338], state_tile: [171, 338]}, surfaceCyclePass2_surface_height13_surface_width13_out_tile171x338_state_tile171x338);
+
+function surfaceCycle(state, surface_height, surface_width) {
+    pickVariant(surfaceCyclePass0, {surface_height, surface_width}).withArgs(surface_height, surface_width, state).renderInto(state);
+    pickVariant(surfaceCyclePass1, {surface_height, surface_width}).withArgs(surface_height, surface_width, state).renderInto(state);
+    pickVariant(surfaceCyclePass2, {surface_height, surface_width}).withArgs(surface_height, surface_width, state).renderInto(state);
+}
+
+export {surfaceCycle}
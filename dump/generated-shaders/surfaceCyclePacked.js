@@ -0,0 +1,4338 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {pickVariant, registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
+
+let surfaceCyclePackedPass0 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    uniform int surface_width;
+    uniform int surface_height;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int sub_9 = func_int_6 - 1;
+        int mod_8 = y % func_int_5;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((mod_8 ^ 1), 0, sub_9))), 0).x;
+        bool eq_11 = mod_3 == 0;
+        bool eq_12 = (mod_8 & 1) == 0;
+        uint match_13 = 
+            (eq_11 && eq_12) ? 1u :
+            0u;
+        uint bitwise_or_14 = (slice_10 & (~match_13)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x)) & match_13);
+        uint match_24 = 
+            eq_11 ? 4294967294u :
+            4294967295u;
+        int right_shift_15 = mod_8 >> 1;
+        int divide_16 = right_shift_15 / surface_width;
+        bool eq_23 = (divide_16 & 1) == 1;
+        int mod_18 = right_shift_15 % surface_width;
+        int add_19 = mod_18 + 1;
+        uint match_25 = 
+            (eq_12 && ((((add_19 | 1) - 1) < surface_width) && eq_23)) ? match_24 :
+            0u;
+        int mul_17 = divide_16 * surface_width;
+        int func_clamp_20 = clamp((((mul_17 + ((add_19 ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_21 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_20 ^ 1), 0, sub_9))), 0).x;
+        uint match_22 = 
+            (eq_11 && ((func_clamp_20 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_26 = bitwise_or_14 ^ (((slice_21 & (~match_22)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_20, 0, sub_9))), 0).x)) & match_22)) & match_25);
+        uint match_39 = 
+            (eq_12 && (((mod_18 | 1) < surface_width) && eq_23)) ? match_24 :
+            0u;
+        int func_clamp_27 = clamp((((mul_17 + (mod_18 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_28 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_27 ^ 1), 0, sub_9))), 0).x;
+        bool eq_29 = (func_clamp_27 & 1) == 0;
+        uint match_30 = 
+            (eq_11 && eq_29) ? 1u :
+            0u;
+        uint bitwise_or_31 = (slice_28 & (~match_30)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_27, 0, sub_9))), 0).x)) & match_30);
+        int right_shift_32 = func_clamp_27 >> 1;
+        int add_34 = (right_shift_32 % surface_width) + 1;
+        int divide_33 = right_shift_32 / surface_width;
+        uint match_38 = 
+            (eq_29 && ((((add_34 | 1) - 1) < surface_width) && ((divide_33 & 1) == 1))) ? match_24 :
+            0u;
+        int func_clamp_35 = clamp(((((divide_33 * surface_width) + ((add_34 ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_36 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_35 ^ 1), 0, sub_9))), 0).x;
+        uint match_37 = 
+            (eq_11 && ((func_clamp_35 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_40 = bitwise_xor_26 ^ ((bitwise_or_31 ^ (((slice_36 & (~match_37)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_35, 0, sub_9))), 0).x)) & match_37)) & match_38)) & match_39);
+        int add_41 = divide_16 + 1;
+        uint match_71 = 
+            (eq_12 && ((((add_41 | 1) - 1) < surface_height) && ((mod_18 & 1) == 0))) ? match_24 :
+            0u;
+        int func_clamp_42 = clamp(((((((add_41 ^ 1) - 1) * surface_width) + mod_18) * 2) + 1), 0, sub_9);
+        uint slice_43 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_42 ^ 1), 0, sub_9))), 0).x;
+        bool eq_44 = (func_clamp_42 & 1) == 0;
+        uint match_45 = 
+            (eq_11 && eq_44) ? 1u :
+            0u;
+        uint bitwise_or_46 = (slice_43 & (~match_45)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_42, 0, sub_9))), 0).x)) & match_45);
+        int right_shift_47 = func_clamp_42 >> 1;
+        int divide_48 = right_shift_47 / surface_width;
+        bool eq_55 = (divide_48 & 1) == 1;
+        int mod_50 = right_shift_47 % surface_width;
+        int add_51 = mod_50 + 1;
+        uint match_56 = 
+            (eq_44 && ((((add_51 | 1) - 1) < surface_width) && eq_55)) ? match_24 :
+            0u;
+        int mul_49 = divide_48 * surface_width;
+        int func_clamp_52 = clamp((((mul_49 + ((add_51 ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_53 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_52 ^ 1), 0, sub_9))), 0).x;
+        uint match_54 = 
+            (eq_11 && ((func_clamp_52 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_57 = bitwise_or_46 ^ (((slice_53 & (~match_54)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_52, 0, sub_9))), 0).x)) & match_54)) & match_56);
+        uint match_70 = 
+            (eq_44 && (((mod_50 | 1) < surface_width) && eq_55)) ? match_24 :
+            0u;
+        int func_clamp_58 = clamp((((mul_49 + (mod_50 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_59 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_58 ^ 1), 0, sub_9))), 0).x;
+        bool eq_60 = (func_clamp_58 & 1) == 0;
+        uint match_61 = 
+            (eq_11 && eq_60) ? 1u :
+            0u;
+        uint bitwise_or_62 = (slice_59 & (~match_61)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_58, 0, sub_9))), 0).x)) & match_61);
+        int right_shift_63 = func_clamp_58 >> 1;
+        int add_65 = (right_shift_63 % surface_width) + 1;
+        int divide_64 = right_shift_63 / surface_width;
+        uint match_69 = 
+            (eq_60 && ((((add_65 | 1) - 1) < surface_width) && ((divide_64 & 1) == 1))) ? match_24 :
+            0u;
+        int func_clamp_66 = clamp(((((divide_64 * surface_width) + ((add_65 ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_67 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_66 ^ 1), 0, sub_9))), 0).x;
+        uint match_68 = 
+            (eq_11 && ((func_clamp_66 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_40 ^ ((bitwise_xor_57 ^ ((bitwise_or_62 ^ (((slice_67 & (~match_68)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_66, 0, sub_9))), 0).x)) & match_68)) & match_69)) & match_70)) & match_71));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp usampler2DArray state;
+    uniform int surface_width;
+    uniform int surface_height;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(state_size.x);
+        int func_clamp_7 = clamp(add_5, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_layer.x);
+        int mod_9 = func_clamp_7 % func_int_8;
+        int sub_16 = int(state_size.y) - 1;
+        int func_int_12 = int(state_tile.y);
+        int add_10 = y + int(out_origin.y);
+        int func_int_11 = int(out_tile.y);
+        int mul_13 = (add_10 / func_int_11) * func_int_12;
+        int sub_15 = func_int_12 - 1;
+        int mod_14 = add_10 % func_int_11;
+        int func_clamp_17 = clamp((mul_13 + clamp((mod_14 ^ 1), 0, sub_15)), 0, sub_16);
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int divide_21 = func_clamp_7 / func_int_8;
+        int divide_20 = ((func_int_6 + func_int_8) - 1) / func_int_8;
+        uint fetch_22 = texelFetch(state, ivec3(mod_9, mod_19, (((func_clamp_17 / func_int_18) * divide_20) + divide_21)), 0).x;
+        bool eq_23 = mod_4 == 0;
+        bool eq_24 = (mod_14 & 1) == 0;
+        uint match_25 = 
+            (eq_23 && eq_24) ? 1u :
+            0u;
+        uint bitwise_and_26 = fetch_22 & (~match_25);
+        int func_clamp_27 = clamp((mul_13 + clamp(mod_14, 0, sub_15)), 0, sub_16);
+        uint bitwise_or_28 = bitwise_and_26 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_27 % func_int_18), (((func_clamp_27 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_25);
+        uint match_41 = 
+            eq_23 ? 4294967294u :
+            4294967295u;
+        int right_shift_29 = mod_14 >> 1;
+        int divide_30 = right_shift_29 / surface_width;
+        bool eq_40 = (divide_30 & 1) == 1;
+        int mod_32 = right_shift_29 % surface_width;
+        int add_33 = mod_32 + 1;
+        uint match_42 = 
+            (eq_24 && ((((add_33 | 1) - 1) < surface_width) && eq_40)) ? match_41 :
+            0u;
+        int mul_31 = divide_30 * surface_width;
+        int func_clamp_34 = clamp((((mul_31 + ((add_33 ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        int func_clamp_35 = clamp((mul_13 + clamp((func_clamp_34 ^ 1), 0, sub_15)), 0, sub_16);
+        uint fetch_36 = texelFetch(state, ivec3(mod_9, (func_clamp_35 % func_int_18), (((func_clamp_35 / func_int_18) * divide_20) + divide_21)), 0).x;
+        uint match_37 = 
+            (eq_23 && ((func_clamp_34 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_and_38 = fetch_36 & (~match_37);
+        int func_clamp_39 = clamp((mul_13 + clamp(func_clamp_34, 0, sub_15)), 0, sub_16);
+        uint bitwise_xor_43 = bitwise_or_28 ^ ((bitwise_and_38 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_39 % func_int_18), (((func_clamp_39 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_37)) & match_42);
+        uint match_62 = 
+            (eq_24 && (((mod_32 | 1) < surface_width) && eq_40)) ? match_41 :
+            0u;
+        int func_clamp_44 = clamp((((mul_31 + (mod_32 ^ 1)) * 2) + 1), 0, sub_15);
+        int func_clamp_45 = clamp((mul_13 + clamp((func_clamp_44 ^ 1), 0, sub_15)), 0, sub_16);
+        uint fetch_46 = texelFetch(state, ivec3(mod_9, (func_clamp_45 % func_int_18), (((func_clamp_45 / func_int_18) * divide_20) + divide_21)), 0).x;
+        bool eq_47 = (func_clamp_44 & 1) == 0;
+        uint match_48 = 
+            (eq_23 && eq_47) ? 1u :
+            0u;
+        uint bitwise_and_49 = fetch_46 & (~match_48);
+        int func_clamp_50 = clamp((mul_13 + clamp(func_clamp_44, 0, sub_15)), 0, sub_16);
+        uint bitwise_or_51 = bitwise_and_49 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_50 % func_int_18), (((func_clamp_50 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_48);
+        int right_shift_52 = func_clamp_44 >> 1;
+        int add_54 = (right_shift_52 % surface_width) + 1;
+        int divide_53 = right_shift_52 / surface_width;
+        uint match_61 = 
+            (eq_47 && ((((add_54 | 1) - 1) < surface_width) && ((divide_53 & 1) == 1))) ? match_41 :
+            0u;
+        int func_clamp_55 = clamp(((((divide_53 * surface_width) + ((add_54 ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        int func_clamp_56 = clamp((mul_13 + clamp((func_clamp_55 ^ 1), 0, sub_15)), 0, sub_16);
+        uint fetch_57 = texelFetch(state, ivec3(mod_9, (func_clamp_56 % func_int_18), (((func_clamp_56 / func_int_18) * divide_20) + divide_21)), 0).x;
+        uint match_58 = 
+            (eq_23 && ((func_clamp_55 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_and_59 = fetch_57 & (~match_58);
+        int func_clamp_60 = clamp((mul_13 + clamp(func_clamp_55, 0, sub_15)), 0, sub_16);
+        uint bitwise_xor_63 = bitwise_xor_43 ^ ((bitwise_or_51 ^ ((bitwise_and_59 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_60 % func_int_18), (((func_clamp_60 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_58)) & match_61)) & match_62);
+        int add_64 = divide_30 + 1;
+        uint match_106 = 
+            (eq_24 && ((((add_64 | 1) - 1) < surface_height) && ((mod_32 & 1) == 0))) ? match_41 :
+            0u;
+        int func_clamp_65 = clamp(((((((add_64 ^ 1) - 1) * surface_width) + mod_32) * 2) + 1), 0, sub_15);
+        int func_clamp_66 = clamp((mul_13 + clamp((func_clamp_65 ^ 1), 0, sub_15)), 0, sub_16);
+        uint fetch_67 = texelFetch(state, ivec3(mod_9, (func_clamp_66 % func_int_18), (((func_clamp_66 / func_int_18) * divide_20) + divide_21)), 0).x;
+        bool eq_68 = (func_clamp_65 & 1) == 0;
+        uint match_69 = 
+            (eq_23 && eq_68) ? 1u :
+            0u;
+        uint bitwise_and_70 = fetch_67 & (~match_69);
+        int func_clamp_71 = clamp((mul_13 + clamp(func_clamp_65, 0, sub_15)), 0, sub_16);
+        uint bitwise_or_72 = bitwise_and_70 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_71 % func_int_18), (((func_clamp_71 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_69);
+        int right_shift_73 = func_clamp_65 >> 1;
+        int divide_74 = right_shift_73 / surface_width;
+        bool eq_84 = (divide_74 & 1) == 1;
+        int mod_76 = right_shift_73 % surface_width;
+        int add_77 = mod_76 + 1;
+        uint match_85 = 
+            (eq_68 && ((((add_77 | 1) - 1) < surface_width) && eq_84)) ? match_41 :
+            0u;
+        int mul_75 = divide_74 * surface_width;
+        int func_clamp_78 = clamp((((mul_75 + ((add_77 ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        int func_clamp_79 = clamp((mul_13 + clamp((func_clamp_78 ^ 1), 0, sub_15)), 0, sub_16);
+        uint fetch_80 = texelFetch(state, ivec3(mod_9, (func_clamp_79 % func_int_18), (((func_clamp_79 / func_int_18) * divide_20) + divide_21)), 0).x;
+        uint match_81 = 
+            (eq_23 && ((func_clamp_78 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_and_82 = fetch_80 & (~match_81);
+        int func_clamp_83 = clamp((mul_13 + clamp(func_clamp_78, 0, sub_15)), 0, sub_16);
+        uint bitwise_xor_86 = bitwise_or_72 ^ ((bitwise_and_82 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_83 % func_int_18), (((func_clamp_83 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_81)) & match_85);
+        uint match_105 = 
+            (eq_68 && (((mod_76 | 1) < surface_width) && eq_84)) ? match_41 :
+            0u;
+        int func_clamp_87 = clamp((((mul_75 + (mod_76 ^ 1)) * 2) + 1), 0, sub_15);
+        int func_clamp_88 = clamp((mul_13 + clamp((func_clamp_87 ^ 1), 0, sub_15)), 0, sub_16);
+        uint fetch_89 = texelFetch(state, ivec3(mod_9, (func_clamp_88 % func_int_18), (((func_clamp_88 / func_int_18) * divide_20) + divide_21)), 0).x;
+        bool eq_90 = (func_clamp_87 & 1) == 0;
+        uint match_91 = 
+            (eq_23 && eq_90) ? 1u :
+            0u;
+        uint bitwise_and_92 = fetch_89 & (~match_91);
+        int func_clamp_93 = clamp((mul_13 + clamp(func_clamp_87, 0, sub_15)), 0, sub_16);
+        uint bitwise_or_94 = bitwise_and_92 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_93 % func_int_18), (((func_clamp_93 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_91);
+        int right_shift_95 = func_clamp_87 >> 1;
+        int add_97 = (right_shift_95 % surface_width) + 1;
+        int divide_96 = right_shift_95 / surface_width;
+        uint match_104 = 
+            (eq_90 && ((((add_97 | 1) - 1) < surface_width) && ((divide_96 & 1) == 1))) ? match_41 :
+            0u;
+        int func_clamp_98 = clamp(((((divide_96 * surface_width) + ((add_97 ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        int func_clamp_99 = clamp((mul_13 + clamp((func_clamp_98 ^ 1), 0, sub_15)), 0, sub_16);
+        uint fetch_100 = texelFetch(state, ivec3(mod_9, (func_clamp_99 % func_int_18), (((func_clamp_99 / func_int_18) * divide_20) + divide_21)), 0).x;
+        uint match_101 = 
+            (eq_23 && ((func_clamp_98 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_and_102 = fetch_100 & (~match_101);
+        int func_clamp_103 = clamp((mul_13 + clamp(func_clamp_98, 0, sub_15)), 0, sub_16);
+        outColor = (bitwise_xor_63 ^ ((bitwise_xor_86 ^ ((bitwise_or_94 ^ ((bitwise_and_102 | ((~(texelFetch(state, ivec3(mod_9, (func_clamp_103 % func_int_18), (((func_clamp_103 / func_int_18) * divide_20) + divide_21)), 0).x)) & match_101)) & match_104)) & match_105)) & match_106));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCyclePackedPass0SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform int surface_width;
+    uniform vec2 state_size;
+    uniform int surface_height;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint slice_0 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_1 = x == 0;
+        bool eq_2 = (y & 1) == 0;
+        uint match_3 = 
+            (eq_1 && eq_2) ? 1u :
+            0u;
+        uint bitwise_or_4 = (slice_0 & (~match_3)) | ((~(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_3);
+        uint match_15 = 
+            eq_1 ? 4294967294u :
+            4294967295u;
+        int right_shift_5 = y >> 1;
+        int divide_6 = right_shift_5 / surface_width;
+        bool eq_14 = (divide_6 & 1) == 1;
+        int mod_8 = right_shift_5 % surface_width;
+        int add_9 = mod_8 + 1;
+        uint match_16 = 
+            (eq_2 && ((((add_9 | 1) - 1) < surface_width) && eq_14)) ? match_15 :
+            0u;
+        int sub_10 = int(state_size.y) - 1;
+        int mul_7 = divide_6 * surface_width;
+        int func_clamp_11 = clamp((((mul_7 + ((add_9 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        uint slice_12 = texelFetch(state, clamp(ivec2(x, (func_clamp_11 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_13 = 
+            (eq_1 && ((func_clamp_11 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_17 = bitwise_or_4 ^ (((slice_12 & (~match_13)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_11), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_13)) & match_16);
+        uint match_30 = 
+            (eq_2 && (((mod_8 | 1) < surface_width) && eq_14)) ? match_15 :
+            0u;
+        int func_clamp_18 = clamp((((mul_7 + (mod_8 ^ 1)) * 2) + 1), 0, sub_10);
+        uint slice_19 = texelFetch(state, clamp(ivec2(x, (func_clamp_18 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_20 = (func_clamp_18 & 1) == 0;
+        uint match_21 = 
+            (eq_1 && eq_20) ? 1u :
+            0u;
+        uint bitwise_or_22 = (slice_19 & (~match_21)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_18), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_21);
+        int right_shift_23 = func_clamp_18 >> 1;
+        int add_25 = (right_shift_23 % surface_width) + 1;
+        int divide_24 = right_shift_23 / surface_width;
+        uint match_29 = 
+            (eq_20 && ((((add_25 | 1) - 1) < surface_width) && ((divide_24 & 1) == 1))) ? match_15 :
+            0u;
+        int func_clamp_26 = clamp(((((divide_24 * surface_width) + ((add_25 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        uint slice_27 = texelFetch(state, clamp(ivec2(x, (func_clamp_26 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_28 = 
+            (eq_1 && ((func_clamp_26 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_31 = bitwise_xor_17 ^ ((bitwise_or_22 ^ (((slice_27 & (~match_28)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_26), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_28)) & match_29)) & match_30);
+        int add_32 = divide_6 + 1;
+        uint match_62 = 
+            (eq_2 && ((((add_32 | 1) - 1) < surface_height) && ((mod_8 & 1) == 0))) ? match_15 :
+            0u;
+        int func_clamp_33 = clamp(((((((add_32 ^ 1) - 1) * surface_width) + mod_8) * 2) + 1), 0, sub_10);
+        uint slice_34 = texelFetch(state, clamp(ivec2(x, (func_clamp_33 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_35 = (func_clamp_33 & 1) == 0;
+        uint match_36 = 
+            (eq_1 && eq_35) ? 1u :
+            0u;
+        uint bitwise_or_37 = (slice_34 & (~match_36)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_33), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_36);
+        int right_shift_38 = func_clamp_33 >> 1;
+        int divide_39 = right_shift_38 / surface_width;
+        bool eq_46 = (divide_39 & 1) == 1;
+        int mod_41 = right_shift_38 % surface_width;
+        int add_42 = mod_41 + 1;
+        uint match_47 = 
+            (eq_35 && ((((add_42 | 1) - 1) < surface_width) && eq_46)) ? match_15 :
+            0u;
+        int mul_40 = divide_39 * surface_width;
+        int func_clamp_43 = clamp((((mul_40 + ((add_42 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        uint slice_44 = texelFetch(state, clamp(ivec2(x, (func_clamp_43 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_45 = 
+            (eq_1 && ((func_clamp_43 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_48 = bitwise_or_37 ^ (((slice_44 & (~match_45)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_43), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_45)) & match_47);
+        uint match_61 = 
+            (eq_35 && (((mod_41 | 1) < surface_width) && eq_46)) ? match_15 :
+            0u;
+        int func_clamp_49 = clamp((((mul_40 + (mod_41 ^ 1)) * 2) + 1), 0, sub_10);
+        uint slice_50 = texelFetch(state, clamp(ivec2(x, (func_clamp_49 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_51 = (func_clamp_49 & 1) == 0;
+        uint match_52 = 
+            (eq_1 && eq_51) ? 1u :
+            0u;
+        uint bitwise_or_53 = (slice_50 & (~match_52)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_49), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_52);
+        int right_shift_54 = func_clamp_49 >> 1;
+        int add_56 = (right_shift_54 % surface_width) + 1;
+        int divide_55 = right_shift_54 / surface_width;
+        uint match_60 = 
+            (eq_51 && ((((add_56 | 1) - 1) < surface_width) && ((divide_55 & 1) == 1))) ? match_15 :
+            0u;
+        int func_clamp_57 = clamp(((((divide_55 * surface_width) + ((add_56 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        uint slice_58 = texelFetch(state, clamp(ivec2(x, (func_clamp_57 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_59 = 
+            (eq_1 && ((func_clamp_57 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_31 ^ ((bitwise_xor_48 ^ ((bitwise_or_53 ^ (((slice_58 & (~match_59)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_57), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_59)) & match_60)) & match_61)) & match_62));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int sub_9 = func_int_6 - 1;
+        int mod_8 = y % func_int_5;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((mod_8 ^ 1), 0, sub_9))), 0).x;
+        bool eq_11 = mod_3 == 0;
+        bool eq_12 = (mod_8 & 1) == 0;
+        uint match_13 = 
+            (eq_11 && eq_12) ? 1u :
+            0u;
+        uint bitwise_or_14 = (slice_10 & (~match_13)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x)) & match_13);
+        uint match_23 = 
+            eq_11 ? 4294967294u :
+            4294967295u;
+        int right_shift_15 = mod_8 >> 1;
+        int right_shift_16 = (right_shift_15 * 26215) >> 17;
+        bool eq_22 = (right_shift_16 & 1) == 1;
+        uint match_24 = 
+            (eq_12 && eq_22) ? match_23 :
+            0u;
+        int mul_17 = right_shift_16 * 5;
+        int sub_18 = right_shift_15 - mul_17;
+        int func_clamp_19 = clamp((((mul_17 + (((sub_18 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_20 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_19 ^ 1), 0, sub_9))), 0).x;
+        uint match_21 = 
+            (eq_11 && ((func_clamp_19 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_25 = bitwise_or_14 ^ (((slice_20 & (~match_21)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_19, 0, sub_9))), 0).x)) & match_21)) & match_24);
+        uint match_38 = 
+            (eq_12 && (((sub_18 | 1) < 5) && eq_22)) ? match_23 :
+            0u;
+        int func_clamp_26 = clamp((((mul_17 + (sub_18 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_27 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_26 ^ 1), 0, sub_9))), 0).x;
+        bool eq_28 = (func_clamp_26 & 1) == 0;
+        uint match_29 = 
+            (eq_11 && eq_28) ? 1u :
+            0u;
+        uint bitwise_or_30 = (slice_27 & (~match_29)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_26, 0, sub_9))), 0).x)) & match_29);
+        int right_shift_31 = func_clamp_26 >> 1;
+        int right_shift_32 = (right_shift_31 * 26215) >> 17;
+        uint match_37 = 
+            (eq_28 && ((right_shift_32 & 1) == 1)) ? match_23 :
+            0u;
+        int mul_33 = right_shift_32 * 5;
+        int func_clamp_34 = clamp((((mul_33 + ((((right_shift_31 - mul_33) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_35 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_34 ^ 1), 0, sub_9))), 0).x;
+        uint match_36 = 
+            (eq_11 && ((func_clamp_34 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_39 = bitwise_xor_25 ^ ((bitwise_or_30 ^ (((slice_35 & (~match_36)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_34, 0, sub_9))), 0).x)) & match_36)) & match_37)) & match_38);
+        int add_40 = right_shift_16 + 1;
+        uint match_69 = 
+            (eq_12 && ((((add_40 | 1) - 1) < 5) && ((sub_18 & 1) == 0))) ? match_23 :
+            0u;
+        int func_clamp_41 = clamp(((((((add_40 ^ 1) - 1) * 5) + sub_18) * 2) + 1), 0, sub_9);
+        uint slice_42 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_41 ^ 1), 0, sub_9))), 0).x;
+        bool eq_43 = (func_clamp_41 & 1) == 0;
+        uint match_44 = 
+            (eq_11 && eq_43) ? 1u :
+            0u;
+        uint bitwise_or_45 = (slice_42 & (~match_44)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_41, 0, sub_9))), 0).x)) & match_44);
+        int right_shift_46 = func_clamp_41 >> 1;
+        int right_shift_47 = (right_shift_46 * 26215) >> 17;
+        bool eq_53 = (right_shift_47 & 1) == 1;
+        uint match_54 = 
+            (eq_43 && eq_53) ? match_23 :
+            0u;
+        int mul_48 = right_shift_47 * 5;
+        int sub_49 = right_shift_46 - mul_48;
+        int func_clamp_50 = clamp((((mul_48 + (((sub_49 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_51 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_50 ^ 1), 0, sub_9))), 0).x;
+        uint match_52 = 
+            (eq_11 && ((func_clamp_50 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_55 = bitwise_or_45 ^ (((slice_51 & (~match_52)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_50, 0, sub_9))), 0).x)) & match_52)) & match_54);
+        uint match_68 = 
+            (eq_43 && (((sub_49 | 1) < 5) && eq_53)) ? match_23 :
+            0u;
+        int func_clamp_56 = clamp((((mul_48 + (sub_49 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_57 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_56 ^ 1), 0, sub_9))), 0).x;
+        bool eq_58 = (func_clamp_56 & 1) == 0;
+        uint match_59 = 
+            (eq_11 && eq_58) ? 1u :
+            0u;
+        uint bitwise_or_60 = (slice_57 & (~match_59)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_56, 0, sub_9))), 0).x)) & match_59);
+        int right_shift_61 = func_clamp_56 >> 1;
+        int right_shift_62 = (right_shift_61 * 26215) >> 17;
+        uint match_67 = 
+            (eq_58 && ((right_shift_62 & 1) == 1)) ? match_23 :
+            0u;
+        int mul_63 = right_shift_62 * 5;
+        int func_clamp_64 = clamp((((mul_63 + ((((right_shift_61 - mul_63) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_65 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_64 ^ 1), 0, sub_9))), 0).x;
+        uint match_66 = 
+            (eq_11 && ((func_clamp_64 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_39 ^ ((bitwise_xor_55 ^ ((bitwise_or_60 ^ (((slice_65 & (~match_66)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_64, 0, sub_9))), 0).x)) & match_66)) & match_67)) & match_68)) & match_69));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height5_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint slice_0 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_1 = x == 0;
+        bool eq_2 = (y & 1) == 0;
+        uint match_3 = 
+            (eq_1 && eq_2) ? 1u :
+            0u;
+        uint bitwise_or_4 = (slice_0 & (~match_3)) | ((~(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_3);
+        uint match_14 = 
+            eq_1 ? 4294967294u :
+            4294967295u;
+        int right_shift_5 = y >> 1;
+        int right_shift_6 = (right_shift_5 * 26215) >> 17;
+        bool eq_13 = (right_shift_6 & 1) == 1;
+        uint match_15 = 
+            (eq_2 && eq_13) ? match_14 :
+            0u;
+        int sub_9 = int(state_size.y) - 1;
+        int mul_7 = right_shift_6 * 5;
+        int sub_8 = right_shift_5 - mul_7;
+        int func_clamp_10 = clamp((((mul_7 + (((sub_8 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_11 = texelFetch(state, clamp(ivec2(x, (func_clamp_10 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_12 = 
+            (eq_1 && ((func_clamp_10 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_16 = bitwise_or_4 ^ (((slice_11 & (~match_12)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_10), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_12)) & match_15);
+        uint match_29 = 
+            (eq_2 && (((sub_8 | 1) < 5) && eq_13)) ? match_14 :
+            0u;
+        int func_clamp_17 = clamp((((mul_7 + (sub_8 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_18 = texelFetch(state, clamp(ivec2(x, (func_clamp_17 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_19 = (func_clamp_17 & 1) == 0;
+        uint match_20 = 
+            (eq_1 && eq_19) ? 1u :
+            0u;
+        uint bitwise_or_21 = (slice_18 & (~match_20)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_17), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_20);
+        int right_shift_22 = func_clamp_17 >> 1;
+        int right_shift_23 = (right_shift_22 * 26215) >> 17;
+        uint match_28 = 
+            (eq_19 && ((right_shift_23 & 1) == 1)) ? match_14 :
+            0u;
+        int mul_24 = right_shift_23 * 5;
+        int func_clamp_25 = clamp((((mul_24 + ((((right_shift_22 - mul_24) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_26 = texelFetch(state, clamp(ivec2(x, (func_clamp_25 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_27 = 
+            (eq_1 && ((func_clamp_25 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_30 = bitwise_xor_16 ^ ((bitwise_or_21 ^ (((slice_26 & (~match_27)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_25), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_27)) & match_28)) & match_29);
+        int add_31 = right_shift_6 + 1;
+        uint match_60 = 
+            (eq_2 && ((((add_31 | 1) - 1) < 5) && ((sub_8 & 1) == 0))) ? match_14 :
+            0u;
+        int func_clamp_32 = clamp(((((((add_31 ^ 1) - 1) * 5) + sub_8) * 2) + 1), 0, sub_9);
+        uint slice_33 = texelFetch(state, clamp(ivec2(x, (func_clamp_32 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_34 = (func_clamp_32 & 1) == 0;
+        uint match_35 = 
+            (eq_1 && eq_34) ? 1u :
+            0u;
+        uint bitwise_or_36 = (slice_33 & (~match_35)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_32), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_35);
+        int right_shift_37 = func_clamp_32 >> 1;
+        int right_shift_38 = (right_shift_37 * 26215) >> 17;
+        bool eq_44 = (right_shift_38 & 1) == 1;
+        uint match_45 = 
+            (eq_34 && eq_44) ? match_14 :
+            0u;
+        int mul_39 = right_shift_38 * 5;
+        int sub_40 = right_shift_37 - mul_39;
+        int func_clamp_41 = clamp((((mul_39 + (((sub_40 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_42 = texelFetch(state, clamp(ivec2(x, (func_clamp_41 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_43 = 
+            (eq_1 && ((func_clamp_41 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_46 = bitwise_or_36 ^ (((slice_42 & (~match_43)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_41), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_43)) & match_45);
+        uint match_59 = 
+            (eq_34 && (((sub_40 | 1) < 5) && eq_44)) ? match_14 :
+            0u;
+        int func_clamp_47 = clamp((((mul_39 + (sub_40 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_48 = texelFetch(state, clamp(ivec2(x, (func_clamp_47 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_49 = (func_clamp_47 & 1) == 0;
+        uint match_50 = 
+            (eq_1 && eq_49) ? 1u :
+            0u;
+        uint bitwise_or_51 = (slice_48 & (~match_50)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_47), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_50);
+        int right_shift_52 = func_clamp_47 >> 1;
+        int right_shift_53 = (right_shift_52 * 26215) >> 17;
+        uint match_58 = 
+            (eq_49 && ((right_shift_53 & 1) == 1)) ? match_14 :
+            0u;
+        int mul_54 = right_shift_53 * 5;
+        int func_clamp_55 = clamp((((mul_54 + ((((right_shift_52 - mul_54) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_56 = texelFetch(state, clamp(ivec2(x, (func_clamp_55 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_57 = 
+            (eq_1 && ((func_clamp_55 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_30 ^ ((bitwise_xor_46 ^ ((bitwise_or_51 ^ (((slice_56 & (~match_57)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_55), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_57)) & match_58)) & match_59)) & match_60));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height5_surface_width5_out_tile1x50_state_tile1x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        uint slice_2 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+        bool eq_3 = (sub_1 & 1) == 0;
+        uint match_4 = 
+            eq_3 ? 1u :
+            0u;
+        uint bitwise_or_5 = (slice_2 & (~match_4)) | ((~(texelFetch(state, ivec2(x, y), 0).x)) & match_4);
+        int right_shift_6 = sub_1 >> 1;
+        int right_shift_7 = (right_shift_6 * 13) >> 6;
+        bool eq_13 = (right_shift_7 & 1) == 1;
+        uint match_14 = 
+            (eq_3 && eq_13) ? 4294967294u :
+            0u;
+        int mul_8 = right_shift_7 * 5;
+        int sub_9 = right_shift_6 - mul_8;
+        int func_clamp_10 = clamp((((mul_8 + (((sub_9 + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        uint slice_11 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_10 ^ 1))), 0).x;
+        uint match_12 = 
+            ((func_clamp_10 & 1) == 0) ? 1u :
+            0u;
+        uint bitwise_xor_15 = bitwise_or_5 ^ (((slice_11 & (~match_12)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_10)), 0).x)) & match_12)) & match_14);
+        uint match_28 = 
+            (eq_3 && (((sub_9 | 1) < 5) && eq_13)) ? 4294967294u :
+            0u;
+        int func_clamp_16 = clamp((((mul_8 + (sub_9 ^ 1)) * 2) + 1), 0, 49);
+        uint slice_17 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_16 ^ 1))), 0).x;
+        bool eq_18 = (func_clamp_16 & 1) == 0;
+        uint match_19 = 
+            eq_18 ? 1u :
+            0u;
+        uint bitwise_or_20 = (slice_17 & (~match_19)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_16)), 0).x)) & match_19);
+        int right_shift_21 = func_clamp_16 >> 1;
+        int right_shift_22 = (right_shift_21 * 13) >> 6;
+        uint match_27 = 
+            (eq_18 && ((right_shift_22 & 1) == 1)) ? 4294967294u :
+            0u;
+        int mul_23 = right_shift_22 * 5;
+        int func_clamp_24 = clamp((((mul_23 + ((((right_shift_21 - mul_23) + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        uint slice_25 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_24 ^ 1))), 0).x;
+        uint match_26 = 
+            ((func_clamp_24 & 1) == 0) ? 1u :
+            0u;
+        uint bitwise_xor_29 = bitwise_xor_15 ^ ((bitwise_or_20 ^ (((slice_25 & (~match_26)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_24)), 0).x)) & match_26)) & match_27)) & match_28);
+        uint match_58 = 
+            (eq_3 && ((sub_9 & 1) == 0)) ? 4294967294u :
+            0u;
+        int func_clamp_30 = clamp((((((((right_shift_7 + 1) ^ 1) - 1) * 5) + sub_9) * 2) + 1), 0, 49);
+        uint slice_31 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_30 ^ 1))), 0).x;
+        bool eq_32 = (func_clamp_30 & 1) == 0;
+        uint match_33 = 
+            eq_32 ? 1u :
+            0u;
+        uint bitwise_or_34 = (slice_31 & (~match_33)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_30)), 0).x)) & match_33);
+        int right_shift_35 = func_clamp_30 >> 1;
+        int right_shift_36 = (right_shift_35 * 13) >> 6;
+        bool eq_42 = (right_shift_36 & 1) == 1;
+        uint match_43 = 
+            (eq_32 && eq_42) ? 4294967294u :
+            0u;
+        int mul_37 = right_shift_36 * 5;
+        int sub_38 = right_shift_35 - mul_37;
+        int func_clamp_39 = clamp((((mul_37 + (((sub_38 + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        uint slice_40 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_39 ^ 1))), 0).x;
+        uint match_41 = 
+            ((func_clamp_39 & 1) == 0) ? 1u :
+            0u;
+        uint bitwise_xor_44 = bitwise_or_34 ^ (((slice_40 & (~match_41)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_39)), 0).x)) & match_41)) & match_43);
+        uint match_57 = 
+            (eq_32 && (((sub_38 | 1) < 5) && eq_42)) ? 4294967294u :
+            0u;
+        int func_clamp_45 = clamp((((mul_37 + (sub_38 ^ 1)) * 2) + 1), 0, 49);
+        uint slice_46 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_45 ^ 1))), 0).x;
+        bool eq_47 = (func_clamp_45 & 1) == 0;
+        uint match_48 = 
+            eq_47 ? 1u :
+            0u;
+        uint bitwise_or_49 = (slice_46 & (~match_48)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_45)), 0).x)) & match_48);
+        int right_shift_50 = func_clamp_45 >> 1;
+        int right_shift_51 = (right_shift_50 * 13) >> 6;
+        uint match_56 = 
+            (eq_47 && ((right_shift_51 & 1) == 1)) ? 4294967294u :
+            0u;
+        int mul_52 = right_shift_51 * 5;
+        int func_clamp_53 = clamp((((mul_52 + ((((right_shift_50 - mul_52) + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        uint slice_54 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_53 ^ 1))), 0).x;
+        uint match_55 = 
+            ((func_clamp_53 & 1) == 0) ? 1u :
+            0u;
+        outColor = (bitwise_xor_29 ^ ((bitwise_xor_44 ^ ((bitwise_or_49 ^ (((slice_54 & (~match_55)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_53)), 0).x)) & match_55)) & match_56)) & match_57)) & match_58));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int sub_9 = func_int_6 - 1;
+        int mod_8 = y % func_int_5;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((mod_8 ^ 1), 0, sub_9))), 0).x;
+        bool eq_11 = mod_3 == 0;
+        bool eq_12 = (mod_8 & 1) == 0;
+        uint match_13 = 
+            (eq_11 && eq_12) ? 1u :
+            0u;
+        uint bitwise_or_14 = (slice_10 & (~match_13)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x)) & match_13);
+        uint match_23 = 
+            eq_11 ? 4294967294u :
+            4294967295u;
+        int right_shift_15 = mod_8 >> 1;
+        int right_shift_16 = (right_shift_15 * 3641) >> 15;
+        bool eq_22 = (right_shift_16 & 1) == 1;
+        uint match_24 = 
+            (eq_12 && eq_22) ? match_23 :
+            0u;
+        int mul_17 = right_shift_16 * 9;
+        int sub_18 = right_shift_15 - mul_17;
+        int func_clamp_19 = clamp((((mul_17 + (((sub_18 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_20 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_19 ^ 1), 0, sub_9))), 0).x;
+        uint match_21 = 
+            (eq_11 && ((func_clamp_19 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_25 = bitwise_or_14 ^ (((slice_20 & (~match_21)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_19, 0, sub_9))), 0).x)) & match_21)) & match_24);
+        uint match_38 = 
+            (eq_12 && (((sub_18 | 1) < 9) && eq_22)) ? match_23 :
+            0u;
+        int func_clamp_26 = clamp((((mul_17 + (sub_18 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_27 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_26 ^ 1), 0, sub_9))), 0).x;
+        bool eq_28 = (func_clamp_26 & 1) == 0;
+        uint match_29 = 
+            (eq_11 && eq_28) ? 1u :
+            0u;
+        uint bitwise_or_30 = (slice_27 & (~match_29)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_26, 0, sub_9))), 0).x)) & match_29);
+        int right_shift_31 = func_clamp_26 >> 1;
+        int right_shift_32 = (right_shift_31 * 3641) >> 15;
+        uint match_37 = 
+            (eq_28 && ((right_shift_32 & 1) == 1)) ? match_23 :
+            0u;
+        int mul_33 = right_shift_32 * 9;
+        int func_clamp_34 = clamp((((mul_33 + ((((right_shift_31 - mul_33) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_35 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_34 ^ 1), 0, sub_9))), 0).x;
+        uint match_36 = 
+            (eq_11 && ((func_clamp_34 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_39 = bitwise_xor_25 ^ ((bitwise_or_30 ^ (((slice_35 & (~match_36)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_34, 0, sub_9))), 0).x)) & match_36)) & match_37)) & match_38);
+        int add_40 = right_shift_16 + 1;
+        uint match_69 = 
+            (eq_12 && ((((add_40 | 1) - 1) < 9) && ((sub_18 & 1) == 0))) ? match_23 :
+            0u;
+        int func_clamp_41 = clamp(((((((add_40 ^ 1) - 1) * 9) + sub_18) * 2) + 1), 0, sub_9);
+        uint slice_42 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_41 ^ 1), 0, sub_9))), 0).x;
+        bool eq_43 = (func_clamp_41 & 1) == 0;
+        uint match_44 = 
+            (eq_11 && eq_43) ? 1u :
+            0u;
+        uint bitwise_or_45 = (slice_42 & (~match_44)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_41, 0, sub_9))), 0).x)) & match_44);
+        int right_shift_46 = func_clamp_41 >> 1;
+        int right_shift_47 = (right_shift_46 * 3641) >> 15;
+        bool eq_53 = (right_shift_47 & 1) == 1;
+        uint match_54 = 
+            (eq_43 && eq_53) ? match_23 :
+            0u;
+        int mul_48 = right_shift_47 * 9;
+        int sub_49 = right_shift_46 - mul_48;
+        int func_clamp_50 = clamp((((mul_48 + (((sub_49 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_51 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_50 ^ 1), 0, sub_9))), 0).x;
+        uint match_52 = 
+            (eq_11 && ((func_clamp_50 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_55 = bitwise_or_45 ^ (((slice_51 & (~match_52)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_50, 0, sub_9))), 0).x)) & match_52)) & match_54);
+        uint match_68 = 
+            (eq_43 && (((sub_49 | 1) < 9) && eq_53)) ? match_23 :
+            0u;
+        int func_clamp_56 = clamp((((mul_48 + (sub_49 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_57 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_56 ^ 1), 0, sub_9))), 0).x;
+        bool eq_58 = (func_clamp_56 & 1) == 0;
+        uint match_59 = 
+            (eq_11 && eq_58) ? 1u :
+            0u;
+        uint bitwise_or_60 = (slice_57 & (~match_59)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_56, 0, sub_9))), 0).x)) & match_59);
+        int right_shift_61 = func_clamp_56 >> 1;
+        int right_shift_62 = (right_shift_61 * 3641) >> 15;
+        uint match_67 = 
+            (eq_58 && ((right_shift_62 & 1) == 1)) ? match_23 :
+            0u;
+        int mul_63 = right_shift_62 * 9;
+        int func_clamp_64 = clamp((((mul_63 + ((((right_shift_61 - mul_63) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_65 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_64 ^ 1), 0, sub_9))), 0).x;
+        uint match_66 = 
+            (eq_11 && ((func_clamp_64 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_39 ^ ((bitwise_xor_55 ^ ((bitwise_or_60 ^ (((slice_65 & (~match_66)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_64, 0, sub_9))), 0).x)) & match_66)) & match_67)) & match_68)) & match_69));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height9_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint slice_0 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_1 = x == 0;
+        bool eq_2 = (y & 1) == 0;
+        uint match_3 = 
+            (eq_1 && eq_2) ? 1u :
+            0u;
+        uint bitwise_or_4 = (slice_0 & (~match_3)) | ((~(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_3);
+        uint match_14 = 
+            eq_1 ? 4294967294u :
+            4294967295u;
+        int right_shift_5 = y >> 1;
+        int right_shift_6 = (right_shift_5 * 3641) >> 15;
+        bool eq_13 = (right_shift_6 & 1) == 1;
+        uint match_15 = 
+            (eq_2 && eq_13) ? match_14 :
+            0u;
+        int sub_9 = int(state_size.y) - 1;
+        int mul_7 = right_shift_6 * 9;
+        int sub_8 = right_shift_5 - mul_7;
+        int func_clamp_10 = clamp((((mul_7 + (((sub_8 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_11 = texelFetch(state, clamp(ivec2(x, (func_clamp_10 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_12 = 
+            (eq_1 && ((func_clamp_10 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_16 = bitwise_or_4 ^ (((slice_11 & (~match_12)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_10), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_12)) & match_15);
+        uint match_29 = 
+            (eq_2 && (((sub_8 | 1) < 9) && eq_13)) ? match_14 :
+            0u;
+        int func_clamp_17 = clamp((((mul_7 + (sub_8 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_18 = texelFetch(state, clamp(ivec2(x, (func_clamp_17 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_19 = (func_clamp_17 & 1) == 0;
+        uint match_20 = 
+            (eq_1 && eq_19) ? 1u :
+            0u;
+        uint bitwise_or_21 = (slice_18 & (~match_20)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_17), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_20);
+        int right_shift_22 = func_clamp_17 >> 1;
+        int right_shift_23 = (right_shift_22 * 3641) >> 15;
+        uint match_28 = 
+            (eq_19 && ((right_shift_23 & 1) == 1)) ? match_14 :
+            0u;
+        int mul_24 = right_shift_23 * 9;
+        int func_clamp_25 = clamp((((mul_24 + ((((right_shift_22 - mul_24) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_26 = texelFetch(state, clamp(ivec2(x, (func_clamp_25 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_27 = 
+            (eq_1 && ((func_clamp_25 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_30 = bitwise_xor_16 ^ ((bitwise_or_21 ^ (((slice_26 & (~match_27)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_25), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_27)) & match_28)) & match_29);
+        int add_31 = right_shift_6 + 1;
+        uint match_60 = 
+            (eq_2 && ((((add_31 | 1) - 1) < 9) && ((sub_8 & 1) == 0))) ? match_14 :
+            0u;
+        int func_clamp_32 = clamp(((((((add_31 ^ 1) - 1) * 9) + sub_8) * 2) + 1), 0, sub_9);
+        uint slice_33 = texelFetch(state, clamp(ivec2(x, (func_clamp_32 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_34 = (func_clamp_32 & 1) == 0;
+        uint match_35 = 
+            (eq_1 && eq_34) ? 1u :
+            0u;
+        uint bitwise_or_36 = (slice_33 & (~match_35)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_32), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_35);
+        int right_shift_37 = func_clamp_32 >> 1;
+        int right_shift_38 = (right_shift_37 * 3641) >> 15;
+        bool eq_44 = (right_shift_38 & 1) == 1;
+        uint match_45 = 
+            (eq_34 && eq_44) ? match_14 :
+            0u;
+        int mul_39 = right_shift_38 * 9;
+        int sub_40 = right_shift_37 - mul_39;
+        int func_clamp_41 = clamp((((mul_39 + (((sub_40 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_42 = texelFetch(state, clamp(ivec2(x, (func_clamp_41 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_43 = 
+            (eq_1 && ((func_clamp_41 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_46 = bitwise_or_36 ^ (((slice_42 & (~match_43)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_41), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_43)) & match_45);
+        uint match_59 = 
+            (eq_34 && (((sub_40 | 1) < 9) && eq_44)) ? match_14 :
+            0u;
+        int func_clamp_47 = clamp((((mul_39 + (sub_40 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_48 = texelFetch(state, clamp(ivec2(x, (func_clamp_47 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_49 = (func_clamp_47 & 1) == 0;
+        uint match_50 = 
+            (eq_1 && eq_49) ? 1u :
+            0u;
+        uint bitwise_or_51 = (slice_48 & (~match_50)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_47), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_50);
+        int right_shift_52 = func_clamp_47 >> 1;
+        int right_shift_53 = (right_shift_52 * 3641) >> 15;
+        uint match_58 = 
+            (eq_49 && ((right_shift_53 & 1) == 1)) ? match_14 :
+            0u;
+        int mul_54 = right_shift_53 * 9;
+        int func_clamp_55 = clamp((((mul_54 + ((((right_shift_52 - mul_54) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_56 = texelFetch(state, clamp(ivec2(x, (func_clamp_55 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_57 = 
+            (eq_1 && ((func_clamp_55 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_30 ^ ((bitwise_xor_46 ^ ((bitwise_or_51 ^ (((slice_56 & (~match_57)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_55), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_57)) & match_58)) & match_59)) & match_60));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height9_surface_width9_out_tile3x162_state_tile3x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        uint slice_2 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+        bool eq_3 = (x - (int(((float(x) + 0.5) * 0.3333333432674408)) * 3)) == 0;
+        bool eq_4 = (sub_1 & 1) == 0;
+        uint match_5 = 
+            (eq_3 && eq_4) ? 1u :
+            0u;
+        uint bitwise_or_6 = (slice_2 & (~match_5)) | ((~(texelFetch(state, ivec2(x, y), 0).x)) & match_5);
+        uint match_15 = 
+            eq_3 ? 4294967294u :
+            4294967295u;
+        int right_shift_7 = sub_1 >> 1;
+        int right_shift_8 = (right_shift_7 * 57) >> 9;
+        bool eq_14 = (right_shift_8 & 1) == 1;
+        uint match_16 = 
+            (eq_4 && eq_14) ? match_15 :
+            0u;
+        int mul_9 = right_shift_8 * 9;
+        int sub_10 = right_shift_7 - mul_9;
+        int func_clamp_11 = clamp((((mul_9 + (((sub_10 + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        uint slice_12 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_11 ^ 1))), 0).x;
+        uint match_13 = 
+            (eq_3 && ((func_clamp_11 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_17 = bitwise_or_6 ^ (((slice_12 & (~match_13)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_11)), 0).x)) & match_13)) & match_16);
+        uint match_30 = 
+            (eq_4 && (((sub_10 | 1) < 9) && eq_14)) ? match_15 :
+            0u;
+        int func_clamp_18 = clamp((((mul_9 + (sub_10 ^ 1)) * 2) + 1), 0, 161);
+        uint slice_19 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_18 ^ 1))), 0).x;
+        bool eq_20 = (func_clamp_18 & 1) == 0;
+        uint match_21 = 
+            (eq_3 && eq_20) ? 1u :
+            0u;
+        uint bitwise_or_22 = (slice_19 & (~match_21)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_18)), 0).x)) & match_21);
+        int right_shift_23 = func_clamp_18 >> 1;
+        int right_shift_24 = (right_shift_23 * 57) >> 9;
+        uint match_29 = 
+            (eq_20 && ((right_shift_24 & 1) == 1)) ? match_15 :
+            0u;
+        int mul_25 = right_shift_24 * 9;
+        int func_clamp_26 = clamp((((mul_25 + ((((right_shift_23 - mul_25) + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        uint slice_27 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_26 ^ 1))), 0).x;
+        uint match_28 = 
+            (eq_3 && ((func_clamp_26 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_31 = bitwise_xor_17 ^ ((bitwise_or_22 ^ (((slice_27 & (~match_28)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_26)), 0).x)) & match_28)) & match_29)) & match_30);
+        uint match_60 = 
+            (eq_4 && ((sub_10 & 1) == 0)) ? match_15 :
+            0u;
+        int func_clamp_32 = clamp((((((((right_shift_8 + 1) ^ 1) - 1) * 9) + sub_10) * 2) + 1), 0, 161);
+        uint slice_33 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_32 ^ 1))), 0).x;
+        bool eq_34 = (func_clamp_32 & 1) == 0;
+        uint match_35 = 
+            (eq_3 && eq_34) ? 1u :
+            0u;
+        uint bitwise_or_36 = (slice_33 & (~match_35)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_32)), 0).x)) & match_35);
+        int right_shift_37 = func_clamp_32 >> 1;
+        int right_shift_38 = (right_shift_37 * 57) >> 9;
+        bool eq_44 = (right_shift_38 & 1) == 1;
+        uint match_45 = 
+            (eq_34 && eq_44) ? match_15 :
+            0u;
+        int mul_39 = right_shift_38 * 9;
+        int sub_40 = right_shift_37 - mul_39;
+        int func_clamp_41 = clamp((((mul_39 + (((sub_40 + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        uint slice_42 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_41 ^ 1))), 0).x;
+        uint match_43 = 
+            (eq_3 && ((func_clamp_41 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_46 = bitwise_or_36 ^ (((slice_42 & (~match_43)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_41)), 0).x)) & match_43)) & match_45);
+        uint match_59 = 
+            (eq_34 && (((sub_40 | 1) < 9) && eq_44)) ? match_15 :
+            0u;
+        int func_clamp_47 = clamp((((mul_39 + (sub_40 ^ 1)) * 2) + 1), 0, 161);
+        uint slice_48 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_47 ^ 1))), 0).x;
+        bool eq_49 = (func_clamp_47 & 1) == 0;
+        uint match_50 = 
+            (eq_3 && eq_49) ? 1u :
+            0u;
+        uint bitwise_or_51 = (slice_48 & (~match_50)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_47)), 0).x)) & match_50);
+        int right_shift_52 = func_clamp_47 >> 1;
+        int right_shift_53 = (right_shift_52 * 57) >> 9;
+        uint match_58 = 
+            (eq_49 && ((right_shift_53 & 1) == 1)) ? match_15 :
+            0u;
+        int mul_54 = right_shift_53 * 9;
+        int func_clamp_55 = clamp((((mul_54 + ((((right_shift_52 - mul_54) + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        uint slice_56 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_55 ^ 1))), 0).x;
+        uint match_57 = 
+            (eq_3 && ((func_clamp_55 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_31 ^ ((bitwise_xor_46 ^ ((bitwise_or_51 ^ (((slice_56 & (~match_57)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_55)), 0).x)) & match_57)) & match_58)) & match_59)) & match_60));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int sub_9 = func_int_6 - 1;
+        int mod_8 = y % func_int_5;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((mod_8 ^ 1), 0, sub_9))), 0).x;
+        bool eq_11 = mod_3 == 0;
+        bool eq_12 = (mod_8 & 1) == 0;
+        uint match_13 = 
+            (eq_11 && eq_12) ? 1u :
+            0u;
+        uint bitwise_or_14 = (slice_10 & (~match_13)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x)) & match_13);
+        uint match_23 = 
+            eq_11 ? 4294967294u :
+            4294967295u;
+        int right_shift_15 = mod_8 >> 1;
+        int right_shift_16 = (right_shift_15 * 20165) >> 18;
+        bool eq_22 = (right_shift_16 & 1) == 1;
+        uint match_24 = 
+            (eq_12 && eq_22) ? match_23 :
+            0u;
+        int mul_17 = right_shift_16 * 13;
+        int sub_18 = right_shift_15 - mul_17;
+        int func_clamp_19 = clamp((((mul_17 + (((sub_18 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_20 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_19 ^ 1), 0, sub_9))), 0).x;
+        uint match_21 = 
+            (eq_11 && ((func_clamp_19 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_25 = bitwise_or_14 ^ (((slice_20 & (~match_21)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_19, 0, sub_9))), 0).x)) & match_21)) & match_24);
+        uint match_38 = 
+            (eq_12 && (((sub_18 | 1) < 13) && eq_22)) ? match_23 :
+            0u;
+        int func_clamp_26 = clamp((((mul_17 + (sub_18 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_27 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_26 ^ 1), 0, sub_9))), 0).x;
+        bool eq_28 = (func_clamp_26 & 1) == 0;
+        uint match_29 = 
+            (eq_11 && eq_28) ? 1u :
+            0u;
+        uint bitwise_or_30 = (slice_27 & (~match_29)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_26, 0, sub_9))), 0).x)) & match_29);
+        int right_shift_31 = func_clamp_26 >> 1;
+        int right_shift_32 = (right_shift_31 * 20165) >> 18;
+        uint match_37 = 
+            (eq_28 && ((right_shift_32 & 1) == 1)) ? match_23 :
+            0u;
+        int mul_33 = right_shift_32 * 13;
+        int func_clamp_34 = clamp((((mul_33 + ((((right_shift_31 - mul_33) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_35 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_34 ^ 1), 0, sub_9))), 0).x;
+        uint match_36 = 
+            (eq_11 && ((func_clamp_34 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_39 = bitwise_xor_25 ^ ((bitwise_or_30 ^ (((slice_35 & (~match_36)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_34, 0, sub_9))), 0).x)) & match_36)) & match_37)) & match_38);
+        int add_40 = right_shift_16 + 1;
+        uint match_69 = 
+            (eq_12 && ((((add_40 | 1) - 1) < 13) && ((sub_18 & 1) == 0))) ? match_23 :
+            0u;
+        int func_clamp_41 = clamp(((((((add_40 ^ 1) - 1) * 13) + sub_18) * 2) + 1), 0, sub_9);
+        uint slice_42 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_41 ^ 1), 0, sub_9))), 0).x;
+        bool eq_43 = (func_clamp_41 & 1) == 0;
+        uint match_44 = 
+            (eq_11 && eq_43) ? 1u :
+            0u;
+        uint bitwise_or_45 = (slice_42 & (~match_44)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_41, 0, sub_9))), 0).x)) & match_44);
+        int right_shift_46 = func_clamp_41 >> 1;
+        int right_shift_47 = (right_shift_46 * 20165) >> 18;
+        bool eq_53 = (right_shift_47 & 1) == 1;
+        uint match_54 = 
+            (eq_43 && eq_53) ? match_23 :
+            0u;
+        int mul_48 = right_shift_47 * 13;
+        int sub_49 = right_shift_46 - mul_48;
+        int func_clamp_50 = clamp((((mul_48 + (((sub_49 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_51 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_50 ^ 1), 0, sub_9))), 0).x;
+        uint match_52 = 
+            (eq_11 && ((func_clamp_50 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_55 = bitwise_or_45 ^ (((slice_51 & (~match_52)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_50, 0, sub_9))), 0).x)) & match_52)) & match_54);
+        uint match_68 = 
+            (eq_43 && (((sub_49 | 1) < 13) && eq_53)) ? match_23 :
+            0u;
+        int func_clamp_56 = clamp((((mul_48 + (sub_49 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_57 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_56 ^ 1), 0, sub_9))), 0).x;
+        bool eq_58 = (func_clamp_56 & 1) == 0;
+        uint match_59 = 
+            (eq_11 && eq_58) ? 1u :
+            0u;
+        uint bitwise_or_60 = (slice_57 & (~match_59)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_56, 0, sub_9))), 0).x)) & match_59);
+        int right_shift_61 = func_clamp_56 >> 1;
+        int right_shift_62 = (right_shift_61 * 20165) >> 18;
+        uint match_67 = 
+            (eq_58 && ((right_shift_62 & 1) == 1)) ? match_23 :
+            0u;
+        int mul_63 = right_shift_62 * 13;
+        int func_clamp_64 = clamp((((mul_63 + ((((right_shift_61 - mul_63) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_65 = texelFetch(state, ivec2(add_4, (mul_7 + clamp((func_clamp_64 ^ 1), 0, sub_9))), 0).x;
+        uint match_66 = 
+            (eq_11 && ((func_clamp_64 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_39 ^ ((bitwise_xor_55 ^ ((bitwise_or_60 ^ (((slice_65 & (~match_66)) | ((~(texelFetch(state, ivec2(add_4, (mul_7 + clamp(func_clamp_64, 0, sub_9))), 0).x)) & match_66)) & match_67)) & match_68)) & match_69));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height13_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint slice_0 = texelFetch(state, clamp(ivec2(x, (y ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_1 = x == 0;
+        bool eq_2 = (y & 1) == 0;
+        uint match_3 = 
+            (eq_1 && eq_2) ? 1u :
+            0u;
+        uint bitwise_or_4 = (slice_0 & (~match_3)) | ((~(texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_3);
+        uint match_14 = 
+            eq_1 ? 4294967294u :
+            4294967295u;
+        int right_shift_5 = y >> 1;
+        int right_shift_6 = (right_shift_5 * 20165) >> 18;
+        bool eq_13 = (right_shift_6 & 1) == 1;
+        uint match_15 = 
+            (eq_2 && eq_13) ? match_14 :
+            0u;
+        int sub_9 = int(state_size.y) - 1;
+        int mul_7 = right_shift_6 * 13;
+        int sub_8 = right_shift_5 - mul_7;
+        int func_clamp_10 = clamp((((mul_7 + (((sub_8 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_11 = texelFetch(state, clamp(ivec2(x, (func_clamp_10 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_12 = 
+            (eq_1 && ((func_clamp_10 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_16 = bitwise_or_4 ^ (((slice_11 & (~match_12)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_10), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_12)) & match_15);
+        uint match_29 = 
+            (eq_2 && (((sub_8 | 1) < 13) && eq_13)) ? match_14 :
+            0u;
+        int func_clamp_17 = clamp((((mul_7 + (sub_8 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_18 = texelFetch(state, clamp(ivec2(x, (func_clamp_17 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_19 = (func_clamp_17 & 1) == 0;
+        uint match_20 = 
+            (eq_1 && eq_19) ? 1u :
+            0u;
+        uint bitwise_or_21 = (slice_18 & (~match_20)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_17), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_20);
+        int right_shift_22 = func_clamp_17 >> 1;
+        int right_shift_23 = (right_shift_22 * 20165) >> 18;
+        uint match_28 = 
+            (eq_19 && ((right_shift_23 & 1) == 1)) ? match_14 :
+            0u;
+        int mul_24 = right_shift_23 * 13;
+        int func_clamp_25 = clamp((((mul_24 + ((((right_shift_22 - mul_24) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_26 = texelFetch(state, clamp(ivec2(x, (func_clamp_25 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_27 = 
+            (eq_1 && ((func_clamp_25 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_30 = bitwise_xor_16 ^ ((bitwise_or_21 ^ (((slice_26 & (~match_27)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_25), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_27)) & match_28)) & match_29);
+        int add_31 = right_shift_6 + 1;
+        uint match_60 = 
+            (eq_2 && ((((add_31 | 1) - 1) < 13) && ((sub_8 & 1) == 0))) ? match_14 :
+            0u;
+        int func_clamp_32 = clamp(((((((add_31 ^ 1) - 1) * 13) + sub_8) * 2) + 1), 0, sub_9);
+        uint slice_33 = texelFetch(state, clamp(ivec2(x, (func_clamp_32 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_34 = (func_clamp_32 & 1) == 0;
+        uint match_35 = 
+            (eq_1 && eq_34) ? 1u :
+            0u;
+        uint bitwise_or_36 = (slice_33 & (~match_35)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_32), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_35);
+        int right_shift_37 = func_clamp_32 >> 1;
+        int right_shift_38 = (right_shift_37 * 20165) >> 18;
+        bool eq_44 = (right_shift_38 & 1) == 1;
+        uint match_45 = 
+            (eq_34 && eq_44) ? match_14 :
+            0u;
+        int mul_39 = right_shift_38 * 13;
+        int sub_40 = right_shift_37 - mul_39;
+        int func_clamp_41 = clamp((((mul_39 + (((sub_40 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_42 = texelFetch(state, clamp(ivec2(x, (func_clamp_41 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_43 = 
+            (eq_1 && ((func_clamp_41 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_46 = bitwise_or_36 ^ (((slice_42 & (~match_43)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_41), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_43)) & match_45);
+        uint match_59 = 
+            (eq_34 && (((sub_40 | 1) < 13) && eq_44)) ? match_14 :
+            0u;
+        int func_clamp_47 = clamp((((mul_39 + (sub_40 ^ 1)) * 2) + 1), 0, sub_9);
+        uint slice_48 = texelFetch(state, clamp(ivec2(x, (func_clamp_47 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_49 = (func_clamp_47 & 1) == 0;
+        uint match_50 = 
+            (eq_1 && eq_49) ? 1u :
+            0u;
+        uint bitwise_or_51 = (slice_48 & (~match_50)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_47), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_50);
+        int right_shift_52 = func_clamp_47 >> 1;
+        int right_shift_53 = (right_shift_52 * 20165) >> 18;
+        uint match_58 = 
+            (eq_49 && ((right_shift_53 & 1) == 1)) ? match_14 :
+            0u;
+        int mul_54 = right_shift_53 * 13;
+        int func_clamp_55 = clamp((((mul_54 + ((((right_shift_52 - mul_54) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9);
+        uint slice_56 = texelFetch(state, clamp(ivec2(x, (func_clamp_55 ^ 1)), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        uint match_57 = 
+            (eq_1 && ((func_clamp_55 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_30 ^ ((bitwise_xor_46 ^ ((bitwise_or_51 ^ (((slice_56 & (~match_57)) | ((~(texelFetch(state, clamp(ivec2(x, func_clamp_55), ivec2(0), textureSize(state, 0) - 1), 0).x)) & match_57)) & match_58)) & match_59)) & match_60));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass0_surface_height13_surface_width13_out_tile6x338_state_tile6x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        uint slice_2 = texelFetch(state, ivec2(x, (mul_0 + (sub_1 ^ 1))), 0).x;
+        bool eq_3 = (x - (int(((float(x) + 0.5) * 0.1666666716337204)) * 6)) == 0;
+        bool eq_4 = (sub_1 & 1) == 0;
+        uint match_5 = 
+            (eq_3 && eq_4) ? 1u :
+            0u;
+        uint bitwise_or_6 = (slice_2 & (~match_5)) | ((~(texelFetch(state, ivec2(x, y), 0).x)) & match_5);
+        uint match_15 = 
+            eq_3 ? 4294967294u :
+            4294967295u;
+        int right_shift_7 = sub_1 >> 1;
+        int right_shift_8 = (right_shift_7 * 79) >> 10;
+        bool eq_14 = (right_shift_8 & 1) == 1;
+        uint match_16 = 
+            (eq_4 && eq_14) ? match_15 :
+            0u;
+        int mul_9 = right_shift_8 * 13;
+        int sub_10 = right_shift_7 - mul_9;
+        int func_clamp_11 = clamp((((mul_9 + (((sub_10 + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        uint slice_12 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_11 ^ 1))), 0).x;
+        uint match_13 = 
+            (eq_3 && ((func_clamp_11 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_17 = bitwise_or_6 ^ (((slice_12 & (~match_13)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_11)), 0).x)) & match_13)) & match_16);
+        uint match_30 = 
+            (eq_4 && (((sub_10 | 1) < 13) && eq_14)) ? match_15 :
+            0u;
+        int func_clamp_18 = clamp((((mul_9 + (sub_10 ^ 1)) * 2) + 1), 0, 337);
+        uint slice_19 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_18 ^ 1))), 0).x;
+        bool eq_20 = (func_clamp_18 & 1) == 0;
+        uint match_21 = 
+            (eq_3 && eq_20) ? 1u :
+            0u;
+        uint bitwise_or_22 = (slice_19 & (~match_21)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_18)), 0).x)) & match_21);
+        int right_shift_23 = func_clamp_18 >> 1;
+        int right_shift_24 = (right_shift_23 * 79) >> 10;
+        uint match_29 = 
+            (eq_20 && ((right_shift_24 & 1) == 1)) ? match_15 :
+            0u;
+        int mul_25 = right_shift_24 * 13;
+        int func_clamp_26 = clamp((((mul_25 + ((((right_shift_23 - mul_25) + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        uint slice_27 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_26 ^ 1))), 0).x;
+        uint match_28 = 
+            (eq_3 && ((func_clamp_26 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_31 = bitwise_xor_17 ^ ((bitwise_or_22 ^ (((slice_27 & (~match_28)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_26)), 0).x)) & match_28)) & match_29)) & match_30);
+        uint match_60 = 
+            (eq_4 && ((sub_10 & 1) == 0)) ? match_15 :
+            0u;
+        int func_clamp_32 = clamp((((((((right_shift_8 + 1) ^ 1) - 1) * 13) + sub_10) * 2) + 1), 0, 337);
+        uint slice_33 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_32 ^ 1))), 0).x;
+        bool eq_34 = (func_clamp_32 & 1) == 0;
+        uint match_35 = 
+            (eq_3 && eq_34) ? 1u :
+            0u;
+        uint bitwise_or_36 = (slice_33 & (~match_35)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_32)), 0).x)) & match_35);
+        int right_shift_37 = func_clamp_32 >> 1;
+        int right_shift_38 = (right_shift_37 * 79) >> 10;
+        bool eq_44 = (right_shift_38 & 1) == 1;
+        uint match_45 = 
+            (eq_34 && eq_44) ? match_15 :
+            0u;
+        int mul_39 = right_shift_38 * 13;
+        int sub_40 = right_shift_37 - mul_39;
+        int func_clamp_41 = clamp((((mul_39 + (((sub_40 + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        uint slice_42 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_41 ^ 1))), 0).x;
+        uint match_43 = 
+            (eq_3 && ((func_clamp_41 & 1) == 0)) ? 1u :
+            0u;
+        uint bitwise_xor_46 = bitwise_or_36 ^ (((slice_42 & (~match_43)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_41)), 0).x)) & match_43)) & match_45);
+        uint match_59 = 
+            (eq_34 && (((sub_40 | 1) < 13) && eq_44)) ? match_15 :
+            0u;
+        int func_clamp_47 = clamp((((mul_39 + (sub_40 ^ 1)) * 2) + 1), 0, 337);
+        uint slice_48 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_47 ^ 1))), 0).x;
+        bool eq_49 = (func_clamp_47 & 1) == 0;
+        uint match_50 = 
+            (eq_3 && eq_49) ? 1u :
+            0u;
+        uint bitwise_or_51 = (slice_48 & (~match_50)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_47)), 0).x)) & match_50);
+        int right_shift_52 = func_clamp_47 >> 1;
+        int right_shift_53 = (right_shift_52 * 79) >> 10;
+        uint match_58 = 
+            (eq_49 && ((right_shift_53 & 1) == 1)) ? match_15 :
+            0u;
+        int mul_54 = right_shift_53 * 13;
+        int func_clamp_55 = clamp((((mul_54 + ((((right_shift_52 - mul_54) + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        uint slice_56 = texelFetch(state, ivec2(x, (mul_0 + (func_clamp_55 ^ 1))), 0).x;
+        uint match_57 = 
+            (eq_3 && ((func_clamp_55 & 1) == 0)) ? 1u :
+            0u;
+        outColor = (bitwise_xor_31 ^ ((bitwise_xor_46 ^ ((bitwise_or_51 ^ (((slice_56 & (~match_57)) | ((~(texelFetch(state, ivec2(x, (mul_0 + func_clamp_55)), 0).x)) & match_57)) & match_58)) & match_59)) & match_60));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+registerLayered(surfaceCyclePackedPass0, surfaceCyclePackedPass0Layered);
+registerSingleShot(surfaceCyclePackedPass0, surfaceCyclePackedPass0SingleShot);
+registerVariant(surfaceCyclePackedPass0, {surface_height: 5, surface_width: 5}, surfaceCyclePackedPass0_surface_height5_surface_width5);
+registerLayered(surfaceCyclePackedPass0_surface_height5_surface_width5, surfaceCyclePackedPass0Layered);
+registerSingleShot(surfaceCyclePackedPass0_surface_height5_surface_width5, surfaceCyclePackedPass0_surface_height5_surface_width5SingleShot);
+registerVariant(surfaceCyclePackedPass0_surface_height5_surface_width5, {out_tile: [1, 50], state_tile: [1, 50]}, surfaceCyclePackedPass0_surface_height5_surface_width5_out_tile1x50_state_tile1x50);
+registerVariant(surfaceCyclePackedPass0, {surface_height: 9, surface_width: 9}, surfaceCyclePackedPass0_surface_height9_surface_width9);
+registerLayered(surfaceCyclePackedPass0_surface_height9_surface_width9, surfaceCyclePackedPass0Layered);
+registerSingleShot(surfaceCyclePackedPass0_surface_height9_surface_width9, surfaceCyclePackedPass0_surface_height9_surface_width9SingleShot);
+registerVariant(surfaceCyclePackedPass0_surface_height9_surface_width9, {out_tile: [3, 162], state_tile: [3, 162]}, surfaceCyclePackedPass0_surface_height9_surface_width9_out_tile3x162_state_tile3x162);
+registerVariant(surfaceCyclePackedPass0, {surface_height: 13, surface_width: 13}, surfaceCyclePackedPass0_surface_height13_surface_width13);
+registerLayered(surfaceCyclePackedPass0_surface_height13_surface_width13, surfaceCyclePackedPass0Layered);
+registerSingleShot(surfaceCyclePackedPass0_surface_height13_surface_width13, surfaceCyclePackedPass0_surface_height13_surface_width13SingleShot);
+registerVariant(surfaceCyclePackedPass0_surface_height13_surface_width13, {out_tile: [6, 338], state_tile: [6, 338]}, surfaceCyclePackedPass0_surface_height13_surface_width13_out_tile6x338_state_tile6x338);
+
+let surfaceCyclePackedPass1 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    uniform int surface_height;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_8 = int(state_tile.x);
+        int func_int_7 = int(out_tile.x);
+        int mul_9 = (x / func_int_7) * func_int_8;
+        int mod_10 = x % func_int_7;
+        int add_11 = mul_9 + clamp(mod_10, 0, (func_int_8 - 1));
+        int func_int_12 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_13 = (y / func_int_0) * func_int_12;
+        int mod_1 = y % func_int_0;
+        int sub_14 = func_int_12 - 1;
+        uint slice_15 = texelFetch(state, ivec2(add_11, (mul_13 + clamp(mod_1, 0, sub_14))), 0).x;
+        bool eq_17 = mod_10 == 0;
+        uint match_18 = 
+            eq_17 ? 4294967294u :
+            4294967295u;
+        bool eq_16 = (mod_1 & 1) == 0;
+        int right_shift_2 = mod_1 >> 1;
+        int divide_5 = right_shift_2 / surface_width;
+        int mod_3 = right_shift_2 % surface_width;
+        int bitwise_and_4 = mod_3 & 1;
+        uint match_19 = 
+            (eq_16 && (((divide_5 | 1) < surface_height) && (bitwise_and_4 == 0))) ? match_18 :
+            0u;
+        uint bitwise_xor_20 = slice_15 ^ ((texelFetch(state, ivec2(add_11, (mul_13 + clamp((((((divide_5 ^ 1) * surface_width) + mod_3) * 2) + 1), 0, sub_14))), 0).x) & match_19);
+        int bitwise_and_6 = divide_5 & 1;
+        uint match_29;
+        if ((bitwise_and_4 == bitwise_and_6)) {
+            match_29 = bitwise_xor_20;
+        } else {
+            int func_clamp_21 = clamp((mod_1 ^ 1), 0, sub_14);
+            uint slice_22 = texelFetch(state, ivec2(add_11, (mul_13 + clamp(func_clamp_21, 0, sub_14))), 0).x;
+            int right_shift_23 = func_clamp_21 >> 1;
+            int divide_24 = right_shift_23 / surface_width;
+            int mod_25 = right_shift_23 % surface_width;
+            uint match_26 = 
+            (((func_clamp_21 & 1) == 0) && (((divide_24 | 1) < surface_height) && ((mod_25 & 1) == 0))) ? match_18 :
+            0u;
+            uint bitwise_xor_27 = slice_22 ^ ((texelFetch(state, ivec2(add_11, (mul_13 + clamp((((((divide_24 ^ 1) * surface_width) + mod_25) * 2) + 1), 0, sub_14))), 0).x) & match_26);
+            uint match_28 = 
+            (eq_17 && eq_16) ? 1u :
+            0u;
+            match_29 = ((bitwise_xor_27 & (~match_28)) | ((~bitwise_xor_20) & match_28));
+        }
+        int mul_30 = divide_5 * surface_width;
+        int add_31 = mod_3 + 1;
+        int func_clamp_32 = clamp((((mul_30 + ((add_31 ^ 1) - 1)) * 2) + 1), 0, sub_14);
+        uint slice_37 = texelFetch(state, ivec2(add_11, (mul_13 + clamp(func_clamp_32, 0, sub_14))), 0).x;
+        bool eq_38 = (func_clamp_32 & 1) == 0;
+        int right_shift_33 = func_clamp_32 >> 1;
+        int divide_36 = right_shift_33 / surface_width;
+        int mod_34 = right_shift_33 % surface_width;
+        int bitwise_and_35 = mod_34 & 1;
+        uint match_39 = 
+            (eq_38 && (((divide_36 | 1) < surface_height) && (bitwise_and_35 == 0))) ? match_18 :
+            0u;
+        uint bitwise_xor_40 = slice_37 ^ ((texelFetch(state, ivec2(add_11, (mul_13 + clamp((((((divide_36 ^ 1) * surface_width) + mod_34) * 2) + 1), 0, sub_14))), 0).x) & match_39);
+        uint match_49;
+        if ((bitwise_and_35 == (divide_36 & 1))) {
+            match_49 = bitwise_xor_40;
+        } else {
+            int func_clamp_41 = clamp((func_clamp_32 ^ 1), 0, sub_14);
+            uint slice_42 = texelFetch(state, ivec2(add_11, (mul_13 + clamp(func_clamp_41, 0, sub_14))), 0).x;
+            int right_shift_43 = func_clamp_41 >> 1;
+            int divide_44 = right_shift_43 / surface_width;
+            int mod_45 = right_shift_43 % surface_width;
+            uint match_46 = 
+            (((func_clamp_41 & 1) == 0) && (((divide_44 | 1) < surface_height) && ((mod_45 & 1) == 0))) ? match_18 :
+            0u;
+            uint bitwise_xor_47 = slice_42 ^ ((texelFetch(state, ivec2(add_11, (mul_13 + clamp((((((divide_44 ^ 1) * surface_width) + mod_45) * 2) + 1), 0, sub_14))), 0).x) & match_46);
+            uint match_48 = 
+            (eq_17 && eq_38) ? 1u :
+            0u;
+            match_49 = ((bitwise_xor_47 & (~match_48)) | ((~bitwise_xor_40) & match_48));
+        }
+        bool eq_50 = bitwise_and_6 == 0;
+        uint match_51 = 
+            (eq_16 && ((((add_31 | 1) - 1) < surface_width) && eq_50)) ? match_18 :
+            0u;
+        uint bitwise_xor_52 = match_29 ^ (match_49 & match_51);
+        uint match_93 = 
+            (eq_16 && (((mod_3 | 1) < surface_width) && eq_50)) ? match_18 :
+            0u;
+        int func_clamp_53 = clamp((((mul_30 + (mod_3 ^ 1)) * 2) + 1), 0, sub_14);
+        uint slice_59 = texelFetch(state, ivec2(add_11, (mul_13 + clamp(func_clamp_53, 0, sub_14))), 0).x;
+        bool eq_60 = (func_clamp_53 & 1) == 0;
+        int right_shift_54 = func_clamp_53 >> 1;
+        int divide_57 = right_shift_54 / surface_width;
+        int mod_55 = right_shift_54 % surface_width;
+        int bitwise_and_56 = mod_55 & 1;
+        uint match_61 = 
+            (eq_60 && (((divide_57 | 1) < surface_height) && (bitwise_and_56 == 0))) ? match_18 :
+            0u;
+        uint bitwise_xor_62 = slice_59 ^ ((texelFetch(state, ivec2(add_11, (mul_13 + clamp((((((divide_57 ^ 1) * surface_width) + mod_55) * 2) + 1), 0, sub_14))), 0).x) & match_61);
+        int bitwise_and_58 = divide_57 & 1;
+        uint match_71;
+        if ((bitwise_and_56 == bitwise_and_58)) {
+            match_71 = bitwise_xor_62;
+        } else {
+            int func_clamp_63 = clamp((func_clamp_53 ^ 1), 0, sub_14);
+            uint slice_64 = texelFetch(state, ivec2(add_11, (mul_13 + clamp(func_clamp_63, 0, sub_14))), 0).x;
+            int right_shift_65 = func_clamp_63 >> 1;
+            int divide_66 = right_shift_65 / surface_width;
+            int mod_67 = right_shift_65 % surface_width;
+            uint match_68 = 
+            (((func_clamp_63 & 1) == 0) && (((divide_66 | 1) < surface_height) && ((mod_67 & 1) == 0))) ? match_18 :
+            0u;
+            uint bitwise_xor_69 = slice_64 ^ ((texelFetch(state, ivec2(add_11, (mul_13 + clamp((((((divide_66 ^ 1) * surface_width) + mod_67) * 2) + 1), 0, sub_14))), 0).x) & match_68);
+            uint match_70 = 
+            (eq_17 && eq_60) ? 1u :
+            0u;
+            match_71 = ((bitwise_xor_69 & (~match_70)) | ((~bitwise_xor_62) & match_70));
+        }
+        int mul_72 = divide_57 * surface_width;
+        int add_73 = mod_55 + 1;
+        int func_clamp_74 = clamp((((mul_72 + ((add_73 ^ 1) - 1)) * 2) + 1), 0, sub_14);
+        uint slice_79 = texelFetch(state, ivec2(add_11, (mul_13 + clamp(func_clamp_74, 0, sub_14))), 0).x;
+        bool eq_80 = (func_clamp_74 & 1) == 0;
+        int right_shift_75 = func_clamp_74 >> 1;
+        int divide_78 = right_shift_75 / surface_width;
+        int mod_76 = right_shift_75 % surface_width;
+        int bitwise_and_77 = mod_76 & 1;
+        uint match_81 = 
+            (eq_80 && (((divide_78 | 1) < surface_height) && (bitwise_and_77 == 0))) ? match_18 :
+            0u;
+        uint bitwise_xor_82 = slice_79 ^ ((texelFetch(state, ivec2(add_11, (mul_13 + clamp((((((divide_78 ^ 1) * surface_width) + mod_76) * 2) + 1), 0, sub_14))), 0).x) & match_81);
+        uint match_91;
+        if ((bitwise_and_77 == (divide_78 & 1))) {
+            match_91 = bitwise_xor_82;
+        } else {
+            int func_clamp_83 = clamp((func_clamp_74 ^ 1), 0, sub_14);
+            uint slice_84 = texelFetch(state, ivec2(add_11, (mul_13 + clamp(func_clamp_83, 0, sub_14))), 0).x;
+            int right_shift_85 = func_clamp_83 >> 1;
+            int divide_86 = right_shift_85 / surface_width;
+            int mod_87 = right_shift_85 % surface_width;
+            uint match_88 = 
+            (((func_clamp_83 & 1) == 0) && (((divide_86 | 1) < surface_height) && ((mod_87 & 1) == 0))) ? match_18 :
+            0u;
+            uint bitwise_xor_89 = slice_84 ^ ((texelFetch(state, ivec2(add_11, (mul_13 + clamp((((((divide_86 ^ 1) * surface_width) + mod_87) * 2) + 1), 0, sub_14))), 0).x) & match_88);
+            uint match_90 = 
+            (eq_17 && eq_80) ? 1u :
+            0u;
+            match_91 = ((bitwise_xor_89 & (~match_90)) | ((~bitwise_xor_82) & match_90));
+        }
+        uint match_92 = 
+            (eq_60 && ((((add_73 | 1) - 1) < surface_width) && (bitwise_and_58 == 0))) ? match_18 :
+            0u;
+        outColor = (bitwise_xor_52 ^ ((match_71 ^ (match_91 & match_92)) & match_93));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp usampler2DArray state;
+    uniform int surface_height;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_10 = int(state_tile.x);
+        int add_8 = x + int(out_origin.x);
+        int func_int_9 = int(out_tile.x);
+        int mul_11 = (add_8 / func_int_9) * func_int_10;
+        int mod_12 = add_8 % func_int_9;
+        int add_13 = mul_11 + clamp(mod_12, 0, (func_int_10 - 1));
+        int func_int_14 = int(state_size.x);
+        int func_clamp_15 = clamp(add_13, 0, (func_int_14 - 1));
+        int func_int_16 = int(state_layer.x);
+        int mod_17 = func_clamp_15 % func_int_16;
+        int sub_21 = int(state_size.y) - 1;
+        int func_int_18 = int(state_tile.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mul_19 = (add_0 / func_int_1) * func_int_18;
+        int mod_2 = add_0 % func_int_1;
+        int sub_20 = func_int_18 - 1;
+        int func_clamp_22 = clamp((mul_19 + clamp(mod_2, 0, sub_20)), 0, sub_21);
+        int func_int_23 = int(state_layer.y);
+        int mod_24 = func_clamp_22 % func_int_23;
+        int divide_26 = func_clamp_15 / func_int_16;
+        int divide_25 = ((func_int_14 + func_int_16) - 1) / func_int_16;
+        uint fetch_27 = texelFetch(state, ivec3(mod_17, mod_24, (((func_clamp_22 / func_int_23) * divide_25) + divide_26)), 0).x;
+        bool eq_30 = mod_12 == 0;
+        uint match_31 = 
+            eq_30 ? 4294967294u :
+            4294967295u;
+        bool eq_29 = (mod_2 & 1) == 0;
+        int right_shift_3 = mod_2 >> 1;
+        int divide_6 = right_shift_3 / surface_width;
+        int mod_4 = right_shift_3 % surface_width;
+        int bitwise_and_5 = mod_4 & 1;
+        uint match_32 = 
+            (eq_29 && (((divide_6 | 1) < surface_height) && (bitwise_and_5 == 0))) ? match_31 :
+            0u;
+        int func_clamp_28 = clamp((mul_19 + clamp((((((divide_6 ^ 1) * surface_width) + mod_4) * 2) + 1), 0, sub_20)), 0, sub_21);
+        uint bitwise_xor_33 = fetch_27 ^ ((texelFetch(state, ivec3(mod_17, (func_clamp_28 % func_int_23), (((func_clamp_28 / func_int_23) * divide_25) + divide_26)), 0).x) & match_32);
+        int bitwise_and_7 = divide_6 & 1;
+        uint match_44;
+        if ((bitwise_and_5 == bitwise_and_7)) {
+            match_44 = bitwise_xor_33;
+        } else {
+            int func_clamp_34 = clamp((mod_2 ^ 1), 0, sub_20);
+            int func_clamp_35 = clamp((mul_19 + clamp(func_clamp_34, 0, sub_20)), 0, sub_21);
+            uint fetch_36 = texelFetch(state, ivec3(mod_17, (func_clamp_35 % func_int_23), (((func_clamp_35 / func_int_23) * divide_25) + divide_26)), 0).x;
+            int right_shift_37 = func_clamp_34 >> 1;
+            int divide_38 = right_shift_37 / surface_width;
+            int mod_39 = right_shift_37 % surface_width;
+            uint match_41 = 
+            (((func_clamp_34 & 1) == 0) && (((divide_38 | 1) < surface_height) && ((mod_39 & 1) == 0))) ? match_31 :
+            0u;
+            int func_clamp_40 = clamp((mul_19 + clamp((((((divide_38 ^ 1) * surface_width) + mod_39) * 2) + 1), 0, sub_20)), 0, sub_21);
+            uint bitwise_xor_42 = fetch_36 ^ ((texelFetch(state, ivec3(mod_17, (func_clamp_40 % func_int_23), (((func_clamp_40 / func_int_23) * divide_25) + divide_26)), 0).x) & match_41);
+            uint match_43 = 
+            (eq_30 && eq_29) ? 1u :
+            0u;
+            match_44 = ((bitwise_xor_42 & (~match_43)) | ((~bitwise_xor_33) & match_43));
+        }
+        int mul_45 = divide_6 * surface_width;
+        int add_46 = mod_4 + 1;
+        int func_clamp_47 = clamp((((mul_45 + ((add_46 ^ 1) - 1)) * 2) + 1), 0, sub_20);
+        int func_clamp_52 = clamp((mul_19 + clamp(func_clamp_47, 0, sub_20)), 0, sub_21);
+        uint fetch_53 = texelFetch(state, ivec3(mod_17, (func_clamp_52 % func_int_23), (((func_clamp_52 / func_int_23) * divide_25) + divide_26)), 0).x;
+        bool eq_55 = (func_clamp_47 & 1) == 0;
+        int right_shift_48 = func_clamp_47 >> 1;
+        int divide_51 = right_shift_48 / surface_width;
+        int mod_49 = right_shift_48 % surface_width;
+        int bitwise_and_50 = mod_49 & 1;
+        uint match_56 = 
+            (eq_55 && (((divide_51 | 1) < surface_height) && (bitwise_and_50 == 0))) ? match_31 :
+            0u;
+        int func_clamp_54 = clamp((mul_19 + clamp((((((divide_51 ^ 1) * surface_width) + mod_49) * 2) + 1), 0, sub_20)), 0, sub_21);
+        uint bitwise_xor_57 = fetch_53 ^ ((texelFetch(state, ivec3(mod_17, (func_clamp_54 % func_int_23), (((func_clamp_54 / func_int_23) * divide_25) + divide_26)), 0).x) & match_56);
+        uint match_68;
+        if ((bitwise_and_50 == (divide_51 & 1))) {
+            match_68 = bitwise_xor_57;
+        } else {
+            int func_clamp_58 = clamp((func_clamp_47 ^ 1), 0, sub_20);
+            int func_clamp_59 = clamp((mul_19 + clamp(func_clamp_58, 0, sub_20)), 0, sub_21);
+            uint fetch_60 = texelFetch(state, ivec3(mod_17, (func_clamp_59 % func_int_23), (((func_clamp_59 / func_int_23) * divide_25) + divide_26)), 0).x;
+            int right_shift_61 = func_clamp_58 >> 1;
+            int divide_62 = right_shift_61 / surface_width;
+            int mod_63 = right_shift_61 % surface_width;
+            uint match_65 = 
+            (((func_clamp_58 & 1) == 0) && (((divide_62 | 1) < surface_height) && ((mod_63 & 1) == 0))) ? match_31 :
+            0u;
+            int func_clamp_64 = clamp((mul_19 + clamp((((((divide_62 ^ 1) * surface_width) + mod_63) * 2) + 1), 0, sub_20)), 0, sub_21);
+            uint bitwise_xor_66 = fetch_60 ^ ((texelFetch(state, ivec3(mod_17, (func_clamp_64 % func_int_23), (((func_clamp_64 / func_int_23) * divide_25) + divide_26)), 0).x) & match_65);
+            uint match_67 = 
+            (eq_30 && eq_55) ? 1u :
+            0u;
+            match_68 = ((bitwise_xor_66 & (~match_67)) | ((~bitwise_xor_57) & match_67));
+        }
+        bool eq_69 = bitwise_and_7 == 0;
+        uint match_70 = 
+            (eq_29 && ((((add_46 | 1) - 1) < surface_width) && eq_69)) ? match_31 :
+            0u;
+        uint bitwise_xor_71 = match_44 ^ (match_68 & match_70);
+        uint match_120 = 
+            (eq_29 && (((mod_4 | 1) < surface_width) && eq_69)) ? match_31 :
+            0u;
+        int func_clamp_72 = clamp((((mul_45 + (mod_4 ^ 1)) * 2) + 1), 0, sub_20);
+        int func_clamp_78 = clamp((mul_19 + clamp(func_clamp_72, 0, sub_20)), 0, sub_21);
+        uint fetch_79 = texelFetch(state, ivec3(mod_17, (func_clamp_78 % func_int_23), (((func_clamp_78 / func_int_23) * divide_25) + divide_26)), 0).x;
+        bool eq_81 = (func_clamp_72 & 1) == 0;
+        int right_shift_73 = func_clamp_72 >> 1;
+        int divide_76 = right_shift_73 / surface_width;
+        int mod_74 = right_shift_73 % surface_width;
+        int bitwise_and_75 = mod_74 & 1;
+        uint match_82 = 
+            (eq_81 && (((divide_76 | 1) < surface_height) && (bitwise_and_75 == 0))) ? match_31 :
+            0u;
+        int func_clamp_80 = clamp((mul_19 + clamp((((((divide_76 ^ 1) * surface_width) + mod_74) * 2) + 1), 0, sub_20)), 0, sub_21);
+        uint bitwise_xor_83 = fetch_79 ^ ((texelFetch(state, ivec3(mod_17, (func_clamp_80 % func_int_23), (((func_clamp_80 / func_int_23) * divide_25) + divide_26)), 0).x) & match_82);
+        int bitwise_and_77 = divide_76 & 1;
+        uint match_94;
+        if ((bitwise_and_75 == bitwise_and_77)) {
+            match_94 = bitwise_xor_83;
+        } else {
+            int func_clamp_84 = clamp((func_clamp_72 ^ 1), 0, sub_20);
+            int func_clamp_85 = clamp((mul_19 + clamp(func_clamp_84, 0, sub_20)), 0, sub_21);
+            uint fetch_86 = texelFetch(state, ivec3(mod_17, (func_clamp_85 % func_int_23), (((func_clamp_85 / func_int_23) * divide_25) + divide_26)), 0).x;
+            int right_shift_87 = func_clamp_84 >> 1;
+            int divide_88 = right_shift_87 / surface_width;
+            int mod_89 = right_shift_87 % surface_width;
+            uint match_91 = 
+            (((func_clamp_84 & 1) == 0) && (((divide_88 | 1) < surface_height) && ((mod_89 & 1) == 0))) ? match_31 :
+            0u;
+            int func_clamp_90 = clamp((mul_19 + clamp((((((divide_88 ^ 1) * surface_width) + mod_89) * 2) + 1), 0, sub_20)), 0, sub_21);
+            uint bitwise_xor_92 = fetch_86 ^ ((texelFetch(state, ivec3(mod_17, (func_clamp_90 % func_int_23), (((func_clamp_90 / func_int_23) * divide_25) + divide_26)), 0).x) & match_91);
+            uint match_93 = 
+            (eq_30 && eq_81) ? 1u :
+            0u;
+            match_94 = ((bitwise_xor_92 & (~match_93)) | ((~bitwise_xor_83) & match_93));
+        }
+        int mul_95 = divide_76 * surface_width;
+        int add_96 = mod_74 + 1;
+        int func_clamp_97 = clamp((((mul_95 + ((add_96 ^ 1) - 1)) * 2) + 1), 0, sub_20);
+        int func_clamp_102 = clamp((mul_19 + clamp(func_clamp_97, 0, sub_20)), 0, sub_21);
+        uint fetch_103 = texelFetch(state, ivec3(mod_17, (func_clamp_102 % func_int_23), (((func_clamp_102 / func_int_23) * divide_25) + divide_26)), 0).x;
+        bool eq_105 = (func_clamp_97 & 1) == 0;
+        int right_shift_98 = func_clamp_97 >> 1;
+        int divide_101 = right_shift_98 / surface_width;
+        int mod_99 = right_shift_98 % surface_width;
+        int bitwise_and_100 = mod_99 & 1;
+        uint match_106 = 
+            (eq_105 && (((divide_101 | 1) < surface_height) && (bitwise_and_100 == 0))) ? match_31 :
+            0u;
+        int func_clamp_104 = clamp((mul_19 + clamp((((((divide_101 ^ 1) * surface_width) + mod_99) * 2) + 1), 0, sub_20)), 0, sub_21);
+        uint bitwise_xor_107 = fetch_103 ^ ((texelFetch(state, ivec3(mod_17, (func_clamp_104 % func_int_23), (((func_clamp_104 / func_int_23) * divide_25) + divide_26)), 0).x) & match_106);
+        uint match_118;
+        if ((bitwise_and_100 == (divide_101 & 1))) {
+            match_118 = bitwise_xor_107;
+        } else {
+            int func_clamp_108 = clamp((func_clamp_97 ^ 1), 0, sub_20);
+            int func_clamp_109 = clamp((mul_19 + clamp(func_clamp_108, 0, sub_20)), 0, sub_21);
+            uint fetch_110 = texelFetch(state, ivec3(mod_17, (func_clamp_109 % func_int_23), (((func_clamp_109 / func_int_23) * divide_25) + divide_26)), 0).x;
+            int right_shift_111 = func_clamp_108 >> 1;
+            int divide_112 = right_shift_111 / surface_width;
+            int mod_113 = right_shift_111 % surface_width;
+            uint match_115 = 
+            (((func_clamp_108 & 1) == 0) && (((divide_112 | 1) < surface_height) && ((mod_113 & 1) == 0))) ? match_31 :
+            0u;
+            int func_clamp_114 = clamp((mul_19 + clamp((((((divide_112 ^ 1) * surface_width) + mod_113) * 2) + 1), 0, sub_20)), 0, sub_21);
+            uint bitwise_xor_116 = fetch_110 ^ ((texelFetch(state, ivec3(mod_17, (func_clamp_114 % func_int_23), (((func_clamp_114 / func_int_23) * divide_25) + divide_26)), 0).x) & match_115);
+            uint match_117 = 
+            (eq_30 && eq_105) ? 1u :
+            0u;
+            match_118 = ((bitwise_xor_116 & (~match_117)) | ((~bitwise_xor_107) & match_117));
+        }
+        uint match_119 = 
+            (eq_81 && ((((add_96 | 1) - 1) < surface_width) && (bitwise_and_77 == 0))) ? match_31 :
+            0u;
+        outColor = (bitwise_xor_71 ^ ((match_94 ^ (match_118 & match_119)) & match_120));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCyclePackedPass1SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int surface_width;
+    uniform highp usampler2D state;
+    uniform int surface_height;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int sub_10 = int(state_size.y) - 1;
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_6 = x == 0;
+        uint match_7 = 
+            eq_6 ? 4294967294u :
+            4294967295u;
+        bool eq_5 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int divide_3 = right_shift_0 / surface_width;
+        int mod_1 = right_shift_0 % surface_width;
+        int bitwise_and_2 = mod_1 & 1;
+        uint match_8 = 
+            (eq_5 && (((divide_3 | 1) < surface_height) && (bitwise_and_2 == 0))) ? match_7 :
+            0u;
+        uint bitwise_xor_9 = v_state ^ ((texelFetch(state, clamp(ivec2(x, (((((divide_3 ^ 1) * surface_width) + mod_1) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_8);
+        int bitwise_and_4 = divide_3 & 1;
+        uint match_19;
+        if ((bitwise_and_2 == bitwise_and_4)) {
+            match_19 = bitwise_xor_9;
+        } else {
+            int func_clamp_11 = clamp((y ^ 1), 0, sub_10);
+            uint slice_12 = texelFetch(state, clamp(ivec2(x, func_clamp_11), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_13 = func_clamp_11 >> 1;
+            int divide_14 = right_shift_13 / surface_width;
+            int mod_15 = right_shift_13 % surface_width;
+            uint match_16 = 
+            (((func_clamp_11 & 1) == 0) && (((divide_14 | 1) < surface_height) && ((mod_15 & 1) == 0))) ? match_7 :
+            0u;
+            uint bitwise_xor_17 = slice_12 ^ ((texelFetch(state, clamp(ivec2(x, (((((divide_14 ^ 1) * surface_width) + mod_15) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_16);
+            uint match_18 = 
+            (eq_6 && eq_5) ? 1u :
+            0u;
+            match_19 = ((bitwise_xor_17 & (~match_18)) | ((~bitwise_xor_9) & match_18));
+        }
+        int mul_20 = divide_3 * surface_width;
+        int add_21 = mod_1 + 1;
+        int func_clamp_22 = clamp((((mul_20 + ((add_21 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        uint slice_27 = texelFetch(state, clamp(ivec2(x, func_clamp_22), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_28 = (func_clamp_22 & 1) == 0;
+        int right_shift_23 = func_clamp_22 >> 1;
+        int divide_26 = right_shift_23 / surface_width;
+        int mod_24 = right_shift_23 % surface_width;
+        int bitwise_and_25 = mod_24 & 1;
+        uint match_29 = 
+            (eq_28 && (((divide_26 | 1) < surface_height) && (bitwise_and_25 == 0))) ? match_7 :
+            0u;
+        uint bitwise_xor_30 = slice_27 ^ ((texelFetch(state, clamp(ivec2(x, (((((divide_26 ^ 1) * surface_width) + mod_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_29);
+        uint match_39;
+        if ((bitwise_and_25 == (divide_26 & 1))) {
+            match_39 = bitwise_xor_30;
+        } else {
+            int func_clamp_31 = clamp((func_clamp_22 ^ 1), 0, sub_10);
+            uint slice_32 = texelFetch(state, clamp(ivec2(x, func_clamp_31), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_33 = func_clamp_31 >> 1;
+            int divide_34 = right_shift_33 / surface_width;
+            int mod_35 = right_shift_33 % surface_width;
+            uint match_36 = 
+            (((func_clamp_31 & 1) == 0) && (((divide_34 | 1) < surface_height) && ((mod_35 & 1) == 0))) ? match_7 :
+            0u;
+            uint bitwise_xor_37 = slice_32 ^ ((texelFetch(state, clamp(ivec2(x, (((((divide_34 ^ 1) * surface_width) + mod_35) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_36);
+            uint match_38 = 
+            (eq_6 && eq_28) ? 1u :
+            0u;
+            match_39 = ((bitwise_xor_37 & (~match_38)) | ((~bitwise_xor_30) & match_38));
+        }
+        bool eq_40 = bitwise_and_4 == 0;
+        uint match_41 = 
+            (eq_5 && ((((add_21 | 1) - 1) < surface_width) && eq_40)) ? match_7 :
+            0u;
+        uint bitwise_xor_42 = match_19 ^ (match_39 & match_41);
+        uint match_83 = 
+            (eq_5 && (((mod_1 | 1) < surface_width) && eq_40)) ? match_7 :
+            0u;
+        int func_clamp_43 = clamp((((mul_20 + (mod_1 ^ 1)) * 2) + 1), 0, sub_10);
+        uint slice_49 = texelFetch(state, clamp(ivec2(x, func_clamp_43), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_50 = (func_clamp_43 & 1) == 0;
+        int right_shift_44 = func_clamp_43 >> 1;
+        int divide_47 = right_shift_44 / surface_width;
+        int mod_45 = right_shift_44 % surface_width;
+        int bitwise_and_46 = mod_45 & 1;
+        uint match_51 = 
+            (eq_50 && (((divide_47 | 1) < surface_height) && (bitwise_and_46 == 0))) ? match_7 :
+            0u;
+        uint bitwise_xor_52 = slice_49 ^ ((texelFetch(state, clamp(ivec2(x, (((((divide_47 ^ 1) * surface_width) + mod_45) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_51);
+        int bitwise_and_48 = divide_47 & 1;
+        uint match_61;
+        if ((bitwise_and_46 == bitwise_and_48)) {
+            match_61 = bitwise_xor_52;
+        } else {
+            int func_clamp_53 = clamp((func_clamp_43 ^ 1), 0, sub_10);
+            uint slice_54 = texelFetch(state, clamp(ivec2(x, func_clamp_53), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_55 = func_clamp_53 >> 1;
+            int divide_56 = right_shift_55 / surface_width;
+            int mod_57 = right_shift_55 % surface_width;
+            uint match_58 = 
+            (((func_clamp_53 & 1) == 0) && (((divide_56 | 1) < surface_height) && ((mod_57 & 1) == 0))) ? match_7 :
+            0u;
+            uint bitwise_xor_59 = slice_54 ^ ((texelFetch(state, clamp(ivec2(x, (((((divide_56 ^ 1) * surface_width) + mod_57) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_58);
+            uint match_60 = 
+            (eq_6 && eq_50) ? 1u :
+            0u;
+            match_61 = ((bitwise_xor_59 & (~match_60)) | ((~bitwise_xor_52) & match_60));
+        }
+        int mul_62 = divide_47 * surface_width;
+        int add_63 = mod_45 + 1;
+        int func_clamp_64 = clamp((((mul_62 + ((add_63 ^ 1) - 1)) * 2) + 1), 0, sub_10);
+        uint slice_69 = texelFetch(state, clamp(ivec2(x, func_clamp_64), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_70 = (func_clamp_64 & 1) == 0;
+        int right_shift_65 = func_clamp_64 >> 1;
+        int divide_68 = right_shift_65 / surface_width;
+        int mod_66 = right_shift_65 % surface_width;
+        int bitwise_and_67 = mod_66 & 1;
+        uint match_71 = 
+            (eq_70 && (((divide_68 | 1) < surface_height) && (bitwise_and_67 == 0))) ? match_7 :
+            0u;
+        uint bitwise_xor_72 = slice_69 ^ ((texelFetch(state, clamp(ivec2(x, (((((divide_68 ^ 1) * surface_width) + mod_66) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_71);
+        uint match_81;
+        if ((bitwise_and_67 == (divide_68 & 1))) {
+            match_81 = bitwise_xor_72;
+        } else {
+            int func_clamp_73 = clamp((func_clamp_64 ^ 1), 0, sub_10);
+            uint slice_74 = texelFetch(state, clamp(ivec2(x, func_clamp_73), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_75 = func_clamp_73 >> 1;
+            int divide_76 = right_shift_75 / surface_width;
+            int mod_77 = right_shift_75 % surface_width;
+            uint match_78 = 
+            (((func_clamp_73 & 1) == 0) && (((divide_76 | 1) < surface_height) && ((mod_77 & 1) == 0))) ? match_7 :
+            0u;
+            uint bitwise_xor_79 = slice_74 ^ ((texelFetch(state, clamp(ivec2(x, (((((divide_76 ^ 1) * surface_width) + mod_77) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_78);
+            uint match_80 = 
+            (eq_6 && eq_70) ? 1u :
+            0u;
+            match_81 = ((bitwise_xor_79 & (~match_80)) | ((~bitwise_xor_72) & match_80));
+        }
+        uint match_82 = 
+            (eq_50 && ((((add_63 | 1) - 1) < surface_width) && (bitwise_and_48 == 0))) ? match_7 :
+            0u;
+        outColor = (bitwise_xor_42 ^ ((match_61 ^ (match_81 & match_82)) & match_83));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_9 = int(state_tile.x);
+        int func_int_8 = int(out_tile.x);
+        int mul_10 = (x / func_int_8) * func_int_9;
+        int mod_11 = x % func_int_8;
+        int add_12 = mul_10 + clamp(mod_11, 0, (func_int_9 - 1));
+        int func_int_13 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_14 = (y / func_int_0) * func_int_13;
+        int mod_1 = y % func_int_0;
+        int sub_15 = func_int_13 - 1;
+        uint slice_16 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(mod_1, 0, sub_15))), 0).x;
+        bool eq_18 = mod_11 == 0;
+        uint match_19 = 
+            eq_18 ? 4294967294u :
+            4294967295u;
+        bool eq_17 = (mod_1 & 1) == 0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 26215) >> 17;
+        int mul_4 = right_shift_3 * 5;
+        int sub_5 = right_shift_2 - mul_4;
+        int bitwise_and_6 = sub_5 & 1;
+        uint match_20 = 
+            (eq_17 && (((right_shift_3 | 1) < 5) && (bitwise_and_6 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_21 = slice_16 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_3 ^ 1) * 5) + sub_5) * 2) + 1), 0, sub_15))), 0).x) & match_20);
+        int bitwise_and_7 = right_shift_3 & 1;
+        uint match_30;
+        if ((bitwise_and_6 == bitwise_and_7)) {
+            match_30 = bitwise_xor_21;
+        } else {
+            int func_clamp_22 = clamp((mod_1 ^ 1), 0, sub_15);
+            uint slice_23 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_22, 0, sub_15))), 0).x;
+            int right_shift_24 = func_clamp_22 >> 1;
+            int right_shift_25 = (right_shift_24 * 26215) >> 17;
+            int sub_26 = right_shift_24 - (right_shift_25 * 5);
+            uint match_27 = 
+            (((func_clamp_22 & 1) == 0) && (((right_shift_25 | 1) < 5) && ((sub_26 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_28 = slice_23 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_25 ^ 1) * 5) + sub_26) * 2) + 1), 0, sub_15))), 0).x) & match_27);
+            uint match_29 = 
+            (eq_18 && eq_17) ? 1u :
+            0u;
+            match_30 = ((bitwise_xor_28 & (~match_29)) | ((~bitwise_xor_21) & match_29));
+        }
+        int func_clamp_31 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        uint slice_36 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_31, 0, sub_15))), 0).x;
+        bool eq_37 = (func_clamp_31 & 1) == 0;
+        int right_shift_32 = func_clamp_31 >> 1;
+        int right_shift_33 = (right_shift_32 * 26215) >> 17;
+        int sub_34 = right_shift_32 - (right_shift_33 * 5);
+        int bitwise_and_35 = sub_34 & 1;
+        uint match_38 = 
+            (eq_37 && (((right_shift_33 | 1) < 5) && (bitwise_and_35 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_39 = slice_36 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_33 ^ 1) * 5) + sub_34) * 2) + 1), 0, sub_15))), 0).x) & match_38);
+        uint match_48;
+        if ((bitwise_and_35 == (right_shift_33 & 1))) {
+            match_48 = bitwise_xor_39;
+        } else {
+            int func_clamp_40 = clamp((func_clamp_31 ^ 1), 0, sub_15);
+            uint slice_41 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_40, 0, sub_15))), 0).x;
+            int right_shift_42 = func_clamp_40 >> 1;
+            int right_shift_43 = (right_shift_42 * 26215) >> 17;
+            int sub_44 = right_shift_42 - (right_shift_43 * 5);
+            uint match_45 = 
+            (((func_clamp_40 & 1) == 0) && (((right_shift_43 | 1) < 5) && ((sub_44 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_46 = slice_41 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_43 ^ 1) * 5) + sub_44) * 2) + 1), 0, sub_15))), 0).x) & match_45);
+            uint match_47 = 
+            (eq_18 && eq_37) ? 1u :
+            0u;
+            match_48 = ((bitwise_xor_46 & (~match_47)) | ((~bitwise_xor_39) & match_47));
+        }
+        bool eq_49 = bitwise_and_7 == 0;
+        uint match_50 = 
+            (eq_17 && eq_49) ? match_19 :
+            0u;
+        uint bitwise_xor_51 = match_30 ^ (match_48 & match_50);
+        uint match_91 = 
+            (eq_17 && (((sub_5 | 1) < 5) && eq_49)) ? match_19 :
+            0u;
+        int func_clamp_52 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, sub_15);
+        uint slice_59 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_52, 0, sub_15))), 0).x;
+        bool eq_60 = (func_clamp_52 & 1) == 0;
+        int right_shift_53 = func_clamp_52 >> 1;
+        int right_shift_54 = (right_shift_53 * 26215) >> 17;
+        int mul_55 = right_shift_54 * 5;
+        int sub_56 = right_shift_53 - mul_55;
+        int bitwise_and_57 = sub_56 & 1;
+        uint match_61 = 
+            (eq_60 && (((right_shift_54 | 1) < 5) && (bitwise_and_57 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_62 = slice_59 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_54 ^ 1) * 5) + sub_56) * 2) + 1), 0, sub_15))), 0).x) & match_61);
+        int bitwise_and_58 = right_shift_54 & 1;
+        uint match_71;
+        if ((bitwise_and_57 == bitwise_and_58)) {
+            match_71 = bitwise_xor_62;
+        } else {
+            int func_clamp_63 = clamp((func_clamp_52 ^ 1), 0, sub_15);
+            uint slice_64 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_63, 0, sub_15))), 0).x;
+            int right_shift_65 = func_clamp_63 >> 1;
+            int right_shift_66 = (right_shift_65 * 26215) >> 17;
+            int sub_67 = right_shift_65 - (right_shift_66 * 5);
+            uint match_68 = 
+            (((func_clamp_63 & 1) == 0) && (((right_shift_66 | 1) < 5) && ((sub_67 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_69 = slice_64 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_66 ^ 1) * 5) + sub_67) * 2) + 1), 0, sub_15))), 0).x) & match_68);
+            uint match_70 = 
+            (eq_18 && eq_60) ? 1u :
+            0u;
+            match_71 = ((bitwise_xor_69 & (~match_70)) | ((~bitwise_xor_62) & match_70));
+        }
+        int func_clamp_72 = clamp((((mul_55 + (((sub_56 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        uint slice_77 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_72, 0, sub_15))), 0).x;
+        bool eq_78 = (func_clamp_72 & 1) == 0;
+        int right_shift_73 = func_clamp_72 >> 1;
+        int right_shift_74 = (right_shift_73 * 26215) >> 17;
+        int sub_75 = right_shift_73 - (right_shift_74 * 5);
+        int bitwise_and_76 = sub_75 & 1;
+        uint match_79 = 
+            (eq_78 && (((right_shift_74 | 1) < 5) && (bitwise_and_76 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_80 = slice_77 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_74 ^ 1) * 5) + sub_75) * 2) + 1), 0, sub_15))), 0).x) & match_79);
+        uint match_89;
+        if ((bitwise_and_76 == (right_shift_74 & 1))) {
+            match_89 = bitwise_xor_80;
+        } else {
+            int func_clamp_81 = clamp((func_clamp_72 ^ 1), 0, sub_15);
+            uint slice_82 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_81, 0, sub_15))), 0).x;
+            int right_shift_83 = func_clamp_81 >> 1;
+            int right_shift_84 = (right_shift_83 * 26215) >> 17;
+            int sub_85 = right_shift_83 - (right_shift_84 * 5);
+            uint match_86 = 
+            (((func_clamp_81 & 1) == 0) && (((right_shift_84 | 1) < 5) && ((sub_85 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_87 = slice_82 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_84 ^ 1) * 5) + sub_85) * 2) + 1), 0, sub_15))), 0).x) & match_86);
+            uint match_88 = 
+            (eq_18 && eq_78) ? 1u :
+            0u;
+            match_89 = ((bitwise_xor_87 & (~match_88)) | ((~bitwise_xor_80) & match_88));
+        }
+        uint match_90 = 
+            (eq_60 && (bitwise_and_58 == 0)) ? match_19 :
+            0u;
+        outColor = (bitwise_xor_51 ^ ((match_71 ^ (match_89 & match_90)) & match_91));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height5_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int sub_11 = int(state_size.y) - 1;
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_7 = x == 0;
+        uint match_8 = 
+            eq_7 ? 4294967294u :
+            4294967295u;
+        bool eq_6 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        int mul_2 = right_shift_1 * 5;
+        int sub_3 = right_shift_0 - mul_2;
+        int bitwise_and_4 = sub_3 & 1;
+        uint match_9 = 
+            (eq_6 && (((right_shift_1 | 1) < 5) && (bitwise_and_4 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_10 = v_state ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 5) + sub_3) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_9);
+        int bitwise_and_5 = right_shift_1 & 1;
+        uint match_20;
+        if ((bitwise_and_4 == bitwise_and_5)) {
+            match_20 = bitwise_xor_10;
+        } else {
+            int func_clamp_12 = clamp((y ^ 1), 0, sub_11);
+            uint slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_14 = func_clamp_12 >> 1;
+            int right_shift_15 = (right_shift_14 * 26215) >> 17;
+            int sub_16 = right_shift_14 - (right_shift_15 * 5);
+            uint match_17 = 
+            (((func_clamp_12 & 1) == 0) && (((right_shift_15 | 1) < 5) && ((sub_16 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_18 = slice_13 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_15 ^ 1) * 5) + sub_16) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_17);
+            uint match_19 = 
+            (eq_7 && eq_6) ? 1u :
+            0u;
+            match_20 = ((bitwise_xor_18 & (~match_19)) | ((~bitwise_xor_10) & match_19));
+        }
+        int func_clamp_21 = clamp((((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_11);
+        uint slice_26 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_27 = (func_clamp_21 & 1) == 0;
+        int right_shift_22 = func_clamp_21 >> 1;
+        int right_shift_23 = (right_shift_22 * 26215) >> 17;
+        int sub_24 = right_shift_22 - (right_shift_23 * 5);
+        int bitwise_and_25 = sub_24 & 1;
+        uint match_28 = 
+            (eq_27 && (((right_shift_23 | 1) < 5) && (bitwise_and_25 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_29 = slice_26 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_23 ^ 1) * 5) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_28);
+        uint match_38;
+        if ((bitwise_and_25 == (right_shift_23 & 1))) {
+            match_38 = bitwise_xor_29;
+        } else {
+            int func_clamp_30 = clamp((func_clamp_21 ^ 1), 0, sub_11);
+            uint slice_31 = texelFetch(state, clamp(ivec2(x, func_clamp_30), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_32 = func_clamp_30 >> 1;
+            int right_shift_33 = (right_shift_32 * 26215) >> 17;
+            int sub_34 = right_shift_32 - (right_shift_33 * 5);
+            uint match_35 = 
+            (((func_clamp_30 & 1) == 0) && (((right_shift_33 | 1) < 5) && ((sub_34 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_36 = slice_31 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_33 ^ 1) * 5) + sub_34) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_35);
+            uint match_37 = 
+            (eq_7 && eq_27) ? 1u :
+            0u;
+            match_38 = ((bitwise_xor_36 & (~match_37)) | ((~bitwise_xor_29) & match_37));
+        }
+        bool eq_39 = bitwise_and_5 == 0;
+        uint match_40 = 
+            (eq_6 && eq_39) ? match_8 :
+            0u;
+        uint bitwise_xor_41 = match_20 ^ (match_38 & match_40);
+        uint match_81 = 
+            (eq_6 && (((sub_3 | 1) < 5) && eq_39)) ? match_8 :
+            0u;
+        int func_clamp_42 = clamp((((mul_2 + (sub_3 ^ 1)) * 2) + 1), 0, sub_11);
+        uint slice_49 = texelFetch(state, clamp(ivec2(x, func_clamp_42), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_50 = (func_clamp_42 & 1) == 0;
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 26215) >> 17;
+        int mul_45 = right_shift_44 * 5;
+        int sub_46 = right_shift_43 - mul_45;
+        int bitwise_and_47 = sub_46 & 1;
+        uint match_51 = 
+            (eq_50 && (((right_shift_44 | 1) < 5) && (bitwise_and_47 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_52 = slice_49 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_44 ^ 1) * 5) + sub_46) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_51);
+        int bitwise_and_48 = right_shift_44 & 1;
+        uint match_61;
+        if ((bitwise_and_47 == bitwise_and_48)) {
+            match_61 = bitwise_xor_52;
+        } else {
+            int func_clamp_53 = clamp((func_clamp_42 ^ 1), 0, sub_11);
+            uint slice_54 = texelFetch(state, clamp(ivec2(x, func_clamp_53), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_55 = func_clamp_53 >> 1;
+            int right_shift_56 = (right_shift_55 * 26215) >> 17;
+            int sub_57 = right_shift_55 - (right_shift_56 * 5);
+            uint match_58 = 
+            (((func_clamp_53 & 1) == 0) && (((right_shift_56 | 1) < 5) && ((sub_57 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_59 = slice_54 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_56 ^ 1) * 5) + sub_57) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_58);
+            uint match_60 = 
+            (eq_7 && eq_50) ? 1u :
+            0u;
+            match_61 = ((bitwise_xor_59 & (~match_60)) | ((~bitwise_xor_52) & match_60));
+        }
+        int func_clamp_62 = clamp((((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_11);
+        uint slice_67 = texelFetch(state, clamp(ivec2(x, func_clamp_62), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_68 = (func_clamp_62 & 1) == 0;
+        int right_shift_63 = func_clamp_62 >> 1;
+        int right_shift_64 = (right_shift_63 * 26215) >> 17;
+        int sub_65 = right_shift_63 - (right_shift_64 * 5);
+        int bitwise_and_66 = sub_65 & 1;
+        uint match_69 = 
+            (eq_68 && (((right_shift_64 | 1) < 5) && (bitwise_and_66 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_70 = slice_67 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_64 ^ 1) * 5) + sub_65) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_69);
+        uint match_79;
+        if ((bitwise_and_66 == (right_shift_64 & 1))) {
+            match_79 = bitwise_xor_70;
+        } else {
+            int func_clamp_71 = clamp((func_clamp_62 ^ 1), 0, sub_11);
+            uint slice_72 = texelFetch(state, clamp(ivec2(x, func_clamp_71), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_73 = func_clamp_71 >> 1;
+            int right_shift_74 = (right_shift_73 * 26215) >> 17;
+            int sub_75 = right_shift_73 - (right_shift_74 * 5);
+            uint match_76 = 
+            (((func_clamp_71 & 1) == 0) && (((right_shift_74 | 1) < 5) && ((sub_75 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_77 = slice_72 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_74 ^ 1) * 5) + sub_75) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_76);
+            uint match_78 = 
+            (eq_7 && eq_68) ? 1u :
+            0u;
+            match_79 = ((bitwise_xor_77 & (~match_78)) | ((~bitwise_xor_70) & match_78));
+        }
+        uint match_80 = 
+            (eq_50 && (bitwise_and_48 == 0)) ? match_8 :
+            0u;
+        outColor = (bitwise_xor_41 ^ ((match_61 ^ (match_79 & match_80)) & match_81));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height5_surface_width5_out_tile1x50_state_tile1x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        bool eq_8 = (sub_1 & 1) == 0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        int mul_4 = right_shift_3 * 5;
+        int sub_5 = right_shift_2 - mul_4;
+        int bitwise_and_6 = sub_5 & 1;
+        uint match_9 = 
+            (eq_8 && (((right_shift_3 | 1) < 5) && (bitwise_and_6 == 0))) ? 4294967294u :
+            0u;
+        uint bitwise_xor_10 = v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 5) + sub_5) * 2) + 1), 0, 49))), 0).x) & match_9);
+        int bitwise_and_7 = right_shift_3 & 1;
+        uint match_19;
+        if ((bitwise_and_6 == bitwise_and_7)) {
+            match_19 = bitwise_xor_10;
+        } else {
+            int bitwise_xor_11 = sub_1 ^ 1;
+            uint slice_12 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_11)), 0).x;
+            int right_shift_13 = bitwise_xor_11 >> 1;
+            int right_shift_14 = (right_shift_13 * 13) >> 6;
+            int sub_15 = right_shift_13 - (right_shift_14 * 5);
+            uint match_16 = 
+            (((bitwise_xor_11 & 1) == 0) && (((right_shift_14 | 1) < 5) && ((sub_15 & 1) == 0))) ? 4294967294u :
+            0u;
+            uint bitwise_xor_17 = slice_12 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_14 ^ 1) * 5) + sub_15) * 2) + 1), 0, 49))), 0).x) & match_16);
+            uint match_18 = 
+            eq_8 ? 1u :
+            0u;
+            match_19 = ((bitwise_xor_17 & (~match_18)) | ((~bitwise_xor_10) & match_18));
+        }
+        int func_clamp_20 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        uint slice_25 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_20)), 0).x;
+        bool eq_26 = (func_clamp_20 & 1) == 0;
+        int right_shift_21 = func_clamp_20 >> 1;
+        int right_shift_22 = (right_shift_21 * 13) >> 6;
+        int sub_23 = right_shift_21 - (right_shift_22 * 5);
+        int bitwise_and_24 = sub_23 & 1;
+        uint match_27 = 
+            (eq_26 && (((right_shift_22 | 1) < 5) && (bitwise_and_24 == 0))) ? 4294967294u :
+            0u;
+        uint bitwise_xor_28 = slice_25 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_22 ^ 1) * 5) + sub_23) * 2) + 1), 0, 49))), 0).x) & match_27);
+        uint match_37;
+        if ((bitwise_and_24 == (right_shift_22 & 1))) {
+            match_37 = bitwise_xor_28;
+        } else {
+            int bitwise_xor_29 = func_clamp_20 ^ 1;
+            uint slice_30 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_29)), 0).x;
+            int right_shift_31 = bitwise_xor_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 13) >> 6;
+            int sub_33 = right_shift_31 - (right_shift_32 * 5);
+            uint match_34 = 
+            (((bitwise_xor_29 & 1) == 0) && (((right_shift_32 | 1) < 5) && ((sub_33 & 1) == 0))) ? 4294967294u :
+            0u;
+            uint bitwise_xor_35 = slice_30 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_32 ^ 1) * 5) + sub_33) * 2) + 1), 0, 49))), 0).x) & match_34);
+            uint match_36 = 
+            eq_26 ? 1u :
+            0u;
+            match_37 = ((bitwise_xor_35 & (~match_36)) | ((~bitwise_xor_28) & match_36));
+        }
+        bool eq_38 = bitwise_and_7 == 0;
+        uint match_39 = 
+            (eq_8 && eq_38) ? 4294967294u :
+            0u;
+        uint bitwise_xor_40 = match_19 ^ (match_37 & match_39);
+        uint match_80 = 
+            (eq_8 && (((sub_5 | 1) < 5) && eq_38)) ? 4294967294u :
+            0u;
+        int func_clamp_41 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 49);
+        uint slice_48 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_41)), 0).x;
+        bool eq_49 = (func_clamp_41 & 1) == 0;
+        int right_shift_42 = func_clamp_41 >> 1;
+        int right_shift_43 = (right_shift_42 * 13) >> 6;
+        int mul_44 = right_shift_43 * 5;
+        int sub_45 = right_shift_42 - mul_44;
+        int bitwise_and_46 = sub_45 & 1;
+        uint match_50 = 
+            (eq_49 && (((right_shift_43 | 1) < 5) && (bitwise_and_46 == 0))) ? 4294967294u :
+            0u;
+        uint bitwise_xor_51 = slice_48 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_43 ^ 1) * 5) + sub_45) * 2) + 1), 0, 49))), 0).x) & match_50);
+        int bitwise_and_47 = right_shift_43 & 1;
+        uint match_60;
+        if ((bitwise_and_46 == bitwise_and_47)) {
+            match_60 = bitwise_xor_51;
+        } else {
+            int bitwise_xor_52 = func_clamp_41 ^ 1;
+            uint slice_53 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_52)), 0).x;
+            int right_shift_54 = bitwise_xor_52 >> 1;
+            int right_shift_55 = (right_shift_54 * 13) >> 6;
+            int sub_56 = right_shift_54 - (right_shift_55 * 5);
+            uint match_57 = 
+            (((bitwise_xor_52 & 1) == 0) && (((right_shift_55 | 1) < 5) && ((sub_56 & 1) == 0))) ? 4294967294u :
+            0u;
+            uint bitwise_xor_58 = slice_53 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_55 ^ 1) * 5) + sub_56) * 2) + 1), 0, 49))), 0).x) & match_57);
+            uint match_59 = 
+            eq_49 ? 1u :
+            0u;
+            match_60 = ((bitwise_xor_58 & (~match_59)) | ((~bitwise_xor_51) & match_59));
+        }
+        int func_clamp_61 = clamp((((mul_44 + (((sub_45 + 1) ^ 1) - 1)) * 2) + 1), 0, 49);
+        uint slice_66 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_61)), 0).x;
+        bool eq_67 = (func_clamp_61 & 1) == 0;
+        int right_shift_62 = func_clamp_61 >> 1;
+        int right_shift_63 = (right_shift_62 * 13) >> 6;
+        int sub_64 = right_shift_62 - (right_shift_63 * 5);
+        int bitwise_and_65 = sub_64 & 1;
+        uint match_68 = 
+            (eq_67 && (((right_shift_63 | 1) < 5) && (bitwise_and_65 == 0))) ? 4294967294u :
+            0u;
+        uint bitwise_xor_69 = slice_66 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_63 ^ 1) * 5) + sub_64) * 2) + 1), 0, 49))), 0).x) & match_68);
+        uint match_78;
+        if ((bitwise_and_65 == (right_shift_63 & 1))) {
+            match_78 = bitwise_xor_69;
+        } else {
+            int bitwise_xor_70 = func_clamp_61 ^ 1;
+            uint slice_71 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_70)), 0).x;
+            int right_shift_72 = bitwise_xor_70 >> 1;
+            int right_shift_73 = (right_shift_72 * 13) >> 6;
+            int sub_74 = right_shift_72 - (right_shift_73 * 5);
+            uint match_75 = 
+            (((bitwise_xor_70 & 1) == 0) && (((right_shift_73 | 1) < 5) && ((sub_74 & 1) == 0))) ? 4294967294u :
+            0u;
+            uint bitwise_xor_76 = slice_71 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_73 ^ 1) * 5) + sub_74) * 2) + 1), 0, 49))), 0).x) & match_75);
+            uint match_77 = 
+            eq_67 ? 1u :
+            0u;
+            match_78 = ((bitwise_xor_76 & (~match_77)) | ((~bitwise_xor_69) & match_77));
+        }
+        uint match_79 = 
+            (eq_49 && (bitwise_and_47 == 0)) ? 4294967294u :
+            0u;
+        outColor = (bitwise_xor_40 ^ ((match_60 ^ (match_78 & match_79)) & match_80));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_9 = int(state_tile.x);
+        int func_int_8 = int(out_tile.x);
+        int mul_10 = (x / func_int_8) * func_int_9;
+        int mod_11 = x % func_int_8;
+        int add_12 = mul_10 + clamp(mod_11, 0, (func_int_9 - 1));
+        int func_int_13 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_14 = (y / func_int_0) * func_int_13;
+        int mod_1 = y % func_int_0;
+        int sub_15 = func_int_13 - 1;
+        uint slice_16 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(mod_1, 0, sub_15))), 0).x;
+        bool eq_18 = mod_11 == 0;
+        uint match_19 = 
+            eq_18 ? 4294967294u :
+            4294967295u;
+        bool eq_17 = (mod_1 & 1) == 0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 3641) >> 15;
+        int mul_4 = right_shift_3 * 9;
+        int sub_5 = right_shift_2 - mul_4;
+        int bitwise_and_6 = sub_5 & 1;
+        uint match_20 = 
+            (eq_17 && (((right_shift_3 | 1) < 9) && (bitwise_and_6 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_21 = slice_16 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_3 ^ 1) * 9) + sub_5) * 2) + 1), 0, sub_15))), 0).x) & match_20);
+        int bitwise_and_7 = right_shift_3 & 1;
+        uint match_30;
+        if ((bitwise_and_6 == bitwise_and_7)) {
+            match_30 = bitwise_xor_21;
+        } else {
+            int func_clamp_22 = clamp((mod_1 ^ 1), 0, sub_15);
+            uint slice_23 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_22, 0, sub_15))), 0).x;
+            int right_shift_24 = func_clamp_22 >> 1;
+            int right_shift_25 = (right_shift_24 * 3641) >> 15;
+            int sub_26 = right_shift_24 - (right_shift_25 * 9);
+            uint match_27 = 
+            (((func_clamp_22 & 1) == 0) && (((right_shift_25 | 1) < 9) && ((sub_26 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_28 = slice_23 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_25 ^ 1) * 9) + sub_26) * 2) + 1), 0, sub_15))), 0).x) & match_27);
+            uint match_29 = 
+            (eq_18 && eq_17) ? 1u :
+            0u;
+            match_30 = ((bitwise_xor_28 & (~match_29)) | ((~bitwise_xor_21) & match_29));
+        }
+        int func_clamp_31 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        uint slice_36 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_31, 0, sub_15))), 0).x;
+        bool eq_37 = (func_clamp_31 & 1) == 0;
+        int right_shift_32 = func_clamp_31 >> 1;
+        int right_shift_33 = (right_shift_32 * 3641) >> 15;
+        int sub_34 = right_shift_32 - (right_shift_33 * 9);
+        int bitwise_and_35 = sub_34 & 1;
+        uint match_38 = 
+            (eq_37 && (((right_shift_33 | 1) < 9) && (bitwise_and_35 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_39 = slice_36 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_33 ^ 1) * 9) + sub_34) * 2) + 1), 0, sub_15))), 0).x) & match_38);
+        uint match_48;
+        if ((bitwise_and_35 == (right_shift_33 & 1))) {
+            match_48 = bitwise_xor_39;
+        } else {
+            int func_clamp_40 = clamp((func_clamp_31 ^ 1), 0, sub_15);
+            uint slice_41 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_40, 0, sub_15))), 0).x;
+            int right_shift_42 = func_clamp_40 >> 1;
+            int right_shift_43 = (right_shift_42 * 3641) >> 15;
+            int sub_44 = right_shift_42 - (right_shift_43 * 9);
+            uint match_45 = 
+            (((func_clamp_40 & 1) == 0) && (((right_shift_43 | 1) < 9) && ((sub_44 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_46 = slice_41 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_43 ^ 1) * 9) + sub_44) * 2) + 1), 0, sub_15))), 0).x) & match_45);
+            uint match_47 = 
+            (eq_18 && eq_37) ? 1u :
+            0u;
+            match_48 = ((bitwise_xor_46 & (~match_47)) | ((~bitwise_xor_39) & match_47));
+        }
+        bool eq_49 = bitwise_and_7 == 0;
+        uint match_50 = 
+            (eq_17 && eq_49) ? match_19 :
+            0u;
+        uint bitwise_xor_51 = match_30 ^ (match_48 & match_50);
+        uint match_91 = 
+            (eq_17 && (((sub_5 | 1) < 9) && eq_49)) ? match_19 :
+            0u;
+        int func_clamp_52 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, sub_15);
+        uint slice_59 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_52, 0, sub_15))), 0).x;
+        bool eq_60 = (func_clamp_52 & 1) == 0;
+        int right_shift_53 = func_clamp_52 >> 1;
+        int right_shift_54 = (right_shift_53 * 3641) >> 15;
+        int mul_55 = right_shift_54 * 9;
+        int sub_56 = right_shift_53 - mul_55;
+        int bitwise_and_57 = sub_56 & 1;
+        uint match_61 = 
+            (eq_60 && (((right_shift_54 | 1) < 9) && (bitwise_and_57 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_62 = slice_59 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_54 ^ 1) * 9) + sub_56) * 2) + 1), 0, sub_15))), 0).x) & match_61);
+        int bitwise_and_58 = right_shift_54 & 1;
+        uint match_71;
+        if ((bitwise_and_57 == bitwise_and_58)) {
+            match_71 = bitwise_xor_62;
+        } else {
+            int func_clamp_63 = clamp((func_clamp_52 ^ 1), 0, sub_15);
+            uint slice_64 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_63, 0, sub_15))), 0).x;
+            int right_shift_65 = func_clamp_63 >> 1;
+            int right_shift_66 = (right_shift_65 * 3641) >> 15;
+            int sub_67 = right_shift_65 - (right_shift_66 * 9);
+            uint match_68 = 
+            (((func_clamp_63 & 1) == 0) && (((right_shift_66 | 1) < 9) && ((sub_67 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_69 = slice_64 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_66 ^ 1) * 9) + sub_67) * 2) + 1), 0, sub_15))), 0).x) & match_68);
+            uint match_70 = 
+            (eq_18 && eq_60) ? 1u :
+            0u;
+            match_71 = ((bitwise_xor_69 & (~match_70)) | ((~bitwise_xor_62) & match_70));
+        }
+        int func_clamp_72 = clamp((((mul_55 + (((sub_56 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        uint slice_77 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_72, 0, sub_15))), 0).x;
+        bool eq_78 = (func_clamp_72 & 1) == 0;
+        int right_shift_73 = func_clamp_72 >> 1;
+        int right_shift_74 = (right_shift_73 * 3641) >> 15;
+        int sub_75 = right_shift_73 - (right_shift_74 * 9);
+        int bitwise_and_76 = sub_75 & 1;
+        uint match_79 = 
+            (eq_78 && (((right_shift_74 | 1) < 9) && (bitwise_and_76 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_80 = slice_77 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_74 ^ 1) * 9) + sub_75) * 2) + 1), 0, sub_15))), 0).x) & match_79);
+        uint match_89;
+        if ((bitwise_and_76 == (right_shift_74 & 1))) {
+            match_89 = bitwise_xor_80;
+        } else {
+            int func_clamp_81 = clamp((func_clamp_72 ^ 1), 0, sub_15);
+            uint slice_82 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_81, 0, sub_15))), 0).x;
+            int right_shift_83 = func_clamp_81 >> 1;
+            int right_shift_84 = (right_shift_83 * 3641) >> 15;
+            int sub_85 = right_shift_83 - (right_shift_84 * 9);
+            uint match_86 = 
+            (((func_clamp_81 & 1) == 0) && (((right_shift_84 | 1) < 9) && ((sub_85 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_87 = slice_82 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_84 ^ 1) * 9) + sub_85) * 2) + 1), 0, sub_15))), 0).x) & match_86);
+            uint match_88 = 
+            (eq_18 && eq_78) ? 1u :
+            0u;
+            match_89 = ((bitwise_xor_87 & (~match_88)) | ((~bitwise_xor_80) & match_88));
+        }
+        uint match_90 = 
+            (eq_60 && (bitwise_and_58 == 0)) ? match_19 :
+            0u;
+        outColor = (bitwise_xor_51 ^ ((match_71 ^ (match_89 & match_90)) & match_91));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height9_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int sub_11 = int(state_size.y) - 1;
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_7 = x == 0;
+        uint match_8 = 
+            eq_7 ? 4294967294u :
+            4294967295u;
+        bool eq_6 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        int mul_2 = right_shift_1 * 9;
+        int sub_3 = right_shift_0 - mul_2;
+        int bitwise_and_4 = sub_3 & 1;
+        uint match_9 = 
+            (eq_6 && (((right_shift_1 | 1) < 9) && (bitwise_and_4 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_10 = v_state ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 9) + sub_3) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_9);
+        int bitwise_and_5 = right_shift_1 & 1;
+        uint match_20;
+        if ((bitwise_and_4 == bitwise_and_5)) {
+            match_20 = bitwise_xor_10;
+        } else {
+            int func_clamp_12 = clamp((y ^ 1), 0, sub_11);
+            uint slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_14 = func_clamp_12 >> 1;
+            int right_shift_15 = (right_shift_14 * 3641) >> 15;
+            int sub_16 = right_shift_14 - (right_shift_15 * 9);
+            uint match_17 = 
+            (((func_clamp_12 & 1) == 0) && (((right_shift_15 | 1) < 9) && ((sub_16 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_18 = slice_13 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_15 ^ 1) * 9) + sub_16) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_17);
+            uint match_19 = 
+            (eq_7 && eq_6) ? 1u :
+            0u;
+            match_20 = ((bitwise_xor_18 & (~match_19)) | ((~bitwise_xor_10) & match_19));
+        }
+        int func_clamp_21 = clamp((((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_11);
+        uint slice_26 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_27 = (func_clamp_21 & 1) == 0;
+        int right_shift_22 = func_clamp_21 >> 1;
+        int right_shift_23 = (right_shift_22 * 3641) >> 15;
+        int sub_24 = right_shift_22 - (right_shift_23 * 9);
+        int bitwise_and_25 = sub_24 & 1;
+        uint match_28 = 
+            (eq_27 && (((right_shift_23 | 1) < 9) && (bitwise_and_25 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_29 = slice_26 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_23 ^ 1) * 9) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_28);
+        uint match_38;
+        if ((bitwise_and_25 == (right_shift_23 & 1))) {
+            match_38 = bitwise_xor_29;
+        } else {
+            int func_clamp_30 = clamp((func_clamp_21 ^ 1), 0, sub_11);
+            uint slice_31 = texelFetch(state, clamp(ivec2(x, func_clamp_30), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_32 = func_clamp_30 >> 1;
+            int right_shift_33 = (right_shift_32 * 3641) >> 15;
+            int sub_34 = right_shift_32 - (right_shift_33 * 9);
+            uint match_35 = 
+            (((func_clamp_30 & 1) == 0) && (((right_shift_33 | 1) < 9) && ((sub_34 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_36 = slice_31 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_33 ^ 1) * 9) + sub_34) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_35);
+            uint match_37 = 
+            (eq_7 && eq_27) ? 1u :
+            0u;
+            match_38 = ((bitwise_xor_36 & (~match_37)) | ((~bitwise_xor_29) & match_37));
+        }
+        bool eq_39 = bitwise_and_5 == 0;
+        uint match_40 = 
+            (eq_6 && eq_39) ? match_8 :
+            0u;
+        uint bitwise_xor_41 = match_20 ^ (match_38 & match_40);
+        uint match_81 = 
+            (eq_6 && (((sub_3 | 1) < 9) && eq_39)) ? match_8 :
+            0u;
+        int func_clamp_42 = clamp((((mul_2 + (sub_3 ^ 1)) * 2) + 1), 0, sub_11);
+        uint slice_49 = texelFetch(state, clamp(ivec2(x, func_clamp_42), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_50 = (func_clamp_42 & 1) == 0;
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 3641) >> 15;
+        int mul_45 = right_shift_44 * 9;
+        int sub_46 = right_shift_43 - mul_45;
+        int bitwise_and_47 = sub_46 & 1;
+        uint match_51 = 
+            (eq_50 && (((right_shift_44 | 1) < 9) && (bitwise_and_47 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_52 = slice_49 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_44 ^ 1) * 9) + sub_46) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_51);
+        int bitwise_and_48 = right_shift_44 & 1;
+        uint match_61;
+        if ((bitwise_and_47 == bitwise_and_48)) {
+            match_61 = bitwise_xor_52;
+        } else {
+            int func_clamp_53 = clamp((func_clamp_42 ^ 1), 0, sub_11);
+            uint slice_54 = texelFetch(state, clamp(ivec2(x, func_clamp_53), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_55 = func_clamp_53 >> 1;
+            int right_shift_56 = (right_shift_55 * 3641) >> 15;
+            int sub_57 = right_shift_55 - (right_shift_56 * 9);
+            uint match_58 = 
+            (((func_clamp_53 & 1) == 0) && (((right_shift_56 | 1) < 9) && ((sub_57 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_59 = slice_54 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_56 ^ 1) * 9) + sub_57) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_58);
+            uint match_60 = 
+            (eq_7 && eq_50) ? 1u :
+            0u;
+            match_61 = ((bitwise_xor_59 & (~match_60)) | ((~bitwise_xor_52) & match_60));
+        }
+        int func_clamp_62 = clamp((((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_11);
+        uint slice_67 = texelFetch(state, clamp(ivec2(x, func_clamp_62), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_68 = (func_clamp_62 & 1) == 0;
+        int right_shift_63 = func_clamp_62 >> 1;
+        int right_shift_64 = (right_shift_63 * 3641) >> 15;
+        int sub_65 = right_shift_63 - (right_shift_64 * 9);
+        int bitwise_and_66 = sub_65 & 1;
+        uint match_69 = 
+            (eq_68 && (((right_shift_64 | 1) < 9) && (bitwise_and_66 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_70 = slice_67 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_64 ^ 1) * 9) + sub_65) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_69);
+        uint match_79;
+        if ((bitwise_and_66 == (right_shift_64 & 1))) {
+            match_79 = bitwise_xor_70;
+        } else {
+            int func_clamp_71 = clamp((func_clamp_62 ^ 1), 0, sub_11);
+            uint slice_72 = texelFetch(state, clamp(ivec2(x, func_clamp_71), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_73 = func_clamp_71 >> 1;
+            int right_shift_74 = (right_shift_73 * 3641) >> 15;
+            int sub_75 = right_shift_73 - (right_shift_74 * 9);
+            uint match_76 = 
+            (((func_clamp_71 & 1) == 0) && (((right_shift_74 | 1) < 9) && ((sub_75 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_77 = slice_72 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_74 ^ 1) * 9) + sub_75) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_76);
+            uint match_78 = 
+            (eq_7 && eq_68) ? 1u :
+            0u;
+            match_79 = ((bitwise_xor_77 & (~match_78)) | ((~bitwise_xor_70) & match_78));
+        }
+        uint match_80 = 
+            (eq_50 && (bitwise_and_48 == 0)) ? match_8 :
+            0u;
+        outColor = (bitwise_xor_41 ^ ((match_61 ^ (match_79 & match_80)) & match_81));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height9_surface_width9_out_tile3x162_state_tile3x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        bool eq_9 = (x - (int(((float(x) + 0.5) * 0.3333333432674408)) * 3)) == 0;
+        uint match_10 = 
+            eq_9 ? 4294967294u :
+            4294967295u;
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        bool eq_8 = (sub_1 & 1) == 0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        int mul_4 = right_shift_3 * 9;
+        int sub_5 = right_shift_2 - mul_4;
+        int bitwise_and_6 = sub_5 & 1;
+        uint match_11 = 
+            (eq_8 && (((right_shift_3 | 1) < 9) && (bitwise_and_6 == 0))) ? match_10 :
+            0u;
+        uint bitwise_xor_12 = v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 9) + sub_5) * 2) + 1), 0, 161))), 0).x) & match_11);
+        int bitwise_and_7 = right_shift_3 & 1;
+        uint match_21;
+        if ((bitwise_and_6 == bitwise_and_7)) {
+            match_21 = bitwise_xor_12;
+        } else {
+            int bitwise_xor_13 = sub_1 ^ 1;
+            uint slice_14 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_13)), 0).x;
+            int right_shift_15 = bitwise_xor_13 >> 1;
+            int right_shift_16 = (right_shift_15 * 57) >> 9;
+            int sub_17 = right_shift_15 - (right_shift_16 * 9);
+            uint match_18 = 
+            (((bitwise_xor_13 & 1) == 0) && (((right_shift_16 | 1) < 9) && ((sub_17 & 1) == 0))) ? match_10 :
+            0u;
+            uint bitwise_xor_19 = slice_14 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_16 ^ 1) * 9) + sub_17) * 2) + 1), 0, 161))), 0).x) & match_18);
+            uint match_20 = 
+            (eq_9 && eq_8) ? 1u :
+            0u;
+            match_21 = ((bitwise_xor_19 & (~match_20)) | ((~bitwise_xor_12) & match_20));
+        }
+        int func_clamp_22 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        uint slice_27 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_22)), 0).x;
+        bool eq_28 = (func_clamp_22 & 1) == 0;
+        int right_shift_23 = func_clamp_22 >> 1;
+        int right_shift_24 = (right_shift_23 * 57) >> 9;
+        int sub_25 = right_shift_23 - (right_shift_24 * 9);
+        int bitwise_and_26 = sub_25 & 1;
+        uint match_29 = 
+            (eq_28 && (((right_shift_24 | 1) < 9) && (bitwise_and_26 == 0))) ? match_10 :
+            0u;
+        uint bitwise_xor_30 = slice_27 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_24 ^ 1) * 9) + sub_25) * 2) + 1), 0, 161))), 0).x) & match_29);
+        uint match_39;
+        if ((bitwise_and_26 == (right_shift_24 & 1))) {
+            match_39 = bitwise_xor_30;
+        } else {
+            int bitwise_xor_31 = func_clamp_22 ^ 1;
+            uint slice_32 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_31)), 0).x;
+            int right_shift_33 = bitwise_xor_31 >> 1;
+            int right_shift_34 = (right_shift_33 * 57) >> 9;
+            int sub_35 = right_shift_33 - (right_shift_34 * 9);
+            uint match_36 = 
+            (((bitwise_xor_31 & 1) == 0) && (((right_shift_34 | 1) < 9) && ((sub_35 & 1) == 0))) ? match_10 :
+            0u;
+            uint bitwise_xor_37 = slice_32 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_34 ^ 1) * 9) + sub_35) * 2) + 1), 0, 161))), 0).x) & match_36);
+            uint match_38 = 
+            (eq_9 && eq_28) ? 1u :
+            0u;
+            match_39 = ((bitwise_xor_37 & (~match_38)) | ((~bitwise_xor_30) & match_38));
+        }
+        bool eq_40 = bitwise_and_7 == 0;
+        uint match_41 = 
+            (eq_8 && eq_40) ? match_10 :
+            0u;
+        uint bitwise_xor_42 = match_21 ^ (match_39 & match_41);
+        uint match_82 = 
+            (eq_8 && (((sub_5 | 1) < 9) && eq_40)) ? match_10 :
+            0u;
+        int func_clamp_43 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 161);
+        uint slice_50 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_43)), 0).x;
+        bool eq_51 = (func_clamp_43 & 1) == 0;
+        int right_shift_44 = func_clamp_43 >> 1;
+        int right_shift_45 = (right_shift_44 * 57) >> 9;
+        int mul_46 = right_shift_45 * 9;
+        int sub_47 = right_shift_44 - mul_46;
+        int bitwise_and_48 = sub_47 & 1;
+        uint match_52 = 
+            (eq_51 && (((right_shift_45 | 1) < 9) && (bitwise_and_48 == 0))) ? match_10 :
+            0u;
+        uint bitwise_xor_53 = slice_50 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_45 ^ 1) * 9) + sub_47) * 2) + 1), 0, 161))), 0).x) & match_52);
+        int bitwise_and_49 = right_shift_45 & 1;
+        uint match_62;
+        if ((bitwise_and_48 == bitwise_and_49)) {
+            match_62 = bitwise_xor_53;
+        } else {
+            int bitwise_xor_54 = func_clamp_43 ^ 1;
+            uint slice_55 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_54)), 0).x;
+            int right_shift_56 = bitwise_xor_54 >> 1;
+            int right_shift_57 = (right_shift_56 * 57) >> 9;
+            int sub_58 = right_shift_56 - (right_shift_57 * 9);
+            uint match_59 = 
+            (((bitwise_xor_54 & 1) == 0) && (((right_shift_57 | 1) < 9) && ((sub_58 & 1) == 0))) ? match_10 :
+            0u;
+            uint bitwise_xor_60 = slice_55 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_57 ^ 1) * 9) + sub_58) * 2) + 1), 0, 161))), 0).x) & match_59);
+            uint match_61 = 
+            (eq_9 && eq_51) ? 1u :
+            0u;
+            match_62 = ((bitwise_xor_60 & (~match_61)) | ((~bitwise_xor_53) & match_61));
+        }
+        int func_clamp_63 = clamp((((mul_46 + (((sub_47 + 1) ^ 1) - 1)) * 2) + 1), 0, 161);
+        uint slice_68 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_63)), 0).x;
+        bool eq_69 = (func_clamp_63 & 1) == 0;
+        int right_shift_64 = func_clamp_63 >> 1;
+        int right_shift_65 = (right_shift_64 * 57) >> 9;
+        int sub_66 = right_shift_64 - (right_shift_65 * 9);
+        int bitwise_and_67 = sub_66 & 1;
+        uint match_70 = 
+            (eq_69 && (((right_shift_65 | 1) < 9) && (bitwise_and_67 == 0))) ? match_10 :
+            0u;
+        uint bitwise_xor_71 = slice_68 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_65 ^ 1) * 9) + sub_66) * 2) + 1), 0, 161))), 0).x) & match_70);
+        uint match_80;
+        if ((bitwise_and_67 == (right_shift_65 & 1))) {
+            match_80 = bitwise_xor_71;
+        } else {
+            int bitwise_xor_72 = func_clamp_63 ^ 1;
+            uint slice_73 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_72)), 0).x;
+            int right_shift_74 = bitwise_xor_72 >> 1;
+            int right_shift_75 = (right_shift_74 * 57) >> 9;
+            int sub_76 = right_shift_74 - (right_shift_75 * 9);
+            uint match_77 = 
+            (((bitwise_xor_72 & 1) == 0) && (((right_shift_75 | 1) < 9) && ((sub_76 & 1) == 0))) ? match_10 :
+            0u;
+            uint bitwise_xor_78 = slice_73 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_75 ^ 1) * 9) + sub_76) * 2) + 1), 0, 161))), 0).x) & match_77);
+            uint match_79 = 
+            (eq_9 && eq_69) ? 1u :
+            0u;
+            match_80 = ((bitwise_xor_78 & (~match_79)) | ((~bitwise_xor_71) & match_79));
+        }
+        uint match_81 = 
+            (eq_51 && (bitwise_and_49 == 0)) ? match_10 :
+            0u;
+        outColor = (bitwise_xor_42 ^ ((match_62 ^ (match_80 & match_81)) & match_82));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_9 = int(state_tile.x);
+        int func_int_8 = int(out_tile.x);
+        int mul_10 = (x / func_int_8) * func_int_9;
+        int mod_11 = x % func_int_8;
+        int add_12 = mul_10 + clamp(mod_11, 0, (func_int_9 - 1));
+        int func_int_13 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_14 = (y / func_int_0) * func_int_13;
+        int mod_1 = y % func_int_0;
+        int sub_15 = func_int_13 - 1;
+        uint slice_16 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(mod_1, 0, sub_15))), 0).x;
+        bool eq_18 = mod_11 == 0;
+        uint match_19 = 
+            eq_18 ? 4294967294u :
+            4294967295u;
+        bool eq_17 = (mod_1 & 1) == 0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 20165) >> 18;
+        int mul_4 = right_shift_3 * 13;
+        int sub_5 = right_shift_2 - mul_4;
+        int bitwise_and_6 = sub_5 & 1;
+        uint match_20 = 
+            (eq_17 && (((right_shift_3 | 1) < 13) && (bitwise_and_6 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_21 = slice_16 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_3 ^ 1) * 13) + sub_5) * 2) + 1), 0, sub_15))), 0).x) & match_20);
+        int bitwise_and_7 = right_shift_3 & 1;
+        uint match_30;
+        if ((bitwise_and_6 == bitwise_and_7)) {
+            match_30 = bitwise_xor_21;
+        } else {
+            int func_clamp_22 = clamp((mod_1 ^ 1), 0, sub_15);
+            uint slice_23 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_22, 0, sub_15))), 0).x;
+            int right_shift_24 = func_clamp_22 >> 1;
+            int right_shift_25 = (right_shift_24 * 20165) >> 18;
+            int sub_26 = right_shift_24 - (right_shift_25 * 13);
+            uint match_27 = 
+            (((func_clamp_22 & 1) == 0) && (((right_shift_25 | 1) < 13) && ((sub_26 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_28 = slice_23 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_25 ^ 1) * 13) + sub_26) * 2) + 1), 0, sub_15))), 0).x) & match_27);
+            uint match_29 = 
+            (eq_18 && eq_17) ? 1u :
+            0u;
+            match_30 = ((bitwise_xor_28 & (~match_29)) | ((~bitwise_xor_21) & match_29));
+        }
+        int func_clamp_31 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        uint slice_36 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_31, 0, sub_15))), 0).x;
+        bool eq_37 = (func_clamp_31 & 1) == 0;
+        int right_shift_32 = func_clamp_31 >> 1;
+        int right_shift_33 = (right_shift_32 * 20165) >> 18;
+        int sub_34 = right_shift_32 - (right_shift_33 * 13);
+        int bitwise_and_35 = sub_34 & 1;
+        uint match_38 = 
+            (eq_37 && (((right_shift_33 | 1) < 13) && (bitwise_and_35 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_39 = slice_36 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_33 ^ 1) * 13) + sub_34) * 2) + 1), 0, sub_15))), 0).x) & match_38);
+        uint match_48;
+        if ((bitwise_and_35 == (right_shift_33 & 1))) {
+            match_48 = bitwise_xor_39;
+        } else {
+            int func_clamp_40 = clamp((func_clamp_31 ^ 1), 0, sub_15);
+            uint slice_41 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_40, 0, sub_15))), 0).x;
+            int right_shift_42 = func_clamp_40 >> 1;
+            int right_shift_43 = (right_shift_42 * 20165) >> 18;
+            int sub_44 = right_shift_42 - (right_shift_43 * 13);
+            uint match_45 = 
+            (((func_clamp_40 & 1) == 0) && (((right_shift_43 | 1) < 13) && ((sub_44 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_46 = slice_41 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_43 ^ 1) * 13) + sub_44) * 2) + 1), 0, sub_15))), 0).x) & match_45);
+            uint match_47 = 
+            (eq_18 && eq_37) ? 1u :
+            0u;
+            match_48 = ((bitwise_xor_46 & (~match_47)) | ((~bitwise_xor_39) & match_47));
+        }
+        bool eq_49 = bitwise_and_7 == 0;
+        uint match_50 = 
+            (eq_17 && eq_49) ? match_19 :
+            0u;
+        uint bitwise_xor_51 = match_30 ^ (match_48 & match_50);
+        uint match_91 = 
+            (eq_17 && (((sub_5 | 1) < 13) && eq_49)) ? match_19 :
+            0u;
+        int func_clamp_52 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, sub_15);
+        uint slice_59 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_52, 0, sub_15))), 0).x;
+        bool eq_60 = (func_clamp_52 & 1) == 0;
+        int right_shift_53 = func_clamp_52 >> 1;
+        int right_shift_54 = (right_shift_53 * 20165) >> 18;
+        int mul_55 = right_shift_54 * 13;
+        int sub_56 = right_shift_53 - mul_55;
+        int bitwise_and_57 = sub_56 & 1;
+        uint match_61 = 
+            (eq_60 && (((right_shift_54 | 1) < 13) && (bitwise_and_57 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_62 = slice_59 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_54 ^ 1) * 13) + sub_56) * 2) + 1), 0, sub_15))), 0).x) & match_61);
+        int bitwise_and_58 = right_shift_54 & 1;
+        uint match_71;
+        if ((bitwise_and_57 == bitwise_and_58)) {
+            match_71 = bitwise_xor_62;
+        } else {
+            int func_clamp_63 = clamp((func_clamp_52 ^ 1), 0, sub_15);
+            uint slice_64 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_63, 0, sub_15))), 0).x;
+            int right_shift_65 = func_clamp_63 >> 1;
+            int right_shift_66 = (right_shift_65 * 20165) >> 18;
+            int sub_67 = right_shift_65 - (right_shift_66 * 13);
+            uint match_68 = 
+            (((func_clamp_63 & 1) == 0) && (((right_shift_66 | 1) < 13) && ((sub_67 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_69 = slice_64 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_66 ^ 1) * 13) + sub_67) * 2) + 1), 0, sub_15))), 0).x) & match_68);
+            uint match_70 = 
+            (eq_18 && eq_60) ? 1u :
+            0u;
+            match_71 = ((bitwise_xor_69 & (~match_70)) | ((~bitwise_xor_62) & match_70));
+        }
+        int func_clamp_72 = clamp((((mul_55 + (((sub_56 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_15);
+        uint slice_77 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_72, 0, sub_15))), 0).x;
+        bool eq_78 = (func_clamp_72 & 1) == 0;
+        int right_shift_73 = func_clamp_72 >> 1;
+        int right_shift_74 = (right_shift_73 * 20165) >> 18;
+        int sub_75 = right_shift_73 - (right_shift_74 * 13);
+        int bitwise_and_76 = sub_75 & 1;
+        uint match_79 = 
+            (eq_78 && (((right_shift_74 | 1) < 13) && (bitwise_and_76 == 0))) ? match_19 :
+            0u;
+        uint bitwise_xor_80 = slice_77 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_74 ^ 1) * 13) + sub_75) * 2) + 1), 0, sub_15))), 0).x) & match_79);
+        uint match_89;
+        if ((bitwise_and_76 == (right_shift_74 & 1))) {
+            match_89 = bitwise_xor_80;
+        } else {
+            int func_clamp_81 = clamp((func_clamp_72 ^ 1), 0, sub_15);
+            uint slice_82 = texelFetch(state, ivec2(add_12, (mul_14 + clamp(func_clamp_81, 0, sub_15))), 0).x;
+            int right_shift_83 = func_clamp_81 >> 1;
+            int right_shift_84 = (right_shift_83 * 20165) >> 18;
+            int sub_85 = right_shift_83 - (right_shift_84 * 13);
+            uint match_86 = 
+            (((func_clamp_81 & 1) == 0) && (((right_shift_84 | 1) < 13) && ((sub_85 & 1) == 0))) ? match_19 :
+            0u;
+            uint bitwise_xor_87 = slice_82 ^ ((texelFetch(state, ivec2(add_12, (mul_14 + clamp((((((right_shift_84 ^ 1) * 13) + sub_85) * 2) + 1), 0, sub_15))), 0).x) & match_86);
+            uint match_88 = 
+            (eq_18 && eq_78) ? 1u :
+            0u;
+            match_89 = ((bitwise_xor_87 & (~match_88)) | ((~bitwise_xor_80) & match_88));
+        }
+        uint match_90 = 
+            (eq_60 && (bitwise_and_58 == 0)) ? match_19 :
+            0u;
+        outColor = (bitwise_xor_51 ^ ((match_71 ^ (match_89 & match_90)) & match_91));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height13_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int sub_11 = int(state_size.y) - 1;
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_7 = x == 0;
+        uint match_8 = 
+            eq_7 ? 4294967294u :
+            4294967295u;
+        bool eq_6 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        int mul_2 = right_shift_1 * 13;
+        int sub_3 = right_shift_0 - mul_2;
+        int bitwise_and_4 = sub_3 & 1;
+        uint match_9 = 
+            (eq_6 && (((right_shift_1 | 1) < 13) && (bitwise_and_4 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_10 = v_state ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 13) + sub_3) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_9);
+        int bitwise_and_5 = right_shift_1 & 1;
+        uint match_20;
+        if ((bitwise_and_4 == bitwise_and_5)) {
+            match_20 = bitwise_xor_10;
+        } else {
+            int func_clamp_12 = clamp((y ^ 1), 0, sub_11);
+            uint slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_14 = func_clamp_12 >> 1;
+            int right_shift_15 = (right_shift_14 * 20165) >> 18;
+            int sub_16 = right_shift_14 - (right_shift_15 * 13);
+            uint match_17 = 
+            (((func_clamp_12 & 1) == 0) && (((right_shift_15 | 1) < 13) && ((sub_16 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_18 = slice_13 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_15 ^ 1) * 13) + sub_16) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_17);
+            uint match_19 = 
+            (eq_7 && eq_6) ? 1u :
+            0u;
+            match_20 = ((bitwise_xor_18 & (~match_19)) | ((~bitwise_xor_10) & match_19));
+        }
+        int func_clamp_21 = clamp((((mul_2 + (((sub_3 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_11);
+        uint slice_26 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_27 = (func_clamp_21 & 1) == 0;
+        int right_shift_22 = func_clamp_21 >> 1;
+        int right_shift_23 = (right_shift_22 * 20165) >> 18;
+        int sub_24 = right_shift_22 - (right_shift_23 * 13);
+        int bitwise_and_25 = sub_24 & 1;
+        uint match_28 = 
+            (eq_27 && (((right_shift_23 | 1) < 13) && (bitwise_and_25 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_29 = slice_26 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_23 ^ 1) * 13) + sub_24) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_28);
+        uint match_38;
+        if ((bitwise_and_25 == (right_shift_23 & 1))) {
+            match_38 = bitwise_xor_29;
+        } else {
+            int func_clamp_30 = clamp((func_clamp_21 ^ 1), 0, sub_11);
+            uint slice_31 = texelFetch(state, clamp(ivec2(x, func_clamp_30), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_32 = func_clamp_30 >> 1;
+            int right_shift_33 = (right_shift_32 * 20165) >> 18;
+            int sub_34 = right_shift_32 - (right_shift_33 * 13);
+            uint match_35 = 
+            (((func_clamp_30 & 1) == 0) && (((right_shift_33 | 1) < 13) && ((sub_34 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_36 = slice_31 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_33 ^ 1) * 13) + sub_34) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_35);
+            uint match_37 = 
+            (eq_7 && eq_27) ? 1u :
+            0u;
+            match_38 = ((bitwise_xor_36 & (~match_37)) | ((~bitwise_xor_29) & match_37));
+        }
+        bool eq_39 = bitwise_and_5 == 0;
+        uint match_40 = 
+            (eq_6 && eq_39) ? match_8 :
+            0u;
+        uint bitwise_xor_41 = match_20 ^ (match_38 & match_40);
+        uint match_81 = 
+            (eq_6 && (((sub_3 | 1) < 13) && eq_39)) ? match_8 :
+            0u;
+        int func_clamp_42 = clamp((((mul_2 + (sub_3 ^ 1)) * 2) + 1), 0, sub_11);
+        uint slice_49 = texelFetch(state, clamp(ivec2(x, func_clamp_42), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_50 = (func_clamp_42 & 1) == 0;
+        int right_shift_43 = func_clamp_42 >> 1;
+        int right_shift_44 = (right_shift_43 * 20165) >> 18;
+        int mul_45 = right_shift_44 * 13;
+        int sub_46 = right_shift_43 - mul_45;
+        int bitwise_and_47 = sub_46 & 1;
+        uint match_51 = 
+            (eq_50 && (((right_shift_44 | 1) < 13) && (bitwise_and_47 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_52 = slice_49 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_44 ^ 1) * 13) + sub_46) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_51);
+        int bitwise_and_48 = right_shift_44 & 1;
+        uint match_61;
+        if ((bitwise_and_47 == bitwise_and_48)) {
+            match_61 = bitwise_xor_52;
+        } else {
+            int func_clamp_53 = clamp((func_clamp_42 ^ 1), 0, sub_11);
+            uint slice_54 = texelFetch(state, clamp(ivec2(x, func_clamp_53), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_55 = func_clamp_53 >> 1;
+            int right_shift_56 = (right_shift_55 * 20165) >> 18;
+            int sub_57 = right_shift_55 - (right_shift_56 * 13);
+            uint match_58 = 
+            (((func_clamp_53 & 1) == 0) && (((right_shift_56 | 1) < 13) && ((sub_57 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_59 = slice_54 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_56 ^ 1) * 13) + sub_57) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_58);
+            uint match_60 = 
+            (eq_7 && eq_50) ? 1u :
+            0u;
+            match_61 = ((bitwise_xor_59 & (~match_60)) | ((~bitwise_xor_52) & match_60));
+        }
+        int func_clamp_62 = clamp((((mul_45 + (((sub_46 + 1) ^ 1) - 1)) * 2) + 1), 0, sub_11);
+        uint slice_67 = texelFetch(state, clamp(ivec2(x, func_clamp_62), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_68 = (func_clamp_62 & 1) == 0;
+        int right_shift_63 = func_clamp_62 >> 1;
+        int right_shift_64 = (right_shift_63 * 20165) >> 18;
+        int sub_65 = right_shift_63 - (right_shift_64 * 13);
+        int bitwise_and_66 = sub_65 & 1;
+        uint match_69 = 
+            (eq_68 && (((right_shift_64 | 1) < 13) && (bitwise_and_66 == 0))) ? match_8 :
+            0u;
+        uint bitwise_xor_70 = slice_67 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_64 ^ 1) * 13) + sub_65) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_69);
+        uint match_79;
+        if ((bitwise_and_66 == (right_shift_64 & 1))) {
+            match_79 = bitwise_xor_70;
+        } else {
+            int func_clamp_71 = clamp((func_clamp_62 ^ 1), 0, sub_11);
+            uint slice_72 = texelFetch(state, clamp(ivec2(x, func_clamp_71), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_73 = func_clamp_71 >> 1;
+            int right_shift_74 = (right_shift_73 * 20165) >> 18;
+            int sub_75 = right_shift_73 - (right_shift_74 * 13);
+            uint match_76 = 
+            (((func_clamp_71 & 1) == 0) && (((right_shift_74 | 1) < 13) && ((sub_75 & 1) == 0))) ? match_8 :
+            0u;
+            uint bitwise_xor_77 = slice_72 ^ ((texelFetch(state, clamp(ivec2(x, (((((right_shift_74 ^ 1) * 13) + sub_75) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_76);
+            uint match_78 = 
+            (eq_7 && eq_68) ? 1u :
+            0u;
+            match_79 = ((bitwise_xor_77 & (~match_78)) | ((~bitwise_xor_70) & match_78));
+        }
+        uint match_80 = 
+            (eq_50 && (bitwise_and_48 == 0)) ? match_8 :
+            0u;
+        outColor = (bitwise_xor_41 ^ ((match_61 ^ (match_79 & match_80)) & match_81));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass1_surface_height13_surface_width13_out_tile6x338_state_tile6x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        bool eq_9 = (x - (int(((float(x) + 0.5) * 0.1666666716337204)) * 6)) == 0;
+        uint match_10 = 
+            eq_9 ? 4294967294u :
+            4294967295u;
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        bool eq_8 = (sub_1 & 1) == 0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        int mul_4 = right_shift_3 * 13;
+        int sub_5 = right_shift_2 - mul_4;
+        int bitwise_and_6 = sub_5 & 1;
+        uint match_11 = 
+            (eq_8 && (((right_shift_3 | 1) < 13) && (bitwise_and_6 == 0))) ? match_10 :
+            0u;
+        uint bitwise_xor_12 = v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 13) + sub_5) * 2) + 1), 0, 337))), 0).x) & match_11);
+        int bitwise_and_7 = right_shift_3 & 1;
+        uint match_21;
+        if ((bitwise_and_6 == bitwise_and_7)) {
+            match_21 = bitwise_xor_12;
+        } else {
+            int bitwise_xor_13 = sub_1 ^ 1;
+            uint slice_14 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_13)), 0).x;
+            int right_shift_15 = bitwise_xor_13 >> 1;
+            int right_shift_16 = (right_shift_15 * 79) >> 10;
+            int sub_17 = right_shift_15 - (right_shift_16 * 13);
+            uint match_18 = 
+            (((bitwise_xor_13 & 1) == 0) && (((right_shift_16 | 1) < 13) && ((sub_17 & 1) == 0))) ? match_10 :
+            0u;
+            uint bitwise_xor_19 = slice_14 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_16 ^ 1) * 13) + sub_17) * 2) + 1), 0, 337))), 0).x) & match_18);
+            uint match_20 = 
+            (eq_9 && eq_8) ? 1u :
+            0u;
+            match_21 = ((bitwise_xor_19 & (~match_20)) | ((~bitwise_xor_12) & match_20));
+        }
+        int func_clamp_22 = clamp((((mul_4 + (((sub_5 + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        uint slice_27 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_22)), 0).x;
+        bool eq_28 = (func_clamp_22 & 1) == 0;
+        int right_shift_23 = func_clamp_22 >> 1;
+        int right_shift_24 = (right_shift_23 * 79) >> 10;
+        int sub_25 = right_shift_23 - (right_shift_24 * 13);
+        int bitwise_and_26 = sub_25 & 1;
+        uint match_29 = 
+            (eq_28 && (((right_shift_24 | 1) < 13) && (bitwise_and_26 == 0))) ? match_10 :
+            0u;
+        uint bitwise_xor_30 = slice_27 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_24 ^ 1) * 13) + sub_25) * 2) + 1), 0, 337))), 0).x) & match_29);
+        uint match_39;
+        if ((bitwise_and_26 == (right_shift_24 & 1))) {
+            match_39 = bitwise_xor_30;
+        } else {
+            int bitwise_xor_31 = func_clamp_22 ^ 1;
+            uint slice_32 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_31)), 0).x;
+            int right_shift_33 = bitwise_xor_31 >> 1;
+            int right_shift_34 = (right_shift_33 * 79) >> 10;
+            int sub_35 = right_shift_33 - (right_shift_34 * 13);
+            uint match_36 = 
+            (((bitwise_xor_31 & 1) == 0) && (((right_shift_34 | 1) < 13) && ((sub_35 & 1) == 0))) ? match_10 :
+            0u;
+            uint bitwise_xor_37 = slice_32 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_34 ^ 1) * 13) + sub_35) * 2) + 1), 0, 337))), 0).x) & match_36);
+            uint match_38 = 
+            (eq_9 && eq_28) ? 1u :
+            0u;
+            match_39 = ((bitwise_xor_37 & (~match_38)) | ((~bitwise_xor_30) & match_38));
+        }
+        bool eq_40 = bitwise_and_7 == 0;
+        uint match_41 = 
+            (eq_8 && eq_40) ? match_10 :
+            0u;
+        uint bitwise_xor_42 = match_21 ^ (match_39 & match_41);
+        uint match_82 = 
+            (eq_8 && (((sub_5 | 1) < 13) && eq_40)) ? match_10 :
+            0u;
+        int func_clamp_43 = clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 337);
+        uint slice_50 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_43)), 0).x;
+        bool eq_51 = (func_clamp_43 & 1) == 0;
+        int right_shift_44 = func_clamp_43 >> 1;
+        int right_shift_45 = (right_shift_44 * 79) >> 10;
+        int mul_46 = right_shift_45 * 13;
+        int sub_47 = right_shift_44 - mul_46;
+        int bitwise_and_48 = sub_47 & 1;
+        uint match_52 = 
+            (eq_51 && (((right_shift_45 | 1) < 13) && (bitwise_and_48 == 0))) ? match_10 :
+            0u;
+        uint bitwise_xor_53 = slice_50 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_45 ^ 1) * 13) + sub_47) * 2) + 1), 0, 337))), 0).x) & match_52);
+        int bitwise_and_49 = right_shift_45 & 1;
+        uint match_62;
+        if ((bitwise_and_48 == bitwise_and_49)) {
+            match_62 = bitwise_xor_53;
+        } else {
+            int bitwise_xor_54 = func_clamp_43 ^ 1;
+            uint slice_55 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_54)), 0).x;
+            int right_shift_56 = bitwise_xor_54 >> 1;
+            int right_shift_57 = (right_shift_56 * 79) >> 10;
+            int sub_58 = right_shift_56 - (right_shift_57 * 13);
+            uint match_59 = 
+            (((bitwise_xor_54 & 1) == 0) && (((right_shift_57 | 1) < 13) && ((sub_58 & 1) == 0))) ? match_10 :
+            0u;
+            uint bitwise_xor_60 = slice_55 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_57 ^ 1) * 13) + sub_58) * 2) + 1), 0, 337))), 0).x) & match_59);
+            uint match_61 = 
+            (eq_9 && eq_51) ? 1u :
+            0u;
+            match_62 = ((bitwise_xor_60 & (~match_61)) | ((~bitwise_xor_53) & match_61));
+        }
+        int func_clamp_63 = clamp((((mul_46 + (((sub_47 + 1) ^ 1) - 1)) * 2) + 1), 0, 337);
+        uint slice_68 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_63)), 0).x;
+        bool eq_69 = (func_clamp_63 & 1) == 0;
+        int right_shift_64 = func_clamp_63 >> 1;
+        int right_shift_65 = (right_shift_64 * 79) >> 10;
+        int sub_66 = right_shift_64 - (right_shift_65 * 13);
+        int bitwise_and_67 = sub_66 & 1;
+        uint match_70 = 
+            (eq_69 && (((right_shift_65 | 1) < 13) && (bitwise_and_67 == 0))) ? match_10 :
+            0u;
+        uint bitwise_xor_71 = slice_68 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_65 ^ 1) * 13) + sub_66) * 2) + 1), 0, 337))), 0).x) & match_70);
+        uint match_80;
+        if ((bitwise_and_67 == (right_shift_65 & 1))) {
+            match_80 = bitwise_xor_71;
+        } else {
+            int bitwise_xor_72 = func_clamp_63 ^ 1;
+            uint slice_73 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_72)), 0).x;
+            int right_shift_74 = bitwise_xor_72 >> 1;
+            int right_shift_75 = (right_shift_74 * 79) >> 10;
+            int sub_76 = right_shift_74 - (right_shift_75 * 13);
+            uint match_77 = 
+            (((bitwise_xor_72 & 1) == 0) && (((right_shift_75 | 1) < 13) && ((sub_76 & 1) == 0))) ? match_10 :
+            0u;
+            uint bitwise_xor_78 = slice_73 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_75 ^ 1) * 13) + sub_76) * 2) + 1), 0, 337))), 0).x) & match_77);
+            uint match_79 = 
+            (eq_9 && eq_69) ? 1u :
+            0u;
+            match_80 = ((bitwise_xor_78 & (~match_79)) | ((~bitwise_xor_71) & match_79));
+        }
+        uint match_81 = 
+            (eq_51 && (bitwise_and_49 == 0)) ? match_10 :
+            0u;
+        outColor = (bitwise_xor_42 ^ ((match_62 ^ (match_80 & match_81)) & match_82));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+registerLayered(surfaceCyclePackedPass1, surfaceCyclePackedPass1Layered);
+registerSingleShot(surfaceCyclePackedPass1, surfaceCyclePackedPass1SingleShot);
+registerVariant(surfaceCyclePackedPass1, {surface_height: 5, surface_width: 5}, surfaceCyclePackedPass1_surface_height5_surface_width5);
+registerLayered(surfaceCyclePackedPass1_surface_height5_surface_width5, surfaceCyclePackedPass1Layered);
+registerSingleShot(surfaceCyclePackedPass1_surface_height5_surface_width5, surfaceCyclePackedPass1_surface_height5_surface_width5SingleShot);
+registerVariant(surfaceCyclePackedPass1_surface_height5_surface_width5, {out_tile: [1, 50], state_tile: [1, 50]}, surfaceCyclePackedPass1_surface_height5_surface_width5_out_tile1x50_state_tile1x50);
+registerVariant(surfaceCyclePackedPass1, {surface_height: 9, surface_width: 9}, surfaceCyclePackedPass1_surface_height9_surface_width9);
+registerLayered(surfaceCyclePackedPass1_surface_height9_surface_width9, surfaceCyclePackedPass1Layered);
+registerSingleShot(surfaceCyclePackedPass1_surface_height9_surface_width9, surfaceCyclePackedPass1_surface_height9_surface_width9SingleShot);
+registerVariant(surfaceCyclePackedPass1_surface_height9_surface_width9, {out_tile: [3, 162], state_tile: [3, 162]}, surfaceCyclePackedPass1_surface_height9_surface_width9_out_tile3x162_state_tile3x162);
+registerVariant(surfaceCyclePackedPass1, {surface_height: 13, surface_width: 13}, surfaceCyclePackedPass1_surface_height13_surface_width13);
+registerLayered(surfaceCyclePackedPass1_surface_height13_surface_width13, surfaceCyclePackedPass1Layered);
+registerSingleShot(surfaceCyclePackedPass1_surface_height13_surface_width13, surfaceCyclePackedPass1_surface_height13_surface_width13SingleShot);
+registerVariant(surfaceCyclePackedPass1_surface_height13_surface_width13, {out_tile: [6, 338], state_tile: [6, 338]}, surfaceCyclePackedPass1_surface_height13_surface_width13_out_tile6x338_state_tile6x338);
+
+let surfaceCyclePackedPass2 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    uniform int surface_height;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.x);
+        int func_int_6 = int(out_tile.x);
+        int mul_8 = (x / func_int_6) * func_int_7;
+        int mod_9 = x % func_int_6;
+        int add_10 = mul_8 + clamp(mod_9, 0, (func_int_7 - 1));
+        int func_int_11 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_12 = (y / func_int_0) * func_int_11;
+        int mod_1 = y % func_int_0;
+        int sub_13 = func_int_11 - 1;
+        uint slice_14 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(mod_1, 0, sub_13))), 0).x;
+        bool eq_18 = mod_9 == 0;
+        uint match_19 = 
+            eq_18 ? 4294967294u :
+            4294967295u;
+        bool eq_16 = (mod_1 & 1) == 0;
+        int right_shift_2 = mod_1 >> 1;
+        int mod_3 = right_shift_2 % surface_width;
+        int bitwise_and_4 = mod_3 & 1;
+        bool eq_17 = bitwise_and_4 == 1;
+        int divide_5 = right_shift_2 / surface_width;
+        int add_15 = divide_5 + 1;
+        uint match_20 = 
+            (eq_16 && ((((add_15 | 1) - 1) < surface_height) && eq_17)) ? match_19 :
+            0u;
+        uint bitwise_xor_21 = slice_14 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_15 ^ 1) - 1) * surface_width) + mod_3) * 2) + 1), 0, sub_13))), 0).x) & match_20);
+        uint match_28 = 
+            (eq_16 && (((divide_5 | 1) < surface_height) && eq_17)) ? match_19 :
+            0u;
+        int func_clamp_22 = clamp((((((divide_5 ^ 1) * surface_width) + mod_3) * 2) + 1), 0, sub_13);
+        uint slice_23 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_22, 0, sub_13))), 0).x;
+        int right_shift_24 = func_clamp_22 >> 1;
+        int add_25 = (right_shift_24 / surface_width) + 1;
+        int mod_26 = right_shift_24 % surface_width;
+        uint match_27 = 
+            (((func_clamp_22 & 1) == 0) && ((((add_25 | 1) - 1) < surface_height) && ((mod_26 & 1) == 1))) ? match_19 :
+            0u;
+        uint bitwise_xor_29 = bitwise_xor_21 ^ ((slice_23 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_25 ^ 1) - 1) * surface_width) + mod_26) * 2) + 1), 0, sub_13))), 0).x) & match_27)) & match_28);
+        uint match_49;
+        if ((bitwise_and_4 != (divide_5 & 1))) {
+            match_49 = bitwise_xor_29;
+        } else {
+            int func_clamp_30 = clamp((mod_1 ^ 1), 0, sub_13);
+            uint slice_31 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_30, 0, sub_13))), 0).x;
+            bool eq_36 = (func_clamp_30 & 1) == 0;
+            int right_shift_32 = func_clamp_30 >> 1;
+            int mod_35 = right_shift_32 % surface_width;
+            bool eq_37 = (mod_35 & 1) == 1;
+            int divide_33 = right_shift_32 / surface_width;
+            int add_34 = divide_33 + 1;
+            uint match_38 = 
+            (eq_36 && ((((add_34 | 1) - 1) < surface_height) && eq_37)) ? match_19 :
+            0u;
+            uint bitwise_xor_39 = slice_31 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_34 ^ 1) - 1) * surface_width) + mod_35) * 2) + 1), 0, sub_13))), 0).x) & match_38);
+            uint match_46 = 
+            (eq_36 && (((divide_33 | 1) < surface_height) && eq_37)) ? match_19 :
+            0u;
+            int func_clamp_40 = clamp((((((divide_33 ^ 1) * surface_width) + mod_35) * 2) + 1), 0, sub_13);
+            uint slice_41 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_40, 0, sub_13))), 0).x;
+            int right_shift_42 = func_clamp_40 >> 1;
+            int add_43 = (right_shift_42 / surface_width) + 1;
+            int mod_44 = right_shift_42 % surface_width;
+            uint match_45 = 
+            (((func_clamp_40 & 1) == 0) && ((((add_43 | 1) - 1) < surface_height) && ((mod_44 & 1) == 1))) ? match_19 :
+            0u;
+            uint bitwise_xor_47 = bitwise_xor_39 ^ ((slice_41 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_43 ^ 1) - 1) * surface_width) + mod_44) * 2) + 1), 0, sub_13))), 0).x) & match_45)) & match_46);
+            uint match_48 = 
+            (eq_18 && eq_16) ? 1u :
+            0u;
+            match_49 = ((bitwise_xor_47 & (~match_48)) | ((~bitwise_xor_29) & match_48));
+        }
+        outColor = match_49;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2Layered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform int surface_width;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp usampler2DArray state;
+    uniform int surface_height;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_9 = int(state_tile.x);
+        int add_7 = x + int(out_origin.x);
+        int func_int_8 = int(out_tile.x);
+        int mul_10 = (add_7 / func_int_8) * func_int_9;
+        int mod_11 = add_7 % func_int_8;
+        int add_12 = mul_10 + clamp(mod_11, 0, (func_int_9 - 1));
+        int func_int_13 = int(state_size.x);
+        int func_clamp_14 = clamp(add_12, 0, (func_int_13 - 1));
+        int func_int_15 = int(state_layer.x);
+        int mod_16 = func_clamp_14 % func_int_15;
+        int sub_20 = int(state_size.y) - 1;
+        int func_int_17 = int(state_tile.y);
+        int add_0 = y + int(out_origin.y);
+        int func_int_1 = int(out_tile.y);
+        int mul_18 = (add_0 / func_int_1) * func_int_17;
+        int mod_2 = add_0 % func_int_1;
+        int sub_19 = func_int_17 - 1;
+        int func_clamp_21 = clamp((mul_18 + clamp(mod_2, 0, sub_19)), 0, sub_20);
+        int func_int_22 = int(state_layer.y);
+        int mod_23 = func_clamp_21 % func_int_22;
+        int divide_25 = func_clamp_14 / func_int_15;
+        int divide_24 = ((func_int_13 + func_int_15) - 1) / func_int_15;
+        uint fetch_26 = texelFetch(state, ivec3(mod_16, mod_23, (((func_clamp_21 / func_int_22) * divide_24) + divide_25)), 0).x;
+        bool eq_31 = mod_11 == 0;
+        uint match_32 = 
+            eq_31 ? 4294967294u :
+            4294967295u;
+        bool eq_29 = (mod_2 & 1) == 0;
+        int right_shift_3 = mod_2 >> 1;
+        int mod_4 = right_shift_3 % surface_width;
+        int bitwise_and_5 = mod_4 & 1;
+        bool eq_30 = bitwise_and_5 == 1;
+        int divide_6 = right_shift_3 / surface_width;
+        int add_27 = divide_6 + 1;
+        uint match_33 = 
+            (eq_29 && ((((add_27 | 1) - 1) < surface_height) && eq_30)) ? match_32 :
+            0u;
+        int func_clamp_28 = clamp((mul_18 + clamp(((((((add_27 ^ 1) - 1) * surface_width) + mod_4) * 2) + 1), 0, sub_19)), 0, sub_20);
+        uint bitwise_xor_34 = fetch_26 ^ ((texelFetch(state, ivec3(mod_16, (func_clamp_28 % func_int_22), (((func_clamp_28 / func_int_22) * divide_24) + divide_25)), 0).x) & match_33);
+        uint match_43 = 
+            (eq_29 && (((divide_6 | 1) < surface_height) && eq_30)) ? match_32 :
+            0u;
+        int func_clamp_35 = clamp((((((divide_6 ^ 1) * surface_width) + mod_4) * 2) + 1), 0, sub_19);
+        int func_clamp_36 = clamp((mul_18 + clamp(func_clamp_35, 0, sub_19)), 0, sub_20);
+        uint fetch_37 = texelFetch(state, ivec3(mod_16, (func_clamp_36 % func_int_22), (((func_clamp_36 / func_int_22) * divide_24) + divide_25)), 0).x;
+        int right_shift_38 = func_clamp_35 >> 1;
+        int add_39 = (right_shift_38 / surface_width) + 1;
+        int mod_40 = right_shift_38 % surface_width;
+        uint match_42 = 
+            (((func_clamp_35 & 1) == 0) && ((((add_39 | 1) - 1) < surface_height) && ((mod_40 & 1) == 1))) ? match_32 :
+            0u;
+        int func_clamp_41 = clamp((mul_18 + clamp(((((((add_39 ^ 1) - 1) * surface_width) + mod_40) * 2) + 1), 0, sub_19)), 0, sub_20);
+        uint bitwise_xor_44 = bitwise_xor_34 ^ ((fetch_37 ^ ((texelFetch(state, ivec3(mod_16, (func_clamp_41 % func_int_22), (((func_clamp_41 / func_int_22) * divide_24) + divide_25)), 0).x) & match_42)) & match_43);
+        uint match_68;
+        if ((bitwise_and_5 != (divide_6 & 1))) {
+            match_68 = bitwise_xor_44;
+        } else {
+            int func_clamp_45 = clamp((mod_2 ^ 1), 0, sub_19);
+            int func_clamp_46 = clamp((mul_18 + clamp(func_clamp_45, 0, sub_19)), 0, sub_20);
+            uint fetch_47 = texelFetch(state, ivec3(mod_16, (func_clamp_46 % func_int_22), (((func_clamp_46 / func_int_22) * divide_24) + divide_25)), 0).x;
+            bool eq_53 = (func_clamp_45 & 1) == 0;
+            int right_shift_48 = func_clamp_45 >> 1;
+            int mod_51 = right_shift_48 % surface_width;
+            bool eq_54 = (mod_51 & 1) == 1;
+            int divide_49 = right_shift_48 / surface_width;
+            int add_50 = divide_49 + 1;
+            uint match_55 = 
+            (eq_53 && ((((add_50 | 1) - 1) < surface_height) && eq_54)) ? match_32 :
+            0u;
+            int func_clamp_52 = clamp((mul_18 + clamp(((((((add_50 ^ 1) - 1) * surface_width) + mod_51) * 2) + 1), 0, sub_19)), 0, sub_20);
+            uint bitwise_xor_56 = fetch_47 ^ ((texelFetch(state, ivec3(mod_16, (func_clamp_52 % func_int_22), (((func_clamp_52 / func_int_22) * divide_24) + divide_25)), 0).x) & match_55);
+            uint match_65 = 
+            (eq_53 && (((divide_49 | 1) < surface_height) && eq_54)) ? match_32 :
+            0u;
+            int func_clamp_57 = clamp((((((divide_49 ^ 1) * surface_width) + mod_51) * 2) + 1), 0, sub_19);
+            int func_clamp_58 = clamp((mul_18 + clamp(func_clamp_57, 0, sub_19)), 0, sub_20);
+            uint fetch_59 = texelFetch(state, ivec3(mod_16, (func_clamp_58 % func_int_22), (((func_clamp_58 / func_int_22) * divide_24) + divide_25)), 0).x;
+            int right_shift_60 = func_clamp_57 >> 1;
+            int add_61 = (right_shift_60 / surface_width) + 1;
+            int mod_62 = right_shift_60 % surface_width;
+            uint match_64 = 
+            (((func_clamp_57 & 1) == 0) && ((((add_61 | 1) - 1) < surface_height) && ((mod_62 & 1) == 1))) ? match_32 :
+            0u;
+            int func_clamp_63 = clamp((mul_18 + clamp(((((((add_61 ^ 1) - 1) * surface_width) + mod_62) * 2) + 1), 0, sub_19)), 0, sub_20);
+            uint bitwise_xor_66 = bitwise_xor_56 ^ ((fetch_59 ^ ((texelFetch(state, ivec3(mod_16, (func_clamp_63 % func_int_22), (((func_clamp_63 / func_int_22) * divide_24) + divide_25)), 0).x) & match_64)) & match_65);
+            uint match_67 = 
+            (eq_31 && eq_29) ? 1u :
+            0u;
+            match_68 = ((bitwise_xor_66 & (~match_67)) | ((~bitwise_xor_44) & match_67));
+        }
+        outColor = match_68;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCyclePackedPass2SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform int surface_width;
+    uniform highp usampler2D state;
+    uniform int surface_height;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_7 = x == 0;
+        uint match_8 = 
+            eq_7 ? 4294967294u :
+            4294967295u;
+        bool eq_5 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int mod_1 = right_shift_0 % surface_width;
+        int bitwise_and_2 = mod_1 & 1;
+        bool eq_6 = bitwise_and_2 == 1;
+        int divide_3 = right_shift_0 / surface_width;
+        int add_4 = divide_3 + 1;
+        uint match_9 = 
+            (eq_5 && ((((add_4 | 1) - 1) < surface_height) && eq_6)) ? match_8 :
+            0u;
+        uint bitwise_xor_10 = v_state ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_4 ^ 1) - 1) * surface_width) + mod_1) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_9);
+        uint match_18 = 
+            (eq_5 && (((divide_3 | 1) < surface_height) && eq_6)) ? match_8 :
+            0u;
+        int sub_11 = int(state_size.y) - 1;
+        int func_clamp_12 = clamp((((((divide_3 ^ 1) * surface_width) + mod_1) * 2) + 1), 0, sub_11);
+        uint slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int add_15 = (right_shift_14 / surface_width) + 1;
+        int mod_16 = right_shift_14 % surface_width;
+        uint match_17 = 
+            (((func_clamp_12 & 1) == 0) && ((((add_15 | 1) - 1) < surface_height) && ((mod_16 & 1) == 1))) ? match_8 :
+            0u;
+        uint bitwise_xor_19 = bitwise_xor_10 ^ ((slice_13 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_15 ^ 1) - 1) * surface_width) + mod_16) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_17)) & match_18);
+        uint match_39;
+        if ((bitwise_and_2 != (divide_3 & 1))) {
+            match_39 = bitwise_xor_19;
+        } else {
+            int func_clamp_20 = clamp((y ^ 1), 0, sub_11);
+            uint slice_21 = texelFetch(state, clamp(ivec2(x, func_clamp_20), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            bool eq_26 = (func_clamp_20 & 1) == 0;
+            int right_shift_22 = func_clamp_20 >> 1;
+            int mod_25 = right_shift_22 % surface_width;
+            bool eq_27 = (mod_25 & 1) == 1;
+            int divide_23 = right_shift_22 / surface_width;
+            int add_24 = divide_23 + 1;
+            uint match_28 = 
+            (eq_26 && ((((add_24 | 1) - 1) < surface_height) && eq_27)) ? match_8 :
+            0u;
+            uint bitwise_xor_29 = slice_21 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_24 ^ 1) - 1) * surface_width) + mod_25) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_28);
+            uint match_36 = 
+            (eq_26 && (((divide_23 | 1) < surface_height) && eq_27)) ? match_8 :
+            0u;
+            int func_clamp_30 = clamp((((((divide_23 ^ 1) * surface_width) + mod_25) * 2) + 1), 0, sub_11);
+            uint slice_31 = texelFetch(state, clamp(ivec2(x, func_clamp_30), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_32 = func_clamp_30 >> 1;
+            int add_33 = (right_shift_32 / surface_width) + 1;
+            int mod_34 = right_shift_32 % surface_width;
+            uint match_35 = 
+            (((func_clamp_30 & 1) == 0) && ((((add_33 | 1) - 1) < surface_height) && ((mod_34 & 1) == 1))) ? match_8 :
+            0u;
+            uint bitwise_xor_37 = bitwise_xor_29 ^ ((slice_31 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_33 ^ 1) - 1) * surface_width) + mod_34) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_35)) & match_36);
+            uint match_38 = 
+            (eq_7 && eq_5) ? 1u :
+            0u;
+            match_39 = ((bitwise_xor_37 & (~match_38)) | ((~bitwise_xor_19) & match_38));
+        }
+        outColor = match_39;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.x);
+        int func_int_6 = int(out_tile.x);
+        int mul_8 = (x / func_int_6) * func_int_7;
+        int mod_9 = x % func_int_6;
+        int add_10 = mul_8 + clamp(mod_9, 0, (func_int_7 - 1));
+        int func_int_11 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_12 = (y / func_int_0) * func_int_11;
+        int mod_1 = y % func_int_0;
+        int sub_13 = func_int_11 - 1;
+        uint slice_14 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(mod_1, 0, sub_13))), 0).x;
+        bool eq_18 = mod_9 == 0;
+        uint match_19 = 
+            eq_18 ? 4294967294u :
+            4294967295u;
+        bool eq_16 = (mod_1 & 1) == 0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 26215) >> 17;
+        int sub_4 = right_shift_2 - (right_shift_3 * 5);
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_17 = bitwise_and_5 == 1;
+        int add_15 = right_shift_3 + 1;
+        uint match_20 = 
+            (eq_16 && ((((add_15 | 1) - 1) < 5) && eq_17)) ? match_19 :
+            0u;
+        uint bitwise_xor_21 = slice_14 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_15 ^ 1) - 1) * 5) + sub_4) * 2) + 1), 0, sub_13))), 0).x) & match_20);
+        uint match_29 = 
+            (eq_16 && (((right_shift_3 | 1) < 5) && eq_17)) ? match_19 :
+            0u;
+        int func_clamp_22 = clamp((((((right_shift_3 ^ 1) * 5) + sub_4) * 2) + 1), 0, sub_13);
+        uint slice_23 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_22, 0, sub_13))), 0).x;
+        int right_shift_24 = func_clamp_22 >> 1;
+        int right_shift_25 = (right_shift_24 * 26215) >> 17;
+        int add_26 = right_shift_25 + 1;
+        int sub_27 = right_shift_24 - (right_shift_25 * 5);
+        uint match_28 = 
+            (((func_clamp_22 & 1) == 0) && ((((add_26 | 1) - 1) < 5) && ((sub_27 & 1) == 1))) ? match_19 :
+            0u;
+        uint bitwise_xor_30 = bitwise_xor_21 ^ ((slice_23 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_26 ^ 1) - 1) * 5) + sub_27) * 2) + 1), 0, sub_13))), 0).x) & match_28)) & match_29);
+        uint match_51;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_51 = bitwise_xor_30;
+        } else {
+            int func_clamp_31 = clamp((mod_1 ^ 1), 0, sub_13);
+            uint slice_32 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_31, 0, sub_13))), 0).x;
+            bool eq_37 = (func_clamp_31 & 1) == 0;
+            int right_shift_33 = func_clamp_31 >> 1;
+            int right_shift_34 = (right_shift_33 * 26215) >> 17;
+            int sub_36 = right_shift_33 - (right_shift_34 * 5);
+            bool eq_38 = (sub_36 & 1) == 1;
+            int add_35 = right_shift_34 + 1;
+            uint match_39 = 
+            (eq_37 && ((((add_35 | 1) - 1) < 5) && eq_38)) ? match_19 :
+            0u;
+            uint bitwise_xor_40 = slice_32 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_35 ^ 1) - 1) * 5) + sub_36) * 2) + 1), 0, sub_13))), 0).x) & match_39);
+            uint match_48 = 
+            (eq_37 && (((right_shift_34 | 1) < 5) && eq_38)) ? match_19 :
+            0u;
+            int func_clamp_41 = clamp((((((right_shift_34 ^ 1) * 5) + sub_36) * 2) + 1), 0, sub_13);
+            uint slice_42 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_41, 0, sub_13))), 0).x;
+            int right_shift_43 = func_clamp_41 >> 1;
+            int right_shift_44 = (right_shift_43 * 26215) >> 17;
+            int add_45 = right_shift_44 + 1;
+            int sub_46 = right_shift_43 - (right_shift_44 * 5);
+            uint match_47 = 
+            (((func_clamp_41 & 1) == 0) && ((((add_45 | 1) - 1) < 5) && ((sub_46 & 1) == 1))) ? match_19 :
+            0u;
+            uint bitwise_xor_49 = bitwise_xor_40 ^ ((slice_42 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_45 ^ 1) - 1) * 5) + sub_46) * 2) + 1), 0, sub_13))), 0).x) & match_47)) & match_48);
+            uint match_50 = 
+            (eq_18 && eq_16) ? 1u :
+            0u;
+            match_51 = ((bitwise_xor_49 & (~match_50)) | ((~bitwise_xor_30) & match_50));
+        }
+        outColor = match_51;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height5_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_7 = x == 0;
+        uint match_8 = 
+            eq_7 ? 4294967294u :
+            4294967295u;
+        bool eq_5 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        int sub_2 = right_shift_0 - (right_shift_1 * 5);
+        int bitwise_and_3 = sub_2 & 1;
+        bool eq_6 = bitwise_and_3 == 1;
+        int add_4 = right_shift_1 + 1;
+        uint match_9 = 
+            (eq_5 && ((((add_4 | 1) - 1) < 5) && eq_6)) ? match_8 :
+            0u;
+        uint bitwise_xor_10 = v_state ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_4 ^ 1) - 1) * 5) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_9);
+        uint match_19 = 
+            (eq_5 && (((right_shift_1 | 1) < 5) && eq_6)) ? match_8 :
+            0u;
+        int sub_11 = int(state_size.y) - 1;
+        int func_clamp_12 = clamp((((((right_shift_1 ^ 1) * 5) + sub_2) * 2) + 1), 0, sub_11);
+        uint slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int right_shift_15 = (right_shift_14 * 26215) >> 17;
+        int add_16 = right_shift_15 + 1;
+        int sub_17 = right_shift_14 - (right_shift_15 * 5);
+        uint match_18 = 
+            (((func_clamp_12 & 1) == 0) && ((((add_16 | 1) - 1) < 5) && ((sub_17 & 1) == 1))) ? match_8 :
+            0u;
+        uint bitwise_xor_20 = bitwise_xor_10 ^ ((slice_13 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_16 ^ 1) - 1) * 5) + sub_17) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_18)) & match_19);
+        uint match_41;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_41 = bitwise_xor_20;
+        } else {
+            int func_clamp_21 = clamp((y ^ 1), 0, sub_11);
+            uint slice_22 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            bool eq_27 = (func_clamp_21 & 1) == 0;
+            int right_shift_23 = func_clamp_21 >> 1;
+            int right_shift_24 = (right_shift_23 * 26215) >> 17;
+            int sub_26 = right_shift_23 - (right_shift_24 * 5);
+            bool eq_28 = (sub_26 & 1) == 1;
+            int add_25 = right_shift_24 + 1;
+            uint match_29 = 
+            (eq_27 && ((((add_25 | 1) - 1) < 5) && eq_28)) ? match_8 :
+            0u;
+            uint bitwise_xor_30 = slice_22 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_25 ^ 1) - 1) * 5) + sub_26) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_29);
+            uint match_38 = 
+            (eq_27 && (((right_shift_24 | 1) < 5) && eq_28)) ? match_8 :
+            0u;
+            int func_clamp_31 = clamp((((((right_shift_24 ^ 1) * 5) + sub_26) * 2) + 1), 0, sub_11);
+            uint slice_32 = texelFetch(state, clamp(ivec2(x, func_clamp_31), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_33 = func_clamp_31 >> 1;
+            int right_shift_34 = (right_shift_33 * 26215) >> 17;
+            int add_35 = right_shift_34 + 1;
+            int sub_36 = right_shift_33 - (right_shift_34 * 5);
+            uint match_37 = 
+            (((func_clamp_31 & 1) == 0) && ((((add_35 | 1) - 1) < 5) && ((sub_36 & 1) == 1))) ? match_8 :
+            0u;
+            uint bitwise_xor_39 = bitwise_xor_30 ^ ((slice_32 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_35 ^ 1) - 1) * 5) + sub_36) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_37)) & match_38);
+            uint match_40 = 
+            (eq_7 && eq_5) ? 1u :
+            0u;
+            match_41 = ((bitwise_xor_39 & (~match_40)) | ((~bitwise_xor_20) & match_40));
+        }
+        outColor = match_41;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height5_surface_width5_out_tile1x50_state_tile1x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        bool eq_6 = (sub_1 & 1) == 0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        int sub_4 = right_shift_2 - (right_shift_3 * 5);
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_7 = bitwise_and_5 == 1;
+        uint match_8 = 
+            (eq_6 && eq_7) ? 4294967294u :
+            0u;
+        uint bitwise_xor_9 = v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_3 + 1) ^ 1) - 1) * 5) + sub_4) * 2) + 1), 0, 49))), 0).x) & match_8);
+        uint match_16 = 
+            (eq_6 && (((right_shift_3 | 1) < 5) && eq_7)) ? 4294967294u :
+            0u;
+        int func_clamp_10 = clamp((((((right_shift_3 ^ 1) * 5) + sub_4) * 2) + 1), 0, 49);
+        uint slice_11 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_10)), 0).x;
+        int right_shift_12 = func_clamp_10 >> 1;
+        int right_shift_13 = (right_shift_12 * 13) >> 6;
+        int sub_14 = right_shift_12 - (right_shift_13 * 5);
+        uint match_15 = 
+            (((func_clamp_10 & 1) == 0) && ((sub_14 & 1) == 1)) ? 4294967294u :
+            0u;
+        uint bitwise_xor_17 = bitwise_xor_9 ^ ((slice_11 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_13 + 1) ^ 1) - 1) * 5) + sub_14) * 2) + 1), 0, 49))), 0).x) & match_15)) & match_16);
+        uint match_36;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_36 = bitwise_xor_17;
+        } else {
+            int bitwise_xor_18 = sub_1 ^ 1;
+            uint slice_19 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_18)), 0).x;
+            bool eq_23 = (bitwise_xor_18 & 1) == 0;
+            int right_shift_20 = bitwise_xor_18 >> 1;
+            int right_shift_21 = (right_shift_20 * 13) >> 6;
+            int sub_22 = right_shift_20 - (right_shift_21 * 5);
+            bool eq_24 = (sub_22 & 1) == 1;
+            uint match_25 = 
+            (eq_23 && eq_24) ? 4294967294u :
+            0u;
+            uint bitwise_xor_26 = slice_19 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_21 + 1) ^ 1) - 1) * 5) + sub_22) * 2) + 1), 0, 49))), 0).x) & match_25);
+            uint match_33 = 
+            (eq_23 && (((right_shift_21 | 1) < 5) && eq_24)) ? 4294967294u :
+            0u;
+            int func_clamp_27 = clamp((((((right_shift_21 ^ 1) * 5) + sub_22) * 2) + 1), 0, 49);
+            uint slice_28 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_27)), 0).x;
+            int right_shift_29 = func_clamp_27 >> 1;
+            int right_shift_30 = (right_shift_29 * 13) >> 6;
+            int sub_31 = right_shift_29 - (right_shift_30 * 5);
+            uint match_32 = 
+            (((func_clamp_27 & 1) == 0) && ((sub_31 & 1) == 1)) ? 4294967294u :
+            0u;
+            uint bitwise_xor_34 = bitwise_xor_26 ^ ((slice_28 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_30 + 1) ^ 1) - 1) * 5) + sub_31) * 2) + 1), 0, 49))), 0).x) & match_32)) & match_33);
+            uint match_35 = 
+            eq_6 ? 1u :
+            0u;
+            match_36 = ((bitwise_xor_34 & (~match_35)) | ((~bitwise_xor_17) & match_35));
+        }
+        outColor = match_36;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.x);
+        int func_int_6 = int(out_tile.x);
+        int mul_8 = (x / func_int_6) * func_int_7;
+        int mod_9 = x % func_int_6;
+        int add_10 = mul_8 + clamp(mod_9, 0, (func_int_7 - 1));
+        int func_int_11 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_12 = (y / func_int_0) * func_int_11;
+        int mod_1 = y % func_int_0;
+        int sub_13 = func_int_11 - 1;
+        uint slice_14 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(mod_1, 0, sub_13))), 0).x;
+        bool eq_18 = mod_9 == 0;
+        uint match_19 = 
+            eq_18 ? 4294967294u :
+            4294967295u;
+        bool eq_16 = (mod_1 & 1) == 0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 3641) >> 15;
+        int sub_4 = right_shift_2 - (right_shift_3 * 9);
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_17 = bitwise_and_5 == 1;
+        int add_15 = right_shift_3 + 1;
+        uint match_20 = 
+            (eq_16 && ((((add_15 | 1) - 1) < 9) && eq_17)) ? match_19 :
+            0u;
+        uint bitwise_xor_21 = slice_14 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_15 ^ 1) - 1) * 9) + sub_4) * 2) + 1), 0, sub_13))), 0).x) & match_20);
+        uint match_29 = 
+            (eq_16 && (((right_shift_3 | 1) < 9) && eq_17)) ? match_19 :
+            0u;
+        int func_clamp_22 = clamp((((((right_shift_3 ^ 1) * 9) + sub_4) * 2) + 1), 0, sub_13);
+        uint slice_23 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_22, 0, sub_13))), 0).x;
+        int right_shift_24 = func_clamp_22 >> 1;
+        int right_shift_25 = (right_shift_24 * 3641) >> 15;
+        int add_26 = right_shift_25 + 1;
+        int sub_27 = right_shift_24 - (right_shift_25 * 9);
+        uint match_28 = 
+            (((func_clamp_22 & 1) == 0) && ((((add_26 | 1) - 1) < 9) && ((sub_27 & 1) == 1))) ? match_19 :
+            0u;
+        uint bitwise_xor_30 = bitwise_xor_21 ^ ((slice_23 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_26 ^ 1) - 1) * 9) + sub_27) * 2) + 1), 0, sub_13))), 0).x) & match_28)) & match_29);
+        uint match_51;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_51 = bitwise_xor_30;
+        } else {
+            int func_clamp_31 = clamp((mod_1 ^ 1), 0, sub_13);
+            uint slice_32 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_31, 0, sub_13))), 0).x;
+            bool eq_37 = (func_clamp_31 & 1) == 0;
+            int right_shift_33 = func_clamp_31 >> 1;
+            int right_shift_34 = (right_shift_33 * 3641) >> 15;
+            int sub_36 = right_shift_33 - (right_shift_34 * 9);
+            bool eq_38 = (sub_36 & 1) == 1;
+            int add_35 = right_shift_34 + 1;
+            uint match_39 = 
+            (eq_37 && ((((add_35 | 1) - 1) < 9) && eq_38)) ? match_19 :
+            0u;
+            uint bitwise_xor_40 = slice_32 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_35 ^ 1) - 1) * 9) + sub_36) * 2) + 1), 0, sub_13))), 0).x) & match_39);
+            uint match_48 = 
+            (eq_37 && (((right_shift_34 | 1) < 9) && eq_38)) ? match_19 :
+            0u;
+            int func_clamp_41 = clamp((((((right_shift_34 ^ 1) * 9) + sub_36) * 2) + 1), 0, sub_13);
+            uint slice_42 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_41, 0, sub_13))), 0).x;
+            int right_shift_43 = func_clamp_41 >> 1;
+            int right_shift_44 = (right_shift_43 * 3641) >> 15;
+            int add_45 = right_shift_44 + 1;
+            int sub_46 = right_shift_43 - (right_shift_44 * 9);
+            uint match_47 = 
+            (((func_clamp_41 & 1) == 0) && ((((add_45 | 1) - 1) < 9) && ((sub_46 & 1) == 1))) ? match_19 :
+            0u;
+            uint bitwise_xor_49 = bitwise_xor_40 ^ ((slice_42 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_45 ^ 1) - 1) * 9) + sub_46) * 2) + 1), 0, sub_13))), 0).x) & match_47)) & match_48);
+            uint match_50 = 
+            (eq_18 && eq_16) ? 1u :
+            0u;
+            match_51 = ((bitwise_xor_49 & (~match_50)) | ((~bitwise_xor_30) & match_50));
+        }
+        outColor = match_51;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height9_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_7 = x == 0;
+        uint match_8 = 
+            eq_7 ? 4294967294u :
+            4294967295u;
+        bool eq_5 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        int sub_2 = right_shift_0 - (right_shift_1 * 9);
+        int bitwise_and_3 = sub_2 & 1;
+        bool eq_6 = bitwise_and_3 == 1;
+        int add_4 = right_shift_1 + 1;
+        uint match_9 = 
+            (eq_5 && ((((add_4 | 1) - 1) < 9) && eq_6)) ? match_8 :
+            0u;
+        uint bitwise_xor_10 = v_state ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_4 ^ 1) - 1) * 9) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_9);
+        uint match_19 = 
+            (eq_5 && (((right_shift_1 | 1) < 9) && eq_6)) ? match_8 :
+            0u;
+        int sub_11 = int(state_size.y) - 1;
+        int func_clamp_12 = clamp((((((right_shift_1 ^ 1) * 9) + sub_2) * 2) + 1), 0, sub_11);
+        uint slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int right_shift_15 = (right_shift_14 * 3641) >> 15;
+        int add_16 = right_shift_15 + 1;
+        int sub_17 = right_shift_14 - (right_shift_15 * 9);
+        uint match_18 = 
+            (((func_clamp_12 & 1) == 0) && ((((add_16 | 1) - 1) < 9) && ((sub_17 & 1) == 1))) ? match_8 :
+            0u;
+        uint bitwise_xor_20 = bitwise_xor_10 ^ ((slice_13 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_16 ^ 1) - 1) * 9) + sub_17) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_18)) & match_19);
+        uint match_41;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_41 = bitwise_xor_20;
+        } else {
+            int func_clamp_21 = clamp((y ^ 1), 0, sub_11);
+            uint slice_22 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            bool eq_27 = (func_clamp_21 & 1) == 0;
+            int right_shift_23 = func_clamp_21 >> 1;
+            int right_shift_24 = (right_shift_23 * 3641) >> 15;
+            int sub_26 = right_shift_23 - (right_shift_24 * 9);
+            bool eq_28 = (sub_26 & 1) == 1;
+            int add_25 = right_shift_24 + 1;
+            uint match_29 = 
+            (eq_27 && ((((add_25 | 1) - 1) < 9) && eq_28)) ? match_8 :
+            0u;
+            uint bitwise_xor_30 = slice_22 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_25 ^ 1) - 1) * 9) + sub_26) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_29);
+            uint match_38 = 
+            (eq_27 && (((right_shift_24 | 1) < 9) && eq_28)) ? match_8 :
+            0u;
+            int func_clamp_31 = clamp((((((right_shift_24 ^ 1) * 9) + sub_26) * 2) + 1), 0, sub_11);
+            uint slice_32 = texelFetch(state, clamp(ivec2(x, func_clamp_31), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_33 = func_clamp_31 >> 1;
+            int right_shift_34 = (right_shift_33 * 3641) >> 15;
+            int add_35 = right_shift_34 + 1;
+            int sub_36 = right_shift_33 - (right_shift_34 * 9);
+            uint match_37 = 
+            (((func_clamp_31 & 1) == 0) && ((((add_35 | 1) - 1) < 9) && ((sub_36 & 1) == 1))) ? match_8 :
+            0u;
+            uint bitwise_xor_39 = bitwise_xor_30 ^ ((slice_32 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_35 ^ 1) - 1) * 9) + sub_36) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_37)) & match_38);
+            uint match_40 = 
+            (eq_7 && eq_5) ? 1u :
+            0u;
+            match_41 = ((bitwise_xor_39 & (~match_40)) | ((~bitwise_xor_20) & match_40));
+        }
+        outColor = match_41;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height9_surface_width9_out_tile3x162_state_tile3x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        bool eq_8 = (x - (int(((float(x) + 0.5) * 0.3333333432674408)) * 3)) == 0;
+        uint match_9 = 
+            eq_8 ? 4294967294u :
+            4294967295u;
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        bool eq_6 = (sub_1 & 1) == 0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        int sub_4 = right_shift_2 - (right_shift_3 * 9);
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_7 = bitwise_and_5 == 1;
+        uint match_10 = 
+            (eq_6 && eq_7) ? match_9 :
+            0u;
+        uint bitwise_xor_11 = v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_3 + 1) ^ 1) - 1) * 9) + sub_4) * 2) + 1), 0, 161))), 0).x) & match_10);
+        uint match_18 = 
+            (eq_6 && (((right_shift_3 | 1) < 9) && eq_7)) ? match_9 :
+            0u;
+        int func_clamp_12 = clamp((((((right_shift_3 ^ 1) * 9) + sub_4) * 2) + 1), 0, 161);
+        uint slice_13 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_12)), 0).x;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int right_shift_15 = (right_shift_14 * 57) >> 9;
+        int sub_16 = right_shift_14 - (right_shift_15 * 9);
+        uint match_17 = 
+            (((func_clamp_12 & 1) == 0) && ((sub_16 & 1) == 1)) ? match_9 :
+            0u;
+        uint bitwise_xor_19 = bitwise_xor_11 ^ ((slice_13 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_15 + 1) ^ 1) - 1) * 9) + sub_16) * 2) + 1), 0, 161))), 0).x) & match_17)) & match_18);
+        uint match_38;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_38 = bitwise_xor_19;
+        } else {
+            int bitwise_xor_20 = sub_1 ^ 1;
+            uint slice_21 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_20)), 0).x;
+            bool eq_25 = (bitwise_xor_20 & 1) == 0;
+            int right_shift_22 = bitwise_xor_20 >> 1;
+            int right_shift_23 = (right_shift_22 * 57) >> 9;
+            int sub_24 = right_shift_22 - (right_shift_23 * 9);
+            bool eq_26 = (sub_24 & 1) == 1;
+            uint match_27 = 
+            (eq_25 && eq_26) ? match_9 :
+            0u;
+            uint bitwise_xor_28 = slice_21 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_23 + 1) ^ 1) - 1) * 9) + sub_24) * 2) + 1), 0, 161))), 0).x) & match_27);
+            uint match_35 = 
+            (eq_25 && (((right_shift_23 | 1) < 9) && eq_26)) ? match_9 :
+            0u;
+            int func_clamp_29 = clamp((((((right_shift_23 ^ 1) * 9) + sub_24) * 2) + 1), 0, 161);
+            uint slice_30 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_29)), 0).x;
+            int right_shift_31 = func_clamp_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 57) >> 9;
+            int sub_33 = right_shift_31 - (right_shift_32 * 9);
+            uint match_34 = 
+            (((func_clamp_29 & 1) == 0) && ((sub_33 & 1) == 1)) ? match_9 :
+            0u;
+            uint bitwise_xor_36 = bitwise_xor_28 ^ ((slice_30 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_32 + 1) ^ 1) - 1) * 9) + sub_33) * 2) + 1), 0, 161))), 0).x) & match_34)) & match_35);
+            uint match_37 = 
+            (eq_8 && eq_6) ? 1u :
+            0u;
+            match_38 = ((bitwise_xor_36 & (~match_37)) | ((~bitwise_xor_19) & match_37));
+        }
+        outColor = match_38;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_7 = int(state_tile.x);
+        int func_int_6 = int(out_tile.x);
+        int mul_8 = (x / func_int_6) * func_int_7;
+        int mod_9 = x % func_int_6;
+        int add_10 = mul_8 + clamp(mod_9, 0, (func_int_7 - 1));
+        int func_int_11 = int(state_tile.y);
+        int func_int_0 = int(out_tile.y);
+        int mul_12 = (y / func_int_0) * func_int_11;
+        int mod_1 = y % func_int_0;
+        int sub_13 = func_int_11 - 1;
+        uint slice_14 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(mod_1, 0, sub_13))), 0).x;
+        bool eq_18 = mod_9 == 0;
+        uint match_19 = 
+            eq_18 ? 4294967294u :
+            4294967295u;
+        bool eq_16 = (mod_1 & 1) == 0;
+        int right_shift_2 = mod_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 20165) >> 18;
+        int sub_4 = right_shift_2 - (right_shift_3 * 13);
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_17 = bitwise_and_5 == 1;
+        int add_15 = right_shift_3 + 1;
+        uint match_20 = 
+            (eq_16 && ((((add_15 | 1) - 1) < 13) && eq_17)) ? match_19 :
+            0u;
+        uint bitwise_xor_21 = slice_14 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_15 ^ 1) - 1) * 13) + sub_4) * 2) + 1), 0, sub_13))), 0).x) & match_20);
+        uint match_29 = 
+            (eq_16 && (((right_shift_3 | 1) < 13) && eq_17)) ? match_19 :
+            0u;
+        int func_clamp_22 = clamp((((((right_shift_3 ^ 1) * 13) + sub_4) * 2) + 1), 0, sub_13);
+        uint slice_23 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_22, 0, sub_13))), 0).x;
+        int right_shift_24 = func_clamp_22 >> 1;
+        int right_shift_25 = (right_shift_24 * 20165) >> 18;
+        int add_26 = right_shift_25 + 1;
+        int sub_27 = right_shift_24 - (right_shift_25 * 13);
+        uint match_28 = 
+            (((func_clamp_22 & 1) == 0) && ((((add_26 | 1) - 1) < 13) && ((sub_27 & 1) == 1))) ? match_19 :
+            0u;
+        uint bitwise_xor_30 = bitwise_xor_21 ^ ((slice_23 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_26 ^ 1) - 1) * 13) + sub_27) * 2) + 1), 0, sub_13))), 0).x) & match_28)) & match_29);
+        uint match_51;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_51 = bitwise_xor_30;
+        } else {
+            int func_clamp_31 = clamp((mod_1 ^ 1), 0, sub_13);
+            uint slice_32 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_31, 0, sub_13))), 0).x;
+            bool eq_37 = (func_clamp_31 & 1) == 0;
+            int right_shift_33 = func_clamp_31 >> 1;
+            int right_shift_34 = (right_shift_33 * 20165) >> 18;
+            int sub_36 = right_shift_33 - (right_shift_34 * 13);
+            bool eq_38 = (sub_36 & 1) == 1;
+            int add_35 = right_shift_34 + 1;
+            uint match_39 = 
+            (eq_37 && ((((add_35 | 1) - 1) < 13) && eq_38)) ? match_19 :
+            0u;
+            uint bitwise_xor_40 = slice_32 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_35 ^ 1) - 1) * 13) + sub_36) * 2) + 1), 0, sub_13))), 0).x) & match_39);
+            uint match_48 = 
+            (eq_37 && (((right_shift_34 | 1) < 13) && eq_38)) ? match_19 :
+            0u;
+            int func_clamp_41 = clamp((((((right_shift_34 ^ 1) * 13) + sub_36) * 2) + 1), 0, sub_13);
+            uint slice_42 = texelFetch(state, ivec2(add_10, (mul_12 + clamp(func_clamp_41, 0, sub_13))), 0).x;
+            int right_shift_43 = func_clamp_41 >> 1;
+            int right_shift_44 = (right_shift_43 * 20165) >> 18;
+            int add_45 = right_shift_44 + 1;
+            int sub_46 = right_shift_43 - (right_shift_44 * 13);
+            uint match_47 = 
+            (((func_clamp_41 & 1) == 0) && ((((add_45 | 1) - 1) < 13) && ((sub_46 & 1) == 1))) ? match_19 :
+            0u;
+            uint bitwise_xor_49 = bitwise_xor_40 ^ ((slice_42 ^ ((texelFetch(state, ivec2(add_10, (mul_12 + clamp(((((((add_45 ^ 1) - 1) * 13) + sub_46) * 2) + 1), 0, sub_13))), 0).x) & match_47)) & match_48);
+            uint match_50 = 
+            (eq_18 && eq_16) ? 1u :
+            0u;
+            match_51 = ((bitwise_xor_49 & (~match_50)) | ((~bitwise_xor_30) & match_50));
+        }
+        outColor = match_51;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height13_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform vec2 state_size;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_7 = x == 0;
+        uint match_8 = 
+            eq_7 ? 4294967294u :
+            4294967295u;
+        bool eq_5 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        int sub_2 = right_shift_0 - (right_shift_1 * 13);
+        int bitwise_and_3 = sub_2 & 1;
+        bool eq_6 = bitwise_and_3 == 1;
+        int add_4 = right_shift_1 + 1;
+        uint match_9 = 
+            (eq_5 && ((((add_4 | 1) - 1) < 13) && eq_6)) ? match_8 :
+            0u;
+        uint bitwise_xor_10 = v_state ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_4 ^ 1) - 1) * 13) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_9);
+        uint match_19 = 
+            (eq_5 && (((right_shift_1 | 1) < 13) && eq_6)) ? match_8 :
+            0u;
+        int sub_11 = int(state_size.y) - 1;
+        int func_clamp_12 = clamp((((((right_shift_1 ^ 1) * 13) + sub_2) * 2) + 1), 0, sub_11);
+        uint slice_13 = texelFetch(state, clamp(ivec2(x, func_clamp_12), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int right_shift_15 = (right_shift_14 * 20165) >> 18;
+        int add_16 = right_shift_15 + 1;
+        int sub_17 = right_shift_14 - (right_shift_15 * 13);
+        uint match_18 = 
+            (((func_clamp_12 & 1) == 0) && ((((add_16 | 1) - 1) < 13) && ((sub_17 & 1) == 1))) ? match_8 :
+            0u;
+        uint bitwise_xor_20 = bitwise_xor_10 ^ ((slice_13 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_16 ^ 1) - 1) * 13) + sub_17) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_18)) & match_19);
+        uint match_41;
+        if ((bitwise_and_3 != (right_shift_1 & 1))) {
+            match_41 = bitwise_xor_20;
+        } else {
+            int func_clamp_21 = clamp((y ^ 1), 0, sub_11);
+            uint slice_22 = texelFetch(state, clamp(ivec2(x, func_clamp_21), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            bool eq_27 = (func_clamp_21 & 1) == 0;
+            int right_shift_23 = func_clamp_21 >> 1;
+            int right_shift_24 = (right_shift_23 * 20165) >> 18;
+            int sub_26 = right_shift_23 - (right_shift_24 * 13);
+            bool eq_28 = (sub_26 & 1) == 1;
+            int add_25 = right_shift_24 + 1;
+            uint match_29 = 
+            (eq_27 && ((((add_25 | 1) - 1) < 13) && eq_28)) ? match_8 :
+            0u;
+            uint bitwise_xor_30 = slice_22 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_25 ^ 1) - 1) * 13) + sub_26) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_29);
+            uint match_38 = 
+            (eq_27 && (((right_shift_24 | 1) < 13) && eq_28)) ? match_8 :
+            0u;
+            int func_clamp_31 = clamp((((((right_shift_24 ^ 1) * 13) + sub_26) * 2) + 1), 0, sub_11);
+            uint slice_32 = texelFetch(state, clamp(ivec2(x, func_clamp_31), ivec2(0), textureSize(state, 0) - 1), 0).x;
+            int right_shift_33 = func_clamp_31 >> 1;
+            int right_shift_34 = (right_shift_33 * 20165) >> 18;
+            int add_35 = right_shift_34 + 1;
+            int sub_36 = right_shift_33 - (right_shift_34 * 13);
+            uint match_37 = 
+            (((func_clamp_31 & 1) == 0) && ((((add_35 | 1) - 1) < 13) && ((sub_36 & 1) == 1))) ? match_8 :
+            0u;
+            uint bitwise_xor_39 = bitwise_xor_30 ^ ((slice_32 ^ ((texelFetch(state, clamp(ivec2(x, ((((((add_35 ^ 1) - 1) * 13) + sub_36) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_37)) & match_38);
+            uint match_40 = 
+            (eq_7 && eq_5) ? 1u :
+            0u;
+            match_41 = ((bitwise_xor_39 & (~match_40)) | ((~bitwise_xor_20) & match_40));
+        }
+        outColor = match_41;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+let surfaceCyclePackedPass2_surface_height13_surface_width13_out_tile6x338_state_tile6x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        bool eq_8 = (x - (int(((float(x) + 0.5) * 0.1666666716337204)) * 6)) == 0;
+        uint match_9 = 
+            eq_8 ? 4294967294u :
+            4294967295u;
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        bool eq_6 = (sub_1 & 1) == 0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        int sub_4 = right_shift_2 - (right_shift_3 * 13);
+        int bitwise_and_5 = sub_4 & 1;
+        bool eq_7 = bitwise_and_5 == 1;
+        uint match_10 = 
+            (eq_6 && eq_7) ? match_9 :
+            0u;
+        uint bitwise_xor_11 = v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_3 + 1) ^ 1) - 1) * 13) + sub_4) * 2) + 1), 0, 337))), 0).x) & match_10);
+        uint match_18 = 
+            (eq_6 && (((right_shift_3 | 1) < 13) && eq_7)) ? match_9 :
+            0u;
+        int func_clamp_12 = clamp((((((right_shift_3 ^ 1) * 13) + sub_4) * 2) + 1), 0, 337);
+        uint slice_13 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_12)), 0).x;
+        int right_shift_14 = func_clamp_12 >> 1;
+        int right_shift_15 = (right_shift_14 * 79) >> 10;
+        int sub_16 = right_shift_14 - (right_shift_15 * 13);
+        uint match_17 = 
+            (((func_clamp_12 & 1) == 0) && ((sub_16 & 1) == 1)) ? match_9 :
+            0u;
+        uint bitwise_xor_19 = bitwise_xor_11 ^ ((slice_13 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_15 + 1) ^ 1) - 1) * 13) + sub_16) * 2) + 1), 0, 337))), 0).x) & match_17)) & match_18);
+        uint match_38;
+        if ((bitwise_and_5 != (right_shift_3 & 1))) {
+            match_38 = bitwise_xor_19;
+        } else {
+            int bitwise_xor_20 = sub_1 ^ 1;
+            uint slice_21 = texelFetch(state, ivec2(x, (mul_0 + bitwise_xor_20)), 0).x;
+            bool eq_25 = (bitwise_xor_20 & 1) == 0;
+            int right_shift_22 = bitwise_xor_20 >> 1;
+            int right_shift_23 = (right_shift_22 * 79) >> 10;
+            int sub_24 = right_shift_22 - (right_shift_23 * 13);
+            bool eq_26 = (sub_24 & 1) == 1;
+            uint match_27 = 
+            (eq_25 && eq_26) ? match_9 :
+            0u;
+            uint bitwise_xor_28 = slice_21 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_23 + 1) ^ 1) - 1) * 13) + sub_24) * 2) + 1), 0, 337))), 0).x) & match_27);
+            uint match_35 = 
+            (eq_25 && (((right_shift_23 | 1) < 13) && eq_26)) ? match_9 :
+            0u;
+            int func_clamp_29 = clamp((((((right_shift_23 ^ 1) * 13) + sub_24) * 2) + 1), 0, 337);
+            uint slice_30 = texelFetch(state, ivec2(x, (mul_0 + func_clamp_29)), 0).x;
+            int right_shift_31 = func_clamp_29 >> 1;
+            int right_shift_32 = (right_shift_31 * 79) >> 10;
+            int sub_33 = right_shift_31 - (right_shift_32 * 13);
+            uint match_34 = 
+            (((func_clamp_29 & 1) == 0) && ((sub_33 & 1) == 1)) ? match_9 :
+            0u;
+            uint bitwise_xor_36 = bitwise_xor_28 ^ ((slice_30 ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((((right_shift_32 + 1) ^ 1) - 1) * 13) + sub_33) * 2) + 1), 0, 337))), 0).x) & match_34)) & match_35);
+            uint match_37 = 
+            (eq_8 && eq_6) ? 1u :
+            0u;
+            match_38 = ((bitwise_xor_36 & (~match_37)) | ((~bitwise_xor_19) & match_37));
+        }
+        outColor = match_38;
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile']);
+
+registerLayered(surfaceCyclePackedPass2, surfaceCyclePackedPass2Layered);
+registerSingleShot(surfaceCyclePackedPass2, surfaceCyclePackedPass2SingleShot);
+registerVariant(surfaceCyclePackedPass2, {surface_height: 5, surface_width: 5}, surfaceCyclePackedPass2_surface_height5_surface_width5);
+registerLayered(surfaceCyclePackedPass2_surface_height5_surface_width5, surfaceCyclePackedPass2Layered);
+registerSingleShot(surfaceCyclePackedPass2_surface_height5_surface_width5, surfaceCyclePackedPass2_surface_height5_surface_width5SingleShot);
+registerVariant(surfaceCyclePackedPass2_surface_height5_surface_width5, {out_tile: [1, 50], state_tile: [1, 50]}, surfaceCyclePackedPass2_surface_height5_surface_width5_out_tile1x50_state_tile1x50);
+registerVariant(surfaceCyclePackedPass2, {surface_height: 9, surface_width: 9}, surfaceCyclePackedPass2_surface_height9_surface_width9);
+registerLayered(surfaceCyclePackedPass2_surface_height9_surface_width9, surfaceCyclePackedPass2Layered);
+registerSingleShot(surfaceCyclePackedPass2_surface_height9_surface_width9, surfaceCyclePackedPass2_surface_height9_surface_width9SingleShot);
+registerVariant(surfaceCyclePackedPass2_surface_height9_surface_width9, {out_tile: [3, 162], state_tile: [3, 162]}, surfaceCyclePackedPass2_surface_height9_surface_width9_out_tile3x162_state_tile3x162);
+registerVariant(surfaceCyclePackedPass2, {surface_height: 13, surface_width: 13}, surfaceCyclePackedPass2_surface_height13_surface_width13);
+registerLayered(surfaceCyclePackedPass2_surface_height13_surface_width13, surfaceCyclePackedPass2Layered);
+registerSingleShot(surfaceCyclePackedPass2_surface_height13_surface_width13, surfaceCyclePackedPass2_surface_height13_surface_width13SingleShot);
+registerVariant(surfaceCyclePackedPass2_surface_height13_surface_width13, {out_tile: [6, 338], state_tile: [6, 338]}, surfaceCyclePackedPass2_surface_height13_surface_width13_out_tile6x338_state_tile6x338);
+
+function surfaceCyclePacked(state, surface_height, surface_width) {
+    pickVariant(surfaceCyclePackedPass0, {surface_height, surface_width}).withArgs(surface_height, surface_width, state).renderInto(state);
+    pickVariant(surfaceCyclePackedPass1, {surface_height, surface_width}).withArgs(surface_height, surface_width, state).renderInto(state);
+    pickVariant(surfaceCyclePackedPass2, {surface_height, surface_width}).withArgs(surface_height, surface_width, state).renderInto(state);
+}
+
+export {surfaceCyclePacked}
@@ -0,0 +1,404 @@
+////// AUTO-GENERATED CODE //////
+
+import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
+
+let surfaceCzsEHZPacked = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    uniform int surface_width;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x;
+        uint match_14 = 
+            (mod_3 == 0) ? 4294967294u :
+            4294967295u;
+        int right_shift_11 = mod_8 >> 1;
+        int add_13 = (right_shift_11 % surface_width) + 1;
+        int divide_12 = right_shift_11 / surface_width;
+        uint match_15 = 
+            (((mod_8 & 1) == 0) && ((((add_13 | 1) - 1) < surface_width) && ((divide_12 & 1) == 0))) ? match_14 :
+            0u;
+        outColor = (slice_10 ^ ((texelFetch(state, ivec2(add_4, (mul_7 + clamp(((((divide_12 * surface_width) + ((add_13 ^ 1) - 1)) * 2) + 1), 0, sub_9))), 0).x) & match_15));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPackedLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp usampler2DArray state;
+    uniform int surface_width;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(state_size.x);
+        int func_clamp_7 = clamp(add_5, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_layer.x);
+        int mod_9 = func_clamp_7 % func_int_8;
+        int sub_16 = int(state_size.y) - 1;
+        int func_int_12 = int(state_tile.y);
+        int add_10 = y + int(out_origin.y);
+        int func_int_11 = int(out_tile.y);
+        int mul_13 = (add_10 / func_int_11) * func_int_12;
+        int mod_14 = add_10 % func_int_11;
+        int sub_15 = func_int_12 - 1;
+        int func_clamp_17 = clamp((mul_13 + clamp(mod_14, 0, sub_15)), 0, sub_16);
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int divide_21 = func_clamp_7 / func_int_8;
+        int divide_20 = ((func_int_6 + func_int_8) - 1) / func_int_8;
+        uint fetch_22 = texelFetch(state, ivec3(mod_9, mod_19, (((func_clamp_17 / func_int_18) * divide_20) + divide_21)), 0).x;
+        uint match_27 = 
+            (mod_4 == 0) ? 4294967294u :
+            4294967295u;
+        int right_shift_23 = mod_14 >> 1;
+        int add_25 = (right_shift_23 % surface_width) + 1;
+        int divide_24 = right_shift_23 / surface_width;
+        uint match_28 = 
+            (((mod_14 & 1) == 0) && ((((add_25 | 1) - 1) < surface_width) && ((divide_24 & 1) == 0))) ? match_27 :
+            0u;
+        int func_clamp_26 = clamp((mul_13 + clamp(((((divide_24 * surface_width) + ((add_25 ^ 1) - 1)) * 2) + 1), 0, sub_15)), 0, sub_16);
+        outColor = (fetch_22 ^ ((texelFetch(state, ivec3(mod_9, (func_clamp_26 % func_int_18), (((func_clamp_26 / func_int_18) * divide_20) + divide_21)), 0).x) & match_28));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCzsEHZPackedSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    uniform int surface_width;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_3 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int add_2 = (right_shift_0 % surface_width) + 1;
+        bool lt_4 = ((add_2 | 1) - 1) < surface_width;
+        int divide_1 = right_shift_0 / surface_width;
+        uint match_6;
+        if ((eq_3 && (lt_4 && ((divide_1 & 1) == 0)))) {
+            uint match_5 = 
+            (x == 0) ? 4294967294u :
+            4294967295u;
+            match_6 = match_5;
+        } else {
+            match_6 = 0u;
+        }
+        outColor = (v_state ^ ((texelFetch(state, clamp(ivec2(x, ((((divide_1 * surface_width) + ((add_2 ^ 1) - 1)) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_6));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x;
+        uint match_14 = 
+            (mod_3 == 0) ? 4294967294u :
+            4294967295u;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 26215) >> 17;
+        uint match_15 = 
+            (((mod_8 & 1) == 0) && ((right_shift_12 & 1) == 0)) ? match_14 :
+            0u;
+        int mul_13 = right_shift_12 * 5;
+        outColor = (slice_10 ^ ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((mul_13 + ((((right_shift_11 - mul_13) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9))), 0).x) & match_15));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_3 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        uint match_5;
+        if ((eq_3 && ((right_shift_1 & 1) == 0))) {
+            uint match_4 = 
+            (x == 0) ? 4294967294u :
+            4294967295u;
+            match_5 = match_4;
+        } else {
+            match_5 = 0u;
+        }
+        int mul_2 = right_shift_1 * 5;
+        outColor = (v_state ^ ((texelFetch(state, clamp(ivec2(x, (((mul_2 + ((((right_shift_0 - mul_2) + 1) ^ 1) - 1)) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_5));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width5_out_tile1x50_state_tile1x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        uint match_5 = 
+            (((sub_1 & 1) == 0) && ((right_shift_3 & 1) == 0)) ? 4294967294u :
+            0u;
+        int mul_4 = right_shift_3 * 5;
+        outColor = (v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((mul_4 + ((((right_shift_2 - mul_4) + 1) ^ 1) - 1)) * 2) + 1), 0, 49))), 0).x) & match_5));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x;
+        uint match_14 = 
+            (mod_3 == 0) ? 4294967294u :
+            4294967295u;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 3641) >> 15;
+        uint match_15 = 
+            (((mod_8 & 1) == 0) && ((right_shift_12 & 1) == 0)) ? match_14 :
+            0u;
+        int mul_13 = right_shift_12 * 9;
+        outColor = (slice_10 ^ ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((mul_13 + ((((right_shift_11 - mul_13) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9))), 0).x) & match_15));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_3 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        uint match_5;
+        if ((eq_3 && ((right_shift_1 & 1) == 0))) {
+            uint match_4 = 
+            (x == 0) ? 4294967294u :
+            4294967295u;
+            match_5 = match_4;
+        } else {
+            match_5 = 0u;
+        }
+        int mul_2 = right_shift_1 * 9;
+        outColor = (v_state ^ ((texelFetch(state, clamp(ivec2(x, (((mul_2 + ((((right_shift_0 - mul_2) + 1) ^ 1) - 1)) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_5));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width9_out_tile3x162_state_tile3x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        bool eq_5 = (sub_1 & 1) == 0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        uint match_7;
+        if ((eq_5 && ((right_shift_3 & 1) == 0))) {
+            uint match_6 = 
+            ((x - (int(((float(x) + 0.5) * 0.3333333432674408)) * 3)) == 0) ? 4294967294u :
+            4294967295u;
+            match_7 = match_6;
+        } else {
+            match_7 = 0u;
+        }
+        int mul_4 = right_shift_3 * 9;
+        outColor = (v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((mul_4 + ((((right_shift_2 - mul_4) + 1) ^ 1) - 1)) * 2) + 1), 0, 161))), 0).x) & match_7));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        uint slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x;
+        uint match_14 = 
+            (mod_3 == 0) ? 4294967294u :
+            4294967295u;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 20165) >> 18;
+        uint match_15 = 
+            (((mod_8 & 1) == 0) && ((right_shift_12 & 1) == 0)) ? match_14 :
+            0u;
+        int mul_13 = right_shift_12 * 13;
+        outColor = (slice_10 ^ ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((mul_13 + ((((right_shift_11 - mul_13) + 1) ^ 1) - 1)) * 2) + 1), 0, sub_9))), 0).x) & match_15));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x;
+        bool eq_3 = (y & 1) == 0;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        uint match_5;
+        if ((eq_3 && ((right_shift_1 & 1) == 0))) {
+            uint match_4 = 
+            (x == 0) ? 4294967294u :
+            4294967295u;
+            match_5 = match_4;
+        } else {
+            match_5 = 0u;
+        }
+        int mul_2 = right_shift_1 * 13;
+        outColor = (v_state ^ ((texelFetch(state, clamp(ivec2(x, (((mul_2 + ((((right_shift_0 - mul_2) + 1) ^ 1) - 1)) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x) & match_5));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsEHZPacked_surface_width13_out_tile6x338_state_tile6x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform highp usampler2D state;
+    out uint outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        uint v_state = texelFetch(state, ivec2(x, y), 0).x;
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        bool eq_5 = (sub_1 & 1) == 0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        uint match_7;
+        if ((eq_5 && ((right_shift_3 & 1) == 0))) {
+            uint match_6 = 
+            ((x - (int(((float(x) + 0.5) * 0.1666666716337204)) * 6)) == 0) ? 4294967294u :
+            4294967295u;
+            match_7 = match_6;
+        } else {
+            match_7 = 0u;
+        }
+        int mul_4 = right_shift_3 * 13;
+        outColor = (v_state ^ ((texelFetch(state, ivec2(x, (mul_0 + clamp((((mul_4 + ((((right_shift_2 - mul_4) + 1) ^ 1) - 1)) * 2) + 1), 0, 337))), 0).x) & match_7));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(surfaceCzsEHZPacked, surfaceCzsEHZPackedLayered);
+registerSingleShot(surfaceCzsEHZPacked, surfaceCzsEHZPackedSingleShot);
+registerVariant(surfaceCzsEHZPacked, {surface_width: 5}, surfaceCzsEHZPacked_surface_width5);
+registerLayered(surfaceCzsEHZPacked_surface_width5, surfaceCzsEHZPackedLayered);
+registerSingleShot(surfaceCzsEHZPacked_surface_width5, surfaceCzsEHZPacked_surface_width5SingleShot);
+registerVariant(surfaceCzsEHZPacked_surface_width5, {out_tile: [1, 50], state_tile: [1, 50]}, surfaceCzsEHZPacked_surface_width5_out_tile1x50_state_tile1x50);
+registerVariant(surfaceCzsEHZPacked, {surface_width: 9}, surfaceCzsEHZPacked_surface_width9);
+registerLayered(surfaceCzsEHZPacked_surface_width9, surfaceCzsEHZPackedLayered);
+registerSingleShot(surfaceCzsEHZPacked_surface_width9, surfaceCzsEHZPacked_surface_width9SingleShot);
+registerVariant(surfaceCzsEHZPacked_surface_width9, {out_tile: [3, 162], state_tile: [3, 162]}, surfaceCzsEHZPacked_surface_width9_out_tile3x162_state_tile3x162);
+registerVariant(surfaceCzsEHZPacked, {surface_width: 13}, surfaceCzsEHZPacked_surface_width13);
+registerLayered(surfaceCzsEHZPacked_surface_width13, surfaceCzsEHZPackedLayered);
+registerSingleShot(surfaceCzsEHZPacked_surface_width13, surfaceCzsEHZPacked_surface_width13SingleShot);
+registerVariant(surfaceCzsEHZPacked_surface_width13, {out_tile: [6, 338], state_tile: [6, 338]}, surfaceCzsEHZPacked_surface_width13_out_tile6x338_state_tile6x338);
+
+export {surfaceCzsEHZPacked}
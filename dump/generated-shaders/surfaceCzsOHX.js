@@ -1,42 +1,322 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
 
 let surfaceCzsOHX = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform int surface_width;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        int divide_12 = right_shift_11 / surface_width;
+        int mul_13 = divide_12 * surface_width;
+        int mod_14 = right_shift_11 % surface_width;
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((mul_13 + (mod_14 ^ 1)) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && (((mod_14 | 1) < surface_width) && ((divide_12 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHXLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform int surface_width;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(state_size.x);
+        int func_clamp_7 = clamp(add_5, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_layer.x);
+        int mod_9 = func_clamp_7 % func_int_8;
+        int sub_16 = int(state_size.y) - 1;
+        int func_int_12 = int(state_tile.y);
+        int add_10 = y + int(out_origin.y);
+        int func_int_11 = int(out_tile.y);
+        int mul_13 = (add_10 / func_int_11) * func_int_12;
+        int mod_14 = add_10 % func_int_11;
+        int sub_15 = func_int_12 - 1;
+        int func_clamp_17 = clamp((mul_13 + clamp(mod_14, 0, sub_15)), 0, sub_16);
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int divide_21 = func_clamp_7 / func_int_8;
+        int divide_20 = ((func_int_6 + func_int_8) - 1) / func_int_8;
+        bool fetch_22 = texelFetch(state, ivec3(mod_9, mod_19, (((func_clamp_17 / func_int_18) * divide_20) + divide_21)), 0).x > 0.5;
+        int right_shift_23 = mod_14 >> 1;
+        int divide_24 = right_shift_23 / surface_width;
+        int mul_25 = divide_24 * surface_width;
+        int mod_26 = right_shift_23 % surface_width;
+        int func_clamp_27 = clamp((mul_13 + clamp((((mul_25 + (mod_26 ^ 1)) * 2) + 1), 0, sub_15)), 0, sub_16);
+        outColor = float((fetch_22 != ((texelFetch(state, ivec3(mod_9, (func_clamp_27 % func_int_18), (((func_clamp_27 / func_int_18) * divide_20) + divide_21)), 0).x > 0.5) && (((mod_4 > 0) && ((mod_14 & 1) == 0)) && (((mod_26 | 1) < surface_width) && ((divide_24 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCzsOHXSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     uniform sampler2D state;
     uniform int surface_width;
     out float outColor;
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        bool v_state = (texture(state, gl_FragCoord.xy / state_size)).x > 0.5;
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int divide_1 = right_shift_0 / surface_width;
+        int mul_2 = divide_1 * surface_width;
+        int mod_3 = right_shift_0 % surface_width;
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, (((mul_2 + (mod_3 ^ 1)) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && (((mod_3 | 1) < surface_width) && ((divide_1 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 26215) >> 17;
+        int mul_13 = right_shift_12 * 5;
+        int sub_14 = right_shift_11 - mul_13;
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((mul_13 + (sub_14 ^ 1)) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && (((sub_14 | 1) < 5) && ((right_shift_12 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        int mul_2 = right_shift_1 * 5;
+        int sub_3 = right_shift_0 - mul_2;
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, (((mul_2 + (sub_3 ^ 1)) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && (((sub_3 | 1) < 5) && ((right_shift_1 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width5_out_tile27x50_state_tile27x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        int mul_4 = right_shift_3 * 5;
+        int sub_5 = right_shift_2 - mul_4;
+        outColor = float((v_state != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 49))), 0).x > 0.5) && ((((x - (int(((float(x) + 0.5) * 0.03703703731298447)) * 27)) > 0) && ((sub_1 & 1) == 0)) && (((sub_5 | 1) < 5) && ((right_shift_3 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 3641) >> 15;
+        int mul_13 = right_shift_12 * 9;
+        int sub_14 = right_shift_11 - mul_13;
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((mul_13 + (sub_14 ^ 1)) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && (((sub_14 | 1) < 9) && ((right_shift_12 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
         int right_shift_0 = y >> 1;
-        int divide_2 = right_shift_0 / surface_width;
-        int mul_9 = divide_2 * surface_width;
-        int mod_1 = right_shift_0 % surface_width;
-        int bitwise_xor_7 = mod_1 ^ 1;
-        int add_10 = mul_9 + bitwise_xor_7;
-        int mul_16 = add_10 * 2;
-        int add_17 = mul_16 + 1;
-        bool slice_18 = (texture(state, vec2(gl_FragCoord.x, float(add_17) + 0.5) / state_size)).x > 0.5;
-        bool gt_11 = x > 0;
-        int bitwise_and_12 = y & 1;
-        bool eq_13 = bitwise_and_12 == 0;
-        bool bit_and_14 = gt_11 && eq_13;
-        int bitwise_or_5 = mod_1 | 1;
-        bool lt_6 = bitwise_or_5 < surface_width;
-        int bitwise_and_3 = divide_2 & 1;
-        bool eq_4 = bitwise_and_3 == 1;
-        bool bit_and_8 = lt_6 && eq_4;
-        bool bit_and_15 = bit_and_14 && bit_and_8;
-        bool bit_and_19 = slice_18 && bit_and_15;
-        bool bit_xor_20 = v_state != bit_and_19;
-        outColor = float(bit_xor_20);
-    }`,
-    ['1i', 'surface_width', false],
-    ['tex', 'state', 'state_size']);
-
-export {surfaceCzsOHX}
\ No newline at end of file
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        int mul_2 = right_shift_1 * 9;
+        int sub_3 = right_shift_0 - mul_2;
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, (((mul_2 + (sub_3 ^ 1)) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && (((sub_3 | 1) < 9) && ((right_shift_1 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width9_out_tile83x162_state_tile83x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        int mul_4 = right_shift_3 * 9;
+        int sub_5 = right_shift_2 - mul_4;
+        outColor = float((v_state != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 161))), 0).x > 0.5) && ((((x - (((x * 25267) >> 21) * 83)) > 0) && ((sub_1 & 1) == 0)) && (((sub_5 | 1) < 9) && ((right_shift_3 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 20165) >> 18;
+        int mul_13 = right_shift_12 * 13;
+        int sub_14 = right_shift_11 - mul_13;
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((mul_13 + (sub_14 ^ 1)) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && (((sub_14 | 1) < 13) && ((right_shift_12 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        int mul_2 = right_shift_1 * 13;
+        int sub_3 = right_shift_0 - mul_2;
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, (((mul_2 + (sub_3 ^ 1)) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && (((sub_3 | 1) < 13) && ((right_shift_1 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOHX_surface_width13_out_tile171x338_state_tile171x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        int mul_4 = right_shift_3 * 13;
+        int sub_5 = right_shift_2 - mul_4;
+        outColor = float((v_state != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((mul_4 + (sub_5 ^ 1)) * 2) + 1), 0, 337))), 0).x > 0.5) && ((((x - (int(((float(x) + 0.5) * 0.005847953259944916)) * 171)) > 0) && ((sub_1 & 1) == 0)) && (((sub_5 | 1) < 13) && ((right_shift_3 & 1) == 1))))));
+    }`,
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(surfaceCzsOHX, surfaceCzsOHXLayered);
+registerSingleShot(surfaceCzsOHX, surfaceCzsOHXSingleShot);
+registerVariant(surfaceCzsOHX, {surface_width: 5}, surfaceCzsOHX_surface_width5);
+registerLayered(surfaceCzsOHX_surface_width5, surfaceCzsOHXLayered);
+registerSingleShot(surfaceCzsOHX_surface_width5, surfaceCzsOHX_surface_width5SingleShot);
+registerVariant(surfaceCzsOHX_surface_width5, {out_tile: [27, 50], state_tile: [27, 50]}, surfaceCzsOHX_surface_width5_out_tile27x50_state_tile27x50);
+registerVariant(surfaceCzsOHX, {surface_width: 9}, surfaceCzsOHX_surface_width9);
+registerLayered(surfaceCzsOHX_surface_width9, surfaceCzsOHXLayered);
+registerSingleShot(surfaceCzsOHX_surface_width9, surfaceCzsOHX_surface_width9SingleShot);
+registerVariant(surfaceCzsOHX_surface_width9, {out_tile: [83, 162], state_tile: [83, 162]}, surfaceCzsOHX_surface_width9_out_tile83x162_state_tile83x162);
+registerVariant(surfaceCzsOHX, {surface_width: 13}, surfaceCzsOHX_surface_width13);
+registerLayered(surfaceCzsOHX_surface_width13, surfaceCzsOHXLayered);
+registerSingleShot(surfaceCzsOHX_surface_width13, surfaceCzsOHX_surface_width13SingleShot);
+registerVariant(surfaceCzsOHX_surface_width13, {out_tile: [171, 338], state_tile: [171, 338]}, surfaceCzsOHX_surface_width13_out_tile171x338_state_tile171x338);
+
+export {surfaceCzsOHX}
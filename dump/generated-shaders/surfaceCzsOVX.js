@@ -1,11 +1,91 @@
 ////// AUTO-GENERATED CODE //////
 
 import {ParametrizedShader} from 'src/sim/Gpu.js'
+import {registerLayered, registerSingleShot, registerVariant} from 'src/sim/ShaderVariants.js'
 
 let surfaceCzsOVX = new ParametrizedShader(`#version 300 es
     precision highp float;
     precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    uniform int surface_width;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        int mod_13 = right_shift_11 % surface_width;
+        int divide_12 = right_shift_11 / surface_width;
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((((divide_12 ^ 1) * surface_width) + mod_13) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && (((divide_12 | 1) < surface_height) && ((mod_13 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVXLayered = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_origin;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
     uniform vec2 state_size;
+    uniform vec2 state_layer;
+    uniform highp sampler2DArray state;
+    uniform int surface_width;
+    uniform int surface_height;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_2 = int(state_tile.x);
+        int add_0 = x + int(out_origin.x);
+        int func_int_1 = int(out_tile.x);
+        int mul_3 = (add_0 / func_int_1) * func_int_2;
+        int mod_4 = add_0 % func_int_1;
+        int add_5 = mul_3 + clamp(mod_4, 0, (func_int_2 - 1));
+        int func_int_6 = int(state_size.x);
+        int func_clamp_7 = clamp(add_5, 0, (func_int_6 - 1));
+        int func_int_8 = int(state_layer.x);
+        int mod_9 = func_clamp_7 % func_int_8;
+        int sub_16 = int(state_size.y) - 1;
+        int func_int_12 = int(state_tile.y);
+        int add_10 = y + int(out_origin.y);
+        int func_int_11 = int(out_tile.y);
+        int mul_13 = (add_10 / func_int_11) * func_int_12;
+        int mod_14 = add_10 % func_int_11;
+        int sub_15 = func_int_12 - 1;
+        int func_clamp_17 = clamp((mul_13 + clamp(mod_14, 0, sub_15)), 0, sub_16);
+        int func_int_18 = int(state_layer.y);
+        int mod_19 = func_clamp_17 % func_int_18;
+        int divide_21 = func_clamp_7 / func_int_8;
+        int divide_20 = ((func_int_6 + func_int_8) - 1) / func_int_8;
+        bool fetch_22 = texelFetch(state, ivec3(mod_9, mod_19, (((func_clamp_17 / func_int_18) * divide_20) + divide_21)), 0).x > 0.5;
+        int right_shift_23 = mod_14 >> 1;
+        int mod_25 = right_shift_23 % surface_width;
+        int divide_24 = right_shift_23 / surface_width;
+        int func_clamp_26 = clamp((mul_13 + clamp((((((divide_24 ^ 1) * surface_width) + mod_25) * 2) + 1), 0, sub_15)), 0, sub_16);
+        outColor = float((fetch_22 != ((texelFetch(state, ivec3(mod_9, (func_clamp_26 % func_int_18), (((func_clamp_26 / func_int_18) * divide_20) + divide_21)), 0).x > 0.5) && (((mod_4 > 0) && ((mod_14 & 1) == 0)) && (((divide_24 | 1) < surface_height) && ((mod_25 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', 'state_size', 'state_tile', 'state_layer']);
+
+let surfaceCzsOVXSingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
     uniform sampler2D state;
     uniform int surface_width;
     uniform int surface_height;
@@ -13,32 +93,233 @@ let surfaceCzsOVX = new ParametrizedShader(`#version 300 es
     void main() {
         int x = int(gl_FragCoord.x);
         int y = int(gl_FragCoord.y);
-        bool v_state = (texture(state, gl_FragCoord.xy / state_size)).x > 0.5;
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int mod_2 = right_shift_0 % surface_width;
+        int divide_1 = right_shift_0 / surface_width;
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, (((((divide_1 ^ 1) * surface_width) + mod_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && (((divide_1 | 1) < surface_height) && ((mod_2 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height5_surface_width5 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 26215) >> 17;
+        int sub_13 = right_shift_11 - (right_shift_12 * 5);
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((((right_shift_12 ^ 1) * 5) + sub_13) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && (((right_shift_12 | 1) < 5) && ((sub_13 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height5_surface_width5SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
         int right_shift_0 = y >> 1;
-        int divide_2 = right_shift_0 / surface_width;
-        int bitwise_xor_7 = divide_2 ^ 1;
-        int mul_9 = bitwise_xor_7 * surface_width;
-        int mod_1 = right_shift_0 % surface_width;
-        int add_10 = mul_9 + mod_1;
-        int mul_16 = add_10 * 2;
-        int add_17 = mul_16 + 1;
-        bool slice_18 = (texture(state, vec2(gl_FragCoord.x, float(add_17) + 0.5) / state_size)).x > 0.5;
-        bool gt_11 = x > 0;
-        int bitwise_and_12 = y & 1;
-        bool eq_13 = bitwise_and_12 == 0;
-        bool bit_and_14 = gt_11 && eq_13;
-        int bitwise_or_5 = divide_2 | 1;
-        bool lt_6 = bitwise_or_5 < surface_height;
-        int bitwise_and_3 = mod_1 & 1;
-        bool eq_4 = bitwise_and_3 == 0;
-        bool bit_and_8 = lt_6 && eq_4;
-        bool bit_and_15 = bit_and_14 && bit_and_8;
-        bool bit_and_19 = slice_18 && bit_and_15;
-        bool bit_xor_20 = v_state != bit_and_19;
-        outColor = float(bit_xor_20);
-    }`,
-    ['1i', 'surface_height', false],
-    ['1i', 'surface_width', false],
-    ['tex', 'state', 'state_size']);
+        int right_shift_1 = (right_shift_0 * 26215) >> 17;
+        int sub_2 = right_shift_0 - (right_shift_1 * 5);
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 5) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && (((right_shift_1 | 1) < 5) && ((sub_2 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height5_surface_width5_out_tile27x50_state_tile27x50 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = int(((float(y) + 0.5) * 0.019999999552965164)) * 50;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 13) >> 6;
+        int sub_4 = right_shift_2 - (right_shift_3 * 5);
+        outColor = float((v_state != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 5) + sub_4) * 2) + 1), 0, 49))), 0).x > 0.5) && ((((x - (int(((float(x) + 0.5) * 0.03703703731298447)) * 27)) > 0) && ((sub_1 & 1) == 0)) && (((right_shift_3 | 1) < 5) && ((sub_4 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height9_surface_width9 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 3641) >> 15;
+        int sub_13 = right_shift_11 - (right_shift_12 * 9);
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((((right_shift_12 ^ 1) * 9) + sub_13) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && (((right_shift_12 | 1) < 9) && ((sub_13 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height9_surface_width9SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 3641) >> 15;
+        int sub_2 = right_shift_0 - (right_shift_1 * 9);
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 9) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && (((right_shift_1 | 1) < 9) && ((sub_2 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height9_surface_width9_out_tile83x162_state_tile83x162 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = ((y * 25891) >> 22) * 162;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 57) >> 9;
+        int sub_4 = right_shift_2 - (right_shift_3 * 9);
+        outColor = float((v_state != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 9) + sub_4) * 2) + 1), 0, 161))), 0).x > 0.5) && ((((x - (((x * 25267) >> 21) * 83)) > 0) && ((sub_1 & 1) == 0)) && (((right_shift_3 | 1) < 9) && ((sub_4 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height13_surface_width13 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform vec2 out_tile;
+    uniform vec2 state_tile;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        int func_int_1 = int(state_tile.x);
+        int func_int_0 = int(out_tile.x);
+        int mul_2 = (x / func_int_0) * func_int_1;
+        int mod_3 = x % func_int_0;
+        int add_4 = mul_2 + clamp(mod_3, 0, (func_int_1 - 1));
+        int func_int_6 = int(state_tile.y);
+        int func_int_5 = int(out_tile.y);
+        int mul_7 = (y / func_int_5) * func_int_6;
+        int mod_8 = y % func_int_5;
+        int sub_9 = func_int_6 - 1;
+        bool slice_10 = texelFetch(state, ivec2(add_4, (mul_7 + clamp(mod_8, 0, sub_9))), 0).x > 0.5;
+        int right_shift_11 = mod_8 >> 1;
+        int right_shift_12 = (right_shift_11 * 20165) >> 18;
+        int sub_13 = right_shift_11 - (right_shift_12 * 13);
+        outColor = float((slice_10 != ((texelFetch(state, ivec2(add_4, (mul_7 + clamp((((((right_shift_12 ^ 1) * 13) + sub_13) * 2) + 1), 0, sub_9))), 0).x > 0.5) && (((mod_3 > 0) && ((mod_8 & 1) == 0)) && (((right_shift_12 | 1) < 13) && ((sub_13 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height13_surface_width13SingleShot = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, clamp(ivec2(x, y), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5;
+        int right_shift_0 = y >> 1;
+        int right_shift_1 = (right_shift_0 * 20165) >> 18;
+        int sub_2 = right_shift_0 - (right_shift_1 * 13);
+        outColor = float((v_state != ((texelFetch(state, clamp(ivec2(x, (((((right_shift_1 ^ 1) * 13) + sub_2) * 2) + 1)), ivec2(0), textureSize(state, 0) - 1), 0).x > 0.5) && (((x > 0) && ((y & 1) == 0)) && (((right_shift_1 | 1) < 13) && ((sub_2 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+let surfaceCzsOVX_surface_height13_surface_width13_out_tile171x338_state_tile171x338 = new ParametrizedShader(`#version 300 es
+    precision highp float;
+    precision highp int;
+    uniform sampler2D state;
+    out float outColor;
+    void main() {
+        int x = int(gl_FragCoord.x);
+        int y = int(gl_FragCoord.y);
+        bool v_state = texelFetch(state, ivec2(x, y), 0).x > 0.5;
+        int mul_0 = int(((float(y) + 0.5) * 0.002958579920232296)) * 338;
+        int sub_1 = y - mul_0;
+        int right_shift_2 = sub_1 >> 1;
+        int right_shift_3 = (right_shift_2 * 79) >> 10;
+        int sub_4 = right_shift_2 - (right_shift_3 * 13);
+        outColor = float((v_state != ((texelFetch(state, ivec2(x, (mul_0 + clamp((((((right_shift_3 ^ 1) * 13) + sub_4) * 2) + 1), 0, 337))), 0).x > 0.5) && ((((x - (int(((float(x) + 0.5) * 0.005847953259944916)) * 171)) > 0) && ((sub_1 & 1) == 0)) && (((right_shift_3 | 1) < 13) && ((sub_4 & 1) == 0))))));
+    }`,
+    ['1i', 'surface_height', false],
+    ['1i', 'surface_width', false],
+    ['tex', 'state', undefined, 'state_tile']);
+
+registerLayered(surfaceCzsOVX, surfaceCzsOVXLayered);
+registerSingleShot(surfaceCzsOVX, surfaceCzsOVXSingleShot);
+registerVariant(surfaceCzsOVX, {surface_height: 5, surface_width: 5}, surfaceCzsOVX_surface_height5_surface_width5);
+registerLayered(surfaceCzsOVX_surface_height5_surface_width5, surfaceCzsOVXLayered);
+registerSingleShot(surfaceCzsOVX_surface_height5_surface_width5, surfaceCzsOVX_surface_height5_surface_width5SingleShot);
+registerVariant(surfaceCzsOVX_surface_height5_surface_width5, {out_tile: [27, 50], state_tile: [27, 50]}, surfaceCzsOVX_surface_height5_surface_width5_out_tile27x50_state_tile27x50);
+registerVariant(surfaceCzsOVX, {surface_height: 9, surface_width: 9}, surfaceCzsOVX_surface_height9_surface_width9);
+registerLayered(surfaceCzsOVX_surface_height9_surface_width9, surfaceCzsOVXLayered);
+registerSingleShot(surfaceCzsOVX_surface_height9_surface_width9, surfaceCzsOVX_surface_height9_surface_width9SingleShot);
+registerVariant(surfaceCzsOVX_surface_height9_surface_width9, {out_tile: [83, 162], state_tile: [83, 162]}, surfaceCzsOVX_surface_height9_surface_width9_out_tile83x162_state_tile83x162);
+registerVariant(surfaceCzsOVX, {surface_height: 13, surface_width: 13}, surfaceCzsOVX_surface_height13_surface_width13);
+registerLayered(surfaceCzsOVX_surface_height13_surface_width13, surfaceCzsOVXLayered);
+registerSingleShot(surfaceCzsOVX_surface_height13_surface_width13, surfaceCzsOVX_surface_height13_surface_width13SingleShot);
+registerVariant(surfaceCzsOVX_surface_height13_surface_width13, {out_tile: [171, 338], state_tile: [171, 338]}, surfaceCzsOVX_surface_height13_surface_width13_out_tile171x338_state_tile171x338);
 
 export {surfaceCzsOVX}
@@ -1,9 +1,8 @@
 import {seq} from 'src/base/Seq.js'
 import {DetailedError} from 'src/base/DetailedError.js'
 import {describe} from 'src/base/Describe.js'
-import {initGpu, ParametrizedShader, readTexture, TexPair, Tex} from 'src/sim/Gpu.js'
-import {createPrng, advancePrng, advanceMeasureWithReset} from 'src/sim/Operations.js'
-import {randomAdvance} from 'src/gen/randomAdvance.js'
+import {initGpu, ParametrizedShader, readTexture, TexPair, Tex, fitsInTexture} from 'src/sim/Gpu.js'
+import {createPrng, advancePrng, advanceMeasureBatch} from 'src/sim/Operations.js'
 import {shifter} from 'src/gen/shifter.js'
 import {orFold} from 'src/gen/orFold.js'
 import {singleHadamard} from 'src/gen/singleHadamard.js'
@@ -11,17 +10,7 @@ import {singleCZ} from 'src/gen/singleCZ.js'
 import {prepareCleanState} from 'src/gen/prepareCleanState.js'
 import {measureSetResult} from 'src/gen/measureSetResult.js'
 import {findOneFold} from 'src/gen/findOneFold.js'
-import {hadamardAll} from 'src/gen/hadamardAll.js'
-import {hadamardCheck} from 'src/gen/hadamardCheck.js'
-import {hadamardData} from 'src/gen/hadamardData.js'
-import {surfaceCzsEHX} from 'src/gen/surfaceCzsEHX.js'
-import {surfaceCzsOHX} from 'src/gen/surfaceCzsOHX.js'
-import {surfaceCzsEVX} from 'src/gen/surfaceCzsEVX.js'
-import {surfaceCzsOVX} from 'src/gen/surfaceCzsOVX.js'
-import {surfaceCzsEHZ} from 'src/gen/surfaceCzsEHZ.js'
-import {surfaceCzsOHZ} from 'src/gen/surfaceCzsOHZ.js'
-import {surfaceCzsEVZ} from 'src/gen/surfaceCzsEVZ.js'
-import {surfaceCzsOVZ} from 'src/gen/surfaceCzsOVZ.js'
+import {surfaceCycle} from 'src/gen/surfaceCycle.js'
 
 window.onerror = function(msg, url, line, col, error) {
     document.getElementById('err_msg').textContent = describe(msg);
@@ -77,45 +66,47 @@ function q(x, y) {
 
 let sim_state;
 let fold_state;
+let claim_state;
 let rng_state;
+let measure_targets;
+let blocked_state;
+let blocked_flag;
 
 // eslint-disable-next-line
 function cycle() {
-    hadamardAll.withArgs(sim_state).renderInto(sim_state);
-
-    surfaceCzsEHX.withArgs(surface_width, sim_state).renderInto(sim_state);
-    surfaceCzsOHX.withArgs(surface_width, sim_state).renderInto(sim_state);
-    surfaceCzsEVX.withArgs(surface_height, surface_width, sim_state).renderInto(sim_state);
-    surfaceCzsOVX.withArgs(surface_height, surface_width, sim_state).renderInto(sim_state);
-
-    hadamardData.withArgs(surface_width, sim_state).renderInto(sim_state);
-
-    surfaceCzsEHZ.withArgs(surface_width, sim_state).renderInto(sim_state);
-    surfaceCzsOHZ.withArgs(surface_width, sim_state).renderInto(sim_state);
-    surfaceCzsEVZ.withArgs(surface_height, surface_width, sim_state).renderInto(sim_state);
-    surfaceCzsOVZ.withArgs(surface_height, surface_width, sim_state).renderInto(sim_state);
-
-    hadamardCheck.withArgs(surface_width, sim_state).renderInto(sim_state);
-
-    for (let i = 0; i < surface_width; i++) {
-        for (let j = 0; j < surface_height; j++) {
-            if ((i & 1) !== (j & 1)) {
-                advanceMeasureWithReset(sim_state, fold_state, rng_state, q(i, j));
-            }
-        }
-    }
+    surfaceCycle(sim_state, surface_height, surface_width);
+    advanceMeasureBatch(sim_state, fold_state, claim_state, rng_state, measure_targets, blocked_state, blocked_flag);
 }
 
 let surface_width = 5;
 //noinspection JSSuspiciousNameCombination
 let surface_height = surface_width;
 let area = surface_width * surface_height;
+// Independent shots simulated side by side, as a grid of tiles in each texture.
+let shots = [16, 16];
+let shot_count = shots[0] * shots[1];
 let blocker = new Tex(1, 1);
 
 setTimeout(() => {
-    sim_state = new TexPair(area, area * 2);
-    fold_state = new TexPair(sim_state.src.width, sim_state.src.height);
-    rng_state = createPrng(sim_state.src.height);
+    // Each tableau has a column per qubit after the two constant columns, and two rows per qubit.
+    let [w, h] = [(area + 2) * shots[0], area * 2 * shots[1]];
+    // When the claims don't fit in one texture, all the states are split into layers of the same size.
+    let layerSize = fitsInTexture(w * 2, h) ? undefined : [2048, 2048];
+    sim_state = new TexPair(w, h, undefined, false, shots, layerSize);
+    fold_state = new TexPair(w, h, undefined, false, shots, layerSize);
+    claim_state = new TexPair(w * 2, h, undefined, false, shots, layerSize);
+    blocked_state = new TexPair(shots[0], shots[1], undefined, false, shots, layerSize);
+    blocked_flag = new TexPair(1, 1, undefined, false, [1, 1], layerSize);
+    let target_flags = new Uint8Array(area);
+    for (let i = 0; i < surface_width; i++) {
+        for (let j = 0; j < surface_height; j++) {
+            if ((i & 1) !== (j & 1)) {
+                target_flags[q(i, j)] = 255;
+            }
+        }
+    }
+    measure_targets = new Tex(1, area, target_flags);
+    rng_state = createPrng();
     canvas.width = sim_state.width * 3;
     canvas.height = sim_state.height * 3;
 
@@ -138,5 +129,5 @@ setTimeout(() => {
         dt = endTime - startTime;
         // showShader.withArgs(sim_state, [canvas.width, canvas.height]).drawToCanvas();
     }
-    console.log(`${surface_width}x${surface_height}: ${cycles} cycles in ${dt}ms, or ${(cycles / dt * 1000).toFixed(1)} Hz, or ${(cycles * surface_width * surface_height / dt).toFixed(1)} qubit*kHz`)
+    console.log(`${surface_width}x${surface_height}x${shot_count} shots: ${cycles} cycles in ${dt}ms, or ${(cycles * shot_count / dt * 1000).toFixed(1)} shot*Hz, or ${(cycles * shot_count * surface_width * surface_height / dt).toFixed(1)} qubit*kHz`)
 }, 0);
@@ -0,0 +1,367 @@
+from typing import Callable, NamedTuple, Optional, Union
+import numpy as np
+
+# Bit-sliced textures store each row as words of 64 columns, with column c
+# in bit c % 64 of word c // 64. Bits past the width are always zero.
+WORD_BITS = 64
+_ALL = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# Masks of the bits at even positions of each pair, nibble, byte, ... of a
+# word, used to compact every other bit.
+_COMPACT_MASKS = [np.uint64(m) for m in [0x5555555555555555,
+                                         0x3333333333333333,
+                                         0x0F0F0F0F0F0F0F0F,
+                                         0x00FF00FF00FF00FF,
+                                         0x0000FFFF0000FFFF,
+                                         0x00000000FFFFFFFF]]
+
+
+def word_count(width: int) -> int:
+    return (width + WORD_BITS - 1) // WORD_BITS
+
+
+class BitTexture(NamedTuple):
+    """
+    A texture of bits, bit-sliced into a (height, word_count(width)) array of
+    uint64 words. The words may be a memory map (see open_memmap), so that
+    kernels stream large tableaus instead of loading them.
+    """
+    words: np.ndarray
+    width: int
+
+    @property
+    def height(self) -> int:
+        return self.words.shape[0]
+
+    @staticmethod
+    def zeros(width: int, height: int) -> 'BitTexture':
+        return BitTexture(np.zeros((height, word_count(width)), np.uint64),
+                          width)
+
+    @staticmethod
+    def from_bits(bits: np.ndarray) -> 'BitTexture':
+        """Packs a (height, width) array of truth values."""
+        bits = np.asarray(bits, dtype=np.bool_)
+        return BitTexture(pack(bits), bits.shape[1])
+
+    def to_bits(self) -> np.ndarray:
+        return unpack(np.asarray(self.words), self.width)
+
+
+def open_memmap(path: str,
+                width: int,
+                height: Optional[int] = None,
+                mode: str = 'r+') -> BitTexture:
+    """
+    Opens a bit texture stored in a .npy file, creating it (zeroed) when a
+    height is given. The file only holds the words, so the width is given.
+    """
+    if height is not None:
+        words = np.lib.format.open_memmap(path,
+                                          mode='w+',
+                                          dtype=np.uint64,
+                                          shape=(height, word_count(width)))
+    else:
+        words = np.lib.format.open_memmap(path, mode=mode)
+        if words.dtype != np.uint64 or words.shape[1] != word_count(width):
+            raise ValueError('Not a bit texture of width {}: {}'.format(
+                width, path))
+    return BitTexture(words, width)
+
+
+def pack(bits: np.ndarray) -> np.ndarray:
+    """Bit-slices the last axis of an array of truth values."""
+    bits = np.asarray(bits, dtype=np.bool_)
+    width = bits.shape[-1]
+    padded = np.zeros(bits.shape[:-1] + (word_count(width) * WORD_BITS,),
+                      np.bool_)
+    padded[..., :width] = bits
+    packed = np.packbits(padded, axis=-1, bitorder='little')
+    return packed.view('<u8').astype(np.uint64)
+
+
+def unpack(words: np.ndarray, width: int) -> np.ndarray:
+    """The truth values of the first width columns of bit-sliced words."""
+    data = np.ascontiguousarray(words, dtype='<u8').view(np.uint8)
+    bits = np.unpackbits(data, axis=-1, bitorder='little')
+    return bits[..., :width].astype(np.bool_)
+
+
+def column_mask(width: int) -> np.ndarray:
+    """The words with the bits of the first width columns set."""
+    return below(width, width)
+
+
+def below(bound, width: int) -> np.ndarray:
+    """
+    Words with the columns less than the bound set, for bounds given per row
+    (as a column vector) or for all rows.
+    """
+    bound = np.asarray(bound, dtype=np.int64)[..., np.newaxis]
+    first = np.arange(word_count(width), dtype=np.int64) * WORD_BITS
+    count = np.clip(np.minimum(bound, width) - first, 0, WORD_BITS)
+    partial = (np.uint64(1) << (count % WORD_BITS).astype(np.uint64)) - 1
+    result = np.where(count == WORD_BITS, _ALL, partial).astype(np.uint64)
+    if result.ndim > 2:
+        # Bounds given per row, as an (n, 1) column.
+        result = result[..., 0, :]
+    return result
+
+
+def compare_columns(op: str, bound, width: int) -> np.ndarray:
+    """Words with the columns x satisfying `x op bound` set."""
+    mask = column_mask(width)
+    bound = np.asarray(bound, dtype=np.int64)
+    if op == '<':
+        return below(bound, width)
+    if op == '<=':
+        return below(bound + 1, width)
+    if op == '>=':
+        return below(bound, width) ^ mask
+    if op == '>':
+        return below(bound + 1, width) ^ mask
+    if op == '==':
+        return below(bound + 1, width) & ~below(bound, width)
+    if op == '!=':
+        return (below(bound + 1, width) & ~below(bound, width)) ^ mask
+    raise NotImplementedError(op)
+
+
+def spread(value, width: int) -> np.ndarray:
+    """Words with every column set to a value given per row (or overall)."""
+    value = np.asarray(value, dtype=np.bool_)
+    return np.where(value, column_mask(width), np.uint64(0))
+
+
+def invert(words: np.ndarray, width: int) -> np.ndarray:
+    return words ^ column_mask(width)
+
+
+def select(condition: np.ndarray,
+           if_true: np.ndarray,
+           if_false: np.ndarray,
+           width: int) -> np.ndarray:
+    return (condition & if_true) | (invert(condition, width) & if_false)
+
+
+def size(tex: Union[BitTexture, np.ndarray]) -> np.ndarray:
+    """A texture's size, as its size uniform gives it to shaders."""
+    if isinstance(tex, BitTexture):
+        return np.array([tex.width, tex.height], np.float32)
+    return np.array([tex.shape[1], tex.shape[0]], np.float32)
+
+
+def row_range(tex: BitTexture, start: int, stop: int) -> np.ndarray:
+    """The words of a range of rows, clamped to the texture's edge."""
+    if stop <= tex.height:
+        return tex.words[start:stop]
+    return read_rows(tex, np.arange(start, stop)[:, np.newaxis])
+
+
+def read_rows(tex: Union[BitTexture, np.ndarray], rows) -> np.ndarray:
+    """
+    The words (or texels) of the rows given per row (as a column vector) or
+    for all rows, clamped to the texture's edge.
+    """
+    data = tex.words if isinstance(tex, BitTexture) else tex
+    rows = np.clip(np.asarray(rows), 0, data.shape[0] - 1)
+    if rows.ndim == 0:
+        return data[int(rows)][np.newaxis]
+    return data[rows[:, 0]]
+
+
+def read_texels(tex: np.ndarray, rows, cols) -> np.ndarray:
+    """Texels of a (non bit-sliced) texture, clamped to its edge."""
+    rows = np.clip(np.asarray(rows), 0, tex.shape[0] - 1)
+    cols = np.clip(np.asarray(cols), 0, tex.shape[1] - 1)
+    return tex[rows, cols]
+
+
+def read_bits(tex: BitTexture, rows, cols) -> np.ndarray:
+    """
+    Bits of a texture at rows and columns given per texel, clamped to its
+    edge. For reads whose row varies by column.
+    """
+    rows = np.clip(np.asarray(rows), 0, tex.height - 1)
+    cols = np.clip(np.asarray(cols, dtype=np.int64), 0, tex.width - 1)
+    word = tex.words[rows, cols // WORD_BITS]
+    shift = (cols % WORD_BITS).astype(np.uint64)
+    return ((word >> shift) & np.uint64(1)).astype(np.bool_)
+
+
+def column_bits(words: np.ndarray, tex_width: int, col) -> np.ndarray:
+    """The bit in a column given per row (or overall) of each row."""
+    col = np.clip(np.asarray(col, dtype=np.int64), 0, tex_width - 1)
+    if col.ndim == 0:
+        word = words[:, int(col) // WORD_BITS][:, np.newaxis]
+    else:
+        word = np.take_along_axis(words, col // WORD_BITS, axis=1)
+    shift = (col % WORD_BITS).astype(np.uint64)
+    return ((word >> shift) & np.uint64(1)).astype(np.bool_)
+
+
+def fit(words: np.ndarray, tex_width: int, width: int) -> np.ndarray:
+    """Reads the columns of a texture into an output of the given width."""
+    if tex_width == width:
+        return words
+    return gather_columns(words, tex_width, np.arange(width)[np.newaxis])
+
+
+def gather_columns(words: np.ndarray, tex_width: int, cols) -> np.ndarray:
+    """
+    Reads the columns given per texel (by an array of indices with a column
+    per output column), clamped to the texture's edge. Handles any indices,
+    by unpacking the bits.
+    """
+    bits = unpack(words, tex_width)
+    cols = np.clip(np.asarray(cols), 0, tex_width - 1)
+    rows = np.arange(bits.shape[0])[:, np.newaxis]
+    if cols.shape[0] == 1:
+        return pack(bits[:, cols[0]])
+    return pack(bits[rows, cols])
+
+
+def _shift_down(words: np.ndarray, offset: int) -> np.ndarray:
+    """Moves column c + offset to column c, across words."""
+    whole, part = divmod(offset, WORD_BITS)
+    padded = np.zeros(words.shape[:-1] + (words.shape[-1] + whole + 1,),
+                      np.uint64)
+    padded[..., :words.shape[-1]] = words
+    low = padded[..., whole:whole + words.shape[-1]]
+    if part == 0:
+        return low.copy()
+    high = padded[..., whole + 1:whole + 1 + words.shape[-1]]
+    return ((low >> np.uint64(part)) |
+            (high << np.uint64(WORD_BITS - part)))
+
+
+def _compact(words: np.ndarray, step: int) -> np.ndarray:
+    """
+    Moves the bits at multiples of step (a power of two) to the low bits of
+    their word, by compacting every other bit log2(step) times.
+    """
+    words = words.copy()
+    count = WORD_BITS
+    while step > 1:
+        words &= _COMPACT_MASKS[0]
+        for level, mask in enumerate(_COMPACT_MASKS[1:]):
+            if (1 << level) >= count // 2:
+                break
+            words = (words | (words >> np.uint64(1 << level))) & mask
+        count //= 2
+        step //= 2
+    return words
+
+
+def gather_strided(words: np.ndarray,
+                   tex_width: int,
+                   width: int,
+                   step: int,
+                   start: int) -> np.ndarray:
+    """
+    Reads column step * x + start into each column x (clamped to the
+    texture's edge), with whole-word shifts and masks when step is a power
+    of two.
+    """
+    if step < 1 or step > WORD_BITS or step & (step - 1) or start < 0:
+        cols = np.arange(width)[np.newaxis] * step + start
+        return gather_columns(words, tex_width, cols)
+
+    # Each word holds WORD_BITS / step of the read columns once compacted.
+    per_word = WORD_BITS // step
+    compacted = _compact(_shift_down(words, start), step)
+    groups = word_count(width)
+    needed = groups * step
+    padded = np.zeros(words.shape[:-1] + (needed,), np.uint64)
+    available = min(needed, compacted.shape[-1])
+    padded[..., :available] = compacted[..., :available]
+    shifts = (np.arange(step, dtype=np.uint64) * np.uint64(per_word))
+    parts = padded.reshape(words.shape[:-1] + (groups, step)) << shifts
+    result = np.bitwise_or.reduce(parts, axis=-1) & column_mask(width)
+
+    # Columns reading past the edge read the last column instead.
+    first_clamped = -(-(tex_width - start) // step)
+    if first_clamped < width:
+        clamped = compare_columns('>=', first_clamped, width)
+        last = spread(column_bits(words, tex_width, tex_width - 1), width)
+        result = (result & ~clamped) | (last & clamped)
+    return result
+
+
+def permute_xor(words: np.ndarray,
+                tex_width: int,
+                width: int,
+                flip: int) -> np.ndarray:
+    """
+    Reads column x ^ flip into each column x, by swapping groups of bits
+    within words when flip is a power of two below the word size.
+    """
+    if (flip < 1 or flip >= WORD_BITS or flip & (flip - 1) or
+            tex_width != width or width % (2 * flip)):
+        cols = np.arange(width)[np.newaxis] ^ flip
+        return gather_columns(words, tex_width, cols)
+    mask = np.uint64(_group_mask(flip))
+    shift = np.uint64(flip)
+    return ((words >> shift) & mask) | ((words & mask) << shift)
+
+
+def _group_mask(flip: int) -> int:
+    """The bits whose position has the flip bit clear."""
+    result = 0
+    for bit in range(WORD_BITS):
+        if not bit & flip:
+            result |= 1 << bit
+    return result
+
+
+def cast(value, dtype) -> np.ndarray:
+    return np.asarray(value).astype(dtype)
+
+
+def divide(a, b):
+    """
+    Integer division rounding towards zero, as in shaders (dividing by zero
+    gives the dividend, where shaders give anything).
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if not np.issubdtype(np.result_type(a, b), np.integer):
+        return a / b
+    safe_b = np.where(b == 0, 1, b).astype(b.dtype)
+    q = np.abs(a.astype(np.int64)) // np.abs(safe_b.astype(np.int64))
+    return np.where((a < 0) != (b < 0), -q, q).astype(a.dtype)
+
+
+def remainder(a, b):
+    """The remainder of divide (taking the sign of the dividend)."""
+    b = np.asarray(b)
+    return np.fmod(a, np.where(b == 0, 1, b).astype(b.dtype))
+
+
+def render(chunk: Callable[[int, int], np.ndarray],
+           width: int,
+           height: int,
+           dtype,
+           out: Union[None, BitTexture, np.ndarray] = None,
+           rows_per_chunk: Optional[int] = None
+           ) -> Union[BitTexture, np.ndarray]:
+    """
+    Runs a kernel's chunk function over the rows of the output, given as a
+    range of rows, a chunk at a time so that outputs (and the inputs they
+    read) can be memory maps larger than the available memory.
+
+    Bit outputs (a dtype of None) are bit textures, others are arrays.
+    """
+    if out is None:
+        if dtype is None:
+            out = BitTexture.zeros(width, height)
+        else:
+            out = np.zeros((height, width), dtype)
+    data = out.words if dtype is None else out
+    step = rows_per_chunk or max(height, 1)
+    # Like shaders, kernels compute branches that end up unused.
+    with np.errstate(all='ignore'):
+        for start in range(0, height, step):
+            stop = min(start + step, height)
+            data[start:stop] = chunk(start, stop)
+    return out
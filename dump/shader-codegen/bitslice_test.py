@@ -0,0 +1,118 @@
+import operator
+import numpy as np
+import bitslice
+from bitslice import BitTexture
+
+_WIDTHS = [1, 37, 63, 64, 65, 131, 200]
+
+_OPS = {'<': operator.lt, '<=': operator.le, '>': operator.gt,
+        '>=': operator.ge, '==': operator.eq, '!=': operator.ne}
+
+
+def _random_bits(rng: np.random.Generator, height: int,
+                 width: int) -> np.ndarray:
+    return rng.random((height, width)) < 0.5
+
+
+def test_pack_round_trip():
+    rng = np.random.default_rng(0)
+    for width in _WIDTHS:
+        bits = _random_bits(rng, 3, width)
+        tex = BitTexture.from_bits(bits)
+        assert tex.words.shape == (3, bitslice.word_count(width))
+        np.testing.assert_array_equal(tex.to_bits(), bits)
+        # Bits past the width stay zero.
+        padded = bitslice.unpack(tex.words, tex.words.shape[1] * 64)
+        assert not padded[:, width:].any()
+
+
+def test_column_masks():
+    for width in _WIDTHS:
+        xs = np.arange(width)
+        for bound in [-1, 0, 1, width // 2, width - 1, width, width + 5]:
+            for op, func in _OPS.items():
+                words = bitslice.compare_columns(op, bound, width)
+                np.testing.assert_array_equal(
+                    bitslice.unpack(words, width),
+                    func(xs, bound),
+                    err_msg=str((width, bound, op)))
+        # Bounds given per row.
+        bounds = np.array([[0], [3], [width]])
+        np.testing.assert_array_equal(
+            bitslice.unpack(bitslice.below(bounds, width), width),
+            xs[np.newaxis] < bounds)
+
+
+def test_gather_strided_matches_gather_columns():
+    rng = np.random.default_rng(1)
+    for tex_width in _WIDTHS:
+        words = BitTexture.from_bits(_random_bits(rng, 4, tex_width)).words
+        for step in [1, 2, 3, 4, 8, 16, 64]:
+            for start in [0, 1, step - 1, 5]:
+                for width in {1, tex_width, -(-tex_width // step), 70}:
+                    cols = np.arange(width)[np.newaxis] * step + start
+                    np.testing.assert_array_equal(
+                        bitslice.gather_strided(words, tex_width, width,
+                                                step, start),
+                        bitslice.gather_columns(words, tex_width, cols),
+                        err_msg=str((tex_width, width, step, start)))
+
+
+def test_permute_xor_matches_gather_columns():
+    rng = np.random.default_rng(2)
+    for width in _WIDTHS + [128]:
+        words = BitTexture.from_bits(_random_bits(rng, 3, width)).words
+        for flip in [1, 2, 4, 32, 3, 64]:
+            cols = np.arange(width)[np.newaxis] ^ flip
+            np.testing.assert_array_equal(
+                bitslice.permute_xor(words, width, width, flip),
+                bitslice.gather_columns(words, width, cols),
+                err_msg=str((width, flip)))
+
+
+def test_reads_clamp_to_edge():
+    rng = np.random.default_rng(3)
+    bits = _random_bits(rng, 5, 131)
+    tex = BitTexture.from_bits(bits)
+    rows = np.array([[-1], [0], [4], [9]])
+    cols = np.array([[-3, 0, 64, 130, 200]])
+    clamped_rows = np.clip(rows, 0, 4)
+    clamped_cols = np.clip(cols, 0, 130)
+    np.testing.assert_array_equal(bitslice.read_bits(tex, rows, cols),
+                                  bits[clamped_rows, clamped_cols])
+    np.testing.assert_array_equal(bitslice.read_rows(tex, rows),
+                                  tex.words[clamped_rows[:, 0]])
+    np.testing.assert_array_equal(
+        bitslice.column_bits(tex.words, 131, np.array([[70], [200], [-1],
+                                                       [0], [64]])),
+        bits[np.arange(5), [70, 130, 0, 0, 64]][:, np.newaxis])
+    np.testing.assert_array_equal(
+        bitslice.unpack(bitslice.row_range(tex, 3, 7), 131),
+        bits[[3, 4, 4, 4]])
+    np.testing.assert_array_equal(
+        bitslice.unpack(bitslice.fit(tex.words, 131, 140), 140),
+        bits[:, np.clip(np.arange(140), 0, 130)])
+
+
+def test_division_truncates():
+    a = np.array([-7, -6, 0, 6, 7], dtype=np.int32)
+    for b in [-3, 3]:
+        expected = np.trunc(a / b).astype(np.int32)
+        np.testing.assert_array_equal(bitslice.divide(a, np.int32(b)),
+                                      expected)
+        np.testing.assert_array_equal(bitslice.remainder(a, np.int32(b)),
+                                      a - expected * b)
+    np.testing.assert_array_equal(bitslice.divide(a, np.int32(0)), a)
+
+
+def test_render_in_chunks():
+    def chunk(y0, y1):
+        rows = np.arange(y0, y1)[:, np.newaxis]
+        return bitslice.compare_columns('<', rows, 70)
+
+    whole = bitslice.render(chunk, 70, 9, None)
+    chunked = bitslice.render(chunk, 70, 9, None, rows_per_chunk=4)
+    np.testing.assert_array_equal(chunked.words, whole.words)
+    np.testing.assert_array_equal(
+        whole.to_bits(),
+        np.arange(70)[np.newaxis] < np.arange(9)[:, np.newaxis])
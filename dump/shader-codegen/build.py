@@ -0,0 +1,219 @@
+import argparse
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from typing import Dict, List, Tuple
+
+# The numbers of texels combined by each pass of the fold shaders.
+FOLD_ARITIES = [2, 4, 8, 16]
+
+# The generated module name of each generator in gen.py, with its arguments.
+GENERATORS = {
+    'singleX': ('single_x', {}),
+    'singleHadamard': ('single_hadamard', {}),
+    'singleHadamardPacked': ('single_hadamard', {'packed': True}),
+    'singleCZ': ('single_cz', {}),
+    'singleCZPacked': ('single_cz', {'packed': True}),
+    'shifter': ('shifter', {}),
+    'prepareCleanState': ('prepare_clean_state', {}),
+    'bitToInt': ('bit_to_int', {}),
+    'eliminateCol': ('eliminate_column', {}),
+    'measureSetResult': ('measure_set_result', {}),
+    'measureClaims': ('measure_claims', {}),
+    'minFoldRows': ('min_fold_rows', {}),
+    'measureBatchSetResult': ('measure_batch_set_result', {}),
+    'eliminateCols': ('eliminate_columns', {}),
+    'measureBlocked': ('measure_blocked', {}),
+    'orAll': ('or_all', {}),
+    'surfaceCycle': ('surface_cycle', {}),
+    'surfaceCyclePacked': ('surface_cycle', {'packed': True}),
+    'frameCycle': ('frame_cycle', {}),
+    'frameMeasureRecord': ('frame_measure_record', {}),
+    'frameMeasureReset': ('frame_measure_reset', {}),
+    'depolarize': ('depolarize', {}),
+    'depolarizeFrame': ('depolarize', {'frame': True}),
+    'bitFlip': ('bit_flip', {}),
+    'bitFlipFrame': ('bit_flip', {'frame': True}),
+    'measurementFlip': ('measurement_flip', {}),
+    'measurementFlipFrame': ('measurement_flip', {'frame': True}),
+    'gatherMeasurements': ('gather_measurements', {}),
+    'gatherFrameRecord': ('gather_frame_record', {}),
+}
+for _packed in [False, True]:
+    _suffix = 'Packed' if _packed else ''
+    for _arity in FOLD_ARITIES:
+        _fold = '' if _arity == 2 else str(_arity)
+        if not _packed:
+            GENERATORS['findOneFold' + _fold] = ('find_one_fold',
+                                                 {'arity': _arity})
+        GENERATORS['orFold' + _fold + _suffix] = ('or_fold',
+                                                  {'arity': _arity,
+                                                   'packed': _packed})
+    for _mode, _check in [('All', None), ('Check', True), ('Data', False)]:
+        GENERATORS['hadamard' + _mode + _suffix] = (
+            'surface_hadamards',
+            {'check_vs_data': _check, 'packed': _packed})
+    for _evens in [False, True]:
+        for _verticals in [False, True]:
+            for _zs in [False, True]:
+                _name = 'surfaceCzs{}{}{}{}'.format('EO'[_evens],
+                                                    'HV'[_verticals],
+                                                    'XZ'[_zs],
+                                                    _suffix)
+                GENERATORS[_name] = ('do_surface_czs',
+                                     {'evens': _evens,
+                                      'verticals': _verticals,
+                                      'zs': _zs,
+                                      'packed': _packed})
+
+_CACHE_FILE_NAME = '.shader-build-cache.json'
+# Lists the report (see report.py) of each shader of each generated module.
+REPORT_FILE_NAME = 'shader-report.json'
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf8')).hexdigest()
+
+
+def _source_hash() -> str:
+    """A hash of the generator sources, which every output depends on."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(directory, '*.py'))):
+        h.update(os.path.basename(path).encode('utf8'))
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _input_hash(source_hash: str, name: str) -> str:
+    func_name, kwargs = GENERATORS[name]
+    return _hash(json.dumps([source_hash, func_name, kwargs],
+                            sort_keys=True))
+
+
+def _read(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf8') as f:
+        return f.read()
+
+
+def _generate(name: str) -> Tuple[str, str, Dict[str, Dict[str, int]]]:
+    # Imported here so that only worker processes build graphs.
+    import gen
+    from report import collect_reports
+    func_name, kwargs = GENERATORS[name]
+    with collect_reports() as reports:
+        content = getattr(gen, func_name)(**kwargs) + '\n'
+    return name, content, reports
+
+
+def build(out_dir: str,
+          names: List[str] = None,
+          processes: int = None,
+          use_cache: bool = True) -> Dict[str, str]:
+    """
+    Writes the generated module of each named generator (default all of
+    them) into out_dir, returning the status ('unchanged', 'written' or
+    'cached') of each.
+
+    Files are only rewritten when their content changes, so that unchanged
+    outputs keep their timestamps. Outputs are skipped entirely when neither
+    the generator sources nor the output file changed since the last build.
+
+    The reports of the built modules' shaders (see report.py) are updated in
+    a json file in out_dir.
+    """
+    names = sorted(GENERATORS) if names is None else names
+    os.makedirs(out_dir, exist_ok=True)
+    cache_path = os.path.join(out_dir, _CACHE_FILE_NAME)
+    cache = {}
+    if use_cache:
+        cache = json.loads(_read(cache_path) or '{}')
+
+    source_hash = _source_hash()
+    statuses = {}
+    pending = []
+    for name in names:
+        entry = cache.get(name, {})
+        content = _read(os.path.join(out_dir, name + '.js'))
+        if (entry.get('input') == _input_hash(source_hash, name) and
+                content is not None and
+                entry.get('output') == _hash(content) and
+                'report' in entry):
+            statuses[name] = 'cached'
+        else:
+            pending.append(name)
+
+    with multiprocessing.Pool(processes) as pool:
+        for name, content, reports in pool.imap_unordered(_generate,
+                                                          pending):
+            path = os.path.join(out_dir, name + '.js')
+            old = _read(path)
+            if old is not None and _hash(old) == _hash(content):
+                statuses[name] = 'unchanged'
+            else:
+                with open(path, 'w', encoding='utf8') as f:
+                    f.write(content)
+                statuses[name] = 'written'
+            cache[name] = {'input': _input_hash(source_hash, name),
+                           'output': _hash(content),
+                           'report': reports}
+
+    report_path = os.path.join(out_dir, REPORT_FILE_NAME)
+    report = json.loads(_read(report_path) or '{}')
+    report.update({name: cache[name]['report'] for name in names})
+    # Drop the modules of removed generators.
+    report = {k: v for k, v in report.items() if k in GENERATORS}
+    report_text = json.dumps(report, indent=2, sort_keys=True) + '\n'
+    if report_text != _read(report_path):
+        with open(report_path, 'w', encoding='utf8') as f:
+            f.write(report_text)
+
+    if use_cache:
+        with open(cache_path, 'w', encoding='utf8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    return statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generates the shader modules into a directory.')
+    parser.add_argument('-o',
+                        '--out-dir',
+                        default=os.path.join(os.path.dirname(__file__),
+                                             '..',
+                                             'generated-shaders'))
+    parser.add_argument('names',
+                        nargs='*',
+                        help='Generators to run (default: all of them).')
+    parser.add_argument('-j', '--processes', type=int, default=None)
+    parser.add_argument('--no-cache',
+                        action='store_true',
+                        help='Regenerate even when nothing changed.')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in GENERATORS]
+    if unknown:
+        parser.error('Unknown generators: {}'.format(', '.join(unknown)))
+
+    start = time.time()
+    statuses = build(args.out_dir,
+                     args.names or None,
+                     args.processes,
+                     use_cache=not args.no_cache)
+    for name in sorted(statuses):
+        if statuses[name] == 'written':
+            print('wrote', os.path.join(args.out_dir, name + '.js'))
+    counts = {s: list(statuses.values()).count(s)
+              for s in ['written', 'unchanged', 'cached']}
+    print('{written} written, {unchanged} unchanged, {cached} cached '
+          'in {t:.1f}s'.format(t=time.time() - start, **counts))
+
+
+if __name__ == '__main__':
+    main()
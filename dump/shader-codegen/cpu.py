@@ -0,0 +1,526 @@
+import argparse
+import os
+from typing import Callable, Dict, List, NamedTuple
+import numpy as np
+from idpression import (
+    Idpression,
+    Literal,
+    Uniform,
+    UniformTexSize,
+    UnaryOp,
+    FuncOp,
+    PropertyOp,
+    BinaryOp,
+    Matcher,
+    Reduce,
+    ShaderType,
+    Bit,
+    Byte,
+    Int32,
+    UInt32,
+    Float32,
+    Vec2,
+    PackedBits,
+    X,
+    Y,
+)
+import bitslice
+import graphs
+import tex
+import tiling
+
+# Values are computed per row (as (rows, 1) columns, or scalars when they
+# are the same for all rows), per texel (as (rows, width) arrays), or, for
+# bits varying by column, as bit-sliced planes (see bitslice.py) where each
+# operation handles 64 columns at once.
+ROW = 'row'
+TEXELS = 'texels'
+PLANE = 'plane'
+
+_DTYPES = {
+    Bit: 'np.bool_',
+    Byte: 'np.int32',
+    Int32: 'np.int32',
+    UInt32: 'np.uint32',
+    PackedBits: 'np.uint32',
+    Float32: 'np.float32',
+}
+
+# Bitwise and logical operators, as numpy operators on bits and words.
+_PLANE_OPS = {'&&': '&', '||': '|', '!=': '^', '&': '&', '|': '|', '^': '^'}
+_NUMPY_OPS = {'&&': '&', '||': '|'}
+_COMPARISONS = ['==', '!=', '<', '<=', '>', '>=']
+_FLIPPED = {'==': '==', '!=': '!=', '<': '>', '<=': '>=', '>': '<',
+            '>=': '<='}
+
+class _Value(NamedTuple):
+    expression: str
+    kind: str
+    val_type: ShaderType
+
+
+class _KernelWriter(object):
+    """Writes the statements computing a graph's nodes, in order."""
+
+    def __init__(self, root: Idpression):
+        self.root = root
+        self.values = {}  # type: Dict[Idpression, _Value]
+        self.lines = []  # type: List[str]
+        self.names = 0
+        self.indent = '        '
+        self.textures = {}  # type: Dict[str, tex.Tex]
+        self.uniforms = {}  # type: Dict[str, Uniform]
+        self.sizes = {}  # type: Dict[Idpression, tex.Tex]
+        for node in root.collect_ascending_deps(include_uniforms=True):
+            if isinstance(node, tex.Tex):
+                self.textures[node.tex_name()] = node
+                self.sizes[node.size] = node
+        for node in root.collect_ascending_deps(include_uniforms=True):
+            if isinstance(node, Uniform) and node not in self.sizes:
+                self.uniforms[node.var_name] = node
+
+    def write(self) -> _Value:
+        for node in self.root.collect_ascending_deps(include_uniforms=False):
+            self.value(node)
+        return self.values[self.root]
+
+    def value(self, node: Idpression) -> _Value:
+        result = self.values.get(node)
+        if result is None:
+            result = self._compute(node)
+            if result.expression.isidentifier() or isinstance(node, Literal):
+                self.values[node] = result
+            else:
+                name = self._name('v')
+                self.lines.append('{}{} = {}'.format(self.indent,
+                                                     name,
+                                                     result.expression))
+                self.values[node] = result._replace(expression=name)
+        return self.values[node]
+
+    def _name(self, prefix: str) -> str:
+        self.names += 1
+        return '{}{}'.format(prefix, self.names - 1)
+
+    def _compute(self, node: Idpression) -> _Value:
+        if node is X:
+            return _Value('xs', TEXELS, Int32)
+        if node is Y:
+            return _Value('ys', ROW, Int32)
+        if isinstance(node, Literal):
+            return _literal(node)
+        if isinstance(node, UniformTexSize) and node in self.sizes:
+            return _Value('bitslice.size({})'.format(
+                self.sizes[node].tex_name()), ROW, Vec2)
+        if isinstance(node, Uniform):
+            return _Value(node.var_name, ROW, node.val_type)
+        if isinstance(node, tex.Tex):
+            return self._read(node, slice(None), slice(None))
+        if isinstance(node, tex.TexSlice):
+            return self._read(node.tex, node.x_slice, node.y_slice)
+        if isinstance(node, PropertyOp):
+            index = {'x': 0, 'y': 1}[node.prop_name]
+            return _Value('{}[{}]'.format(self.value(node.val).expression,
+                                          index), ROW, node.val_type)
+        if isinstance(node, UnaryOp):
+            return self._unary(node)
+        if isinstance(node, FuncOp):
+            return self._func(node)
+        if isinstance(node, BinaryOp):
+            rhs = self.value(node.rhs)
+            if (node.op_char in ['<<', '>>'] and
+                    isinstance(node.rhs, Literal) and
+                    node.rhs.val_type is not node.lhs.val_type):
+                rhs = _literal(Literal.of(node.lhs.val_type,
+                                          node.rhs.python_equivalent))
+            return self._binary(node.op_char,
+                                self.value(node.lhs),
+                                rhs,
+                                node.val_type,
+                                node.lhs is X,
+                                node.rhs is X)
+        if isinstance(node, Matcher):
+            return self._match(node)
+        if isinstance(node, Reduce):
+            return self._reduce(node)
+        raise NotImplementedError('No CPU version of {!r}.'.format(node))
+
+    def _index(self,
+               index,
+               coordinate: str) -> _Value:
+        if isinstance(index, slice):
+            index = tex.coalesce_slice(index)
+            result = _Value(coordinate,
+                            TEXELS if coordinate == 'xs' else ROW,
+                            Int32)
+            if not (isinstance(index.step, int) and index.step == 1):
+                result = self._binary('*',
+                                      result,
+                                      self.value(Idpression.wrap(index.step)),
+                                      Int32)
+            if not (isinstance(index.start, int) and index.start == 0):
+                result = self._binary(
+                    '+',
+                    result,
+                    self.value(Idpression.wrap(index.start)),
+                    Int32)
+            return result
+        return self.value(Idpression.wrap(index))
+
+    def _read(self, src: 'tex.Tex', x_index, y_index) -> _Value:
+        name = src.tex_name()
+        if tex.is_identity_index(y_index):
+            rows = 'bitslice.row_range({}, y0, y1)'.format(name)
+        else:
+            y = self._index(y_index, 'ys')
+            if y.kind != ROW and src.val_type is Bit:
+                # Rows varying by column need a word per texel.
+                x = self._texels(self._index(x_index, 'xs'))
+                return self._plane(_Value('bitslice.read_bits({}, {}, '
+                                          '{})'.format(name,
+                                                       y.expression,
+                                                       x.expression),
+                                          TEXELS,
+                                          Bit))
+            rows = 'bitslice.read_rows({}, {})'.format(name, y.expression)
+
+        if src.val_type is not Bit:
+            x = self._index(x_index, 'xs')
+            if tex.is_identity_index(y_index):
+                y = _Value('ys', ROW, Int32)
+            return _Value('bitslice.read_texels({}, {}, {})'.format(
+                name, y.expression, x.expression), x.kind, src.val_type)
+
+        width = '{}.width'.format(name)
+        if tex.is_identity_index(x_index):
+            return _Value('bitslice.fit({}, {}, width)'.format(rows, width),
+                          PLANE, Bit)
+        if isinstance(x_index, slice):
+            x_index = tex.coalesce_slice(x_index)
+            if (isinstance(x_index.step, int) and
+                    isinstance(x_index.start, int)):
+                # Strided reads, as in folds, compact the read columns.
+                return _Value('bitslice.gather_strided({}, {}, width, {}, '
+                              '{})'.format(rows,
+                                           width,
+                                           x_index.step,
+                                           x_index.start), PLANE, Bit)
+        if (isinstance(x_index, BinaryOp) and
+                x_index.op_char == '^' and
+                x_index.lhs is X and
+                isinstance(x_index.rhs, Literal)):
+            # Reads of partner columns swap bits within words.
+            return _Value('bitslice.permute_xor({}, {}, width, {})'.format(
+                rows, width, x_index.rhs.python_equivalent), PLANE, Bit)
+        x = self._index(x_index, 'xs')
+        if x.kind == ROW:
+            return _Value('bitslice.column_bits({}, {}, {})'.format(
+                rows, width, x.expression), ROW, Bit)
+        return _Value('bitslice.gather_columns({}, {}, {})'.format(
+            rows, width, self._texels(x).expression), PLANE, Bit)
+
+    def _plane(self, value: _Value) -> _Value:
+        if value.kind == PLANE:
+            return value
+        if value.kind == ROW:
+            return _Value('bitslice.spread({}, width)'.format(
+                value.expression), PLANE, Bit)
+        return _Value('bitslice.pack({})'.format(value.expression),
+                      PLANE,
+                      Bit)
+
+    def _texels(self, value: _Value) -> _Value:
+        if value.kind == PLANE:
+            return _Value('bitslice.unpack({}, width)'.format(
+                value.expression), TEXELS, Bit)
+        return value
+
+    def _unary(self, node: UnaryOp) -> _Value:
+        val = self.value(node.val)
+        if val.kind == PLANE:
+            if node.op_char not in ['!', '~']:
+                val = self._texels(val)
+            else:
+                return _Value('bitslice.invert({}, width)'.format(
+                    val.expression), PLANE, Bit)
+        return _Value('{}({})'.format(node.op_char.replace('!', '~'),
+                                      val.expression), val.kind,
+                      node.val_type)
+
+    def _func(self, node: FuncOp) -> _Value:
+        vals = [self.value(v) for v in node.vals]
+        if node.op_name == 'bool' and vals[0].val_type is Bit:
+            return vals[0]
+        vals = [self._texels(v) for v in vals]
+        kind = TEXELS if any(v.kind == TEXELS for v in vals) else ROW
+        args = [v.expression for v in vals]
+        if node.op_name == 'bool':
+            expression = '({}) != 0'.format(args[0])
+        elif node.op_name in ['int', 'uint', 'float']:
+            expression = 'bitslice.cast({}, {})'.format(
+                args[0], _DTYPES[node.val_type])
+        elif node.op_name == 'clamp':
+            expression = 'np.clip({}, {}, {})'.format(*args)
+        elif node.op_name in ['min', 'max']:
+            expression = 'np.{}imum({}, {})'.format(node.op_name, *args)
+        elif node.op_name == 'mod':
+            expression = 'np.mod({}, {})'.format(*args)
+        else:
+            raise NotImplementedError('No CPU version of {}.'.format(
+                node.op_name))
+        result = _Value(expression, kind, node.val_type)
+        if node.val_type is Bit and kind == TEXELS:
+            return self._plane(result)
+        return result
+
+    def _binary(self,
+                op: str,
+                lhs: _Value,
+                rhs: _Value,
+                val_type: ShaderType,
+                lhs_is_x: bool = False,
+                rhs_is_x: bool = False) -> _Value:
+        kinds = {lhs.kind, rhs.kind}
+        if kinds == {ROW}:
+            return _Value(_numpy_op(op, lhs, rhs), ROW, val_type)
+
+        if (val_type is Bit and
+                op in _PLANE_OPS and
+                lhs.val_type is Bit and
+                rhs.val_type is Bit):
+            return _Value('({}) {} ({})'.format(
+                self._plane(lhs).expression,
+                _PLANE_OPS[op],
+                self._plane(rhs).expression), PLANE, Bit)
+        if (val_type is Bit and
+                op == '==' and
+                lhs.val_type is Bit and
+                rhs.val_type is Bit):
+            return _Value('bitslice.invert(({}) ^ ({}), width)'.format(
+                self._plane(lhs).expression,
+                self._plane(rhs).expression), PLANE, Bit)
+
+        if op in _COMPARISONS:
+            # Comparing the column with a row's value gives whole words.
+            if lhs_is_x and rhs.kind == ROW:
+                return _Value('bitslice.compare_columns({!r}, {}, '
+                              'width)'.format(op, rhs.expression), PLANE, Bit)
+            if rhs_is_x and lhs.kind == ROW:
+                return _Value('bitslice.compare_columns({!r}, {}, '
+                              'width)'.format(_FLIPPED[op], lhs.expression),
+                              PLANE,
+                              Bit)
+
+        result = _Value(_numpy_op(op, self._texels(lhs), self._texels(rhs)),
+                        TEXELS,
+                        val_type)
+        if val_type is Bit:
+            return self._plane(result)
+        return result
+
+    def _match(self, node: Matcher) -> _Value:
+        clauses = [(self.value(a), self.value(b)) for a, b in node.clauses]
+        result = self.value(node.else_result)
+        values = [v for clause in clauses for v in clause] + [result]
+        if all(v.kind == ROW for v in values):
+            for condition, value in reversed(clauses):
+                result = _Value('np.where({}, {}, {})'.format(
+                    condition.expression,
+                    value.expression,
+                    result.expression), ROW, node.val_type)
+            return result
+        if node.val_type is Bit:
+            result = self._plane(result)
+            for condition, value in reversed(clauses):
+                result = _Value('bitslice.select({}, {}, {}, width)'.format(
+                    self._plane(condition).expression,
+                    self._plane(value).expression,
+                    result.expression), PLANE, Bit)
+            return result
+        result = self._texels(result)
+        for condition, value in reversed(clauses):
+            result = _Value('np.where({}, {}, {})'.format(
+                self._texels(condition).expression,
+                self._texels(value).expression,
+                result.expression), TEXELS, node.val_type)
+        return result
+
+    def _reduce(self, node: Reduce) -> _Value:
+        count = self.value(node.count)
+        if count.kind != ROW:
+            raise NotImplementedError('Loop counts varying by column.')
+        initial = self.value(node.initial)
+        name = self._name('v')
+        index = self._name('i')
+        self.values[node.index] = _Value(index, ROW, Int32)
+        # The accumulator's kind can't change within the loop, so it starts
+        # out as general as the loop body might need.
+        varying = {v for v in node.inner} | {node.index}
+        if node.val_type is Bit:
+            initial = self._plane(initial)
+        else:
+            initial = self._texels(initial)
+            if initial.kind == ROW:
+                initial = _Value('np.broadcast_to({}, (y1 - y0, '
+                                 'width))'.format(initial.expression),
+                                 TEXELS,
+                                 node.val_type)
+        self.lines.append('{}{} = {}'.format(self.indent,
+                                             name,
+                                             initial.expression))
+        self.lines.append(
+            '{}for {} in range(int(np.max({}, initial=0))):'.format(
+                self.indent, index, count.expression))
+        outer_indent = self.indent
+        self.indent += '    '
+        self.lines.append('{}{} = np.int32({})'.format(self.indent,
+                                                       index,
+                                                       index))
+        for dep in node.inner:
+            self.value(dep)
+        body = self.value(node.body)
+        combined = self._binary(node.op_char,
+                                _Value(name, initial.kind, node.val_type),
+                                body,
+                                node.val_type)
+        if combined.kind != initial.kind:
+            combined = (self._plane(combined)
+                        if initial.kind == PLANE
+                        else self._texels(combined))
+        if not isinstance(node.count, Literal):
+            # Rows with fewer iterations keep their value.
+            looping = '{} < {}'.format(index, count.expression)
+            if initial.kind == PLANE:
+                combined = _Value('bitslice.select(bitslice.spread({}, '
+                                  'width), {}, {}, width)'.format(
+                                      looping,
+                                      combined.expression,
+                                      name), PLANE, Bit)
+            else:
+                combined = _Value('np.where({}, {}, {})'.format(
+                    looping, combined.expression, name), TEXELS,
+                    node.val_type)
+        self.lines.append('{}{} = {}'.format(self.indent,
+                                             name,
+                                             combined.expression))
+        self.indent = outer_indent
+        for dep in varying:
+            self.values.pop(dep, None)
+        return _Value(name, initial.kind, node.val_type)
+
+
+def _literal(node: Literal) -> _Value:
+    value = node.python_equivalent
+    if node.val_type is Bit:
+        return _Value('np.{}_'.format(bool(value)), ROW, Bit)
+    if node.val_type in _DTYPES:
+        return _Value('{}({!r})'.format(_DTYPES[node.val_type], value),
+                      ROW,
+                      node.val_type)
+    raise NotImplementedError('No CPU version of {!r}.'.format(node))
+
+
+def _numpy_op(op: str, lhs: _Value, rhs: _Value) -> str:
+    a, b = lhs.expression, rhs.expression
+    if op == '/':
+        return 'bitslice.divide({}, {})'.format(a, b)
+    if op == '%':
+        return 'bitslice.remainder({}, {})'.format(a, b)
+    if op in ['<<', '>>'] and rhs.val_type is not lhs.val_type:
+        # Shifts keep the type of the shifted value.
+        b = 'bitslice.cast({}, {})'.format(b, _DTYPES[lhs.val_type])
+    return '({}) {} ({})'.format(a, _NUMPY_OPS.get(op, op), b)
+
+
+def generate_kernel(name: str, final_value: Idpression) -> str:
+    """
+    The source of a python function computing (untiled) final_value on the
+    CPU, for a single shot. It takes the output's width and height, with the
+    shader's textures and uniforms as keyword arguments, and returns the
+    output (see bitslice.render).
+
+    Bit textures (inputs and outputs) are bit-sliced BitTextures. Others are
+    arrays of their texels' values.
+    """
+    final_value = tiling.single_shot(Idpression.wrap(final_value))
+    writer = _KernelWriter(final_value)
+    result = writer.write()
+    if final_value.val_type is Bit:
+        result = writer._plane(result)
+        dtype = 'None'
+    else:
+        dtype = _DTYPES[final_value.val_type]
+
+    params = sorted(writer.textures) + sorted(writer.uniforms)
+    conversions = []
+    for param in sorted(writer.uniforms):
+        val_type = writer.uniforms[param].val_type
+        if val_type is Vec2:
+            convert = 'np.asarray({}, np.float32)'
+        elif val_type is Bit:
+            convert = 'np.bool_({})'
+        else:
+            convert = _DTYPES[val_type] + '({})'
+        conversions.append('    {} = {}'.format(param,
+                                                convert.format(param)))
+    lines = [
+        'def {}(width, height, *, {}out=None, rows_per_chunk=None):'.format(
+            name, ''.join(p + ', ' for p in params)),
+    ] + conversions + [
+        '',
+        '    def chunk(y0, y1):',
+        '        ys = np.arange(y0, y1, dtype=np.int32)[:, np.newaxis]',
+        '        xs = np.arange(width, dtype=np.int32)[np.newaxis]',
+    ] + writer.lines + [
+        '        return {}'.format(result.expression),
+        '',
+        '    return bitslice.render(chunk, width, height, {}, out, '
+        'rows_per_chunk)'.format(dtype),
+    ]
+    return '\n'.join(lines)
+
+
+def compile_kernel(name: str, final_value: Idpression) -> Callable:
+    """The kernel computing final_value (see generate_kernel)."""
+    namespace = {'np': np, 'bitslice': bitslice}
+    exec(generate_kernel(name, final_value), namespace)
+    return namespace[name]
+
+
+def generate_kernel_module(graphs: Dict[str, Idpression]) -> str:
+    kernels = [generate_kernel(name, graphs[name]) for name in sorted(graphs)]
+    return '\n\n\n'.join(['''####### AUTO-GENERATED CODE #######
+
+import numpy as np
+import bitslice'''] + kernels) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generates CPU kernels of the shaders (for bit '
+                    'tableaus, bit-sliced into 64 bit words).')
+    parser.add_argument('-o',
+                        '--out',
+                        default=os.path.join(os.path.dirname(__file__),
+                                             'kernels.py'))
+    parser.add_argument('names',
+                        nargs='*',
+                        help='Generators to compile (default: all of them).')
+    args = parser.parse_args()
+
+    collected = graphs.generator_graphs(args.names or None)
+    supported = {}
+    for name, graph in sorted(collected.items()):
+        try:
+            generate_kernel(name, graph)
+        except NotImplementedError as ex:
+            print('skipped', name + ':', ex)
+            continue
+        supported[name] = graph
+    with open(args.out, 'w', encoding='utf8') as f:
+        f.write(generate_kernel_module(supported))
+    print('wrote {} kernels to {}'.format(len(supported), args.out))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from idpression import Bit
+import bitslice
+import cpu
+import interpret
+import shader_cases
+
+# Widths that aren't multiples of the word size, with one below a word.
+_SHAPES = [(70, 9), (131, 5), (37, 4)]
+
+
+def _bindings(name: str, width: int, height: int, seed: int):
+    rng = np.random.default_rng(seed)
+    root = shader_cases.GRAPHS[name]
+    textures = {n: shader_cases.random_texels(rng, t, (height, width))
+                for n, t in shader_cases.texture_nodes(root).items()}
+    uniforms = shader_cases.random_uniforms(rng, root)
+    for key, value in uniforms.items():
+        # Positions anywhere in the texture, including past the first word.
+        if type(value) is int and not key.startswith('surface_'):
+            uniforms[key] = int(rng.integers(0, width))
+    return root, textures, uniforms
+
+
+def _kernel_inputs(root, textures):
+    inputs = {}
+    for n, t in shader_cases.texture_nodes(root).items():
+        values = interpret.decode_texels(textures[n], t.val_type)
+        inputs[n] = (bitslice.BitTexture.from_bits(values)
+                     if t.val_type is Bit else values)
+    return inputs
+
+
+def _kernel_values(result) -> np.ndarray:
+    if isinstance(result, bitslice.BitTexture):
+        return result.to_bits()
+    return result
+
+
+@pytest.mark.parametrize('name', sorted(shader_cases.GRAPHS))
+def test_kernels_match_interpreter(name):
+    kernel = cpu.compile_kernel(name, shader_cases.GRAPHS[name])
+    for seed, (width, height) in enumerate(_SHAPES):
+        root, textures, uniforms = _bindings(name, width, height, seed)
+        expected = interpret.evaluate(root, width, height, textures, uniforms)
+        for rows_per_chunk in [None, 2]:
+            actual = kernel(width,
+                            height,
+                            rows_per_chunk=rows_per_chunk,
+                            **_kernel_inputs(root, textures),
+                            **uniforms)
+            np.testing.assert_array_equal(
+                _kernel_values(actual), expected,
+                err_msg='{}x{}'.format(width, height))
+
+
+def test_kernels_stream_memory_maps(tmp_path):
+    name = 'singleHadamard'
+    width, height = 131, 10
+    root, textures, uniforms = _bindings(name, width, height, 0)
+    inputs = _kernel_inputs(root, textures)
+    path = str(tmp_path / 'state.npy')
+    state = bitslice.open_memmap(path, width, height)
+    state.words[:] = inputs['state'].words
+    state.words.flush()
+    inputs['state'] = bitslice.open_memmap(path, width, mode='r')
+    out = bitslice.open_memmap(str(tmp_path / 'out.npy'), width, height)
+    kernel = cpu.compile_kernel(name, root)
+    result = kernel(width, height, out=out, rows_per_chunk=3,
+                    **inputs, **uniforms)
+    assert result is out
+    out.words.flush()
+    stored = bitslice.open_memmap(str(tmp_path / 'out.npy'), width, mode='r')
+    np.testing.assert_array_equal(
+        stored.to_bits(),
+        interpret.evaluate(root, width, height, textures, uniforms))
+    with pytest.raises(ValueError):
+        bitslice.open_memmap(path, width + 64, mode='r')
@@ -0,0 +1,328 @@
+from typing import List, Optional, Sequence, Tuple
+from idpression import (
+    Idpression,
+    Literal,
+    Uniform,
+    UniformTexSize,
+    UnaryOp,
+    BinaryOp,
+    Matcher,
+    Bit,
+    Int32,
+    X,
+    Y,
+)
+import simplify
+import tex
+
+# A rect is a tuple (x_lows, x_highs, y_lows, y_highs) of bounds on the
+# fragment's coordinates within its shot's tile: it covers the texels at
+# least every low and below every high, so a rect without bounds covers
+# everything. A region is a list of rects covering (at least) some texels.
+Rect = Tuple[Tuple[Idpression, ...], ...]
+Region = List[Rect]
+_EVERYWHERE = [((), (), (), ())]
+_NOWHERE = []
+
+# Regions with more rects are replaced by everything, since each rect costs
+# the runtime a draw.
+_MAX_RECTS = 4
+
+# The operators that bounds can use, since the runtime computes them.
+_JS_OPS = ['+', '-', '*', '<<', '>>']
+
+_FLIPPED = {'==': '==', '!=': '!=', '<': '>', '<=': '>=', '>': '<',
+            '>=': '<='}
+_NEGATED = {'==': '!=', '!=': '==', '<': '>=', '<=': '>', '>': '<=',
+            '>=': '<'}
+
+
+def _is_bound(node: Idpression) -> bool:
+    """Determines if the runtime can compute a value from the uniforms."""
+    for dep in node.collect_ascending_deps(include_uniforms=False):
+        if dep.val_type is not Int32:
+            return False
+        if isinstance(dep, Literal):
+            if not isinstance(dep.python_equivalent, int):
+                return False
+        elif isinstance(dep, Uniform):
+            if isinstance(dep, UniformTexSize):
+                return False
+        elif isinstance(dep, BinaryOp):
+            if dep.op_char not in _JS_OPS:
+                return False
+        elif not (isinstance(dep, UnaryOp) and dep.op_char == '-'):
+            return False
+    return True
+
+
+def _coordinate(node: Idpression) -> Optional[Tuple[int, int]]:
+    """The axis (0 for x) and shift of a fragment coordinate shifted right."""
+    shift = 0
+    if (isinstance(node, BinaryOp) and
+            node.op_char == '>>' and
+            isinstance(node.rhs, Literal) and
+            isinstance(node.rhs.python_equivalent, int)):
+        shift = node.rhs.python_equivalent
+        node = node.lhs
+    if node is X:
+        return 0, shift
+    if node is Y:
+        return 1, shift
+    return None
+
+
+def _rect(axis: int,
+          low: Optional[Idpression],
+          high: Optional[Idpression]) -> Region:
+    bounds = [(), (), (), ()]
+    if low is not None:
+        bounds[axis * 2] = (simplify.simplify(low),)
+    if high is not None:
+        bounds[axis * 2 + 1] = (simplify.simplify(high),)
+    return [tuple(bounds)]
+
+
+def _contains(nodes: Sequence, node) -> bool:
+    # Comparing nodes with == builds a node, so they're compared by identity.
+    return any(e is node for e in nodes)
+
+
+def _is_everywhere(region: Region) -> bool:
+    return any(not any(r) for r in region)
+
+
+def _is_within(r1: Rect, r2: Rect) -> bool:
+    """Determines if r2's bounds are all bounds of r1, so r1 is within r2."""
+    return all(all(_contains(b1, e) for e in b2) for b1, b2 in zip(r1, r2))
+
+
+def _simplified(rects: Sequence[Rect]) -> Region:
+    result = []
+    for i, r in enumerate(rects):
+        # Drop rects within others (keeping the first of identical ones).
+        if not any(_is_within(r, other) and
+                   (j > i or not _is_within(other, r))
+                   for j, other in enumerate(rects) if j != i):
+            result.append(r)
+    if len(result) > _MAX_RECTS or _is_everywhere(result):
+        return _EVERYWHERE
+    return result
+
+
+def _union(a: Region, b: Region) -> Region:
+    return _simplified(a + b)
+
+
+def _intersection(a: Region, b: Region) -> Region:
+    return _simplified([
+        tuple(b1 + tuple(e for e in b2 if not _contains(b1, e))
+              for b1, b2 in zip(r1, r2))
+        for r1 in a
+        for r2 in b])
+
+
+def _literal_columns(region: Region) -> Optional[Tuple[int, int]]:
+    """Constant bounds on the columns of a region, if it has any."""
+    lows, highs = [], []
+    for x_lows, x_highs, _, _ in region:
+        low = [e.python_equivalent for e in x_lows
+               if isinstance(e, Literal)]
+        high = [e.python_equivalent for e in x_highs
+                if isinstance(e, Literal)]
+        if not high:
+            return None
+        # Coordinates aren't negative.
+        lows.append(max(low, default=0))
+        highs.append(min(high))
+    if not region:
+        return None
+    return min(lows), max(highs)
+
+
+def _compare(op: str,
+             lhs: Idpression,
+             rhs: Idpression,
+             columns: Optional[Tuple[int, int]]) -> Region:
+    coordinate = _coordinate(lhs)
+    if coordinate is None:
+        coordinate = _coordinate(rhs)
+        lhs, rhs, op = rhs, lhs, _FLIPPED[op]
+    if coordinate is None:
+        return _EVERYWHERE
+    axis, shift = coordinate
+
+    if not _is_bound(rhs):
+        # Rows on a diagonal, e.g. y == t + x, are bounded by the columns.
+        if (op != '==' or
+                axis != 1 or
+                shift != 0 or
+                columns is None or
+                not isinstance(rhs, BinaryOp) or
+                rhs.op_char != '+'):
+            return _EVERYWHERE
+        if rhs.rhs is X and _is_bound(rhs.lhs):
+            base = rhs.lhs
+        elif rhs.lhs is X and _is_bound(rhs.rhs):
+            base = rhs.rhs
+        else:
+            return _EVERYWHERE
+        return _rect(1, base + columns[0], base + columns[1])
+
+    # The coordinate is at least low and below high.
+    if op == '==':
+        return _rect(axis, rhs << shift, (rhs + 1) << shift)
+    if op == '<':
+        return _rect(axis, None, rhs << shift)
+    if op == '<=':
+        return _rect(axis, None, (rhs + 1) << shift)
+    if op == '>':
+        return _rect(axis, (rhs + 1) << shift, None)
+    if op == '>=':
+        return _rect(axis, rhs << shift, None)
+    return _EVERYWHERE
+
+
+def _where(node: Idpression,
+           value: bool,
+           columns: Optional[Tuple[int, int]] = None) -> Region:
+    """
+    A region covering the texels where node has the given truth value (i.e.
+    is non-zero or not). Columns are constant bounds on the texels that
+    matter, if known.
+    """
+    if isinstance(node, Literal) and node.python_equivalent is not None:
+        if bool(node.python_equivalent) == value:
+            return _EVERYWHERE
+        return _NOWHERE
+    if isinstance(node, UnaryOp) and node.op_char == '!':
+        return _where(node.val, not value, columns)
+    if isinstance(node, Matcher):
+        return _matched(node,
+                        lambda e: _where(e, value, columns),
+                        columns)
+    if not isinstance(node, BinaryOp):
+        return _EVERYWHERE
+
+    op = node.op_char
+    if node.val_type is Bit and op in _NEGATED:
+        if node.lhs.val_type is Bit:
+            if op == '!=' and value:
+                # Differing bits have a set bit.
+                return _union(_where(node.lhs, True, columns),
+                              _where(node.rhs, True, columns))
+            return _EVERYWHERE
+        if not value:
+            op = _NEGATED[op]
+        return _compare(op, node.lhs, node.rhs, columns)
+
+    if (op in ['&&', '&'] and value) or (op == '||' and not value):
+        left = _where(node.lhs, value, columns)
+        # Bounds on the left operand's columns bound the right operand's.
+        right = _where(node.rhs, value, _literal_columns(left) or columns)
+        return _intersection(left, right)
+    if ((op in ['||', '|', '^'] and value) or
+            (op == '&&' and not value)):
+        return _union(_where(node.lhs, value, columns),
+                      _where(node.rhs, value, columns))
+    return _EVERYWHERE
+
+
+def _matched(node: Matcher, region_of_result, columns) -> Region:
+    """The union of each clause's region where the clause is picked."""
+    result = []
+    reached = _EVERYWHERE
+    for condition, value in node.clauses:
+        picked = _intersection(reached, _where(condition, True, columns))
+        result = _union(result,
+                        _intersection(picked, region_of_result(value)))
+        reached = _intersection(reached, _where(condition, False, columns))
+    return _union(result,
+                  _intersection(reached, region_of_result(node.else_result)))
+
+
+def _changed(node: Idpression, state: 'tex.Tex') -> Region:
+    """A region covering the texels where node may differ from state."""
+    if node is state:
+        return _NOWHERE
+    if isinstance(node, Matcher):
+        return _matched(node, lambda e: _changed(e, state), None)
+    if isinstance(node, BinaryOp) and node.op_char in ['!=', '^']:
+        # Xor-ing in a value changes the texels where it is non-zero.
+        if node.op_char == '^' or node.val_type is Bit:
+            if node.lhs is state:
+                return _where(node.rhs, True)
+            if node.rhs is state:
+                return _where(node.lhs, True)
+    return _EVERYWHERE
+
+
+def changed_region(final_value: Idpression
+                   ) -> Optional[Tuple['tex.Tex', Region]]:
+    """
+    A per-shot texture read by (untiled) final_value, with a region of each
+    shot's tile covering the texels where final_value may differ from it.
+    None when no texture has a region bounding those texels.
+
+    Shaders updating a texture in place then only need to draw (and copy)
+    the texels in the region, see registerFootprint in ShaderVariants.js.
+    """
+    for node in final_value.collect_ascending_deps(include_uniforms=False):
+        if (isinstance(node, tex.Tex) and
+                node.per_shot and
+                node.val_type is final_value.val_type):
+            region = _changed(final_value, node)
+            # Rects only bounded from below cover most of a tile anyway.
+            if all(x_highs or y_highs for _, x_highs, _, y_highs in region):
+                return node, region
+    return None
+
+
+def _js(node: Idpression) -> str:
+    if isinstance(node, Literal):
+        return repr(node.python_equivalent)
+    if isinstance(node, Uniform):
+        return node.var_name
+    if isinstance(node, UnaryOp):
+        return '-{}'.format(_js_operand(node.val))
+    return '{} {} {}'.format(_js_operand(node.lhs),
+                             node.op_char,
+                             _js_operand(node.rhs))
+
+
+def _js_operand(node: Idpression) -> str:
+    if isinstance(node, (UnaryOp, BinaryOp)):
+        return '({})'.format(_js(node))
+    return _js(node)
+
+
+def _js_bound(bounds: Sequence[Idpression], func: str, default: str) -> str:
+    if not bounds:
+        return default
+    if len(bounds) == 1:
+        return _js(bounds[0])
+    return 'Math.{}({})'.format(func, ', '.join(_js(e) for e in bounds))
+
+
+def generate_footprint_registration(name: str,
+                                    state: 'tex.Tex',
+                                    region: Region) -> str:
+    """
+    Registers a function computing the region from the shader's arguments,
+    as [x_low, x_high, y_low, y_high] bounds of each rect.
+    """
+    uniforms = sorted({dep.var_name
+                       for x_lows, x_highs, y_lows, y_highs in region
+                       for e in x_lows + x_highs + y_lows + y_highs
+                       for dep in e.collect_ascending_deps()
+                       if isinstance(dep, Uniform)})
+    rects = ['[{}, {}, {}, {}]'.format(_js_bound(x_lows, 'max', '0'),
+                                       _js_bound(x_highs, 'min', 'Infinity'),
+                                       _js_bound(y_lows, 'max', '0'),
+                                       _js_bound(y_highs, 'min', 'Infinity'))
+             for x_lows, x_highs, y_lows, y_highs in region]
+    return "registerFootprint({}, '{}', ({{{}}}) => [{}]);".format(
+        name,
+        state.tex_name(),
+        ', '.join(uniforms),
+        ''.join('\n    {},'.format(r) for r in rects) + '\n')
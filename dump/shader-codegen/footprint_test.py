@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from idpression import Uniform, Bit, Int32, X, Y
+from tex import Tex
+from footprint import changed_region, generate_footprint_registration
+import interpret
+import shader_cases
+
+_REGIONS = {name: changed_region(root)
+            for name, root in shader_cases.GRAPHS.items()}
+
+
+def _bound(bounds, combine, default, uniforms) -> int:
+    values = [int(interpret.evaluate(e, 1, 1, uniforms=uniforms)[0, 0])
+              for e in bounds]
+    return combine(values) if values else default
+
+
+def _covered(region, uniforms) -> np.ndarray:
+    """Which texels of a shot the region covers."""
+    w, h = shader_cases.SHOT
+    xs = np.arange(w)[np.newaxis, :]
+    ys = np.arange(h)[:, np.newaxis]
+    result = np.zeros((h, w), dtype=bool)
+    for x_lows, x_highs, y_lows, y_highs in region:
+        result |= ((_bound(x_lows, max, 0, uniforms) <= xs) &
+                   (xs < _bound(x_highs, min, w, uniforms)) &
+                   (_bound(y_lows, max, 0, uniforms) <= ys) &
+                   (ys < _bound(y_highs, min, h, uniforms)))
+    return result
+
+
+def test_regions_are_found():
+    names = {name for name, r in _REGIONS.items() if r is not None}
+    assert {'singleHadamard', 'singleCZ', 'singleX', 'bitFlip'} <= names
+
+
+@pytest.mark.parametrize('name', sorted(n for n, r in _REGIONS.items()
+                                        if r is not None))
+def test_changes_are_within_region(name):
+    state, region = _REGIONS[name]
+    changed = 0
+    for seed in range(8):
+        root, textures, uniforms = shader_cases.random_bindings(name, seed)
+        before = shader_cases.evaluate(state, textures, uniforms)
+        after = shader_cases.evaluate(root, textures, uniforms)
+        differs = before != after
+        changed += np.count_nonzero(differs)
+        outside = differs & ~_covered(region, uniforms)
+        assert not outside.any(), (seed, np.argwhere(outside))
+    assert changed
+
+
+def test_xor_with_bounded_condition():
+    state = Tex(name='state', val_type=Bit)
+    t = Uniform(Int32, 'target')
+    state, region = changed_region(state != ((X == t) &
+                                             (Y < 4)))
+    assert region[0][0][0] is t
+    assert len(region) == 1
+    uniforms = {'target': 3}
+    covered = _covered(region, uniforms)
+    assert covered[:4, 3].all()
+    assert np.count_nonzero(covered) == 4
+
+
+def test_unbounded_changes_have_no_region():
+    state = Tex(name='state', val_type=Bit)
+    assert changed_region(~state) is None
+    assert changed_region(state != state[X + 1, Y]) is None
+
+
+def test_registration():
+    state = Tex(name='state', val_type=Bit)
+    t = Uniform(Int32, 'target')
+    value = state != ((Y == t) | (Y == t + 2))
+    registration = generate_footprint_registration(
+        'someShader', *changed_region(value))
+    assert registration == (
+        "registerFootprint(someShader, 'state', ({target}) => [\n"
+        "    [0, Infinity, target, target + 1],\n"
+        "    [0, Infinity, target + 2, (target + 2) + 1],\n"
+        "]);")
@@ -1,11 +1,55 @@
-from typing import Union, Optional
-from idpression import Idpression, Uniform, Byte, Bit, Int32, Vec2, UInt32
+from typing import Callable, Dict, List, Union, Optional
+from idpression import (
+    Idpression,
+    Uniform,
+    Literal,
+    Byte,
+    Bit,
+    Int32,
+    Float32,
+    Vec2,
+    PackedBits,
+    X,
+    Y,
+    reduce_range,
+)
 from tex import Tex
-from shader import X, Y, generate_shader_construction
+from prng import random_bit, random_word
+from shader import generate_shader_construction
+from pipeline import generate_pipeline_construction
+from ranges import MAX_TEXTURE_SIZE
+import packing
+
+# Tableaus always have the measurement result and constant columns, and the
+# rows of at least one qubit.
+_TABLEAU_SIZE = ((2, MAX_TEXTURE_SIZE), (2, MAX_TEXTURE_SIZE))
+
+# The (square) surface sizes used in production, i.e. distances 3, 5 and 7.
+# Surface shaders get variants specialized to them, see ShaderVariants.js.
+SURFACE_SIZES = [5, 9, 13]
+_SURFACE_SPECIALIZATIONS = [{'surface_width': n, 'surface_height': n}
+                            for n in SURFACE_SIZES]
+
+
+def _surface_specializations(packed: bool) -> List[Dict[str, object]]:
+    """
+    The surface specializations of shaders updating a surface tableau, with
+    the tableau's tile sizes (a column per qubit after the two constant
+    columns, and two rows per qubit).
+    """
+    result = []
+    for values in _SURFACE_SPECIALIZATIONS:
+        qubits = values['surface_width'] * values['surface_height']
+        width = qubits + 2
+        tile = (packing.packed_width(width) if packed else width, qubits * 2)
+        result.append(dict(values, out_tile=tile, state_tile=tile))
+    return result
 
 
 def single_x() -> Idpression:
-    state = Tex(name='state', val_type=Bit)
+    state = Tex(name='state',
+                val_type=Bit,
+                size_range=_TABLEAU_SIZE)
     target = Uniform(name='target', val_type=Int32)
     # Flip const bit of Z observable and Y sign bit.
     flip = (X < 2) & (Y == target * 2 + X)
@@ -15,62 +59,111 @@ def single_x() -> Idpression:
         result)
 
 
+def _check_row_only(condition: Idpression):
+    # Packed texels hold 32 columns, so conditions can't vary by column.
+    if any(d is X for d in condition.collect_ascending_deps()):
+        raise ValueError('Packed condition depends on the column.')
+
+
 def do_parallel_hadamards(src: Idpression,
                           unaffected: Union[bool, Idpression]) -> Idpression:
     unaffected = Idpression.wrap(unaffected)
+    if src.val_type is PackedBits:
+        _check_row_only(unaffected)
+        # Bit 0 of the first texel holds column 0.
+        sign_mask = (((X == 0) & ((Y & 1) == 0))
+                     .if_then(Literal.of(PackedBits, 1))
+                     .else_end(Literal.of(PackedBits, 0)))
+        swapped = (src[X, Y ^ 1] & ~sign_mask) | (~src & sign_mask)
+        return unaffected.if_then(src).else_end(swapped)
+
     return (unaffected.if_then(src)  # Unaffected.
             .else_if((X == 0) & ((Y & 1) == 0)).then(~src)  # Flip Y sign,
             .else_end(src[X, Y ^ 1]))  # Swap X/Z observables.
 
 
-def single_hadamard():
-    state = Tex(name='state', val_type=Bit)
+def single_hadamard(packed: bool = False):
+    state = Tex(name='state', val_type=PackedBits if packed else Bit)
     target = Uniform(name='target', val_type=Int32)
     result = do_parallel_hadamards(state, unaffected=(Y >> 1) != target)
     return generate_shader_construction(
-        'singleHadamard',
+        'singleHadamardPacked' if packed else 'singleHadamard',
         result)
 
 
 def do_parallel_czs(state: Idpression,
                     affected: Union[bool, Idpression],
                     partner: Union[int, Idpression]) -> Idpression:
+    if state.val_type is PackedBits:
+        affected = Idpression.wrap(affected)
+        _check_row_only(affected)
+        # Every column except column 0 (bit 0 of the first texel).
+        column_mask = ((X == 0)
+                       .if_then(Literal.of(PackedBits, 0xFFFFFFFE))
+                       .else_end(Literal.of(PackedBits, 0xFFFFFFFF)))
+        mask = (((Y & 1 == 0) & affected)
+                .if_then(column_mask)
+                .else_end(Literal.of(PackedBits, 0)))
+        return state ^ (state[:, partner * 2 + 1] & mask)
+
     is_affected = (X > 0) & (Y & 1 == 0) & affected
     flip = state[:, partner * 2 + 1] & is_affected
     return state ^ flip
 
 
-def single_cz() -> Idpression:
-    state = Tex(name='state', val_type=Bit)
+def single_cz(packed: bool = False) -> Idpression:
+    state = Tex(name='state', val_type=PackedBits if packed else Bit)
     target1 = Uniform(name='target1', val_type=Int32)
     target2 = Uniform(name='target2', val_type=Int32)
     index = Y >> 1
     result = do_parallel_czs(state,
                              affected=(index == target1) | (index == target2),
                              partner=(target1 + target2 - index))
-    return generate_shader_construction('singleCZ', result)
+    return generate_shader_construction(
+        'singleCZPacked' if packed else 'singleCZ',
+        result)
 
 
-def find_one_fold():
+def find_one_fold(arity: int = 2):
+    """
+    Each output texel covers `arity` input texels. A texel holds one plus the
+    offset, relative to its own position, of the first set column it covers
+    (or 0 if there's none), so that texel 0 ends up holding one plus the
+    first set column.
+    """
     state = Tex(name='state', val_type=Int32)
-    a = state[::2, :]
-    b = state[1::2, :]
-    result = ((a != 0).if_then(a + X)
-              .else_if(b != 0).then(b + X + 1)
-              .else_end(0))
+    matcher = None
+    for j in range(arity):
+        part = state[j::arity, :]
+        found = part + X * (arity - 1) + j
+        if matcher is None:
+            matcher = (part != 0).if_then(found)
+        else:
+            matcher = matcher.else_if(part != 0).then(found)
     return generate_shader_construction(
-        'findOneFold',
-        result)
+        _fold_name('findOneFold', arity),
+        matcher.else_end(0))
 
 
-def or_fold():
-    state = Tex(name='state', val_type=Bit)
-    result = state[::2, :] | state[1::2, :]
+def or_fold(arity: int = 2, packed: bool = False):
+    """
+    When packed, texels are or'd together bit by bit. Once the width is down
+    to one texel, a row has a set bit iff its texel is non-zero.
+    """
+    state = Tex(name='state', val_type=PackedBits if packed else Bit)
+    result = state[::arity, :]
+    for j in range(1, arity):
+        result = result | state[j::arity, :]
     return generate_shader_construction(
-        'orFold',
+        _fold_name('orFold', arity) + ('Packed' if packed else ''),
         result)
 
 
+def _fold_name(name: str, arity: int) -> str:
+    # Pairwise folds keep their original names.
+    return name if arity == 2 else name + str(arity)
+
+
 def shifter():
     state = Tex(name='state', val_type=Int32)
     offset = Uniform(name='offset', val_type=Vec2)
@@ -94,7 +187,9 @@ def prepare_clean_state():
 
 
 def bit_to_int():
-    state = Tex(name='state', val_type=Bit)
+    state = Tex(name='state',
+                val_type=Bit,
+                size_range=_TABLEAU_SIZE)
     result = state.bool().int()
     return generate_shader_construction(
         'bitToInt',
@@ -120,7 +215,9 @@ def eliminate_column():
     X observable will be replaced such that only the first variable bit from
     the Z observable is set.
     """
-    state = Tex(name='state', val_type=Bit)
+    state = Tex(name='state',
+                val_type=Bit,
+                size_range=_TABLEAU_SIZE)
     mux = Tex(name='found_ones', val_type=Int32)
     measured = Uniform(name='target', val_type=Int32)
 
@@ -136,24 +233,6 @@ def eliminate_column():
     return generate_shader_construction('eliminateCol', result)
 
 
-def random_advance():
-    state = Tex(name='state', val_type=UInt32)
-    x1 = state[0, :]
-    x2 = state[1, :]
-    x3 = state[2, :]
-    x4 = state[3, :]
-    u = x1 | (x2 << 8) | (x3 << 16) | (x4 << 24)
-
-    # xorshift32 prng
-    u ^= u << 13
-    u &= 0xFFFFFFFF
-    u ^= u >> 17
-    u ^= u << 5
-
-    result = (u >> (X*8)) & 0xFF
-    return generate_shader_construction('randomAdvance', result)
-
-
 def measure_set_result():
     """
     The input state should be the state to be measured.
@@ -163,18 +242,19 @@ def measure_set_result():
     containing zero to mean "no variables" or non-zero to mean "index of
     first variable" (off by one).
 
-    The rand param should be a 4xH texture containing PRNG state. Its state
-    should be advanced (separately) after using this shader.
+    Random results come from the counter-based PRNG (see prng.py), whose
+    counter should be advanced (separately) after using this shader.
 
     In the output state, the target qubit's Z observable is guaranteed to be
     equal to 1. The actual measurement result is stored in column 0 of Z. No
     other values should be affected.
     """
-    state = Tex(name='state', val_type=Bit)
+    state = Tex(name='state',
+                val_type=Bit,
+                size_range=_TABLEAU_SIZE)
     found_ones = Tex(name='found_ones', val_type=Int32)
-    rand = Tex(name='rand', val_type=Int32)
     target = Uniform(name='target', val_type=Int32)
-    rand_bit = (rand[0, :] & 1).bool()
+    rand_bit = random_bit(Y >> 1)
     const_bit = state[1, :]
     is_random_result = found_ones[0, :] != 0
     outcome = is_random_result.if_then(rand_bit).else_end(const_bit)
@@ -186,26 +266,249 @@ def measure_set_result():
     return generate_shader_construction('measureSetResult', result)
 
 
-def surface_hadamards(check_vs_data: Optional[bool]):
+# Claims use 255 to mean "unclaimed", so (like the byte-sized found_ones fold)
+# batched measurement supports fewer than 255 columns and qubits (checked by
+# advanceMeasureBatch in Operations.js).
+_NO_CLAIM = 255
+_BATCH_TABLEAU_SIZE = ((2, _NO_CLAIM - 1), (2, 2 * (_NO_CLAIM - 1)))
+
+
+def _is_selected(claims: Idpression,
+                 width: Idpression,
+                 pivot: Idpression,
+                 target: Idpression) -> Idpression:
+    # A random target is measured in this round iff it won the claims on its
+    # pivot column, i.e. no other candidate's row has a bit in that column
+    # unless that candidate's pivot is larger (or equal with a larger index).
+    return ((claims[pivot, 0] == pivot) &
+            (claims[width + pivot, 0] == target))
+
+
+def measure_claims():
+    """
+    The first half of a batched measurement round over a set of commuting
+    Z-basis targets.
+
+    The input state should be the state to be measured. The found_ones param
+    should be the result of folding found_ones over all but the first two
+    columns of the state, as for measure_set_result. The targets param is a
+    1xN texture marking the qubits being measured (the same for all shots).
+
+    The output has twice the state's width. Row by row, column c of the left
+    half is the pivot (first variable column) of the row if it is the Z row
+    of a target with variables and it has column c set. Column c of the right
+    half is the target's index if its pivot is c. Everything else is 255.
+    Min-folding the rows (see min_fold_rows) then gives claims where a
+    target's pivot column c holds c in the left half and the target in the
+    right half iff the target can be measured this round without conflicting
+    with any other target measured in the same round.
+    """
+    state = Tex(name='state',
+                val_type=Bit,
+                size_range=_BATCH_TABLEAU_SIZE)
+    found_ones = Tex(name='found_ones', val_type=Int32)
+    targets = Tex(name='targets', val_type=Bit, per_shot=False)
+    width = state.size.x().int()
+    is_owner_half = X >= width
+    col = is_owner_half.if_then(X - width).else_end(X)
+    pivot = found_ones[0, :] + 1
+    is_candidate = ((Y & 1) == 1) & targets[0, Y >> 1] & (pivot >= 2)
+
+    pivot_claim = ((is_candidate & state[col, :] & (col >= 2))
+                   .if_then(pivot)
+                   .else_end(_NO_CLAIM))
+    owner_claim = ((is_candidate & (pivot == col))
+                   .if_then(Y >> 1)
+                   .else_end(_NO_CLAIM))
+    result = is_owner_half.if_then(owner_claim).else_end(pivot_claim)
+    return generate_shader_construction('measureClaims', result)
+
+
+def min_fold_rows():
+    state = Tex(name='state', val_type=Int32)
+    a = state[:, ::2]
+    b = state[:, 1::2]
+    result = (a < b).if_then(a).else_end(b)
+    return generate_shader_construction('minFoldRows', result)
+
+
+def measure_batch_set_result():
+    """
+    The batched version of measure_set_result, given the folded claims from
+    measure_claims. Handles every target without variables and every target
+    that won its claims.
+
+    The clear_results param should be set in the first round, to clear out
+    previous measurement results. Afterwards results are xor'd into column 0,
+    so that targets measured in earlier rounds (whose Z observables have
+    become the constant 0) are unaffected by later rounds.
+    """
+    state = Tex(name='state',
+                val_type=Bit,
+                size_range=_BATCH_TABLEAU_SIZE)
+    found_ones = Tex(name='found_ones', val_type=Int32)
+    claims = Tex(name='claims', val_type=Int32)
+    targets = Tex(name='targets', val_type=Bit, per_shot=False)
+    clear_results = Uniform(name='clear_results', val_type=Bit)
+    width = state.size.x().int()
+    pivot = found_ones[0, :] + 1
+    is_deterministic = pivot < 2
+    is_target = ((Y & 1) == 1) & targets[0, Y >> 1]
+    is_measured = is_deterministic | _is_selected(claims,
+                                                  width,
+                                                  pivot,
+                                                  Y >> 1)
+    rand_bit = random_bit(Y >> 1)
+    outcome = is_measured & (is_deterministic
+                             .if_then(state[1, :])
+                             .else_end(rand_bit))
+
+    result = ((~is_target | (X >= 2)).if_then(state)
+              .else_if(X == 1).then(state ^ outcome)
+              .else_end((~clear_results & state) ^ outcome))
+    return generate_shader_construction('measureBatchSetResult', result)
+
+
+def eliminate_columns():
+    """
+    The batched version of eliminate_column, given the state after
+    measure_batch_set_result and the same found_ones and claims it used.
+
+    Because measured targets never have another measured target's pivot set,
+    eliminating all of their pivot columns at once is equivalent to
+    eliminating them one by one: each row gets the Z observables of the
+    targets whose pivot columns it has set xor'd into it.
+
+    Each texel loops over every column, so a draw costs O(width * area)
+    where eliminate_column costs O(area). The loop is bounded by the batch
+    width limit (see _NO_CLAIM), and runs once per round rather than once
+    per target.
+    """
+    state = Tex(name='state',
+                val_type=Bit,
+                size_range=_BATCH_TABLEAU_SIZE)
+    found_ones = Tex(name='found_ones', val_type=Int32)
+    claims = Tex(name='claims', val_type=Int32)
+    width = state.size.x().int()
+
+    def toggle(col):
+        owner = claims[width + col, 0]
+        is_pivot = claims[col, 0] == col
+        return is_pivot & state[col, :] & state[:, owner * 2 + 1]
+
+    toggles = reduce_range(width, toggle, '!=', False)
+    x_row_pivot = found_ones[0, Y | 1] + 1
+    is_reset = ((Y & 1) == 0) & _is_selected(claims,
+                                             width,
+                                             x_row_pivot,
+                                             Y >> 1)
+    result = (is_reset.if_then(X == x_row_pivot)
+              .else_if(X == 0).then(state)
+              .else_end(state ^ toggles))
+    return generate_shader_construction('eliminateCols', result)
+
+
+def measure_blocked():
+    """
+    Whether a batched measurement round skipped any target because another
+    target claimed its pivot column, given the found_ones and claims the
+    round used. Each shot's tile is a single texel.
+
+    Targets that weren't skipped were measured, or will be unaffected by
+    further rounds, so rounds continue until no shot has a blocked target.
+    """
+    found_ones = Tex(name='found_ones', val_type=Int32)
+    claims = Tex(name='claims', val_type=Int32)
+    targets = Tex(name='targets', val_type=Bit, per_shot=False)
+    width = claims.size.x().int() >> 1
+
+    def is_blocked(target):
+        pivot = found_ones[0, target * 2 + 1] + 1
+        return (targets[0, target] &
+                (pivot >= 2) &
+                ~_is_selected(claims, width, pivot, target))
+
+    result = reduce_range(targets.size.y().int(), is_blocked, '||', False)
+    return generate_shader_construction('measureBlocked', result)
+
+
+def or_all():
+    """
+    Ors every texel of the state together, into each texel of the output, so
+    that reading back a single texel tells if any texel was set.
+    """
     state = Tex(name='state', val_type=Bit)
-    surface_width = Uniform(Int32, 'surface_width')
-    q = Y >> 1
+    width = state.size.x().int()
+    result = reduce_range(width * state.size.y().int(),
+                          lambda i: state[i % width, i // width],
+                          '||',
+                          False)
+    return generate_shader_construction('orAll', result, tiled=False)
+
+
+def do_parallel_frame_hadamards(frame: Idpression,
+                                unaffected: Union[bool, Idpression]
+                                ) -> Idpression:
+    """
+    Pauli frames have a shot per row, with qubit q's X and Z bits in columns
+    2q and 2q+1. Hadamards swap the two.
+    """
+    unaffected = Idpression.wrap(unaffected)
+    return unaffected.if_then(frame).else_end(frame[X ^ 1, :])
+
+
+def do_parallel_frame_czs(frame: Idpression,
+                          affected: Union[bool, Idpression],
+                          partner: Union[int, Idpression]) -> Idpression:
+    # An X on either qubit picks up a Z on the other.
+    is_z = (X & 1) == 1
+    return frame ^ (frame[partner * 2, :] & affected & is_z)
+
+
+def _gate_qubit(frame: bool) -> Idpression:
+    # Tableaus have two rows per qubit, frames have two columns per qubit.
+    return (X if frame else Y) >> 1
+
+
+def apply_surface_hadamards(state: Idpression,
+                            surface_width: Idpression,
+                            check_vs_data: Optional[bool],
+                            frame: bool = False) -> Idpression:
+    q = _gate_qubit(frame)
     qX = q % surface_width
     qY = q // surface_width
     is_check = qX & 1 == qY & 1
     is_data = qX & 1 != qY & 1
-    result = do_parallel_hadamards(
+    apply = do_parallel_frame_hadamards if frame else do_parallel_hadamards
+    return apply(
         state,
         False if check_vs_data is None else
         is_data if check_vs_data else
         is_check)
+
+
+def surface_hadamards(check_vs_data: Optional[bool], packed: bool = False):
+    state = Tex(name='state', val_type=PackedBits if packed else Bit)
+    surface_width = Uniform(Int32, 'surface_width')
+    result = apply_surface_hadamards(state, surface_width, check_vs_data)
     caption = ('hadamardAll' if check_vs_data is None else
                'hadamardCheck' if check_vs_data else
                'hadamardData')
-    return generate_shader_construction(caption, result)
-
-
-def do_surface_czs(evens, verticals, zs):
+    if packed:
+        caption += 'Packed'
+    return generate_shader_construction(
+        caption,
+        result,
+        specializations=_surface_specializations(packed))
+
+
+def apply_surface_czs(state: Idpression,
+                      surface_width: Idpression,
+                      surface_height: Idpression,
+                      evens: bool,
+                      verticals: bool,
+                      zs: bool,
+                      frame: bool = False) -> Idpression:
     # o==x--o==x--
     #    |     |
     # z  o  z  o
@@ -219,10 +522,7 @@ def do_surface_czs(evens, verticals, zs):
     # |: even vertical
     # !: odd vertical
 
-    state = Tex(name='state', val_type=Bit)
-    surface_width = Uniform(Int32, 'surface_width')
-    surface_height = Uniform(Int32, 'surface_height')
-    q = Y >> 1
+    q = _gate_qubit(frame)
     qX = q % surface_width
     qY = q // surface_width
 
@@ -243,9 +543,22 @@ def do_surface_czs(evens, verticals, zs):
     else:
         qX, qY = i, j
 
-    result = do_parallel_czs(state,
-                             affected=in_range & on_line,
-                             partner=qY * surface_width + qX)
+    apply = do_parallel_frame_czs if frame else do_parallel_czs
+    return apply(state,
+                 affected=in_range & on_line,
+                 partner=qY * surface_width + qX)
+
+
+def do_surface_czs(evens, verticals, zs, packed=False):
+    state = Tex(name='state', val_type=PackedBits if packed else Bit)
+    surface_width = Uniform(Int32, 'surface_width')
+    surface_height = Uniform(Int32, 'surface_height')
+    result = apply_surface_czs(state,
+                               surface_width,
+                               surface_height,
+                               evens,
+                               verticals,
+                               zs)
     captions = {
         (False, False, False): 'surfaceCzsEHX',
         (True, False, False): 'surfaceCzsOHX',
@@ -256,54 +569,242 @@ def do_surface_czs(evens, verticals, zs):
         (False, True, True): 'surfaceCzsEVZ',
         (True, True, True): 'surfaceCzsOVZ',
     }
+    caption = captions[(evens, verticals, zs)]
+    if packed:
+        caption += 'Packed'
     return generate_shader_construction(
-        captions[(evens, verticals, zs)],
-        result)
+        caption,
+        result,
+        specializations=_surface_specializations(packed))
 
 
-def apply_cycle(src):
-    qX = (Y >> 1) & 15
-    qY = (Y >> 5) & 15
-    is_check = qX & 1 == qY & 1
-    is_data = qX & 1 != qY & 1
-    is_odd = qY & 1
-
-    src[:, :] = do_parallel_hadamards(src, unaffected=False)
-    src[:, :] = do_parallel_czs(src,
-                                affected=(qX > 0) & ((qY & 1) == 1),
-                                partner=(qX ^ 1) + (qY << 4))
-    src[:, :] = do_parallel_czs(src,
-                                affected=(qY > 0) & ((qX & 1) == 1),
-                                partner=qX + ((qY ^ 1) << 4))
-    src[:, :] = do_parallel_hadamards(src, unaffected=is_check)
-
-    src[:, :] = do_parallel_czs(src,
-                                affected=(qX < 16) & ((qY & 1) == 0),
-                                partner=(qX ^ 1) + (qY << 4))
-    src[:, :] = do_parallel_czs(src,
-                                affected=(qX > 0) & ((qY & 1) == 1),
-                                partner=(qX ^ 1) + (qY << 4))
-
-    src[:, :] = do_parallel_hadamards(src, unaffected=is_data)
-
-    # if is_check:
-    #
-    #     cnot_from(qX-1, qY)
-    #     cnot_from(qX+1, qY)
-    #     cnot_from(qX, qY-1)
-    #     cnot_from(qX, qY+1)
-    #
-    # if i & 1 == 1 and j & 1 == 1:
-    #     for p in [(i-1,j), (i+1, j), (i, j-1), (i, j+1)]:
-    #         if p in qs:
-    #             c.cnot(qs[p], q)
-    #     cs[(i, j)] = c.measure(q, reset=True)
-    #
-    # if i & 1 == 0 and j & 1 == 0:
-    #     for p in [(i-1,j), (i+1, j), (i, j-1), (i, j+1)]:
-    #         if p in qs:
-    #             c.xnot(qs[p], q)
-    #     cs[(i, j)] = c.measure(q, reset=True)
+def apply_cycle(state: Tex,
+                surface_width: Idpression,
+                surface_height: Idpression,
+                frame: bool = False):
+    """
+    Records the gates of a surface code round, minus the measurements, as
+    writes into the given state texture (the same schedule as cycle() in
+    main-time-gpu-surface-cycle.js). The state is either a tableau or, when
+    frame is set, a texture of Pauli frames.
+    """
+    state[:, :] = apply_surface_hadamards(state, surface_width, None, frame)
+    for zs in [False, True]:
+        for verticals in [False, True]:
+            for evens in [False, True]:
+                state[:, :] = apply_surface_czs(state,
+                                                surface_width,
+                                                surface_height,
+                                                evens,
+                                                verticals,
+                                                zs,
+                                                frame)
+        state[:, :] = apply_surface_hadamards(state,
+                                              surface_width,
+                                              zs,
+                                              frame)
+
+
+def surface_cycle(packed: bool = False):
+    steps = []
+    state = Tex(name='state',
+                val_type=PackedBits if packed else Bit,
+                steps=steps)
+    surface_width = Uniform(Int32, 'surface_width')
+    surface_height = Uniform(Int32, 'surface_height')
+    apply_cycle(state, surface_width, surface_height)
+    return generate_pipeline_construction(
+        'surfaceCyclePacked' if packed else 'surfaceCycle',
+        steps,
+        specializations=_surface_specializations(packed))
+
+
+def frame_cycle():
+    """
+    Pushes Pauli frames (see do_parallel_frame_hadamards) through the gates
+    of a surface code round. Each frame is one shot; xor-ing its measurement
+    flips into the measurement record of a noiseless reference run gives the
+    shot's measurement results.
+    """
+    steps = []
+    frame = Tex(name='frame', val_type=Bit, steps=steps)
+    surface_width = Uniform(Int32, 'surface_width')
+    surface_height = Uniform(Int32, 'surface_height')
+    apply_cycle(frame, surface_width, surface_height, frame=True)
+    # Each row is already a shot.
+    return generate_pipeline_construction(
+        'frameCycle',
+        steps,
+        tiled=False,
+        specializations=_SURFACE_SPECIALIZATIONS)
+
+
+def frame_measure_record():
+    """
+    The measurement flips of each shot, with one column per qubit. A Z basis
+    measurement is flipped iff the frame has an X on the measured qubit.
+    """
+    frame = Tex(name='frame', val_type=Bit)
+    result = frame[X * 2, :]
+    return generate_shader_construction('frameMeasureRecord',
+                                        result,
+                                        tiled=False)
+
+
+def frame_measure_reset():
+    """
+    Resets the measured qubits of each frame, after frame_measure_record.
+
+    Resetting clears the X bit. The Z bit is randomized, because the reset
+    state is a Z eigenstate and that lets later random measurements of the
+    qubit's observables come out random in each shot instead of copying the
+    reference run.
+    """
+    frame = Tex(name='frame', val_type=Bit)
+    targets = Tex(name='targets', val_type=Bit, per_shot=False)
+    q = X >> 1
+    # Frames have a row per shot.
+    rand_bit = random_bit(q, Y)
+    is_z = (X & 1) == 1
+    result = targets[0, q].if_then(is_z & rand_bit).else_end(frame)
+    return generate_shader_construction('frameMeasureReset',
+                                        result,
+                                        tiled=False)
+
+
+def _noise_sample(frame: bool) -> Idpression:
+    """
+    A uniform sample in [0, 1) scaled by 2**24, drawn for the qubit being
+    processed (of the row's shot, for frames).
+    """
+    if frame:
+        u = random_word(X >> 1, Y)
+    else:
+        u = random_word(Y >> 1)
+    # The top 24 bits convert to a float exactly.
+    return (u >> 8).float()
+
+
+def _noise_threshold(probability: Idpression,
+                     fraction: float = 1.0) -> Idpression:
+    # The value a sample is below with the given fraction of probability.
+    return probability * (16777216.0 * fraction)
+
+
+def _apply_paulis(state: Idpression,
+                  x_flip: Idpression,
+                  z_flip: Idpression,
+                  frame: bool) -> Idpression:
+    """
+    Applies X (when x_flip is set), Z (when z_flip is set), or both (Y, up to
+    phase) to the qubit of each texel.
+    """
+    # Selections are written as bit logic, rather than as matchers.
+    if frame:
+        is_z = (X & 1) == 1
+        return state != ((is_z & z_flip) | (~is_z & x_flip))
+    # X negates the Z observable and Y, Z negates the X observable and Y.
+    is_z_row = (Y & 1) == 1
+    flip_const = (X == 1) & ((is_z_row & x_flip) | (~is_z_row & z_flip))
+    flip_y_sign = (X == 0) & ~is_z_row & (x_flip != z_flip)
+    return state != (flip_const | flip_y_sign)
+
+
+def depolarize(frame: bool = False):
+    """
+    Applies a uniformly random one of X, Y or Z to each qubit with the given
+    probability, using the counter-based PRNG (whose counter should be
+    advanced separately afterwards). Decisions are threshold comparisons, so
+    the shader doesn't branch.
+    """
+    state = Tex(name='frame' if frame else 'state', val_type=Bit)
+    probability = Uniform(name='probability', val_type=Float32)
+    r = _noise_sample(frame)
+    # [0, p/3) is X, [p/3, 2p/3) is Y and [2p/3, p) is Z.
+    x_flip = r < _noise_threshold(probability, 2 / 3)
+    z_flip = ((r >= _noise_threshold(probability, 1 / 3)) &
+              (r < _noise_threshold(probability)))
+    result = _apply_paulis(state, x_flip, z_flip, frame)
+    return generate_shader_construction(
+        'depolarizeFrame' if frame else 'depolarize',
+        result,
+        tiled=not frame)
+
+
+def bit_flip(frame: bool = False):
+    """Applies X to each qubit with the given probability."""
+    state = Tex(name='frame' if frame else 'state', val_type=Bit)
+    probability = Uniform(name='probability', val_type=Float32)
+    x_flip = _noise_sample(frame) < _noise_threshold(probability)
+    result = _apply_paulis(state, x_flip, Literal.of(Bit, False), frame)
+    return generate_shader_construction(
+        'bitFlipFrame' if frame else 'bitFlip',
+        result,
+        tiled=not frame)
+
+
+def measurement_flip(frame: bool = False):
+    """
+    Flips the recorded result of each target qubit's measurement with the
+    given probability, without affecting the qubit itself. Tableaus record
+    results in column 0 of the Z rows, frames in the shots x qubits record
+    written by frame_measure_record.
+    """
+    record = Tex(name='record' if frame else 'state', val_type=Bit)
+    targets = Tex(name='targets', val_type=Bit, per_shot=False)
+    probability = Uniform(name='probability', val_type=Float32)
+    if frame:
+        # The record has one column per qubit, and a row per shot.
+        u = random_word(X, Y)
+        is_result = targets[0, X]
+    else:
+        u = random_word(Y >> 1)
+        is_result = (X == 0) & ((Y & 1) == 1) & targets[0, Y >> 1]
+    flip = is_result & ((u >> 8).float() < _noise_threshold(probability))
+    return generate_shader_construction(
+        'measurementFlipFrame' if frame else 'measurementFlip',
+        record != flip,
+        tiled=not frame)
+
+
+def _gather_word(num_bits: Idpression,
+                 bit: Callable[[Idpression], Idpression]):
+    # Packs bit(i) for the 32 indices i = 32*X + k into a word.
+    def shifted(k):
+        i = X * 32 + k
+        is_set = (i < num_bits) & bit(i)
+        return (is_set.if_then(Literal.of(PackedBits, 1))
+                .else_end(Literal.of(PackedBits, 0))) << k
+    return reduce_range(32, shifted, '|', Literal.of(PackedBits, 0))
+
+
+def gather_measurements():
+    """
+    Packs the measurement results of a measured state (column 0 of each
+    target's Z row) into a single row of packed_width(num_qubits) texels per
+    shot, with qubit q's result in bit q & 31 of texel q >> 5. Qubits that
+    aren't targets read as 0.
+    """
+    state = Tex(name='state',
+                val_type=Bit,
+                size_range=_TABLEAU_SIZE)
+    targets = Tex(name='targets', val_type=Bit, per_shot=False)
+    num_qubits = state.size.y().int() >> 1
+    result = _gather_word(num_qubits,
+                          lambda q: targets[0, q] & state[0, q * 2 + 1])
+    return generate_shader_construction('gatherMeasurements', result)
+
+
+def gather_frame_record():
+    """
+    Packs each row (shot) of a frame_measure_record result the same way as
+    gather_measurements, giving packed_width(num_qubits) texels per shot.
+    """
+    record = Tex(name='record', val_type=Bit)
+    result = _gather_word(record.size.x().int(), lambda q: record[q, :])
+    return generate_shader_construction('gatherFrameRecord',
+                                        result,
+                                        tiled=False)
 
 
 def main():
@@ -315,11 +816,12 @@ def main():
     # print(prepare_clean_state())
     # print(eliminate_column())
     # print(eliminate_column())
-    # print(random_advance())
     # print(measure_set_result())
     # print(shifter())
     # print(surface_hadamards(check_vs_data=False))
+    # print(surface_cycle())
     print(do_surface_czs(evens=False, verticals=True, zs=True))
 
 
-main()
+if __name__ == '__main__':
+    main()
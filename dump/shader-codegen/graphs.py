@@ -0,0 +1,41 @@
+import contextlib
+from typing import Dict, List, Optional
+from idpression import Idpression
+
+_collectors = []  # type: List[Dict[str, Idpression]]
+
+
+@contextlib.contextmanager
+def collect_graphs():
+    """
+    Collects the (untiled) value of each shader constructed within the
+    context (see record_graph), keyed by the shader's name.
+    """
+    graphs = {}  # type: Dict[str, Idpression]
+    _collectors.append(graphs)
+    try:
+        yield graphs
+    finally:
+        _collectors.pop()
+
+
+def record_graph(name: str, final_value: Idpression):
+    """Adds a shader's value to the innermost collect_graphs context."""
+    if _collectors:
+        _collectors[-1][name] = final_value
+
+
+def generator_graphs(names: Optional[List[str]] = None
+                     ) -> Dict[str, Idpression]:
+    """The values of the shaders built by the named generators."""
+    # Imported here because build and gen build on this module.
+    import build
+    import gen
+    graphs = {}
+    for name in sorted(build.GENERATORS) if names is None else names:
+        func_name, kwargs = build.GENERATORS[name]
+        with collect_graphs() as collected:
+            getattr(gen, func_name)(**kwargs)
+        if name in collected:
+            graphs[name] = collected[name]
+    return graphs
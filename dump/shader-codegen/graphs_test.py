@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+from idpression import X
+import graphs
+import shader
+
+
+def test_collect_graphs():
+    value = X + 1
+    with graphs.collect_graphs() as outer:
+        with graphs.collect_graphs() as inner:
+            shader.generate_shader_construction('inner', value)
+        shader.generate_shader_construction('outer', value, tiled=False)
+    assert inner == {'inner': value}
+    assert outer == {'outer': value}
+    # Nothing is recorded outside of a context.
+    graphs.record_graph('ignored', X)
+
+
+def test_graphs_do_not_need_numpy():
+    # Generating shaders works without the CPU backend's dependencies.
+    check = ('import sys; sys.modules["numpy"] = None; '
+             'import graphs; '
+             'assert graphs.generator_graphs(["singleHadamard"])')
+    subprocess.run([sys.executable, '-c', check],
+                   check=True,
+                   cwd=os.path.dirname(os.path.abspath(__file__)))
@@ -1,7 +1,31 @@
-from typing import List, Optional, Union, Dict, Type, Tuple, Callable
+from typing import (
+    Collection,
+    List,
+    Optional,
+    Union,
+    Dict,
+    Type,
+    Tuple,
+    Callable,
+    Iterator,
+)
+import contextlib
+import weakref
 
 _next_id = 0
 
+# The names of the local variables of the shader being generated, if any. See
+# local_variable_names.
+_local_names = None
+
+# Structurally identical nodes are shared instead of re-created, so that each
+# distinct value is only computed once by the generated shader.
+_interned = weakref.WeakValueDictionary()
+
+# Literals by text and type. Operators wrap python numbers all the time, so
+# literals are looked up before a node is built, and kept alive for reuse.
+_literals = {}  # type: Dict[Tuple[str, ShaderType], Literal]
+
 
 def next_id():
     global _next_id
@@ -16,13 +40,17 @@ class ShaderType(object):
                  set_arg_key: Optional[str] = None,
                  from_in: Optional[Callable[[str], str]] = None,
                  to_out: Optional[Callable[[str], str]] = None,
-                 spread_args: bool = False):
+                 spread_args: bool = False,
+                 sampler_gl_name: str = 'sampler2D',
+                 out_gl_name: str = 'float'):
         self.name = name
         self.gl_name = gl_name
         self.set_arg_key = set_arg_key
         self.from_in = from_in
         self._to_out = to_out
         self.spread_args = spread_args
+        self.sampler_gl_name = sampler_gl_name
+        self.out_gl_name = out_gl_name
 
     def to_out(self, expression: str) -> str:
         if self._to_out is None:
@@ -62,7 +90,7 @@ Int32 = ShaderType(
 UInt32 = ShaderType(
     name='UInt32',
     gl_name='uint',
-    set_arg_key='1i',
+    set_arg_key='1ui',
     from_in=lambda s: 'uint(({}).x*255.0 + 0.5)'.format(s),
     to_out=lambda s: 'float({}) / 255.0'.format(s))
 
@@ -79,12 +107,63 @@ Vec2 = ShaderType(
     set_arg_key='2f',
     spread_args=True)
 
-
-class Idpression(object):
+# 32 consecutive Bit columns packed into one texel of an R32UI texture. Column
+# c of the unpacked layout is bit c % 32 of the texel in column c // 32.
+PackedBits = ShaderType(
+    name='PackedBits',
+    gl_name='uint',
+    set_arg_key='1ui',
+    from_in=lambda s: '({}).x'.format(s),
+    to_out=lambda s: s,
+    sampler_gl_name='highp usampler2D',
+    out_gl_name='uint')
+
+
+def intern_key_of(val) -> tuple:
+    """A hashable key identifying an operand for structural interning."""
+    if isinstance(val, Idpression):
+        # Operands are interned themselves, so identity is structure.
+        return 'node', id(val)
+    if isinstance(val, slice):
+        return ('slice',
+                intern_key_of(val.start),
+                intern_key_of(val.stop),
+                intern_key_of(val.step))
+    # Include the type so that e.g. True and 1 stay distinct.
+    return type(val).__name__, val
+
+
+class _Interned(type):
+    def __call__(cls, *args, **kwargs):
+        node = super().__call__(*args, **kwargs)
+        key = node.intern_key()
+        if key is None:
+            return node
+        existing = _interned.get(key)
+        if existing is not None:
+            return existing
+        _interned[key] = node
+        return node
+
+
+class Idpression(object, metaclass=_Interned):
     """
     An idempotent expression that can be stored in a named variable.
     """
 
+    # Graphs have many nodes (and interning builds more that are thrown
+    # away), so nodes have slots instead of instance dictionaries.
+    __slots__ = (
+        'dependencies',
+        'val_type',
+        'uniform_dependencies',
+        '_ascending_deps',
+        '_range',
+        '_name',
+        '_id',
+        '__weakref__',
+    )
+
     __hash__ = object.__hash__
 
     def __init__(self,
@@ -93,66 +172,128 @@ class Idpression(object):
                  dependencies: List['Idpression'] = (),
                  uniform_dependencies: List['Idpression'] = (),
                  add_id_suffix_to_name=True):
-        self.dependencies = dependencies
+        self.dependencies = tuple(dependencies)
         self.val_type = val_type
-        self.uniform_dependencies = uniform_dependencies
-        self.var_name = ('{}_{}'.format(name, next_id())
-                         if add_id_suffix_to_name
-                         else name)
+        self.uniform_dependencies = tuple(uniform_dependencies)
+        # Caches, created when first used.
+        self._ascending_deps = None
+        self._range = None
+        self._name = name
+        self._id = next_id() if add_id_suffix_to_name else None
+
+    @property
+    def var_name(self) -> str:
+        if _local_names is not None and self in _local_names:
+            return _local_names[self]
+        if self._id is None:
+            return self._name
+        return '{}_{}'.format(self._name, self._id)
 
     def uniform_lines(self):
         return []
 
-    def uniform_args(self):
+    def uniform_args(self, declared: Collection['Idpression'] = ()):
+        """
+        Descriptions of the javascript arguments setting this node's uniforms,
+        given the uniform nodes that the shader declares.
+        """
         return []
 
+    def arg_name(self) -> str:
+        """The javascript name used for this node's uniform arguments."""
+        return self.var_name
+
+    def intern_key(self) -> Optional[tuple]:
+        """
+        A key shared by all structurally identical nodes, or None if the node
+        has an identity of its own (e.g. a uniform or texture declaration).
+        """
+        return None
+
+    def map_operands(self,
+                     func: Callable[['Idpression'], 'Idpression']
+                     ) -> 'Idpression':
+        """A copy of this node with func applied to each of its operands."""
+        return self
+
     def collect_ascending_deps(self,
-                               seen: Dict['Idpression', int] = None,
-                               out: List['Idpression'] = None,
-                               include_uniforms: bool = True):
-        if seen is None:
-            seen = dict()
-        if out is None:
-            out = []
-        if self in seen:
-            seen[self] += 1
-            return out
-        seen[self] = 1
-
-        for r in self.dependencies:
-            r.collect_ascending_deps(seen, out, include_uniforms)
-        if include_uniforms:
-            for r in self.uniform_dependencies:
-                r.collect_ascending_deps(seen, out, include_uniforms)
-        out.append(self)
+                               include_uniforms: bool = True
+                               ) -> Tuple['Idpression', ...]:
+        """
+        The nodes of the graph under this node (including it), ordered so that
+        each node comes after its dependencies. Uniform dependencies (e.g.
+        declarations of textures and their sizes) are only included when
+        include_uniforms is set.
+
+        Graphs are immutable, so the order is computed once per node and view.
+        """
+        if self._ascending_deps is None:
+            self._ascending_deps = {}
+        cache = self._ascending_deps
+        result = cache.get(include_uniforms)
+        if result is None:
+            result = tuple(self._topological_order(include_uniforms))
+            cache[include_uniforms] = result
+        return result
+
+    def _topological_order(self,
+                           include_uniforms: bool) -> List['Idpression']:
+        # A depth first post-order walk, using an explicit stack so that long
+        # chains of writes don't run into the recursion limit.
+        def operands(node: 'Idpression') -> Iterator['Idpression']:
+            yield from node.dependencies
+            if include_uniforms:
+                yield from node.uniform_dependencies
+
+        out = []
+        seen = {self}
+        stack = [(self, operands(self))]
+        while stack:
+            node, pending = stack[-1]
+            for dep in pending:
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append((dep, operands(dep)))
+                    break
+            else:
+                stack.pop()
+                out.append(node)
         return out
 
     def formula(self) -> Optional[str]:
         """An expression for this value, or None if the var_name works fine."""
         return None
 
+    def declaration_lines(self) -> List[str]:
+        """The shader statements that define this node's variable."""
+        f = self.formula()
+        if f is None:
+            return []
+        return ['{} {} = {};'.format(self.val_type.gl_name, self.var_name, f)]
+
     def if_then(self, true_result) -> 'PartialMatcherBeforeElse':
         return PartialMatcherBeforeElse([[self, true_result]])
 
     def __or__(self, other):
-        if self.val_type is Bit and other.val_type is Bit:
+        if self.val_type is Bit and Idpression.wrap(other).val_type is Bit:
             return BinaryOp(self, other, 'bit_or', '||')
         return BinaryOp(self, other, 'bitwise_or', '|')
 
     def __and__(self, other):
-        if self.val_type is Bit and other.val_type is Bit:
+        if self.val_type is Bit and Idpression.wrap(other).val_type is Bit:
             return BinaryOp(self, other, 'bit_and', '&&')
         if self.val_type is UInt32 and isinstance(other, int):
             return self & Idpression.wrap(other).uint()
         return BinaryOp(self, other, 'bitwise_and', '&')
 
     def __floordiv__(self, other):
-        if self.val_type is Int32 and other.val_type is Int32:
+        if self.val_type is Int32 and Idpression.wrap(other).val_type is Int32:
             return BinaryOp(self, other, 'divide', '/')
         return BinaryOp(self, other, 'divide', '/').int()
 
     def __mod__(self, other):
-        if self.val_type is Float32 and other.val_type is Float32:
+        if (self.val_type is Float32 and
+                Idpression.wrap(other).val_type is Float32):
             return FuncOp('mod', Float32, self, other)
         return BinaryOp(self, other, 'mod', '%')
 
@@ -168,6 +309,9 @@ class Idpression(object):
     def float(self):
         return FuncOp('float', Float32, self)
 
+    def clamp(self, low, high):
+        return FuncOp('clamp', self.val_type, self, low, high)
+
     def __invert__(self):
         if self.val_type == Bit:
             return UnaryOp(self, 'not', '!')
@@ -238,8 +382,10 @@ class Idpression(object):
         return BinaryOp(other, self, 'mul', '*')
 
     def __getitem__(self, item):
+        # Imported here because tex builds on this module.
+        from tex import substitute_coordinates
         x_slice, y_slice = item
-        return PseudoSlice(self, x_slice, y_slice)
+        return substitute_coordinates(self, x_slice, y_slice)
 
     def x(self):
         if self.val_type is not Vec2:
@@ -256,19 +402,26 @@ class Idpression(object):
         if isinstance(val, Idpression):
             return val
         if isinstance(val, bool):
-            return Literal(literal_text='true' if val else 'false',
-                           python_equivalent=-1 if val else 0,
-                           val_type=Bit)
+            return Literal.interned('true' if val else 'false',
+                                    Bit,
+                                    -1 if val else 0)
         if isinstance(val, int):
-            return Literal(literal_text=repr(val),
-                           val_type=Int32,
-                           python_equivalent=val)
+            return Literal.interned(repr(val), Int32, val)
         if isinstance(val, float):
-            return Literal(literal_text=repr(val),
-                           val_type=Float32,
-                           python_equivalent=val)
+            return Literal.interned(repr(val), Float32, val)
         raise ValueError('Unrecognized val: {}'.format(val))
 
+    @staticmethod
+    def wrap_like(val: Union[bool, int, float, 'Idpression'],
+                  other) -> 'Idpression':
+        """Wraps val, giving python ints the unsigned type of other if any."""
+        if (isinstance(val, int) and
+                not isinstance(val, bool) and
+                isinstance(other, Idpression) and
+                other.val_type in [UInt32, PackedBits]):
+            return Literal.of(other.val_type, val)
+        return Idpression.wrap(val)
+
 
 class PartialMatcherBeforeElse(object):
     def __init__(self, clauses):
@@ -295,6 +448,8 @@ class PartialMatcherBeforeThen(object):
 
 
 class Literal(Idpression):
+    __slots__ = ('python_equivalent',)
+
     def __init__(self,
                  literal_text: str,
                  val_type: ShaderType,
@@ -302,6 +457,41 @@ class Literal(Idpression):
         super().__init__(literal_text, val_type, add_id_suffix_to_name=False)
         self.python_equivalent = python_equivalent
 
+    def intern_key(self):
+        return (type(self),
+                self.var_name,
+                self.val_type,
+                intern_key_of(self.python_equivalent))
+
+    @staticmethod
+    def interned(literal_text: str,
+                 val_type: ShaderType,
+                 python_equivalent) -> 'Literal':
+        """
+        The literal with the given text and type. Unlike the constructor,
+        doesn't build a new node when the literal already exists.
+        """
+        key = literal_text, val_type
+        result = _literals.get(key)
+        if result is None:
+            result = Literal(literal_text, val_type, python_equivalent)
+            _literals[key] = result
+        return result
+
+    @staticmethod
+    def of(val_type: ShaderType, value) -> 'Literal':
+        """A literal of the given type holding the given python value."""
+        if val_type is Bit:
+            return Idpression.wrap(bool(value))
+        if val_type is Int32:
+            return Idpression.wrap(int(value))
+        if val_type is UInt32 or val_type is PackedBits:
+            value = int(value) & 0xFFFFFFFF
+            return Literal.interned('{}u'.format(value), val_type, value)
+        if val_type is Float32:
+            return Idpression.wrap(float(value))
+        raise ValueError('No literals of type {}.'.format(val_type))
+
     def __getitem__(self, item):
         return ValueError()
 
@@ -309,20 +499,33 @@ class Literal(Idpression):
         return []
 
     def __invert__(self):
-        if self.python_equivalent is None:
+        if self.python_equivalent is None or self.val_type is Float32:
             return Idpression.__invert__(self)
-        return Idpression.wrap(~self.python_equivalent)
+        if self.val_type is Bit:
+            return Literal.of(Bit, not self.python_equivalent)
+        return Literal.of(self.val_type, ~self.python_equivalent)
+
+
+# The fragment's integer coordinates in the output texture.
+X = Literal('x', val_type=Int32, python_equivalent=None)
+Y = Literal('y', val_type=Int32, python_equivalent=None)
 
 
 class Uniform(Idpression):
+    __slots__ = ('value_range',)
+
     def __init__(self,
                  val_type: ShaderType,
                  name: str,
-                 add_id_suffix_to_name=False):
+                 add_id_suffix_to_name=False,
+                 value_range: Optional[tuple] = None):
         super().__init__(name,
                          val_type,
                          add_id_suffix_to_name=add_id_suffix_to_name)
         self.val_type = val_type
+        # Inclusive (low, high) bounds on the values the uniform will be set
+        # to, or one such pair per component for vectors. See ranges.py.
+        self.value_range = value_range
 
     def __getitem__(self, item):
         return ValueError()
@@ -332,7 +535,7 @@ class Uniform(Idpression):
             'uniform {} {};'.format(self.val_type.gl_name, self.var_name),
         ]
 
-    def uniform_args(self):
+    def uniform_args(self, declared=()):
         return [
             "['{}', '{}', {}]".format(
                 self.val_type.set_arg_key,
@@ -342,23 +545,43 @@ class Uniform(Idpression):
 
 
 class UniformTexSize(Uniform):
-    def __init__(self, name, add_id_suffix_to_name=True):
+    __slots__ = ()
+
+    def __init__(self,
+                 name,
+                 add_id_suffix_to_name=True,
+                 value_range: Optional[tuple] = None):
         super().__init__(Vec2,
                          name,
-                         add_id_suffix_to_name=add_id_suffix_to_name)
+                         add_id_suffix_to_name=add_id_suffix_to_name,
+                         value_range=value_range)
 
-    def uniform_args(self):
+    def uniform_args(self, declared=()):
         # Handled by Tex.
         return []
 
 
+class TextureRead(Idpression):
+    """A value read from a texture. See tex.py."""
+    __slots__ = ()
+
+
 class UnaryOp(Idpression):
+    __slots__ = ('val', 'prefix', 'op_char')
+
     def __init__(self, val, prefix, op_char):
         val = Idpression.wrap(val)
         super().__init__(prefix, val.val_type, dependencies=[val])
         self.val = val
+        self.prefix = prefix
         self.op_char = op_char
 
+    def map_operands(self, func):
+        return UnaryOp(func(self.val), self.prefix, self.op_char)
+
+    def intern_key(self):
+        return type(self), intern_key_of(self.val), self.op_char
+
     def formula(self):
         return '{}({})'.format(
             self.op_char,
@@ -366,6 +589,8 @@ class UnaryOp(Idpression):
 
 
 class FuncOp(Idpression):
+    __slots__ = ('vals', 'op_name')
+
     def __init__(self, op_name: str, out_type: ShaderType, *vals: Idpression):
         vals = tuple(Idpression.wrap(val) for val in vals)
         super().__init__(
@@ -375,6 +600,15 @@ class FuncOp(Idpression):
         self.vals = vals
         self.op_name = op_name
 
+    def intern_key(self):
+        return ((type(self), self.op_name, self.val_type) +
+                tuple(intern_key_of(v) for v in self.vals))
+
+    def map_operands(self, func):
+        return FuncOp(self.op_name,
+                      self.val_type,
+                      *[func(v) for v in self.vals])
+
     def formula(self):
         return '{}({})'.format(
             self.op_name,
@@ -382,6 +616,8 @@ class FuncOp(Idpression):
 
 
 class PropertyOp(Idpression):
+    __slots__ = ('val', 'prop_name')
+
     def __init__(self, val: Idpression, prop_name: str, out_type: ShaderType):
         super().__init__(
             name='prop_{}'.format(prop_name),
@@ -390,6 +626,15 @@ class PropertyOp(Idpression):
         self.val = val
         self.prop_name = prop_name
 
+    def intern_key(self):
+        return (type(self),
+                intern_key_of(self.val),
+                self.prop_name,
+                self.val_type)
+
+    def map_operands(self, func):
+        return PropertyOp(func(self.val), self.prop_name, self.val_type)
+
     def formula(self):
         return '({}).{}'.format(
             self.val.var_name,
@@ -397,12 +642,18 @@ class PropertyOp(Idpression):
 
 
 class BinaryOp(Idpression):
+    __slots__ = ('lhs', 'rhs', 'prefix', 'op_char')
+
     def __init__(self,
                  lhs: Idpression,
                  rhs: Idpression,
                  prefix: str,
                  op_char: str,
                  out_type: Optional[ShaderType] = None):
+        if op_char not in ['<<', '>>']:
+            # GLSL has no implicit int to uint conversions.
+            lhs = Idpression.wrap_like(lhs, rhs)
+            rhs = Idpression.wrap_like(rhs, lhs)
         lhs = Idpression.wrap(lhs)
         rhs = Idpression.wrap(rhs)
         super().__init__(
@@ -411,8 +662,23 @@ class BinaryOp(Idpression):
             dependencies=[lhs, rhs])
         self.lhs = lhs
         self.rhs = rhs
+        self.prefix = prefix
         self.op_char = op_char
 
+    def intern_key(self):
+        return (type(self),
+                intern_key_of(self.lhs),
+                intern_key_of(self.rhs),
+                self.op_char,
+                self.val_type)
+
+    def map_operands(self, func):
+        return BinaryOp(func(self.lhs),
+                        func(self.rhs),
+                        self.prefix,
+                        self.op_char,
+                        self.val_type)
+
     def formula(self):
         return '({}) {} ({})'.format(
             self.lhs.var_name,
@@ -420,42 +686,37 @@ class BinaryOp(Idpression):
             self.rhs.var_name)
 
 
-class PseudoSlice(Idpression):
-    def __init__(self, val: Idpression, x_slice: slice, y_slice: slice):
-        deps = ([dep[x_slice, y_slice] for dep in val.dependencies] +
-                slice_deps(x_slice) +
-                slice_deps(y_slice))
-        super().__init__('slice', val.val_type, deps)
-        self.val = val
-        self.x_slice = x_slice
-        self.y_slice = y_slice
-        self.sliced_deps = deps
-
-    def formula(self):
-        line = self.val.formula()
-        for dep, sliced_dep in zip(self.val.dependencies, self.sliced_deps):
-            # Oh man is this ever hacky.
-            line = line.replace(dep.var_name, sliced_dep.var_name)
-        return line
-
-
 class Matcher(Idpression):
+    __slots__ = ('clauses', 'else_result')
+
     def __init__(self,
                  clauses: List[Tuple[Idpression, Idpression]],
                  else_result: Idpression):
+        clauses = [(Idpression.wrap(a), Idpression.wrap(b))
+                   for a, b in clauses]
+        else_result = Idpression.wrap(else_result)
         terms = []
-        combo_type = Idpression.wrap(else_result).val_type
+        combo_type = else_result.val_type
         for a, b in clauses:
             terms.append(a)
             terms.append(b)
-            combo_type = combo_type.combine(Idpression.wrap(b).val_type)
+            combo_type = combo_type.combine(b.val_type)
         terms.append(else_result)
-        terms = [t for t in terms if isinstance(t, Idpression)]
 
         super().__init__('match', combo_type, terms)
         self.clauses = clauses
         self.else_result = else_result
 
+    def intern_key(self):
+        return (type(self),
+                tuple((intern_key_of(a), intern_key_of(b))
+                      for a, b in self.clauses),
+                intern_key_of(self.else_result))
+
+    def map_operands(self, func):
+        return Matcher([(func(a), func(b)) for a, b in self.clauses],
+                       func(self.else_result))
+
     @staticmethod
     def simplify(clauses, else_result):
         result = []
@@ -482,6 +743,102 @@ class Matcher(Idpression):
         return '\n                '.join(lines)
 
 
+class LoopIndex(Idpression):
+    """The index variable of a Reduce's loop."""
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__('i', Int32)
+
+
+class Reduce(Idpression):
+    """
+    The value obtained by starting from initial and combining in the body's
+    value for each index from 0 up to (but excluding) count, using a binary
+    operator such as '!=' (for xor-ing bits) or '+'. Becomes a for loop.
+    """
+    __slots__ = ('index', 'count', 'body', 'op_char', 'initial', 'inner')
+
+    def __init__(self,
+                 index: LoopIndex,
+                 count: Idpression,
+                 body: Idpression,
+                 op_char: str,
+                 initial: Idpression):
+        count = Idpression.wrap(count)
+        body = Idpression.wrap(body)
+        initial = Idpression.wrap(initial)
+
+        # Nodes that vary with the index are computed inside the loop. Their
+        # other operands are computed once, before it.
+        varying = {index}
+        inner = []
+        for dep in body.collect_ascending_deps(include_uniforms=False):
+            if dep is not index and any(e in varying
+                                        for e in dep.dependencies):
+                varying.add(dep)
+                inner.append(dep)
+        outer = [count, initial]
+        if body not in varying:
+            outer.append(body)
+        for dep in inner:
+            outer.extend(e for e in dep.dependencies if e not in varying)
+
+        super().__init__(
+            'reduce',
+            val_type=initial.val_type.combine(body.val_type),
+            dependencies=outer,
+            uniform_dependencies=inner)
+        self.index = index
+        self.count = count
+        self.body = body
+        self.op_char = op_char
+        self.initial = initial
+        self.inner = inner
+
+    def intern_key(self):
+        return (type(self),
+                intern_key_of(self.index),
+                intern_key_of(self.count),
+                intern_key_of(self.body),
+                self.op_char,
+                intern_key_of(self.initial))
+
+    def map_operands(self, func):
+        return Reduce(self.index,
+                      func(self.count),
+                      func(self.body),
+                      self.op_char,
+                      func(self.initial))
+
+    def declaration_lines(self):
+        body_lines = [line
+                      for dep in self.inner
+                      for line in dep.declaration_lines()]
+        return [
+            '{} {} = {};'.format(self.val_type.gl_name,
+                                 self.var_name,
+                                 self.initial.var_name),
+            'for (int {0} = 0; {0} < {1}; {0}++) {{'.format(
+                self.index.var_name,
+                self.count.var_name),
+        ] + ['    ' + line for line in body_lines] + [
+            '    {0} = ({0}) {1} ({2});'.format(self.var_name,
+                                              self.op_char,
+                                              self.body.var_name),
+            '}',
+        ]
+
+
+def reduce_range(count: Union[int, Idpression],
+                 func: Callable[[Idpression], Idpression],
+                 op_char: str,
+                 initial: Union[bool, int, Idpression]) -> Reduce:
+    """Reduces func(i) over 0 <= i < count. See Reduce."""
+    index = LoopIndex()
+    return Reduce(index, count, func(index), op_char, initial)
+
+
 def slice_deps(s):
     result = []
     if isinstance(s, slice):
@@ -495,3 +852,72 @@ def slice_deps(s):
     else:
         raise NotImplementedError(type(s))
     return [r for r in result if isinstance(r, Idpression)]
+
+
+def map_slice(s, func: Callable[[Idpression], Idpression]):
+    """Applies func to the Idpression parts of a slice or index."""
+    def f(e):
+        return func(e) if isinstance(e, Idpression) else e
+    if isinstance(s, slice):
+        return slice(f(s.start), f(s.stop), f(s.step))
+    return f(s)
+
+
+def transform(root: Idpression,
+              rewrite: Callable[[Idpression], Idpression]) -> Idpression:
+    """
+    Rebuilds the graph under root from the bottom up, replacing each node by
+    the result of calling rewrite on it after its operands were replaced.
+    """
+    memo = {}
+
+    def f(node: Idpression) -> Idpression:
+        result = memo.get(node)
+        if result is None:
+            result = rewrite(node.map_operands(f))
+            memo[node] = result
+        return result
+
+    return visit_ascending(root, f)
+
+
+def visit_ascending(root: Idpression,
+                    f: Callable[[Idpression], Idpression]) -> Idpression:
+    """
+    Returns f(root) for a memoized recursive f, after first calling it on the
+    graph's nodes from the bottom up. That way f finds its operands already
+    memoized instead of recursing all the way down long chains.
+    """
+    for node in root.collect_ascending_deps(include_uniforms=False):
+        f(node)
+    return f(root)
+
+
+@contextlib.contextmanager
+def local_variable_names(root: Idpression,
+                         inlined: Collection[Idpression] = ()):
+    """
+    Within this context, the variables computing root are numbered by their
+    position in the graph's topological order instead of by when their nodes
+    were created, so that generated code doesn't depend on what else was
+    built before it. Declarations (uniforms and textures) keep their names,
+    since javascript code refers to them.
+
+    The given inlined nodes get no variable. Their name is their (bracketed)
+    formula instead, so that their consumers compute them in place.
+    """
+    global _local_names
+    names = {}
+    previous = _local_names
+    _local_names = names
+    try:
+        count = 0
+        for node in root.collect_ascending_deps(include_uniforms=True):
+            if node in inlined:
+                names[node] = '({})'.format(node.formula())
+            elif node._id is not None and not node.uniform_lines():
+                names[node] = '{}_{}'.format(node._name, count)
+                count += 1
+        yield
+    finally:
+        _local_names = previous
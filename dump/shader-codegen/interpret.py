@@ -0,0 +1,324 @@
+from typing import Dict, Tuple, Union
+import numpy as np
+from idpression import (
+    Idpression,
+    Literal,
+    Uniform,
+    UnaryOp,
+    FuncOp,
+    PropertyOp,
+    BinaryOp,
+    Matcher,
+    Reduce,
+    ShaderType,
+    Bit,
+    Byte,
+    Int32,
+    UInt32,
+    Float32,
+    PackedBits,
+    X,
+    Y,
+)
+from tex import Tex, TexSlice, TexLayerFetch, coalesce_slice
+from tiling import OUT_ORIGIN, OUT_TILE, SHOT_X, SHOT_Y
+
+_DTYPES = {
+    Bit: np.bool_,
+    Byte: np.int32,
+    Int32: np.int32,
+    UInt32: np.uint32,
+    PackedBits: np.uint32,
+    Float32: np.float32,
+}
+
+
+def decode_texels(texels: np.ndarray, val_type: ShaderType) -> np.ndarray:
+    """
+    The values a shader sees when reading texels of the given type, given the
+    data stored in the texture (bytes for R8 textures, words for R32UI).
+    """
+    if val_type is PackedBits:
+        return texels.astype(np.uint32)
+    texels = texels.astype(np.uint8)
+    if val_type is Bit:
+        return texels > 127
+    if val_type is Float32:
+        return texels.astype(np.float32) / np.float32(255)
+    return texels.astype(_DTYPES[val_type])
+
+
+def encode_texels(values: np.ndarray, val_type: ShaderType) -> np.ndarray:
+    """The data a texture ends up storing when a shader outputs values."""
+    if val_type is PackedBits:
+        return values.astype(np.uint32)
+    if val_type is Bit:
+        return np.where(values, 255, 0).astype(np.uint8)
+    if val_type is Float32:
+        return np.round(np.clip(values, 0, 1) * 255).astype(np.uint8)
+    # Written as float(v) / 255.0 into a normalized byte.
+    return np.clip(values.astype(np.int64), 0, 255).astype(np.uint8)
+
+
+class _Evaluator(object):
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 textures: Dict[Union[str, Tex], np.ndarray],
+                 uniforms: Dict[Union[str, Uniform], object],
+                 shots: Tuple[int, int]):
+        self.width = width
+        self.height = height
+        self.shots = shots
+        self.textures = textures
+        self.uniforms = uniforms
+        self.xs = np.arange(width, dtype=np.int32)[np.newaxis, :]
+        self.ys = np.arange(height, dtype=np.int32)[:, np.newaxis]
+        self.sized_textures = {}
+        self.tiled_textures = {}
+
+    def texels(self, tex: Tex) -> np.ndarray:
+        for key in [tex, tex.tex_name()]:
+            if key in self.textures:
+                return np.asarray(self.textures[key])
+        raise ValueError('No data bound for texture {}.'.format(
+            tex.tex_name()))
+
+    def uniform(self, node: Uniform):
+        for key in [node, node.var_name]:
+            if key in self.uniforms:
+                v = self.uniforms[key]
+                if node.val_type.spread_args:
+                    return tuple(np.float32(e) for e in v)
+                return _DTYPES[node.val_type](v)
+        cols, rows = self.shots
+        if node is OUT_TILE:
+            return (np.float32(self.width / cols),
+                    np.float32(self.height / rows))
+        if node is OUT_ORIGIN:
+            return np.float32(0), np.float32(0)
+        if node in self.tiled_textures:
+            h, w = self.texels(self.tiled_textures[node]).shape
+            return np.float32(w / cols), np.float32(h / rows)
+        if node in self.sized_textures:
+            h, w = self.texels(self.sized_textures[node]).shape
+            return np.float32(w), np.float32(h)
+        raise ValueError('No value bound for uniform {}.'.format(
+            node.var_name))
+
+    def fetch(self, tex: Tex, ix, iy) -> np.ndarray:
+        texels = self.texels(tex)
+        h, w = texels.shape
+        # Reads outside the texture are clamped to its edge.
+        ix = np.clip(ix, 0, w - 1)
+        iy = np.clip(iy, 0, h - 1)
+        ix, iy = np.broadcast_arrays(ix, iy)
+        return decode_texels(texels[iy, ix], tex.val_type)
+
+    @staticmethod
+    def index(index, coords: np.ndarray, values) -> np.ndarray:
+        def v(e):
+            return values[e] if isinstance(e, Idpression) else e
+
+        if isinstance(index, slice):
+            index = coalesce_slice(index)
+            return coords * v(index.step) + v(index.start)
+        return v(index)
+
+    def evaluate(self, root: Idpression):
+        for tex in root.collect_ascending_deps(include_uniforms=True):
+            if isinstance(tex, Tex):
+                self.sized_textures[tex.size] = tex
+                if tex.tile is not None:
+                    self.tiled_textures[tex.tile] = tex
+        values = {}
+        for node in root.collect_ascending_deps(include_uniforms=False):
+            values[node] = self.evaluate_node(node, values)
+        return values[root]
+
+    def evaluate_node(self, node: Idpression, values):
+        def v(e):
+            return values[e] if isinstance(e, Idpression) else e
+
+        if node is X:
+            return self.xs
+        if node is Y:
+            return self.ys
+        if node is SHOT_X or node is SHOT_Y:
+            # Untiled graphs compute a single shot.
+            return np.int32(0)
+        if isinstance(node, Literal):
+            p = node.python_equivalent
+            if node.val_type is Bit:
+                p = bool(p)
+            return _DTYPES[node.val_type](p)
+        if isinstance(node, Uniform):
+            return self.uniform(node)
+        if isinstance(node, Tex):
+            return self.fetch(node, self.xs, self.ys)
+        if isinstance(node, TexSlice):
+            return self.fetch(node.tex,
+                              self.index(node.x_slice, self.xs, values),
+                              self.index(node.y_slice, self.ys, values))
+        if isinstance(node, TexLayerFetch):
+            w = self.texels(node.tex).shape[1]
+            layer_w, layer_h = (int(e) for e in self.uniform(node.tex.layer))
+            columns = -(-w // layer_w)
+            layer = v(node.layer)
+            return self.fetch(node.tex,
+                              layer % columns * layer_w + v(node.x),
+                              layer // columns * layer_h + v(node.y))
+        if isinstance(node, PropertyOp):
+            return v(node.val)['xy'.index(node.prop_name)]
+        if isinstance(node, UnaryOp):
+            return _unary(node, v(node.val))
+        if isinstance(node, FuncOp):
+            return _func(node, [v(e) for e in node.vals])
+        if isinstance(node, BinaryOp):
+            return _binary(node, v(node.lhs), v(node.rhs))
+        if isinstance(node, Matcher):
+            shape = (self.height, self.width)
+            return np.select(
+                [np.broadcast_to(v(c), shape) for c, _ in node.clauses],
+                [np.broadcast_to(v(r), shape) for _, r in node.clauses],
+                default=np.broadcast_to(v(node.else_result), shape))
+        if isinstance(node, Reduce):
+            counts = np.asarray(v(node.count))
+            acc = v(node.initial)
+            for i in range(int(np.max(counts, initial=0))):
+                scope = dict(values)
+                scope[node.index] = np.int32(i)
+                for dep in node.inner:
+                    scope[dep] = self.evaluate_node(dep, scope)
+                combined = _combine(node.op_char,
+                                    node.val_type,
+                                    acc,
+                                    scope[node.body])
+                acc = np.where(i < counts, combined, acc)
+            return acc
+        raise NotImplementedError('Unrecognized node: {}'.format(node))
+
+
+def _unary(node: UnaryOp, a):
+    dtype = _DTYPES[node.val_type]
+    if node.op_char == '!':
+        return np.logical_not(a)
+    if node.op_char == '~':
+        return np.invert(a).astype(dtype)
+    if node.op_char == '-':
+        return np.negative(a).astype(dtype)
+    raise NotImplementedError(node.op_char)
+
+
+def _func(node: FuncOp, args):
+    if node.op_name == 'clamp':
+        a, low, high = args
+        return np.minimum(np.maximum(a, low), high)
+    if node.op_name == 'mod':
+        a, b = args
+        return (a - b * np.floor(a / b)).astype(np.float32)
+    if node.op_name in ['bool', 'int', 'uint', 'float']:
+        a = np.asarray(args[0])
+        if node.op_name == 'bool':
+            return a != 0
+        if node.op_name == 'uint' and a.dtype == np.float32:
+            # Go through int64 so negative floats don't saturate to zero.
+            a = np.trunc(a).astype(np.int64)
+        elif a.dtype == np.float32:
+            a = np.trunc(a)
+        return a.astype(_DTYPES[node.val_type])
+    raise NotImplementedError(node.op_name)
+
+
+def _binary(node: BinaryOp, a, b):
+    return _combine(node.op_char,
+                    node.lhs.val_type,
+                    a,
+                    b,
+                    node.rhs.val_type)
+
+
+def _combine(op: str,
+             lhs_type: ShaderType,
+             a,
+             b,
+             rhs_type: ShaderType = None):
+    arg_dtype = _DTYPES[lhs_type]
+    a = np.asarray(a, dtype=arg_dtype)
+    b = np.asarray(b, dtype=_DTYPES[rhs_type or lhs_type])
+    if op in ['<<', '>>']:
+        b = b.astype(arg_dtype)
+    comparisons = {
+        '==': np.equal,
+        '!=': np.not_equal,
+        '<': np.less,
+        '>': np.greater,
+        '<=': np.less_equal,
+        '>=': np.greater_equal,
+    }
+    if op in comparisons:
+        return comparisons[op](a, b)
+    if op == '&&':
+        return np.logical_and(a, b)
+    if op == '||':
+        return np.logical_or(a, b)
+    if op == '/' and arg_dtype is not np.float32:
+        # GLSL integer division truncates towards zero.
+        safe_b = np.where(b == 0, 1, b)
+        q = np.abs(a.astype(np.int64)) // np.abs(safe_b.astype(np.int64))
+        q = np.where((a < 0) != (b < 0), -q, q)
+        return q.astype(arg_dtype)
+    if op == '%':
+        safe_b = np.where(b == 0, 1, b)
+        return np.fmod(a, safe_b).astype(arg_dtype)
+    f = {
+        '+': np.add,
+        '-': np.subtract,
+        '*': np.multiply,
+        '/': np.divide,
+        '&': np.bitwise_and,
+        '|': np.bitwise_or,
+        '^': np.bitwise_xor,
+        '<<': np.left_shift,
+        '>>': np.right_shift,
+    }[op]
+    return f(a, b).astype(arg_dtype)
+
+
+def evaluate(root: Idpression,
+             width: int,
+             height: int,
+             textures: Dict[Union[str, Tex], np.ndarray] = None,
+             uniforms: Dict[Union[str, Uniform], object] = None,
+             shots: Tuple[int, int] = (1, 1)) -> np.ndarray:
+    """
+    Computes the value of root at every texel of a width x height output, the
+    way the generated shader would.
+
+    Textures and uniforms are bound by node or by name. Texture data is given
+    as a (height, width) array of what the texture stores, i.e. what reading
+    it back gives (bytes for R8 textures, words for PackedBits textures).
+    Tiled textures (and the output) hold a grid of shots with the given
+    number of columns and rows. Layered textures are bound to their whole
+    (logical) data, with their layer sizes given as uniforms; the output's
+    layer is at the out_origin uniform (default 0, 0).
+    """
+    evaluator = _Evaluator(width,
+                           height,
+                           textures or {},
+                           uniforms or {},
+                           shots)
+    with np.errstate(over='ignore'):
+        result = evaluator.evaluate(Idpression.wrap(root))
+    return np.broadcast_to(result, (height, width)).copy()
+
+
+def render(root: Idpression,
+           width: int,
+           height: int,
+           textures: Dict[Union[str, Tex], np.ndarray] = None,
+           uniforms: Dict[Union[str, Uniform], object] = None,
+           shots: Tuple[int, int] = (1, 1)) -> np.ndarray:
+    """The data a texture would store after rendering root into it."""
+    values = evaluate(root, width, height, textures, uniforms, shots)
+    return encode_texels(values, Idpression.wrap(root).val_type)
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from idpression import (
+    Idpression,
+    Literal,
+    Uniform,
+    Int32,
+    transform,
+)
+from simplify import simplify, specialize
+from tiling import SHOT_X, SHOT_Y, tile_shots, single_shot
+from shader_cases import (
+    GRAPHS,
+    SHOT,
+    texture_nodes,
+    random_texels,
+    random_uniforms,
+    evaluate,
+    random_bindings,
+)
+
+@pytest.mark.parametrize('name', sorted(GRAPHS))
+def test_simplify_preserves_generated_shaders(name):
+    root, textures, uniforms = random_bindings(name)
+    np.testing.assert_array_equal(
+        evaluate(simplify(root), textures, uniforms),
+        evaluate(root, textures, uniforms))
+    np.testing.assert_array_equal(
+        evaluate(simplify(single_shot(root)), textures, uniforms),
+        evaluate(root, textures, uniforms))
+
+
+@pytest.mark.parametrize('name', sorted(
+    n for n, g in GRAPHS.items()
+    if any(isinstance(e, Uniform) and e.var_name.startswith('surface_')
+           for e in g.collect_ascending_deps(include_uniforms=True))))
+def test_specialize_preserves_generated_shaders(name):
+    root, textures, uniforms = random_bindings(name)
+    for n in [3, 5]:
+        uniforms.update({'surface_width': n, 'surface_height': n})
+        fixed = specialize(root, uniforms)
+        np.testing.assert_array_equal(
+            evaluate(fixed, textures, {}),
+            evaluate(root, textures, uniforms))
+
+
+def _with_shot(root: Idpression, x: int, y: int) -> Idpression:
+    shot_x, shot_y = Literal.of(Int32, x), Literal.of(Int32, y)
+    return transform(root,
+                     lambda node: shot_x if node is SHOT_X else
+                     shot_y if node is SHOT_Y else node)
+
+
+@pytest.mark.parametrize('name', sorted(GRAPHS))
+def test_tiled_shots_match_separate_shots(name):
+    cols, rows = 3, 2
+    rng = np.random.default_rng(1)
+    root = GRAPHS[name]
+    textures = texture_nodes(root)
+    uniforms = random_uniforms(rng, root)
+    tiled_data = {}
+    for n, t in textures.items():
+        shape = (SHOT[1] * rows, SHOT[0] * cols)
+        tiled_data[n] = random_texels(rng, t, shape if t.per_shot
+                                      else SHOT[::-1])
+    tiled = simplify(tile_shots(root))
+    actual = evaluate(tiled, tiled_data, uniforms, (cols, rows))
+
+    w, h = SHOT
+    for y in range(rows):
+        for x in range(cols):
+            shot_data = {
+                n: tiled_data[n][y * h:(y + 1) * h, x * w:(x + 1) * w]
+                if t.per_shot else tiled_data[n]
+                for n, t in textures.items()
+            }
+            expected = evaluate(_with_shot(root, x, y), shot_data, uniforms)
+            np.testing.assert_array_equal(
+                actual[y * h:(y + 1) * h, x * w:(x + 1) * w],
+                expected,
+                err_msg='shot {}, {}'.format(x, y))
@@ -0,0 +1,39 @@
+from typing import List, Sequence
+
+
+def packed_width(width: int) -> int:
+    """The number of PackedBits texels needed for a row of width bits."""
+    return (width + 31) // 32
+
+
+def pack_bits(buf: Sequence[int], width: int) -> List[int]:
+    """
+    Packs a row-major buffer of bits (e.g. the bytes read back from a Bit
+    texture, where any non-zero value is a set bit) into the row-major words
+    of the equivalent PackedBits texture.
+    """
+    if len(buf) % width:
+        raise ValueError('Buffer length is not a multiple of the width.')
+    w = packed_width(width)
+    result = [0] * (len(buf) // width * w)
+    for i, b in enumerate(buf):
+        if b:
+            y, x = divmod(i, width)
+            result[y * w + (x >> 5)] |= 1 << (x & 31)
+    return result
+
+
+def unpack_bits(words: Sequence[int], width: int) -> bytes:
+    """
+    Unpacks the row-major words of a PackedBits texture into the bytes that
+    reading back the equivalent Bit texture would give (0 or 255 per bit).
+    """
+    w = packed_width(width)
+    if len(words) % w:
+        raise ValueError('Word count is not a multiple of the packed width.')
+    result = bytearray(len(words) // w * width)
+    for i in range(len(result)):
+        y, x = divmod(i, width)
+        if (words[y * w + (x >> 5)] >> (x & 31)) & 1:
+            result[i] = 255
+    return bytes(result)
@@ -0,0 +1,173 @@
+from typing import Dict, List, Optional, Sequence
+from idpression import (
+    Idpression,
+    Reduce,
+    X,
+    Y,
+    slice_deps,
+    transform,
+)
+from tex import (
+    Tex,
+    TexSlice,
+    TexWrite,
+    is_identity_index,
+    index_expression,
+    substitute_coordinates,
+)
+from shader import (
+    shader_arguments,
+    shader_specializations,
+    generate_variant_declarations,
+    variant_imports,
+)
+from simplify import simplify
+
+
+def texture_reads(value: Idpression) -> List[Idpression]:
+    """The distinct texture fetches performed when computing value."""
+    reads = []
+
+    def visit(nodes: List[Idpression]):
+        for d in nodes:
+            if isinstance(d, (Tex, TexSlice)):
+                reads.append(d)
+            elif isinstance(d, Reduce):
+                visit(d.inner)
+
+    visit(value.collect_ascending_deps(include_uniforms=False))
+    return reads
+
+
+def is_static_read(read: Idpression) -> bool:
+    """Determines if a fetch's position doesn't depend on texture data."""
+    if isinstance(read, Tex):
+        return True
+    indices = slice_deps(read.x_slice) + slice_deps(read.y_slice)
+    return not any(texture_reads(index) for index in indices)
+
+
+def clamped_index(index, coord: Idpression, size: Idpression):
+    """
+    An index reading at the same place as the given one, except that it is
+    clamped to the texture's edge the way the sampler would clamp it.
+    """
+    if is_identity_index(index):
+        return index
+    return index_expression(index, coord).clamp(0, size.int() - 1)
+
+
+def fuse_writes(first: TexWrite,
+                second: TexWrite,
+                memo: Optional[Dict[tuple, tuple]] = None
+                ) -> Optional[Idpression]:
+    """
+    A value computing the result of the second write directly from the
+    textures the first write reads, or None if the second write reads the
+    first write's output at positions that depend on texture data.
+
+    The memo is passed on to substitute_coordinates.
+    """
+    reads = [r
+             for r in texture_reads(second.src)
+             if r is first.dst or (isinstance(r, TexSlice) and
+                                   r.tex is first.dst)]
+    if not all(is_static_read(r) for r in reads):
+        return None
+
+    def rewrite(node: Idpression) -> Idpression:
+        if node is first.dst:
+            return first.src
+        if isinstance(node, TexSlice) and node.tex is first.dst:
+            size = first.dst.size
+            return substitute_coordinates(
+                first.src,
+                clamped_index(node.x_slice, X, size.x()),
+                clamped_index(node.y_slice, Y, size.y()),
+                memo)
+        return node
+
+    return simplify(transform(second.src, rewrite))
+
+
+def fuse_steps(steps: List[TexWrite],
+               max_fetches: int = 16) -> List[TexWrite]:
+    """
+    Combines consecutive full-texture writes into single passes, starting a
+    new pass when a write reads the previous one at data-dependent positions
+    or when the combined pass would need more than max_fetches texture reads.
+    """
+    passes = []
+    pending = None
+    # Substitutions shared by the fusions of this run.
+    memo = {}
+    for step in steps:
+        step = TexWrite(simplify(step.src),
+                        step.dst,
+                        step.x_slice,
+                        step.y_slice)
+        if pending is not None:
+            fused = None
+            if (pending.dst is step.dst and
+                    pending.is_full_write() and
+                    step.is_full_write()):
+                fused = fuse_writes(pending, step, memo)
+            if fused is not None and len(texture_reads(fused)) <= max_fetches:
+                pending = TexWrite(fused,
+                                   step.dst,
+                                   step.x_slice,
+                                   step.y_slice)
+                continue
+            passes.append(pending)
+        pending = step
+    if pending is not None:
+        passes.append(pending)
+    return passes
+
+
+def generate_pipeline_construction(
+        name: str,
+        steps: List[TexWrite],
+        max_fetches: int = 16,
+        tiled: bool = True,
+        specializations: Sequence[Dict[str, object]] = ()) -> str:
+    passes = fuse_steps(steps, max_fetches)
+
+    declarations = []
+    calls = []
+    params = set()
+    for i, p in enumerate(passes):
+        shader_name = '{}Pass{}'.format(name, i)
+        declarations.extend(generate_variant_declarations(shader_name,
+                                                          p.src,
+                                                          specializations,
+                                                          tiled=tiled))
+        fixed = sorted({k
+                        for values in shader_specializations(p.src,
+                                                             specializations)
+                        for k in values})
+        if fixed:
+            shader_name = 'pickVariant({}, {{{}}})'.format(shader_name,
+                                                           ', '.join(fixed))
+        calls.append(p.generate_js(shader_name))
+        params |= {e.arg_name() for _, e in shader_arguments(p.src)}
+        params.add(p.dst.tex_name())
+    imports = variant_imports(declarations + calls)
+
+    return """////// AUTO-GENERATED CODE //////
+
+{}
+
+{}
+
+function {}({}) {{
+    {}
+}}
+
+export {{{}}}""".format(
+        '\n'.join(imports),
+        '\n\n'.join(declarations),
+        name,
+        ', '.join(sorted(params)),
+        '\n    '.join(calls),
+        name)
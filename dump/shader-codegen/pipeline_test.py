@@ -0,0 +1,109 @@
+import numpy as np
+from idpression import Uniform, Bit, Int32, PackedBits, X, Y
+from tex import Tex, substitute_coordinates
+import gen
+import interpret
+import packing
+import pipeline
+
+
+def _random_state(rng: np.random.Generator,
+                  area: int,
+                  packed: bool) -> np.ndarray:
+    width, height = area + 2, 2 * area
+    bits = (rng.random((height, width)) < 0.5).astype(np.uint8) * 255
+    if not packed:
+        return bits
+    words = packing.pack_bits(bits.flatten(), width)
+    return np.array(words, dtype=np.uint32).reshape(height, -1)
+
+
+def _run(steps, data: np.ndarray, uniforms) -> np.ndarray:
+    for step in steps:
+        assert step.is_full_write()
+        height, width = data.shape
+        data = interpret.render(step.src,
+                                width,
+                                height,
+                                {step.dst: data},
+                                uniforms)
+    return data
+
+
+def test_fused_surface_cycle_matches_steps():
+    rng = np.random.default_rng(3)
+    for packed in [False, True]:
+        for frame in [False, True]:
+            if packed and frame:
+                continue
+            steps = []
+            state = Tex(name='state',
+                        val_type=PackedBits if packed else Bit,
+                        steps=steps)
+            surface_width = Uniform(Int32, 'surface_width')
+            surface_height = Uniform(Int32, 'surface_height')
+            gen.apply_cycle(state, surface_width, surface_height, frame)
+            passes = pipeline.fuse_steps(steps)
+            assert len(passes) < len(steps)
+            for n in [3, 5]:
+                uniforms = {'surface_width': n, 'surface_height': n}
+                data = _random_state(rng, n * n, packed)
+                np.testing.assert_array_equal(_run(passes, data, uniforms),
+                                              _run(steps, data, uniforms))
+
+
+def test_fusion_respects_max_fetches():
+    steps = []
+    state = Tex(name='state', val_type=Bit, steps=steps)
+    gen.apply_cycle(state,
+                    Uniform(Int32, 'surface_width'),
+                    Uniform(Int32, 'surface_height'))
+    for max_fetches in [1, 4, 16]:
+        passes = pipeline.fuse_steps(steps, max_fetches)
+        for p in passes:
+            reads = pipeline.texture_reads(p.src)
+            # Single steps are kept even when they read more.
+            assert len(reads) <= max_fetches or any(p.src is s.src
+                                                    for s in steps)
+
+
+def test_data_dependent_reads_are_not_fused():
+    steps = []
+    state = Tex(name='state', val_type=Int32, steps=steps)
+    state[:, :] = state + 1
+    # Reads the first write's output at a position it computed.
+    state[:, :] = state[state, Y]
+    assert pipeline.fuse_writes(steps[0], steps[1]) is None
+    assert len(pipeline.fuse_steps(steps)) == 2
+
+    steps = []
+    state = Tex(name='state', val_type=Int32, steps=steps)
+    state[:, :] = state + 1
+    state[:, :] = state[X + 1, Y] * 2
+    assert pipeline.fuse_writes(steps[0], steps[1]) is not None
+    passes = pipeline.fuse_steps(steps)
+    assert len(passes) == 1
+    data = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    np.testing.assert_array_equal(_run(passes, data, {}),
+                                  _run(steps, data, {}))
+
+
+def test_texture_reads_are_distinct():
+    state = Tex(name='state', val_type=Bit)
+    value = (state != state[:, Y ^ 1]) != state[:, Y ^ 1]
+    assert len(pipeline.texture_reads(value)) == 2
+    assert pipeline.is_static_read(state[:, Y ^ 1])
+    assert not pipeline.is_static_read(state[:, state.int()])
+
+
+def test_fusion_substitutions_share_a_memo():
+    state = Tex(name='state', val_type=Bit)
+    value = state != state[:, Y ^ 1]
+    memo = {}
+    first = substitute_coordinates(value, slice(None), Y + 1, memo)
+    results = [entry[2] for entry in memo.values()]
+    assert len(results) == 1 and results[0][value] is first
+    again = substitute_coordinates(value, slice(None), Y + 1, memo)
+    assert again is first and len(memo) == 1
+    substitute_coordinates(value, X + 1, slice(None), memo)
+    assert len(memo) == 2
@@ -0,0 +1,46 @@
+from typing import Union
+from idpression import Idpression, Uniform, UInt32
+from tiling import SHOT_X, SHOT_Y
+
+# The generator's key, and the number of times it was advanced. Random values
+# only depend on these, the fragment's shot and the caller's keys, so there's
+# no state to store or update: advancing increments the counter uniform.
+SEED = Uniform(name='rand_seed', val_type=UInt32)
+COUNTER = Uniform(name='rand_counter', val_type=UInt32)
+
+
+def mix(word: Idpression) -> Idpression:
+    """
+    Scrambles a UInt32 with a bijective hash (the 'lowbias32' integer hash),
+    so that close inputs give unrelated outputs.
+    """
+    word ^= word >> 16
+    word *= 0x7FEB352D
+    word ^= word >> 15
+    word *= 0x846CA68B
+    word ^= word >> 16
+    return word
+
+
+def random_word(*keys: Union[int, Idpression]) -> Idpression:
+    """
+    A pseudo-random UInt32 that is a pure function of the SEED and COUNTER
+    uniforms, the fragment's shot and the given (integer) keys. Values drawn
+    with different keys, shots or counters are independent, so callers pass
+    whatever distinguishes their draws, e.g. the qubit.
+
+    This is a counter-based generator, i.e. a keyed hash: each key is xor'd
+    into the hash of the ones before it, and the result is hashed again.
+    """
+    h = mix(SEED)
+    for key in [COUNTER, SHOT_X, SHOT_Y] + list(keys):
+        key = Idpression.wrap(key)
+        if key.val_type is not UInt32:
+            key = key.uint()
+        h = mix(h ^ key)
+    return h
+
+
+def random_bit(*keys: Union[int, Idpression]) -> Idpression:
+    """A random Bit, the top bit of random_word(*keys)."""
+    return (random_word(*keys) >> 31) == 1
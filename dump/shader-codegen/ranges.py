@@ -0,0 +1,204 @@
+from typing import Optional, Tuple
+from idpression import (
+    Idpression,
+    Literal,
+    Uniform,
+    UniformTexSize,
+    UnaryOp,
+    FuncOp,
+    PropertyOp,
+    BinaryOp,
+    Matcher,
+    Bit,
+    Byte,
+    Int32,
+    UInt32,
+    Float32,
+    PackedBits,
+    X,
+    Y,
+    TextureRead,
+)
+
+# An inclusive (low, high) bound on a value, or None when nothing is known.
+Range = Optional[Tuple[float, float]]
+
+# Textures (and so fragment coordinates) are assumed to be smaller than this
+# in each dimension.
+MAX_TEXTURE_SIZE = 1 << 16
+
+_INT_LIMITS = {
+    Int32: (-(1 << 31), (1 << 31) - 1),
+    UInt32: (0, (1 << 32) - 1),
+    PackedBits: (0, (1 << 32) - 1),
+}
+
+
+def value_range(node: Idpression) -> Range:
+    """
+    Bounds on the values node can take, derived from the value_range
+    annotations of uniforms (including texture sizes), the storage of
+    textures and the size of the output. Only integer values (and the float
+    components of annotated vectors) get bounds.
+    """
+    # Ranges only depend on the graph under a node, which never changes, so
+    # they are cached on the node (wrapped, since None is a valid result).
+    if node._range is not None:
+        return node._range[0]
+    result = _compute_range(node)
+    if result is not None and node.val_type in _INT_LIMITS:
+        low, high = _INT_LIMITS[node.val_type]
+        if not low <= result[0] <= result[1] <= high:
+            # The value may wrap around.
+            result = None
+    node._range = (result,)
+    return result
+
+
+def _compute_range(node: Idpression) -> Range:
+    if node is X or node is Y:
+        return 0, MAX_TEXTURE_SIZE - 1
+    if isinstance(node, Literal):
+        v = node.python_equivalent
+        if v is None or node.val_type is Bit:
+            return None
+        return v, v
+    if isinstance(node, Uniform):
+        if node.val_type.spread_args:
+            # Vectors are bounded by component. See PropertyOp.
+            return None
+        return node.value_range
+    if isinstance(node, TextureRead):
+        # Non-packed textures store bytes.
+        if node.val_type in [Byte, Int32, UInt32]:
+            return 0, 255
+        return None
+    if isinstance(node, PropertyOp):
+        if not isinstance(node.val, Uniform):
+            return None
+        if node.val.value_range is not None:
+            return node.val.value_range['xy'.index(node.prop_name)]
+        if isinstance(node.val, UniformTexSize):
+            return 1, MAX_TEXTURE_SIZE
+        return None
+    if isinstance(node, FuncOp):
+        return _func_range(node)
+    if isinstance(node, UnaryOp):
+        r = value_range(node.val)
+        if node.op_char == '-' and r is not None:
+            return -r[1], -r[0]
+        return None
+    if isinstance(node, BinaryOp):
+        return _binary_range(node)
+    if isinstance(node, Matcher):
+        results = [r for _, r in node.clauses] + [node.else_result]
+        return _union([value_range(r) for r in results])
+    return None
+
+
+def _union(ranges) -> Range:
+    if any(r is None for r in ranges):
+        return None
+    return min(r[0] for r in ranges), max(r[1] for r in ranges)
+
+
+def _func_range(node: FuncOp) -> Range:
+    args = [value_range(e) for e in node.vals]
+    if node.op_name == 'clamp':
+        v, low, high = args
+        if low is None or high is None:
+            return None
+        if v is None:
+            return low[0], high[1]
+        return (min(max(v[0], low[0]), high[1]),
+                max(min(v[1], high[1]), low[0]))
+    if node.op_name == 'int' and node.vals[0].val_type is Bit:
+        return 0, 1
+    if node.op_name in ['int', 'uint'] and args[0] is not None:
+        # Conversions from float truncate towards zero.
+        return int(args[0][0]), int(args[0][1])
+    if node.op_name == 'float':
+        return args[0]
+    return None
+
+
+def _binary_range(node: BinaryOp) -> Range:
+    op = node.op_char
+    a, b = value_range(node.lhs), value_range(node.rhs)
+    if a is None or b is None or node.val_type is Bit:
+        return None
+    if op == '+':
+        return a[0] + b[0], a[1] + b[1]
+    if op == '-':
+        return a[0] - b[1], a[1] - b[0]
+    if op == '*':
+        products = [x * y for x in a for y in b]
+        return min(products), max(products)
+    if node.val_type is Float32:
+        return None
+
+    a_non_negative, b_non_negative = a[0] >= 0, b[0] >= 0
+    if op == '&':
+        if a_non_negative and b_non_negative:
+            return 0, min(a[1], b[1])
+        if a_non_negative or b_non_negative:
+            return 0, a[1] if a_non_negative else b[1]
+        return None
+    if op in ['|', '^'] and a_non_negative and b_non_negative:
+        # Only changes the bits below the highest bit of the other operand.
+        return 0, min(a[1] | (1 << b[1].bit_length()) - 1,
+                      b[1] | (1 << a[1].bit_length()) - 1)
+    if op == '>>' and a_non_negative and b_non_negative and b[1] < 32:
+        return a[0] >> b[1], a[1] >> b[0]
+    if op == '<<' and a_non_negative and b_non_negative and b[1] < 32:
+        return a[0] << b[0], a[1] << b[1]
+    if op == '/' and a_non_negative and b[0] > 0:
+        return a[0] // b[1], a[1] // b[0]
+    if op == '%' and a_non_negative and b[0] > 0:
+        if a[1] < b[0]:
+            return a
+        return 0, min(a[1], b[1] - 1)
+    return None
+
+
+def narrow_range(node: Idpression, bounds: Tuple[float, float]):
+    """
+    Records bounds on node's values that are known from how it was derived
+    (e.g. for a remainder rewritten into other operations), in addition to
+    the ones computed from its operands.
+    """
+    r = value_range(node)
+    if r is not None:
+        bounds = max(bounds[0], r[0]), min(bounds[1], r[1])
+    node._range = (bounds,)
+
+
+def is_within(index: Idpression, size: Idpression) -> bool:
+    """Determines if value ranges prove that 0 <= index < size."""
+    r, size_range = value_range(index), value_range(size)
+    return (r is not None and
+            size_range is not None and
+            0 <= r[0] and r[1] < size_range[0])
+
+
+def compare(op: str, lhs: Idpression, rhs: Idpression) -> Optional[bool]:
+    """The result of a comparison, when the ranges of its sides decide it."""
+    a, b = value_range(lhs), value_range(rhs)
+    if a is None or b is None:
+        return None
+    if op in ['<', '>=']:
+        if a[1] < b[0]:
+            return op == '<'
+        if a[0] >= b[1]:
+            return op == '>='
+    if op in ['>', '<=']:
+        if a[0] > b[1]:
+            return op == '>'
+        if a[1] <= b[0]:
+            return op == '<='
+    if op in ['==', '!=']:
+        if a[1] < b[0] or b[1] < a[0]:
+            return op == '!='
+        if a[0] == a[1] == b[0] == b[1]:
+            return op == '=='
+    return None
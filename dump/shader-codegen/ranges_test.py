@@ -0,0 +1,142 @@
+import os
+import subprocess
+import sys
+import numpy as np
+from idpression import (
+    Idpression,
+    Literal,
+    Uniform,
+    UniformTexSize,
+    Int32,
+    X,
+    Y,
+)
+from ranges import (
+    MAX_TEXTURE_SIZE,
+    value_range,
+    narrow_range,
+    is_within,
+    compare,
+)
+from tex import Tex
+import interpret
+
+_SMALL = Uniform(Int32, 'small', value_range=(0, 300))
+_SIGNED = Uniform(Int32, 'signed', value_range=(-50, 50))
+
+
+def test_ranges_does_not_import_passes():
+    check = ('import sys, ranges; '
+             'assert not {"shader", "tex"} & set(sys.modules)')
+    subprocess.run([sys.executable, '-c', check],
+                   check=True,
+                   cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_leaf_ranges():
+    assert value_range(X) == (0, MAX_TEXTURE_SIZE - 1)
+    assert value_range(Literal.of(Int32, 7)) == (7, 7)
+    assert value_range(_SMALL) == (0, 300)
+    assert value_range(Uniform(Int32, 'unbounded')) is None
+    assert value_range(Tex(name='bytes', val_type=Int32)) == (0, 255)
+    size = UniformTexSize('some_size')
+    assert value_range(size.x().int()) == (1, MAX_TEXTURE_SIZE)
+
+
+def test_arithmetic_ranges():
+    assert value_range(_SMALL + _SIGNED) == (-50, 350)
+    assert value_range(_SMALL - _SIGNED) == (-50, 350)
+    assert value_range(_SIGNED * _SIGNED) == (-2500, 2500)
+    assert value_range(-_SIGNED) == (-50, 50)
+    assert value_range(_SMALL // 7) == (0, 42)
+    assert value_range(_SMALL % 7) == (0, 6)
+    assert value_range(_SMALL >> 2) == (0, 75)
+    assert value_range(_SMALL.clamp(10, 20)) == (10, 20)
+    # Values that may wrap around have no range.
+    assert value_range(X * X * X) is None
+
+
+def test_bitwise_ranges():
+    low_bits = X & 7
+    assert value_range(low_bits) == (0, 7)
+    assert value_range(low_bits ^ 1) == (0, 7)
+    assert value_range(low_bits | 8) == (0, 15)
+    assert value_range((X % 5) ^ 1) == (0, 5)
+    # Masking by a non-negative value bounds signed values too.
+    assert value_range(_SIGNED & 12) == (0, 12)
+    assert value_range(_SIGNED | 1) is None
+
+
+def test_narrow_range():
+    remainder = _SMALL - (_SMALL // 7) * 7
+    assert value_range(remainder) == (-294, 300)
+    narrow_range(remainder, (0, 6))
+    assert value_range(remainder) == (0, 6)
+    # Known bounds are kept where they are tighter.
+    quotient = _SMALL >> 3
+    narrow_range(quotient, (-10, 100))
+    assert value_range(quotient) == (0, 37)
+
+
+def test_is_within_and_compare():
+    size = Uniform(Int32, 'size', value_range=(8, 20))
+    assert is_within(X & 7, size)
+    assert not is_within(X & 15, size)
+    assert not is_within(_SIGNED.clamp(-1, 3), size)
+    assert compare('<', X & 7, size) is True
+    assert compare('>=', X & 7, size) is False
+    assert compare('<', X & 15, size) is None
+    assert compare('==', _SMALL + 301, _SMALL) is False
+    assert compare('==', Literal.of(Int32, 3), Literal.of(Int32, 3)) is True
+
+
+def _random_int(rng: np.random.Generator, depth: int) -> Idpression:
+    if depth == 0:
+        return [X,
+                Y,
+                _SMALL,
+                _SIGNED,
+                Idpression.wrap(int(rng.integers(-9, 300)))
+                ][rng.integers(0, 5)]
+    a = _random_int(rng, depth - 1)
+    kind = rng.integers(0, 4)
+    if kind == 0:
+        return a.clamp(int(rng.integers(-20, 5)), int(rng.integers(5, 400)))
+    if kind == 1:
+        condition = _random_int(rng, depth - 1) < _random_int(rng, depth - 1)
+        return condition.if_then(a).else_end(_random_int(rng, depth - 1))
+    if kind == 2:
+        op = rng.choice(['/', '%', '<<', '>>'])
+        if op in ['/', '%']:
+            b = int(rng.choice([1, 3, 7, 8, 50]))
+            return a // b if op == '/' else a % b
+        b = int(rng.integers(0, 6))
+        return a << b if op == '<<' else a >> b
+    b = _random_int(rng, depth - 1)
+    op = rng.choice(['+', '-', '*', '&', '|', '^'])
+    return {
+        '+': lambda: a + b,
+        '-': lambda: a - b,
+        '*': lambda: a * b,
+        '&': lambda: a & b,
+        '|': lambda: a | b,
+        '^': lambda: a ^ b,
+    }[op]()
+
+
+def test_random_expression_values_are_within_their_ranges():
+    rng = np.random.default_rng(11)
+    checked = 0
+    for _ in range(400):
+        root = _random_int(rng, 3)
+        r = value_range(root)
+        if r is None:
+            continue
+        checked += 1
+        for _ in range(3):
+            uniforms = {'small': int(rng.integers(0, 301)),
+                        'signed': int(rng.integers(-50, 51))}
+            values = interpret.evaluate(root, 300, 4, uniforms=uniforms)
+            assert r[0] <= np.min(values) and np.max(values) <= r[1], (
+                root, r)
+    assert checked > 100
@@ -0,0 +1,175 @@
+import argparse
+import contextlib
+import json
+import sys
+from typing import Dict, List
+from idpression import (
+    Idpression,
+    BinaryOp,
+    Matcher,
+    Reduce,
+    Int32,
+    UInt32,
+    PackedBits,
+    local_variable_names,
+)
+import schedule
+import tex
+
+# The measures in a shader report, in the order they are listed.
+MEASURES = [
+    'nodes',
+    'statements',
+    'fetches',
+    'div_mod',
+    'branches',
+    'selects',
+    'loops',
+    'peak_live',
+]
+
+_collectors = []  # type: List[Dict[str, Dict[str, int]]]
+
+
+def shader_report(final_value: Idpression) -> Dict[str, int]:
+    """
+    Static measures of the shader computing final_value:
+
+    nodes: Distinct values in the graph.
+    statements: Statements in the shader's main function.
+    fetches: Texture reads, counting reads in loops once.
+    div_mod: Integer divisions and remainders.
+    branches: Conditions of matches emitted as if statements.
+    selects: Conditions of matches emitted as ternaries.
+    loops: For loops.
+    peak_live: The most variables alive at once.
+    """
+    plan = schedule.Schedule(final_value)
+    nodes = list(plan.nodes)
+    for n in plan.nodes:
+        if isinstance(n, Reduce):
+            nodes.extend(n.inner)
+    nodes = set(nodes)
+
+    with local_variable_names(final_value, plan.inlined):
+        lines = plan.lines()
+    conditions = {n: len(n.clauses)
+                  for n in nodes
+                  if isinstance(n, Matcher)}
+    branches = sum(c for n, c in conditions.items() if n in plan.guarded)
+    return {
+        'nodes': len(nodes),
+        'statements': sum(1 for line in lines if line.endswith(';')),
+        'fetches': sum(1
+                       for n in nodes
+                       if isinstance(n, (tex.Tex,
+                                         tex.TexSlice,
+                                         tex.TexLayerFetch))),
+        'div_mod': sum(1
+                       for n in nodes
+                       if isinstance(n, BinaryOp) and
+                       n.op_char in ['/', '%'] and
+                       n.val_type in [Int32, UInt32, PackedBits]),
+        'branches': branches,
+        'selects': sum(conditions.values()) - branches,
+        'loops': sum(1 for n in nodes if isinstance(n, Reduce)),
+        'peak_live': plan.peak_live(),
+    }
+
+
+def memory_report(root: Idpression) -> Dict[str, int]:
+    """
+    The size of the graph under root: its node count, the count of each
+    kind of node and the (approximate) bytes they take up, including their
+    operand tuples and caches.
+    """
+    nodes = root.collect_ascending_deps(include_uniforms=True)
+    result = {'nodes': len(nodes)}
+    parts = {}
+    for n in nodes:
+        kind = type(n).__name__
+        result[kind] = result.get(kind, 0) + 1
+        node_parts = [n, n.dependencies, n.uniform_dependencies]
+        if n._ascending_deps is not None:
+            node_parts.append(n._ascending_deps)
+        for part in node_parts:
+            parts[id(part)] = sys.getsizeof(part)
+    result['bytes'] = sum(parts.values())
+    return result
+
+
+@contextlib.contextmanager
+def collect_reports():
+    """
+    Collects the report of each shader declared within the context (see
+    record_report), keyed by the shader's name.
+    """
+    reports = {}  # type: Dict[str, Dict[str, int]]
+    _collectors.append(reports)
+    try:
+        yield reports
+    finally:
+        _collectors.pop()
+
+
+def record_report(name: str, final_value: Idpression):
+    """Adds the shader's report to the innermost collect_reports context."""
+    if _collectors:
+        _collectors[-1][name] = shader_report(final_value)
+
+
+def diff_reports(old: Dict[str, Dict[str, Dict[str, int]]],
+                 new: Dict[str, Dict[str, Dict[str, int]]]) -> List[str]:
+    """
+    Describes the differences between two build reports (the reports of the
+    shaders of each module), one line per changed, added or removed shader.
+    """
+    lines = []
+    for module in sorted(set(old) | set(new)):
+        old_shaders = old.get(module, {})
+        new_shaders = new.get(module, {})
+        for name in sorted(set(old_shaders) | set(new_shaders)):
+            if name not in new_shaders:
+                lines.append('{}: {} removed'.format(module, name))
+            elif name not in old_shaders:
+                lines.append('{}: {} added'.format(module, name))
+            else:
+                a, b = old_shaders[name], new_shaders[name]
+                changes = ['{} {} -> {}'.format(k, a.get(k), b.get(k))
+                           for k in MEASURES
+                           if a.get(k) != b.get(k)]
+                if changes:
+                    lines.append('{}: {}: {}'.format(module,
+                                                     name,
+                                                     ', '.join(changes)))
+    return lines
+
+
+def is_regression(old: Dict[str, Dict[str, Dict[str, int]]],
+                  new: Dict[str, Dict[str, Dict[str, int]]]) -> bool:
+    """Determines if any measure of a shader in both reports went up."""
+    return any(new[module][name][k] > old[module][name][k]
+               for module in set(old) & set(new)
+               for name in set(old[module]) & set(new[module])
+               for k in MEASURES
+               if k in old[module][name] and k in new[module][name])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares the shader reports of two builds, exiting '
+                    'with status 1 if any measure went up.')
+    parser.add_argument('old')
+    parser.add_argument('new')
+    args = parser.parse_args()
+    with open(args.old, encoding='utf8') as f:
+        old = json.load(f)
+    with open(args.new, encoding='utf8') as f:
+        new = json.load(f)
+    lines = diff_reports(old, new)
+    print('\n'.join(lines) if lines else 'No differences.')
+    sys.exit(1 if is_regression(old, new) else 0)
+
+
+if __name__ == '__main__':
+    main()
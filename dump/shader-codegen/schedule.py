@@ -0,0 +1,265 @@
+from typing import Dict, List, Set
+from idpression import Idpression, Matcher, Reduce
+import tex
+
+# Rough relative costs of computing values, used to decide when computing a
+# match clause's result behind an if statement pays for the branch.
+_STATEMENT_COST = 1
+_FETCH_COST = 8
+_BRANCH_COST = 4
+# A guess at how many times loops run.
+_LOOP_ITERATIONS = 8
+
+
+def _cost(node: Idpression) -> int:
+    if isinstance(node, (tex.Tex, tex.TexSlice, tex.TexLayerFetch)):
+        return _FETCH_COST
+    if isinstance(node, Reduce):
+        return _LOOP_ITERATIONS * sum(_cost(e) for e in node.inner)
+    return _STATEMENT_COST
+
+
+class Schedule(object):
+    """
+    Decides how the statements computing a shader's output are arranged.
+
+    Statements are placed just before their first use, so that fewer values
+    are alive at once. Values used once are inlined into the expression
+    using them instead of getting a variable, when that doesn't keep their
+    operands alive for longer (i.e. when no statement separates them from
+    their use) or when it lets a match only compute them when needed. When
+    a match clause's result needs expensive computations (e.g. texture
+    reads) that nothing else needs, the match becomes an if statement doing
+    them only when the clause is taken.
+    """
+
+    def __init__(self, root: Idpression):
+        self.root = root
+        self.nodes = root.collect_ascending_deps(include_uniforms=False)
+        self.consumers = {n: [] for n in self.nodes}
+        for n in self.nodes:
+            for d in n.dependencies:
+                self.consumers[d].append(n)
+        # The output.
+        self.consumers[root].append(None)
+
+        self.formulas = {n for n in self.nodes if n.formula() is not None}
+        self.candidates = {n for n in self.nodes if self._can_inline(n)}
+
+        # The nodes computed inside each clause of guarded matches, listed
+        # in the order of the match's results (the else result last).
+        self.guarded = {}  # type: Dict[Matcher, List[Set[Idpression]]]
+        for n in self.nodes:
+            if isinstance(n, Matcher):
+                results = [r for _, r in n.clauses] + [n.else_result]
+                exclusives = [self._exclusive(n, r) for r in results]
+                if any(self._eager_cost(n, r, e) > _BRANCH_COST
+                       for r, e in zip(results, exclusives)):
+                    self.guarded[n] = exclusives
+
+        # Values only computed when the matches using them need them.
+        self.inlined = set()
+        for n in reversed(self.nodes):
+            if n in self.candidates:
+                consumer = self.consumers[n][0]
+                if ((isinstance(consumer, Matcher) and
+                        consumer not in self.guarded) or
+                        consumer in self.inlined):
+                    self.inlined.add(n)
+        self._inline_adjacent(set(self.nodes))
+
+    def _can_inline(self, node: Idpression) -> bool:
+        if (isinstance(node, Matcher) or
+                type(node).declaration_lines is not
+                Idpression.declaration_lines or
+                node not in self.formulas):
+            return False
+        consumers = self.consumers[node]
+        # Values used inside a loop are computed once, before it.
+        return len(consumers) == 1 and not isinstance(consumers[0], Reduce)
+
+    def _exclusive(self, matcher: Matcher,
+                   result: Idpression) -> Set[Idpression]:
+        """The nodes only needed to compute the given result of a match."""
+        consumers = self.consumers[result]
+        if len(consumers) != 1 or consumers[0] is not matcher:
+            return set()
+        exclusive = {result}
+        for n in reversed(result.collect_ascending_deps(
+                include_uniforms=False)):
+            if all(c in exclusive for c in self.consumers[n]):
+                exclusive.add(n)
+        return exclusive
+
+    def _eager_cost(self,
+                    matcher: Matcher,
+                    result: Idpression,
+                    exclusive: Set[Idpression]) -> int:
+        """
+        The cost of the computations only needed by the given result that
+        are done whether or not its clause is taken. Results inlined into
+        the match are already only computed when needed.
+        """
+        lazy = set()
+        for n in reversed(result.collect_ascending_deps(
+                include_uniforms=False)):
+            if n in self.candidates and n in exclusive:
+                consumer = self.consumers[n][0]
+                if consumer is matcher or consumer in lazy:
+                    lazy.add(n)
+        return sum(_cost(n) for n in exclusive if n not in lazy)
+
+    def _operands(self, node: Idpression) -> List[Idpression]:
+        """The values that must be computed before the node's statements."""
+        if node not in self.guarded:
+            return list(node.dependencies)
+        exclusives = self.guarded[node]
+        inside = set().union(*exclusives)
+        result = [d for d in node.dependencies if d not in inside]
+        for exclusive in exclusives:
+            # Listed in a fixed order, so that the output is deterministic.
+            for n in self.nodes:
+                if n in exclusive:
+                    result.extend(d
+                                  for d in n.dependencies
+                                  if d not in exclusive)
+        return result
+
+    def _order(self, members: Set[Idpression]) -> List[Idpression]:
+        """
+        The given nodes, each placed after its operands but otherwise as late
+        as possible (right before its first use). Values that may be inlined
+        are computed last, so that they end up next to their use.
+        """
+        pending = {n: 0 for n in members}
+        for n in members:
+            for d in self._operands(n):
+                if d in pending:
+                    pending[d] += 1
+        ready = [n for n in self.nodes if n in members and not pending[n]]
+        result = []
+        while ready:
+            n = ready.pop()
+            result.append(n)
+            for d in sorted(self._operands(n),
+                            key=lambda d: d in self.candidates):
+                if d in pending:
+                    pending[d] -= 1
+                    if not pending[d]:
+                        ready.append(d)
+        result.reverse()
+        return result
+
+    def _block_order(self, members: Set[Idpression]) -> List[Idpression]:
+        # Nodes computed inside guarded matches are emitted by the match.
+        for n in list(members):
+            if n in self.guarded:
+                for exclusive in self.guarded[n]:
+                    members = members - exclusive
+        return self._order(members)
+
+    def _inline_adjacent(self, members: Set[Idpression]):
+        """Inlines the values that no statement separates from their use."""
+        order = self._block_order(members)
+        positions = {n: i for i, n in enumerate(order)}
+        next_statement = len(order)
+        for i in reversed(range(len(order))):
+            n = order[i]
+            if n in self.candidates and n not in self.inlined:
+                # Values used outside of the block are used at its end.
+                use = positions.get(self.consumers[n][0], len(order))
+                if next_statement >= use:
+                    self.inlined.add(n)
+            if self._is_statement(n):
+                next_statement = i
+        for n in order:
+            for exclusive in self.guarded.get(n, []):
+                self._inline_adjacent(exclusive)
+
+    def _is_statement(self, node: Idpression) -> bool:
+        """Determines if the node gets its own statements (and variable)."""
+        if node in self.guarded or isinstance(node, Reduce):
+            return True
+        return node in self.formulas and node not in self.inlined
+
+    def _variables_read(self, node: Idpression) -> Set[Idpression]:
+        """The variables read by an expression using the node's value."""
+        if self._is_statement(node):
+            return {node}
+        if node not in self.inlined:
+            return set()
+        return set().union(*[self._variables_read(d)
+                             for d in node.dependencies])
+
+    def _block_lines(self, members: Set[Idpression]) -> List[str]:
+        lines = []
+        for n in self._block_order(members):
+            if n in self.guarded:
+                lines.extend(self._guarded_lines(n))
+            elif n not in self.inlined:
+                lines.extend(n.declaration_lines())
+        return lines
+
+    def _guarded_lines(self, matcher: Matcher) -> List[str]:
+        def clause_lines(result, exclusive):
+            body = self._block_lines(exclusive) + [
+                '{} = {};'.format(matcher.var_name, result.var_name)]
+            return ['    ' + line for line in body]
+
+        exclusives = self.guarded[matcher]
+        lines = ['{} {};'.format(matcher.val_type.gl_name, matcher.var_name)]
+        for i, (condition, result) in enumerate(matcher.clauses):
+            lines.append('{}if ({}) {{'.format('} else ' if i else '',
+                                               condition.var_name))
+            lines.extend(clause_lines(result, exclusives[i]))
+        lines.append('} else {')
+        lines.extend(clause_lines(matcher.else_result, exclusives[-1]))
+        lines.append('}')
+        return lines
+
+    def peak_live(self) -> int:
+        """
+        The most variables that are alive at once (declared and read again
+        later) while computing the output, a proxy for register pressure.
+        """
+        defined = {}  # type: Dict[Idpression, int]
+        last_read = {}  # type: Dict[Idpression, int]
+        step = 0
+
+        def read(node: Idpression):
+            for v in self._variables_read(node):
+                last_read[v] = step
+
+        def visit(members: Set[Idpression]):
+            nonlocal step
+            for n in self._block_order(members):
+                if not self._is_statement(n):
+                    continue
+                step += 1
+                if n in self.guarded:
+                    for condition, _ in n.clauses:
+                        read(condition)
+                    results = [r for _, r in n.clauses] + [n.else_result]
+                    for result, exclusive in zip(results, self.guarded[n]):
+                        visit(exclusive)
+                        step += 1
+                        read(result)
+                else:
+                    for d in n.dependencies:
+                        read(d)
+                defined[n] = step
+
+        visit(set(self.nodes))
+        step += 1
+        read(self.root)
+        return max([sum(1
+                        for v, d in defined.items()
+                        if d <= i < last_read.get(v, d))
+                    for i in range(step + 1)] or [0])
+
+    def lines(self) -> List[str]:
+        """
+        The statements computing the output's value. Must be called within
+        local_variable_names(root, inlined).
+        """
+        return self._block_lines(set(self.nodes))
@@ -1,22 +1,32 @@
-from idpression import Idpression, Literal, Int32
+from typing import Dict, List, Optional, Sequence, Tuple
+from idpression import (
+    Idpression,
+    Uniform,
+    UniformTexSize,
+    local_variable_names,
+)
+from simplify import simplify, specialize
+import footprint
+import graphs
+import report
+import schedule
+import tiling
 import re
 
 
 def generate_shader(final_value: Idpression):
-    deps = final_value.collect_ascending_deps(include_uniforms=False)
+    plan = schedule.Schedule(final_value)
+    with local_variable_names(final_value, plan.inlined):
+        return _generate_shader(final_value, plan)
+
+
+def _generate_shader(final_value: Idpression, plan: 'schedule.Schedule'):
     uniform_deps = final_value.collect_ascending_deps(include_uniforms=True)
 
     uniform_lines = []
-    init_lines = []
     for dep in uniform_deps:
         uniform_lines.extend(dep.uniform_lines())
-    for dep in deps:
-        f = dep.formula()
-        if f is not None:
-            init_lines.append('{} {} = {};'.format(
-                dep.val_type.gl_name,
-                dep.var_name,
-                f))
+    init_lines = plan.lines()
 
     uniform_block = '\n        '.join(line for line in uniform_lines if line)
     init_block = '\n            '.join(line for line in init_lines if line)
@@ -25,7 +35,7 @@ def generate_shader(final_value: Idpression):
         precision highp float;
         precision highp int;
         {}
-        out float outColor;
+        out {} outColor;
         void main() {{
             int x = int(gl_FragCoord.x);
             int y = int(gl_FragCoord.y);
@@ -33,35 +43,262 @@ def generate_shader(final_value: Idpression):
             outColor = {};
         }}""".format(
             uniform_block,
+            final_value.val_type.out_gl_name,
             init_block,
             final_value.val_type.to_out(final_value.var_name))
 
     indented = '\n'.join(code.split('\n        '))
-    cleaned = re.sub(r'([ \(*+\-!])\(([a-zA-Z_0-9]+)\)', r'\1\2', indented)
+    while True:
+        cleaned = _remove_redundant_brackets(indented)
+        if cleaned == indented:
+            return cleaned
+        indented = cleaned
 
-    return cleaned
 
+def _remove_redundant_brackets(code: str) -> str:
+    """
+    Removes the brackets formulas put around their operands (and inlined
+    values) when they only contain a name, a function call or another
+    bracketed expression.
+    """
+    closing = {}
+    stack = []
+    for i, c in enumerate(code):
+        if c == '(':
+            stack.append(i)
+        elif c == ')':
+            closing[stack.pop()] = i
 
-def generate_shader_construction(name: str,
-                                 final_value: Idpression):
-    shader_source = generate_shader(final_value).replace('\n', '\n    ')
+    dropped = set()
+    for i, j in closing.items():
+        if i > 0 and re.match(r'[a-zA-Z_0-9]', code[i - 1]):
+            # A function call.
+            continue
+        if re.search(r'\b(if|for|while) $', code[max(0, i - 6):i]):
+            # The brackets of a statement.
+            continue
+        inside = code[i + 1:j]
+        call = re.match(r'[a-zA-Z_][a-zA-Z_0-9]*\(', inside)
+        if (re.fullmatch(r'[a-zA-Z_0-9.]+', inside) or
+                (call is not None and closing[i + call.end()] == j - 1) or
+                (inside.startswith('(') and closing[i + 1] == j - 1)):
+            dropped.add(i)
+            dropped.add(j)
+    return ''.join(c for i, c in enumerate(code) if i not in dropped)
+
+
+def shader_arguments(final_value: Idpression,
+                     variants: Sequence[Idpression] = ()
+                     ) -> List[Tuple[str, Idpression]]:
+    """
+    The parameter descriptions of the shader computing final_value, in the
+    order they must be given to withArgs, each paired with the node (uniform
+    or texture) that the argument is for. Texture parameters also set the
+    size uniforms used by the given variants of the shader.
+    """
     uniform_deps = final_value.collect_ascending_deps(include_uniforms=True)
-    uniform_args = sorted([
-        ',\n    ' + b
-        for e in uniform_deps
-        for b in e.uniform_args()
-    ])
+    declared = set(uniform_deps)
+    for variant in variants:
+        declared.update(variant.collect_ascending_deps(include_uniforms=True))
+    return sorted([(b, e)
+                   for e in uniform_deps
+                   for b in e.uniform_args(declared)],
+                  key=lambda pair: pair[0])
+
+
+def generate_shader_declaration(
+        name: str,
+        final_value: Idpression,
+        arguments: List[Tuple[str, Idpression]] = None) -> str:
+    """
+    The declaration of a ParametrizedShader computing final_value, taking the
+    given arguments (by default, the ones final_value uses).
+    """
+    shader_source = generate_shader(final_value).replace('\n', '\n    ')
+    report.record_report(name, final_value)
+    if arguments is None:
+        arguments = shader_arguments(final_value)
+    uniform_args = [',\n    ' + b for b, _ in arguments]
+    return 'let {} = new ParametrizedShader(`{}`{});'.format(
+        name,
+        shader_source,
+        ''.join(uniform_args))
+
+
+def _js_value(value) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, tuple):
+        return '[{}]'.format(', '.join(_js_value(e) for e in value))
+    return repr(value)
+
+
+def variant_name(name: str, values: Dict[str, object]) -> str:
+    """The name of the variant of a shader specialized to the given values."""
+    def text(value) -> str:
+        if isinstance(value, tuple):
+            return 'x'.join(text(e) for e in value)
+        return _js_value(value)
+
+    return '_'.join([name] + ['{}{}'.format(k, text(values[k]))
+                              for k in sorted(values)])
+
+
+def _js_values(values: Dict[str, object]) -> str:
+    return '{{{}}}'.format(', '.join('{}: {}'.format(k, _js_value(values[k]))
+                                     for k in sorted(values)))
+
+
+def shader_specializations(final_value: Idpression,
+                           specializations: Sequence[Dict[str, object]]
+                           ) -> List[Dict[str, object]]:
+    """
+    The given specializations restricted to the uniforms final_value takes,
+    without duplicates or ones that fix nothing.
+    """
+    names = {e.var_name
+             for _, e in shader_arguments(final_value)
+             if isinstance(e, Uniform) and not isinstance(e, UniformTexSize)}
+    result = []
+    for values in specializations:
+        values = {k: v for k, v in values.items() if k in names}
+        if values and values not in result:
+            result.append(values)
+    return result
+
+
+def generate_variant_declarations(
+        name: str,
+        final_value: Idpression,
+        specializations: Sequence[Dict[str, object]],
+        changed: Optional[Tuple[Idpression, 'footprint.Region']] = None,
+        tiled: bool = True
+) -> List[str]:
+    """
+    Declarations of the shader computing final_value (for a single shot, see
+    tiling.tile_shots) and of its variants with some uniforms fixed to the
+    given values, followed by the registration of the variants (see
+    pickVariant in ShaderVariants.js). Variants take the same arguments as
+    the shader, ignoring the fixed ones, so that they are interchangeable.
+
+    The shader also gets a variant drawing into layered textures (see
+    tiling.tile_layers), which is used in place of the shader and its other
+    variants when rendering into a layered texture.
+
+    Tiled shaders and their variants get an untiled variant, used when every
+    texture holds a single shot. Specializations that also give every tile
+    size (see tiling.tile_names) get a variant with those tiles fixed, used
+    when the textures have those tile sizes.
+
+    When given the texels that final_value may change in one of its textures
+    (see footprint.changed_region), the shader and its variants register
+    them, so that rendering in place only draws those texels.
+    """
+    if tiled:
+        value = simplify(tiling.tile_shots(final_value))
+        single = simplify(tiling.single_shot(final_value))
+        arguments = shader_arguments(value, [single])
+    else:
+        value = simplify(tiling.single_shot(final_value))
+        arguments = shader_arguments(value)
+    tile_names = tiling.tile_names(final_value)
+    declarations = [generate_shader_declaration(name, value, arguments)]
+    layered = name + 'Layered'
+    declarations.append(generate_shader_declaration(
+        layered,
+        simplify(tiling.tile_layers(value))))
+    registrations = ['registerLayered({}, {});'.format(name, layered)]
+    if changed is not None:
+        registrations.append(
+            footprint.generate_footprint_registration(name, *changed))
+
+    fixed_names = set()
+
+    def add_single_shot(shader_name: str, values: Dict[str, object]):
+        single_name = shader_name + 'SingleShot'
+        declarations.append(generate_shader_declaration(
+            single_name,
+            specialize(single, values),
+            arguments))
+        registrations.append('registerSingleShot({}, {});'.format(
+            shader_name,
+            single_name))
+
+    def add_fixed_tiles(shader_name: str, values: Dict[str, object]):
+        for spec in specializations:
+            if any(spec.get(k) != v for k, v in values.items()):
+                continue
+            tiles = {k: spec[k] for k in tile_names if k in spec}
+            fixed_name = variant_name(shader_name, tiles)
+            if len(tiles) < len(tile_names) or fixed_name in fixed_names:
+                continue
+            fixed_names.add(fixed_name)
+            declarations.append(generate_shader_declaration(
+                fixed_name,
+                specialize(tiling.tile_shots(final_value, tiles), values),
+                arguments))
+            registrations.append('registerVariant({}, {}, {});'.format(
+                shader_name,
+                _js_values(tiles),
+                fixed_name))
+
+    specialized = shader_specializations(value, specializations)
+    if tiled:
+        add_single_shot(name, {})
+        if not specialized:
+            add_fixed_tiles(name, {})
+    for values in specialized:
+        variant = variant_name(name, values)
+        declarations.append(generate_shader_declaration(
+            variant,
+            specialize(value, values),
+            arguments))
+        registrations.append('registerVariant({}, {}, {});'.format(
+            name,
+            _js_values(values),
+            variant))
+        registrations.append('registerLayered({}, {});'.format(variant,
+                                                               layered))
+        if changed is not None:
+            registrations.append(
+                footprint.generate_footprint_registration(variant, *changed))
+        if tiled:
+            add_single_shot(variant, values)
+            add_fixed_tiles(variant, values)
+    declarations.append('\n'.join(registrations))
+    return declarations
+
+
+def variant_imports(declarations: Sequence[str]) -> List[str]:
+    """The imports of the generated code using the given declarations."""
+    names = sorted(set(re.findall(
+        r'\b(register[A-Za-z]*|pickVariant)\(', '\n'.join(declarations))))
+    return ["import {ParametrizedShader} from 'src/sim/Gpu.js'",
+            "import {{{}}} from 'src/sim/ShaderVariants.js'".format(
+                ', '.join(names))]
+
+
+def generate_shader_construction(
+        name: str,
+        final_value: Idpression,
+        tiled: bool = True,
+        specializations: Sequence[Dict[str, object]] = ()):
+    graphs.record_graph(name, final_value)
+    # Tiles don't change which texels of a shot can change.
+    changed = footprint.changed_region(final_value)
+    declarations = generate_variant_declarations(name,
+                                                 final_value,
+                                                 specializations,
+                                                 changed,
+                                                 tiled)
     return """////// AUTO-GENERATED CODE //////
 
-import {{ParametrizedShader}} from 'src/sim/Gpu.js'
+{}
 
-let {} = new ParametrizedShader(`{}`{});
+{}
 
 export {{{}}}""".format(
-        name,
-        shader_source,
-        ''.join(uniform_args),
+        '\n'.join(variant_imports(declarations)),
+        '\n\n'.join(declarations),
         name)
 
-X = Literal('x', val_type=Int32, python_equivalent=None)
-Y = Literal('y', val_type=Int32, python_equivalent=None)
@@ -0,0 +1,81 @@
+from typing import Dict, Tuple
+import numpy as np
+from idpression import (
+    Idpression,
+    Uniform,
+    Bit,
+    UInt32,
+    Float32,
+    PackedBits,
+)
+from tex import Tex
+import graphs
+import interpret
+
+# The values of the generated shaders, shared by the tests checking them.
+GRAPHS = graphs.generator_graphs()
+
+# The (width, height) of each shot of the output and per-shot textures.
+SHOT = (11, 6)
+
+
+def texture_nodes(root: Idpression) -> Dict[str, Tex]:
+    return {t.tex_name(): t
+            for t in root.collect_ascending_deps(include_uniforms=True)
+            if isinstance(t, Tex)}
+
+
+def random_texels(rng: np.random.Generator,
+                  tex: Tex,
+                  shape: Tuple[int, int]) -> np.ndarray:
+    if tex.val_type is PackedBits:
+        return rng.integers(0, 1 << 32, size=shape, dtype=np.uint32)
+    if tex.val_type is Bit:
+        return (rng.random(shape) < 0.5).astype(np.uint8) * 255
+    return rng.integers(0, 256, size=shape, dtype=np.uint8)
+
+
+def random_uniforms(rng: np.random.Generator,
+                    root: Idpression) -> Dict[str, object]:
+    sizes = set()
+    for t in texture_nodes(root).values():
+        sizes.update([t.size, t.tile, t.layer])
+    values = {}
+    for dep in root.collect_ascending_deps(include_uniforms=True):
+        if not isinstance(dep, Uniform) or dep in sizes:
+            continue
+        if dep.val_type.spread_args:
+            values[dep.var_name] = tuple(int(e)
+                                         for e in rng.integers(1, 5, 2))
+        elif dep.val_type is Float32:
+            values[dep.var_name] = float(rng.random())
+        elif dep.val_type is UInt32:
+            values[dep.var_name] = int(rng.integers(0, 1 << 32))
+        elif dep.val_type is Bit:
+            values[dep.var_name] = bool(rng.integers(0, 2))
+        elif dep.var_name.startswith('surface_'):
+            values[dep.var_name] = 3
+        else:
+            values[dep.var_name] = int(rng.integers(0, min(SHOT)))
+    return values
+
+
+def evaluate(root: Idpression, textures, uniforms,
+             shots=(1, 1)) -> np.ndarray:
+    """Evaluates root over the given grid of SHOT sized shots."""
+    cols, rows = shots
+    return interpret.evaluate(root,
+                             SHOT[0] * cols,
+                             SHOT[1] * rows,
+                             textures,
+                             uniforms,
+                             shots)
+
+
+def random_bindings(name: str, seed: int = 0):
+    """A generated shader's value, with random textures and uniforms."""
+    rng = np.random.default_rng(seed)
+    root = GRAPHS[name]
+    textures = {n: random_texels(rng, t, SHOT[::-1])
+                for n, t in texture_nodes(root).items()}
+    return root, textures, random_uniforms(rng, root)
@@ -0,0 +1,413 @@
+from typing import Dict, Optional, Tuple
+import struct
+from idpression import (
+    Idpression,
+    Literal,
+    Uniform,
+    UniformTexSize,
+    UnaryOp,
+    FuncOp,
+    BinaryOp,
+    Matcher,
+    Bit,
+    Int32,
+    UInt32,
+    Float32,
+    PackedBits,
+    transform,
+    X,
+    Y,
+)
+import ranges
+
+_UNSIGNED_TYPES = [UInt32, PackedBits]
+_INTEGER_TYPES = [Int32, UInt32, PackedBits]
+
+# Dividends below this are divided exactly by multiplying their float by the
+# divisor's (float) reciprocal, see _reciprocal_quotient.
+_MAX_FLOAT_DIVIDEND = (1 << 22) - 1
+
+
+def simplify(root: Idpression) -> Idpression:
+    """
+    Folds literal arithmetic and removes algebraic identities from the graph
+    under root, returning an equivalent (and hopefully smaller) graph.
+    """
+    return transform(root, _simplify_to_fixed_point)
+
+
+def specialize(root: Idpression,
+               values: Dict[str, object]) -> Idpression:
+    """
+    The graph under root with the named uniforms replaced by the given
+    values, simplified.
+    """
+    def rewrite(node: Idpression) -> Idpression:
+        if (isinstance(node, Uniform) and
+                not isinstance(node, UniformTexSize) and
+                node.var_name in values):
+            return Literal.of(node.val_type, values[node.var_name])
+        return node
+
+    return simplify(transform(root, rewrite))
+
+
+def _simplify_to_fixed_point(node: Idpression) -> Idpression:
+    while True:
+        simpler = _simplify_node(node)
+        if simpler is node:
+            return node
+        node = simpler
+
+
+def _simplify_node(node: Idpression) -> Idpression:
+    if isinstance(node, BinaryOp):
+        return _simplify_binary(node)
+    if isinstance(node, UnaryOp):
+        return _simplify_unary(node)
+    if isinstance(node, FuncOp):
+        return _simplify_func(node)
+    if isinstance(node, Matcher):
+        return _simplify_matcher(node)
+    return node
+
+
+def literal_value(node: Idpression):
+    """The python value of a literal node, or None if it isn't constant."""
+    if not isinstance(node, Literal) or node.python_equivalent is None:
+        return None
+    if node.val_type is Bit:
+        return bool(node.python_equivalent)
+    return node.python_equivalent
+
+
+def is_non_negative(node: Idpression) -> bool:
+    """Conservatively determines if an integer value can't be negative."""
+    if (node is X or
+            node is Y or
+            node.val_type in _UNSIGNED_TYPES):
+        return True
+    r = ranges.value_range(node)
+    if r is not None:
+        return r[0] >= 0
+    v = literal_value(node)
+    if v is not None:
+        return v >= 0
+    if isinstance(node, FuncOp):
+        return node.op_name == 'int' and node.vals[0].val_type is Bit
+    if isinstance(node, BinaryOp):
+        if node.op_char == '&':
+            return is_non_negative(node.lhs) or is_non_negative(node.rhs)
+        if node.op_char == '>>':
+            return is_non_negative(node.lhs)
+        if node.op_char in ['|', '^', '+', '*', '/', '%']:
+            return is_non_negative(node.lhs) and is_non_negative(node.rhs)
+    if isinstance(node, Matcher):
+        return (all(is_non_negative(b) for _, b in node.clauses) and
+                is_non_negative(node.else_result))
+    return False
+
+
+def _wrap_int(val_type, value: int) -> int:
+    if val_type in _UNSIGNED_TYPES:
+        return value & 0xFFFFFFFF
+    return ((value + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+def _fold(node: BinaryOp, a, b) -> Optional[Literal]:
+    op = node.op_char
+    out = node.val_type
+    arg_type = node.lhs.val_type
+    if op in ['==', '!=', '<', '>', '<=', '>=']:
+        return Literal.of(Bit, {
+            '==': a == b,
+            '!=': a != b,
+            '<': a < b,
+            '>': a > b,
+            '<=': a <= b,
+            '>=': a >= b,
+        }[op])
+    if arg_type is Bit:
+        if op not in ['&&', '||']:
+            return None
+        return Literal.of(Bit, (a and b) if op == '&&' else (a or b))
+    if arg_type is Float32:
+        if op not in ['+', '-', '*', '/'] or (op == '/' and b == 0):
+            return None
+        return Literal.of(Float32, {
+            '+': lambda: a + b,
+            '-': lambda: a - b,
+            '*': lambda: a * b,
+            '/': lambda: a / b,
+        }[op]())
+
+    if op == '/':
+        if b == 0:
+            return None
+        # GLSL integer division truncates towards zero.
+        q = abs(a) // abs(b)
+        if (a < 0) != (b < 0):
+            q = -q
+        return Literal.of(out, _wrap_int(out, q))
+    if op == '%':
+        # Only defined by GLSL for non-negative operands.
+        if a < 0 or b <= 0:
+            return None
+        return Literal.of(out, a % b)
+    if op in ['<<', '>>']:
+        if not 0 <= b < 32:
+            return None
+        shifted = a << b if op == '<<' else a >> b
+        return Literal.of(out, _wrap_int(out, shifted))
+    if op not in ['+', '-', '*', '&', '|', '^']:
+        return None
+    return Literal.of(out, _wrap_int(out, {
+        '+': lambda: a + b,
+        '-': lambda: a - b,
+        '*': lambda: a * b,
+        '&': lambda: a & b,
+        '|': lambda: a | b,
+        '^': lambda: a ^ b,
+    }[op]()))
+
+
+def _power_of_two_exponent(value) -> Optional[int]:
+    if isinstance(value, bool) or not isinstance(value, int):
+        return None
+    if value <= 0 or value & (value - 1):
+        return None
+    return value.bit_length() - 1
+
+
+def _magic_divisor(divisor: int,
+                   max_dividend: int) -> Optional[Tuple[int, int]]:
+    """
+    A multiplier m and shift s such that (a * m) >> s == a / divisor for all
+    0 <= a <= max_dividend, without overflowing an Int32, if there is one.
+    """
+    for shift in range(32):
+        m = (1 << shift) // divisor + 1
+        # The rounding error stays below one quotient step.
+        error = m * divisor - (1 << shift)
+        if max_dividend * m >= 1 << 31:
+            return None
+        if max_dividend * error < 1 << shift:
+            return m, shift
+    return None
+
+
+def _reciprocal_quotient(dividend: Idpression, divisor: int) -> Idpression:
+    """
+    The quotient of a non-negative dividend of at most _MAX_FLOAT_DIVIDEND,
+    for divisors without a magic multiplier (see _magic_divisor).
+
+    Adding a half keeps the exact quotient at least half the reciprocal away
+    from whole numbers, further than the rounding errors of the reciprocal
+    and of the product can move it.
+    """
+    reciprocal = struct.unpack('f', struct.pack('f', 1 / divisor))[0]
+    return ((dividend.float() + 0.5) * Literal.of(Float32, reciprocal)).int()
+
+
+def _simplify_binary(node: BinaryOp) -> Idpression:
+    op = node.op_char
+    lhs, rhs = node.lhs, node.rhs
+    a, b = literal_value(lhs), literal_value(rhs)
+    if a is not None and b is not None:
+        folded = _fold(node, a, b)
+        if folded is not None:
+            return folded
+
+    if lhs.val_type is Bit:
+        # Bits use '!=' for xor and '&&'/'||' for and/or.
+        for x, c in [(lhs, b), (rhs, a)]:
+            if c is None:
+                continue
+            if op == '&&':
+                return x if c else Literal.of(Bit, False)
+            if op == '||':
+                return Literal.of(Bit, True) if c else x
+            if op == '!=':
+                return ~x if c else x
+            if op == '==':
+                return x if c else ~x
+        if lhs is rhs and op in ['&&', '||']:
+            return lhs
+        if lhs is rhs and op in ['==', '!=']:
+            return Literal.of(Bit, op == '==')
+        return node
+
+    if lhs.val_type not in _INTEGER_TYPES:
+        return node
+
+    # Comparisons and arithmetic decided by the operands' value ranges.
+    if op in ['==', '!=', '<', '>', '<=', '>=']:
+        c = ranges.compare(op, lhs, rhs)
+        if c is not None:
+            return Literal.of(Bit, c)
+    lhs_range, rhs_range = ranges.value_range(lhs), ranges.value_range(rhs)
+    if (op in ['%', '/'] and
+            lhs_range is not None and
+            rhs_range is not None and
+            0 <= lhs_range[0] and lhs_range[1] < rhs_range[0]):
+        return lhs if op == '%' else Literal.of(node.val_type, 0)
+
+    # Identities with a literal on the right.
+    if b is not None:
+        if b == 0 and op in ['+', '-', '|', '^', '<<', '>>']:
+            return lhs
+        if b == 0 and op in ['*', '&']:
+            return rhs
+        if b == 1 and op in ['*', '/']:
+            return lhs
+        if _wrap_int(node.val_type, b) == _wrap_int(node.val_type, -1):
+            if op == '&':
+                return lhs
+            if op == '|':
+                return rhs
+
+        k = _power_of_two_exponent(b)
+        if k is not None and is_non_negative(lhs):
+            if op == '%':
+                return lhs & Literal.of(node.val_type, b - 1)
+            if op == '/':
+                return lhs >> k
+
+        # Division by other constants, as a multiply and a shift.
+        if (op in ['/', '%'] and
+                node.val_type is Int32 and
+                b > 1 and
+                lhs_range is not None and
+                lhs_range[0] >= 0):
+            magic = _magic_divisor(b, lhs_range[1])
+            if magic is not None:
+                m, shift = magic
+                quotient = (lhs * m) >> shift
+            elif lhs_range[1] <= _MAX_FLOAT_DIVIDEND:
+                quotient = _reciprocal_quotient(lhs, b)
+            else:
+                quotient = None
+            if quotient is not None:
+                # Keep the ranges the division had.
+                ranges.narrow_range(quotient, (lhs_range[0] // b,
+                                               lhs_range[1] // b))
+                if op == '%':
+                    remainder = lhs - quotient * b
+                    ranges.narrow_range(remainder,
+                                        (0, min(lhs_range[1], b - 1)))
+                    return remainder
+                return quotient
+
+    # Identities with a literal on the left.
+    if a is not None:
+        if a == 0 and op in ['+', '|', '^']:
+            return rhs
+        if a == 0 and op in ['*', '&', '<<', '>>']:
+            return lhs
+        if a == 1 and op == '*':
+            return rhs
+
+    if lhs is rhs:
+        if op in ['&', '|']:
+            return lhs
+        if op in ['^', '-']:
+            return Literal.of(node.val_type, 0)
+        if op in ['==', '<=', '>=']:
+            return Literal.of(Bit, True)
+        if op in ['!=', '<', '>']:
+            return Literal.of(Bit, False)
+
+    return node
+
+
+def _simplify_unary(node: UnaryOp) -> Idpression:
+    v = literal_value(node.val)
+    if v is not None:
+        if node.op_char == '!':
+            return Literal.of(Bit, not v)
+        if node.op_char == '~' and node.val_type in _INTEGER_TYPES:
+            return Literal.of(node.val_type, _wrap_int(node.val_type, ~v))
+        if node.op_char == '-' and node.val_type is Float32:
+            return Literal.of(Float32, -v)
+        if node.op_char == '-':
+            return Literal.of(node.val_type, _wrap_int(node.val_type, -v))
+
+    # Double negation.
+    if (isinstance(node.val, UnaryOp) and
+            node.val.op_char == node.op_char):
+        return node.val.val
+
+    return node
+
+
+def _simplify_func(node: FuncOp) -> Idpression:
+    if node.op_name == 'clamp':
+        v, low, high = [literal_value(e) for e in node.vals]
+        if v is not None and v == low:
+            # Clamping to an empty range isn't meaningful anyway.
+            return node.vals[0]
+        if v is not None and low is not None and high is not None:
+            return node.vals[0] if low <= v <= high else node
+        v, low, high = [ranges.value_range(e) for e in node.vals]
+        if (v is not None and low is not None and high is not None and
+                low[1] <= v[0] and v[1] <= high[0]):
+            return node.vals[0]
+        return node
+    if len(node.vals) != 1:
+        return node
+    val = node.vals[0]
+
+    # Conversions to the type the value already has.
+    if val.val_type is node.val_type and node.op_name in ['bool',
+                                                          'int',
+                                                          'uint',
+                                                          'float']:
+        return val
+
+    v = literal_value(val)
+    if v is None:
+        return node
+    if node.op_name == 'bool':
+        return Literal.of(Bit, v != 0)
+    if node.op_name in ['int', 'uint'] and val.val_type is not Float32:
+        return Literal.of(node.val_type, _wrap_int(node.val_type, int(v)))
+    if node.op_name in ['int', 'uint'] and (
+            -0x80000000 < v < 0x80000000 if node.op_name == 'int' else
+            0 <= v < 0x100000000):
+        # Floats convert by truncating, when they fit.
+        return Literal.of(node.val_type, int(v))
+    if node.op_name == 'float':
+        return Literal.of(Float32, float(v))
+    return node
+
+
+def _simplify_matcher(node: Matcher) -> Idpression:
+    clauses = []
+    else_result = node.else_result
+    for condition, result in node.clauses:
+        c = literal_value(condition)
+        if c is not None and not c:
+            continue
+        if c is not None:
+            else_result = result
+            break
+        if clauses and clauses[-1][1] is result:
+            # Adjacent clauses with identical results.
+            clauses[-1] = (clauses[-1][0] | condition, result)
+            continue
+        clauses.append((condition, result))
+
+    # Trailing clauses that produce the fallback value anyway.
+    while clauses and clauses[-1][1] is else_result:
+        clauses.pop()
+
+    if not clauses:
+        return else_result
+
+    if len(clauses) == 1 and else_result.val_type is Bit:
+        condition, result = clauses[0]
+        t, e = literal_value(result), literal_value(else_result)
+        if t is not None and e is not None:
+            return condition if t else ~condition
+
+    return Matcher(clauses, else_result)
@@ -0,0 +1,267 @@
+import math
+import os
+import subprocess
+import sys
+import numpy as np
+from idpression import (
+    Idpression,
+    Literal,
+    Uniform,
+    BinaryOp,
+    Matcher,
+    Bit,
+    Int32,
+    X,
+    Y,
+)
+from simplify import (
+    simplify,
+    specialize,
+    literal_value,
+    _magic_divisor,
+    _reciprocal_quotient,
+    _MAX_FLOAT_DIVIDEND,
+)
+import interpret
+
+# Fragment coordinates cover every non-negative 16 bit value in one row.
+_XS = np.arange(1 << 16, dtype=np.int32)
+
+
+def _evaluate(root: Idpression, width: int = 1, uniforms=None) -> np.ndarray:
+    values = interpret.evaluate(root, width, 1, uniforms=uniforms)
+    return np.broadcast_to(values, (1, width))
+
+
+def test_truncating_division_folds():
+    for a in [-7, -6, -1, 0, 1, 6, 7, 2147483647]:
+        for b in [-3, -2, -1, 1, 2, 3]:
+            folded = simplify(Idpression.wrap(a) // b)
+            assert literal_value(folded) == math.trunc(a / b)
+    # Dividing the smallest integer by -1 wraps around.
+    folded = simplify(Idpression.wrap(-2147483648) // -1)
+    assert literal_value(folded) == -2147483648
+    # Division by zero is left to the shader.
+    assert isinstance(simplify(Idpression.wrap(5) // 0), BinaryOp)
+
+
+def test_remainder_folds_only_non_negative_operands():
+    assert literal_value(simplify(Idpression.wrap(7) % 3)) == 1
+    assert literal_value(simplify(Idpression.wrap(0) % 5)) == 0
+    for a, b in [(-7, 3), (7, -3), (-7, -3), (7, 0)]:
+        assert isinstance(simplify(Idpression.wrap(a) % b), BinaryOp)
+
+
+def test_power_of_two_division_becomes_shift():
+    x = X
+    quotient = simplify(x // 8)
+    remainder = simplify(x % 8)
+    assert isinstance(quotient, BinaryOp) and quotient.op_char == '>>'
+    assert isinstance(remainder, BinaryOp) and remainder.op_char == '&'
+    np.testing.assert_array_equal(_evaluate(quotient, 1 << 16)[0], _XS // 8)
+    np.testing.assert_array_equal(_evaluate(remainder, 1 << 16)[0], _XS % 8)
+
+    # Possibly negative values round differently when shifted.
+    signed = Uniform(Int32, 'signed_dividend')
+    assert simplify(signed // 8).op_char == '/'
+    assert simplify(signed % 8).op_char == '%'
+
+
+def test_magic_divisor():
+    for max_dividend in [1, 100, 1000, 20000]:
+        dividends = np.arange(max_dividend + 1, dtype=np.int64)
+        for divisor in range(2, 300):
+            magic = _magic_divisor(divisor, max_dividend)
+            if magic is None:
+                continue
+            m, shift = magic
+            assert max_dividend * m < 1 << 31
+            np.testing.assert_array_equal((dividends * m) >> shift,
+                                          dividends // divisor)
+
+
+def test_constant_division_matches_interpreter():
+    bounded = Uniform(Int32, 'bounded_dividend', value_range=(0, 5000))
+    for divisor in [3, 5, 7, 10, 25, 50, 81, 162, 169, 338, 1000]:
+        for op in ['/', '%']:
+            raw = bounded // divisor if op == '/' else bounded % divisor
+            simple = simplify(raw)
+            assert not (isinstance(simple, BinaryOp) and
+                        simple.op_char == op), (divisor, op)
+            for a in [0, 1, divisor - 1, divisor, 4999, 5000]:
+                expected = a // divisor if op == '/' else a % divisor
+                values = {'bounded_dividend': a}
+                assert _evaluate(raw, uniforms=values)[0, 0] == expected
+                assert _evaluate(simple, uniforms=values)[0, 0] == expected
+
+
+def test_reciprocal_division_is_exact():
+    # Covers the top of the dividend range, where float32 steps are coarsest.
+    top = _MAX_FLOAT_DIVIDEND + 1 - len(_XS)
+    for divisor in [3, 27, 50, 99, 171, 338, 1000, 65535]:
+        for offset in [0, top]:
+            dividend = X + offset
+            quotient = _evaluate(_reciprocal_quotient(dividend, divisor),
+                                 len(_XS))[0]
+            np.testing.assert_array_equal(quotient,
+                                          (_XS + offset) // divisor,
+                                          err_msg=str((divisor, offset)))
+    # Dividends too large for the magic multiply use the reciprocal.
+    large = Uniform(Int32, 'large_dividend', value_range=(0, 1 << 20))
+    assert _magic_divisor(27, 1 << 20) is None
+    for a in [0, 26, 27, (1 << 20) - 1, 1 << 20]:
+        values = {'large_dividend': a}
+        assert _evaluate(simplify(large // 27), uniforms=values)[0, 0] == (
+            a // 27)
+        assert _evaluate(simplify(large % 27), uniforms=values)[0, 0] == (
+            a % 27)
+
+def test_range_decided_division():
+    small = Uniform(Int32, 'small_dividend', value_range=(0, 6))
+    assert simplify(small % 7) is small
+    assert literal_value(simplify(small // 7)) == 0
+    assert simplify(small % 6) is not small
+
+
+def test_identities():
+    x = X
+    assert simplify(x + 0) is x
+    assert simplify(0 + x) is x
+    assert simplify(x * 1) is x
+    assert literal_value(simplify(x * 0)) == 0
+    assert simplify(x | 0) is x
+    assert simplify(x & -1) is x
+    assert literal_value(simplify(x - x)) == 0
+    assert literal_value(simplify(x ^ x)) == 0
+    assert literal_value(simplify(x <= x)) is True
+    assert literal_value(simplify(x < x)) is False
+
+    bit = Uniform(Bit, 'identity_bit')
+    assert simplify(bit & True) is bit
+    assert literal_value(simplify(bit & False)) is False
+    assert simplify(bit | False) is bit
+    assert simplify((bit != True) != True) is bit
+
+
+def _all_bits(*names):
+    for i in range(1 << len(names)):
+        yield {n: bool(i >> k & 1) for k, n in enumerate(names)}
+
+
+def _assert_same_bits(a: Idpression, b: Idpression, names):
+    for values in _all_bits(*names):
+        assert (_evaluate(a, uniforms=values)[0, 0] ==
+                _evaluate(b, uniforms=values)[0, 0]), values
+
+
+def test_matcher_merges_adjacent_clauses():
+    a, b, c = [Uniform(Bit, 'merge_' + n) for n in 'abc']
+    r1, r2 = Uniform(Int32, 'merge_r1'), Uniform(Int32, 'merge_r2')
+    raw = Matcher([(a, r1), (b, r1), (c, r2)], Literal.of(Int32, 0))
+    simple = simplify(raw)
+    assert isinstance(simple, Matcher)
+    assert len(simple.clauses) == 2
+    for values in _all_bits('merge_a', 'merge_b', 'merge_c'):
+        values.update({'merge_r1': 1, 'merge_r2': 2})
+        assert (_evaluate(raw, uniforms=values)[0, 0] ==
+                _evaluate(simple, uniforms=values)[0, 0]), values
+
+
+def test_matcher_drops_clauses_giving_the_fallback():
+    a, b = Uniform(Bit, 'fallback_a'), Uniform(Bit, 'fallback_b')
+    r, e = Uniform(Int32, 'fallback_r'), Uniform(Int32, 'fallback_e')
+    # The second clause gives the fallback value anyway.
+    simple = simplify(Matcher([(a, r), (b, e)], e))
+    assert isinstance(simple, Matcher)
+    assert len(simple.clauses) == 1
+    # Only clauses after the last differing result can be dropped.
+    kept = simplify(Matcher([(a, e), (b, r)], e))
+    assert isinstance(kept, Matcher) and len(kept.clauses) == 2
+
+
+def test_matcher_literal_conditions():
+    a = Uniform(Bit, 'literal_a')
+    r, e = Uniform(Int32, 'literal_r'), Uniform(Int32, 'literal_e')
+    # A false clause is skipped and a true one ends the matcher.
+    assert simplify(Matcher([(Literal.of(Bit, False), r)], e)) is e
+    assert simplify(Matcher([(Literal.of(Bit, True), r), (a, e)], e)) is r
+    skipped = simplify(Matcher([(Literal.of(Bit, False), e), (a, r)], e))
+    assert isinstance(skipped, Matcher)
+    assert skipped.clauses[0][0] is a
+
+
+def test_matcher_collapses_to_bits():
+    a, b = Uniform(Bit, 'collapse_a'), Uniform(Bit, 'collapse_b')
+    names = ['collapse_a', 'collapse_b']
+    t, f = Literal.of(Bit, True), Literal.of(Bit, False)
+    assert simplify(Matcher([(a, t)], f)) is a
+    negated = Matcher([(a, f)], t)
+    _assert_same_bits(negated, simplify(negated), names)
+    assert not isinstance(simplify(negated), Matcher)
+    merged = Matcher([(a, t), (b, t)], f)
+    assert not isinstance(simplify(merged), Matcher)
+    _assert_same_bits(merged, simplify(merged), names)
+
+
+def test_specialize():
+    n = Uniform(Int32, 'specialized_n')
+    raw = (X // n) * n + X % n
+    fixed = specialize(raw, {'specialized_n': 8})
+    assert not any(isinstance(e, Uniform)
+                   for e in fixed.collect_ascending_deps())
+    np.testing.assert_array_equal(_evaluate(fixed, 1 << 16)[0], _XS)
+
+
+def _random_int(rng: np.random.Generator, depth: int) -> Idpression:
+    if depth == 0 or rng.random() < 0.2:
+        choice = rng.integers(0, 4)
+        if choice == 0:
+            return X
+        if choice == 1:
+            return Y
+        return Idpression.wrap(int(rng.choice([-3, -1, 0, 1, 2, 3, 8, 255])))
+    kind = rng.integers(0, 5)
+    a = _random_int(rng, depth - 1)
+    if kind == 0:
+        return a.clamp(int(rng.integers(-4, 4)), int(rng.integers(4, 300)))
+    if kind == 1:
+        condition = _random_int(rng, depth - 1) < _random_int(rng, depth - 1)
+        return condition.if_then(a).else_end(_random_int(rng, depth - 1))
+    if kind == 2:
+        # Divisors and shift amounts keep to operands GLSL defines.
+        op = rng.choice(['/', '%', '<<', '>>'])
+        if op in ['/', '%']:
+            a = a.clamp(0, 1000)
+            b = int(rng.choice([1, 2, 3, 4, 7, 8, 25]))
+            return a // b if op == '/' else a % b
+        b = int(rng.integers(0, 8))
+        return a << b if op == '<<' else a >> b
+    b = _random_int(rng, depth - 1)
+    op = rng.choice(['+', '-', '*', '&', '|', '^'])
+    return {
+        '+': lambda: a + b,
+        '-': lambda: a - b,
+        '*': lambda: a * b,
+        '&': lambda: a & b,
+        '|': lambda: a | b,
+        '^': lambda: a ^ b,
+    }[op]()
+
+
+def test_random_expressions_match_interpreter():
+    rng = np.random.default_rng(7)
+    for _ in range(300):
+        raw = _random_int(rng, 4)
+        expected = np.broadcast_to(interpret.evaluate(raw, 40, 9), (9, 40))
+        actual = np.broadcast_to(interpret.evaluate(simplify(raw), 40, 9),
+                                 (9, 40))
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_modules_import_on_their_own():
+    # Checked in fresh interpreters, where nothing else was imported first.
+    for module in ['idpression', 'ranges', 'simplify', 'tex', 'tiling',
+                   'footprint', 'shader', 'interpret']:
+        subprocess.run([sys.executable, '-c', 'import ' + module],
+                       check=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
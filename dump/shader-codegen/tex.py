@@ -2,12 +2,18 @@ from typing import Tuple, Union, Dict, List, Optional
 from idpression import (
     Idpression,
     Literal,
+    Int32,
+    intern_key_of,
+    map_slice,
     slice_deps,
     UniformTexSize,
     Byte,
     ShaderType,
+    visit_ascending,
+    X,
+    Y,
+    TextureRead,
 )
-import shader
 
 
 def coalesce_slice(s: Union[slice, Idpression, int]) -> slice:
@@ -35,61 +41,71 @@ def nest_slice(s1: slice, s2: Union[slice, Idpression, int]) -> slice:
     return s1.start + s2 * s1.step
 
 
-class TexSlice(Idpression):
+def is_identity_index(index: Union[slice, Idpression, int]) -> bool:
+    """Determines if an index reads at the fragment's own coordinate."""
+    if not isinstance(index, slice) or index.stop is not None:
+        return False
+    index = coalesce_slice(index)
+    return (isinstance(index.start, int) and index.start == 0 and
+            isinstance(index.step, int) and index.step == 1)
+
+
+def normalize_index(index: Union[slice, Idpression, int],
+                    coord: Idpression) -> Union[slice, Idpression, int]:
+    """Picks a canonical form for an index, so equivalent reads are shared."""
+    if index is coord or is_identity_index(index):
+        return slice(None)
+    if (isinstance(index, Literal) and
+            index.val_type is Int32 and
+            isinstance(index.python_equivalent, int)):
+        return index.python_equivalent
+    return index
+
+
+def index_expression(index: Union[slice, Idpression, int],
+                     coord: Idpression) -> Idpression:
+    """The position an index reads at, given the fragment's coordinate."""
+    if isinstance(index, slice):
+        index = coalesce_slice(index)
+        result = coord
+        if not (isinstance(index.step, int) and index.step == 1):
+            result = result * index.step
+        if not (isinstance(index.start, int) and index.start == 0):
+            result = result + index.start
+        return result
+    return Idpression.wrap(index)
+
+
+class TexSlice(TextureRead):
+    __slots__ = ('tex', 'x_slice', 'y_slice')
+
     def __init__(self, tex: 'Tex', x_slice: slice, y_slice: slice):
         super().__init__(
             'slice',
             val_type=tex.val_type,
-            dependencies=[tex.size] + slice_deps(x_slice) + slice_deps(y_slice),
+            dependencies=slice_deps(x_slice) + slice_deps(y_slice),
             uniform_dependencies=[tex])
         self.tex = tex
         self.x_slice = x_slice
         self.y_slice = y_slice
 
+    def intern_key(self):
+        return (type(self),
+                intern_key_of(self.tex),
+                intern_key_of(self.x_slice),
+                intern_key_of(self.y_slice))
+
+    def map_operands(self, func):
+        return self.tex[map_slice(self.x_slice, func),
+                        map_slice(self.y_slice, func)]
+
     def __getitem__(self, item):
         x_slice, y_slice = item
-        return TexSlice(
-            self.tex,
-            nest_slice(self.x_slice, x_slice),
-            nest_slice(self.y_slice, y_slice))
+        return self.tex[nest_index(self.x_slice, x_slice),
+                        nest_index(self.y_slice, y_slice)]
 
     def formula(self):
-        read_expression = 'texture(({}), vec2({}) / ({}))'.format(
-            self.tex.tex_name(),
-            self.indices_to_formula(
-                [self.x_slice, self.y_slice],
-                ['x', 'y'],
-                ['gl_FragCoord.x', 'gl_FragCoord.y']),
-            self.tex.size.var_name)
-        return self.val_type.from_in(read_expression)
-
-    @staticmethod
-    def indices_to_formula(indices, var_labels, var_raws):
-        if len(indices) != len(var_labels):
-            raise NotImplementedError()
-        parts = [
-            TexSlice.index_to_formula(index, label, raw)
-            for index, label, raw in zip(indices, var_labels, var_raws)
-        ]
-        return ', '.join(parts)
-
-    @staticmethod
-    def index_to_formula(index: Union[int, slice, Idpression],
-                         compute_var: str='x',
-                         raw_var: str='gl_FragCoord.x'):
-        if index is shader.X:
-            return 'gl_FragCoord.x'
-        if index is shader.Y:
-            return 'gl_FragCoord.y'
-        if isinstance(index, int):
-            return '{}.5'.format(index)
-        if (isinstance(index, slice) and
-                index.step is None and
-                index.stop is None and
-                index.start is None):
-            return raw_var
-        return 'float({}) + 0.5'.format(
-            TexSlice._int_index_to_formula(index, compute_var))
+        return _fetch_formula(self.tex, self.x_slice, self.y_slice)
 
     @staticmethod
     def _int_index_to_formula(index: Union[int, slice, Idpression],
@@ -118,47 +134,118 @@ class TexSlice(Idpression):
         raise NotImplementedError(str(type(index)))
 
 
-class Tex(Idpression):
+def _fetch_formula(tex: 'Tex',
+                   x: Union[int, slice, Idpression],
+                   y: Union[int, slice, Idpression]) -> str:
+    """
+    A texelFetch of the texel at the given indices, clamped to the texture's
+    edge (as texture() reads are) unless the indices can't leave it.
+    """
+    # Imported here because ranges builds on this module.
+    from ranges import is_within
+    x_expr = index_expression(x, X)
+    y_expr = index_expression(y, Y)
+    position = 'ivec2({}, {})'.format(TexSlice._int_index_to_formula(x, 'x'),
+                                      TexSlice._int_index_to_formula(y, 'y'))
+    # Reads of tiled textures stay in their tile, see tiling.tile_shots.
+    if not (tex.tile is not None or
+            is_within(x_expr, tex.size.x().int()) and
+            is_within(y_expr, tex.size.y().int())):
+        position = 'clamp({}, ivec2(0), textureSize({}, 0) - 1)'.format(
+            position,
+            tex.tex_name())
+    return tex.val_type.from_in(
+        'texelFetch({}, {}, 0)'.format(tex.tex_name(), position))
+
+
+class Tex(TextureRead):
+    __slots__ = ('size_range', 'steps', 'size', 'per_shot', 'tile', 'layer')
 
     def __init__(self,
                  val_type: ShaderType,
                  steps: Optional[List[str]] = None,
                  size: Optional[Idpression] = None,
-                 name: Optional[str] = None):
+                 name: Optional[str] = None,
+                 per_shot: bool = True,
+                 tiled: bool = False,
+                 size_range: Optional[tuple] = None,
+                 layered: bool = False):
+        # Bounds on the (per shot) width and height, as ((low, high), (low,
+        # high)). Used by ranges.value_range.
+        self.size_range = size_range
         if size is None:
             if name is None:
                 size = UniformTexSize('tex_size')
             else:
                 size = UniformTexSize('{}_size'.format(name),
                                       add_id_suffix_to_name=False)
+            if not tiled:
+                size.value_range = size_range
         super().__init__('v_' + (name or 'tex'),
                          val_type=val_type,
-                         dependencies=[size],
                          add_id_suffix_to_name=name is None)
         self.steps = steps
         self.size = size
+        # Whether each shot has its own tile of the texture, instead of all
+        # shots sharing it. See tiling.tile_shots.
+        self.per_shot = per_shot
+        # When tiled, the size of each shot's tile.
+        self.tile = None
+        if tiled:
+            self.tile = UniformTexSize('{}_tile'.format(self.tex_name()),
+                                       add_id_suffix_to_name=False,
+                                       value_range=size_range)
+        # When layered, the size of each layer. Layered textures are split
+        # into a grid of layers of a texture array, in row-major order, so
+        # that they can be larger than a texture. See tiling.tile_layers.
+        self.layer = None
+        if layered:
+            self.layer = UniformTexSize('{}_layer'.format(self.tex_name()),
+                                        add_id_suffix_to_name=False)
 
-    def uniform_args(self):
-        return {
-            "['tex', '{}', '{}']".format(self.tex_name(), self.size.var_name)
-        }
+    def uniform_args(self, declared=()):
+        # Reads don't need the size uniforms, so they're only set when the
+        # shader uses them for something else.
+        declared = {e.var_name for e in declared}
+        names = [e.var_name if e is not None and e.var_name in declared
+                 else None
+                 for e in [self.size, self.tile, self.layer]]
+        while names and names[-1] is None:
+            names.pop()
+        return [
+            "[{}]".format(', '.join(
+                ["'tex'", "'{}'".format(self.tex_name())] +
+                ["'{}'".format(e) if e is not None else 'undefined'
+                 for e in names]))
+        ]
 
     def uniform_lines(self):
+        sampler = self.val_type.sampler_gl_name
+        if self.layer is not None:
+            # Array samplers have no default precision.
+            sampler = 'highp {}Array'.format(sampler.replace('highp ', ''))
         return [
-            'uniform sampler2D {};'.format(self.tex_name()),
+            'uniform {} {};'.format(sampler, self.tex_name()),
         ]
 
     def tex_name(self):
-        return self.var_name[2:]
+        # Not var_name, which is the read's formula when it's inlined.
+        if self._id is None:
+            return self._name[2:]
+        return '{}_{}'.format(self._name[2:], self._id)
+
+    def arg_name(self):
+        return self.tex_name()
 
     def formula(self):
-        read_expression = 'texture(({}), gl_FragCoord.xy / ({}))'.format(
-            self.tex_name(),
-            self.size.var_name)
-        return self.val_type.from_in(read_expression)
+        return _fetch_formula(self, X, Y)
 
-    def __getitem__(self, item: Tuple[slice, slice]) -> TexSlice:
+    def __getitem__(self, item: Tuple[slice, slice]) -> Idpression:
         x, y = item
+        x = normalize_index(x, X)
+        y = normalize_index(y, Y)
+        if is_identity_index(x) and is_identity_index(y):
+            return self
         return TexSlice(self, x, y)
 
     def __setitem__(self, key: Tuple[slice, slice], value):
@@ -168,6 +255,46 @@ class Tex(Idpression):
             self.steps.append(write)
 
 
+class TexLayerFetch(TextureRead):
+    """A read of a layered texture, at a position within one of its layers."""
+    __slots__ = ('tex', 'x', 'y', 'layer')
+
+    def __init__(self,
+                 tex: Tex,
+                 x: Idpression,
+                 y: Idpression,
+                 layer: Idpression):
+        super().__init__('fetch',
+                         val_type=tex.val_type,
+                         dependencies=[x, y, layer],
+                         uniform_dependencies=[tex])
+        self.tex = tex
+        self.x = x
+        self.y = y
+        self.layer = layer
+
+    def intern_key(self):
+        return (type(self),
+                intern_key_of(self.tex),
+                intern_key_of(self.x),
+                intern_key_of(self.y),
+                intern_key_of(self.layer))
+
+    def map_operands(self, func):
+        return TexLayerFetch(self.tex,
+                             func(self.x),
+                             func(self.y),
+                             func(self.layer))
+
+    def formula(self):
+        return self.tex.val_type.from_in(
+            'texelFetch({}, ivec3({}, {}, {}), 0)'.format(
+                self.tex.tex_name(),
+                self.x.var_name,
+                self.y.var_name,
+                self.layer.var_name))
+
+
 class TexWrite(object):
     def __init__(self,
                  src: Idpression,
@@ -179,12 +306,80 @@ class TexWrite(object):
         self.x_slice = x_slice
         self.y_slice = y_slice
 
-    def generate_js(self):
-        deps = self.src.collect_ascending_deps(include_uniforms=True)
-        args = sorted([d.var_name for d in deps if isinstance(d, Tex)])
-        r = """
-            {}.withArgs({}).renderIntoTexPair({})
-            """.format(self.src.var_name,
-                       ', '.join(args),
-                       self.dst.var_name)
-        return r
+    def is_full_write(self) -> bool:
+        return (is_identity_index(self.x_slice) and
+                is_identity_index(self.y_slice))
+
+    def generate_js(self, shader_name: str) -> str:
+        # Imported here because shader builds on this module.
+        import shader
+        args = [e.arg_name() for _, e in shader.shader_arguments(self.src)]
+        return '{}.withArgs({}).renderInto({});'.format(
+            shader_name,
+            ', '.join(args),
+            self.dst.tex_name())
+
+
+def nest_index(outer: Union[slice, Idpression, int],
+               inner: Union[slice, Idpression, int]
+               ) -> Union[slice, Idpression, int]:
+    """
+    The index read by an outer index (which is relative to the fragment's
+    coordinate) when the fragment's coordinate is replaced by the inner index.
+    """
+    if isinstance(outer, slice):
+        return nest_slice(outer, inner)
+    if isinstance(outer, Idpression) and not isinstance(outer, Literal):
+        raise NotImplementedError(
+            'Use substitute_coordinates to re-index computed positions.')
+    return outer
+
+
+def substitute_coordinates(
+        root: Idpression,
+        x: Union[slice, Idpression, int],
+        y: Union[slice, Idpression, int],
+        memo: Optional[Dict[tuple, tuple]] = None) -> Idpression:
+    """
+    The value root would have if it was computed at the position given by
+    indexing from the current fragment with x and y. For example, the value in
+    the partner row is substitute_coordinates(root, slice(None), Y ^ 1).
+
+    Callers substituting into shared subgraphs repeatedly (e.g. when fusing
+    passes) can pass the same memo dict to each call, so that each node is
+    only rewritten once per coordinate mapping.
+    """
+    x_expr = index_expression(x, X)
+    y_expr = index_expression(y, Y)
+    if memo is None:
+        memo = {}
+    # The entry keeps x and y alive, so the ids in its key stay unique.
+    _, _, results = memo.setdefault((intern_key_of(x), intern_key_of(y)),
+                                    (x, y, {}))
+
+    def sub_index(index, coord_index):
+        if isinstance(index, slice):
+            return nest_slice(index, coord_index)
+        if isinstance(index, Idpression):
+            return f(index)
+        return index
+
+    def f(node: Idpression) -> Idpression:
+        result = results.get(node)
+        if result is not None:
+            return result
+        if node is X:
+            result = x_expr
+        elif node is Y:
+            result = y_expr
+        elif isinstance(node, Tex):
+            result = node[x, y]
+        elif isinstance(node, TexSlice):
+            result = node.tex[sub_index(node.x_slice, x),
+                              sub_index(node.y_slice, y)]
+        else:
+            result = node.map_operands(f)
+        results[node] = result
+        return result
+
+    return visit_ascending(Idpression.wrap(root), f)
@@ -0,0 +1,221 @@
+from typing import Dict, List, Optional, Tuple, Union
+from idpression import (
+    Idpression,
+    Literal,
+    UniformTexSize,
+    PropertyOp,
+    Int32,
+    Float32,
+    transform,
+    visit_ascending,
+    X,
+    Y,
+)
+from ranges import MAX_TEXTURE_SIZE, is_within
+import tex
+
+# The size of each shot's tile in the output texture. Set by renderInto.
+OUT_TILE = UniformTexSize('out_tile', add_id_suffix_to_name=False)
+
+# The position of the drawn layer in a layered output texture. Set by
+# renderInto, which draws each layer separately. See tile_layers.
+OUT_ORIGIN = UniformTexSize('out_origin',
+                            add_id_suffix_to_name=False,
+                            value_range=((0, MAX_TEXTURE_SIZE - 1),
+                                         (0, MAX_TEXTURE_SIZE - 1)))
+
+# The column and row of the fragment's shot in the grid of shots, for values
+# that differ between shots (e.g. random ones). Replaced by tile_shots, or by
+# single_shot for shaders that aren't tiled.
+SHOT_X = Literal('shot_x', val_type=Int32, python_equivalent=None)
+SHOT_Y = Literal('shot_y', val_type=Int32, python_equivalent=None)
+
+
+def tile_names(root: Idpression) -> List[str]:
+    """The names of the tile sizes that tile_shots(root) may use."""
+    names = {OUT_TILE.var_name}
+    for dep in root.collect_ascending_deps(include_uniforms=True):
+        if isinstance(dep, tex.Tex) and dep.per_shot:
+            names.add('{}_tile'.format(dep.tex_name()))
+    return sorted(names)
+
+
+def tile_shots(root: Idpression,
+               tiles: Optional[Dict[str, Tuple[int, int]]] = None
+               ) -> Idpression:
+    """
+    Rewrites a value computed for a single shot into one computing every shot
+    of a texture holding a grid of independent shots.
+
+    Coordinates become relative to the fragment's tile. Per-shot textures are
+    read from the fragment's tile, clamping to the tile's edge the way the
+    sampler clamps to a texture's edge (unless value ranges show that reads
+    can't leave it), and their sizes become tile sizes. Shared textures are
+    read as-is, at the relative coordinates.
+
+    Tile sizes named in tiles (see tile_names) are fixed to the given width
+    and height, so that dividing by them can be simplified.
+    """
+    tiles = tiles or {}
+
+    def tile_size(tile: UniformTexSize) -> Tuple[Idpression, Idpression]:
+        fixed = tiles.get(tile.var_name)
+        if fixed is None:
+            return tile.x().int(), tile.y().int()
+        return Literal.of(Int32, fixed[0]), Literal.of(Int32, fixed[1])
+
+    out_width, out_height = tile_size(OUT_TILE)
+    local_x = X % out_width
+    local_y = Y % out_height
+    shot_x = X // out_width
+    shot_y = Y // out_height
+
+    sizes = {}
+    for dep in root.collect_ascending_deps(include_uniforms=True):
+        if isinstance(dep, tex.Tex) and dep.per_shot:
+            sizes[dep.size] = dep
+    tiled = {}
+    memo = {}
+
+    def tiled_tex(src: 'tex.Tex') -> 'tex.Tex':
+        result = tiled.get(src)
+        if result is None:
+            result = tex.Tex(val_type=src.val_type,
+                             name=src.tex_name(),
+                             tiled=True,
+                             size_range=src.size_range)
+            tiled[src] = result
+        return result
+
+    def read(src: 'tex.Tex',
+             x: Union[slice, Idpression, int],
+             y: Union[slice, Idpression, int]) -> Idpression:
+        x = f(tex.index_expression(x, X))
+        y = f(tex.index_expression(y, Y))
+        if not src.per_shot:
+            return src[x, y]
+        src = tiled_tex(src)
+        width, height = tile_size(src.tile)
+        return src[tile_index(X, shot_x, local_x, width, out_width, x),
+                   tile_index(Y, shot_y, local_y, height, out_height,
+                              y)]
+
+    def tile_index(coordinate: Idpression,
+                   shot: Idpression,
+                   local: Idpression,
+                   size: Idpression,
+                   out_size: Idpression,
+                   index: Idpression) -> Idpression:
+        if index is local and size is out_size:
+            # The fragment's own position in a tile of the same size.
+            return coordinate
+        if not is_within(index, size):
+            index = index.clamp(0, size - 1)
+        return shot * size + index
+
+    def f(node: Idpression) -> Idpression:
+        result = memo.get(node)
+        if result is None:
+            if node is X:
+                result = local_x
+            elif node is Y:
+                result = local_y
+            elif node is SHOT_X:
+                result = shot_x
+            elif node is SHOT_Y:
+                result = shot_y
+            elif isinstance(node, tex.Tex):
+                result = read(node, slice(None), slice(None))
+            elif isinstance(node, tex.TexSlice):
+                result = read(node.tex, node.x_slice, node.y_slice)
+            elif (isinstance(node, PropertyOp) and
+                  node.val in sizes and
+                  tiled_tex(sizes[node.val]).tile.var_name in tiles):
+                fixed = tiles[tiled_tex(sizes[node.val]).tile.var_name]
+                result = Literal.of(Float32,
+                                    float(fixed['xy'.index(node.prop_name)]))
+            elif node in sizes:
+                result = tiled_tex(sizes[node]).tile
+            else:
+                result = node.map_operands(f)
+            memo[node] = result
+        return result
+
+    return visit_ascending(Idpression.wrap(root), f)
+
+
+def single_shot(root: Idpression) -> Idpression:
+    """Rewrites a value for a texture holding a single shot (shot 0, 0)."""
+    zero = Literal.of(Int32, 0)
+    return transform(root,
+                     lambda node: zero if node is SHOT_X or
+                     node is SHOT_Y else node)
+
+
+def tile_layers(root: Idpression) -> Idpression:
+    """
+    Rewrites a value into one computing a layer of a layered output texture,
+    reading per-shot textures from layered textures (see Tex.layer), so that
+    textures can be larger than the GPU allows.
+
+    Coordinates stay logical: the fragment's coordinate is offset by the
+    drawn layer's origin, and reads are clamped to the texture's edge before
+    being split into a layer and a position within it. Shared textures are
+    small, so they are read as-is.
+    """
+    x = X + OUT_ORIGIN.x().int()
+    y = Y + OUT_ORIGIN.y().int()
+    layered = {}
+    memo = {}
+
+    def layered_tex(src: 'tex.Tex') -> 'tex.Tex':
+        result = layered.get(src)
+        if result is None:
+            result = tex.Tex(val_type=src.val_type,
+                             size=src.size,
+                             name=src.tex_name(),
+                             size_range=src.size_range,
+                             layered=True)
+            # Tiles are logical, like sizes.
+            result.tile = src.tile
+            layered[src] = result
+        return result
+
+    def read(src: 'tex.Tex',
+             ix: Union[slice, Idpression, int],
+             iy: Union[slice, Idpression, int]) -> Idpression:
+        ix = f(tex.index_expression(ix, X))
+        iy = f(tex.index_expression(iy, Y))
+        if not src.per_shot:
+            return src[ix, iy]
+        src = layered_tex(src)
+        width = src.size.x().int()
+        height = src.size.y().int()
+        layer_width = src.layer.x().int()
+        layer_height = src.layer.y().int()
+        ix = ix.clamp(0, width - 1)
+        iy = iy.clamp(0, height - 1)
+        columns = (width + layer_width - 1) // layer_width
+        return tex.TexLayerFetch(src,
+                                 ix % layer_width,
+                                 iy % layer_height,
+                                 (iy // layer_height) * columns +
+                                 ix // layer_width)
+
+    def f(node: Idpression) -> Idpression:
+        result = memo.get(node)
+        if result is None:
+            if node is X:
+                result = x
+            elif node is Y:
+                result = y
+            elif isinstance(node, tex.Tex):
+                result = read(node, slice(None), slice(None))
+            elif isinstance(node, tex.TexSlice):
+                result = read(node.tex, node.x_slice, node.y_slice)
+            else:
+                result = node.map_operands(f)
+            memo[node] = result
+        return result
+
+    return visit_ascending(Idpression.wrap(root), f)
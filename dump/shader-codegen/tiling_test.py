@@ -0,0 +1,148 @@
+from typing import Dict
+import numpy as np
+import pytest
+from idpression import Idpression, BinaryOp, FuncOp, Bit, Int32, X, Y
+import shader
+from simplify import simplify, specialize, literal_value
+from tex import Tex, TexSlice
+from tiling import (
+    OUT_TILE,
+    OUT_ORIGIN,
+    tile_names,
+    tile_shots,
+    single_shot,
+    tile_layers,
+)
+import gen
+import interpret
+import shader_cases
+
+_SURFACE_GRAPHS = {
+    name: root for name, root in shader_cases.GRAPHS.items()
+    if name.startswith(('hadamard', 'surfaceCzs'))
+}
+
+
+def _tiles(root: Idpression, packed: bool, n: int) -> Dict[str, object]:
+    for values in gen._surface_specializations(packed):
+        if values['surface_width'] == n:
+            return {k: v for k, v in values.items()
+                    if k in tile_names(root) or k.startswith('surface_')}
+    raise ValueError(n)
+
+
+def _divisions(root: Idpression):
+    return [e for e in root.collect_ascending_deps()
+            if isinstance(e, BinaryOp) and e.op_char in ['/', '%']]
+
+
+def _clamps(root: Idpression):
+    return [e for e in root.collect_ascending_deps()
+            if isinstance(e, FuncOp) and e.op_name == 'clamp']
+
+
+def test_tile_clamps_are_dropped_when_reads_stay_in_tile():
+    state = Tex(name='state', val_type=Bit, size_range=((8, 100), (8, 100)))
+    # Column 3 is in every tile, while the row depends on the output's tile.
+    tiled = simplify(tile_shots(state[3, Y]))
+    clamp, = _clamps(tiled)
+    assert literal_value(clamp.vals[0]) is None
+    # Tiled reads aren't clamped to the texture's edge on top of that.
+    assert 'textureSize' not in shader.generate_shader(tiled)
+
+def test_tile_names():
+    state = Tex(name='state', val_type=Bit)
+    shared = Tex(name='shared', val_type=Int32, per_shot=False)
+    assert tile_names(state[X + 1, Y] != shared) == [
+        'out_tile', 'state_tile']
+    assert tile_names(shared + 1) == ['out_tile']
+
+
+@pytest.mark.parametrize('name', sorted(_SURFACE_GRAPHS))
+def test_fixed_tiles_match_tile_uniforms(name):
+    root = _SURFACE_GRAPHS[name]
+    packed = name.endswith('Packed')
+    cols, rows = 2, 3
+    rng = np.random.default_rng(2)
+    for n in [5, 9]:
+        values = _tiles(root, packed, n)
+        surface = {k: values.pop(k) for k in list(values)
+                   if k.startswith('surface_')}
+        symbolic = simplify(specialize(tile_shots(root), surface))
+        fixed = simplify(specialize(tile_shots(root, values), surface))
+
+        # Dividing by the fixed tiles becomes a multiply and a shift, and
+        # reads that stay in their tile aren't clamped.
+        assert not _divisions(fixed)
+        assert len(_clamps(fixed)) < len(_clamps(symbolic))
+
+        width, height = values['out_tile']
+        data = shader_cases.random_texels(
+            rng, Tex(name='state', val_type=root.val_type),
+            (height * rows, width * cols))
+        textures = {'state': data}
+        np.testing.assert_array_equal(
+            interpret.evaluate(fixed, width * cols, height * rows,
+                               textures, {}, (cols, rows)),
+            interpret.evaluate(symbolic, width * cols, height * rows,
+                               textures, {}, (cols, rows)))
+
+
+def test_own_tile_reads_use_fragment_coordinates():
+    state = Tex(name='state', val_type=Int32)
+    tiled = simplify(tile_shots(state + 1,
+                                {'out_tile': (7, 4), 'state_tile': (7, 4)}))
+    deps = tiled.collect_ascending_deps(include_uniforms=True)
+    # Reads the tiled texture at the fragment's own position.
+    assert not any(isinstance(e, TexSlice) for e in deps)
+    assert any(isinstance(e, Tex) for e in deps)
+    assert not any(e is OUT_TILE for e in deps)
+
+
+@pytest.mark.parametrize('name', sorted(shader_cases.GRAPHS))
+def test_single_shot_matches_one_tile(name):
+    root, textures, uniforms = shader_cases.random_bindings(name, seed=4)
+    np.testing.assert_array_equal(
+        shader_cases.evaluate(simplify(single_shot(root)),
+                              textures,
+                              uniforms),
+        shader_cases.evaluate(simplify(tile_shots(root)),
+                              textures,
+                              uniforms))
+
+
+@pytest.mark.parametrize('name', sorted(shader_cases.GRAPHS))
+def test_layers_match_whole_texture(name):
+    cols, rows = 3, 2
+    # Layers that don't divide the textures, nor line up with their tiles.
+    layer_width, layer_height = 8, 5
+    rng = np.random.default_rng(5)
+    root = shader_cases.GRAPHS[name]
+    uniforms = shader_cases.random_uniforms(rng, root)
+    w, h = shader_cases.SHOT
+    width, height = w * cols, h * rows
+    data = {n: shader_cases.random_texels(rng, t, (height, width)
+                                           if t.per_shot else (h, w))
+            for n, t in shader_cases.texture_nodes(root).items()}
+    tiled = simplify(tile_shots(root))
+    expected = interpret.evaluate(tiled, width, height, data, uniforms,
+                                  (cols, rows))
+
+    layered = simplify(tile_layers(tiled))
+    bound = dict(uniforms)
+    bound[OUT_TILE] = (w, h)
+    for t in shader_cases.texture_nodes(layered).values():
+        if t.layer is not None:
+            bound[t.layer] = (layer_width, layer_height)
+    actual = np.zeros_like(expected)
+    for y in range(0, height, layer_height):
+        for x in range(0, width, layer_width):
+            bound[OUT_ORIGIN] = (x, y)
+            part = actual[y:y + layer_height, x:x + layer_width]
+            part[...] = interpret.evaluate(layered,
+                                           part.shape[1],
+                                           part.shape[0],
+                                           data,
+                                           bound,
+                                           (cols, rows))
+    np.testing.assert_array_equal(actual, expected)